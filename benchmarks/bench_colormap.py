@@ -0,0 +1,35 @@
+'''
+Compare the 'lut' and 'analytic' engines of uvecs.calc_colormap across map sizes.
+
+For each size it prints the best time of each engine and the maximum color difference
+between them (which goes to 0 when nx goes to infinity).
+
+Usage: python benchmarks/bench_colormap.py [--sizes 256 1024 4096] [--nx 512] [--repeat 3]
+'''
+import argparse
+
+import numpy as np
+
+from common import best_time, random_map
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[256, 1024, 4096])
+    parser.add_argument('--nx', type=int, default=512, help='size of the lut')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print('{:>8s} {:>12s} {:>12s} {:>12s}'.format('size', 'lut (s)', 'analytic (s)', 'max diff'))
+    for n in args.sizes:
+        da = random_map(n)
+        # build the lut outside of the timing, it is cached for the whole process
+        da[:2, :2].uvecs.calc_colormap(nx=args.nx)
+        tl, il = best_time(lambda: da.uvecs.calc_colormap(nx=args.nx), args.repeat)
+        ta, ia = best_time(lambda: da.uvecs.calc_colormap(engine='analytic'), args.repeat)
+        diff = np.nanmax(np.abs(il.values - ia.values))
+        print('{:8d} {:12.4f} {:12.4f} {:12.2e}'.format(n, tl, ta, diff))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+'''
+Compare the closed-form eigen solver of the orientation tensors (tensor3.eigh_sym3) with np.linalg.eigh.
+
+The tensors are random second order orientation tensors (mean of u u^T over 20 random vectors), generated by blocks
+so that 1e8 tensors fit in memory. For each size it prints the total time of both solvers and the maximum difference
+of the eigen values.
+
+Usage: python benchmarks/bench_eigh.py [--sizes 1000000 10000000 100000000] [--block 1048576]
+'''
+import argparse
+import time
+
+import numpy as np
+
+import common  # noqa: F401 (puts the package in the path)
+from xarrayuvecs import tensor3
+
+
+def random_tensors(n, rng):
+    u = rng.normal(size=(n, 20, 3))
+    u /= np.linalg.norm(u, axis=-1)[..., np.newaxis]
+    return np.einsum('nki,nkj->nij', u, u) / 20.
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10**6, 10**7, 10**8])
+    parser.add_argument('--block', type=int, default=2**20)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print('{:>12s} {:>14s} {:>12s} {:>10s}'.format('tensors', 'eigh_sym3 (s)', 'eigh (s)', 'max diff'))
+    for n in args.sizes:
+        t3 = te = diff = 0.
+        for i in range(0, n, args.block):
+            a = random_tensors(min(args.block, n - i), rng)
+            t = time.perf_counter()
+            w3, v3 = tensor3.eigh_sym3(a)
+            t3 += time.perf_counter() - t
+            t = time.perf_counter()
+            we, ve = np.linalg.eigh(a)
+            te += time.perf_counter() - t
+            diff = max(diff, np.max(np.abs(w3 - we[:, ::-1])))
+        print('{:12d} {:14.3f} {:12.3f} {:10.2e}'.format(n, t3, te, diff))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+'''
+Import-time benchmark for xarrayuvecs.
+
+Each measure is done in a fresh interpreter so that nothing is already in sys.modules.
+
+The import of xarrayuvecs.uvecs is measured on top of 'import xarray' (which it cannot avoid).
+The script exits with a non-zero status if this extra cost is above --budget, or if the import
+pulls in one of the heavy modules that should only be loaded on demand.
+
+Usage: python benchmarks/bench_import.py [--repeat 5] [--budget 0.1]
+'''
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# modules that must not be imported by 'import xarrayuvecs.uvecs'
+LAZY_MODULES = ['matplotlib', 'sklearn', 'scipy']
+
+
+def time_in_subprocess(stmt, setup='pass', repeat=5):
+    '''
+    Time a statement in a fresh python interpreter
+
+    :param stmt: statement to time
+    :type stmt: str
+    :param setup: statement executed before the timer starts
+    :type setup: str
+    :param repeat: number of fresh interpreters
+    :type repeat: int
+    :return: best time in second
+    :rtype: float
+    '''
+    code = (
+        'import time\n'
+        + setup + '\n'
+        + 't0=time.perf_counter()\n'
+        + stmt + '\n'
+        + 'print(time.perf_counter()-t0)\n'
+    )
+    res = []
+    for i in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout
+        res.append(float(out.strip().splitlines()[-1]))
+    return min(res)
+
+
+def eagerly_imported(module, lazy_modules=LAZY_MODULES):
+    '''
+    List the lazy modules that are loaded by importing module
+
+    :param module: module to import
+    :type module: str
+    :rtype: list
+    '''
+    code = (
+        'import sys\n'
+        + 'import ' + module + '\n'
+        + 'print(\' \'.join(m for m in ' + repr(lazy_modules) + ' if m in sys.modules))\n'
+    )
+    out = subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True,
+                         capture_output=True, text=True).stdout
+    return out.split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=0.1,
+                        help='maximum extra import time of xarrayuvecs.uvecs in second (default: 0.1)')
+    args = parser.parse_args()
+
+    cases = [
+        ('import uniform_dist', 'import xarrayuvecs.uniform_dist', 'import numpy'),
+        ('first access unidist', 'xarrayuvecs.uniform_dist.unidist',
+         'import numpy; import xarrayuvecs.uniform_dist'),
+        ('import uniform_dist + unidist', 'from xarrayuvecs.uniform_dist import unidist', 'import numpy'),
+    ]
+    for name, stmt, setup in cases:
+        t = time_in_subprocess(stmt, setup=setup, repeat=args.repeat)
+        print('{:<35s} {:10.3f} ms'.format(name, t * 1e3))
+
+    t = time_in_subprocess('import xarrayuvecs.uvecs', setup='import xarray', repeat=args.repeat)
+    print('{:<35s} {:10.3f} ms (budget {:.3f} ms)'.format('import uvecs (after xarray)', t * 1e3, args.budget * 1e3))
+    failed = False
+    if t > args.budget:
+        print('FAILED: import xarrayuvecs.uvecs is over budget')
+        failed = True
+    eager = eagerly_imported('xarrayuvecs.uvecs')
+    if eager:
+        print('FAILED: import xarrayuvecs.uvecs loads ' + ', '.join(eager))
+        failed = True
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
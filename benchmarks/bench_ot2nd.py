@@ -0,0 +1,64 @@
+'''
+Compare uvecs.OT2nd with the previous implementation (u and -u concatenated, six float128 nanmean, np.linalg.eig).
+
+For each size it prints the best time and the peak memory of both, and the maximum difference of the eigen values.
+The cache of the cartesian coordinate is cleared before each call so that both include the conversion.
+
+Usage: python benchmarks/bench_ot2nd.py [--sizes 256 1024 4096] [--repeat 3]
+'''
+import argparse
+
+import numpy as np
+
+from common import best_time, peak_memory, random_map
+from xarrayuvecs import uvecs
+
+
+def legacy_ot2nd(da):
+    u_xyz = da.uvecs.xyz()
+    ux = np.concatenate([np.array(u_xyz[..., 0]).flatten(), -np.array(u_xyz[..., 0]).flatten()])
+    uy = np.concatenate([np.array(u_xyz[..., 1]).flatten(), -np.array(u_xyz[..., 1]).flatten()])
+    uz = np.concatenate([np.array(u_xyz[..., 2]).flatten(), -np.array(u_xyz[..., 2]).flatten()])
+
+    a11 = np.float32(np.nanmean(np.float128(np.multiply(ux, ux))))
+    a22 = np.float32(np.nanmean(np.float128(np.multiply(uy, uy))))
+    a33 = np.float32(np.nanmean(np.float128(np.multiply(uz, uz))))
+    a12 = np.float32(np.nanmean(np.float128(np.multiply(ux, uy))))
+    a13 = np.float32(np.nanmean(np.float128(np.multiply(ux, uz))))
+    a23 = np.float32(np.nanmean(np.float128(np.multiply(uy, uz))))
+
+    tensor = np.array([[a11, a12, a13], [a12, a22, a23], [a13, a23, a33]])
+    eigvalue, eigvector = np.linalg.eig(tensor)
+    idx = eigvalue.argsort()[::-1]
+    return eigvalue[idx], eigvector[:, idx]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[256, 1024, 4096])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print('{:>8s} {:>12s} {:>12s} {:>14s} {:>14s} {:>10s}'.format(
+        'size', 'legacy (s)', 'OT2nd (s)', 'legacy (MB)', 'OT2nd (MB)', 'max diff'))
+    for n in args.sizes:
+        da = random_map(n)
+
+        def legacy():
+            uvecs.clear_cache()
+            return legacy_ot2nd(da)
+
+        def current():
+            uvecs.clear_cache()
+            return da.uvecs.OT2nd()
+
+        tl, (wl, vl) = best_time(legacy, args.repeat)
+        tc, (wc, vc) = best_time(current, args.repeat)
+        ml = peak_memory(legacy)
+        mc = peak_memory(current)
+        print('{:8d} {:12.4f} {:12.4f} {:14.1f} {:14.1f} {:10.2e}'.format(
+            n, tl, tc, ml / 2**20, mc / 2**20, np.max(np.abs(wl - wc))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+'''
+Benchmark suite of the uvecs accessor: time and peak memory of every method on synthetic maps.
+
+Runs offline, the maps are random orientations with 10% of NaN. The cache of the accessor is
+emptied before each call, the numbers are cold timings. Results can be saved as json to compare
+two versions of the package.
+
+Usage: python benchmarks/bench_uvecs.py [--sizes 256 512 ... 8192] [--methods xyz OT2nd ...] [--engines numpy numba]
+                                       [--repeat 3] [--json out.json]
+'''
+import argparse
+import json
+import platform
+
+import numpy as np
+
+from common import best_time, peak_memory, random_map
+from xarrayuvecs import uvecs
+
+AXIS = np.array([0., 0., 1.])
+
+
+def _plot_odf(da, other):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    plt.figure()
+    da.uvecs.plotODF()
+    plt.close('all')
+
+
+def _profile(da, other):
+    n = len(da.x)
+    xx = np.linspace(0, n - 1, 100)
+    return da.uvecs.misorientation_profile(xx, xx)
+
+
+# name: function of the map and of a second map of the same size
+METHODS = {
+    'xyz': lambda da, other: da.uvecs.xyz(),
+    'bunge_euler': lambda da, other: da.uvecs.bunge_euler(),
+    'calc_colormap': lambda da, other: da.uvecs.calc_colormap(),
+    'OT2nd': lambda da, other: da.uvecs.OT2nd(),
+    'OT4th': lambda da, other: da.uvecs.OT4th(),
+    'mis_angle': lambda da, other: da.uvecs.mis_angle(),
+    'misorientation_profile': _profile,
+    'calc_schmid': lambda da, other: da.uvecs.calc_schmid(AXIS),
+    'inner_angle': lambda da, other: da.uvecs.inner_angle(other),
+    'plotODF': _plot_odf,
+    'products': lambda da, other: da.uvecs.products(axis=AXIS),
+    'local_OT2nd': lambda da, other: da.uvecs.local_OT2nd(11),
+}
+
+SIZES = [256, 512, 1024, 2048, 4096, 8192]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--methods', nargs='+', default=list(METHODS), choices=list(METHODS))
+    parser.add_argument('--engines', nargs='+', default=['numpy'], choices=['numpy', 'numba'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help='save the results in this file')
+    args = parser.parse_args()
+
+    results = []
+    print('{:>24s} {:>8s} {:>8s} {:>12s} {:>14s}'.format('method', 'engine', 'size', 'time (s)', 'peak mem (MB)'))
+    for n in args.sizes:
+        da = random_map(n)
+        other = random_map(n, seed=1)
+        for engine in args.engines:
+            uvecs.set_engine(engine)
+            # warm up the caches (lut, sphere grid, lazy imports, jit compilation) so that only the computation is measured
+            for name in args.methods:
+                METHODS[name](da[:16, :16], other[:16, :16])
+            for name in args.methods:
+                func = METHODS[name]
+
+                def cold():
+                    # empty the cache of the representations (xyz, ...) so that every call does the full computation
+                    uvecs.clear_cache()
+                    return func(da, other)
+
+                t, out = best_time(cold, args.repeat)
+                del out
+                mem = peak_memory(cold)
+                results.append({'method': name, 'engine': engine, 'size': n, 'time': t, 'peak_memory': mem})
+                print('{:>24s} {:>8s} {:8d} {:12.4f} {:14.1f}'.format(name, engine, n, t, mem / 2**20))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'machine': platform.platform(), 'python': platform.python_version(),
+                       'numpy': np.__version__, 'results': results}, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
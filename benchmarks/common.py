@@ -0,0 +1,60 @@
+'''
+Helpers shared by the benchmark scripts: synthetic orientation maps, timing and peak memory.
+'''
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import xarray as xr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import xarrayuvecs.uvecs  # noqa: E402,F401
+
+
+def random_map(n, nan_fraction=0.1, seed=0):
+    '''
+    Random orientation map of size (n,n,2) with x and y coordinates
+
+    :param n: size of the map
+    :type n: int
+    :param nan_fraction: fraction of non-indexed (NaN) pixels
+    :type nan_fraction: float
+    :rtype: xr.DataArray
+    '''
+    rng = np.random.default_rng(seed)
+    data = np.empty((n, n, 2))
+    data[..., 0] = rng.uniform(0, 2 * np.pi, (n, n))
+    data[..., 1] = rng.uniform(0, np.pi / 2, (n, n))
+    data[rng.random((n, n)) < nan_fraction, :] = np.nan
+    return xr.DataArray(data, dims=['y', 'x', 'v'], coords={'y': np.arange(n), 'x': np.arange(n)})
+
+
+def best_time(func, repeat=3):
+    '''
+    :return: best time in second over repeat calls and the output of the last call
+    :rtype: float, object
+    '''
+    res = []
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        out = func()
+        res.append(time.perf_counter() - t0)
+    return min(res), out
+
+
+def peak_memory(func):
+    '''
+    :return: peak memory allocated during func() in byte (numpy buffers included)
+    :rtype: int
+    '''
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        out = func()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del out
+    return peak
@@ -27,7 +27,8 @@ REQUIRED = [
 
 # What packages are optional?
 EXTRAS = {
-    # 'fancy feature': ['django'],
+    'dask': ['dask[array]'],
+    'jit': ['numba'],
 }
 
 # The rest you shouldn't have to touch too much :)
@@ -111,6 +112,7 @@ setup(
     install_requires=REQUIRED,
     extras_require=EXTRAS,
     include_package_data=True,
+    package_data={NAME: ['*.npy']},
     license='GPL-3.0',
     classifiers=[
         'Intended Audience :: Science/Research',
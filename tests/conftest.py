@@ -0,0 +1,7 @@
+'''
+Shared setup of the tests: the repository root is importable, the synthetic maps come from benchmarks.common
+'''
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
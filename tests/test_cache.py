@@ -0,0 +1,72 @@
+'''
+Tests of the cache of the xyz and bunge_euler representations
+'''
+import gc
+
+import numpy as np
+
+from benchmarks.common import random_map
+from xarrayuvecs import uvecs
+
+
+def test_cache_hit():
+    uvecs.clear_cache()
+    da = random_map(32)
+    a = da.uvecs.xyz()
+    b = da.uvecs.xyz()
+    assert np.shares_memory(a.values, b.values)
+    assert not a.values.flags.writeable
+
+
+def test_cache_inplace_modification():
+    uvecs.clear_cache()
+    da = random_map(32)
+    before = da.uvecs.xyz().values.copy()
+    da[0, 0] = [0., 0.]
+    after = da.uvecs.xyz().values
+    assert not np.array_equal(before[0, 0], after[0, 0], equal_nan=True)
+    np.testing.assert_array_equal(after[0, 0], [0., 0., 1.])
+
+
+def test_cache_representation():
+    # the same buffer read as azicol then as oct8 gives two different results
+    uvecs.clear_cache()
+    da = random_map(32).fillna(0.)
+    azicol = da.uvecs.xyz().values
+    oct8 = da.assign_attrs(uvecs_repr='oct8')
+    assert np.shares_memory(da.data, oct8.data)
+    uvecs.set_cache_limit(0)
+    fresh = oct8.uvecs.xyz().values
+    uvecs.set_cache_limit(2**30)
+    np.testing.assert_array_equal(oct8.uvecs.xyz().values, fresh)
+    assert not np.array_equal(azicol, fresh)
+
+
+def test_cache_strided_view():
+    uvecs.clear_cache()
+    da = random_map(32)
+    view = da[::2, ::2]
+    np.testing.assert_array_equal(view.uvecs.xyz(), da.uvecs.xyz()[::2, ::2])
+    assert view.uvecs._buffer_key() is None
+
+
+def test_cache_freed_buffer():
+    uvecs.clear_cache()
+    da = random_map(32)
+    da.uvecs.xyz()
+    da.uvecs.bunge_euler()
+    assert len(uvecs._cache) == 2
+    del da
+    gc.collect()
+    assert len(uvecs._cache) == 0
+
+
+def test_cache_limit():
+    uvecs.clear_cache()
+    uvecs.set_cache_limit(0)
+    try:
+        da = random_map(32)
+        da.uvecs.xyz()
+        assert len(uvecs._cache) == 0
+    finally:
+        uvecs.set_cache_limit(2**30)
@@ -0,0 +1,43 @@
+'''
+Tests of the sparse valid-pixel representation (compress/expand)
+'''
+import numpy as np
+import pytest
+import xarray as xr
+
+from benchmarks.common import random_map
+from xarrayuvecs import uvecs
+
+
+def test_compress_roundtrip():
+    da = random_map(32)
+    packed = da.uvecs.compress()
+    valid = ~np.isnan(da.values).any(axis=-1)
+    assert packed.dims == ('pixel', 'v') and packed.sizes['pixel'] == valid.sum()
+    assert not np.isnan(packed.values).any()
+    xr.testing.assert_identical(packed.uvecs.expand(), da)
+
+
+def test_compress_methods():
+    da = random_map(32)
+    packed = da.uvecs.compress()
+    np.testing.assert_array_equal(uvecs.expand(packed.uvecs.xyz()), da.uvecs.xyz())
+    valid = ~np.isnan(da.values).any(axis=-1)
+    np.testing.assert_array_equal(uvecs.expand(packed.uvecs.calc_colormap()).values[valid], da.uvecs.calc_colormap().values[valid])
+    img = uvecs.expand(packed.uvecs.calc_colormap(dtype=np.uint8), fill_value=255)
+    assert img.dtype == np.uint8 and img.dims == ('y', 'x', 'img')
+    w, v = packed.uvecs.OT2nd()
+    np.testing.assert_allclose(w, da.uvecs.OT2nd()[0], atol=1e-12)
+
+
+def test_compress_empty_rows():
+    # rows and columns without any valid vector are restored
+    da = random_map(16)
+    da[3] = np.nan
+    da[:, -1] = np.nan
+    xr.testing.assert_identical(da.uvecs.compress().uvecs.expand(), da)
+
+
+def test_compress_grid_methods():
+    with pytest.raises(ValueError):
+        random_map(16).uvecs.compress().uvecs.mis_angle()
@@ -0,0 +1,38 @@
+'''
+Tests of the lazy dask backend: same values and metadata as the eager methods
+'''
+import numpy as np
+import pytest
+
+from benchmarks.common import random_map
+
+dask = pytest.importorskip('dask')
+
+AXIS = np.array([0., 0., 1.])
+
+METHODS = {
+    'xyz': lambda da: da.uvecs.xyz(),
+    'bunge_euler': lambda da: da.uvecs.bunge_euler(),
+    'canonical': lambda da: da.uvecs.canonical(),
+    'calc_colormap': lambda da: da.uvecs.calc_colormap(),
+    'calc_schmid': lambda da: da.uvecs.calc_schmid(AXIS),
+}
+
+
+@pytest.mark.parametrize('name', list(METHODS))
+@pytest.mark.parametrize('attrs', [{}, {'uvecs_dim': 'v'}, {'uvecs_repr': 'azicol'}])
+def test_lazy(name, attrs):
+    da = random_map(32).assign_attrs(attrs)
+    lazy = METHODS[name](da.chunk({'y': 8}))
+    eager = METHODS[name](da)
+    assert isinstance(lazy.data, dask.array.Array)
+    assert lazy.dims == eager.dims and lazy.attrs == eager.attrs
+    np.testing.assert_array_equal(lazy.compute(), eager)
+
+
+def test_lazy_chain():
+    da = random_map(32).assign_attrs(uvecs_dim='v', uvecs_repr='azicol')
+    w, v = da.chunk({'y': 8}).uvecs.xyz().uvecs.OT2nd()
+    we, ve = da.uvecs.OT2nd()
+    np.testing.assert_allclose(w, we, atol=1e-12)
+    np.testing.assert_allclose(np.asarray(da.chunk({'y': 8}).uvecs.inner_angle(da)), da.uvecs.inner_angle(da), atol=1e-12)
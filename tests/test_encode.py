@@ -0,0 +1,45 @@
+'''
+Tests of the hemi-octahedral encoding
+'''
+import numpy as np
+import pytest
+import xarray as xr
+
+from benchmarks.common import random_map
+
+
+@pytest.mark.parametrize('encoding,tol', [('oct16', 1e-4), ('oct8', 2e-2)])
+def test_encode_roundtrip(encoding, tol):
+    da = random_map(32)
+    enc = da.uvecs.encode(encoding)
+    assert enc.dims == ('y', 'x', 'oct') and enc.attrs == {'uvecs_repr': encoding}
+    dec = enc.uvecs.decode()
+    ref = da.uvecs.canonical()
+    np.testing.assert_array_equal(np.isnan(dec), np.isnan(ref))
+    np.testing.assert_allclose(dec, ref, atol=tol)
+
+
+def test_encode_uvecs_dim(tmp_path):
+    # component dimension given by uvecs_dim, not the last one, and stored in netCDF
+    da = random_map(16).transpose('v', 'y', 'x').assign_attrs(uvecs_dim='v', name='map')
+    enc = da.uvecs.encode()
+    assert 'uvecs_dim' not in enc.attrs
+    np.testing.assert_allclose(enc.uvecs.decode(), da.uvecs.canonical().transpose('y', 'x', 'vc'), atol=1e-4)
+    enc.to_netcdf(tmp_path / 'map.nc')
+    with xr.open_dataarray(tmp_path / 'map.nc') as stored:
+        assert stored.attrs['uvecs_repr'] == 'oct16'
+        np.testing.assert_array_equal(stored.uvecs.decode(), enc.uvecs.decode())
+
+
+def test_encode_dask():
+    pytest.importorskip('dask')
+    da = random_map(32).assign_attrs(uvecs_dim='v')
+    enc = da.chunk({'y': 8}).uvecs.encode()
+    assert enc.attrs == {'uvecs_repr': 'oct16'}
+    np.testing.assert_array_equal(enc.compute(), da.uvecs.encode())
+    np.testing.assert_array_equal(enc.uvecs.decode().compute(), da.uvecs.encode().uvecs.decode())
+
+
+def test_encode_error():
+    with pytest.raises(ValueError):
+        random_map(4).uvecs.encode('oct32')
@@ -0,0 +1,64 @@
+'''
+Tests of the numpy and numba engines of the per-pixel kernels
+'''
+import numpy as np
+import pytest
+import xarray as xr
+
+from benchmarks.common import random_map
+from xarrayuvecs import uvecs
+
+
+@pytest.fixture
+def engine():
+    '''
+    Restore the engine after the test
+    '''
+    yield uvecs.set_engine
+    uvecs.set_engine('auto')
+    uvecs.clear_cache()
+
+
+@pytest.mark.parametrize('method', [
+    lambda da, other: da.uvecs.mis_angle(),
+    lambda da, other: da.uvecs.inner_angle(other),
+    lambda da, other: da.uvecs.calc_schmid(np.array([0., 0., 1.])),
+    lambda da, other: da.uvecs.calc_colormap(),
+])
+def test_engine_parity(engine, method):
+    pytest.importorskip('numba')
+    da = random_map(64)
+    other = random_map(64, seed=1)
+    res = {}
+    for name in ('numpy', 'numba'):
+        engine(name)
+        uvecs.clear_cache()
+        res[name] = np.asarray(method(da, other))
+    np.testing.assert_array_equal(res['numpy'], res['numba'])
+
+
+def test_engine_error():
+    with pytest.raises(ValueError):
+        uvecs.set_engine('fortran')
+
+
+@pytest.mark.parametrize('name', ['numpy', 'numba'])
+def test_mis_angle_stack(engine, name):
+    if name == 'numba':
+        pytest.importorskip('numba')
+    engine(name)
+    stack = xr.concat([random_map(16), random_map(16, seed=1)], dim='time')
+    with pytest.raises(ValueError):
+        stack.uvecs.mis_angle()
+    assert stack.isel(time=0).uvecs.mis_angle().dims == ('y', 'x', 'misAngle')
+
+
+def test_misorientation_profile_stack():
+    maps = [random_map(16), random_map(16, seed=1)]
+    stack = xr.concat(maps, dim='time')
+    xx = np.arange(2., 12.)
+    with pytest.raises(ValueError):
+        stack.uvecs.misorientation_profile(xx, xx)
+    # the map of the stack is selected by the kwargs of xr.sel
+    prof = stack.assign_coords(time=[0, 1]).uvecs.misorientation_profile(xx, xx, time=1)
+    xr.testing.assert_identical(prof, maps[1].uvecs.misorientation_profile(xx, xx))
@@ -0,0 +1,61 @@
+'''
+Tests of local_OT2nd, the orientation tensor in a sliding window
+'''
+import numpy as np
+import pytest
+import xarray as xr
+
+from benchmarks.common import random_map
+
+
+def window_tensor(da, i, j, half):
+    '''
+    Reference tensor of the valid vectors of the window centred on (i,j), cut at the border
+    '''
+    xyz = np.asarray(da.uvecs.xyz())[max(i - half, 0):i + half + 1, max(j - half, 0):j + half + 1].reshape(-1, 3)
+    xyz = xyz[~np.any(np.isnan(xyz), axis=-1)]
+    return xyz.T @ xyz / len(xyz)
+
+
+def test_local_ot2nd_uniform():
+    da = random_map(16)
+    ds = da.uvecs.local_OT2nd(5)
+    assert ds.eigvalue.dims == ('y', 'x', 'eig') and ds.eigvector.dims == ('y', 'x', 'vc', 'eig')
+    for i, j in ((0, 0), (7, 9), (15, 3)):
+        we = np.linalg.eigh(window_tensor(da, i, j, 2))[0][::-1]
+        np.testing.assert_allclose(ds.eigvalue[i, j], we, atol=1e-12)
+    np.testing.assert_allclose(ds.eigvalue.sum('eig'), 1., atol=1e-12)
+
+
+def test_local_ot2nd_whole_map():
+    # a window larger than the map gives the tensor of the map everywhere
+    da = random_map(8)
+    ds = da.uvecs.local_OT2nd(17)
+    w, v = da.uvecs.OT2nd()
+    np.testing.assert_allclose(ds.eigvalue.values.reshape(-1, 3), np.broadcast_to(w, (64, 3)), atol=1e-12)
+
+
+def test_local_ot2nd_min_fraction():
+    da = random_map(8, nan_fraction=0.)
+    da[0, :2] = np.nan
+    ds = da.uvecs.local_OT2nd(3)
+    # corner window: 4 pixels in the map, 2 valid
+    frac = ds.fraction[0, 0].item()
+    np.testing.assert_allclose(frac, 2 / 9)
+    # a window exactly at the threshold is kept, NaN below
+    assert not np.isnan(da.uvecs.local_OT2nd(3, min_fraction=frac).eigvalue[0, 0]).any()
+    assert np.isnan(da.uvecs.local_OT2nd(3, min_fraction=frac + 1e-9).eigvalue[0, 0]).all()
+
+
+def test_local_ot2nd_stack():
+    maps = [random_map(12, seed=i) for i in range(2)]
+    ds = xr.concat(maps, dim='time').uvecs.local_OT2nd(5, kernel='gaussian')
+    np.testing.assert_allclose(ds.eigvalue.isel(time=1), maps[1].uvecs.local_OT2nd(5, kernel='gaussian').eigvalue, atol=1e-12)
+
+
+def test_local_ot2nd_error():
+    da = random_map(8)
+    with pytest.raises(ValueError):
+        da.uvecs.local_OT2nd(5, kernel='gaussian', sigma=0)
+    with pytest.raises(ValueError):
+        da.uvecs.local_OT2nd(5, kernel='median')
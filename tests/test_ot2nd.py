@@ -0,0 +1,116 @@
+'''
+Tests of OT2nd, the second order orientation tensor
+'''
+import numpy as np
+import pytest
+import xarray as xr
+
+from benchmarks.common import random_map
+
+
+def tensor(da):
+    '''
+    Reference tensor <u_i u_j> of the valid vectors of da
+    '''
+    xyz = np.asarray(da.uvecs.xyz()).reshape(-1, 3)
+    xyz = xyz[~np.any(np.isnan(xyz), axis=-1)]
+    return xyz.T @ xyz / len(xyz)
+
+
+def test_ot2nd_map():
+    da = random_map(64)
+    w, v = da.uvecs.OT2nd()
+    assert isinstance(w, np.ndarray) and w.shape == (3,) and v.shape == (3, 3)
+    we, ve = np.linalg.eigh(tensor(da))
+    np.testing.assert_allclose(w, we[::-1], atol=1e-14)
+    np.testing.assert_allclose(np.abs(v), np.abs(ve[:, ::-1]), atol=1e-12)
+    assert w[0] >= w[1] >= w[2]
+
+
+def test_ot2nd_symmetry():
+    # u and -u give the same tensor
+    xyz = random_map(32).uvecs.xyz()
+    w, v = xyz.uvecs.OT2nd()
+    wm, vm = (-xyz).uvecs.OT2nd()
+    np.testing.assert_allclose(w, wm, atol=1e-15)
+
+
+def test_ot2nd_empty():
+    da = xr.full_like(random_map(8), np.nan)
+    w, v = da.uvecs.OT2nd()
+    assert np.all(np.isnan(w)) and np.all(np.isnan(v))
+
+
+def test_ot2nd_labels():
+    da = random_map(32)
+    labels = xr.DataArray(np.arange(32 * 32).reshape(32, 32) % 5, dims=('y', 'x'))
+    labels[0, 0] = -1  # ignored
+    ds = da.uvecs.OT2nd(labels=labels)
+    np.testing.assert_array_equal(ds.label, np.arange(5))
+    for lab in range(5):
+        sel = da.where(labels == lab)
+        we, ve = np.linalg.eigh(tensor(sel))
+        np.testing.assert_allclose(ds.eigvalue.sel(label=lab), we[::-1], atol=1e-14)
+        np.testing.assert_allclose(ds.tensor.sel(label=lab), tensor(sel), atol=1e-14)
+        assert ds['count'].sel(label=lab) == (~np.isnan(sel.values).any(axis=-1)).sum()
+
+
+def test_ot2nd_labels_empty():
+    # a label without valid vector gets NaN, NaN labels are ignored
+    da = random_map(8)
+    labels = xr.DataArray(np.zeros((8, 8)), dims=('y', 'x'))
+    labels[:, 0] = np.nan
+    labels[0, 1] = 7
+    da[0, 1] = np.nan
+    ds = da.uvecs.OT2nd(labels=labels)
+    np.testing.assert_array_equal(ds.label, [0, 7])
+    assert ds['count'].sel(label=7) == 0
+    assert np.all(np.isnan(ds.eigvalue.sel(label=7))) and np.all(np.isnan(ds.tensor.sel(label=7)))
+
+
+def test_ot2nd_labels_error():
+    da = random_map(8)
+    with pytest.raises(ValueError):
+        da.uvecs.OT2nd(labels=xr.DataArray(np.zeros((4, 4), dtype=int), dims=('y', 'x')))
+    with pytest.raises(ValueError):
+        da.uvecs.OT2nd(labels=xr.DataArray(np.full((8, 8), 'a'), dims=('y', 'x')))
+
+
+def test_ot2nd_stack():
+    maps = [random_map(32, seed=i) for i in range(3)]
+    stack = xr.concat(maps, dim='time')
+    w, v = stack.uvecs.OT2nd()
+    assert w.dims == ('time', 'eig') and v.dims == ('time', 'vc', 'eig')
+    for i, da in enumerate(maps):
+        wi, vi = da.uvecs.OT2nd()
+        np.testing.assert_array_equal(w.isel(time=i), wi)
+    # one tensor for the whole stack
+    w, v = stack.uvecs.OT2nd(dims=stack.uvecs._dims())
+    assert isinstance(w, np.ndarray) and w.shape == (3,)
+
+
+def test_ot2nd_volume():
+    # z is a spatial dimension, a volume gives a single tensor
+    maps = [random_map(16, seed=i) for i in range(4)]
+    volume = xr.concat(maps, dim='z')
+    w, v = volume.uvecs.OT2nd()
+    assert isinstance(w, np.ndarray) and w.shape == (3,)
+    wt, vt = volume.rename(z='time').uvecs.OT2nd(dims=['time', 'y', 'x'])
+    np.testing.assert_allclose(w, wt, atol=1e-14)
+
+
+def test_ot2nd_stack_coords():
+    stack = xr.concat([random_map(16, seed=i) for i in range(3)], dim='time').assign_coords(time=[10., 20., 30.])
+    stack = stack.transpose('y', 'time', 'x', 'v')
+    w, v = stack.uvecs.OT2nd()
+    np.testing.assert_array_equal(w.time, [10., 20., 30.])
+    np.testing.assert_array_equal(w.sel(time=20.), stack.sel(time=20.).uvecs.OT2nd()[0])
+
+
+def test_plot_odf_stack():
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    stack = xr.concat([random_map(16, seed=i) for i in range(2)], dim='time')
+    stack.uvecs.plotODF()
+    plt.close('all')
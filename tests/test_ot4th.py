@@ -0,0 +1,48 @@
+'''
+Tests of OT4th, the fourth order orientation tensor in compact form
+'''
+import numpy as np
+import xarray as xr
+
+from benchmarks.common import random_map
+from xarrayuvecs import uvecs
+
+
+def full_tensor(da):
+    '''
+    Reference tensor <u_i u_j u_k u_l> of the valid vectors of da
+    '''
+    xyz = np.asarray(da.uvecs.xyz()).reshape(-1, 3)
+    xyz = xyz[~np.any(np.isnan(xyz), axis=-1)]
+    return np.einsum('ni,nj,nk,nl->ijkl', xyz, xyz, xyz, xyz) / len(xyz)
+
+
+def test_ot4th():
+    da = random_map(32)
+    a4 = da.uvecs.OT4th()
+    assert a4.dims == ('comp4',) and a4.sizes['comp4'] == 15
+    full = uvecs.expand_OT4th(a4)
+    assert full.dims == ('i', 'j', 'k', 'l')
+    np.testing.assert_allclose(full, full_tensor(da), atol=1e-14)
+    np.testing.assert_allclose(a4.sel(comp4='1122'), full_tensor(da)[0, 0, 1, 1], atol=1e-14)
+
+
+def test_ot4th_contraction():
+    # a_ijkk is the second order tensor
+    da = random_map(32)
+    a2 = np.einsum('ijkk->ij', uvecs.expand_OT4th(da.uvecs.OT4th()).values)
+    w, v = da.uvecs.OT2nd()
+    np.testing.assert_allclose(np.linalg.eigh(a2)[0][::-1], w, atol=1e-14)
+
+
+def test_ot4th_stack_labels():
+    maps = [random_map(16, seed=i) for i in range(2)]
+    stack = xr.concat(maps, dim='time')
+    a4 = stack.uvecs.OT4th()
+    assert a4.dims == ('time', 'comp4')
+    np.testing.assert_allclose(a4.isel(time=1), maps[1].uvecs.OT4th(), atol=1e-15)
+    labels = xr.DataArray(np.repeat([[0] * 8 + [1] * 8], 16, axis=0), dims=('y', 'x'))
+    a4 = maps[0].uvecs.OT4th(labels=labels)
+    assert a4.dims == ('label', 'comp4')
+    np.testing.assert_allclose(uvecs.expand_OT4th(a4.sel(label=1)), full_tensor(maps[0].where(labels == 1)), atol=1e-14)
+    np.testing.assert_array_equal(a4['count'], [np.sum(~np.isnan(maps[0].values[:, s]).any(axis=-1)) for s in (slice(0, 8), slice(8, 16))])
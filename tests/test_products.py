@@ -0,0 +1,48 @@
+'''
+Tests of products, several products of the map in one pass
+'''
+import numpy as np
+import pytest
+import xarray as xr
+
+from benchmarks.common import random_map
+from xarrayuvecs import uvecs
+
+AXIS = np.array([0., 1., 0.])
+
+
+def test_products():
+    da = random_map(64)
+    stack = xr.concat([da, random_map(64, seed=1)], dim='time')
+    for obj in (da, stack):
+        ds = obj.uvecs.products(axis=AXIS)
+        np.testing.assert_array_equal(ds.xyz, obj.uvecs.xyz())
+        np.testing.assert_array_equal(ds.colormap, obj.uvecs.calc_colormap())
+        np.testing.assert_allclose(ds.schmid, obj.uvecs.calc_schmid(AXIS), atol=1e-15)
+        # the OT2nd products are identical to OT2nd, one tensor per time step
+        w, v = obj.uvecs.OT2nd()
+        np.testing.assert_array_equal(ds.OT2nd_eigvalue, w)
+        np.testing.assert_array_equal(ds.OT2nd_eigvector, v)
+
+
+def test_products_error():
+    with pytest.raises(ValueError):
+        random_map(4).uvecs.products(names=['xyz', 'OT4th'])
+
+
+def test_products_dask(monkeypatch):
+    dask = pytest.importorskip('dask')
+    stack = xr.concat([random_map(32, seed=i) for i in range(2)], dim='time')
+    calls = []
+    kernel = uvecs._products_block
+    monkeypatch.setattr(uvecs, '_products_block', lambda *args, **kwargs: calls.append(1) or kernel(*args, **kwargs))
+    ds = stack.chunk({'time': 1, 'y': 16}).uvecs.products(axis=AXIS)
+    assert all(isinstance(ds[name].data, dask.array.Array) for name in ds)
+    assert not calls
+    ds = ds.compute()
+    # every chunk is read once for all the products
+    assert len(calls) == 4
+    eager = stack.uvecs.products(axis=AXIS)
+    for name in ('xyz', 'colormap', 'schmid'):
+        np.testing.assert_array_equal(ds[name], eager[name])
+    np.testing.assert_allclose(ds.OT2nd_eigvalue, eager.OT2nd_eigvalue, atol=1e-12)
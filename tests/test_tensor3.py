@@ -0,0 +1,80 @@
+'''
+Tests of tensor3.eigh_sym3, the closed-form eigen solver of 3x3 symmetric tensors
+'''
+import numpy as np
+import pytest
+
+from xarrayuvecs import tensor3, uvecs
+
+
+def check_eigen(tensor, w, v, atol=1e-12):
+    '''
+    A v[:,i] = w[i] v[:,i], v orthonormal and w in decreasing order
+    '''
+    np.testing.assert_allclose(tensor @ v, v * w[..., np.newaxis, :], atol=atol)
+    np.testing.assert_allclose(np.swapaxes(v, -1, -2) @ v, np.broadcast_to(np.eye(3), v.shape), atol=atol)
+    assert np.all(np.diff(w, axis=-1) <= atol)
+
+
+def test_eigh_sym3_random():
+    rng = np.random.default_rng(0)
+    u = rng.normal(size=(1000, 50, 3))
+    tensor = np.einsum('nki,nkj->nij', u, u) / 50
+    w, v = tensor3.eigh_sym3(tensor)
+    check_eigen(tensor, w, v)
+    np.testing.assert_allclose(w, np.linalg.eigh(tensor)[0][:, ::-1], atol=1e-12)
+
+
+@pytest.mark.parametrize('tensor', [
+    np.eye(3) / 3,  # isotropic
+    np.zeros((3, 3)),
+    np.diag([0.5, 0.25, 0.25]),  # transversely isotropic, single maximum
+    np.diag([0.4, 0.4, 0.2]),  # transversely isotropic, girdle
+    np.diag([1., 0., 0.]),
+])
+def test_eigh_sym3_degenerate(tensor):
+    rot = np.linalg.qr(np.random.default_rng(1).normal(size=(3, 3)))[0]
+    for t in (tensor, rot @ tensor @ rot.T):
+        w, v = tensor3.eigh_sym3(t)
+        assert w.shape == (3,) and v.shape == (3, 3)
+        check_eigen(t, w, v)
+        np.testing.assert_allclose(w, np.sort(np.diag(tensor))[::-1], atol=1e-12)
+
+
+def test_eigh_sym3_nan():
+    tensor = np.stack([np.eye(3), np.full((3, 3), np.nan)])
+    w, v = tensor3.eigh_sym3(tensor)
+    assert np.all(np.isnan(w[1])) and np.all(np.isnan(v[1]))
+    check_eigen(tensor[0], w[0], v[0])
+
+
+def test_eigh_sym3_fallback():
+    # a negative tolerance sends every tensor to np.linalg.eigh
+    rng = np.random.default_rng(2)
+    a = rng.normal(size=(100, 3, 3))
+    tensor = a + np.swapaxes(a, -1, -2)
+    w, v = tensor3.eigh_sym3(tensor, tol=-1.)
+    we, ve = np.linalg.eigh(tensor)
+    np.testing.assert_array_equal(w, we[:, ::-1])
+    np.testing.assert_array_equal(v, ve[:, :, ::-1])
+
+
+def test_eigh_sym3_overflow():
+    # the closed form overflows, the residual is NaN and the tensor is solved by np.linalg.eigh
+    tensor = np.diag([3e200, 2e200, 1e200])
+    tensor[0, 1] = tensor[1, 0] = 1e200
+    w, v = tensor3.eigh_sym3(tensor)
+    we, ve = np.linalg.eigh(tensor)
+    np.testing.assert_array_equal(w, we[::-1])
+    np.testing.assert_array_equal(v, ve[:, ::-1])
+
+
+def test_eigh_sym3_batch_size():
+    # OT2nd uses np.linalg.eigh for a few tensors and eigh_sym3 for many, both agree
+    rng = np.random.default_rng(3)
+    u = rng.normal(size=(300, 20, 3))
+    tensor = np.einsum('nki,nkj->nij', u, u) / 20
+    w, v = uvecs._ot2nd_eig(tensor)
+    ws, vs = uvecs._ot2nd_eig(tensor[:10])
+    np.testing.assert_allclose(w[:10], ws, atol=1e-12)
+    np.testing.assert_allclose(np.abs(v[:10]), np.abs(vs), atol=1e-10)
@@ -0,0 +1,163 @@
+'''
+Optional numba kernels for the per-pixel hot loops of uvecs (mis_angle, inner_angle, calc_schmid, calc_colormap).
+
+Each kernel fuses the per-pixel arithmetic in a single multithreaded pass without temporaries.
+The arccos is left to numpy (applied in place) because numba's acos is not bit-identical to numpy's,
+so that the results are bit-compatible with the numpy engine.
+
+This module needs numba, it is only imported by uvecs when the 'numba' engine is used (see uvecs.set_engine).
+'''
+import math
+
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, cache=True)
+def dot_nansum(a, b, out):
+    '''
+    out[i]=sum_k a[i,k]*b[i,k], NaN products are skipped like DataArray.sum
+
+    :param a: vectors of size [n,3]
+    :param b: vectors of size [n,3]
+    :param out: array of size [n]
+    '''
+    for i in numba.prange(a.shape[0]):
+        res = 0.
+        for k in range(a.shape[1]):
+            p = a[i, k] * b[i, k]
+            if not math.isnan(p):
+                res += p
+        out[i] = res
+
+
+@numba.njit(parallel=True, cache=True)
+def dot_axis_nansum(a, axis, out):
+    '''
+    out[i]=sum_k a[i,k]*axis[k], NaN products are skipped like DataArray.sum
+
+    :param a: vectors of size [n,3]
+    :param axis: vector of size [3]
+    :param out: array of size [n]
+    '''
+    for i in numba.prange(a.shape[0]):
+        res = 0.
+        for k in range(a.shape[1]):
+            p = a[i, k] * axis[k]
+            if not math.isnan(p):
+                res += p
+        out[i] = res
+
+
+@numba.njit(parallel=True, cache=True)
+def abs_cos_sin(angle):
+    '''
+    angle[i]=abs(cos(angle[i])*sin(angle[i])) in place
+    '''
+    for i in numba.prange(angle.shape[0]):
+        angle[i] = abs(math.cos(angle[i]) * math.sin(angle[i]))
+
+
+@numba.njit(parallel=True, cache=True)
+def fold(angle):
+    '''
+    angle[i]=pi-angle[i] if angle[i]>pi/2, in place, because c=-c
+    '''
+    for i in numba.prange(angle.shape[0]):
+        if angle[i] > np.pi / 2:
+            angle[i] = np.pi - angle[i]
+
+
+@numba.njit(parallel=True, cache=True)
+def neighbour_dot(comp, cartesian, out):
+    '''
+    Dot product, rounded to 1e-5, between each pixel and its neighbours (i+1,j), (i,j+1), (i,j-1), (i-1,j)
+
+    Like the convolution used by the numpy engine, the result is NaN when a NaN is in the 3x3 window of the pixel.
+
+    :param comp: Bunge Euler angle comp[:,:,0:2] or cartesian coordinate comp[:,:,0:3]
+    :param cartesian: True if comp is in cartesian coordinate
+    :param out: array of size [n,m,4], the border is set to NaN
+    '''
+    n, m = comp.shape[0], comp.shape[1]
+    bad = np.zeros((n, m), dtype=np.bool_)
+    for i in numba.prange(n):
+        for j in range(m):
+            for c in range(comp.shape[2]):
+                if math.isnan(comp[i, j, c]):
+                    bad[i, j] = True
+    di = (1, 0, 0, -1)
+    dj = (0, 1, -1, 0)
+    for i in numba.prange(n):
+        for j in range(m):
+            skip = i == 0 or j == 0 or i == n - 1 or j == m - 1
+            if not skip:
+                for wi in range(i - 1, i + 2):
+                    for wj in range(j - 1, j + 2):
+                        if bad[wi, wj]:
+                            skip = True
+            for k in range(4):
+                if skip:
+                    out[i, j, k] = np.nan
+                    continue
+                ni = i + di[k]
+                nj = j + dj[k]
+                if cartesian:
+                    d = comp[i, j, 0] * comp[ni, nj, 0] + comp[i, j, 1] * comp[ni, nj, 1] + comp[i, j, 2] * comp[ni, nj, 2]
+                else:
+                    phi1 = comp[i, j, 0]
+                    phi = comp[i, j, 1]
+                    nphi1 = comp[ni, nj, 0]
+                    nphi = comp[ni, nj, 1]
+                    d = (math.sin(phi1) * math.sin(nphi1) * math.sin(phi) * math.sin(nphi)
+                         + math.cos(phi1) * math.cos(nphi1) * math.sin(phi) * math.sin(nphi)
+                         + math.cos(phi) * math.cos(nphi))
+                # same as np.round(d,5)
+                out[i, j, k] = np.rint(d * 1e5) / 1e5
+
+
+@numba.njit(parallel=True, cache=True)
+def _colormap(u, rlut, cartesian, out):
+    nlut = rlut.shape[0]
+    c = (nlut - 1) / 2
+    for i in numba.prange(u.shape[0]):
+        if cartesian:
+            invalid = math.isnan(u[i, 0]) or math.isnan(u[i, 1]) or math.isnan(u[i, 2])
+            # same tie-break on the equator as uvecs._canonical_kernel
+            z = u[i, 2]
+            flip = z < 0 or (z == 0 and (u[i, 1] < 0 or (u[i, 1] == 0 and u[i, 0] < 0)))
+            sgn = -1. if flip else 1.
+            hx = sgn * u[i, 0]
+            hy = sgn * u[i, 1]
+        else:
+            invalid = math.isnan(u[i, 0]) or math.isnan(u[i, 1])
+            rho = math.sin(u[i, 1])
+            hx = rho * math.cos(u[i, 0])
+            hy = rho * math.sin(u[i, 0])
+        if invalid:
+            for k in range(3):
+                out[i, k] = 255
+        else:
+            ix = int(c * (-hy) + c)
+            iy = int(c * hx + c)
+            for k in range(3):
+                out[i, k] = rlut[ix, iy, k]
+
+
+def colormap(u, rlut, representation='azicol'):
+    '''
+    Fused version of uvecs._colormap: color each vector with rlut, invalid vectors are white
+
+    :param u: vectors, azimuth/colatitude u[...,0:2] or cartesian u[...,0:3]
+    :type u: np.array
+    :param rlut: colorwheel of size [nlut,nlut,3]
+    :type rlut: np.array
+    :param representation: 'azicol' or 'xyz'
+    :type representation: str
+    :rtype: np.array of size [...,3]
+    '''
+    shape = u.shape[:-1]
+    u = np.ascontiguousarray(u, dtype=np.float64).reshape(-1, u.shape[-1])
+    out = np.empty((u.shape[0], 3), dtype=rlut.dtype)
+    _colormap(u, np.asarray(rlut), representation == 'xyz', out)
+    return out.reshape(shape + (3,))
@@ -1,60 +1,156 @@
 #########################Various Function##############################
+import functools
+import os
+
 import numpy as np
-import colorsys
 
 
-def lut(nx=512,semi=False,circle=True):
+# directory of the on-disk lut cache (opt-in), see set_cache_dir
+_cache_dir=os.environ.get('XARRAYUVECS_LUT_CACHE') or None
+# number of pixels computed at once when filling a lut
+_BLOCK_SIZE=2**20
+
+def set_cache_dir(path):
+    '''
+    Set the directory of the on-disk lut cache
+    
+    uint8 luts are stored there as .npy files and memory-mapped back on later calls, so that several
+    processes share the same lut through the page cache. It can also be set with the environment
+    variable XARRAYUVECS_LUT_CACHE.
+    
+    :param path: cache directory, None to disable the on-disk cache
+    :type path: str
+    '''
+    global _cache_dir
+    if path is not None:
+        path=os.path.abspath(os.path.expanduser(path))
+        os.makedirs(path,exist_ok=True)
+    _cache_dir=path
+    _lut.cache_clear()
+
+def get_cache_dir():
+    '''
+    :return: the directory of the on-disk lut cache, None if disabled
+    :rtype: str
+    '''
+    return _cache_dir
+
+def lut(nx=512,semi=False,circle=True,dtype=np.float64):
     '''
     Create a 2D colorwheel
     
     :param nx: number of pixel for the colorwheel
     :param circle: do you want create a black circle around
     :param semi: do you want a semi LUT
+    :param dtype: np.float64 for value in [0 1], np.uint8 for value in [0 255]
     :type nx: int
     :type circle: bool
     :type semi: bool
+    :type dtype: np.dtype
     :return: lut
     :rtype: array of size [nx,nx,3]
     :Exemple:
         >>> lut2d=lut()
         >>> plt.imshow(lut)
         >>> plt.show()
+
+    .. note:: the lut is cached for each (nx,semi,circle,dtype) and returned read-only, use lut().copy() to modify it
+    .. note:: if a cache directory is set (see set_cache_dir) the uint8 luts are stored on disk and memory-mapped
     '''
+    dtype=np.dtype(dtype)
+    if dtype not in (np.dtype(np.float64),np.dtype(np.uint8)):
+        raise ValueError('dtype should be np.float64 or np.uint8, got '+str(dtype))
+    return _lut(int(nx),bool(semi),bool(circle),dtype.str)
+
+@functools.lru_cache(maxsize=8)
+def _lut(nx,semi,circle,dtype):
+    if _cache_dir is not None and np.dtype(dtype)==np.uint8:
+        fname=os.path.join(_cache_dir,'lut2d_nx{}_semi{:d}_circle{:d}_uint8.npy'.format(nx,semi,circle))
+        if not os.path.exists(fname):
+            # write in a temporary file and rename it so that concurrent processes never read a partial file
+            tmp='{}.{}.tmp'.format(fname,os.getpid())
+            out=np.lib.format.open_memmap(tmp,mode='w+',dtype=np.uint8,shape=(nx,nx,3))
+            _fill_lut(out,nx,semi,circle)
+            out.flush()
+            del out
+            os.replace(tmp,fname)
+        return np.load(fname,mmap_mode='r')
     
-    
+    lutrgb=np.empty((nx,nx,3),dtype=dtype)
+    _fill_lut(lutrgb,nx,semi,circle)
+    lutrgb.flags.writeable=False
+    return lutrgb
+
+def _fill_lut(out,nx,semi,circle):
+    '''
+    Fill out with the colorwheel, computed by block of rows to bound the memory used
+    '''
     x=np.linspace(-np.pi/2, np.pi/2, nx)
     y=np.linspace(-np.pi/2, np.pi/2, nx)
-    xv, yv = np.meshgrid(x, y)
-    rho,phi=cart2pol(xv, yv)
+    nrow=max(1,_BLOCK_SIZE//nx)
+    blocks=[slice(i,min(i+nrow,nx)) for i in range(0,nx,nrow)]
     
-    if semi:
-        phi=np.mod(phi,np.pi)
+    def polar(rows):
+        xv, yv = np.meshgrid(x, y[rows])
+        rho,phi=cart2pol(xv, yv)
+        if semi:
+            phi=np.mod(phi,np.pi)
+        return rho,phi
     
-    h = (phi-np.min(phi))/(np.max(phi)-np.min(phi))
-    v = rho/np.max(rho)
-
-    luthsv = np.ones((nx, nx,3))
-    luthsv[:,:,0]=h
-    luthsv[:,:,2]=v
-    # colorwheel rgb
-    lutrgb = np.ones((nx, nx,3))
-    for i in list(range(nx)):
-        for j in list(range(nx)):
-            lutrgb[i,j,0],lutrgb[i,j,1],lutrgb[i,j,2]=colorsys.hsv_to_rgb(luthsv[i,j,0],luthsv[i,j,1],luthsv[i,j,2])
+    # normalisation over the whole wheel
+    phimin,phimax,rhomax=np.inf,-np.inf,-np.inf
+    for rows in blocks:
+        rho,phi=polar(rows)
+        phimin=min(phimin,np.min(phi))
+        phimax=max(phimax,np.max(phi))
+        rhomax=max(rhomax,np.max(rho))
+    
+    for rows in blocks:
+        rho,phi=polar(rows)
+        h = (phi-phimin)/(phimax-phimin)
+        v = rho/rhomax
 
+        # colorwheel rgb
+        lutrgb = hsv_to_rgb(h,np.ones(np.shape(h)),v)
         
-    # build a circle color bar        
-    if circle:
-        for i in list(range(nx)):
-            for j in list(range(nx)):
-                if ((i-nx/2)**2+(j-nx/2)**2)**0.5>(nx/2):
-                    lutrgb[i,j,0]=0 
-                    lutrgb[i,j,1]=0
-                    lutrgb[i,j,2]=0
-                    
-
+        # build a circle color bar        
+        if circle:
+            i,j=np.ogrid[rows,0:nx]
+            lutrgb[((i-nx/2)**2+(j-nx/2)**2)**0.5>(nx/2),:]=0
+        
+        if out.dtype==np.uint8:
+            lutrgb=np.rint(lutrgb*255)
+        out[rows]=lutrgb
 
-    return lutrgb
+def hsv_to_rgb(h,s,v):
+    '''
+    Vectorized version of colorsys.hsv_to_rgb
+    
+    :param h: hue [0 1]
+    :param s: saturation [0 1]
+    :param v: value [0 1]
+    :type h: np.array
+    :type s: np.array
+    :type v: np.array
+    :return: rgb, the last dimension is the color channel
+    :rtype: np.array of size [...,3]
+    '''
+    h,s,v=np.broadcast_arrays(np.asarray(h,dtype=np.float64),np.asarray(s,dtype=np.float64),np.asarray(v,dtype=np.float64))
+    i=np.floor(h*6.0)
+    f=(h*6.0)-i
+    p=v*(1.0-s)
+    q=v*(1.0-s*f)
+    t=v*(1.0-s*(1.0-f))
+    i=i.astype(np.int64)%6
+    
+    rgb=np.empty(h.shape+(3,))
+    rgb[...,0]=np.choose(i,[v,q,p,p,t,v])
+    rgb[...,1]=np.choose(i,[t,v,v,q,p,p])
+    rgb[...,2]=np.choose(i,[p,p,t,v,v,q])
+    # colorsys return (v,v,v) without computation when s=0
+    grey=s==0.0
+    rgb[grey,:]=v[grey,np.newaxis]
+    return rgb
 
 def cart2pol(x, y):
     '''
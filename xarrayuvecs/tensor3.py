@@ -0,0 +1,171 @@
+'''
+Vectorized closed-form eigen decomposition of 3x3 symmetric tensors.
+
+eigh_sym3 solves millions of orientation tensors at once (local tensor maps, one tensor per grain...)
+without the per-matrix overhead of np.linalg.eigh: every step is a numpy operation on arrays of size [n].
+'''
+import numpy as np
+
+# number of tensors solved together, the temporaries of a block stay in the cache of the cpu
+_BLOCK_SIZE = 2**14
+
+
+def eigh_sym3(tensor, tol=1e-10):
+    '''
+    Eigen decomposition of symmetric 3x3 tensors
+
+    The eigen values are first given by the trigonometric (Cardano) solution of the characteristic polynomial.
+    The eigen vector of the most isolated eigen value is the largest cross product of two rows of A-lambda*I,
+    the two other ones are obtained by a Jacobi rotation in the orthogonal plane, so that degenerate eigen values
+    (e.g. transverse isotropy, isotropy) still give an orthonormal basis. The eigen values are then the Rayleigh
+    quotients of the eigen vectors. Tensors with a residual max|A v - lambda v| larger than tol*max|A|, or not finite
+    (overflow of the closed form, e.g. entries about 1e200), are solved again with np.linalg.eigh.
+
+    :param tensor: symmetric tensors of size [...,3,3] (only the upper triangle is used)
+    :type tensor: np.array
+    :param tol: relative tolerance of the residual before the np.linalg.eigh fallback (default:1e-10)
+    :type tol: float
+    :return: eigen value w[...,i] sorted in decreasing order, eigen vector v[...,:,i]
+    :rtype: np.array, np.array
+    :Exemple:
+        >>> w,v=eigh_sym3(np.eye(3)*[3.,1.,2.])
+        >>> w
+        array([3., 2., 1.])
+
+    .. note:: tensors with NaN give NaN
+    '''
+    a = np.asarray(tensor, dtype=np.float64)
+    shape = a.shape[:-2]
+    a = a.reshape(-1, 3, 3)
+    eigvalue = np.empty((a.shape[0], 3))
+    eigvector = np.empty((a.shape[0], 3, 3))
+    # an overflow of the closed form is caught by the residual check
+    with np.errstate(over='ignore', invalid='ignore'):
+        for i in range(0, a.shape[0], _BLOCK_SIZE):
+            sl = slice(i, i + _BLOCK_SIZE)
+            _eigh_sym3(a[sl], tol, eigvalue[sl], eigvector[sl])
+    return eigvalue.reshape(shape + (3,)), eigvector.reshape(shape + (3, 3))
+
+
+def _eigh_sym3(a, tol, eigvalue, eigvector):
+    '''
+    eigh_sym3 of the tensors a of size [n,3,3], written in eigvalue [n,3] and eigvector [n,3,3]
+    '''
+    # the 6 components as contiguous arrays, every step below works on arrays of size [n]
+    a11, a22, a33 = (np.ascontiguousarray(a[:, i, i]) for i in range(3))
+    a12, a13, a23 = (np.ascontiguousarray(a[:, i, j]) for i, j in ((0, 1), (0, 2), (1, 2)))
+    comp = (a11, a22, a33, a12, a13, a23)
+
+    # eigen values of B=(A-qI)/p are 2cos(phi+2k*pi/3)
+    q = (a11 + a22 + a33) / 3.
+    b11, b22, b33 = a11 - q, a22 - q, a33 - q
+    off = a12 * a12 + a13 * a13 + a23 * a23
+    p = np.sqrt((b11 * b11 + b22 * b22 + b33 * b33 + 2. * off) / 6.)
+    ps = np.where(p == 0, 1., p)
+    det = (b11 * (b22 * b33 - a23 * a23) - a12 * (a12 * b33 - a23 * a13) + a13 * (a12 * a23 - b22 * a13)) / (ps * ps * ps)
+    phi = np.arccos(np.clip(det / 2., -1., 1.)) / 3.
+    l1 = q + 2. * p * np.cos(phi)
+    l3 = q + 2. * p * np.cos(phi + 2. * np.pi / 3.)
+    l2 = 3. * q - l1 - l3
+
+    # eigen vector of the most isolated eigen value
+    v = _null_vector(comp, np.where(l1 - l2 >= l2 - l3, l1, l3))
+
+    # orthonormal basis (e1,e2) of the plane orthogonal to v: e1=v x axis with the axis the most orthogonal to v
+    vx, vy, vz = v
+    ax, ay, az = np.abs(vx), np.abs(vy), np.abs(vz)
+    zero = np.zeros_like(vx)
+    on_x = (ax <= ay) & (ax <= az)
+    on_y = ~on_x & (ay <= az)
+    e1 = _normalize((np.where(on_x, 0., np.where(on_y, -vz, vy)),
+                     np.where(on_x, vz, np.where(on_y, 0., -vx)),
+                     np.where(on_x, -vy, np.where(on_y, vx, zero))))
+    e2 = _cross(v, e1)
+
+    # Jacobi rotation diagonalising A in the plane (e1,e2)
+    m11 = _quadratic(comp, e1, e1)
+    m22 = _quadratic(comp, e2, e2)
+    m12 = _quadratic(comp, e1, e2)
+    theta = 0.5 * np.arctan2(2. * m12, m11 - m22)
+    c = np.cos(theta)
+    s = np.sin(theta)
+    vectors = [v,
+               tuple(c * x1 + s * x2 for x1, x2 in zip(e1, e2)),
+               tuple(c * x2 - s * x1 for x1, x2 in zip(e1, e2))]
+    values = [_quadratic(comp, x, x) for x in vectors]
+
+    # sort in decreasing order with a 3 elements sorting network
+    for i, j in ((0, 1), (1, 2), (0, 1)):
+        swap = values[i] < values[j]
+        values[i], values[j] = np.where(swap, values[j], values[i]), np.where(swap, values[i], values[j])
+        vectors[i], vectors[j] = (tuple(np.where(swap, y, x) for x, y in zip(vectors[i], vectors[j])),
+                                  tuple(np.where(swap, x, y) for x, y in zip(vectors[i], vectors[j])))
+
+    residual = np.zeros_like(a11)
+    for k in range(3):
+        av = _matvec(comp, vectors[k])
+        eigvalue[:, k] = values[k]
+        for i in range(3):
+            eigvector[:, i, k] = vectors[k][i]
+            residual = np.maximum(residual, np.abs(av[i] - values[k] * vectors[k][i]))
+
+    # fallback for the tensors where the closed form lost accuracy, or overflowed (NaN residual of a finite tensor)
+    scale = np.maximum.reduce([np.abs(x) for x in comp])
+    bad = np.flatnonzero(~(residual <= tol * scale))
+    bad = bad[np.isfinite(scale[bad])]
+    if len(bad):
+        w, vv = np.linalg.eigh(a[bad])
+        eigvalue[bad] = w[:, ::-1]
+        eigvector[bad] = vv[:, :, ::-1]
+
+
+def _null_vector(comp, lam):
+    '''
+    Unit vector v such that (A-lam*I)v=0, largest cross product of two rows of A-lam*I
+
+    :param comp: components a11, a22, a33, a12, a13, a23 of size [n]
+    :param lam: eigen value of size [n]
+    :rtype: tuple of 3 np.array of size [n]
+    '''
+    a11, a22, a33, a12, a13, a23 = comp
+    r0 = (a11 - lam, a12, a13)
+    r1 = (a12, a22 - lam, a23)
+    r2 = (a13, a23, a33 - lam)
+    best = _cross(r0, r1)
+    nbest = _dot(best, best)
+    for x in (_cross(r0, r2), _cross(r1, r2)):
+        nx = _dot(x, x)
+        larger = nx > nbest
+        best = tuple(np.where(larger, y, z) for y, z in zip(x, best))
+        nbest = np.where(larger, nx, nbest)
+    # A=lam*I, any vector is an eigen vector
+    null = nbest == 0
+    best = (np.where(null, 1., best[0]), np.where(null, 0., best[1]), np.where(null, 0., best[2]))
+    return _normalize(best)
+
+
+def _cross(u, v):
+    return (u[1] * v[2] - u[2] * v[1], u[2] * v[0] - u[0] * v[2], u[0] * v[1] - u[1] * v[0])
+
+
+def _dot(u, v):
+    return u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+
+
+def _normalize(v):
+    norm = np.sqrt(_dot(v, v))
+    return tuple(x / norm for x in v)
+
+
+def _matvec(comp, v):
+    a11, a22, a33, a12, a13, a23 = comp
+    return (a11 * v[0] + a12 * v[1] + a13 * v[2],
+            a12 * v[0] + a22 * v[1] + a23 * v[2],
+            a13 * v[0] + a23 * v[1] + a33 * v[2])
+
+
+def _quadratic(comp, u, v):
+    '''
+    u^T A v for the symmetric tensors A
+    '''
+    return _dot(u, _matvec(comp, v))
@@ -1,32498 +1,76 @@
+'''
+Uniform distribution of points on the unit sphere used to evaluate the ODF.
+
+unidist: fixed set of points on the whole sphere, stored as a binary float64 array in uniform_dist.npy
+(flat array x0,y0,z0,x1,y1,z1,...). It is loaded lazily and memory-mapped the first time it is needed,
+so importing this module is cheap.
+
+equal_area_hemisphere: equal-area set of points on the upper hemisphere at any resolution, with its triangulation.
+'''
+import os
+import functools
+
 import numpy as np
-unidist=np.array([
-0.509740891866,
-0.858587033115,
-0.054704019281,
-0.533297886141,
-0.845456878655,
-0.028214020866,
-0.601482758764,
-0.796013182495,
-0.067686809675,
-0.517031948082,
-0.851514691953,
-0.087181959437,
-0.541502443142,
-0.838485074695,
-0.060974450259,
-0.636536089703,
-0.764556520153,
-0.101366335619,
-0.498443288263,
-0.855155644007,
-0.142348561315,
-0.524006836582,
-0.843371405732,
-0.118918069313,
-0.548872753512,
-0.830738198012,
-0.092804885731,
-0.572709175758,
-0.817104273010,
-0.065915150241,
-0.451437165961,
-0.865236842074,
-0.218104773694,
-0.478160087951,
-0.855929451995,
-0.196844363646,
-0.504523177166,
-0.845588746481,
-0.174459266100,
-0.530428048689,
-0.834274934605,
-0.150437424381,
-0.555596354883,
-0.822094202042,
-0.124393783647,
-0.579833815340,
-0.808868435677,
-0.097594059007,
-0.700386923272,
-0.693740005139,
-0.167877821581,
-0.456245351117,
-0.853789221030,
-0.250767114346,
-0.483363013715,
-0.844927722123,
-0.229035677050,
-0.510072452482,
-0.835057219956,
-0.206168699415,
-0.536257536616,
-0.824238695204,
-0.181819767216,
-0.561699814163,
-0.812529734802,
-0.155848480366,
-0.586250028573,
-0.799775054213,
-0.129115323093,
-0.608982280362,
-0.786838789936,
-0.100126424367,
-0.404537812807,
-0.855049731676,
-0.324405786587,
-0.432761095464,
-0.848707024008,
-0.303997075071,
-0.460602751467,
-0.841336350422,
-0.282839620277,
-0.488048481755,
-0.832949915435,
-0.260774074312,
-0.515046814922,
-0.823573709931,
-0.237598658979,
-0.541483068373,
-0.813262540847,
-0.213073053952,
-0.567184163723,
-0.802037815098,
-0.187182978860,
-0.592020299751,
-0.789775412530,
-0.160520286711,
-0.615419060923,
-0.777051321231,
-0.132100808574,
-0.378866273910,
-0.845531467814,
-0.376213879901,
-0.407783503179,
-0.840669571422,
-0.356352755315,
-0.436314161401,
-0.834788295906,
-0.335795255444,
-0.464453915600,
-0.827895394061,
-0.314438828355,
-0.492177671287,
-0.820003566332,
-0.292156278537,
-0.519427435938,
-0.811137061100,
-0.268796962230,
-0.546096639708,
-0.801342482213,
-0.244189857080,
-0.572044412140,
-0.790613876656,
-0.218391594571,
-0.597152269911,
-0.778857082594,
-0.191809310079,
-0.621038774494,
-0.766476261429,
-0.163783336271,
-0.643124058843,
-0.753976111300,
-0.133833734635,
-0.351838442497,
-0.833082078956,
-0.426830130267,
-0.381405273918,
-0.829682353884,
-0.407623856860,
-0.410583074670,
-0.825275966432,
-0.387738466010,
-0.439374092501,
-0.819868898485,
-0.367104067175,
-0.467766799964,
-0.813468177337,
-0.345635277874,
-0.495729662012,
-0.806085115764,
-0.323231942024,
-0.523203249555,
-0.797740348149,
-0.299781081107,
-0.550090552773,
-0.788471944630,
-0.275158820103,
-0.576273198705,
-0.778252558317,
-0.249463736698,
-0.601641470101,
-0.767013889272,
-0.222973619783,
-0.625926236622,
-0.755046458449,
-0.195246490087,
-0.648711338174,
-0.742736837361,
-0.165878238934,
-0.323571996298,
-0.817745743319,
-0.476017922451,
-0.353737616446,
-0.815773311537,
-0.457584530874,
-0.383512766566,
-0.812812516000,
-0.438467526408,
-0.412905547302,
-0.808868616354,
-0.418617451243,
-0.441913583782,
-0.803945533000,
-0.397974828901,
-0.470520244446,
-0.798048178665,
-0.376470190182,
-0.498690283857,
-0.791185291484,
-0.354025190242,
-0.526364968624,
-0.783373245969,
-0.330554499750,
-0.553456274327,
-0.774641918018,
-0.305967402278,
-0.579861548264,
-0.764946680982,
-0.280387517733,
-0.605479281861,
-0.754239827860,
-0.254002207286,
-0.630110240541,
-0.742731326260,
-0.226519892631,
-0.653442397248,
-0.730730853975,
-0.197599221982,
-0.675125976559,
-0.718513555359,
-0.167162156425,
-0.799003016669,
-0.505994649138,
-0.324905516107,
-0.355227301829,
-0.797435434069,
-0.487760486844,
-0.385163513944,
-0.794914821628,
-0.468785125491,
-0.414726779331,
-0.791438960936,
-0.449027916302,
-0.443911483977,
-0.787008109037,
-0.428439996620,
-0.472697284538,
-0.781623984221,
-0.406965876309,
-0.501046845689,
-0.775291633792,
-0.384545109183,
-0.528902593534,
-0.768023083918,
-0.361112986643,
-0.556183853652,
-0.759841040708,
-0.336602308061,
-0.582798919640,
-0.750686869491,
-0.311150515410,
-0.608654780313,
-0.740527365357,
-0.284883449080,
-0.633597340900,
-0.729513047729,
-0.257614290748,
-0.657383693382,
-0.717900629621,
-0.229053193964,
-0.679741136730,
-0.705901380163,
-0.199136205954,
-0.779455798212,
-0.552665008698,
-0.294974654495,
-0.779247787315,
-0.535376362503,
-0.325799073721,
-0.778070620261,
-0.517379894387,
-0.356264164309,
-0.386335970368,
-0.775975091849,
-0.498605229445,
-0.416026083287,
-0.772972327657,
-0.478994862918,
-0.445348939393,
-0.769041947555,
-0.458518053170,
-0.474281772040,
-0.764180865604,
-0.437132022797,
-0.502785535995,
-0.758389972150,
-0.414790736319,
-0.530804099515,
-0.751675777603,
-0.391446718345,
-0.558261487633,
-0.744055856019,
-0.367049035620,
-0.585073072463,
-0.735461508390,
-0.341739476145,
-0.611155203544,
-0.725866878871,
-0.315605119318,
-0.636383795645,
-0.715377871413,
-0.288531048127,
-0.660563635174,
-0.704212118406,
-0.260270966832,
-0.683476702310,
-0.692531867884,
-0.230779568776,
-0.704886406660,
-0.680524332915,
-0.200054457629,
-0.757178336382,
-0.597441831138,
-0.264091320040,
-0.758300940040,
-0.581180686131,
-0.295311182318,
-0.758470088709,
-0.564198671374,
-0.326194702215,
-0.757695269771,
-0.546462423634,
-0.356758598667,
-0.756003153045,
-0.527930440381,
-0.386973749375,
-0.416786057409,
-0.753448209260,
-0.508532376858,
-0.446207860485,
-0.750028876122,
-0.488216376440,
-0.475256867241,
-0.745701770764,
-0.466968713320,
-0.503890763968,
-0.740464432165,
-0.444754452126,
-0.532054174226,
-0.734317471273,
-0.421540279299,
-0.559675204568,
-0.727271290962,
-0.397290995034,
-0.586669904180,
-0.719256982207,
-0.372139512919,
-0.612966060638,
-0.710246570874,
-0.346153747729,
-0.638460328337,
-0.700312680099,
-0.319265656206,
-0.662991166580,
-0.689641762059,
-0.291267837325,
-0.686379326973,
-0.678358205594,
-0.262132722885,
-0.708427054342,
-0.666613279376,
-0.231857379516,
-0.732280310243,
-0.640119516756,
-0.232406005726,
-0.734654367436,
-0.624988892581,
-0.263954247091,
-0.736102349125,
-0.609122008085,
-0.295167259158,
-0.736643903423,
-0.592483236920,
-0.326066517015,
-0.736286048777,
-0.575040785130,
-0.356666440547,
-0.735024618451,
-0.556765963323,
-0.386976061735,
-0.732891345862,
-0.537619859446,
-0.416935440913,
-0.446476634126,
-0.729942906182,
-0.517534509858,
-0.475605014712,
-0.726167588495,
-0.496468028579,
-0.504345036577,
-0.721498236991,
-0.474422151778,
-0.532635680865,
-0.715933202766,
-0.451374435083,
-0.560406939592,
-0.709473131690,
-0.427307778383,
-0.587573355064,
-0.702058188152,
-0.402333012402,
-0.614071177784,
-0.693652731366,
-0.376513581272,
-0.639814347960,
-0.684303739574,
-0.349808507829,
-0.664664669428,
-0.674170257989,
-0.322048661629,
-0.688470879104,
-0.663347279653,
-0.293220454953,
-0.711065840907,
-0.651954164263,
-0.263327054430,
-0.712834204081,
-0.636507382151,
-0.294492359764,
-0.713746738620,
-0.620240751188,
-0.325372100332,
-0.713806638960,
-0.603125964757,
-0.355976337434,
-0.713008481544,
-0.585137025453,
-0.386307606307,
-0.711334601976,
-0.566251681186,
-0.416367767227,
-0.708830045070,
-0.546431413852,
-0.446063534893,
-0.475320368540,
-0.705551241990,
-0.525612016774,
-0.504134074319,
-0.701469401363,
-0.503775261462,
-0.532528907061,
-0.696504415944,
-0.480930932375,
-0.560433162842,
-0.690652200021,
-0.457071338626,
-0.587765434291,
-0.683850854635,
-0.432295966749,
-0.614454438910,
-0.676069940440,
-0.406663470374,
-0.640431668609,
-0.667336496990,
-0.380143759158,
-0.665576466359,
-0.657779645175,
-0.352610132898,
-0.689758528490,
-0.647472758312,
-0.324055858796,
-0.690240188967,
-0.630711224396,
-0.354643247441,
-0.689907310996,
-0.613040501717,
-0.384979539051,
-0.688745900523,
-0.594439277891,
-0.415055453419,
-0.686726880725,
-0.574894833844,
-0.444861912629,
-0.683916954789,
-0.554357033689,
-0.474284596157,
-0.503241112921,
-0.680359054357,
-0.532785078076,
-0.531720548403,
-0.676012829877,
-0.510176354066,
-0.559741694480,
-0.670791975688,
-0.486546360394,
-0.587226813659,
-0.664625657257,
-0.461992862538,
-0.614101661369,
-0.657483244315,
-0.436571795870,
-0.640295865946,
-0.649395550601,
-0.410251901778,
-0.665714723058,
-0.640451726038,
-0.382943199598,
-0.665064220782,
-0.622168319300,
-0.413032885730,
-0.663602297660,
-0.602912621107,
-0.442863818629,
-0.661304518580,
-0.582670499105,
-0.472410227639,
-0.658241473138,
-0.561398955062,
-0.501546983139,
-0.530186663847,
-0.654446960427,
-0.539074463749,
-0.558313987684,
-0.649875510950,
-0.515700796417,
-0.585936979856,
-0.644367810339,
-0.491393915953,
-0.612985588145,
-0.637885440141,
-0.466209002469,
-0.639388890937,
-0.630461315159,
-0.440114049122,
-0.637683355249,
-0.610524214804,
-0.469702162626,
-0.635159254074,
-0.589570333716,
-0.498978500105,
-0.631885373499,
-0.567566573620,
-0.527815364751,
-0.556122903246,
-0.627892878372,
-0.544497795931,
-0.583873834927,
-0.623061616905,
-0.520466681381,
-0.611082217190,
-0.617262952030,
-0.495545125983,
-0.608373477124,
-0.595600248780,
-0.524539851666,
-0.604926632717,
-0.572873638477,
-0.553063796833,
-0.581014692318,
-0.600697877351,
-0.549166629956,
-0.525731112119,
-0.850650808352,
-0.000000000000,
-0.000000000000,
-0.525731112119,
--0.850650808352,
--0.525731112119,
-0.850650808352,
-0.000000000000,
-0.000000000000,
-0.525731112119,
-0.850650808352,
-0.850650808352,
--0.000000000000,
-0.525731112119,
--0.850650808352,
--0.000000000000,
-0.525731112119,
--0.000000000000,
--0.525731112119,
-0.850650808352,
--0.850650808352,
--0.000000000000,
--0.525731112119,
--0.525731112119,
--0.850650808352,
-0.000000000000,
-0.850650808352,
--0.000000000000,
--0.525731112119,
-0.525731112119,
--0.850650808352,
-0.000000000000,
-0.000000000000,
--0.525731112119,
--0.850650808352,
-0.577350269190,
-0.577350269190,
-0.577350269190,
-0.356822089773,
-0.000000000000,
--0.934172358963,
--0.577350269190,
-0.577350269190,
--0.577350269190,
--0.356822089773,
-0.000000000000,
-0.934172358963,
-0.934172358963,
-0.356822089773,
--0.000000000000,
-0.000000000000,
-0.934172358963,
--0.356822089773,
--0.577350269190,
-0.577350269190,
-0.577350269190,
-0.577350269190,
--0.577350269190,
-0.577350269190,
--0.934172358963,
--0.356822089773,
--0.000000000000,
-0.577350269190,
-0.577350269190,
--0.577350269190,
--0.000000000000,
-0.934172358963,
-0.356822089773,
--0.577350269190,
--0.577350269190,
-0.577350269190,
-0.934172358963,
--0.356822089773,
-0.000000000000,
-0.356822089773,
--0.000000000000,
-0.934172358963,
--0.356822089773,
--0.000000000000,
--0.934172358963,
--0.000000000000,
--0.934172358963,
--0.356822089773,
-0.577350269190,
--0.577350269190,
--0.577350269190,
-0.000000000000,
--0.934172358963,
-0.356822089773,
--0.934172358963,
-0.356822089773,
-0.000000000000,
--0.577350269190,
--0.577350269190,
--0.577350269190,
-0.054704019708,
-0.509740892985,
--0.858587032424,
-0.017437222806,
-0.505083862528,
--0.862894104207,
-0.000000001077,
-0.424276393266,
--0.905532739396,
-0.075148223519,
-0.485527218439,
--0.870985685678,
-0.037684282522,
-0.480527992402,
--0.876169357698,
-0.000000001209,
-0.371155580903,
--0.928570694543,
-0.130198387931,
-0.466633721374,
--0.874815037512,
-0.094819417663,
-0.460915747478,
--0.882363843185,
-0.057356574024,
-0.456067868618,
--0.888094771199,
-0.019470995389,
-0.451116799777,
--0.892252494139,
-0.218104773852,
-0.451437166376,
--0.865236841817,
-0.184667138114,
-0.446279697618,
--0.875632616795,
-0.150180215433,
-0.440959797305,
--0.884873075674,
-0.114297541343,
-0.435812606548,
--0.892750493708,
-0.076879586932,
-0.431202572933,
--0.898973787276,
-0.038992437455,
-0.426412778319,
--0.903687851145,
-0.000000000267,
-0.260877081116,
--0.965372025982,
-0.238587560490,
-0.424358865154,
--0.873496153136,
-0.204709273349,
-0.419675662001,
--0.884288670135,
-0.169804627536,
-0.414870076333,
--0.893895524226,
-0.133670277522,
-0.410200536058,
--0.902146206069,
-0.096319658571,
-0.405851335393,
--0.908849391777,
-0.058475559759,
-0.401312727207,
--0.914072592245,
-0.019659396641,
-0.398316866803,
--0.917037175770,
-0.324405786143,
-0.404537811643,
--0.855049732395,
-0.291823145905,
-0.400889335129,
--0.868404855176,
-0.258507914019,
-0.396901517479,
--0.880705878152,
-0.224342096266,
-0.392668324953,
--0.891898094191,
-0.189196217983,
-0.388327579256,
--0.901890504602,
-0.152950133514,
-0.384079219164,
--0.910543469618,
-0.115685444091,
-0.380001187585,
--0.917723256467,
-0.077907514227,
-0.375737253482,
--0.923445686314,
-0.039284332407,
-0.372422371603,
--0.927231534385,
-0.376213878238,
-0.378866269556,
--0.845531470505,
-0.344184867676,
-0.375927559769,
--0.860357627193,
-0.311470757725,
-0.372631799612,
--0.874146159976,
-0.277993144360,
-0.369037876158,
--0.886865749507,
-0.243665596151,
-0.365227416662,
--0.898463138571,
-0.208402729158,
-0.361313281033,
--0.908856982934,
-0.172133869696,
-0.357451615644,
--0.917931518893,
-0.134973429242,
-0.353652820029,
--0.925587303437,
-0.097280931289,
-0.349673761336,
--0.931807212378,
-0.058838305758,
-0.346289117662,
--0.936280887749,
-0.019703168063,
-0.344326356404,
--0.938643247168,
-0.426830127955,
-0.351838436445,
--0.833082082696,
-0.395457937836,
-0.349554484410,
--0.849367224368,
-0.363419769717,
-0.346915901212,
--0.864624443597,
-0.330659805590,
-0.343961776975,
--0.878836952425,
-0.297116904854,
-0.340744050319,
--0.891972553962,
-0.262729302900,
-0.337331696377,
--0.903980442276,
-0.227441689107,
-0.333816262573,
--0.914787943131,
-0.191214115708,
-0.330320463490,
--0.924297329518,
-0.154177069552,
-0.326809465443,
--0.932429624434,
-0.116589039358,
-0.323123022669,
--0.939147756278,
-0.078316797465,
-0.319800327043,
--0.944242675406,
-0.039360950301,
-0.317484776367,
--0.947446110534,
-0.476017922505,
-0.323571996438,
--0.817745743233,
-0.445412670440,
-0.321871272122,
--0.835467795426,
-0.414144177747,
-0.319833413052,
--0.852168520853,
-0.382170007216,
-0.317484900037,
--0.867841819592,
-0.349444440272,
-0.314859376865,
--0.882469351288,
-0.315921109048,
-0.312000692048,
--0.896018649928,
-0.281556954182,
-0.308965978748,
--0.908441360534,
-0.246317369496,
-0.305829298505,
--0.919671785835,
-0.210182208227,
-0.302687380683,
--0.929625617612,
-0.173289016939,
-0.299474033040,
--0.938235695411,
-0.135825386016,
-0.296088347093,
--0.945453941358,
-0.097719924500,
-0.292907546226,
--0.951134052444,
-0.058948182227,
-0.290449262594,
--0.955072948874,
-0.019706936380,
-0.289083198661,
--0.957101113211,
-0.019713521409,
-0.000000001455,
--0.999805669655,
-0.463413973171,
-0.291487301526,
--0.836828920699,
-0.432315565225,
-0.289684965611,
--0.853923809695,
-0.400475914512,
-0.287615988421,
--0.869997750055,
-0.367858376750,
-0.285306744065,
--0.885031229079,
-0.334428762131,
-0.282792654174,
--0.898991500407,
-0.300158396027,
-0.280119562447,
--0.911832203878,
-0.265027431319,
-0.277347343869,
--0.923492778259,
-0.229028855343,
-0.274552898150,
--0.933898543492,
-0.192301595082,
-0.271648406695,
--0.942988462108,
-0.154983702260,
-0.268572828009,
--0.950709570841,
-0.117047598125,
-0.265588961928,
--0.956954734078,
-0.078459574667,
-0.263124479574,
--0.961566224132,
-0.039369529270,
-0.261466546902,
--0.964409293307,
-0.019694489174,
-0.058762968974,
--0.998077672616,
-0.039393488134,
-0.029428229681,
--0.998790334550,
-0.059067633195,
-0.000000000468,
--0.998253983067,
-0.450001609514,
-0.259090041412,
--0.854617400873,
-0.418363528103,
-0.257291187958,
--0.871075888171,
-0.385921458728,
-0.255288587675,
--0.886505704830,
-0.352651223456,
-0.253108167969,
--0.900873670335,
-0.318535376552,
-0.250785732525,
--0.914134415853,
-0.283565587315,
-0.248367631734,
--0.926231114354,
-0.247744068043,
-0.245917027490,
--0.937095348585,
-0.211206612419,
-0.243333598581,
--0.946668118546,
-0.174057504493,
-0.240578736906,
--0.954895730684,
-0.136298543183,
-0.237833923510,
--0.961695238604,
-0.097895329955,
-0.235458698884,
--0.966941417819,
-0.058970358261,
-0.233674349604,
--0.970525010076,
-0.019697836648,
-0.232706642837,
--0.972347475757,
-0.019684876760,
-0.117313960807,
--0.992899763434,
-0.039356003921,
-0.088201583401,
--0.995324864374,
-0.059008990871,
-0.058968815102,
--0.996514233637,
-0.078642310016,
-0.029577373257,
--0.996464031497,
-0.098206241025,
-0.000000001337,
--0.995166083739,
-0.435846607406,
-0.226492242485,
--0.871056254731,
-0.403643084224,
-0.224792106921,
--0.886871337469,
-0.370591711198,
-0.222938599952,
--0.901643035931,
-0.336684621379,
-0.220960273914,
--0.915325091472,
-0.301922740544,
-0.218891392113,
--0.927862714630,
-0.266316752839,
-0.216780186850,
--0.939192066484,
-0.229994868965,
-0.214530394989,
--0.949251847444,
-0.193039494857,
-0.212107742457,
--0.957990636184,
-0.155469696949,
-0.209636939783,
--0.965340109396,
-0.117256071528,
-0.207422449280,
--0.971198713562,
-0.078504377911,
-0.205634078535,
--0.975475109059,
-0.039357865132,
-0.204456782867,
--0.978084036467,
-0.019688062214,
-0.175377504113,
--0.984304379375,
-0.039348477020,
-0.146628827319,
--0.988408662627,
-0.058973206426,
-0.117738291131,
--0.991292013347,
-0.078558790941,
-0.088660264083,
--0.992959150186,
-0.098103562401,
-0.059359645562,
--0.993404310200,
-0.117608045691,
-0.029809996965,
--0.992612568765,
-0.136995857407,
-0.000000001447,
--0.990571620355,
-0.421020659521,
-0.193800093560,
--0.886105596412,
-0.388246690537,
-0.192277873411,
--0.901273391754,
-0.354598281650,
-0.190642071917,
--0.915377331523,
-0.320087274868,
-0.188921433136,
--0.928360290281,
-0.284735039489,
-0.187146663299,
--0.940160669090,
-0.248655478078,
-0.185240346897,
--0.950713661995,
-0.211920779157,
-0.183161627543,
--0.959969479493,
-0.174555338473,
-0.180995593950,
--0.967869324228,
-0.136540572380,
-0.178998186587,
--0.974328651581,
-0.097970474188,
-0.177299793160,
--0.979268384833,
-0.058968057970,
-0.176047042267,
--0.982613966443,
-0.078523819851,
-0.147421226090,
--0.985951820230,
-0.098023122075,
-0.118539386236,
--0.988099125316,
-0.117463759958,
-0.089372604384,
--0.989047421857,
-0.136842462690,
-0.059900256546,
--0.988780106834,
-0.156162691188,
-0.030108868862,
--0.987272338262,
-0.175314550905,
-0.000000002569,
--0.984512472364,
-0.405596193926,
-0.161114865134,
--0.899740922547,
-0.372261676764,
-0.159827039598,
--0.914262851387,
-0.338048545066,
-0.158457960691,
--0.927692975005,
-0.302985166178,
-0.157030326177,
--0.939968864238,
-0.267173602254,
-0.155469471741,
--0.951024452690,
-0.230687540052,
-0.153743472123,
--0.960804976905,
-0.193545245697,
-0.151910418116,
--0.969259234022,
-0.155744445637,
-0.150175405890,
--0.976315018382,
-0.117367518361,
-0.148641428153,
--0.981901518214,
-0.136692806518,
-0.119638526767,
--0.983362445673,
-0.155941267352,
-0.090277330963,
--0.983632210052,
-0.175105804155,
-0.060549563160,
--0.982685965989,
-0.194189680741,
-0.030458457605,
--0.980491025076,
-0.213051565428,
-0.000000001356,
--0.977040956393,
-0.389654136125,
-0.128519442053,
--0.911949783275,
-0.355780519214,
-0.127507005039,
--0.925830538389,
-0.321039547048,
-0.126439231770,
--0.938587625052,
-0.285527293233,
-0.125233955376,
--0.950152946235,
-0.249316667449,
-0.123861370596,
--0.960468406667,
-0.212427088748,
-0.122383781614,
--0.969482821903,
-0.174860662249,
-0.120947567812,
--0.977136343935,
-0.193879097426,
-0.091312154238,
--0.976766597540,
-0.212793452680,
-0.061270259801,
--0.975174293017,
-0.231590729531,
-0.030830887379,
--0.972324632198,
-0.250121114006,
-0.000000002098,
--0.968214556970,
-0.373262303172,
-0.096084791708,
--0.922736671989,
-0.338876291584,
-0.095381423987,
--0.935983569813,
-0.303698143033,
-0.094543066807,
--0.948065950468,
-0.267795653324,
-0.093532696260,
--0.958924982880,
-0.231188560415,
-0.092414860384,
--0.968509857004,
-0.249817712086,
-0.062018390139,
--0.966304729375,
-0.268289711873,
-0.031208165659,
--0.962832633898,
-0.286456629914,
-0.000000002214,
--0.958093210068,
-0.356476088749,
-0.063875683220,
--0.932118391216,
-0.321666100946,
-0.063407158365,
--0.944727713032,
-0.286108061980,
-0.062768865127,
--0.956139240091,
-0.304225514390,
-0.031583053926,
--0.952076334702,
-0.322002384172,
-0.000000000881,
--0.946738857652,
-0.339403642805,
-0.031848062377,
--0.940101520142,
--0.509740891866,
-0.858587033115,
--0.054704019281,
--0.533297886141,
-0.845456878655,
--0.028214020866,
--0.601482758764,
-0.796013182495,
--0.067686809675,
--0.517031948082,
-0.851514691953,
--0.087181959437,
--0.541502443142,
-0.838485074695,
--0.060974450259,
--0.636536089703,
-0.764556520153,
--0.101366335619,
--0.498443288263,
-0.855155644007,
--0.142348561315,
--0.524006836582,
-0.843371405732,
--0.118918069313,
--0.548872753512,
-0.830738198012,
--0.092804885731,
--0.572709175758,
-0.817104273010,
--0.065915150241,
--0.451437165961,
-0.865236842074,
--0.218104773694,
--0.478160087951,
-0.855929451995,
--0.196844363646,
--0.504523177166,
-0.845588746481,
--0.174459266100,
--0.530428048689,
-0.834274934605,
--0.150437424381,
--0.555596354883,
-0.822094202042,
--0.124393783647,
--0.579833815340,
-0.808868435677,
--0.097594059007,
--0.700386923272,
-0.693740005139,
--0.167877821581,
--0.456245351117,
-0.853789221030,
--0.250767114346,
--0.483363013715,
-0.844927722123,
--0.229035677050,
--0.510072452482,
-0.835057219956,
--0.206168699415,
--0.536257536616,
-0.824238695204,
--0.181819767216,
--0.561699814163,
-0.812529734802,
--0.155848480366,
--0.586250028573,
-0.799775054213,
--0.129115323093,
--0.608982280362,
-0.786838789936,
--0.100126424367,
--0.404537812807,
-0.855049731676,
--0.324405786587,
--0.432761095464,
-0.848707024008,
--0.303997075071,
--0.460602751467,
-0.841336350422,
--0.282839620277,
--0.488048481755,
-0.832949915435,
--0.260774074312,
--0.515046814922,
-0.823573709931,
--0.237598658979,
--0.541483068373,
-0.813262540847,
--0.213073053952,
--0.567184163723,
-0.802037815098,
--0.187182978860,
--0.592020299751,
-0.789775412530,
--0.160520286711,
--0.615419060923,
-0.777051321231,
--0.132100808574,
--0.378866273910,
-0.845531467814,
--0.376213879901,
--0.407783503179,
-0.840669571422,
--0.356352755315,
--0.436314161401,
-0.834788295906,
--0.335795255444,
--0.464453915600,
-0.827895394061,
--0.314438828355,
--0.492177671287,
-0.820003566332,
--0.292156278537,
--0.519427435938,
-0.811137061100,
--0.268796962230,
--0.546096639708,
-0.801342482213,
--0.244189857080,
--0.572044412140,
-0.790613876656,
--0.218391594571,
--0.597152269911,
-0.778857082594,
--0.191809310079,
--0.621038774494,
-0.766476261429,
--0.163783336271,
--0.643124058843,
-0.753976111300,
--0.133833734635,
--0.351838442497,
-0.833082078956,
--0.426830130267,
--0.381405273918,
-0.829682353884,
--0.407623856860,
--0.410583074670,
-0.825275966432,
--0.387738466010,
--0.439374092501,
-0.819868898485,
--0.367104067175,
--0.467766799964,
-0.813468177337,
--0.345635277874,
--0.495729662012,
-0.806085115764,
--0.323231942024,
--0.523203249555,
-0.797740348149,
--0.299781081107,
--0.550090552773,
-0.788471944630,
--0.275158820103,
--0.576273198705,
-0.778252558317,
--0.249463736698,
--0.601641470101,
-0.767013889272,
--0.222973619783,
--0.625926236622,
-0.755046458449,
--0.195246490087,
--0.648711338174,
-0.742736837361,
--0.165878238934,
--0.323571996298,
-0.817745743319,
--0.476017922451,
--0.353737616446,
-0.815773311537,
--0.457584530874,
--0.383512766566,
-0.812812516000,
--0.438467526408,
--0.412905547302,
-0.808868616354,
--0.418617451243,
--0.441913583782,
-0.803945533000,
--0.397974828901,
--0.470520244446,
-0.798048178665,
--0.376470190182,
--0.498690283857,
-0.791185291484,
--0.354025190242,
--0.526364968624,
-0.783373245969,
--0.330554499750,
--0.553456274327,
-0.774641918018,
--0.305967402278,
--0.579861548264,
-0.764946680982,
--0.280387517733,
--0.605479281861,
-0.754239827860,
--0.254002207286,
--0.630110240541,
-0.742731326260,
--0.226519892631,
--0.653442397248,
-0.730730853975,
--0.197599221982,
--0.675125976559,
-0.718513555359,
--0.167162156425,
--0.799003016669,
-0.505994649138,
--0.324905516107,
--0.355227301829,
-0.797435434069,
--0.487760486844,
--0.385163513944,
-0.794914821628,
--0.468785125491,
--0.414726779331,
-0.791438960936,
--0.449027916302,
--0.443911483977,
-0.787008109037,
--0.428439996620,
--0.472697284538,
-0.781623984221,
--0.406965876309,
--0.501046845689,
-0.775291633792,
--0.384545109183,
--0.528902593534,
-0.768023083918,
--0.361112986643,
--0.556183853652,
-0.759841040708,
--0.336602308061,
--0.582798919640,
-0.750686869491,
--0.311150515410,
--0.608654780313,
-0.740527365357,
--0.284883449080,
--0.633597340900,
-0.729513047729,
--0.257614290748,
--0.657383693382,
-0.717900629621,
--0.229053193964,
--0.679741136730,
-0.705901380163,
--0.199136205954,
--0.779455798212,
-0.552665008698,
--0.294974654495,
--0.779247787315,
-0.535376362503,
--0.325799073721,
--0.778070620261,
-0.517379894387,
--0.356264164309,
--0.386335970368,
-0.775975091849,
--0.498605229445,
--0.416026083287,
-0.772972327657,
--0.478994862918,
--0.445348939393,
-0.769041947555,
--0.458518053170,
--0.474281772040,
-0.764180865604,
--0.437132022797,
--0.502785535995,
-0.758389972150,
--0.414790736319,
--0.530804099515,
-0.751675777603,
--0.391446718345,
--0.558261487633,
-0.744055856019,
--0.367049035620,
--0.585073072463,
-0.735461508390,
--0.341739476145,
--0.611155203544,
-0.725866878871,
--0.315605119318,
--0.636383795645,
-0.715377871413,
--0.288531048127,
--0.660563635174,
-0.704212118406,
--0.260270966832,
--0.683476702310,
-0.692531867884,
--0.230779568776,
--0.704886406660,
-0.680524332915,
--0.200054457629,
--0.757178336382,
-0.597441831138,
--0.264091320040,
--0.758300940040,
-0.581180686131,
--0.295311182318,
--0.758470088709,
-0.564198671374,
--0.326194702215,
--0.757695269771,
-0.546462423634,
--0.356758598667,
--0.756003153045,
-0.527930440381,
--0.386973749375,
--0.416786057409,
-0.753448209260,
--0.508532376858,
--0.446207860485,
-0.750028876122,
--0.488216376440,
--0.475256867241,
-0.745701770764,
--0.466968713320,
--0.503890763968,
-0.740464432165,
--0.444754452126,
--0.532054174226,
-0.734317471273,
--0.421540279299,
--0.559675204568,
-0.727271290962,
--0.397290995034,
--0.586669904180,
-0.719256982207,
--0.372139512919,
--0.612966060638,
-0.710246570874,
--0.346153747729,
--0.638460328337,
-0.700312680099,
--0.319265656206,
--0.662991166580,
-0.689641762059,
--0.291267837325,
--0.686379326973,
-0.678358205594,
--0.262132722885,
--0.708427054342,
-0.666613279376,
--0.231857379516,
--0.732280310243,
-0.640119516756,
--0.232406005726,
--0.734654367436,
-0.624988892581,
--0.263954247091,
--0.736102349125,
-0.609122008085,
--0.295167259158,
--0.736643903423,
-0.592483236920,
--0.326066517015,
--0.736286048777,
-0.575040785130,
--0.356666440547,
--0.735024618451,
-0.556765963323,
--0.386976061735,
--0.732891345862,
-0.537619859446,
--0.416935440913,
--0.446476634126,
-0.729942906182,
--0.517534509858,
--0.475605014712,
-0.726167588495,
--0.496468028579,
--0.504345036577,
-0.721498236991,
--0.474422151778,
--0.532635680865,
-0.715933202766,
--0.451374435083,
--0.560406939592,
-0.709473131690,
--0.427307778383,
--0.587573355064,
-0.702058188152,
--0.402333012402,
--0.614071177784,
-0.693652731366,
--0.376513581272,
--0.639814347960,
-0.684303739574,
--0.349808507829,
--0.664664669428,
-0.674170257989,
--0.322048661629,
--0.688470879104,
-0.663347279653,
--0.293220454953,
--0.711065840907,
-0.651954164263,
--0.263327054430,
--0.712834204081,
-0.636507382151,
--0.294492359764,
--0.713746738620,
-0.620240751188,
--0.325372100332,
--0.713806638960,
-0.603125964757,
--0.355976337434,
--0.713008481544,
-0.585137025453,
--0.386307606307,
--0.711334601976,
-0.566251681186,
--0.416367767227,
--0.708830045070,
-0.546431413852,
--0.446063534893,
--0.475320368540,
-0.705551241990,
--0.525612016774,
--0.504134074319,
-0.701469401363,
--0.503775261462,
--0.532528907061,
-0.696504415944,
--0.480930932375,
--0.560433162842,
-0.690652200021,
--0.457071338626,
--0.587765434291,
-0.683850854635,
--0.432295966749,
--0.614454438910,
-0.676069940440,
--0.406663470374,
--0.640431668609,
-0.667336496990,
--0.380143759158,
--0.665576466359,
-0.657779645175,
--0.352610132898,
--0.689758528490,
-0.647472758312,
--0.324055858796,
--0.690240188967,
-0.630711224396,
--0.354643247441,
--0.689907310996,
-0.613040501717,
--0.384979539051,
--0.688745900523,
-0.594439277891,
--0.415055453419,
--0.686726880725,
-0.574894833844,
--0.444861912629,
--0.683916954789,
-0.554357033689,
--0.474284596157,
--0.503241112921,
-0.680359054357,
--0.532785078076,
--0.531720548403,
-0.676012829877,
--0.510176354066,
--0.559741694480,
-0.670791975688,
--0.486546360394,
--0.587226813659,
-0.664625657257,
--0.461992862538,
--0.614101661369,
-0.657483244315,
--0.436571795870,
--0.640295865946,
-0.649395550601,
--0.410251901778,
--0.665714723058,
-0.640451726038,
--0.382943199598,
--0.665064220782,
-0.622168319300,
--0.413032885730,
--0.663602297660,
-0.602912621107,
--0.442863818629,
--0.661304518580,
-0.582670499105,
--0.472410227639,
--0.658241473138,
-0.561398955062,
--0.501546983139,
--0.530186663847,
-0.654446960427,
--0.539074463749,
--0.558313987684,
-0.649875510950,
--0.515700796417,
--0.585936979856,
-0.644367810339,
--0.491393915953,
--0.612985588145,
-0.637885440141,
--0.466209002469,
--0.639388890937,
-0.630461315159,
--0.440114049122,
--0.637683355249,
-0.610524214804,
--0.469702162626,
--0.635159254074,
-0.589570333716,
--0.498978500105,
--0.631885373499,
-0.567566573620,
--0.527815364751,
--0.556122903246,
-0.627892878372,
--0.544497795931,
--0.583873834927,
-0.623061616905,
--0.520466681381,
--0.611082217190,
-0.617262952030,
--0.495545125983,
--0.608373477124,
-0.595600248780,
--0.524539851666,
--0.604926632717,
-0.572873638477,
--0.553063796833,
--0.581014692318,
-0.600697877351,
--0.549166629956,
--0.054704019708,
-0.509740892985,
-0.858587032424,
--0.017437222806,
-0.505083862528,
-0.862894104207,
--0.000000001077,
-0.424276393266,
-0.905532739396,
--0.075148223519,
-0.485527218439,
-0.870985685678,
--0.037684282522,
-0.480527992402,
-0.876169357698,
--0.000000001209,
-0.371155580903,
-0.928570694543,
--0.130198387931,
-0.466633721374,
-0.874815037512,
--0.094819417663,
-0.460915747478,
-0.882363843185,
--0.057356574024,
-0.456067868618,
-0.888094771199,
--0.019470995389,
-0.451116799777,
-0.892252494139,
--0.218104773852,
-0.451437166376,
-0.865236841817,
--0.184667138114,
-0.446279697618,
-0.875632616795,
--0.150180215433,
-0.440959797305,
-0.884873075674,
--0.114297541343,
-0.435812606548,
-0.892750493708,
--0.076879586932,
-0.431202572933,
-0.898973787276,
--0.038992437455,
-0.426412778319,
-0.903687851145,
--0.000000000267,
-0.260877081116,
-0.965372025982,
--0.238587560490,
-0.424358865154,
-0.873496153136,
--0.204709273349,
-0.419675662001,
-0.884288670135,
--0.169804627536,
-0.414870076333,
-0.893895524226,
--0.133670277522,
-0.410200536058,
-0.902146206069,
--0.096319658571,
-0.405851335393,
-0.908849391777,
--0.058475559759,
-0.401312727207,
-0.914072592245,
--0.019659396641,
-0.398316866803,
-0.917037175770,
--0.324405786143,
-0.404537811643,
-0.855049732395,
--0.291823145905,
-0.400889335129,
-0.868404855176,
--0.258507914019,
-0.396901517479,
-0.880705878152,
--0.224342096266,
-0.392668324953,
-0.891898094191,
--0.189196217983,
-0.388327579256,
-0.901890504602,
--0.152950133514,
-0.384079219164,
-0.910543469618,
--0.115685444091,
-0.380001187585,
-0.917723256467,
--0.077907514227,
-0.375737253482,
-0.923445686314,
--0.039284332407,
-0.372422371603,
-0.927231534385,
--0.376213878238,
-0.378866269556,
-0.845531470505,
--0.344184867676,
-0.375927559769,
-0.860357627193,
--0.311470757725,
-0.372631799612,
-0.874146159976,
--0.277993144360,
-0.369037876158,
-0.886865749507,
--0.243665596151,
-0.365227416662,
-0.898463138571,
--0.208402729158,
-0.361313281033,
-0.908856982934,
--0.172133869696,
-0.357451615644,
-0.917931518893,
--0.134973429242,
-0.353652820029,
-0.925587303437,
--0.097280931289,
-0.349673761336,
-0.931807212378,
--0.058838305758,
-0.346289117662,
-0.936280887749,
--0.019703168063,
-0.344326356404,
-0.938643247168,
--0.426830127955,
-0.351838436445,
-0.833082082696,
--0.395457937836,
-0.349554484410,
-0.849367224368,
--0.363419769717,
-0.346915901212,
-0.864624443597,
--0.330659805590,
-0.343961776975,
-0.878836952425,
--0.297116904854,
-0.340744050319,
-0.891972553962,
--0.262729302900,
-0.337331696377,
-0.903980442276,
--0.227441689107,
-0.333816262573,
-0.914787943131,
--0.191214115708,
-0.330320463490,
-0.924297329518,
--0.154177069552,
-0.326809465443,
-0.932429624434,
--0.116589039358,
-0.323123022669,
-0.939147756278,
--0.078316797465,
-0.319800327043,
-0.944242675406,
--0.039360950301,
-0.317484776367,
-0.947446110534,
--0.476017922505,
-0.323571996438,
-0.817745743233,
--0.445412670440,
-0.321871272122,
-0.835467795426,
--0.414144177747,
-0.319833413052,
-0.852168520853,
--0.382170007216,
-0.317484900037,
-0.867841819592,
--0.349444440272,
-0.314859376865,
-0.882469351288,
--0.315921109048,
-0.312000692048,
-0.896018649928,
--0.281556954182,
-0.308965978748,
-0.908441360534,
--0.246317369496,
-0.305829298505,
-0.919671785835,
--0.210182208227,
-0.302687380683,
-0.929625617612,
--0.173289016939,
-0.299474033040,
-0.938235695411,
--0.135825386016,
-0.296088347093,
-0.945453941358,
--0.097719924500,
-0.292907546226,
-0.951134052444,
--0.058948182227,
-0.290449262594,
-0.955072948874,
--0.019706936380,
-0.289083198661,
-0.957101113211,
--0.019713521409,
-0.000000001455,
-0.999805669655,
--0.463413973171,
-0.291487301526,
-0.836828920699,
--0.432315565225,
-0.289684965611,
-0.853923809695,
--0.400475914512,
-0.287615988421,
-0.869997750055,
--0.367858376750,
-0.285306744065,
-0.885031229079,
--0.334428762131,
-0.282792654174,
-0.898991500407,
--0.300158396027,
-0.280119562447,
-0.911832203878,
--0.265027431319,
-0.277347343869,
-0.923492778259,
--0.229028855343,
-0.274552898150,
-0.933898543492,
--0.192301595082,
-0.271648406695,
-0.942988462108,
--0.154983702260,
-0.268572828009,
-0.950709570841,
--0.117047598125,
-0.265588961928,
-0.956954734078,
--0.078459574667,
-0.263124479574,
-0.961566224132,
--0.039369529270,
-0.261466546902,
-0.964409293307,
--0.019694489174,
-0.058762968974,
-0.998077672616,
--0.039393488134,
-0.029428229681,
-0.998790334550,
--0.059067633195,
-0.000000000468,
-0.998253983067,
--0.450001609514,
-0.259090041412,
-0.854617400873,
--0.418363528103,
-0.257291187958,
-0.871075888171,
--0.385921458728,
-0.255288587675,
-0.886505704830,
--0.352651223456,
-0.253108167969,
-0.900873670335,
--0.318535376552,
-0.250785732525,
-0.914134415853,
--0.283565587315,
-0.248367631734,
-0.926231114354,
--0.247744068043,
-0.245917027490,
-0.937095348585,
--0.211206612419,
-0.243333598581,
-0.946668118546,
--0.174057504493,
-0.240578736906,
-0.954895730684,
--0.136298543183,
-0.237833923510,
-0.961695238604,
--0.097895329955,
-0.235458698884,
-0.966941417819,
--0.058970358261,
-0.233674349604,
-0.970525010076,
--0.019697836648,
-0.232706642837,
-0.972347475757,
--0.019684876760,
-0.117313960807,
-0.992899763434,
--0.039356003921,
-0.088201583401,
-0.995324864374,
--0.059008990871,
-0.058968815102,
-0.996514233637,
--0.078642310016,
-0.029577373257,
-0.996464031497,
--0.098206241025,
-0.000000001337,
-0.995166083739,
--0.435846607406,
-0.226492242485,
-0.871056254731,
--0.403643084224,
-0.224792106921,
-0.886871337469,
--0.370591711198,
-0.222938599952,
-0.901643035931,
--0.336684621379,
-0.220960273914,
-0.915325091472,
--0.301922740544,
-0.218891392113,
-0.927862714630,
--0.266316752839,
-0.216780186850,
-0.939192066484,
--0.229994868965,
-0.214530394989,
-0.949251847444,
--0.193039494857,
-0.212107742457,
-0.957990636184,
--0.155469696949,
-0.209636939783,
-0.965340109396,
--0.117256071528,
-0.207422449280,
-0.971198713562,
--0.078504377911,
-0.205634078535,
-0.975475109059,
--0.039357865132,
-0.204456782867,
-0.978084036467,
--0.019688062214,
-0.175377504113,
-0.984304379375,
--0.039348477020,
-0.146628827319,
-0.988408662627,
--0.058973206426,
-0.117738291131,
-0.991292013347,
--0.078558790941,
-0.088660264083,
-0.992959150186,
--0.098103562401,
-0.059359645562,
-0.993404310200,
--0.117608045691,
-0.029809996965,
-0.992612568765,
--0.136995857407,
-0.000000001447,
-0.990571620355,
--0.421020659521,
-0.193800093560,
-0.886105596412,
--0.388246690537,
-0.192277873411,
-0.901273391754,
--0.354598281650,
-0.190642071917,
-0.915377331523,
--0.320087274868,
-0.188921433136,
-0.928360290281,
--0.284735039489,
-0.187146663299,
-0.940160669090,
--0.248655478078,
-0.185240346897,
-0.950713661995,
--0.211920779157,
-0.183161627543,
-0.959969479493,
--0.174555338473,
-0.180995593950,
-0.967869324228,
--0.136540572380,
-0.178998186587,
-0.974328651581,
--0.097970474188,
-0.177299793160,
-0.979268384833,
--0.058968057970,
-0.176047042267,
-0.982613966443,
--0.078523819851,
-0.147421226090,
-0.985951820230,
--0.098023122075,
-0.118539386236,
-0.988099125316,
--0.117463759958,
-0.089372604384,
-0.989047421857,
--0.136842462690,
-0.059900256546,
-0.988780106834,
--0.156162691188,
-0.030108868862,
-0.987272338262,
--0.175314550905,
-0.000000002569,
-0.984512472364,
--0.405596193926,
-0.161114865134,
-0.899740922547,
--0.372261676764,
-0.159827039598,
-0.914262851387,
--0.338048545066,
-0.158457960691,
-0.927692975005,
--0.302985166178,
-0.157030326177,
-0.939968864238,
--0.267173602254,
-0.155469471741,
-0.951024452690,
--0.230687540052,
-0.153743472123,
-0.960804976905,
--0.193545245697,
-0.151910418116,
-0.969259234022,
--0.155744445637,
-0.150175405890,
-0.976315018382,
--0.117367518361,
-0.148641428153,
-0.981901518214,
--0.136692806518,
-0.119638526767,
-0.983362445673,
--0.155941267352,
-0.090277330963,
-0.983632210052,
--0.175105804155,
-0.060549563160,
-0.982685965989,
--0.194189680741,
-0.030458457605,
-0.980491025076,
--0.213051565428,
-0.000000001356,
-0.977040956393,
--0.389654136125,
-0.128519442053,
-0.911949783275,
--0.355780519214,
-0.127507005039,
-0.925830538389,
--0.321039547048,
-0.126439231770,
-0.938587625052,
--0.285527293233,
-0.125233955376,
-0.950152946235,
--0.249316667449,
-0.123861370596,
-0.960468406667,
--0.212427088748,
-0.122383781614,
-0.969482821903,
--0.174860662249,
-0.120947567812,
-0.977136343935,
--0.193879097426,
-0.091312154238,
-0.976766597540,
--0.212793452680,
-0.061270259801,
-0.975174293017,
--0.231590729531,
-0.030830887379,
-0.972324632198,
--0.250121114006,
-0.000000002098,
-0.968214556970,
--0.373262303172,
-0.096084791708,
-0.922736671989,
--0.338876291584,
-0.095381423987,
-0.935983569813,
--0.303698143033,
-0.094543066807,
-0.948065950468,
--0.267795653324,
-0.093532696260,
-0.958924982880,
--0.231188560415,
-0.092414860384,
-0.968509857004,
--0.249817712086,
-0.062018390139,
-0.966304729375,
--0.268289711873,
-0.031208165659,
-0.962832633898,
--0.286456629914,
-0.000000002214,
-0.958093210068,
--0.356476088749,
-0.063875683220,
-0.932118391216,
--0.321666100946,
-0.063407158365,
-0.944727713032,
--0.286108061980,
-0.062768865127,
-0.956139240091,
--0.304225514390,
-0.031583053926,
-0.952076334702,
--0.322002384172,
-0.000000000881,
-0.946738857652,
--0.339403642805,
-0.031848062377,
-0.940101520142,
-0.564444911575,
-0.824778089614,
-0.033808943928,
-0.550735108946,
-0.834680082291,
--0.000000001697,
-0.601482759841,
-0.796013181829,
--0.067686807932,
-0.592180171602,
-0.805070535623,
-0.034410420412,
-0.579186725664,
-0.815194907255,
--0.000000000297,
-0.636536090912,
-0.764556519406,
--0.101366333663,
-0.628641676194,
-0.774688614985,
-0.068316855638,
-0.618826254245,
-0.784769782823,
-0.034502971258,
-0.606229327536,
-0.795289885787,
-0.000000000517,
-0.592180171147,
-0.805070536065,
--0.034410417907,
-0.669541939813,
-0.730440678724,
-0.134796163508,
-0.662827226065,
-0.741798884035,
-0.101953342427,
-0.654703392598,
-0.752772268905,
-0.068537426908,
-0.644725590032,
-0.763635169224,
-0.034499882344,
-0.632475941815,
-0.774580004277,
-0.000000001049,
-0.618826252795,
-0.784769784026,
--0.034502969901,
-0.700386923539,
-0.693740004974,
--0.167877821148,
-0.694832911607,
-0.706333999354,
-0.135275667820,
-0.688072287063,
-0.718410433381,
-0.102190885040,
-0.679877080018,
-0.730112188692,
-0.068580959385,
-0.669927814138,
-0.741625920410,
-0.034463285101,
-0.658019472734,
-0.753000912020,
-0.000000000986,
-0.644725588332,
-0.763635170771,
--0.034499879892,
-0.628641677003,
-0.774688614614,
--0.068316852403,
-0.728943598949,
-0.654555929692,
-0.200493801539,
-0.724584241369,
-0.668350401135,
-0.168182693707,
-0.719110665487,
-0.681569673198,
-0.135434970966,
-0.712390578021,
-0.694298874835,
-0.102219062554,
-0.704243032905,
-0.706644016675,
-0.068527252260,
-0.694433201887,
-0.718734159752,
-0.034405460658,
-0.682869607814,
-0.730540278646,
-0.000000001682,
-0.669927813978,
-0.741625920758,
--0.034463280713,
-0.654703393330,
-0.752772268578,
--0.068537423514,
-0.755080152148,
-0.613018504024,
-0.232512962128,
-0.751968370855,
-0.627951624785,
-0.200550058999,
-0.747784919126,
-0.642288781130,
-0.168175017056,
-0.742447059960,
-0.656086182207,
-0.135363527859,
-0.735843267438,
-0.669409946022,
-0.102102937924,
-0.727830165097,
-0.682337091132,
-0.068405736897,
-0.718230509404,
-0.694957900126,
-0.034328594704,
-0.707017841381,
-0.707195709806,
-0.000000001520,
-0.694433201200,
-0.718734160601,
--0.034405456797,
-0.679877080252,
-0.730112188631,
--0.068580957714,
-0.662827226906,
-0.741798883751,
--0.101953339022,
-0.778668570452,
-0.569286552457,
-0.263795524187,
-0.776863211754,
-0.585275907180,
-0.232240527680,
-0.774002844387,
-0.600670196563,
-0.200287073575,
-0.770033898090,
-0.615509899917,
-0.167914736983,
-0.764883704818,
-0.629839831505,
-0.135109972812,
-0.758458964912,
-0.643709476732,
-0.101872999909,
-0.750644938662,
-0.657173653822,
-0.068227302327,
-0.741304668481,
-0.670295121994,
-0.034232118240,
-0.730450268257,
-0.682965889048,
-0.000000002123,
-0.718230509459,
-0.694957900233,
--0.034328591386,
-0.704243034087,
-0.706644015726,
--0.068527249899,
-0.688072288475,
-0.718410432245,
--0.102190883518,
-0.799589918803,
-0.523550487957,
-0.294195255416,
-0.799150286886,
-0.540493142185,
-0.263108308917,
-0.797656944313,
-0.556857337909,
-0.231631829430,
-0.795075554518,
-0.572674562413,
-0.199746609914,
-0.791358024054,
-0.587976991732,
-0.167438152639,
-0.786441353493,
-0.602798195510,
-0.134700902021,
-0.780247238039,
-0.617173524031,
-0.101543531393,
-0.772682338120,
-0.631140739601,
-0.067995376114,
-0.763638482554,
-0.644742169503,
-0.034114554464,
-0.753150565202,
-0.657848178636,
-0.000000001551,
-0.741304667877,
-0.670295122767,
--0.034232116178,
-0.727830165042,
-0.682337091540,
--0.068405733411,
-0.712390579475,
-0.694298873783,
--0.102219059564,
-0.694832912939,
-0.706333998862,
--0.135275663549,
-0.818716538078,
-0.493811022870,
--0.293008368430,
-0.818641275000,
-0.511029847788,
-0.262059072609,
-0.817479079168,
-0.527729108454,
-0.230716152908,
-0.815202693842,
-0.543931234092,
-0.198955725053,
-0.811769860727,
-0.559659129159,
-0.166767360008,
-0.807126046669,
-0.574935642409,
-0.134151227635,
-0.801205241716,
-0.589783543039,
-0.101121377597,
-0.793930024853,
-0.604227123412,
-0.067710405183,
-0.785212708996,
-0.618293423701,
-0.033974164289,
-0.775100514722,
-0.631837947640,
-0.000000001523,
-0.763638482573,
-0.644742169658,
--0.034114551121,
-0.750644939025,
-0.657173653786,
--0.068227298680,
-0.735843268049,
-0.669409945734,
--0.102102935410,
-0.719110666000,
-0.681569672953,
--0.135434969474,
-0.799150287386,
-0.540493144997,
--0.263108301620,
-0.818641275450,
-0.511029847900,
--0.262059070984,
-0.837138253457,
-0.480874089437,
--0.260690726163,
-0.836337579883,
-0.497858802177,
-0.229512669741,
-0.834389611390,
-0.514409447636,
-0.197931545206,
-0.831270398120,
-0.530529369073,
-0.165915984039,
-0.826932995496,
-0.546230423334,
-0.133469642930,
-0.821320912547,
-0.561524282822,
-0.100610329561,
-0.814369686830,
-0.576422606602,
-0.067372039971,
-0.806005555676,
-0.590941601458,
-0.033809286985,
-0.796279684883,
-0.604928643266,
-0.000000001398,
-0.785212708037,
-0.618293425097,
--0.033974161051,
-0.772682338828,
-0.631140739108,
--0.067995372639,
-0.758458965129,
-0.643709477154,
--0.101872995626,
-0.742447060571,
-0.656086182150,
--0.135363524780,
-0.724584243308,
-0.668350400361,
--0.168182688427,
-0.776863213142,
-0.585275908236,
--0.232240520377,
-0.797656943961,
-0.556857338047,
--0.231631830313,
-0.817479079580,
-0.527729109375,
--0.230716149344,
-0.836337579787,
-0.497858803090,
--0.229512668108,
-0.854209394069,
-0.467235645521,
--0.228072713490,
-0.852632664815,
-0.484080192001,
-0.196682247807,
-0.849850944709,
-0.500563730748,
-0.164891853157,
-0.845848578439,
-0.516663497294,
-0.132661271348,
-0.840575385347,
-0.532381892663,
-0.100012708755,
-0.833976914770,
-0.547718955641,
-0.066980976877,
-0.825991957407,
-0.562678485934,
-0.033618562833,
-0.816664773145,
-0.577112335949,
-0.000000002304,
-0.806005555495,
-0.590941601881,
--0.033809283880,
-0.793930025286,
-0.604227123164,
--0.067710402321,
-0.780247238108,
-0.617173524468,
--0.101543528206,
-0.764883704885,
-0.629839831779,
--0.135109971159,
-0.747784919474,
-0.642288781000,
--0.168175016008,
-0.751968372458,
-0.627951625135,
--0.200550051891,
-0.774002844455,
-0.600670196378,
--0.200287073868,
-0.795075555551,
-0.572674562088,
--0.199746606736,
-0.815202694364,
-0.543931234004,
--0.198955723158,
-0.834389611179,
-0.514409449149,
--0.197931542165,
-0.852632664142,
-0.484080193736,
--0.196682246456,
-0.869887203269,
-0.452951763250,
--0.195271487311,
-0.867497293647,
-0.469737828632,
-0.163691227213,
-0.863851705249,
-0.486217937723,
-0.131728312730,
-0.858943318227,
-0.502344446580,
-0.099329920283,
-0.852722955733,
-0.518108387531,
-0.066537655019,
-0.845141979081,
-0.533497199498,
-0.033403193298,
-0.836228833142,
-0.548380651210,
-0.000000002618,
-0.825991956941,
-0.562678486925,
--0.033618557674,
-0.814369686433,
-0.576422607479,
--0.067372037262,
-0.801205241808,
-0.589783543415,
--0.101121374674,
-0.786441353292,
-0.602798196711,
--0.134700897822,
-0.770033898877,
-0.615509900187,
--0.167914732384,
-0.791358023933,
-0.587976992556,
--0.167438150318,
-0.811769860695,
-0.559659130062,
--0.166767357131,
-0.831270398918,
-0.530529368657,
--0.165915981375,
-0.849850944234,
-0.500563732406,
--0.164891850570,
-0.867497293164,
-0.469737830257,
--0.163691225109,
-0.884144595975,
-0.438081062670,
--0.162398632807,
-0.880916562465,
-0.454879008437,
-0.130656410705,
-0.876395751084,
-0.471399032414,
-0.098556784251,
-0.870577452126,
-0.487578925246,
-0.066043103389,
-0.863418329020,
-0.503397069236,
-0.033168958337,
-0.854939036545,
-0.518728487546,
-0.000000002595,
-0.845141978961,
-0.533497199907,
--0.033403189790,
-0.833976914306,
-0.547718956789,
--0.066980973260,
-0.821320911996,
-0.561524284212,
--0.100610326299,
-0.807126046851,
-0.574935642789,
--0.134151224913,
-0.826932995485,
-0.546230423950,
--0.133469640478,
-0.845848578348,
-0.516663498245,
--0.132661268227,
-0.863851704678,
-0.486217939296,
--0.131728310669,
-0.880916561466,
-0.454879010882,
--0.130656408926,
-0.896968520217,
-0.422683924898,
--0.129559921939,
-0.892895249047,
-0.439539554374,
-0.097688558032,
-0.887501067616,
-0.456128376468,
-0.065488618557,
-0.880781241528,
-0.472378623880,
-0.032906538462,
-0.872754106893,
-0.488160085323,
-0.000000002630,
-0.863418328818,
-0.503397069870,
--0.033168953976,
-0.852722954693,
-0.518108389624,
--0.066537652053,
-0.840575385307,
-0.532381893473,
--0.100012704784,
-0.858943318208,
-0.502344447383,
--0.099329916387,
-0.876395750340,
-0.471399034768,
--0.098556779610,
-0.892895248111,
-0.439539556776,
--0.097688555779,
-0.908362587145,
-0.406815605302,
--0.096842519373,
-0.903448967019,
-0.423758170348,
-0.064876629502,
-0.897190279267,
-0.440438444769,
-0.032612561347,
-0.889635122890,
-0.456672035624,
-0.000000001795,
-0.880781241468,
-0.472378624347,
--0.032906533352,
-0.870577451352,
-0.487578927012,
--0.066043100561,
-0.887501067336,
-0.456128377743,
--0.065488613479,
-0.903448965947,
-0.423758172946,
--0.064876627463,
-0.918342003413,
-0.390526640030,
--0.064318801248,
-0.912598991995,
-0.407578539349,
-0.032292631841,
-0.905539935873,
-0.424261033492,
-0.000000002979,
-0.897190279170,
-0.440438445271,
--0.032612557244,
-0.912598991513,
-0.407578540642,
--0.032292629138,
-0.926929016889,
-0.373865220601,
--0.032052994785,
-0.920418335123,
-0.390934890192,
-0.000000000009,
--0.475931949057,
-0.879482108895,
-0.000000000692,
--0.505083864225,
-0.862894103158,
--0.017437225552,
--0.491963201198,
-0.863699991504,
--0.109519556901,
--0.451116798027,
-0.892252495060,
--0.019470993726,
--0.480527992700,
-0.876169357514,
--0.037684283003,
--0.472521914566,
-0.865922855025,
--0.164014174390,
--0.398316865736,
-0.917037176300,
--0.019659393505,
--0.426412776219,
-0.903687852136,
--0.038992437454,
--0.456067868101,
-0.888094771519,
--0.057356573187,
--0.485527217684,
-0.870985686306,
--0.075148221129,
--0.316641002868,
-0.948545452418,
-0.000000000256,
--0.344326355191,
-0.938643247681,
--0.019703164800,
--0.372422370397,
-0.927231535005,
--0.039284329194,
--0.401312724204,
-0.914072593605,
--0.058475559104,
--0.431202571884,
-0.898973787924,
--0.076879585234,
--0.460915748221,
-0.882363843033,
--0.094819415468,
--0.428754902264,
-0.861617826555,
--0.271632020843,
--0.289083197335,
-0.957101113700,
--0.019706932107,
--0.317484776960,
-0.947446110431,
--0.039360948013,
--0.346289116948,
-0.936280888107,
--0.058838304270,
--0.375737250957,
-0.923445687626,
--0.077907510865,
--0.405851334406,
-0.908849392386,
--0.096319656975,
--0.435812607099,
-0.892750493863,
--0.114297538032,
--0.466633719206,
-0.874815038980,
--0.130198385834,
--0.204044010104,
-0.978961716279,
--0.000000000719,
--0.232706641423,
-0.972347476206,
--0.019697831168,
--0.261466546513,
-0.964409293475,
--0.039369527730,
--0.290449262399,
-0.955072949147,
--0.058948178756,
--0.319800326996,
-0.944242675654,
--0.078316794670,
--0.349673758507,
-0.931807213703,
--0.097280928771,
--0.380001185903,
-0.917723257506,
--0.115685441369,
--0.410200534195,
-0.902146207470,
--0.133670273785,
--0.440959795116,
-0.884873077152,
--0.150180213154,
--0.146353307429,
-0.989232383924,
--0.000000002691,
--0.175377500770,
-0.984304380100,
--0.019688055771,
--0.204456782556,
-0.978084036575,
--0.039357864070,
--0.233674348299,
-0.970525010562,
--0.058970355447,
--0.263124478738,
-0.961566224559,
--0.078459572239,
--0.292907544136,
-0.951134053362,
--0.097719921834,
--0.323123020940,
-0.939147757206,
--0.116589036680,
--0.353652818509,
-0.925587304377,
--0.134973426781,
--0.384079218133,
-0.910543470680,
--0.152950129784,
--0.414870075375,
-0.893895524901,
--0.169804626320,
--0.446279695426,
-0.875632618386,
--0.184667135868,
--0.088042912258,
-0.996116682724,
--0.000000003740,
--0.117313956730,
-0.992899764040,
--0.019684870484,
--0.146628827637,
-0.988408662574,
--0.039348477165,
--0.176047039993,
-0.982613967092,
--0.058968053940,
--0.205634077507,
-0.975475109379,
--0.078504376625,
--0.235458696468,
-0.966941418755,
--0.097895326512,
--0.265588960246,
-0.956954734930,
--0.117047594982,
--0.296088345249,
-0.945453942097,
--0.135825384888,
--0.326809463320,
-0.932429625746,
--0.154177066117,
--0.357451614055,
-0.917931520016,
--0.172133867007,
--0.388327576942,
-0.901890505813,
--0.189196216957,
--0.419675659885,
-0.884288671180,
--0.204709273173,
--0.029376741022,
-0.999568410409,
-0.000000000087,
--0.058762963205,
-0.998077673059,
--0.019694483889,
--0.088201583622,
-0.995324864317,
--0.039356004853,
--0.117738290124,
-0.991292013656,
--0.058973203238,
--0.147421224225,
-0.985951820633,
--0.078523818288,
--0.177299790028,
-0.979268385692,
--0.097970471263,
--0.207422447354,
-0.971198714273,
--0.117256069050,
--0.237833922391,
-0.961695239351,
--0.136298539866,
--0.268572826219,
-0.950709571782,
--0.154983699593,
--0.299474031489,
-0.938235696369,
--0.173289014429,
--0.330320463271,
-0.924297330053,
--0.191214113498,
--0.361313279637,
-0.908856984171,
--0.208402726185,
--0.392668322157,
-0.891898095766,
--0.224342094899,
--0.424358862210,
-0.873496155288,
--0.238587557852,
--0.293008369884,
-0.818716538977,
--0.493811020516,
--0.029428228917,
-0.998790334632,
--0.039393486630,
--0.058968812703,
-0.996514233945,
--0.059008988066,
--0.088660263368,
-0.992959150394,
--0.078558789119,
--0.118539384056,
-0.988099125779,
--0.098023120043,
--0.148641426540,
-0.981901518718,
--0.117367516186,
--0.178998184851,
-0.974328652222,
--0.136540570086,
--0.209636938687,
-0.965340110054,
--0.155469694342,
--0.240578733861,
-0.954895731762,
--0.174057502784,
--0.271648405172,
-0.942988463049,
--0.192301592617,
--0.302687379130,
-0.929625618738,
--0.210182205485,
--0.333816260608,
-0.914787944534,
--0.227441686350,
--0.365227414984,
-0.898463139698,
--0.243665594511,
--0.396901516376,
-0.880705878907,
--0.258507913144,
--0.321871270594,
-0.835467799492,
--0.445412663918,
--0.291487300666,
-0.836828921621,
--0.463413972047,
--0.260690726632,
-0.837138253746,
--0.480874088680,
--0.029577371671,
-0.996464031622,
--0.078642309025,
--0.059359642752,
-0.993404310554,
--0.098103560514,
--0.089372603636,
-0.989047422243,
--0.117463757275,
--0.119638525039,
-0.983362446131,
--0.136692804730,
--0.150175402964,
-0.976315019141,
--0.155744443703,
--0.180995591764,
-0.967869324947,
--0.174555336751,
--0.212107740505,
-0.957990637077,
--0.193039492566,
--0.243333597183,
-0.946668119411,
--0.211206610157,
--0.274552897957,
-0.933898544415,
--0.229028851813,
--0.305829296149,
-0.919671787235,
--0.246317367191,
--0.337331694510,
-0.903980443986,
--0.262729299413,
--0.369037874384,
-0.886865750925,
--0.277993142192,
--0.400889331264,
-0.868404857990,
--0.291823142842,
--0.349554481184,
-0.849367228276,
--0.395457932296,
--0.319833413713,
-0.852168520364,
--0.414144178243,
--0.289684964446,
-0.853923811589,
--0.432315562263,
--0.259090041364,
-0.854617401757,
--0.450001607863,
--0.228072714827,
-0.854209394896,
--0.467235643358,
--0.029809994679,
-0.992612568859,
--0.117608045472,
--0.059900253764,
-0.988780107188,
--0.136842461347,
--0.090277328605,
-0.983632210614,
--0.155941265167,
--0.120947565159,
-0.977136344790,
--0.174860659307,
--0.151910415236,
-0.969259234940,
--0.193545243357,
--0.183161624017,
-0.959969480968,
--0.211920775522,
--0.214530392685,
-0.949251848868,
--0.229994865237,
--0.245917026336,
-0.937095349611,
--0.247744065310,
--0.277347342105,
-0.923492779370,
--0.265027429297,
--0.308965977486,
-0.908441361793,
--0.281556951503,
--0.340744049693,
-0.891972554664,
--0.297116903465,
--0.372631798875,
-0.874146160516,
--0.311470757091,
--0.375927556003,
-0.860357630861,
--0.344184862619,
--0.346915901187,
-0.864624443469,
--0.363419770045,
--0.317484897866,
-0.867841821247,
--0.382170005262,
--0.287615987240,
-0.869997751019,
--0.400475913266,
--0.257291187727,
-0.871075889696,
--0.418363525069,
--0.226492243422,
-0.871056255471,
--0.435846605441,
--0.195271488757,
-0.869887204164,
--0.452951760909,
--0.030108866347,
-0.987272338490,
--0.156162690230,
--0.060549560681,
-0.982685966302,
--0.175105803259,
--0.091312151634,
-0.976766598358,
--0.193879094531,
--0.122383778116,
-0.969482822614,
--0.212427087515,
--0.153743470000,
-0.960804977881,
--0.230687537400,
--0.185240344280,
-0.950713663612,
--0.248655473843,
--0.216780185217,
-0.939192068197,
--0.266316748126,
--0.248367631212,
-0.926231115309,
--0.283565584654,
--0.280119561262,
-0.911832205044,
--0.300158393592,
--0.312000690982,
-0.896018651663,
--0.315921105180,
--0.343961774652,
-0.878836954617,
--0.330659802180,
--0.314859376408,
-0.882469352320,
--0.349444438079,
--0.285306743367,
-0.885031230395,
--0.367858374127,
--0.255288585759,
-0.886505706090,
--0.385921457100,
--0.224792107116,
-0.886871338714,
--0.403643081381,
--0.193800093972,
-0.886105597484,
--0.421020657075,
--0.162398635376,
-0.884144597563,
--0.438081058513,
--0.030458454429,
-0.980491025211,
--0.194189680557,
--0.061270255346,
-0.975174293876,
--0.212793450024,
--0.092414857302,
-0.968509857621,
--0.231188559060,
--0.123861367840,
-0.960468407862,
--0.249316664217,
--0.155469469146,
-0.951024454294,
--0.267173598055,
--0.187146661913,
-0.940160670282,
--0.284735036464,
--0.218891391377,
-0.927862715947,
--0.301922737031,
--0.250785732189,
-0.914134417110,
--0.318535373208,
--0.282792653065,
-0.898991501585,
--0.334428759902,
--0.253108167245,
-0.900873671391,
--0.352651221277,
--0.222938599190,
-0.901643037296,
--0.370591708334,
--0.192277873829,
-0.901273392715,
--0.388246688098,
--0.161114866532,
-0.899740923511,
--0.405596191232,
--0.129559923295,
-0.896968521055,
--0.422683922704,
--0.030830884021,
-0.972324632450,
--0.231590728918,
--0.062018386482,
-0.966304730534,
--0.249817708512,
--0.093532693308,
-0.958924984274,
--0.267795649364,
--0.125233952746,
-0.950152947861,
--0.285527288979,
--0.157030324571,
-0.939968865739,
--0.302985162353,
--0.188921433667,
-0.928360291402,
--0.320087271301,
--0.220960272596,
-0.915325093071,
--0.336684617897,
--0.190642070625,
-0.915377333113,
--0.354598278240,
--0.159827039411,
-0.914262853396,
--0.372261671910,
--0.128519443158,
-0.911949784415,
--0.389654133093,
--0.096842521471,
-0.908362588441,
--0.406815601908,
--0.031208162206,
-0.962832634097,
--0.268289711562,
--0.062768862639,
-0.956139241186,
--0.286108058864,
--0.094543065012,
-0.948065951577,
--0.303698140129,
--0.126439229612,
-0.938587626817,
--0.321039542739,
--0.158457960946,
-0.927692976135,
--0.338048541845,
--0.127507003618,
-0.925830540369,
--0.355780514571,
--0.096084793122,
-0.922736673051,
--0.373262300183,
--0.064318803462,
-0.918342004781,
--0.390526636448,
--0.031583051379,
-0.952076335280,
--0.304225512844,
--0.063407155387,
-0.944727714873,
--0.321666096127,
--0.095381422371,
-0.935983571254,
--0.338876288061,
--0.063875683064,
-0.932118392308,
--0.356476085922,
--0.032052995666,
-0.926929017434,
--0.373865219175,
--0.031848062368,
-0.940101520148,
--0.339403642791,
--0.033808942809,
-0.564444912266,
-0.824778089187,
--0.028214021915,
-0.533297883394,
-0.845456880352,
--0.109519557567,
-0.491963202941,
-0.863699990427,
--0.065915150055,
-0.572709177876,
-0.817104271541,
--0.060974450443,
-0.541502442661,
-0.838485074993,
--0.164014175138,
-0.472521916522,
-0.865922853816,
--0.100126422527,
-0.608982282690,
-0.786838788369,
--0.097594060363,
-0.579833816791,
-0.808868434473,
--0.092804885412,
-0.548872754349,
-0.830738197495,
--0.087181958074,
-0.517031950018,
-0.851514690917,
--0.134796163093,
-0.669541940069,
-0.730440678566,
--0.133833732760,
-0.643124061264,
-0.753976109567,
--0.132100806769,
-0.615419063405,
-0.777051319572,
--0.129115324484,
-0.586250030929,
-0.799775052261,
--0.124393782999,
-0.555596356581,
-0.822094200992,
--0.118918067119,
-0.524006837327,
-0.843371405579,
--0.271632021008,
-0.428754902697,
-0.861617826288,
--0.167162153783,
-0.675125979501,
-0.718513553210,
--0.165878236754,
-0.648711339050,
-0.742736837082,
--0.163783335534,
-0.621038775748,
-0.766476260571,
--0.160520285659,
-0.592020303273,
-0.789775410103,
--0.155848479757,
-0.561699815759,
-0.812529733815,
--0.150437421474,
-0.530428050300,
-0.834274934105,
--0.142348561156,
-0.498443291170,
-0.855155642339,
--0.200493802702,
-0.728943598230,
-0.654555930137,
--0.200054454041,
-0.704886410201,
-0.680524330302,
--0.199136204955,
-0.679741137757,
-0.705901379456,
--0.197599219356,
-0.653442399265,
-0.730730852881,
--0.195246487927,
-0.625926238235,
-0.755046457671,
--0.191809309866,
-0.597152273116,
-0.778857080189,
--0.187182977821,
-0.567184166445,
-0.802037813416,
--0.181819765556,
-0.536257540194,
-0.824238693243,
--0.174459265807,
-0.504523180177,
-0.845588744745,
--0.232512966481,
-0.755080149457,
-0.613018505686,
--0.232406002408,
-0.732280315084,
-0.640119512424,
--0.231857378845,
-0.708427055056,
-0.666613278850,
--0.230779567301,
-0.683476704513,
-0.692531866202,
--0.229053192549,
-0.657383695200,
-0.717900628408,
--0.226519891802,
-0.630110243263,
-0.742731324204,
--0.222973618767,
-0.601641472724,
-0.767013887509,
--0.218391593631,
-0.572044414600,
-0.790613875135,
--0.213073051778,
-0.541483071415,
-0.813262539391,
--0.206168699119,
-0.510072453932,
-0.835057219143,
--0.196844363417,
-0.478160091038,
-0.855929450322,
--0.263795530239,
-0.778668566712,
-0.569286554769,
--0.264091317188,
-0.757178341270,
-0.597441826204,
--0.263954247034,
-0.734654367222,
-0.624988892857,
--0.263327052508,
-0.711065844150,
-0.651954161502,
--0.262132722457,
-0.686379328193,
-0.678358204525,
--0.260270965544,
-0.660563638400,
-0.704212115856,
--0.257614289309,
-0.633597343680,
-0.729513045822,
--0.254002207524,
-0.605479283593,
-0.754239826390,
--0.249463735385,
-0.576273202140,
-0.778252556194,
--0.244189856046,
-0.546096642452,
-0.801342480658,
--0.237598659680,
-0.515046817130,
-0.823573708348,
--0.229035678289,
-0.483363015301,
-0.844927720879,
--0.294195255276,
-0.799589918889,
-0.523550487904,
--0.294974653241,
-0.779455802997,
-0.552665002619,
--0.295311182944,
-0.758300939460,
-0.581180686570,
--0.295167257179,
-0.736102351280,
-0.609122006440,
--0.294492359556,
-0.712834205766,
-0.636507380361,
--0.293220454418,
-0.688470882230,
-0.663347276645,
--0.291267836503,
-0.662991168989,
-0.689641760091,
--0.288531046233,
-0.636383798254,
-0.715377869855,
--0.284883448108,
-0.608654782961,
-0.740527363554,
--0.280387516774,
-0.579861550773,
-0.764946679431,
--0.275158818591,
-0.550090554379,
-0.788471944038,
--0.268796960904,
-0.519427438857,
-0.811137059671,
--0.260774075091,
-0.488048484576,
-0.832949913538,
--0.250767114349,
-0.456245355086,
-0.853789218908,
--0.505994646785,
-0.324905517562,
-0.799003017568,
--0.325799072911,
-0.779247788370,
-0.535376361461,
--0.326194701241,
-0.758470091102,
-0.564198668721,
--0.326066515963,
-0.736643904723,
-0.592483235883,
--0.325372099921,
-0.713746740685,
-0.620240749029,
--0.324055857998,
-0.689758530483,
-0.647472756587,
--0.322048660839,
-0.664664671630,
-0.674170256196,
--0.319265654848,
-0.638460330512,
-0.700312678735,
--0.315605119791,
-0.611155206211,
-0.725866876419,
--0.311150514469,
-0.582798922105,
-0.750686867968,
--0.305967401183,
-0.553456277089,
-0.774641916478,
--0.299781080293,
-0.523203252676,
-0.797740346409,
--0.292156278398,
-0.492177673538,
-0.820003565031,
--0.282839620354,
-0.460602752856,
-0.841336349636,
--0.457584527618,
-0.353737623468,
-0.815773310318,
--0.487760486650,
-0.355227303402,
-0.797435433487,
--0.517379893630,
-0.356264164777,
-0.778070620550,
--0.356758598697,
-0.757695270858,
-0.546462422108,
--0.356666440534,
-0.736286050876,
-0.575040782451,
--0.355976335757,
-0.713806640845,
-0.603125963516,
--0.354643247000,
-0.690240190766,
-0.630711222675,
--0.352610133031,
-0.665576468844,
-0.657779642589,
--0.349808507752,
-0.639814350079,
-0.684303737632,
--0.346153747128,
-0.612966063110,
-0.710246569034,
--0.341739475281,
-0.585073074726,
-0.735461506991,
--0.336602305587,
-0.556183856224,
-0.759841039922,
--0.330554499496,
-0.526364971637,
-0.783373244052,
--0.323231940665,
-0.495729665716,
-0.806085114031,
--0.314438827927,
-0.464453918379,
-0.827895392664,
--0.303997075396,
-0.432761100466,
-0.848707021341,
--0.407623855198,
-0.381405280847,
-0.829682351515,
--0.438467526327,
-0.383512765718,
-0.812812516444,
--0.468785124263,
-0.385163517317,
-0.794914820719,
--0.498605228407,
-0.386335971924,
-0.775975091741,
--0.527930438218,
-0.386973750712,
-0.756003153871,
--0.386976062730,
-0.735024619344,
-0.556765961453,
--0.386307606721,
-0.713008483361,
-0.585137022965,
--0.384979538636,
-0.689907313273,
-0.613040499416,
--0.382943198809,
-0.665714726040,
-0.640451723410,
--0.380143758990,
-0.640431671412,
-0.667336494396,
--0.376513580550,
-0.614071181884,
-0.693652728129,
--0.372139511495,
-0.586669907908,
-0.719256979903,
--0.367049034302,
-0.558261490186,
-0.744055854754,
--0.361112986232,
-0.528902595989,
-0.768023082420,
--0.354025189094,
-0.498690286605,
-0.791185290265,
--0.345635277280,
-0.467766801419,
-0.813468176753,
--0.335795255467,
-0.436314162382,
-0.834788295384,
--0.356352754240,
-0.407783509839,
-0.840669568647,
--0.387738466249,
-0.410583074410,
-0.825275966449,
--0.418617451258,
-0.412905550289,
-0.808868614821,
--0.449027916183,
-0.414726781098,
-0.791438960078,
--0.478994861051,
-0.416026086109,
-0.772972327295,
--0.508532375029,
-0.416786058701,
-0.753448209780,
--0.537619857105,
-0.416935442360,
-0.732891346756,
--0.416367767780,
-0.711334603417,
-0.566251678969,
--0.415055454031,
-0.688745901990,
-0.594439275764,
--0.413032884943,
-0.665064223696,
-0.622168316708,
--0.410251902749,
-0.640295868218,
-0.649395547747,
--0.406663469592,
-0.614454441682,
-0.676069938392,
--0.402333010784,
-0.587573359299,
-0.702058185534,
--0.397290992567,
-0.559675208815,
-0.727271289041,
--0.391446716748,
-0.530804101780,
-0.751675776835,
--0.384545108166,
-0.501046848216,
-0.775291632664,
--0.376470188122,
-0.470520248113,
-0.798048177475,
--0.367104066256,
-0.439374096697,
-0.819868896647,
--0.397974827673,
-0.441913585854,
-0.803945532468,
--0.428439995253,
-0.443911486568,
-0.787008108319,
--0.458518053200,
-0.445348941818,
-0.769041946132,
--0.488216374428,
-0.446207862853,
-0.750028876023,
--0.517534508004,
-0.446476636089,
-0.729942906296,
--0.546431409694,
-0.446063537463,
-0.708830046658,
--0.444861914111,
-0.686726881908,
-0.574894831285,
--0.442863818973,
-0.663602301060,
-0.602912617112,
--0.440114049758,
-0.639388893066,
-0.630461312556,
--0.436571795002,
-0.614101664803,
-0.657483241684,
--0.432295965145,
-0.587765438490,
-0.683850852040,
--0.427307776997,
-0.560406942497,
-0.709473130230,
--0.421540277233,
-0.532054177275,
-0.734317470250,
--0.414790734170,
-0.502785538788,
-0.758389971474,
--0.406965875424,
-0.472697286949,
-0.781623983224,
--0.437132021722,
-0.474281774208,
-0.764180864874,
--0.466968711806,
-0.475256870014,
-0.745701769945,
--0.496468026693,
-0.475605016580,
-0.726167588560,
--0.525612014194,
-0.475320370235,
-0.705551242770,
--0.554357031495,
-0.474284597513,
-0.683916955627,
--0.472410228900,
-0.661304520129,
-0.582670496325,
--0.469702161921,
-0.637683359104,
-0.610524211320,
--0.466209001172,
-0.612985592165,
-0.637885437226,
--0.461992860913,
-0.587226817914,
-0.664625654627,
--0.457071336798,
-0.560433166465,
-0.690652198290,
--0.451374432279,
-0.532635683392,
-0.715933202654,
--0.444754450462,
-0.503890767410,
-0.740464430822,
--0.474422150157,
-0.504345039968,
-0.721498235687,
--0.503775258249,
-0.504134078430,
-0.701469400717,
--0.532785075422,
-0.503241115018,
-0.680359054884,
--0.561398951668,
-0.501546985237,
-0.658241474435,
--0.498978501641,
-0.635159255457,
-0.589570330925,
--0.495545125044,
-0.611082220403,
-0.617262949603,
--0.491393914844,
-0.585936982761,
-0.644367808544,
--0.486546358533,
-0.559741698729,
-0.670791973493,
--0.480930929991,
-0.532528909506,
-0.696504415720,
--0.510176351632,
-0.531720552765,
-0.676012828283,
--0.539074460952,
-0.530186665764,
-0.654446961178,
--0.567566570038,
-0.527815366965,
-0.631885374868,
--0.524539851867,
-0.608373479152,
-0.595600246531,
--0.520466679540,
-0.583873839746,
-0.623061613926,
--0.515700794820,
-0.558313991109,
-0.649875509274,
--0.544497794059,
-0.556122905592,
-0.627892877918,
--0.572873637051,
-0.553063797714,
-0.604926633262,
--0.549166629950,
-0.581014692332,
-0.600697877342,
-0.824778089187,
--0.033808942809,
-0.564444912266,
-0.845456880352,
--0.028214021915,
-0.533297883394,
-0.863699990427,
--0.109519557567,
-0.491963202941,
-0.817104271541,
--0.065915150055,
-0.572709177876,
-0.838485074993,
--0.060974450443,
-0.541502442661,
-0.865922853816,
--0.164014175138,
-0.472521916522,
-0.786838788369,
--0.100126422527,
-0.608982282690,
-0.808868434473,
--0.097594060363,
-0.579833816791,
-0.830738197495,
--0.092804885412,
-0.548872754349,
-0.851514690917,
--0.087181958074,
-0.517031950018,
-0.730440678566,
--0.134796163093,
-0.669541940069,
-0.753976109567,
--0.133833732760,
-0.643124061264,
-0.777051319572,
--0.132100806769,
-0.615419063405,
-0.799775052261,
--0.129115324484,
-0.586250030929,
-0.822094200992,
--0.124393782999,
-0.555596356581,
-0.843371405579,
--0.118918067119,
-0.524006837327,
-0.861617826288,
--0.271632021008,
-0.428754902697,
-0.718513553210,
--0.167162153783,
-0.675125979501,
-0.742736837082,
--0.165878236754,
-0.648711339050,
-0.766476260571,
--0.163783335534,
-0.621038775748,
-0.789775410103,
--0.160520285659,
-0.592020303273,
-0.812529733815,
--0.155848479757,
-0.561699815759,
-0.834274934105,
--0.150437421474,
-0.530428050300,
-0.855155642339,
--0.142348561156,
-0.498443291170,
-0.654555930137,
--0.200493802702,
-0.728943598230,
-0.680524330302,
--0.200054454041,
-0.704886410201,
-0.705901379456,
--0.199136204955,
-0.679741137757,
-0.730730852881,
--0.197599219356,
-0.653442399265,
-0.755046457671,
--0.195246487927,
-0.625926238235,
-0.778857080189,
--0.191809309866,
-0.597152273116,
-0.802037813416,
--0.187182977821,
-0.567184166445,
-0.824238693243,
--0.181819765556,
-0.536257540194,
-0.845588744745,
--0.174459265807,
-0.504523180177,
-0.613018505686,
--0.232512966481,
-0.755080149457,
-0.640119512424,
--0.232406002408,
-0.732280315084,
-0.666613278850,
--0.231857378845,
-0.708427055056,
-0.692531866202,
--0.230779567301,
-0.683476704513,
-0.717900628408,
--0.229053192549,
-0.657383695200,
-0.742731324204,
--0.226519891802,
-0.630110243263,
-0.767013887509,
--0.222973618767,
-0.601641472724,
-0.790613875135,
--0.218391593631,
-0.572044414600,
-0.813262539391,
--0.213073051778,
-0.541483071415,
-0.835057219143,
--0.206168699119,
-0.510072453932,
-0.855929450322,
--0.196844363417,
-0.478160091038,
-0.569286554769,
--0.263795530239,
-0.778668566712,
-0.597441826204,
--0.264091317188,
-0.757178341270,
-0.624988892857,
--0.263954247034,
-0.734654367222,
-0.651954161502,
--0.263327052508,
-0.711065844150,
-0.678358204525,
--0.262132722457,
-0.686379328193,
-0.704212115856,
--0.260270965544,
-0.660563638400,
-0.729513045822,
--0.257614289309,
-0.633597343680,
-0.754239826390,
--0.254002207524,
-0.605479283593,
-0.778252556194,
--0.249463735385,
-0.576273202140,
-0.801342480658,
--0.244189856046,
-0.546096642452,
-0.823573708348,
--0.237598659680,
-0.515046817130,
-0.844927720879,
--0.229035678289,
-0.483363015301,
-0.523550487904,
--0.294195255276,
-0.799589918889,
-0.552665002619,
--0.294974653241,
-0.779455802997,
-0.581180686570,
--0.295311182944,
-0.758300939460,
-0.609122006440,
--0.295167257179,
-0.736102351280,
-0.636507380361,
--0.294492359556,
-0.712834205766,
-0.663347276645,
--0.293220454418,
-0.688470882230,
-0.689641760091,
--0.291267836503,
-0.662991168989,
-0.715377869855,
--0.288531046233,
-0.636383798254,
-0.740527363554,
--0.284883448108,
-0.608654782961,
-0.764946679431,
--0.280387516774,
-0.579861550773,
-0.788471944038,
--0.275158818591,
-0.550090554379,
-0.811137059671,
--0.268796960904,
-0.519427438857,
-0.832949913538,
--0.260774075091,
-0.488048484576,
-0.853789218908,
--0.250767114349,
-0.456245355086,
-0.799003017568,
--0.505994646785,
-0.324905517562,
-0.535376361461,
--0.325799072911,
-0.779247788370,
-0.564198668721,
--0.326194701241,
-0.758470091102,
-0.592483235883,
--0.326066515963,
-0.736643904723,
-0.620240749029,
--0.325372099921,
-0.713746740685,
-0.647472756587,
--0.324055857998,
-0.689758530483,
-0.674170256196,
--0.322048660839,
-0.664664671630,
-0.700312678735,
--0.319265654848,
-0.638460330512,
-0.725866876419,
--0.315605119791,
-0.611155206211,
-0.750686867968,
--0.311150514469,
-0.582798922105,
-0.774641916478,
--0.305967401183,
-0.553456277089,
-0.797740346409,
--0.299781080293,
-0.523203252676,
-0.820003565031,
--0.292156278398,
-0.492177673538,
-0.841336349636,
--0.282839620354,
-0.460602752856,
-0.815773310318,
--0.457584527618,
-0.353737623468,
-0.797435433487,
--0.487760486650,
-0.355227303402,
-0.778070620550,
--0.517379893630,
-0.356264164777,
-0.546462422108,
--0.356758598697,
-0.757695270858,
-0.575040782451,
--0.356666440534,
-0.736286050876,
-0.603125963516,
--0.355976335757,
-0.713806640845,
-0.630711222675,
--0.354643247000,
-0.690240190766,
-0.657779642589,
--0.352610133031,
-0.665576468844,
-0.684303737632,
--0.349808507752,
-0.639814350079,
-0.710246569034,
--0.346153747128,
-0.612966063110,
-0.735461506991,
--0.341739475281,
-0.585073074726,
-0.759841039922,
--0.336602305587,
-0.556183856224,
-0.783373244052,
--0.330554499496,
-0.526364971637,
-0.806085114031,
--0.323231940665,
-0.495729665716,
-0.827895392664,
--0.314438827927,
-0.464453918379,
-0.848707021341,
--0.303997075396,
-0.432761100466,
-0.829682351515,
--0.407623855198,
-0.381405280847,
-0.812812516444,
--0.438467526327,
-0.383512765718,
-0.794914820719,
--0.468785124263,
-0.385163517317,
-0.775975091741,
--0.498605228407,
-0.386335971924,
-0.756003153871,
--0.527930438218,
-0.386973750712,
-0.556765961453,
--0.386976062730,
-0.735024619344,
-0.585137022965,
--0.386307606721,
-0.713008483361,
-0.613040499416,
--0.384979538636,
-0.689907313273,
-0.640451723410,
--0.382943198809,
-0.665714726040,
-0.667336494396,
--0.380143758990,
-0.640431671412,
-0.693652728129,
--0.376513580550,
-0.614071181884,
-0.719256979903,
--0.372139511495,
-0.586669907908,
-0.744055854754,
--0.367049034302,
-0.558261490186,
-0.768023082420,
--0.361112986232,
-0.528902595989,
-0.791185290265,
--0.354025189094,
-0.498690286605,
-0.813468176753,
--0.345635277280,
-0.467766801419,
-0.834788295384,
--0.335795255467,
-0.436314162382,
-0.840669568647,
--0.356352754240,
-0.407783509839,
-0.825275966449,
--0.387738466249,
-0.410583074410,
-0.808868614821,
--0.418617451258,
-0.412905550289,
-0.791438960078,
--0.449027916183,
-0.414726781098,
-0.772972327295,
--0.478994861051,
-0.416026086109,
-0.753448209780,
--0.508532375029,
-0.416786058701,
-0.732891346756,
--0.537619857105,
-0.416935442360,
-0.566251678969,
--0.416367767780,
-0.711334603417,
-0.594439275764,
--0.415055454031,
-0.688745901990,
-0.622168316708,
--0.413032884943,
-0.665064223696,
-0.649395547747,
--0.410251902749,
-0.640295868218,
-0.676069938392,
--0.406663469592,
-0.614454441682,
-0.702058185534,
--0.402333010784,
-0.587573359299,
-0.727271289041,
--0.397290992567,
-0.559675208815,
-0.751675776835,
--0.391446716748,
-0.530804101780,
-0.775291632664,
--0.384545108166,
-0.501046848216,
-0.798048177475,
--0.376470188122,
-0.470520248113,
-0.819868896647,
--0.367104066256,
-0.439374096697,
-0.803945532468,
--0.397974827673,
-0.441913585854,
-0.787008108319,
--0.428439995253,
-0.443911486568,
-0.769041946132,
--0.458518053200,
-0.445348941818,
-0.750028876023,
--0.488216374428,
-0.446207862853,
-0.729942906296,
--0.517534508004,
-0.446476636089,
-0.708830046658,
--0.546431409694,
-0.446063537463,
-0.574894831285,
--0.444861914111,
-0.686726881908,
-0.602912617112,
--0.442863818973,
-0.663602301060,
-0.630461312556,
--0.440114049758,
-0.639388893066,
-0.657483241684,
--0.436571795002,
-0.614101664803,
-0.683850852040,
--0.432295965145,
-0.587765438490,
-0.709473130230,
--0.427307776997,
-0.560406942497,
-0.734317470250,
--0.421540277233,
-0.532054177275,
-0.758389971474,
--0.414790734170,
-0.502785538788,
-0.781623983224,
--0.406965875424,
-0.472697286949,
-0.764180864874,
--0.437132021722,
-0.474281774208,
-0.745701769945,
--0.466968711806,
-0.475256870014,
-0.726167588560,
--0.496468026693,
-0.475605016580,
-0.705551242770,
--0.525612014194,
-0.475320370235,
-0.683916955627,
--0.554357031495,
-0.474284597513,
-0.582670496325,
--0.472410228900,
-0.661304520129,
-0.610524211320,
--0.469702161921,
-0.637683359104,
-0.637885437226,
--0.466209001172,
-0.612985592165,
-0.664625654627,
--0.461992860913,
-0.587226817914,
-0.690652198290,
--0.457071336798,
-0.560433166465,
-0.715933202654,
--0.451374432279,
-0.532635683392,
-0.740464430822,
--0.444754450462,
-0.503890767410,
-0.721498235687,
--0.474422150157,
-0.504345039968,
-0.701469400717,
--0.503775258249,
-0.504134078430,
-0.680359054884,
--0.532785075422,
-0.503241115018,
-0.658241474435,
--0.561398951668,
-0.501546985237,
-0.589570330925,
--0.498978501641,
-0.635159255457,
-0.617262949603,
--0.495545125044,
-0.611082220403,
-0.644367808544,
--0.491393914844,
-0.585936982761,
-0.670791973493,
--0.486546358533,
-0.559741698729,
-0.696504415720,
--0.480930929991,
-0.532528909506,
-0.676012828283,
--0.510176351632,
-0.531720552765,
-0.654446961178,
--0.539074460952,
-0.530186665764,
-0.631885374868,
--0.567566570038,
-0.527815366965,
-0.595600246531,
--0.524539851867,
-0.608373479152,
-0.623061613926,
--0.520466679540,
-0.583873839746,
-0.649875509274,
--0.515700794820,
-0.558313991109,
-0.627892877918,
--0.544497794059,
-0.556122905592,
-0.604926633262,
--0.572873637051,
-0.553063797714,
-0.600697877342,
--0.549166629950,
-0.581014692332,
--0.879482108895,
-0.000000000692,
-0.475931949057,
--0.862894103158,
--0.017437225552,
-0.505083864225,
--0.863699991504,
--0.109519556901,
-0.491963201198,
--0.892252495060,
--0.019470993726,
-0.451116798027,
--0.876169357514,
--0.037684283003,
-0.480527992700,
--0.865922855025,
--0.164014174390,
-0.472521914566,
--0.917037176300,
--0.019659393505,
-0.398316865736,
--0.903687852136,
--0.038992437454,
-0.426412776219,
--0.888094771519,
--0.057356573187,
-0.456067868101,
--0.870985686306,
--0.075148221129,
-0.485527217684,
--0.948545452418,
-0.000000000256,
-0.316641002868,
--0.938643247681,
--0.019703164800,
-0.344326355191,
--0.927231535005,
--0.039284329194,
-0.372422370397,
--0.914072593605,
--0.058475559104,
-0.401312724204,
--0.898973787924,
--0.076879585234,
-0.431202571884,
--0.882363843033,
--0.094819415468,
-0.460915748221,
--0.861617826555,
--0.271632020843,
-0.428754902264,
--0.957101113700,
--0.019706932107,
-0.289083197335,
--0.947446110431,
--0.039360948013,
-0.317484776960,
--0.936280888107,
--0.058838304270,
-0.346289116948,
--0.923445687626,
--0.077907510865,
-0.375737250957,
--0.908849392386,
--0.096319656975,
-0.405851334406,
--0.892750493863,
--0.114297538032,
-0.435812607099,
--0.874815038980,
--0.130198385834,
-0.466633719206,
--0.978961716279,
--0.000000000719,
-0.204044010104,
--0.972347476206,
--0.019697831168,
-0.232706641423,
--0.964409293475,
--0.039369527730,
-0.261466546513,
--0.955072949147,
--0.058948178756,
-0.290449262399,
--0.944242675654,
--0.078316794670,
-0.319800326996,
--0.931807213703,
--0.097280928771,
-0.349673758507,
--0.917723257506,
--0.115685441369,
-0.380001185903,
--0.902146207470,
--0.133670273785,
-0.410200534195,
--0.884873077152,
--0.150180213154,
-0.440959795116,
--0.989232383924,
--0.000000002691,
-0.146353307429,
--0.984304380100,
--0.019688055771,
-0.175377500770,
--0.978084036575,
--0.039357864070,
-0.204456782556,
--0.970525010562,
--0.058970355447,
-0.233674348299,
--0.961566224559,
--0.078459572239,
-0.263124478738,
--0.951134053362,
--0.097719921834,
-0.292907544136,
--0.939147757206,
--0.116589036680,
-0.323123020940,
--0.925587304377,
--0.134973426781,
-0.353652818509,
--0.910543470680,
--0.152950129784,
-0.384079218133,
--0.893895524901,
--0.169804626320,
-0.414870075375,
--0.875632618386,
--0.184667135868,
-0.446279695426,
--0.996116682724,
--0.000000003740,
-0.088042912258,
--0.992899764040,
--0.019684870484,
-0.117313956730,
--0.988408662574,
--0.039348477165,
-0.146628827637,
--0.982613967092,
--0.058968053940,
-0.176047039993,
--0.975475109379,
--0.078504376625,
-0.205634077507,
--0.966941418755,
--0.097895326512,
-0.235458696468,
--0.956954734930,
--0.117047594982,
-0.265588960246,
--0.945453942097,
--0.135825384888,
-0.296088345249,
--0.932429625746,
--0.154177066117,
-0.326809463320,
--0.917931520016,
--0.172133867007,
-0.357451614055,
--0.901890505813,
--0.189196216957,
-0.388327576942,
--0.884288671180,
--0.204709273173,
-0.419675659885,
--0.999568410409,
-0.000000000087,
-0.029376741022,
--0.998077673059,
--0.019694483889,
-0.058762963205,
--0.995324864317,
--0.039356004853,
-0.088201583622,
--0.991292013656,
--0.058973203238,
-0.117738290124,
--0.985951820633,
--0.078523818288,
-0.147421224225,
--0.979268385692,
--0.097970471263,
-0.177299790028,
--0.971198714273,
--0.117256069050,
-0.207422447354,
--0.961695239351,
--0.136298539866,
-0.237833922391,
--0.950709571782,
--0.154983699593,
-0.268572826219,
--0.938235696369,
--0.173289014429,
-0.299474031489,
--0.924297330053,
--0.191214113498,
-0.330320463271,
--0.908856984171,
--0.208402726185,
-0.361313279637,
--0.891898095766,
--0.224342094899,
-0.392668322157,
--0.873496155288,
--0.238587557852,
-0.424358862210,
--0.818716538977,
--0.493811020516,
-0.293008369884,
--0.998790334632,
--0.039393486630,
-0.029428228917,
--0.996514233945,
--0.059008988066,
-0.058968812703,
--0.992959150394,
--0.078558789119,
-0.088660263368,
--0.988099125779,
--0.098023120043,
-0.118539384056,
--0.981901518718,
--0.117367516186,
-0.148641426540,
--0.974328652222,
--0.136540570086,
-0.178998184851,
--0.965340110054,
--0.155469694342,
-0.209636938687,
--0.954895731762,
--0.174057502784,
-0.240578733861,
--0.942988463049,
--0.192301592617,
-0.271648405172,
--0.929625618738,
--0.210182205485,
-0.302687379130,
--0.914787944534,
--0.227441686350,
-0.333816260608,
--0.898463139698,
--0.243665594511,
-0.365227414984,
--0.880705878907,
--0.258507913144,
-0.396901516376,
--0.835467799492,
--0.445412663918,
-0.321871270594,
--0.836828921621,
--0.463413972047,
-0.291487300666,
--0.837138253746,
--0.480874088680,
-0.260690726632,
--0.996464031622,
--0.078642309025,
-0.029577371671,
--0.993404310554,
--0.098103560514,
-0.059359642752,
--0.989047422243,
--0.117463757275,
-0.089372603636,
--0.983362446131,
--0.136692804730,
-0.119638525039,
--0.976315019141,
--0.155744443703,
-0.150175402964,
--0.967869324947,
--0.174555336751,
-0.180995591764,
--0.957990637077,
--0.193039492566,
-0.212107740505,
--0.946668119411,
--0.211206610157,
-0.243333597183,
--0.933898544415,
--0.229028851813,
-0.274552897957,
--0.919671787235,
--0.246317367191,
-0.305829296149,
--0.903980443986,
--0.262729299413,
-0.337331694510,
--0.886865750925,
--0.277993142192,
-0.369037874384,
--0.868404857990,
--0.291823142842,
-0.400889331264,
--0.849367228276,
--0.395457932296,
-0.349554481184,
--0.852168520364,
--0.414144178243,
-0.319833413713,
--0.853923811589,
--0.432315562263,
-0.289684964446,
--0.854617401757,
--0.450001607863,
-0.259090041364,
--0.854209394896,
--0.467235643358,
-0.228072714827,
--0.992612568859,
--0.117608045472,
-0.029809994679,
--0.988780107188,
--0.136842461347,
-0.059900253764,
--0.983632210614,
--0.155941265167,
-0.090277328605,
--0.977136344790,
--0.174860659307,
-0.120947565159,
--0.969259234940,
--0.193545243357,
-0.151910415236,
--0.959969480968,
--0.211920775522,
-0.183161624017,
--0.949251848868,
--0.229994865237,
-0.214530392685,
--0.937095349611,
--0.247744065310,
-0.245917026336,
--0.923492779370,
--0.265027429297,
-0.277347342105,
--0.908441361793,
--0.281556951503,
-0.308965977486,
--0.891972554664,
--0.297116903465,
-0.340744049693,
--0.874146160516,
--0.311470757091,
-0.372631798875,
--0.860357630861,
--0.344184862619,
-0.375927556003,
--0.864624443469,
--0.363419770045,
-0.346915901187,
--0.867841821247,
--0.382170005262,
-0.317484897866,
--0.869997751019,
--0.400475913266,
-0.287615987240,
--0.871075889696,
--0.418363525069,
-0.257291187727,
--0.871056255471,
--0.435846605441,
-0.226492243422,
--0.869887204164,
--0.452951760909,
-0.195271488757,
--0.987272338490,
--0.156162690230,
-0.030108866347,
--0.982685966302,
--0.175105803259,
-0.060549560681,
--0.976766598358,
--0.193879094531,
-0.091312151634,
--0.969482822614,
--0.212427087515,
-0.122383778116,
--0.960804977881,
--0.230687537400,
-0.153743470000,
--0.950713663612,
--0.248655473843,
-0.185240344280,
--0.939192068197,
--0.266316748126,
-0.216780185217,
--0.926231115309,
--0.283565584654,
-0.248367631212,
--0.911832205044,
--0.300158393592,
-0.280119561262,
--0.896018651663,
--0.315921105180,
-0.312000690982,
--0.878836954617,
--0.330659802180,
-0.343961774652,
--0.882469352320,
--0.349444438079,
-0.314859376408,
--0.885031230395,
--0.367858374127,
-0.285306743367,
--0.886505706090,
--0.385921457100,
-0.255288585759,
--0.886871338714,
--0.403643081381,
-0.224792107116,
--0.886105597484,
--0.421020657075,
-0.193800093972,
--0.884144597563,
--0.438081058513,
-0.162398635376,
--0.980491025211,
--0.194189680557,
-0.030458454429,
--0.975174293876,
--0.212793450024,
-0.061270255346,
--0.968509857621,
--0.231188559060,
-0.092414857302,
--0.960468407862,
--0.249316664217,
-0.123861367840,
--0.951024454294,
--0.267173598055,
-0.155469469146,
--0.940160670282,
--0.284735036464,
-0.187146661913,
--0.927862715947,
--0.301922737031,
-0.218891391377,
--0.914134417110,
--0.318535373208,
-0.250785732189,
--0.898991501585,
--0.334428759902,
-0.282792653065,
--0.900873671391,
--0.352651221277,
-0.253108167245,
--0.901643037296,
--0.370591708334,
-0.222938599190,
--0.901273392715,
--0.388246688098,
-0.192277873829,
--0.899740923511,
--0.405596191232,
-0.161114866532,
--0.896968521055,
--0.422683922704,
-0.129559923295,
--0.972324632450,
--0.231590728918,
-0.030830884021,
--0.966304730534,
--0.249817708512,
-0.062018386482,
--0.958924984274,
--0.267795649364,
-0.093532693308,
--0.950152947861,
--0.285527288979,
-0.125233952746,
--0.939968865739,
--0.302985162353,
-0.157030324571,
--0.928360291402,
--0.320087271301,
-0.188921433667,
--0.915325093071,
--0.336684617897,
-0.220960272596,
--0.915377333113,
--0.354598278240,
-0.190642070625,
--0.914262853396,
--0.372261671910,
-0.159827039411,
--0.911949784415,
--0.389654133093,
-0.128519443158,
--0.908362588441,
--0.406815601908,
-0.096842521471,
--0.962832634097,
--0.268289711562,
-0.031208162206,
--0.956139241186,
--0.286108058864,
-0.062768862639,
--0.948065951577,
--0.303698140129,
-0.094543065012,
--0.938587626817,
--0.321039542739,
-0.126439229612,
--0.927692976135,
--0.338048541845,
-0.158457960946,
--0.925830540369,
--0.355780514571,
-0.127507003618,
--0.922736673051,
--0.373262300183,
-0.096084793122,
--0.918342004781,
--0.390526636448,
-0.064318803462,
--0.952076335280,
--0.304225512844,
-0.031583051379,
--0.944727714873,
--0.321666096127,
-0.063407155387,
--0.935983571254,
--0.338876288061,
-0.095381422371,
--0.932118392308,
--0.356476085922,
-0.063875683064,
--0.926929017434,
--0.373865219175,
-0.032052995666,
--0.940101520148,
--0.339403642791,
-0.031848062368,
-0.564444912266,
-0.824778089187,
--0.033808942809,
-0.533297883394,
-0.845456880352,
--0.028214021915,
-0.491963202941,
-0.863699990427,
--0.109519557567,
-0.572709177876,
-0.817104271541,
--0.065915150055,
-0.541502442661,
-0.838485074993,
--0.060974450443,
-0.472521916522,
-0.865922853816,
--0.164014175138,
-0.608982282690,
-0.786838788369,
--0.100126422527,
-0.579833816791,
-0.808868434473,
--0.097594060363,
-0.548872754349,
-0.830738197495,
--0.092804885412,
-0.517031950018,
-0.851514690917,
--0.087181958074,
-0.669541940069,
-0.730440678566,
--0.134796163093,
-0.643124061264,
-0.753976109567,
--0.133833732760,
-0.615419063405,
-0.777051319572,
--0.132100806769,
-0.586250030929,
-0.799775052261,
--0.129115324484,
-0.555596356581,
-0.822094200992,
--0.124393782999,
-0.524006837327,
-0.843371405579,
--0.118918067119,
-0.428754902697,
-0.861617826288,
--0.271632021008,
-0.675125979501,
-0.718513553210,
--0.167162153783,
-0.648711339050,
-0.742736837082,
--0.165878236754,
-0.621038775748,
-0.766476260571,
--0.163783335534,
-0.592020303273,
-0.789775410103,
--0.160520285659,
-0.561699815759,
-0.812529733815,
--0.155848479757,
-0.530428050300,
-0.834274934105,
--0.150437421474,
-0.498443291170,
-0.855155642339,
--0.142348561156,
-0.728943598230,
-0.654555930137,
--0.200493802702,
-0.704886410201,
-0.680524330302,
--0.200054454041,
-0.679741137757,
-0.705901379456,
--0.199136204955,
-0.653442399265,
-0.730730852881,
--0.197599219356,
-0.625926238235,
-0.755046457671,
--0.195246487927,
-0.597152273116,
-0.778857080189,
--0.191809309866,
-0.567184166445,
-0.802037813416,
--0.187182977821,
-0.536257540194,
-0.824238693243,
--0.181819765556,
-0.504523180177,
-0.845588744745,
--0.174459265807,
-0.755080149457,
-0.613018505686,
--0.232512966481,
-0.732280315084,
-0.640119512424,
--0.232406002408,
-0.708427055056,
-0.666613278850,
--0.231857378845,
-0.683476704513,
-0.692531866202,
--0.230779567301,
-0.657383695200,
-0.717900628408,
--0.229053192549,
-0.630110243263,
-0.742731324204,
--0.226519891802,
-0.601641472724,
-0.767013887509,
--0.222973618767,
-0.572044414600,
-0.790613875135,
--0.218391593631,
-0.541483071415,
-0.813262539391,
--0.213073051778,
-0.510072453932,
-0.835057219143,
--0.206168699119,
-0.478160091038,
-0.855929450322,
--0.196844363417,
-0.778668566712,
-0.569286554769,
--0.263795530239,
-0.757178341270,
-0.597441826204,
--0.264091317188,
-0.734654367222,
-0.624988892857,
--0.263954247034,
-0.711065844150,
-0.651954161502,
--0.263327052508,
-0.686379328193,
-0.678358204525,
--0.262132722457,
-0.660563638400,
-0.704212115856,
--0.260270965544,
-0.633597343680,
-0.729513045822,
--0.257614289309,
-0.605479283593,
-0.754239826390,
--0.254002207524,
-0.576273202140,
-0.778252556194,
--0.249463735385,
-0.546096642452,
-0.801342480658,
--0.244189856046,
-0.515046817130,
-0.823573708348,
--0.237598659680,
-0.483363015301,
-0.844927720879,
--0.229035678289,
-0.799589918889,
-0.523550487904,
--0.294195255276,
-0.779455802997,
-0.552665002619,
--0.294974653241,
-0.758300939460,
-0.581180686570,
--0.295311182944,
-0.736102351280,
-0.609122006440,
--0.295167257179,
-0.712834205766,
-0.636507380361,
--0.294492359556,
-0.688470882230,
-0.663347276645,
--0.293220454418,
-0.662991168989,
-0.689641760091,
--0.291267836503,
-0.636383798254,
-0.715377869855,
--0.288531046233,
-0.608654782961,
-0.740527363554,
--0.284883448108,
-0.579861550773,
-0.764946679431,
--0.280387516774,
-0.550090554379,
-0.788471944038,
--0.275158818591,
-0.519427438857,
-0.811137059671,
--0.268796960904,
-0.488048484576,
-0.832949913538,
--0.260774075091,
-0.456245355086,
-0.853789218908,
--0.250767114349,
-0.324905517562,
-0.799003017568,
--0.505994646785,
-0.779247788370,
-0.535376361461,
--0.325799072911,
-0.758470091102,
-0.564198668721,
--0.326194701241,
-0.736643904723,
-0.592483235883,
--0.326066515963,
-0.713746740685,
-0.620240749029,
--0.325372099921,
-0.689758530483,
-0.647472756587,
--0.324055857998,
-0.664664671630,
-0.674170256196,
--0.322048660839,
-0.638460330512,
-0.700312678735,
--0.319265654848,
-0.611155206211,
-0.725866876419,
--0.315605119791,
-0.582798922105,
-0.750686867968,
--0.311150514469,
-0.553456277089,
-0.774641916478,
--0.305967401183,
-0.523203252676,
-0.797740346409,
--0.299781080293,
-0.492177673538,
-0.820003565031,
--0.292156278398,
-0.460602752856,
-0.841336349636,
--0.282839620354,
-0.353737623468,
-0.815773310318,
--0.457584527618,
-0.355227303402,
-0.797435433487,
--0.487760486650,
-0.356264164777,
-0.778070620550,
--0.517379893630,
-0.757695270858,
-0.546462422108,
--0.356758598697,
-0.736286050876,
-0.575040782451,
--0.356666440534,
-0.713806640845,
-0.603125963516,
--0.355976335757,
-0.690240190766,
-0.630711222675,
--0.354643247000,
-0.665576468844,
-0.657779642589,
--0.352610133031,
-0.639814350079,
-0.684303737632,
--0.349808507752,
-0.612966063110,
-0.710246569034,
--0.346153747128,
-0.585073074726,
-0.735461506991,
--0.341739475281,
-0.556183856224,
-0.759841039922,
--0.336602305587,
-0.526364971637,
-0.783373244052,
--0.330554499496,
-0.495729665716,
-0.806085114031,
--0.323231940665,
-0.464453918379,
-0.827895392664,
--0.314438827927,
-0.432761100466,
-0.848707021341,
--0.303997075396,
-0.381405280847,
-0.829682351515,
--0.407623855198,
-0.383512765718,
-0.812812516444,
--0.438467526327,
-0.385163517317,
-0.794914820719,
--0.468785124263,
-0.386335971924,
-0.775975091741,
--0.498605228407,
-0.386973750712,
-0.756003153871,
--0.527930438218,
-0.735024619344,
-0.556765961453,
--0.386976062730,
-0.713008483361,
-0.585137022965,
--0.386307606721,
-0.689907313273,
-0.613040499416,
--0.384979538636,
-0.665714726040,
-0.640451723410,
--0.382943198809,
-0.640431671412,
-0.667336494396,
--0.380143758990,
-0.614071181884,
-0.693652728129,
--0.376513580550,
-0.586669907908,
-0.719256979903,
--0.372139511495,
-0.558261490186,
-0.744055854754,
--0.367049034302,
-0.528902595989,
-0.768023082420,
--0.361112986232,
-0.498690286605,
-0.791185290265,
--0.354025189094,
-0.467766801419,
-0.813468176753,
--0.345635277280,
-0.436314162382,
-0.834788295384,
--0.335795255467,
-0.407783509839,
-0.840669568647,
--0.356352754240,
-0.410583074410,
-0.825275966449,
--0.387738466249,
-0.412905550289,
-0.808868614821,
--0.418617451258,
-0.414726781098,
-0.791438960078,
--0.449027916183,
-0.416026086109,
-0.772972327295,
--0.478994861051,
-0.416786058701,
-0.753448209780,
--0.508532375029,
-0.416935442360,
-0.732891346756,
--0.537619857105,
-0.711334603417,
-0.566251678969,
--0.416367767780,
-0.688745901990,
-0.594439275764,
--0.415055454031,
-0.665064223696,
-0.622168316708,
--0.413032884943,
-0.640295868218,
-0.649395547747,
--0.410251902749,
-0.614454441682,
-0.676069938392,
--0.406663469592,
-0.587573359299,
-0.702058185534,
--0.402333010784,
-0.559675208815,
-0.727271289041,
--0.397290992567,
-0.530804101780,
-0.751675776835,
--0.391446716748,
-0.501046848216,
-0.775291632664,
--0.384545108166,
-0.470520248113,
-0.798048177475,
--0.376470188122,
-0.439374096697,
-0.819868896647,
--0.367104066256,
-0.441913585854,
-0.803945532468,
--0.397974827673,
-0.443911486568,
-0.787008108319,
--0.428439995253,
-0.445348941818,
-0.769041946132,
--0.458518053200,
-0.446207862853,
-0.750028876023,
--0.488216374428,
-0.446476636089,
-0.729942906296,
--0.517534508004,
-0.446063537463,
-0.708830046658,
--0.546431409694,
-0.686726881908,
-0.574894831285,
--0.444861914111,
-0.663602301060,
-0.602912617112,
--0.442863818973,
-0.639388893066,
-0.630461312556,
--0.440114049758,
-0.614101664803,
-0.657483241684,
--0.436571795002,
-0.587765438490,
-0.683850852040,
--0.432295965145,
-0.560406942497,
-0.709473130230,
--0.427307776997,
-0.532054177275,
-0.734317470250,
--0.421540277233,
-0.502785538788,
-0.758389971474,
--0.414790734170,
-0.472697286949,
-0.781623983224,
--0.406965875424,
-0.474281774208,
-0.764180864874,
--0.437132021722,
-0.475256870014,
-0.745701769945,
--0.466968711806,
-0.475605016580,
-0.726167588560,
--0.496468026693,
-0.475320370235,
-0.705551242770,
--0.525612014194,
-0.474284597513,
-0.683916955627,
--0.554357031495,
-0.661304520129,
-0.582670496325,
--0.472410228900,
-0.637683359104,
-0.610524211320,
--0.469702161921,
-0.612985592165,
-0.637885437226,
--0.466209001172,
-0.587226817914,
-0.664625654627,
--0.461992860913,
-0.560433166465,
-0.690652198290,
--0.457071336798,
-0.532635683392,
-0.715933202654,
--0.451374432279,
-0.503890767410,
-0.740464430822,
--0.444754450462,
-0.504345039968,
-0.721498235687,
--0.474422150157,
-0.504134078430,
-0.701469400717,
--0.503775258249,
-0.503241115018,
-0.680359054884,
--0.532785075422,
-0.501546985237,
-0.658241474435,
--0.561398951668,
-0.635159255457,
-0.589570330925,
--0.498978501641,
-0.611082220403,
-0.617262949603,
--0.495545125044,
-0.585936982761,
-0.644367808544,
--0.491393914844,
-0.559741698729,
-0.670791973493,
--0.486546358533,
-0.532528909506,
-0.696504415720,
--0.480930929991,
-0.531720552765,
-0.676012828283,
--0.510176351632,
-0.530186665764,
-0.654446961178,
--0.539074460952,
-0.527815366965,
-0.631885374868,
--0.567566570038,
-0.608373479152,
-0.595600246531,
--0.524539851867,
-0.583873839746,
-0.623061613926,
--0.520466679540,
-0.558313991109,
-0.649875509274,
--0.515700794820,
-0.556122905592,
-0.627892877918,
--0.544497794059,
-0.553063797714,
-0.604926633262,
--0.572873637051,
-0.581014692332,
-0.600697877342,
--0.549166629950,
-0.033808943928,
-0.564444911575,
-0.824778089614,
--0.000000001697,
-0.550735108946,
-0.834680082291,
--0.067686807932,
-0.601482759841,
-0.796013181829,
-0.034410420412,
-0.592180171602,
-0.805070535623,
--0.000000000297,
-0.579186725664,
-0.815194907255,
--0.101366333663,
-0.636536090912,
-0.764556519406,
-0.068316855638,
-0.628641676194,
-0.774688614985,
-0.034502971258,
-0.618826254245,
-0.784769782823,
-0.000000000517,
-0.606229327536,
-0.795289885787,
--0.034410417907,
-0.592180171147,
-0.805070536065,
-0.134796163508,
-0.669541939813,
-0.730440678724,
-0.101953342427,
-0.662827226065,
-0.741798884035,
-0.068537426908,
-0.654703392598,
-0.752772268905,
-0.034499882344,
-0.644725590032,
-0.763635169224,
-0.000000001049,
-0.632475941815,
-0.774580004277,
--0.034502969901,
-0.618826252795,
-0.784769784026,
--0.167877821148,
-0.700386923539,
-0.693740004974,
-0.135275667820,
-0.694832911607,
-0.706333999354,
-0.102190885040,
-0.688072287063,
-0.718410433381,
-0.068580959385,
-0.679877080018,
-0.730112188692,
-0.034463285101,
-0.669927814138,
-0.741625920410,
-0.000000000986,
-0.658019472734,
-0.753000912020,
--0.034499879892,
-0.644725588332,
-0.763635170771,
--0.068316852403,
-0.628641677003,
-0.774688614614,
-0.200493801539,
-0.728943598949,
-0.654555929692,
-0.168182693707,
-0.724584241369,
-0.668350401135,
-0.135434970966,
-0.719110665487,
-0.681569673198,
-0.102219062554,
-0.712390578021,
-0.694298874835,
-0.068527252260,
-0.704243032905,
-0.706644016675,
-0.034405460658,
-0.694433201887,
-0.718734159752,
-0.000000001682,
-0.682869607814,
-0.730540278646,
--0.034463280713,
-0.669927813978,
-0.741625920758,
--0.068537423514,
-0.654703393330,
-0.752772268578,
-0.232512962128,
-0.755080152148,
-0.613018504024,
-0.200550058999,
-0.751968370855,
-0.627951624785,
-0.168175017056,
-0.747784919126,
-0.642288781130,
-0.135363527859,
-0.742447059960,
-0.656086182207,
-0.102102937924,
-0.735843267438,
-0.669409946022,
-0.068405736897,
-0.727830165097,
-0.682337091132,
-0.034328594704,
-0.718230509404,
-0.694957900126,
-0.000000001520,
-0.707017841381,
-0.707195709806,
--0.034405456797,
-0.694433201200,
-0.718734160601,
--0.068580957714,
-0.679877080252,
-0.730112188631,
--0.101953339022,
-0.662827226906,
-0.741798883751,
-0.263795524187,
-0.778668570452,
-0.569286552457,
-0.232240527680,
-0.776863211754,
-0.585275907180,
-0.200287073575,
-0.774002844387,
-0.600670196563,
-0.167914736983,
-0.770033898090,
-0.615509899917,
-0.135109972812,
-0.764883704818,
-0.629839831505,
-0.101872999909,
-0.758458964912,
-0.643709476732,
-0.068227302327,
-0.750644938662,
-0.657173653822,
-0.034232118240,
-0.741304668481,
-0.670295121994,
-0.000000002123,
-0.730450268257,
-0.682965889048,
--0.034328591386,
-0.718230509459,
-0.694957900233,
--0.068527249899,
-0.704243034087,
-0.706644015726,
--0.102190883518,
-0.688072288475,
-0.718410432245,
-0.294195255416,
-0.799589918803,
-0.523550487957,
-0.263108308917,
-0.799150286886,
-0.540493142185,
-0.231631829430,
-0.797656944313,
-0.556857337909,
-0.199746609914,
-0.795075554518,
-0.572674562413,
-0.167438152639,
-0.791358024054,
-0.587976991732,
-0.134700902021,
-0.786441353493,
-0.602798195510,
-0.101543531393,
-0.780247238039,
-0.617173524031,
-0.067995376114,
-0.772682338120,
-0.631140739601,
-0.034114554464,
-0.763638482554,
-0.644742169503,
-0.000000001551,
-0.753150565202,
-0.657848178636,
--0.034232116178,
-0.741304667877,
-0.670295122767,
--0.068405733411,
-0.727830165042,
-0.682337091540,
--0.102219059564,
-0.712390579475,
-0.694298873783,
--0.135275663549,
-0.694832912939,
-0.706333998862,
--0.293008368430,
-0.818716538078,
-0.493811022870,
-0.262059072609,
-0.818641275000,
-0.511029847788,
-0.230716152908,
-0.817479079168,
-0.527729108454,
-0.198955725053,
-0.815202693842,
-0.543931234092,
-0.166767360008,
-0.811769860727,
-0.559659129159,
-0.134151227635,
-0.807126046669,
-0.574935642409,
-0.101121377597,
-0.801205241716,
-0.589783543039,
-0.067710405183,
-0.793930024853,
-0.604227123412,
-0.033974164289,
-0.785212708996,
-0.618293423701,
-0.000000001523,
-0.775100514722,
-0.631837947640,
--0.034114551121,
-0.763638482573,
-0.644742169658,
--0.068227298680,
-0.750644939025,
-0.657173653786,
--0.102102935410,
-0.735843268049,
-0.669409945734,
--0.135434969474,
-0.719110666000,
-0.681569672953,
--0.263108301620,
-0.799150287386,
-0.540493144997,
--0.262059070984,
-0.818641275450,
-0.511029847900,
--0.260690726163,
-0.837138253457,
-0.480874089437,
-0.229512669741,
-0.836337579883,
-0.497858802177,
-0.197931545206,
-0.834389611390,
-0.514409447636,
-0.165915984039,
-0.831270398120,
-0.530529369073,
-0.133469642930,
-0.826932995496,
-0.546230423334,
-0.100610329561,
-0.821320912547,
-0.561524282822,
-0.067372039971,
-0.814369686830,
-0.576422606602,
-0.033809286985,
-0.806005555676,
-0.590941601458,
-0.000000001398,
-0.796279684883,
-0.604928643266,
--0.033974161051,
-0.785212708037,
-0.618293425097,
--0.067995372639,
-0.772682338828,
-0.631140739108,
--0.101872995626,
-0.758458965129,
-0.643709477154,
--0.135363524780,
-0.742447060571,
-0.656086182150,
--0.168182688427,
-0.724584243308,
-0.668350400361,
--0.232240520377,
-0.776863213142,
-0.585275908236,
--0.231631830313,
-0.797656943961,
-0.556857338047,
--0.230716149344,
-0.817479079580,
-0.527729109375,
--0.229512668108,
-0.836337579787,
-0.497858803090,
--0.228072713490,
-0.854209394069,
-0.467235645521,
-0.196682247807,
-0.852632664815,
-0.484080192001,
-0.164891853157,
-0.849850944709,
-0.500563730748,
-0.132661271348,
-0.845848578439,
-0.516663497294,
-0.100012708755,
-0.840575385347,
-0.532381892663,
-0.066980976877,
-0.833976914770,
-0.547718955641,
-0.033618562833,
-0.825991957407,
-0.562678485934,
-0.000000002304,
-0.816664773145,
-0.577112335949,
--0.033809283880,
-0.806005555495,
-0.590941601881,
--0.067710402321,
-0.793930025286,
-0.604227123164,
--0.101543528206,
-0.780247238108,
-0.617173524468,
--0.135109971159,
-0.764883704885,
-0.629839831779,
--0.168175016008,
-0.747784919474,
-0.642288781000,
--0.200550051891,
-0.751968372458,
-0.627951625135,
--0.200287073868,
-0.774002844455,
-0.600670196378,
--0.199746606736,
-0.795075555551,
-0.572674562088,
--0.198955723158,
-0.815202694364,
-0.543931234004,
--0.197931542165,
-0.834389611179,
-0.514409449149,
--0.196682246456,
-0.852632664142,
-0.484080193736,
--0.195271487311,
-0.869887203269,
-0.452951763250,
-0.163691227213,
-0.867497293647,
-0.469737828632,
-0.131728312730,
-0.863851705249,
-0.486217937723,
-0.099329920283,
-0.858943318227,
-0.502344446580,
-0.066537655019,
-0.852722955733,
-0.518108387531,
-0.033403193298,
-0.845141979081,
-0.533497199498,
-0.000000002618,
-0.836228833142,
-0.548380651210,
--0.033618557674,
-0.825991956941,
-0.562678486925,
--0.067372037262,
-0.814369686433,
-0.576422607479,
--0.101121374674,
-0.801205241808,
-0.589783543415,
--0.134700897822,
-0.786441353292,
-0.602798196711,
--0.167914732384,
-0.770033898877,
-0.615509900187,
--0.167438150318,
-0.791358023933,
-0.587976992556,
--0.166767357131,
-0.811769860695,
-0.559659130062,
--0.165915981375,
-0.831270398918,
-0.530529368657,
--0.164891850570,
-0.849850944234,
-0.500563732406,
--0.163691225109,
-0.867497293164,
-0.469737830257,
--0.162398632807,
-0.884144595975,
-0.438081062670,
-0.130656410705,
-0.880916562465,
-0.454879008437,
-0.098556784251,
-0.876395751084,
-0.471399032414,
-0.066043103389,
-0.870577452126,
-0.487578925246,
-0.033168958337,
-0.863418329020,
-0.503397069236,
-0.000000002595,
-0.854939036545,
-0.518728487546,
--0.033403189790,
-0.845141978961,
-0.533497199907,
--0.066980973260,
-0.833976914306,
-0.547718956789,
--0.100610326299,
-0.821320911996,
-0.561524284212,
--0.134151224913,
-0.807126046851,
-0.574935642789,
--0.133469640478,
-0.826932995485,
-0.546230423950,
--0.132661268227,
-0.845848578348,
-0.516663498245,
--0.131728310669,
-0.863851704678,
-0.486217939296,
--0.130656408926,
-0.880916561466,
-0.454879010882,
--0.129559921939,
-0.896968520217,
-0.422683924898,
-0.097688558032,
-0.892895249047,
-0.439539554374,
-0.065488618557,
-0.887501067616,
-0.456128376468,
-0.032906538462,
-0.880781241528,
-0.472378623880,
-0.000000002630,
-0.872754106893,
-0.488160085323,
--0.033168953976,
-0.863418328818,
-0.503397069870,
--0.066537652053,
-0.852722954693,
-0.518108389624,
--0.100012704784,
-0.840575385307,
-0.532381893473,
--0.099329916387,
-0.858943318208,
-0.502344447383,
--0.098556779610,
-0.876395750340,
-0.471399034768,
--0.097688555779,
-0.892895248111,
-0.439539556776,
--0.096842519373,
-0.908362587145,
-0.406815605302,
-0.064876629502,
-0.903448967019,
-0.423758170348,
-0.032612561347,
-0.897190279267,
-0.440438444769,
-0.000000001795,
-0.889635122890,
-0.456672035624,
--0.032906533352,
-0.880781241468,
-0.472378624347,
--0.066043100561,
-0.870577451352,
-0.487578927012,
--0.065488613479,
-0.887501067336,
-0.456128377743,
--0.064876627463,
-0.903448965947,
-0.423758172946,
--0.064318801248,
-0.918342003413,
-0.390526640030,
-0.032292631841,
-0.912598991995,
-0.407578539349,
-0.000000002979,
-0.905539935873,
-0.424261033492,
--0.032612557244,
-0.897190279170,
-0.440438445271,
--0.032292629138,
-0.912598991513,
-0.407578540642,
--0.032052994785,
-0.926929016889,
-0.373865220601,
-0.000000000009,
-0.920418335123,
-0.390934890192,
--0.054704019281,
--0.509740891866,
-0.858587033115,
--0.028214020866,
--0.533297886141,
-0.845456878655,
--0.067686809675,
--0.601482758764,
-0.796013182495,
--0.087181959437,
--0.517031948082,
-0.851514691953,
--0.060974450259,
--0.541502443142,
-0.838485074695,
--0.101366335619,
--0.636536089703,
-0.764556520153,
--0.142348561315,
--0.498443288263,
-0.855155644007,
--0.118918069313,
--0.524006836582,
-0.843371405732,
--0.092804885731,
--0.548872753512,
-0.830738198012,
--0.065915150241,
--0.572709175758,
-0.817104273010,
--0.218104773694,
--0.451437165961,
-0.865236842074,
--0.196844363646,
--0.478160087951,
-0.855929451995,
--0.174459266100,
--0.504523177166,
-0.845588746481,
--0.150437424381,
--0.530428048689,
-0.834274934605,
--0.124393783647,
--0.555596354883,
-0.822094202042,
--0.097594059007,
--0.579833815340,
-0.808868435677,
--0.167877821581,
--0.700386923272,
-0.693740005139,
--0.250767114346,
--0.456245351117,
-0.853789221030,
--0.229035677050,
--0.483363013715,
-0.844927722123,
--0.206168699415,
--0.510072452482,
-0.835057219956,
--0.181819767216,
--0.536257536616,
-0.824238695204,
--0.155848480366,
--0.561699814163,
-0.812529734802,
--0.129115323093,
--0.586250028573,
-0.799775054213,
--0.100126424367,
--0.608982280362,
-0.786838789936,
--0.324405786587,
--0.404537812807,
-0.855049731676,
--0.303997075071,
--0.432761095464,
-0.848707024008,
--0.282839620277,
--0.460602751467,
-0.841336350422,
--0.260774074312,
--0.488048481755,
-0.832949915435,
--0.237598658979,
--0.515046814922,
-0.823573709931,
--0.213073053952,
--0.541483068373,
-0.813262540847,
--0.187182978860,
--0.567184163723,
-0.802037815098,
--0.160520286711,
--0.592020299751,
-0.789775412530,
--0.132100808574,
--0.615419060923,
-0.777051321231,
--0.376213879901,
--0.378866273910,
-0.845531467814,
--0.356352755315,
--0.407783503179,
-0.840669571422,
--0.335795255444,
--0.436314161401,
-0.834788295906,
--0.314438828355,
--0.464453915600,
-0.827895394061,
--0.292156278537,
--0.492177671287,
-0.820003566332,
--0.268796962230,
--0.519427435938,
-0.811137061100,
--0.244189857080,
--0.546096639708,
-0.801342482213,
--0.218391594571,
--0.572044412140,
-0.790613876656,
--0.191809310079,
--0.597152269911,
-0.778857082594,
--0.163783336271,
--0.621038774494,
-0.766476261429,
--0.133833734635,
--0.643124058843,
-0.753976111300,
--0.426830130267,
--0.351838442497,
-0.833082078956,
--0.407623856860,
--0.381405273918,
-0.829682353884,
--0.387738466010,
--0.410583074670,
-0.825275966432,
--0.367104067175,
--0.439374092501,
-0.819868898485,
--0.345635277874,
--0.467766799964,
-0.813468177337,
--0.323231942024,
--0.495729662012,
-0.806085115764,
--0.299781081107,
--0.523203249555,
-0.797740348149,
--0.275158820103,
--0.550090552773,
-0.788471944630,
--0.249463736698,
--0.576273198705,
-0.778252558317,
--0.222973619783,
--0.601641470101,
-0.767013889272,
--0.195246490087,
--0.625926236622,
-0.755046458449,
--0.165878238934,
--0.648711338174,
-0.742736837361,
--0.476017922451,
--0.323571996298,
-0.817745743319,
--0.457584530874,
--0.353737616446,
-0.815773311537,
--0.438467526408,
--0.383512766566,
-0.812812516000,
--0.418617451243,
--0.412905547302,
-0.808868616354,
--0.397974828901,
--0.441913583782,
-0.803945533000,
--0.376470190182,
--0.470520244446,
-0.798048178665,
--0.354025190242,
--0.498690283857,
-0.791185291484,
--0.330554499750,
--0.526364968624,
-0.783373245969,
--0.305967402278,
--0.553456274327,
-0.774641918018,
--0.280387517733,
--0.579861548264,
-0.764946680982,
--0.254002207286,
--0.605479281861,
-0.754239827860,
--0.226519892631,
--0.630110240541,
-0.742731326260,
--0.197599221982,
--0.653442397248,
-0.730730853975,
--0.167162156425,
--0.675125976559,
-0.718513555359,
--0.324905516107,
--0.799003016669,
-0.505994649138,
--0.487760486844,
--0.355227301829,
-0.797435434069,
--0.468785125491,
--0.385163513944,
-0.794914821628,
--0.449027916302,
--0.414726779331,
-0.791438960936,
--0.428439996620,
--0.443911483977,
-0.787008109037,
--0.406965876309,
--0.472697284538,
-0.781623984221,
--0.384545109183,
--0.501046845689,
-0.775291633792,
--0.361112986643,
--0.528902593534,
-0.768023083918,
--0.336602308061,
--0.556183853652,
-0.759841040708,
--0.311150515410,
--0.582798919640,
-0.750686869491,
--0.284883449080,
--0.608654780313,
-0.740527365357,
--0.257614290748,
--0.633597340900,
-0.729513047729,
--0.229053193964,
--0.657383693382,
-0.717900629621,
--0.199136205954,
--0.679741136730,
-0.705901380163,
--0.294974654495,
--0.779455798212,
-0.552665008698,
--0.325799073721,
--0.779247787315,
-0.535376362503,
--0.356264164309,
--0.778070620261,
-0.517379894387,
--0.498605229445,
--0.386335970368,
-0.775975091849,
--0.478994862918,
--0.416026083287,
-0.772972327657,
--0.458518053170,
--0.445348939393,
-0.769041947555,
--0.437132022797,
--0.474281772040,
-0.764180865604,
--0.414790736319,
--0.502785535995,
-0.758389972150,
--0.391446718345,
--0.530804099515,
-0.751675777603,
--0.367049035620,
--0.558261487633,
-0.744055856019,
--0.341739476145,
--0.585073072463,
-0.735461508390,
--0.315605119318,
--0.611155203544,
-0.725866878871,
--0.288531048127,
--0.636383795645,
-0.715377871413,
--0.260270966832,
--0.660563635174,
-0.704212118406,
--0.230779568776,
--0.683476702310,
-0.692531867884,
--0.200054457629,
--0.704886406660,
-0.680524332915,
--0.264091320040,
--0.757178336382,
-0.597441831138,
--0.295311182318,
--0.758300940040,
-0.581180686131,
--0.326194702215,
--0.758470088709,
-0.564198671374,
--0.356758598667,
--0.757695269771,
-0.546462423634,
--0.386973749375,
--0.756003153045,
-0.527930440381,
--0.508532376858,
--0.416786057409,
-0.753448209260,
--0.488216376440,
--0.446207860485,
-0.750028876122,
--0.466968713320,
--0.475256867241,
-0.745701770764,
--0.444754452126,
--0.503890763968,
-0.740464432165,
--0.421540279299,
--0.532054174226,
-0.734317471273,
--0.397290995034,
--0.559675204568,
-0.727271290962,
--0.372139512919,
--0.586669904180,
-0.719256982207,
--0.346153747729,
--0.612966060638,
-0.710246570874,
--0.319265656206,
--0.638460328337,
-0.700312680099,
--0.291267837325,
--0.662991166580,
-0.689641762059,
--0.262132722885,
--0.686379326973,
-0.678358205594,
--0.231857379516,
--0.708427054342,
-0.666613279376,
--0.232406005726,
--0.732280310243,
-0.640119516756,
--0.263954247091,
--0.734654367436,
-0.624988892581,
--0.295167259158,
--0.736102349125,
-0.609122008085,
--0.326066517015,
--0.736643903423,
-0.592483236920,
--0.356666440547,
--0.736286048777,
-0.575040785130,
--0.386976061735,
--0.735024618451,
-0.556765963323,
--0.416935440913,
--0.732891345862,
-0.537619859446,
--0.517534509858,
--0.446476634126,
-0.729942906182,
--0.496468028579,
--0.475605014712,
-0.726167588495,
--0.474422151778,
--0.504345036577,
-0.721498236991,
--0.451374435083,
--0.532635680865,
-0.715933202766,
--0.427307778383,
--0.560406939592,
-0.709473131690,
--0.402333012402,
--0.587573355064,
-0.702058188152,
--0.376513581272,
--0.614071177784,
-0.693652731366,
--0.349808507829,
--0.639814347960,
-0.684303739574,
--0.322048661629,
--0.664664669428,
-0.674170257989,
--0.293220454953,
--0.688470879104,
-0.663347279653,
--0.263327054430,
--0.711065840907,
-0.651954164263,
--0.294492359764,
--0.712834204081,
-0.636507382151,
--0.325372100332,
--0.713746738620,
-0.620240751188,
--0.355976337434,
--0.713806638960,
-0.603125964757,
--0.386307606307,
--0.713008481544,
-0.585137025453,
--0.416367767227,
--0.711334601976,
-0.566251681186,
--0.446063534893,
--0.708830045070,
-0.546431413852,
--0.525612016774,
--0.475320368540,
-0.705551241990,
--0.503775261462,
--0.504134074319,
-0.701469401363,
--0.480930932375,
--0.532528907061,
-0.696504415944,
--0.457071338626,
--0.560433162842,
-0.690652200021,
--0.432295966749,
--0.587765434291,
-0.683850854635,
--0.406663470374,
--0.614454438910,
-0.676069940440,
--0.380143759158,
--0.640431668609,
-0.667336496990,
--0.352610132898,
--0.665576466359,
-0.657779645175,
--0.324055858796,
--0.689758528490,
-0.647472758312,
--0.354643247441,
--0.690240188967,
-0.630711224396,
--0.384979539051,
--0.689907310996,
-0.613040501717,
--0.415055453419,
--0.688745900523,
-0.594439277891,
--0.444861912629,
--0.686726880725,
-0.574894833844,
--0.474284596157,
--0.683916954789,
-0.554357033689,
--0.532785078076,
--0.503241112921,
-0.680359054357,
--0.510176354066,
--0.531720548403,
-0.676012829877,
--0.486546360394,
--0.559741694480,
-0.670791975688,
--0.461992862538,
--0.587226813659,
-0.664625657257,
--0.436571795870,
--0.614101661369,
-0.657483244315,
--0.410251901778,
--0.640295865946,
-0.649395550601,
--0.382943199598,
--0.665714723058,
-0.640451726038,
--0.413032885730,
--0.665064220782,
-0.622168319300,
--0.442863818629,
--0.663602297660,
-0.602912621107,
--0.472410227639,
--0.661304518580,
-0.582670499105,
--0.501546983139,
--0.658241473138,
-0.561398955062,
--0.539074463749,
--0.530186663847,
-0.654446960427,
--0.515700796417,
--0.558313987684,
-0.649875510950,
--0.491393915953,
--0.585936979856,
-0.644367810339,
--0.466209002469,
--0.612985588145,
-0.637885440141,
--0.440114049122,
--0.639388890937,
-0.630461315159,
--0.469702162626,
--0.637683355249,
-0.610524214804,
--0.498978500105,
--0.635159254074,
-0.589570333716,
--0.527815364751,
--0.631885373499,
-0.567566573620,
--0.544497795931,
--0.556122903246,
-0.627892878372,
--0.520466681381,
--0.583873834927,
-0.623061616905,
--0.495545125983,
--0.611082217190,
-0.617262952030,
--0.524539851666,
--0.608373477124,
-0.595600248780,
--0.553063796833,
--0.604926632717,
-0.572873638477,
--0.549166629956,
--0.581014692318,
-0.600697877351,
-0.858587032424,
--0.054704019708,
-0.509740892985,
-0.862894104207,
--0.017437222806,
-0.505083862528,
-0.905532739396,
--0.000000001077,
-0.424276393266,
-0.870985685678,
--0.075148223519,
-0.485527218439,
-0.876169357698,
--0.037684282522,
-0.480527992402,
-0.928570694543,
--0.000000001209,
-0.371155580903,
-0.874815037512,
--0.130198387931,
-0.466633721374,
-0.882363843185,
--0.094819417663,
-0.460915747478,
-0.888094771199,
--0.057356574024,
-0.456067868618,
-0.892252494139,
--0.019470995389,
-0.451116799777,
-0.865236841817,
--0.218104773852,
-0.451437166376,
-0.875632616795,
--0.184667138114,
-0.446279697618,
-0.884873075674,
--0.150180215433,
-0.440959797305,
-0.892750493708,
--0.114297541343,
-0.435812606548,
-0.898973787276,
--0.076879586932,
-0.431202572933,
-0.903687851145,
--0.038992437455,
-0.426412778319,
-0.965372025982,
--0.000000000267,
-0.260877081116,
-0.873496153136,
--0.238587560490,
-0.424358865154,
-0.884288670135,
--0.204709273349,
-0.419675662001,
-0.893895524226,
--0.169804627536,
-0.414870076333,
-0.902146206069,
--0.133670277522,
-0.410200536058,
-0.908849391777,
--0.096319658571,
-0.405851335393,
-0.914072592245,
--0.058475559759,
-0.401312727207,
-0.917037175770,
--0.019659396641,
-0.398316866803,
-0.855049732395,
--0.324405786143,
-0.404537811643,
-0.868404855176,
--0.291823145905,
-0.400889335129,
-0.880705878152,
--0.258507914019,
-0.396901517479,
-0.891898094191,
--0.224342096266,
-0.392668324953,
-0.901890504602,
--0.189196217983,
-0.388327579256,
-0.910543469618,
--0.152950133514,
-0.384079219164,
-0.917723256467,
--0.115685444091,
-0.380001187585,
-0.923445686314,
--0.077907514227,
-0.375737253482,
-0.927231534385,
--0.039284332407,
-0.372422371603,
-0.845531470505,
--0.376213878238,
-0.378866269556,
-0.860357627193,
--0.344184867676,
-0.375927559769,
-0.874146159976,
--0.311470757725,
-0.372631799612,
-0.886865749507,
--0.277993144360,
-0.369037876158,
-0.898463138571,
--0.243665596151,
-0.365227416662,
-0.908856982934,
--0.208402729158,
-0.361313281033,
-0.917931518893,
--0.172133869696,
-0.357451615644,
-0.925587303437,
--0.134973429242,
-0.353652820029,
-0.931807212378,
--0.097280931289,
-0.349673761336,
-0.936280887749,
--0.058838305758,
-0.346289117662,
-0.938643247168,
--0.019703168063,
-0.344326356404,
-0.833082082696,
--0.426830127955,
-0.351838436445,
-0.849367224368,
--0.395457937836,
-0.349554484410,
-0.864624443597,
--0.363419769717,
-0.346915901212,
-0.878836952425,
--0.330659805590,
-0.343961776975,
-0.891972553962,
--0.297116904854,
-0.340744050319,
-0.903980442276,
--0.262729302900,
-0.337331696377,
-0.914787943131,
--0.227441689107,
-0.333816262573,
-0.924297329518,
--0.191214115708,
-0.330320463490,
-0.932429624434,
--0.154177069552,
-0.326809465443,
-0.939147756278,
--0.116589039358,
-0.323123022669,
-0.944242675406,
--0.078316797465,
-0.319800327043,
-0.947446110534,
--0.039360950301,
-0.317484776367,
-0.817745743233,
--0.476017922505,
-0.323571996438,
-0.835467795426,
--0.445412670440,
-0.321871272122,
-0.852168520853,
--0.414144177747,
-0.319833413052,
-0.867841819592,
--0.382170007216,
-0.317484900037,
-0.882469351288,
--0.349444440272,
-0.314859376865,
-0.896018649928,
--0.315921109048,
-0.312000692048,
-0.908441360534,
--0.281556954182,
-0.308965978748,
-0.919671785835,
--0.246317369496,
-0.305829298505,
-0.929625617612,
--0.210182208227,
-0.302687380683,
-0.938235695411,
--0.173289016939,
-0.299474033040,
-0.945453941358,
--0.135825386016,
-0.296088347093,
-0.951134052444,
--0.097719924500,
-0.292907546226,
-0.955072948874,
--0.058948182227,
-0.290449262594,
-0.957101113211,
--0.019706936380,
-0.289083198661,
-0.999805669655,
--0.019713521409,
-0.000000001455,
-0.836828920699,
--0.463413973171,
-0.291487301526,
-0.853923809695,
--0.432315565225,
-0.289684965611,
-0.869997750055,
--0.400475914512,
-0.287615988421,
-0.885031229079,
--0.367858376750,
-0.285306744065,
-0.898991500407,
--0.334428762131,
-0.282792654174,
-0.911832203878,
--0.300158396027,
-0.280119562447,
-0.923492778259,
--0.265027431319,
-0.277347343869,
-0.933898543492,
--0.229028855343,
-0.274552898150,
-0.942988462108,
--0.192301595082,
-0.271648406695,
-0.950709570841,
--0.154983702260,
-0.268572828009,
-0.956954734078,
--0.117047598125,
-0.265588961928,
-0.961566224132,
--0.078459574667,
-0.263124479574,
-0.964409293307,
--0.039369529270,
-0.261466546902,
-0.998077672616,
--0.019694489174,
-0.058762968974,
-0.998790334550,
--0.039393488134,
-0.029428229681,
-0.998253983067,
--0.059067633195,
-0.000000000468,
-0.854617400873,
--0.450001609514,
-0.259090041412,
-0.871075888171,
--0.418363528103,
-0.257291187958,
-0.886505704830,
--0.385921458728,
-0.255288587675,
-0.900873670335,
--0.352651223456,
-0.253108167969,
-0.914134415853,
--0.318535376552,
-0.250785732525,
-0.926231114354,
--0.283565587315,
-0.248367631734,
-0.937095348585,
--0.247744068043,
-0.245917027490,
-0.946668118546,
--0.211206612419,
-0.243333598581,
-0.954895730684,
--0.174057504493,
-0.240578736906,
-0.961695238604,
--0.136298543183,
-0.237833923510,
-0.966941417819,
--0.097895329955,
-0.235458698884,
-0.970525010076,
--0.058970358261,
-0.233674349604,
-0.972347475757,
--0.019697836648,
-0.232706642837,
-0.992899763434,
--0.019684876760,
-0.117313960807,
-0.995324864374,
--0.039356003921,
-0.088201583401,
-0.996514233637,
--0.059008990871,
-0.058968815102,
-0.996464031497,
--0.078642310016,
-0.029577373257,
-0.995166083739,
--0.098206241025,
-0.000000001337,
-0.871056254731,
--0.435846607406,
-0.226492242485,
-0.886871337469,
--0.403643084224,
-0.224792106921,
-0.901643035931,
--0.370591711198,
-0.222938599952,
-0.915325091472,
--0.336684621379,
-0.220960273914,
-0.927862714630,
--0.301922740544,
-0.218891392113,
-0.939192066484,
--0.266316752839,
-0.216780186850,
-0.949251847444,
--0.229994868965,
-0.214530394989,
-0.957990636184,
--0.193039494857,
-0.212107742457,
-0.965340109396,
--0.155469696949,
-0.209636939783,
-0.971198713562,
--0.117256071528,
-0.207422449280,
-0.975475109059,
--0.078504377911,
-0.205634078535,
-0.978084036467,
--0.039357865132,
-0.204456782867,
-0.984304379375,
--0.019688062214,
-0.175377504113,
-0.988408662627,
--0.039348477020,
-0.146628827319,
-0.991292013347,
--0.058973206426,
-0.117738291131,
-0.992959150186,
--0.078558790941,
-0.088660264083,
-0.993404310200,
--0.098103562401,
-0.059359645562,
-0.992612568765,
--0.117608045691,
-0.029809996965,
-0.990571620355,
--0.136995857407,
-0.000000001447,
-0.886105596412,
--0.421020659521,
-0.193800093560,
-0.901273391754,
--0.388246690537,
-0.192277873411,
-0.915377331523,
--0.354598281650,
-0.190642071917,
-0.928360290281,
--0.320087274868,
-0.188921433136,
-0.940160669090,
--0.284735039489,
-0.187146663299,
-0.950713661995,
--0.248655478078,
-0.185240346897,
-0.959969479493,
--0.211920779157,
-0.183161627543,
-0.967869324228,
--0.174555338473,
-0.180995593950,
-0.974328651581,
--0.136540572380,
-0.178998186587,
-0.979268384833,
--0.097970474188,
-0.177299793160,
-0.982613966443,
--0.058968057970,
-0.176047042267,
-0.985951820230,
--0.078523819851,
-0.147421226090,
-0.988099125316,
--0.098023122075,
-0.118539386236,
-0.989047421857,
--0.117463759958,
-0.089372604384,
-0.988780106834,
--0.136842462690,
-0.059900256546,
-0.987272338262,
--0.156162691188,
-0.030108868862,
-0.984512472364,
--0.175314550905,
-0.000000002569,
-0.899740922547,
--0.405596193926,
-0.161114865134,
-0.914262851387,
--0.372261676764,
-0.159827039598,
-0.927692975005,
--0.338048545066,
-0.158457960691,
-0.939968864238,
--0.302985166178,
-0.157030326177,
-0.951024452690,
--0.267173602254,
-0.155469471741,
-0.960804976905,
--0.230687540052,
-0.153743472123,
-0.969259234022,
--0.193545245697,
-0.151910418116,
-0.976315018382,
--0.155744445637,
-0.150175405890,
-0.981901518214,
--0.117367518361,
-0.148641428153,
-0.983362445673,
--0.136692806518,
-0.119638526767,
-0.983632210052,
--0.155941267352,
-0.090277330963,
-0.982685965989,
--0.175105804155,
-0.060549563160,
-0.980491025076,
--0.194189680741,
-0.030458457605,
-0.977040956393,
--0.213051565428,
-0.000000001356,
-0.911949783275,
--0.389654136125,
-0.128519442053,
-0.925830538389,
--0.355780519214,
-0.127507005039,
-0.938587625052,
--0.321039547048,
-0.126439231770,
-0.950152946235,
--0.285527293233,
-0.125233955376,
-0.960468406667,
--0.249316667449,
-0.123861370596,
-0.969482821903,
--0.212427088748,
-0.122383781614,
-0.977136343935,
--0.174860662249,
-0.120947567812,
-0.976766597540,
--0.193879097426,
-0.091312154238,
-0.975174293017,
--0.212793452680,
-0.061270259801,
-0.972324632198,
--0.231590729531,
-0.030830887379,
-0.968214556970,
--0.250121114006,
-0.000000002098,
-0.922736671989,
--0.373262303172,
-0.096084791708,
-0.935983569813,
--0.338876291584,
-0.095381423987,
-0.948065950468,
--0.303698143033,
-0.094543066807,
-0.958924982880,
--0.267795653324,
-0.093532696260,
-0.968509857004,
--0.231188560415,
-0.092414860384,
-0.966304729375,
--0.249817712086,
-0.062018390139,
-0.962832633898,
--0.268289711873,
-0.031208165659,
-0.958093210068,
--0.286456629914,
-0.000000002214,
-0.932118391216,
--0.356476088749,
-0.063875683220,
-0.944727713032,
--0.321666100946,
-0.063407158365,
-0.956139240091,
--0.286108061980,
-0.062768865127,
-0.952076334702,
--0.304225514390,
-0.031583053926,
-0.946738857652,
--0.322002384172,
-0.000000000881,
-0.940101520142,
--0.339403642805,
-0.031848062377,
-0.054704019281,
-0.509740891866,
-0.858587033115,
-0.028214020866,
-0.533297886141,
-0.845456878655,
-0.067686809675,
-0.601482758764,
-0.796013182495,
-0.087181959437,
-0.517031948082,
-0.851514691953,
-0.060974450259,
-0.541502443142,
-0.838485074695,
-0.101366335619,
-0.636536089703,
-0.764556520153,
-0.142348561315,
-0.498443288263,
-0.855155644007,
-0.118918069313,
-0.524006836582,
-0.843371405732,
-0.092804885731,
-0.548872753512,
-0.830738198012,
-0.065915150241,
-0.572709175758,
-0.817104273010,
-0.218104773694,
-0.451437165961,
-0.865236842074,
-0.196844363646,
-0.478160087951,
-0.855929451995,
-0.174459266100,
-0.504523177166,
-0.845588746481,
-0.150437424381,
-0.530428048689,
-0.834274934605,
-0.124393783647,
-0.555596354883,
-0.822094202042,
-0.097594059007,
-0.579833815340,
-0.808868435677,
-0.167877821581,
-0.700386923272,
-0.693740005139,
-0.250767114346,
-0.456245351117,
-0.853789221030,
-0.229035677050,
-0.483363013715,
-0.844927722123,
-0.206168699415,
-0.510072452482,
-0.835057219956,
-0.181819767216,
-0.536257536616,
-0.824238695204,
-0.155848480366,
-0.561699814163,
-0.812529734802,
-0.129115323093,
-0.586250028573,
-0.799775054213,
-0.100126424367,
-0.608982280362,
-0.786838789936,
-0.324405786587,
-0.404537812807,
-0.855049731676,
-0.303997075071,
-0.432761095464,
-0.848707024008,
-0.282839620277,
-0.460602751467,
-0.841336350422,
-0.260774074312,
-0.488048481755,
-0.832949915435,
-0.237598658979,
-0.515046814922,
-0.823573709931,
-0.213073053952,
-0.541483068373,
-0.813262540847,
-0.187182978860,
-0.567184163723,
-0.802037815098,
-0.160520286711,
-0.592020299751,
-0.789775412530,
-0.132100808574,
-0.615419060923,
-0.777051321231,
-0.376213879901,
-0.378866273910,
-0.845531467814,
-0.356352755315,
-0.407783503179,
-0.840669571422,
-0.335795255444,
-0.436314161401,
-0.834788295906,
-0.314438828355,
-0.464453915600,
-0.827895394061,
-0.292156278537,
-0.492177671287,
-0.820003566332,
-0.268796962230,
-0.519427435938,
-0.811137061100,
-0.244189857080,
-0.546096639708,
-0.801342482213,
-0.218391594571,
-0.572044412140,
-0.790613876656,
-0.191809310079,
-0.597152269911,
-0.778857082594,
-0.163783336271,
-0.621038774494,
-0.766476261429,
-0.133833734635,
-0.643124058843,
-0.753976111300,
-0.426830130267,
-0.351838442497,
-0.833082078956,
-0.407623856860,
-0.381405273918,
-0.829682353884,
-0.387738466010,
-0.410583074670,
-0.825275966432,
-0.367104067175,
-0.439374092501,
-0.819868898485,
-0.345635277874,
-0.467766799964,
-0.813468177337,
-0.323231942024,
-0.495729662012,
-0.806085115764,
-0.299781081107,
-0.523203249555,
-0.797740348149,
-0.275158820103,
-0.550090552773,
-0.788471944630,
-0.249463736698,
-0.576273198705,
-0.778252558317,
-0.222973619783,
-0.601641470101,
-0.767013889272,
-0.195246490087,
-0.625926236622,
-0.755046458449,
-0.165878238934,
-0.648711338174,
-0.742736837361,
-0.476017922451,
-0.323571996298,
-0.817745743319,
-0.457584530874,
-0.353737616446,
-0.815773311537,
-0.438467526408,
-0.383512766566,
-0.812812516000,
-0.418617451243,
-0.412905547302,
-0.808868616354,
-0.397974828901,
-0.441913583782,
-0.803945533000,
-0.376470190182,
-0.470520244446,
-0.798048178665,
-0.354025190242,
-0.498690283857,
-0.791185291484,
-0.330554499750,
-0.526364968624,
-0.783373245969,
-0.305967402278,
-0.553456274327,
-0.774641918018,
-0.280387517733,
-0.579861548264,
-0.764946680982,
-0.254002207286,
-0.605479281861,
-0.754239827860,
-0.226519892631,
-0.630110240541,
-0.742731326260,
-0.197599221982,
-0.653442397248,
-0.730730853975,
-0.167162156425,
-0.675125976559,
-0.718513555359,
-0.324905516107,
-0.799003016669,
-0.505994649138,
-0.487760486844,
-0.355227301829,
-0.797435434069,
-0.468785125491,
-0.385163513944,
-0.794914821628,
-0.449027916302,
-0.414726779331,
-0.791438960936,
-0.428439996620,
-0.443911483977,
-0.787008109037,
-0.406965876309,
-0.472697284538,
-0.781623984221,
-0.384545109183,
-0.501046845689,
-0.775291633792,
-0.361112986643,
-0.528902593534,
-0.768023083918,
-0.336602308061,
-0.556183853652,
-0.759841040708,
-0.311150515410,
-0.582798919640,
-0.750686869491,
-0.284883449080,
-0.608654780313,
-0.740527365357,
-0.257614290748,
-0.633597340900,
-0.729513047729,
-0.229053193964,
-0.657383693382,
-0.717900629621,
-0.199136205954,
-0.679741136730,
-0.705901380163,
-0.294974654495,
-0.779455798212,
-0.552665008698,
-0.325799073721,
-0.779247787315,
-0.535376362503,
-0.356264164309,
-0.778070620261,
-0.517379894387,
-0.498605229445,
-0.386335970368,
-0.775975091849,
-0.478994862918,
-0.416026083287,
-0.772972327657,
-0.458518053170,
-0.445348939393,
-0.769041947555,
-0.437132022797,
-0.474281772040,
-0.764180865604,
-0.414790736319,
-0.502785535995,
-0.758389972150,
-0.391446718345,
-0.530804099515,
-0.751675777603,
-0.367049035620,
-0.558261487633,
-0.744055856019,
-0.341739476145,
-0.585073072463,
-0.735461508390,
-0.315605119318,
-0.611155203544,
-0.725866878871,
-0.288531048127,
-0.636383795645,
-0.715377871413,
-0.260270966832,
-0.660563635174,
-0.704212118406,
-0.230779568776,
-0.683476702310,
-0.692531867884,
-0.200054457629,
-0.704886406660,
-0.680524332915,
-0.264091320040,
-0.757178336382,
-0.597441831138,
-0.295311182318,
-0.758300940040,
-0.581180686131,
-0.326194702215,
-0.758470088709,
-0.564198671374,
-0.356758598667,
-0.757695269771,
-0.546462423634,
-0.386973749375,
-0.756003153045,
-0.527930440381,
-0.508532376858,
-0.416786057409,
-0.753448209260,
-0.488216376440,
-0.446207860485,
-0.750028876122,
-0.466968713320,
-0.475256867241,
-0.745701770764,
-0.444754452126,
-0.503890763968,
-0.740464432165,
-0.421540279299,
-0.532054174226,
-0.734317471273,
-0.397290995034,
-0.559675204568,
-0.727271290962,
-0.372139512919,
-0.586669904180,
-0.719256982207,
-0.346153747729,
-0.612966060638,
-0.710246570874,
-0.319265656206,
-0.638460328337,
-0.700312680099,
-0.291267837325,
-0.662991166580,
-0.689641762059,
-0.262132722885,
-0.686379326973,
-0.678358205594,
-0.231857379516,
-0.708427054342,
-0.666613279376,
-0.232406005726,
-0.732280310243,
-0.640119516756,
-0.263954247091,
-0.734654367436,
-0.624988892581,
-0.295167259158,
-0.736102349125,
-0.609122008085,
-0.326066517015,
-0.736643903423,
-0.592483236920,
-0.356666440547,
-0.736286048777,
-0.575040785130,
-0.386976061735,
-0.735024618451,
-0.556765963323,
-0.416935440913,
-0.732891345862,
-0.537619859446,
-0.517534509858,
-0.446476634126,
-0.729942906182,
-0.496468028579,
-0.475605014712,
-0.726167588495,
-0.474422151778,
-0.504345036577,
-0.721498236991,
-0.451374435083,
-0.532635680865,
-0.715933202766,
-0.427307778383,
-0.560406939592,
-0.709473131690,
-0.402333012402,
-0.587573355064,
-0.702058188152,
-0.376513581272,
-0.614071177784,
-0.693652731366,
-0.349808507829,
-0.639814347960,
-0.684303739574,
-0.322048661629,
-0.664664669428,
-0.674170257989,
-0.293220454953,
-0.688470879104,
-0.663347279653,
-0.263327054430,
-0.711065840907,
-0.651954164263,
-0.294492359764,
-0.712834204081,
-0.636507382151,
-0.325372100332,
-0.713746738620,
-0.620240751188,
-0.355976337434,
-0.713806638960,
-0.603125964757,
-0.386307606307,
-0.713008481544,
-0.585137025453,
-0.416367767227,
-0.711334601976,
-0.566251681186,
-0.446063534893,
-0.708830045070,
-0.546431413852,
-0.525612016774,
-0.475320368540,
-0.705551241990,
-0.503775261462,
-0.504134074319,
-0.701469401363,
-0.480930932375,
-0.532528907061,
-0.696504415944,
-0.457071338626,
-0.560433162842,
-0.690652200021,
-0.432295966749,
-0.587765434291,
-0.683850854635,
-0.406663470374,
-0.614454438910,
-0.676069940440,
-0.380143759158,
-0.640431668609,
-0.667336496990,
-0.352610132898,
-0.665576466359,
-0.657779645175,
-0.324055858796,
-0.689758528490,
-0.647472758312,
-0.354643247441,
-0.690240188967,
-0.630711224396,
-0.384979539051,
-0.689907310996,
-0.613040501717,
-0.415055453419,
-0.688745900523,
-0.594439277891,
-0.444861912629,
-0.686726880725,
-0.574894833844,
-0.474284596157,
-0.683916954789,
-0.554357033689,
-0.532785078076,
-0.503241112921,
-0.680359054357,
-0.510176354066,
-0.531720548403,
-0.676012829877,
-0.486546360394,
-0.559741694480,
-0.670791975688,
-0.461992862538,
-0.587226813659,
-0.664625657257,
-0.436571795870,
-0.614101661369,
-0.657483244315,
-0.410251901778,
-0.640295865946,
-0.649395550601,
-0.382943199598,
-0.665714723058,
-0.640451726038,
-0.413032885730,
-0.665064220782,
-0.622168319300,
-0.442863818629,
-0.663602297660,
-0.602912621107,
-0.472410227639,
-0.661304518580,
-0.582670499105,
-0.501546983139,
-0.658241473138,
-0.561398955062,
-0.539074463749,
-0.530186663847,
-0.654446960427,
-0.515700796417,
-0.558313987684,
-0.649875510950,
-0.491393915953,
-0.585936979856,
-0.644367810339,
-0.466209002469,
-0.612985588145,
-0.637885440141,
-0.440114049122,
-0.639388890937,
-0.630461315159,
-0.469702162626,
-0.637683355249,
-0.610524214804,
-0.498978500105,
-0.635159254074,
-0.589570333716,
-0.527815364751,
-0.631885373499,
-0.567566573620,
-0.544497795931,
-0.556122903246,
-0.627892878372,
-0.520466681381,
-0.583873834927,
-0.623061616905,
-0.495545125983,
-0.611082217190,
-0.617262952030,
-0.524539851666,
-0.608373477124,
-0.595600248780,
-0.553063796833,
-0.604926632717,
-0.572873638477,
-0.549166629956,
-0.581014692318,
-0.600697877351,
-0.000000000692,
--0.475931949057,
-0.879482108895,
--0.017437225552,
--0.505083864225,
-0.862894103158,
--0.109519556901,
--0.491963201198,
-0.863699991504,
--0.019470993726,
--0.451116798027,
-0.892252495060,
--0.037684283003,
--0.480527992700,
-0.876169357514,
--0.164014174390,
--0.472521914566,
-0.865922855025,
--0.019659393505,
--0.398316865736,
-0.917037176300,
--0.038992437454,
--0.426412776219,
-0.903687852136,
--0.057356573187,
--0.456067868101,
-0.888094771519,
--0.075148221129,
--0.485527217684,
-0.870985686306,
-0.000000000256,
--0.316641002868,
-0.948545452418,
--0.019703164800,
--0.344326355191,
-0.938643247681,
--0.039284329194,
--0.372422370397,
-0.927231535005,
--0.058475559104,
--0.401312724204,
-0.914072593605,
--0.076879585234,
--0.431202571884,
-0.898973787924,
--0.094819415468,
--0.460915748221,
-0.882363843033,
--0.271632020843,
--0.428754902264,
-0.861617826555,
--0.019706932107,
--0.289083197335,
-0.957101113700,
--0.039360948013,
--0.317484776960,
-0.947446110431,
--0.058838304270,
--0.346289116948,
-0.936280888107,
--0.077907510865,
--0.375737250957,
-0.923445687626,
--0.096319656975,
--0.405851334406,
-0.908849392386,
--0.114297538032,
--0.435812607099,
-0.892750493863,
--0.130198385834,
--0.466633719206,
-0.874815038980,
--0.000000000719,
--0.204044010104,
-0.978961716279,
--0.019697831168,
--0.232706641423,
-0.972347476206,
--0.039369527730,
--0.261466546513,
-0.964409293475,
--0.058948178756,
--0.290449262399,
-0.955072949147,
--0.078316794670,
--0.319800326996,
-0.944242675654,
--0.097280928771,
--0.349673758507,
-0.931807213703,
--0.115685441369,
--0.380001185903,
-0.917723257506,
--0.133670273785,
--0.410200534195,
-0.902146207470,
--0.150180213154,
--0.440959795116,
-0.884873077152,
--0.000000002691,
--0.146353307429,
-0.989232383924,
--0.019688055771,
--0.175377500770,
-0.984304380100,
--0.039357864070,
--0.204456782556,
-0.978084036575,
--0.058970355447,
--0.233674348299,
-0.970525010562,
--0.078459572239,
--0.263124478738,
-0.961566224559,
--0.097719921834,
--0.292907544136,
-0.951134053362,
--0.116589036680,
--0.323123020940,
-0.939147757206,
--0.134973426781,
--0.353652818509,
-0.925587304377,
--0.152950129784,
--0.384079218133,
-0.910543470680,
--0.169804626320,
--0.414870075375,
-0.893895524901,
--0.184667135868,
--0.446279695426,
-0.875632618386,
--0.000000003740,
--0.088042912258,
-0.996116682724,
--0.019684870484,
--0.117313956730,
-0.992899764040,
--0.039348477165,
--0.146628827637,
-0.988408662574,
--0.058968053940,
--0.176047039993,
-0.982613967092,
--0.078504376625,
--0.205634077507,
-0.975475109379,
--0.097895326512,
--0.235458696468,
-0.966941418755,
--0.117047594982,
--0.265588960246,
-0.956954734930,
--0.135825384888,
--0.296088345249,
-0.945453942097,
--0.154177066117,
--0.326809463320,
-0.932429625746,
--0.172133867007,
--0.357451614055,
-0.917931520016,
--0.189196216957,
--0.388327576942,
-0.901890505813,
--0.204709273173,
--0.419675659885,
-0.884288671180,
-0.000000000087,
--0.029376741022,
-0.999568410409,
--0.019694483889,
--0.058762963205,
-0.998077673059,
--0.039356004853,
--0.088201583622,
-0.995324864317,
--0.058973203238,
--0.117738290124,
-0.991292013656,
--0.078523818288,
--0.147421224225,
-0.985951820633,
--0.097970471263,
--0.177299790028,
-0.979268385692,
--0.117256069050,
--0.207422447354,
-0.971198714273,
--0.136298539866,
--0.237833922391,
-0.961695239351,
--0.154983699593,
--0.268572826219,
-0.950709571782,
--0.173289014429,
--0.299474031489,
-0.938235696369,
--0.191214113498,
--0.330320463271,
-0.924297330053,
--0.208402726185,
--0.361313279637,
-0.908856984171,
--0.224342094899,
--0.392668322157,
-0.891898095766,
--0.238587557852,
--0.424358862210,
-0.873496155288,
--0.493811020516,
--0.293008369884,
-0.818716538977,
--0.039393486630,
--0.029428228917,
-0.998790334632,
--0.059008988066,
--0.058968812703,
-0.996514233945,
--0.078558789119,
--0.088660263368,
-0.992959150394,
--0.098023120043,
--0.118539384056,
-0.988099125779,
--0.117367516186,
--0.148641426540,
-0.981901518718,
--0.136540570086,
--0.178998184851,
-0.974328652222,
--0.155469694342,
--0.209636938687,
-0.965340110054,
--0.174057502784,
--0.240578733861,
-0.954895731762,
--0.192301592617,
--0.271648405172,
-0.942988463049,
--0.210182205485,
--0.302687379130,
-0.929625618738,
--0.227441686350,
--0.333816260608,
-0.914787944534,
--0.243665594511,
--0.365227414984,
-0.898463139698,
--0.258507913144,
--0.396901516376,
-0.880705878907,
--0.445412663918,
--0.321871270594,
-0.835467799492,
--0.463413972047,
--0.291487300666,
-0.836828921621,
--0.480874088680,
--0.260690726632,
-0.837138253746,
--0.078642309025,
--0.029577371671,
-0.996464031622,
--0.098103560514,
--0.059359642752,
-0.993404310554,
--0.117463757275,
--0.089372603636,
-0.989047422243,
--0.136692804730,
--0.119638525039,
-0.983362446131,
--0.155744443703,
--0.150175402964,
-0.976315019141,
--0.174555336751,
--0.180995591764,
-0.967869324947,
--0.193039492566,
--0.212107740505,
-0.957990637077,
--0.211206610157,
--0.243333597183,
-0.946668119411,
--0.229028851813,
--0.274552897957,
-0.933898544415,
--0.246317367191,
--0.305829296149,
-0.919671787235,
--0.262729299413,
--0.337331694510,
-0.903980443986,
--0.277993142192,
--0.369037874384,
-0.886865750925,
--0.291823142842,
--0.400889331264,
-0.868404857990,
--0.395457932296,
--0.349554481184,
-0.849367228276,
--0.414144178243,
--0.319833413713,
-0.852168520364,
--0.432315562263,
--0.289684964446,
-0.853923811589,
--0.450001607863,
--0.259090041364,
-0.854617401757,
--0.467235643358,
--0.228072714827,
-0.854209394896,
--0.117608045472,
--0.029809994679,
-0.992612568859,
--0.136842461347,
--0.059900253764,
-0.988780107188,
--0.155941265167,
--0.090277328605,
-0.983632210614,
--0.174860659307,
--0.120947565159,
-0.977136344790,
--0.193545243357,
--0.151910415236,
-0.969259234940,
--0.211920775522,
--0.183161624017,
-0.959969480968,
--0.229994865237,
--0.214530392685,
-0.949251848868,
--0.247744065310,
--0.245917026336,
-0.937095349611,
--0.265027429297,
--0.277347342105,
-0.923492779370,
--0.281556951503,
--0.308965977486,
-0.908441361793,
--0.297116903465,
--0.340744049693,
-0.891972554664,
--0.311470757091,
--0.372631798875,
-0.874146160516,
--0.344184862619,
--0.375927556003,
-0.860357630861,
--0.363419770045,
--0.346915901187,
-0.864624443469,
--0.382170005262,
--0.317484897866,
-0.867841821247,
--0.400475913266,
--0.287615987240,
-0.869997751019,
--0.418363525069,
--0.257291187727,
-0.871075889696,
--0.435846605441,
--0.226492243422,
-0.871056255471,
--0.452951760909,
--0.195271488757,
-0.869887204164,
--0.156162690230,
--0.030108866347,
-0.987272338490,
--0.175105803259,
--0.060549560681,
-0.982685966302,
--0.193879094531,
--0.091312151634,
-0.976766598358,
--0.212427087515,
--0.122383778116,
-0.969482822614,
--0.230687537400,
--0.153743470000,
-0.960804977881,
--0.248655473843,
--0.185240344280,
-0.950713663612,
--0.266316748126,
--0.216780185217,
-0.939192068197,
--0.283565584654,
--0.248367631212,
-0.926231115309,
--0.300158393592,
--0.280119561262,
-0.911832205044,
--0.315921105180,
--0.312000690982,
-0.896018651663,
--0.330659802180,
--0.343961774652,
-0.878836954617,
--0.349444438079,
--0.314859376408,
-0.882469352320,
--0.367858374127,
--0.285306743367,
-0.885031230395,
--0.385921457100,
--0.255288585759,
-0.886505706090,
--0.403643081381,
--0.224792107116,
-0.886871338714,
--0.421020657075,
--0.193800093972,
-0.886105597484,
--0.438081058513,
--0.162398635376,
-0.884144597563,
--0.194189680557,
--0.030458454429,
-0.980491025211,
--0.212793450024,
--0.061270255346,
-0.975174293876,
--0.231188559060,
--0.092414857302,
-0.968509857621,
--0.249316664217,
--0.123861367840,
-0.960468407862,
--0.267173598055,
--0.155469469146,
-0.951024454294,
--0.284735036464,
--0.187146661913,
-0.940160670282,
--0.301922737031,
--0.218891391377,
-0.927862715947,
--0.318535373208,
--0.250785732189,
-0.914134417110,
--0.334428759902,
--0.282792653065,
-0.898991501585,
--0.352651221277,
--0.253108167245,
-0.900873671391,
--0.370591708334,
--0.222938599190,
-0.901643037296,
--0.388246688098,
--0.192277873829,
-0.901273392715,
--0.405596191232,
--0.161114866532,
-0.899740923511,
--0.422683922704,
--0.129559923295,
-0.896968521055,
--0.231590728918,
--0.030830884021,
-0.972324632450,
--0.249817708512,
--0.062018386482,
-0.966304730534,
--0.267795649364,
--0.093532693308,
-0.958924984274,
--0.285527288979,
--0.125233952746,
-0.950152947861,
--0.302985162353,
--0.157030324571,
-0.939968865739,
--0.320087271301,
--0.188921433667,
-0.928360291402,
--0.336684617897,
--0.220960272596,
-0.915325093071,
--0.354598278240,
--0.190642070625,
-0.915377333113,
--0.372261671910,
--0.159827039411,
-0.914262853396,
--0.389654133093,
--0.128519443158,
-0.911949784415,
--0.406815601908,
--0.096842521471,
-0.908362588441,
--0.268289711562,
--0.031208162206,
-0.962832634097,
--0.286108058864,
--0.062768862639,
-0.956139241186,
--0.303698140129,
--0.094543065012,
-0.948065951577,
--0.321039542739,
--0.126439229612,
-0.938587626817,
--0.338048541845,
--0.158457960946,
-0.927692976135,
--0.355780514571,
--0.127507003618,
-0.925830540369,
--0.373262300183,
--0.096084793122,
-0.922736673051,
--0.390526636448,
--0.064318803462,
-0.918342004781,
--0.304225512844,
--0.031583051379,
-0.952076335280,
--0.321666096127,
--0.063407155387,
-0.944727714873,
--0.338876288061,
--0.095381422371,
-0.935983571254,
--0.356476085922,
--0.063875683064,
-0.932118392308,
--0.373865219175,
--0.032052995666,
-0.926929017434,
--0.339403642791,
--0.031848062368,
-0.940101520148,
--0.000000000692,
-0.475931949057,
-0.879482108895,
-0.017437225552,
-0.505083864225,
-0.862894103158,
-0.109519556901,
-0.491963201198,
-0.863699991504,
-0.019470993726,
-0.451116798027,
-0.892252495060,
-0.037684283003,
-0.480527992700,
-0.876169357514,
-0.164014174390,
-0.472521914566,
-0.865922855025,
-0.019659393505,
-0.398316865736,
-0.917037176300,
-0.038992437454,
-0.426412776219,
-0.903687852136,
-0.057356573187,
-0.456067868101,
-0.888094771519,
-0.075148221129,
-0.485527217684,
-0.870985686306,
--0.000000000256,
-0.316641002868,
-0.948545452418,
-0.019703164800,
-0.344326355191,
-0.938643247681,
-0.039284329194,
-0.372422370397,
-0.927231535005,
-0.058475559104,
-0.401312724204,
-0.914072593605,
-0.076879585234,
-0.431202571884,
-0.898973787924,
-0.094819415468,
-0.460915748221,
-0.882363843033,
-0.271632020843,
-0.428754902264,
-0.861617826555,
-0.019706932107,
-0.289083197335,
-0.957101113700,
-0.039360948013,
-0.317484776960,
-0.947446110431,
-0.058838304270,
-0.346289116948,
-0.936280888107,
-0.077907510865,
-0.375737250957,
-0.923445687626,
-0.096319656975,
-0.405851334406,
-0.908849392386,
-0.114297538032,
-0.435812607099,
-0.892750493863,
-0.130198385834,
-0.466633719206,
-0.874815038980,
-0.000000000719,
-0.204044010104,
-0.978961716279,
-0.019697831168,
-0.232706641423,
-0.972347476206,
-0.039369527730,
-0.261466546513,
-0.964409293475,
-0.058948178756,
-0.290449262399,
-0.955072949147,
-0.078316794670,
-0.319800326996,
-0.944242675654,
-0.097280928771,
-0.349673758507,
-0.931807213703,
-0.115685441369,
-0.380001185903,
-0.917723257506,
-0.133670273785,
-0.410200534195,
-0.902146207470,
-0.150180213154,
-0.440959795116,
-0.884873077152,
-0.000000002691,
-0.146353307429,
-0.989232383924,
-0.019688055771,
-0.175377500770,
-0.984304380100,
-0.039357864070,
-0.204456782556,
-0.978084036575,
-0.058970355447,
-0.233674348299,
-0.970525010562,
-0.078459572239,
-0.263124478738,
-0.961566224559,
-0.097719921834,
-0.292907544136,
-0.951134053362,
-0.116589036680,
-0.323123020940,
-0.939147757206,
-0.134973426781,
-0.353652818509,
-0.925587304377,
-0.152950129784,
-0.384079218133,
-0.910543470680,
-0.169804626320,
-0.414870075375,
-0.893895524901,
-0.184667135868,
-0.446279695426,
-0.875632618386,
-0.000000003740,
-0.088042912258,
-0.996116682724,
-0.019684870484,
-0.117313956730,
-0.992899764040,
-0.039348477165,
-0.146628827637,
-0.988408662574,
-0.058968053940,
-0.176047039993,
-0.982613967092,
-0.078504376625,
-0.205634077507,
-0.975475109379,
-0.097895326512,
-0.235458696468,
-0.966941418755,
-0.117047594982,
-0.265588960246,
-0.956954734930,
-0.135825384888,
-0.296088345249,
-0.945453942097,
-0.154177066117,
-0.326809463320,
-0.932429625746,
-0.172133867007,
-0.357451614055,
-0.917931520016,
-0.189196216957,
-0.388327576942,
-0.901890505813,
-0.204709273173,
-0.419675659885,
-0.884288671180,
--0.000000000087,
-0.029376741022,
-0.999568410409,
-0.019694483889,
-0.058762963205,
-0.998077673059,
-0.039356004853,
-0.088201583622,
-0.995324864317,
-0.058973203238,
-0.117738290124,
-0.991292013656,
-0.078523818288,
-0.147421224225,
-0.985951820633,
-0.097970471263,
-0.177299790028,
-0.979268385692,
-0.117256069050,
-0.207422447354,
-0.971198714273,
-0.136298539866,
-0.237833922391,
-0.961695239351,
-0.154983699593,
-0.268572826219,
-0.950709571782,
-0.173289014429,
-0.299474031489,
-0.938235696369,
-0.191214113498,
-0.330320463271,
-0.924297330053,
-0.208402726185,
-0.361313279637,
-0.908856984171,
-0.224342094899,
-0.392668322157,
-0.891898095766,
-0.238587557852,
-0.424358862210,
-0.873496155288,
-0.493811020516,
-0.293008369884,
-0.818716538977,
-0.039393486630,
-0.029428228917,
-0.998790334632,
-0.059008988066,
-0.058968812703,
-0.996514233945,
-0.078558789119,
-0.088660263368,
-0.992959150394,
-0.098023120043,
-0.118539384056,
-0.988099125779,
-0.117367516186,
-0.148641426540,
-0.981901518718,
-0.136540570086,
-0.178998184851,
-0.974328652222,
-0.155469694342,
-0.209636938687,
-0.965340110054,
-0.174057502784,
-0.240578733861,
-0.954895731762,
-0.192301592617,
-0.271648405172,
-0.942988463049,
-0.210182205485,
-0.302687379130,
-0.929625618738,
-0.227441686350,
-0.333816260608,
-0.914787944534,
-0.243665594511,
-0.365227414984,
-0.898463139698,
-0.258507913144,
-0.396901516376,
-0.880705878907,
-0.445412663918,
-0.321871270594,
-0.835467799492,
-0.463413972047,
-0.291487300666,
-0.836828921621,
-0.480874088680,
-0.260690726632,
-0.837138253746,
-0.078642309025,
-0.029577371671,
-0.996464031622,
-0.098103560514,
-0.059359642752,
-0.993404310554,
-0.117463757275,
-0.089372603636,
-0.989047422243,
-0.136692804730,
-0.119638525039,
-0.983362446131,
-0.155744443703,
-0.150175402964,
-0.976315019141,
-0.174555336751,
-0.180995591764,
-0.967869324947,
-0.193039492566,
-0.212107740505,
-0.957990637077,
-0.211206610157,
-0.243333597183,
-0.946668119411,
-0.229028851813,
-0.274552897957,
-0.933898544415,
-0.246317367191,
-0.305829296149,
-0.919671787235,
-0.262729299413,
-0.337331694510,
-0.903980443986,
-0.277993142192,
-0.369037874384,
-0.886865750925,
-0.291823142842,
-0.400889331264,
-0.868404857990,
-0.395457932296,
-0.349554481184,
-0.849367228276,
-0.414144178243,
-0.319833413713,
-0.852168520364,
-0.432315562263,
-0.289684964446,
-0.853923811589,
-0.450001607863,
-0.259090041364,
-0.854617401757,
-0.467235643358,
-0.228072714827,
-0.854209394896,
-0.117608045472,
-0.029809994679,
-0.992612568859,
-0.136842461347,
-0.059900253764,
-0.988780107188,
-0.155941265167,
-0.090277328605,
-0.983632210614,
-0.174860659307,
-0.120947565159,
-0.977136344790,
-0.193545243357,
-0.151910415236,
-0.969259234940,
-0.211920775522,
-0.183161624017,
-0.959969480968,
-0.229994865237,
-0.214530392685,
-0.949251848868,
-0.247744065310,
-0.245917026336,
-0.937095349611,
-0.265027429297,
-0.277347342105,
-0.923492779370,
-0.281556951503,
-0.308965977486,
-0.908441361793,
-0.297116903465,
-0.340744049693,
-0.891972554664,
-0.311470757091,
-0.372631798875,
-0.874146160516,
-0.344184862619,
-0.375927556003,
-0.860357630861,
-0.363419770045,
-0.346915901187,
-0.864624443469,
-0.382170005262,
-0.317484897866,
-0.867841821247,
-0.400475913266,
-0.287615987240,
-0.869997751019,
-0.418363525069,
-0.257291187727,
-0.871075889696,
-0.435846605441,
-0.226492243422,
-0.871056255471,
-0.452951760909,
-0.195271488757,
-0.869887204164,
-0.156162690230,
-0.030108866347,
-0.987272338490,
-0.175105803259,
-0.060549560681,
-0.982685966302,
-0.193879094531,
-0.091312151634,
-0.976766598358,
-0.212427087515,
-0.122383778116,
-0.969482822614,
-0.230687537400,
-0.153743470000,
-0.960804977881,
-0.248655473843,
-0.185240344280,
-0.950713663612,
-0.266316748126,
-0.216780185217,
-0.939192068197,
-0.283565584654,
-0.248367631212,
-0.926231115309,
-0.300158393592,
-0.280119561262,
-0.911832205044,
-0.315921105180,
-0.312000690982,
-0.896018651663,
-0.330659802180,
-0.343961774652,
-0.878836954617,
-0.349444438079,
-0.314859376408,
-0.882469352320,
-0.367858374127,
-0.285306743367,
-0.885031230395,
-0.385921457100,
-0.255288585759,
-0.886505706090,
-0.403643081381,
-0.224792107116,
-0.886871338714,
-0.421020657075,
-0.193800093972,
-0.886105597484,
-0.438081058513,
-0.162398635376,
-0.884144597563,
-0.194189680557,
-0.030458454429,
-0.980491025211,
-0.212793450024,
-0.061270255346,
-0.975174293876,
-0.231188559060,
-0.092414857302,
-0.968509857621,
-0.249316664217,
-0.123861367840,
-0.960468407862,
-0.267173598055,
-0.155469469146,
-0.951024454294,
-0.284735036464,
-0.187146661913,
-0.940160670282,
-0.301922737031,
-0.218891391377,
-0.927862715947,
-0.318535373208,
-0.250785732189,
-0.914134417110,
-0.334428759902,
-0.282792653065,
-0.898991501585,
-0.352651221277,
-0.253108167245,
-0.900873671391,
-0.370591708334,
-0.222938599190,
-0.901643037296,
-0.388246688098,
-0.192277873829,
-0.901273392715,
-0.405596191232,
-0.161114866532,
-0.899740923511,
-0.422683922704,
-0.129559923295,
-0.896968521055,
-0.231590728918,
-0.030830884021,
-0.972324632450,
-0.249817708512,
-0.062018386482,
-0.966304730534,
-0.267795649364,
-0.093532693308,
-0.958924984274,
-0.285527288979,
-0.125233952746,
-0.950152947861,
-0.302985162353,
-0.157030324571,
-0.939968865739,
-0.320087271301,
-0.188921433667,
-0.928360291402,
-0.336684617897,
-0.220960272596,
-0.915325093071,
-0.354598278240,
-0.190642070625,
-0.915377333113,
-0.372261671910,
-0.159827039411,
-0.914262853396,
-0.389654133093,
-0.128519443158,
-0.911949784415,
-0.406815601908,
-0.096842521471,
-0.908362588441,
-0.268289711562,
-0.031208162206,
-0.962832634097,
-0.286108058864,
-0.062768862639,
-0.956139241186,
-0.303698140129,
-0.094543065012,
-0.948065951577,
-0.321039542739,
-0.126439229612,
-0.938587626817,
-0.338048541845,
-0.158457960946,
-0.927692976135,
-0.355780514571,
-0.127507003618,
-0.925830540369,
-0.373262300183,
-0.096084793122,
-0.922736673051,
-0.390526636448,
-0.064318803462,
-0.918342004781,
-0.304225512844,
-0.031583051379,
-0.952076335280,
-0.321666096127,
-0.063407155387,
-0.944727714873,
-0.338876288061,
-0.095381422371,
-0.935983571254,
-0.356476085922,
-0.063875683064,
-0.932118392308,
-0.373865219175,
-0.032052995666,
-0.926929017434,
-0.339403642791,
-0.031848062368,
-0.940101520148,
--0.509740892985,
-0.858587032424,
-0.054704019708,
--0.505083862528,
-0.862894104207,
-0.017437222806,
--0.424276393266,
-0.905532739396,
-0.000000001077,
--0.485527218439,
-0.870985685678,
-0.075148223519,
--0.480527992402,
-0.876169357698,
-0.037684282522,
--0.371155580903,
-0.928570694543,
-0.000000001209,
--0.466633721374,
-0.874815037512,
-0.130198387931,
--0.460915747478,
-0.882363843185,
-0.094819417663,
--0.456067868618,
-0.888094771199,
-0.057356574024,
--0.451116799777,
-0.892252494139,
-0.019470995389,
--0.451437166376,
-0.865236841817,
-0.218104773852,
--0.446279697618,
-0.875632616795,
-0.184667138114,
--0.440959797305,
-0.884873075674,
-0.150180215433,
--0.435812606548,
-0.892750493708,
-0.114297541343,
--0.431202572933,
-0.898973787276,
-0.076879586932,
--0.426412778319,
-0.903687851145,
-0.038992437455,
--0.260877081116,
-0.965372025982,
-0.000000000267,
--0.424358865154,
-0.873496153136,
-0.238587560490,
--0.419675662001,
-0.884288670135,
-0.204709273349,
--0.414870076333,
-0.893895524226,
-0.169804627536,
--0.410200536058,
-0.902146206069,
-0.133670277522,
--0.405851335393,
-0.908849391777,
-0.096319658571,
--0.401312727207,
-0.914072592245,
-0.058475559759,
--0.398316866803,
-0.917037175770,
-0.019659396641,
--0.404537811643,
-0.855049732395,
-0.324405786143,
--0.400889335129,
-0.868404855176,
-0.291823145905,
--0.396901517479,
-0.880705878152,
-0.258507914019,
--0.392668324953,
-0.891898094191,
-0.224342096266,
--0.388327579256,
-0.901890504602,
-0.189196217983,
--0.384079219164,
-0.910543469618,
-0.152950133514,
--0.380001187585,
-0.917723256467,
-0.115685444091,
--0.375737253482,
-0.923445686314,
-0.077907514227,
--0.372422371603,
-0.927231534385,
-0.039284332407,
--0.378866269556,
-0.845531470505,
-0.376213878238,
--0.375927559769,
-0.860357627193,
-0.344184867676,
--0.372631799612,
-0.874146159976,
-0.311470757725,
--0.369037876158,
-0.886865749507,
-0.277993144360,
--0.365227416662,
-0.898463138571,
-0.243665596151,
--0.361313281033,
-0.908856982934,
-0.208402729158,
--0.357451615644,
-0.917931518893,
-0.172133869696,
--0.353652820029,
-0.925587303437,
-0.134973429242,
--0.349673761336,
-0.931807212378,
-0.097280931289,
--0.346289117662,
-0.936280887749,
-0.058838305758,
--0.344326356404,
-0.938643247168,
-0.019703168063,
--0.351838436445,
-0.833082082696,
-0.426830127955,
--0.349554484410,
-0.849367224368,
-0.395457937836,
--0.346915901212,
-0.864624443597,
-0.363419769717,
--0.343961776975,
-0.878836952425,
-0.330659805590,
--0.340744050319,
-0.891972553962,
-0.297116904854,
--0.337331696377,
-0.903980442276,
-0.262729302900,
--0.333816262573,
-0.914787943131,
-0.227441689107,
--0.330320463490,
-0.924297329518,
-0.191214115708,
--0.326809465443,
-0.932429624434,
-0.154177069552,
--0.323123022669,
-0.939147756278,
-0.116589039358,
--0.319800327043,
-0.944242675406,
-0.078316797465,
--0.317484776367,
-0.947446110534,
-0.039360950301,
--0.323571996438,
-0.817745743233,
-0.476017922505,
--0.321871272122,
-0.835467795426,
-0.445412670440,
--0.319833413052,
-0.852168520853,
-0.414144177747,
--0.317484900037,
-0.867841819592,
-0.382170007216,
--0.314859376865,
-0.882469351288,
-0.349444440272,
--0.312000692048,
-0.896018649928,
-0.315921109048,
--0.308965978748,
-0.908441360534,
-0.281556954182,
--0.305829298505,
-0.919671785835,
-0.246317369496,
--0.302687380683,
-0.929625617612,
-0.210182208227,
--0.299474033040,
-0.938235695411,
-0.173289016939,
--0.296088347093,
-0.945453941358,
-0.135825386016,
--0.292907546226,
-0.951134052444,
-0.097719924500,
--0.290449262594,
-0.955072948874,
-0.058948182227,
--0.289083198661,
-0.957101113211,
-0.019706936380,
--0.000000001455,
-0.999805669655,
-0.019713521409,
--0.291487301526,
-0.836828920699,
-0.463413973171,
--0.289684965611,
-0.853923809695,
-0.432315565225,
--0.287615988421,
-0.869997750055,
-0.400475914512,
--0.285306744065,
-0.885031229079,
-0.367858376750,
--0.282792654174,
-0.898991500407,
-0.334428762131,
--0.280119562447,
-0.911832203878,
-0.300158396027,
--0.277347343869,
-0.923492778259,
-0.265027431319,
--0.274552898150,
-0.933898543492,
-0.229028855343,
--0.271648406695,
-0.942988462108,
-0.192301595082,
--0.268572828009,
-0.950709570841,
-0.154983702260,
--0.265588961928,
-0.956954734078,
-0.117047598125,
--0.263124479574,
-0.961566224132,
-0.078459574667,
--0.261466546902,
-0.964409293307,
-0.039369529270,
--0.058762968974,
-0.998077672616,
-0.019694489174,
--0.029428229681,
-0.998790334550,
-0.039393488134,
--0.000000000468,
-0.998253983067,
-0.059067633195,
--0.259090041412,
-0.854617400873,
-0.450001609514,
--0.257291187958,
-0.871075888171,
-0.418363528103,
--0.255288587675,
-0.886505704830,
-0.385921458728,
--0.253108167969,
-0.900873670335,
-0.352651223456,
--0.250785732525,
-0.914134415853,
-0.318535376552,
--0.248367631734,
-0.926231114354,
-0.283565587315,
--0.245917027490,
-0.937095348585,
-0.247744068043,
--0.243333598581,
-0.946668118546,
-0.211206612419,
--0.240578736906,
-0.954895730684,
-0.174057504493,
--0.237833923510,
-0.961695238604,
-0.136298543183,
--0.235458698884,
-0.966941417819,
-0.097895329955,
--0.233674349604,
-0.970525010076,
-0.058970358261,
--0.232706642837,
-0.972347475757,
-0.019697836648,
--0.117313960807,
-0.992899763434,
-0.019684876760,
--0.088201583401,
-0.995324864374,
-0.039356003921,
--0.058968815102,
-0.996514233637,
-0.059008990871,
--0.029577373257,
-0.996464031497,
-0.078642310016,
--0.000000001337,
-0.995166083739,
-0.098206241025,
--0.226492242485,
-0.871056254731,
-0.435846607406,
--0.224792106921,
-0.886871337469,
-0.403643084224,
--0.222938599952,
-0.901643035931,
-0.370591711198,
--0.220960273914,
-0.915325091472,
-0.336684621379,
--0.218891392113,
-0.927862714630,
-0.301922740544,
--0.216780186850,
-0.939192066484,
-0.266316752839,
--0.214530394989,
-0.949251847444,
-0.229994868965,
--0.212107742457,
-0.957990636184,
-0.193039494857,
--0.209636939783,
-0.965340109396,
-0.155469696949,
--0.207422449280,
-0.971198713562,
-0.117256071528,
--0.205634078535,
-0.975475109059,
-0.078504377911,
--0.204456782867,
-0.978084036467,
-0.039357865132,
--0.175377504113,
-0.984304379375,
-0.019688062214,
--0.146628827319,
-0.988408662627,
-0.039348477020,
--0.117738291131,
-0.991292013347,
-0.058973206426,
--0.088660264083,
-0.992959150186,
-0.078558790941,
--0.059359645562,
-0.993404310200,
-0.098103562401,
--0.029809996965,
-0.992612568765,
-0.117608045691,
--0.000000001447,
-0.990571620355,
-0.136995857407,
--0.193800093560,
-0.886105596412,
-0.421020659521,
--0.192277873411,
-0.901273391754,
-0.388246690537,
--0.190642071917,
-0.915377331523,
-0.354598281650,
--0.188921433136,
-0.928360290281,
-0.320087274868,
--0.187146663299,
-0.940160669090,
-0.284735039489,
--0.185240346897,
-0.950713661995,
-0.248655478078,
--0.183161627543,
-0.959969479493,
-0.211920779157,
--0.180995593950,
-0.967869324228,
-0.174555338473,
--0.178998186587,
-0.974328651581,
-0.136540572380,
--0.177299793160,
-0.979268384833,
-0.097970474188,
--0.176047042267,
-0.982613966443,
-0.058968057970,
--0.147421226090,
-0.985951820230,
-0.078523819851,
--0.118539386236,
-0.988099125316,
-0.098023122075,
--0.089372604384,
-0.989047421857,
-0.117463759958,
--0.059900256546,
-0.988780106834,
-0.136842462690,
--0.030108868862,
-0.987272338262,
-0.156162691188,
--0.000000002569,
-0.984512472364,
-0.175314550905,
--0.161114865134,
-0.899740922547,
-0.405596193926,
--0.159827039598,
-0.914262851387,
-0.372261676764,
--0.158457960691,
-0.927692975005,
-0.338048545066,
--0.157030326177,
-0.939968864238,
-0.302985166178,
--0.155469471741,
-0.951024452690,
-0.267173602254,
--0.153743472123,
-0.960804976905,
-0.230687540052,
--0.151910418116,
-0.969259234022,
-0.193545245697,
--0.150175405890,
-0.976315018382,
-0.155744445637,
--0.148641428153,
-0.981901518214,
-0.117367518361,
--0.119638526767,
-0.983362445673,
-0.136692806518,
--0.090277330963,
-0.983632210052,
-0.155941267352,
--0.060549563160,
-0.982685965989,
-0.175105804155,
--0.030458457605,
-0.980491025076,
-0.194189680741,
--0.000000001356,
-0.977040956393,
-0.213051565428,
--0.128519442053,
-0.911949783275,
-0.389654136125,
--0.127507005039,
-0.925830538389,
-0.355780519214,
--0.126439231770,
-0.938587625052,
-0.321039547048,
--0.125233955376,
-0.950152946235,
-0.285527293233,
--0.123861370596,
-0.960468406667,
-0.249316667449,
--0.122383781614,
-0.969482821903,
-0.212427088748,
--0.120947567812,
-0.977136343935,
-0.174860662249,
--0.091312154238,
-0.976766597540,
-0.193879097426,
--0.061270259801,
-0.975174293017,
-0.212793452680,
--0.030830887379,
-0.972324632198,
-0.231590729531,
--0.000000002098,
-0.968214556970,
-0.250121114006,
--0.096084791708,
-0.922736671989,
-0.373262303172,
--0.095381423987,
-0.935983569813,
-0.338876291584,
--0.094543066807,
-0.948065950468,
-0.303698143033,
--0.093532696260,
-0.958924982880,
-0.267795653324,
--0.092414860384,
-0.968509857004,
-0.231188560415,
--0.062018390139,
-0.966304729375,
-0.249817712086,
--0.031208165659,
-0.962832633898,
-0.268289711873,
--0.000000002214,
-0.958093210068,
-0.286456629914,
--0.063875683220,
-0.932118391216,
-0.356476088749,
--0.063407158365,
-0.944727713032,
-0.321666100946,
--0.062768865127,
-0.956139240091,
-0.286108061980,
--0.031583053926,
-0.952076334702,
-0.304225514390,
--0.000000000881,
-0.946738857652,
-0.322002384172,
--0.031848062377,
-0.940101520142,
-0.339403642805,
--0.824778089614,
-0.033808943928,
--0.564444911575,
--0.834680082291,
--0.000000001697,
--0.550735108946,
--0.796013181829,
--0.067686807932,
--0.601482759841,
--0.805070535623,
-0.034410420412,
--0.592180171602,
--0.815194907255,
--0.000000000297,
--0.579186725664,
--0.764556519406,
--0.101366333663,
--0.636536090912,
--0.774688614985,
-0.068316855638,
--0.628641676194,
--0.784769782823,
-0.034502971258,
--0.618826254245,
--0.795289885787,
-0.000000000517,
--0.606229327536,
--0.805070536065,
--0.034410417907,
--0.592180171147,
--0.730440678724,
-0.134796163508,
--0.669541939813,
--0.741798884035,
-0.101953342427,
--0.662827226065,
--0.752772268905,
-0.068537426908,
--0.654703392598,
--0.763635169224,
-0.034499882344,
--0.644725590032,
--0.774580004277,
-0.000000001049,
--0.632475941815,
--0.784769784026,
--0.034502969901,
--0.618826252795,
--0.693740004974,
--0.167877821148,
--0.700386923539,
--0.706333999354,
-0.135275667820,
--0.694832911607,
--0.718410433381,
-0.102190885040,
--0.688072287063,
--0.730112188692,
-0.068580959385,
--0.679877080018,
--0.741625920410,
-0.034463285101,
--0.669927814138,
--0.753000912020,
-0.000000000986,
--0.658019472734,
--0.763635170771,
--0.034499879892,
--0.644725588332,
--0.774688614614,
--0.068316852403,
--0.628641677003,
--0.654555929692,
-0.200493801539,
--0.728943598949,
--0.668350401135,
-0.168182693707,
--0.724584241369,
--0.681569673198,
-0.135434970966,
--0.719110665487,
--0.694298874835,
-0.102219062554,
--0.712390578021,
--0.706644016675,
-0.068527252260,
--0.704243032905,
--0.718734159752,
-0.034405460658,
--0.694433201887,
--0.730540278646,
-0.000000001682,
--0.682869607814,
--0.741625920758,
--0.034463280713,
--0.669927813978,
--0.752772268578,
--0.068537423514,
--0.654703393330,
--0.613018504024,
-0.232512962128,
--0.755080152148,
--0.627951624785,
-0.200550058999,
--0.751968370855,
--0.642288781130,
-0.168175017056,
--0.747784919126,
--0.656086182207,
-0.135363527859,
--0.742447059960,
--0.669409946022,
-0.102102937924,
--0.735843267438,
--0.682337091132,
-0.068405736897,
--0.727830165097,
--0.694957900126,
-0.034328594704,
--0.718230509404,
--0.707195709806,
-0.000000001520,
--0.707017841381,
--0.718734160601,
--0.034405456797,
--0.694433201200,
--0.730112188631,
--0.068580957714,
--0.679877080252,
--0.741798883751,
--0.101953339022,
--0.662827226906,
--0.569286552457,
-0.263795524187,
--0.778668570452,
--0.585275907180,
-0.232240527680,
--0.776863211754,
--0.600670196563,
-0.200287073575,
--0.774002844387,
--0.615509899917,
-0.167914736983,
--0.770033898090,
--0.629839831505,
-0.135109972812,
--0.764883704818,
--0.643709476732,
-0.101872999909,
--0.758458964912,
--0.657173653822,
-0.068227302327,
--0.750644938662,
--0.670295121994,
-0.034232118240,
--0.741304668481,
--0.682965889048,
-0.000000002123,
--0.730450268257,
--0.694957900233,
--0.034328591386,
--0.718230509459,
--0.706644015726,
--0.068527249899,
--0.704243034087,
--0.718410432245,
--0.102190883518,
--0.688072288475,
--0.523550487957,
-0.294195255416,
--0.799589918803,
--0.540493142185,
-0.263108308917,
--0.799150286886,
--0.556857337909,
-0.231631829430,
--0.797656944313,
--0.572674562413,
-0.199746609914,
--0.795075554518,
--0.587976991732,
-0.167438152639,
--0.791358024054,
--0.602798195510,
-0.134700902021,
--0.786441353493,
--0.617173524031,
-0.101543531393,
--0.780247238039,
--0.631140739601,
-0.067995376114,
--0.772682338120,
--0.644742169503,
-0.034114554464,
--0.763638482554,
--0.657848178636,
-0.000000001551,
--0.753150565202,
--0.670295122767,
--0.034232116178,
--0.741304667877,
--0.682337091540,
--0.068405733411,
--0.727830165042,
--0.694298873783,
--0.102219059564,
--0.712390579475,
--0.706333998862,
--0.135275663549,
--0.694832912939,
--0.493811022870,
--0.293008368430,
--0.818716538078,
--0.511029847788,
-0.262059072609,
--0.818641275000,
--0.527729108454,
-0.230716152908,
--0.817479079168,
--0.543931234092,
-0.198955725053,
--0.815202693842,
--0.559659129159,
-0.166767360008,
--0.811769860727,
--0.574935642409,
-0.134151227635,
--0.807126046669,
--0.589783543039,
-0.101121377597,
--0.801205241716,
--0.604227123412,
-0.067710405183,
--0.793930024853,
--0.618293423701,
-0.033974164289,
--0.785212708996,
--0.631837947640,
-0.000000001523,
--0.775100514722,
--0.644742169658,
--0.034114551121,
--0.763638482573,
--0.657173653786,
--0.068227298680,
--0.750644939025,
--0.669409945734,
--0.102102935410,
--0.735843268049,
--0.681569672953,
--0.135434969474,
--0.719110666000,
--0.540493144997,
--0.263108301620,
--0.799150287386,
--0.511029847900,
--0.262059070984,
--0.818641275450,
--0.480874089437,
--0.260690726163,
--0.837138253457,
--0.497858802177,
-0.229512669741,
--0.836337579883,
--0.514409447636,
-0.197931545206,
--0.834389611390,
--0.530529369073,
-0.165915984039,
--0.831270398120,
--0.546230423334,
-0.133469642930,
--0.826932995496,
--0.561524282822,
-0.100610329561,
--0.821320912547,
--0.576422606602,
-0.067372039971,
--0.814369686830,
--0.590941601458,
-0.033809286985,
--0.806005555676,
--0.604928643266,
-0.000000001398,
--0.796279684883,
--0.618293425097,
--0.033974161051,
--0.785212708037,
--0.631140739108,
--0.067995372639,
--0.772682338828,
--0.643709477154,
--0.101872995626,
--0.758458965129,
--0.656086182150,
--0.135363524780,
--0.742447060571,
--0.668350400361,
--0.168182688427,
--0.724584243308,
--0.585275908236,
--0.232240520377,
--0.776863213142,
--0.556857338047,
--0.231631830313,
--0.797656943961,
--0.527729109375,
--0.230716149344,
--0.817479079580,
--0.497858803090,
--0.229512668108,
--0.836337579787,
--0.467235645521,
--0.228072713490,
--0.854209394069,
--0.484080192001,
-0.196682247807,
--0.852632664815,
--0.500563730748,
-0.164891853157,
--0.849850944709,
--0.516663497294,
-0.132661271348,
--0.845848578439,
--0.532381892663,
-0.100012708755,
--0.840575385347,
--0.547718955641,
-0.066980976877,
--0.833976914770,
--0.562678485934,
-0.033618562833,
--0.825991957407,
--0.577112335949,
-0.000000002304,
--0.816664773145,
--0.590941601881,
--0.033809283880,
--0.806005555495,
--0.604227123164,
--0.067710402321,
--0.793930025286,
--0.617173524468,
--0.101543528206,
--0.780247238108,
--0.629839831779,
--0.135109971159,
--0.764883704885,
--0.642288781000,
--0.168175016008,
--0.747784919474,
--0.627951625135,
--0.200550051891,
--0.751968372458,
--0.600670196378,
--0.200287073868,
--0.774002844455,
--0.572674562088,
--0.199746606736,
--0.795075555551,
--0.543931234004,
--0.198955723158,
--0.815202694364,
--0.514409449149,
--0.197931542165,
--0.834389611179,
--0.484080193736,
--0.196682246456,
--0.852632664142,
--0.452951763250,
--0.195271487311,
--0.869887203269,
--0.469737828632,
-0.163691227213,
--0.867497293647,
--0.486217937723,
-0.131728312730,
--0.863851705249,
--0.502344446580,
-0.099329920283,
--0.858943318227,
--0.518108387531,
-0.066537655019,
--0.852722955733,
--0.533497199498,
-0.033403193298,
--0.845141979081,
--0.548380651210,
-0.000000002618,
--0.836228833142,
--0.562678486925,
--0.033618557674,
--0.825991956941,
--0.576422607479,
--0.067372037262,
--0.814369686433,
--0.589783543415,
--0.101121374674,
--0.801205241808,
--0.602798196711,
--0.134700897822,
--0.786441353292,
--0.615509900187,
--0.167914732384,
--0.770033898877,
--0.587976992556,
--0.167438150318,
--0.791358023933,
--0.559659130062,
--0.166767357131,
--0.811769860695,
--0.530529368657,
--0.165915981375,
--0.831270398918,
--0.500563732406,
--0.164891850570,
--0.849850944234,
--0.469737830257,
--0.163691225109,
--0.867497293164,
--0.438081062670,
--0.162398632807,
--0.884144595975,
--0.454879008437,
-0.130656410705,
--0.880916562465,
--0.471399032414,
-0.098556784251,
--0.876395751084,
--0.487578925246,
-0.066043103389,
--0.870577452126,
--0.503397069236,
-0.033168958337,
--0.863418329020,
--0.518728487546,
-0.000000002595,
--0.854939036545,
--0.533497199907,
--0.033403189790,
--0.845141978961,
--0.547718956789,
--0.066980973260,
--0.833976914306,
--0.561524284212,
--0.100610326299,
--0.821320911996,
--0.574935642789,
--0.134151224913,
--0.807126046851,
--0.546230423950,
--0.133469640478,
--0.826932995485,
--0.516663498245,
--0.132661268227,
--0.845848578348,
--0.486217939296,
--0.131728310669,
--0.863851704678,
--0.454879010882,
--0.130656408926,
--0.880916561466,
--0.422683924898,
--0.129559921939,
--0.896968520217,
--0.439539554374,
-0.097688558032,
--0.892895249047,
--0.456128376468,
-0.065488618557,
--0.887501067616,
--0.472378623880,
-0.032906538462,
--0.880781241528,
--0.488160085323,
-0.000000002630,
--0.872754106893,
--0.503397069870,
--0.033168953976,
--0.863418328818,
--0.518108389624,
--0.066537652053,
--0.852722954693,
--0.532381893473,
--0.100012704784,
--0.840575385307,
--0.502344447383,
--0.099329916387,
--0.858943318208,
--0.471399034768,
--0.098556779610,
--0.876395750340,
--0.439539556776,
--0.097688555779,
--0.892895248111,
--0.406815605302,
--0.096842519373,
--0.908362587145,
--0.423758170348,
-0.064876629502,
--0.903448967019,
--0.440438444769,
-0.032612561347,
--0.897190279267,
--0.456672035624,
-0.000000001795,
--0.889635122890,
--0.472378624347,
--0.032906533352,
--0.880781241468,
--0.487578927012,
--0.066043100561,
--0.870577451352,
--0.456128377743,
--0.065488613479,
--0.887501067336,
--0.423758172946,
--0.064876627463,
--0.903448965947,
--0.390526640030,
--0.064318801248,
--0.918342003413,
--0.407578539349,
-0.032292631841,
--0.912598991995,
--0.424261033492,
-0.000000002979,
--0.905539935873,
--0.440438445271,
--0.032612557244,
--0.897190279170,
--0.407578540642,
--0.032292629138,
--0.912598991513,
--0.373865220601,
--0.032052994785,
--0.926929016889,
--0.390934890192,
-0.000000000009,
--0.920418335123,
--0.858587033115,
--0.054704019281,
-0.509740891866,
--0.845456878655,
--0.028214020866,
-0.533297886141,
--0.796013182495,
--0.067686809675,
-0.601482758764,
--0.851514691953,
--0.087181959437,
-0.517031948082,
--0.838485074695,
--0.060974450259,
-0.541502443142,
--0.764556520153,
--0.101366335619,
-0.636536089703,
--0.855155644007,
--0.142348561315,
-0.498443288263,
--0.843371405732,
--0.118918069313,
-0.524006836582,
--0.830738198012,
--0.092804885731,
-0.548872753512,
--0.817104273010,
--0.065915150241,
-0.572709175758,
--0.865236842074,
--0.218104773694,
-0.451437165961,
--0.855929451995,
--0.196844363646,
-0.478160087951,
--0.845588746481,
--0.174459266100,
-0.504523177166,
--0.834274934605,
--0.150437424381,
-0.530428048689,
--0.822094202042,
--0.124393783647,
-0.555596354883,
--0.808868435677,
--0.097594059007,
-0.579833815340,
--0.693740005139,
--0.167877821581,
-0.700386923272,
--0.853789221030,
--0.250767114346,
-0.456245351117,
--0.844927722123,
--0.229035677050,
-0.483363013715,
--0.835057219956,
--0.206168699415,
-0.510072452482,
--0.824238695204,
--0.181819767216,
-0.536257536616,
--0.812529734802,
--0.155848480366,
-0.561699814163,
--0.799775054213,
--0.129115323093,
-0.586250028573,
--0.786838789936,
--0.100126424367,
-0.608982280362,
--0.855049731676,
--0.324405786587,
-0.404537812807,
--0.848707024008,
--0.303997075071,
-0.432761095464,
--0.841336350422,
--0.282839620277,
-0.460602751467,
--0.832949915435,
--0.260774074312,
-0.488048481755,
--0.823573709931,
--0.237598658979,
-0.515046814922,
--0.813262540847,
--0.213073053952,
-0.541483068373,
--0.802037815098,
--0.187182978860,
-0.567184163723,
--0.789775412530,
--0.160520286711,
-0.592020299751,
--0.777051321231,
--0.132100808574,
-0.615419060923,
--0.845531467814,
--0.376213879901,
-0.378866273910,
--0.840669571422,
--0.356352755315,
-0.407783503179,
--0.834788295906,
--0.335795255444,
-0.436314161401,
--0.827895394061,
--0.314438828355,
-0.464453915600,
--0.820003566332,
--0.292156278537,
-0.492177671287,
--0.811137061100,
--0.268796962230,
-0.519427435938,
--0.801342482213,
--0.244189857080,
-0.546096639708,
--0.790613876656,
--0.218391594571,
-0.572044412140,
--0.778857082594,
--0.191809310079,
-0.597152269911,
--0.766476261429,
--0.163783336271,
-0.621038774494,
--0.753976111300,
--0.133833734635,
-0.643124058843,
--0.833082078956,
--0.426830130267,
-0.351838442497,
--0.829682353884,
--0.407623856860,
-0.381405273918,
--0.825275966432,
--0.387738466010,
-0.410583074670,
--0.819868898485,
--0.367104067175,
-0.439374092501,
--0.813468177337,
--0.345635277874,
-0.467766799964,
--0.806085115764,
--0.323231942024,
-0.495729662012,
--0.797740348149,
--0.299781081107,
-0.523203249555,
--0.788471944630,
--0.275158820103,
-0.550090552773,
--0.778252558317,
--0.249463736698,
-0.576273198705,
--0.767013889272,
--0.222973619783,
-0.601641470101,
--0.755046458449,
--0.195246490087,
-0.625926236622,
--0.742736837361,
--0.165878238934,
-0.648711338174,
--0.817745743319,
--0.476017922451,
-0.323571996298,
--0.815773311537,
--0.457584530874,
-0.353737616446,
--0.812812516000,
--0.438467526408,
-0.383512766566,
--0.808868616354,
--0.418617451243,
-0.412905547302,
--0.803945533000,
--0.397974828901,
-0.441913583782,
--0.798048178665,
--0.376470190182,
-0.470520244446,
--0.791185291484,
--0.354025190242,
-0.498690283857,
--0.783373245969,
--0.330554499750,
-0.526364968624,
--0.774641918018,
--0.305967402278,
-0.553456274327,
--0.764946680982,
--0.280387517733,
-0.579861548264,
--0.754239827860,
--0.254002207286,
-0.605479281861,
--0.742731326260,
--0.226519892631,
-0.630110240541,
--0.730730853975,
--0.197599221982,
-0.653442397248,
--0.718513555359,
--0.167162156425,
-0.675125976559,
--0.505994649138,
--0.324905516107,
-0.799003016669,
--0.797435434069,
--0.487760486844,
-0.355227301829,
--0.794914821628,
--0.468785125491,
-0.385163513944,
--0.791438960936,
--0.449027916302,
-0.414726779331,
--0.787008109037,
--0.428439996620,
-0.443911483977,
--0.781623984221,
--0.406965876309,
-0.472697284538,
--0.775291633792,
--0.384545109183,
-0.501046845689,
--0.768023083918,
--0.361112986643,
-0.528902593534,
--0.759841040708,
--0.336602308061,
-0.556183853652,
--0.750686869491,
--0.311150515410,
-0.582798919640,
--0.740527365357,
--0.284883449080,
-0.608654780313,
--0.729513047729,
--0.257614290748,
-0.633597340900,
--0.717900629621,
--0.229053193964,
-0.657383693382,
--0.705901380163,
--0.199136205954,
-0.679741136730,
--0.552665008698,
--0.294974654495,
-0.779455798212,
--0.535376362503,
--0.325799073721,
-0.779247787315,
--0.517379894387,
--0.356264164309,
-0.778070620261,
--0.775975091849,
--0.498605229445,
-0.386335970368,
--0.772972327657,
--0.478994862918,
-0.416026083287,
--0.769041947555,
--0.458518053170,
-0.445348939393,
--0.764180865604,
--0.437132022797,
-0.474281772040,
--0.758389972150,
--0.414790736319,
-0.502785535995,
--0.751675777603,
--0.391446718345,
-0.530804099515,
--0.744055856019,
--0.367049035620,
-0.558261487633,
--0.735461508390,
--0.341739476145,
-0.585073072463,
--0.725866878871,
--0.315605119318,
-0.611155203544,
--0.715377871413,
--0.288531048127,
-0.636383795645,
--0.704212118406,
--0.260270966832,
-0.660563635174,
--0.692531867884,
--0.230779568776,
-0.683476702310,
--0.680524332915,
--0.200054457629,
-0.704886406660,
--0.597441831138,
--0.264091320040,
-0.757178336382,
--0.581180686131,
--0.295311182318,
-0.758300940040,
--0.564198671374,
--0.326194702215,
-0.758470088709,
--0.546462423634,
--0.356758598667,
-0.757695269771,
--0.527930440381,
--0.386973749375,
-0.756003153045,
--0.753448209260,
--0.508532376858,
-0.416786057409,
--0.750028876122,
--0.488216376440,
-0.446207860485,
--0.745701770764,
--0.466968713320,
-0.475256867241,
--0.740464432165,
--0.444754452126,
-0.503890763968,
--0.734317471273,
--0.421540279299,
-0.532054174226,
--0.727271290962,
--0.397290995034,
-0.559675204568,
--0.719256982207,
--0.372139512919,
-0.586669904180,
--0.710246570874,
--0.346153747729,
-0.612966060638,
--0.700312680099,
--0.319265656206,
-0.638460328337,
--0.689641762059,
--0.291267837325,
-0.662991166580,
--0.678358205594,
--0.262132722885,
-0.686379326973,
--0.666613279376,
--0.231857379516,
-0.708427054342,
--0.640119516756,
--0.232406005726,
-0.732280310243,
--0.624988892581,
--0.263954247091,
-0.734654367436,
--0.609122008085,
--0.295167259158,
-0.736102349125,
--0.592483236920,
--0.326066517015,
-0.736643903423,
--0.575040785130,
--0.356666440547,
-0.736286048777,
--0.556765963323,
--0.386976061735,
-0.735024618451,
--0.537619859446,
--0.416935440913,
-0.732891345862,
--0.729942906182,
--0.517534509858,
-0.446476634126,
--0.726167588495,
--0.496468028579,
-0.475605014712,
--0.721498236991,
--0.474422151778,
-0.504345036577,
--0.715933202766,
--0.451374435083,
-0.532635680865,
--0.709473131690,
--0.427307778383,
-0.560406939592,
--0.702058188152,
--0.402333012402,
-0.587573355064,
--0.693652731366,
--0.376513581272,
-0.614071177784,
--0.684303739574,
--0.349808507829,
-0.639814347960,
--0.674170257989,
--0.322048661629,
-0.664664669428,
--0.663347279653,
--0.293220454953,
-0.688470879104,
--0.651954164263,
--0.263327054430,
-0.711065840907,
--0.636507382151,
--0.294492359764,
-0.712834204081,
--0.620240751188,
--0.325372100332,
-0.713746738620,
--0.603125964757,
--0.355976337434,
-0.713806638960,
--0.585137025453,
--0.386307606307,
-0.713008481544,
--0.566251681186,
--0.416367767227,
-0.711334601976,
--0.546431413852,
--0.446063534893,
-0.708830045070,
--0.705551241990,
--0.525612016774,
-0.475320368540,
--0.701469401363,
--0.503775261462,
-0.504134074319,
--0.696504415944,
--0.480930932375,
-0.532528907061,
--0.690652200021,
--0.457071338626,
-0.560433162842,
--0.683850854635,
--0.432295966749,
-0.587765434291,
--0.676069940440,
--0.406663470374,
-0.614454438910,
--0.667336496990,
--0.380143759158,
-0.640431668609,
--0.657779645175,
--0.352610132898,
-0.665576466359,
--0.647472758312,
--0.324055858796,
-0.689758528490,
--0.630711224396,
--0.354643247441,
-0.690240188967,
--0.613040501717,
--0.384979539051,
-0.689907310996,
--0.594439277891,
--0.415055453419,
-0.688745900523,
--0.574894833844,
--0.444861912629,
-0.686726880725,
--0.554357033689,
--0.474284596157,
-0.683916954789,
--0.680359054357,
--0.532785078076,
-0.503241112921,
--0.676012829877,
--0.510176354066,
-0.531720548403,
--0.670791975688,
--0.486546360394,
-0.559741694480,
--0.664625657257,
--0.461992862538,
-0.587226813659,
--0.657483244315,
--0.436571795870,
-0.614101661369,
--0.649395550601,
--0.410251901778,
-0.640295865946,
--0.640451726038,
--0.382943199598,
-0.665714723058,
--0.622168319300,
--0.413032885730,
-0.665064220782,
--0.602912621107,
--0.442863818629,
-0.663602297660,
--0.582670499105,
--0.472410227639,
-0.661304518580,
--0.561398955062,
--0.501546983139,
-0.658241473138,
--0.654446960427,
--0.539074463749,
-0.530186663847,
--0.649875510950,
--0.515700796417,
-0.558313987684,
--0.644367810339,
--0.491393915953,
-0.585936979856,
--0.637885440141,
--0.466209002469,
-0.612985588145,
--0.630461315159,
--0.440114049122,
-0.639388890937,
--0.610524214804,
--0.469702162626,
-0.637683355249,
--0.589570333716,
--0.498978500105,
-0.635159254074,
--0.567566573620,
--0.527815364751,
-0.631885373499,
--0.627892878372,
--0.544497795931,
-0.556122903246,
--0.623061616905,
--0.520466681381,
-0.583873834927,
--0.617262952030,
--0.495545125983,
-0.611082217190,
--0.595600248780,
--0.524539851666,
-0.608373477124,
--0.572873638477,
--0.553063796833,
-0.604926632717,
--0.600697877351,
--0.549166629956,
-0.581014692318,
--0.564444912266,
-0.824778089187,
-0.033808942809,
--0.533297883394,
-0.845456880352,
-0.028214021915,
--0.491963202941,
-0.863699990427,
-0.109519557567,
--0.572709177876,
-0.817104271541,
-0.065915150055,
--0.541502442661,
-0.838485074993,
-0.060974450443,
--0.472521916522,
-0.865922853816,
-0.164014175138,
--0.608982282690,
-0.786838788369,
-0.100126422527,
--0.579833816791,
-0.808868434473,
-0.097594060363,
--0.548872754349,
-0.830738197495,
-0.092804885412,
--0.517031950018,
-0.851514690917,
-0.087181958074,
--0.669541940069,
-0.730440678566,
-0.134796163093,
--0.643124061264,
-0.753976109567,
-0.133833732760,
--0.615419063405,
-0.777051319572,
-0.132100806769,
--0.586250030929,
-0.799775052261,
-0.129115324484,
--0.555596356581,
-0.822094200992,
-0.124393782999,
--0.524006837327,
-0.843371405579,
-0.118918067119,
--0.428754902697,
-0.861617826288,
-0.271632021008,
--0.675125979501,
-0.718513553210,
-0.167162153783,
--0.648711339050,
-0.742736837082,
-0.165878236754,
--0.621038775748,
-0.766476260571,
-0.163783335534,
--0.592020303273,
-0.789775410103,
-0.160520285659,
--0.561699815759,
-0.812529733815,
-0.155848479757,
--0.530428050300,
-0.834274934105,
-0.150437421474,
--0.498443291170,
-0.855155642339,
-0.142348561156,
--0.728943598230,
-0.654555930137,
-0.200493802702,
--0.704886410201,
-0.680524330302,
-0.200054454041,
--0.679741137757,
-0.705901379456,
-0.199136204955,
--0.653442399265,
-0.730730852881,
-0.197599219356,
--0.625926238235,
-0.755046457671,
-0.195246487927,
--0.597152273116,
-0.778857080189,
-0.191809309866,
--0.567184166445,
-0.802037813416,
-0.187182977821,
--0.536257540194,
-0.824238693243,
-0.181819765556,
--0.504523180177,
-0.845588744745,
-0.174459265807,
--0.755080149457,
-0.613018505686,
-0.232512966481,
--0.732280315084,
-0.640119512424,
-0.232406002408,
--0.708427055056,
-0.666613278850,
-0.231857378845,
--0.683476704513,
-0.692531866202,
-0.230779567301,
--0.657383695200,
-0.717900628408,
-0.229053192549,
--0.630110243263,
-0.742731324204,
-0.226519891802,
--0.601641472724,
-0.767013887509,
-0.222973618767,
--0.572044414600,
-0.790613875135,
-0.218391593631,
--0.541483071415,
-0.813262539391,
-0.213073051778,
--0.510072453932,
-0.835057219143,
-0.206168699119,
--0.478160091038,
-0.855929450322,
-0.196844363417,
--0.778668566712,
-0.569286554769,
-0.263795530239,
--0.757178341270,
-0.597441826204,
-0.264091317188,
--0.734654367222,
-0.624988892857,
-0.263954247034,
--0.711065844150,
-0.651954161502,
-0.263327052508,
--0.686379328193,
-0.678358204525,
-0.262132722457,
--0.660563638400,
-0.704212115856,
-0.260270965544,
--0.633597343680,
-0.729513045822,
-0.257614289309,
--0.605479283593,
-0.754239826390,
-0.254002207524,
--0.576273202140,
-0.778252556194,
-0.249463735385,
--0.546096642452,
-0.801342480658,
-0.244189856046,
--0.515046817130,
-0.823573708348,
-0.237598659680,
--0.483363015301,
-0.844927720879,
-0.229035678289,
--0.799589918889,
-0.523550487904,
-0.294195255276,
--0.779455802997,
-0.552665002619,
-0.294974653241,
--0.758300939460,
-0.581180686570,
-0.295311182944,
--0.736102351280,
-0.609122006440,
-0.295167257179,
--0.712834205766,
-0.636507380361,
-0.294492359556,
--0.688470882230,
-0.663347276645,
-0.293220454418,
--0.662991168989,
-0.689641760091,
-0.291267836503,
--0.636383798254,
-0.715377869855,
-0.288531046233,
--0.608654782961,
-0.740527363554,
-0.284883448108,
--0.579861550773,
-0.764946679431,
-0.280387516774,
--0.550090554379,
-0.788471944038,
-0.275158818591,
--0.519427438857,
-0.811137059671,
-0.268796960904,
--0.488048484576,
-0.832949913538,
-0.260774075091,
--0.456245355086,
-0.853789218908,
-0.250767114349,
--0.324905517562,
-0.799003017568,
-0.505994646785,
--0.779247788370,
-0.535376361461,
-0.325799072911,
--0.758470091102,
-0.564198668721,
-0.326194701241,
--0.736643904723,
-0.592483235883,
-0.326066515963,
--0.713746740685,
-0.620240749029,
-0.325372099921,
--0.689758530483,
-0.647472756587,
-0.324055857998,
--0.664664671630,
-0.674170256196,
-0.322048660839,
--0.638460330512,
-0.700312678735,
-0.319265654848,
--0.611155206211,
-0.725866876419,
-0.315605119791,
--0.582798922105,
-0.750686867968,
-0.311150514469,
--0.553456277089,
-0.774641916478,
-0.305967401183,
--0.523203252676,
-0.797740346409,
-0.299781080293,
--0.492177673538,
-0.820003565031,
-0.292156278398,
--0.460602752856,
-0.841336349636,
-0.282839620354,
--0.353737623468,
-0.815773310318,
-0.457584527618,
--0.355227303402,
-0.797435433487,
-0.487760486650,
--0.356264164777,
-0.778070620550,
-0.517379893630,
--0.757695270858,
-0.546462422108,
-0.356758598697,
--0.736286050876,
-0.575040782451,
-0.356666440534,
--0.713806640845,
-0.603125963516,
-0.355976335757,
--0.690240190766,
-0.630711222675,
-0.354643247000,
--0.665576468844,
-0.657779642589,
-0.352610133031,
--0.639814350079,
-0.684303737632,
-0.349808507752,
--0.612966063110,
-0.710246569034,
-0.346153747128,
--0.585073074726,
-0.735461506991,
-0.341739475281,
--0.556183856224,
-0.759841039922,
-0.336602305587,
--0.526364971637,
-0.783373244052,
-0.330554499496,
--0.495729665716,
-0.806085114031,
-0.323231940665,
--0.464453918379,
-0.827895392664,
-0.314438827927,
--0.432761100466,
-0.848707021341,
-0.303997075396,
--0.381405280847,
-0.829682351515,
-0.407623855198,
--0.383512765718,
-0.812812516444,
-0.438467526327,
--0.385163517317,
-0.794914820719,
-0.468785124263,
--0.386335971924,
-0.775975091741,
-0.498605228407,
--0.386973750712,
-0.756003153871,
-0.527930438218,
--0.735024619344,
-0.556765961453,
-0.386976062730,
--0.713008483361,
-0.585137022965,
-0.386307606721,
--0.689907313273,
-0.613040499416,
-0.384979538636,
--0.665714726040,
-0.640451723410,
-0.382943198809,
--0.640431671412,
-0.667336494396,
-0.380143758990,
--0.614071181884,
-0.693652728129,
-0.376513580550,
--0.586669907908,
-0.719256979903,
-0.372139511495,
--0.558261490186,
-0.744055854754,
-0.367049034302,
--0.528902595989,
-0.768023082420,
-0.361112986232,
--0.498690286605,
-0.791185290265,
-0.354025189094,
--0.467766801419,
-0.813468176753,
-0.345635277280,
--0.436314162382,
-0.834788295384,
-0.335795255467,
--0.407783509839,
-0.840669568647,
-0.356352754240,
--0.410583074410,
-0.825275966449,
-0.387738466249,
--0.412905550289,
-0.808868614821,
-0.418617451258,
--0.414726781098,
-0.791438960078,
-0.449027916183,
--0.416026086109,
-0.772972327295,
-0.478994861051,
--0.416786058701,
-0.753448209780,
-0.508532375029,
--0.416935442360,
-0.732891346756,
-0.537619857105,
--0.711334603417,
-0.566251678969,
-0.416367767780,
--0.688745901990,
-0.594439275764,
-0.415055454031,
--0.665064223696,
-0.622168316708,
-0.413032884943,
--0.640295868218,
-0.649395547747,
-0.410251902749,
--0.614454441682,
-0.676069938392,
-0.406663469592,
--0.587573359299,
-0.702058185534,
-0.402333010784,
--0.559675208815,
-0.727271289041,
-0.397290992567,
--0.530804101780,
-0.751675776835,
-0.391446716748,
--0.501046848216,
-0.775291632664,
-0.384545108166,
--0.470520248113,
-0.798048177475,
-0.376470188122,
--0.439374096697,
-0.819868896647,
-0.367104066256,
--0.441913585854,
-0.803945532468,
-0.397974827673,
--0.443911486568,
-0.787008108319,
-0.428439995253,
--0.445348941818,
-0.769041946132,
-0.458518053200,
--0.446207862853,
-0.750028876023,
-0.488216374428,
--0.446476636089,
-0.729942906296,
-0.517534508004,
--0.446063537463,
-0.708830046658,
-0.546431409694,
--0.686726881908,
-0.574894831285,
-0.444861914111,
--0.663602301060,
-0.602912617112,
-0.442863818973,
--0.639388893066,
-0.630461312556,
-0.440114049758,
--0.614101664803,
-0.657483241684,
-0.436571795002,
--0.587765438490,
-0.683850852040,
-0.432295965145,
--0.560406942497,
-0.709473130230,
-0.427307776997,
--0.532054177275,
-0.734317470250,
-0.421540277233,
--0.502785538788,
-0.758389971474,
-0.414790734170,
--0.472697286949,
-0.781623983224,
-0.406965875424,
--0.474281774208,
-0.764180864874,
-0.437132021722,
--0.475256870014,
-0.745701769945,
-0.466968711806,
--0.475605016580,
-0.726167588560,
-0.496468026693,
--0.475320370235,
-0.705551242770,
-0.525612014194,
--0.474284597513,
-0.683916955627,
-0.554357031495,
--0.661304520129,
-0.582670496325,
-0.472410228900,
--0.637683359104,
-0.610524211320,
-0.469702161921,
--0.612985592165,
-0.637885437226,
-0.466209001172,
--0.587226817914,
-0.664625654627,
-0.461992860913,
--0.560433166465,
-0.690652198290,
-0.457071336798,
--0.532635683392,
-0.715933202654,
-0.451374432279,
--0.503890767410,
-0.740464430822,
-0.444754450462,
--0.504345039968,
-0.721498235687,
-0.474422150157,
--0.504134078430,
-0.701469400717,
-0.503775258249,
--0.503241115018,
-0.680359054884,
-0.532785075422,
--0.501546985237,
-0.658241474435,
-0.561398951668,
--0.635159255457,
-0.589570330925,
-0.498978501641,
--0.611082220403,
-0.617262949603,
-0.495545125044,
--0.585936982761,
-0.644367808544,
-0.491393914844,
--0.559741698729,
-0.670791973493,
-0.486546358533,
--0.532528909506,
-0.696504415720,
-0.480930929991,
--0.531720552765,
-0.676012828283,
-0.510176351632,
--0.530186665764,
-0.654446961178,
-0.539074460952,
--0.527815366965,
-0.631885374868,
-0.567566570038,
--0.608373479152,
-0.595600246531,
-0.524539851867,
--0.583873839746,
-0.623061613926,
-0.520466679540,
--0.558313991109,
-0.649875509274,
-0.515700794820,
--0.556122905592,
-0.627892877918,
-0.544497794059,
--0.553063797714,
-0.604926633262,
-0.572873637051,
--0.581014692332,
-0.600697877342,
-0.549166629950,
--0.858587033115,
-0.054704019281,
--0.509740891866,
--0.845456878655,
-0.028214020866,
--0.533297886141,
--0.796013182495,
-0.067686809675,
--0.601482758764,
--0.851514691953,
-0.087181959437,
--0.517031948082,
--0.838485074695,
-0.060974450259,
--0.541502443142,
--0.764556520153,
-0.101366335619,
--0.636536089703,
--0.855155644007,
-0.142348561315,
--0.498443288263,
--0.843371405732,
-0.118918069313,
--0.524006836582,
--0.830738198012,
-0.092804885731,
--0.548872753512,
--0.817104273010,
-0.065915150241,
--0.572709175758,
--0.865236842074,
-0.218104773694,
--0.451437165961,
--0.855929451995,
-0.196844363646,
--0.478160087951,
--0.845588746481,
-0.174459266100,
--0.504523177166,
--0.834274934605,
-0.150437424381,
--0.530428048689,
--0.822094202042,
-0.124393783647,
--0.555596354883,
--0.808868435677,
-0.097594059007,
--0.579833815340,
--0.693740005139,
-0.167877821581,
--0.700386923272,
--0.853789221030,
-0.250767114346,
--0.456245351117,
--0.844927722123,
-0.229035677050,
--0.483363013715,
--0.835057219956,
-0.206168699415,
--0.510072452482,
--0.824238695204,
-0.181819767216,
--0.536257536616,
--0.812529734802,
-0.155848480366,
--0.561699814163,
--0.799775054213,
-0.129115323093,
--0.586250028573,
--0.786838789936,
-0.100126424367,
--0.608982280362,
--0.855049731676,
-0.324405786587,
--0.404537812807,
--0.848707024008,
-0.303997075071,
--0.432761095464,
--0.841336350422,
-0.282839620277,
--0.460602751467,
--0.832949915435,
-0.260774074312,
--0.488048481755,
--0.823573709931,
-0.237598658979,
--0.515046814922,
--0.813262540847,
-0.213073053952,
--0.541483068373,
--0.802037815098,
-0.187182978860,
--0.567184163723,
--0.789775412530,
-0.160520286711,
--0.592020299751,
--0.777051321231,
-0.132100808574,
--0.615419060923,
--0.845531467814,
-0.376213879901,
--0.378866273910,
--0.840669571422,
-0.356352755315,
--0.407783503179,
--0.834788295906,
-0.335795255444,
--0.436314161401,
--0.827895394061,
-0.314438828355,
--0.464453915600,
--0.820003566332,
-0.292156278537,
--0.492177671287,
--0.811137061100,
-0.268796962230,
--0.519427435938,
--0.801342482213,
-0.244189857080,
--0.546096639708,
--0.790613876656,
-0.218391594571,
--0.572044412140,
--0.778857082594,
-0.191809310079,
--0.597152269911,
--0.766476261429,
-0.163783336271,
--0.621038774494,
--0.753976111300,
-0.133833734635,
--0.643124058843,
--0.833082078956,
-0.426830130267,
--0.351838442497,
--0.829682353884,
-0.407623856860,
--0.381405273918,
--0.825275966432,
-0.387738466010,
--0.410583074670,
--0.819868898485,
-0.367104067175,
--0.439374092501,
--0.813468177337,
-0.345635277874,
--0.467766799964,
--0.806085115764,
-0.323231942024,
--0.495729662012,
--0.797740348149,
-0.299781081107,
--0.523203249555,
--0.788471944630,
-0.275158820103,
--0.550090552773,
--0.778252558317,
-0.249463736698,
--0.576273198705,
--0.767013889272,
-0.222973619783,
--0.601641470101,
--0.755046458449,
-0.195246490087,
--0.625926236622,
--0.742736837361,
-0.165878238934,
--0.648711338174,
--0.817745743319,
-0.476017922451,
--0.323571996298,
--0.815773311537,
-0.457584530874,
--0.353737616446,
--0.812812516000,
-0.438467526408,
--0.383512766566,
--0.808868616354,
-0.418617451243,
--0.412905547302,
--0.803945533000,
-0.397974828901,
--0.441913583782,
--0.798048178665,
-0.376470190182,
--0.470520244446,
--0.791185291484,
-0.354025190242,
--0.498690283857,
--0.783373245969,
-0.330554499750,
--0.526364968624,
--0.774641918018,
-0.305967402278,
--0.553456274327,
--0.764946680982,
-0.280387517733,
--0.579861548264,
--0.754239827860,
-0.254002207286,
--0.605479281861,
--0.742731326260,
-0.226519892631,
--0.630110240541,
--0.730730853975,
-0.197599221982,
--0.653442397248,
--0.718513555359,
-0.167162156425,
--0.675125976559,
--0.505994649138,
-0.324905516107,
--0.799003016669,
--0.797435434069,
-0.487760486844,
--0.355227301829,
--0.794914821628,
-0.468785125491,
--0.385163513944,
--0.791438960936,
-0.449027916302,
--0.414726779331,
--0.787008109037,
-0.428439996620,
--0.443911483977,
--0.781623984221,
-0.406965876309,
--0.472697284538,
--0.775291633792,
-0.384545109183,
--0.501046845689,
--0.768023083918,
-0.361112986643,
--0.528902593534,
--0.759841040708,
-0.336602308061,
--0.556183853652,
--0.750686869491,
-0.311150515410,
--0.582798919640,
--0.740527365357,
-0.284883449080,
--0.608654780313,
--0.729513047729,
-0.257614290748,
--0.633597340900,
--0.717900629621,
-0.229053193964,
--0.657383693382,
--0.705901380163,
-0.199136205954,
--0.679741136730,
--0.552665008698,
-0.294974654495,
--0.779455798212,
--0.535376362503,
-0.325799073721,
--0.779247787315,
--0.517379894387,
-0.356264164309,
--0.778070620261,
--0.775975091849,
-0.498605229445,
--0.386335970368,
--0.772972327657,
-0.478994862918,
--0.416026083287,
--0.769041947555,
-0.458518053170,
--0.445348939393,
--0.764180865604,
-0.437132022797,
--0.474281772040,
--0.758389972150,
-0.414790736319,
--0.502785535995,
--0.751675777603,
-0.391446718345,
--0.530804099515,
--0.744055856019,
-0.367049035620,
--0.558261487633,
--0.735461508390,
-0.341739476145,
--0.585073072463,
--0.725866878871,
-0.315605119318,
--0.611155203544,
--0.715377871413,
-0.288531048127,
--0.636383795645,
--0.704212118406,
-0.260270966832,
--0.660563635174,
--0.692531867884,
-0.230779568776,
--0.683476702310,
--0.680524332915,
-0.200054457629,
--0.704886406660,
--0.597441831138,
-0.264091320040,
--0.757178336382,
--0.581180686131,
-0.295311182318,
--0.758300940040,
--0.564198671374,
-0.326194702215,
--0.758470088709,
--0.546462423634,
-0.356758598667,
--0.757695269771,
--0.527930440381,
-0.386973749375,
--0.756003153045,
--0.753448209260,
-0.508532376858,
--0.416786057409,
--0.750028876122,
-0.488216376440,
--0.446207860485,
--0.745701770764,
-0.466968713320,
--0.475256867241,
--0.740464432165,
-0.444754452126,
--0.503890763968,
--0.734317471273,
-0.421540279299,
--0.532054174226,
--0.727271290962,
-0.397290995034,
--0.559675204568,
--0.719256982207,
-0.372139512919,
--0.586669904180,
--0.710246570874,
-0.346153747729,
--0.612966060638,
--0.700312680099,
-0.319265656206,
--0.638460328337,
--0.689641762059,
-0.291267837325,
--0.662991166580,
--0.678358205594,
-0.262132722885,
--0.686379326973,
--0.666613279376,
-0.231857379516,
--0.708427054342,
--0.640119516756,
-0.232406005726,
--0.732280310243,
--0.624988892581,
-0.263954247091,
--0.734654367436,
--0.609122008085,
-0.295167259158,
--0.736102349125,
--0.592483236920,
-0.326066517015,
--0.736643903423,
--0.575040785130,
-0.356666440547,
--0.736286048777,
--0.556765963323,
-0.386976061735,
--0.735024618451,
--0.537619859446,
-0.416935440913,
--0.732891345862,
--0.729942906182,
-0.517534509858,
--0.446476634126,
--0.726167588495,
-0.496468028579,
--0.475605014712,
--0.721498236991,
-0.474422151778,
--0.504345036577,
--0.715933202766,
-0.451374435083,
--0.532635680865,
--0.709473131690,
-0.427307778383,
--0.560406939592,
--0.702058188152,
-0.402333012402,
--0.587573355064,
--0.693652731366,
-0.376513581272,
--0.614071177784,
--0.684303739574,
-0.349808507829,
--0.639814347960,
--0.674170257989,
-0.322048661629,
--0.664664669428,
--0.663347279653,
-0.293220454953,
--0.688470879104,
--0.651954164263,
-0.263327054430,
--0.711065840907,
--0.636507382151,
-0.294492359764,
--0.712834204081,
--0.620240751188,
-0.325372100332,
--0.713746738620,
--0.603125964757,
-0.355976337434,
--0.713806638960,
--0.585137025453,
-0.386307606307,
--0.713008481544,
--0.566251681186,
-0.416367767227,
--0.711334601976,
--0.546431413852,
-0.446063534893,
--0.708830045070,
--0.705551241990,
-0.525612016774,
--0.475320368540,
--0.701469401363,
-0.503775261462,
--0.504134074319,
--0.696504415944,
-0.480930932375,
--0.532528907061,
--0.690652200021,
-0.457071338626,
--0.560433162842,
--0.683850854635,
-0.432295966749,
--0.587765434291,
--0.676069940440,
-0.406663470374,
--0.614454438910,
--0.667336496990,
-0.380143759158,
--0.640431668609,
--0.657779645175,
-0.352610132898,
--0.665576466359,
--0.647472758312,
-0.324055858796,
--0.689758528490,
--0.630711224396,
-0.354643247441,
--0.690240188967,
--0.613040501717,
-0.384979539051,
--0.689907310996,
--0.594439277891,
-0.415055453419,
--0.688745900523,
--0.574894833844,
-0.444861912629,
--0.686726880725,
--0.554357033689,
-0.474284596157,
--0.683916954789,
--0.680359054357,
-0.532785078076,
--0.503241112921,
--0.676012829877,
-0.510176354066,
--0.531720548403,
--0.670791975688,
-0.486546360394,
--0.559741694480,
--0.664625657257,
-0.461992862538,
--0.587226813659,
--0.657483244315,
-0.436571795870,
--0.614101661369,
--0.649395550601,
-0.410251901778,
--0.640295865946,
--0.640451726038,
-0.382943199598,
--0.665714723058,
--0.622168319300,
-0.413032885730,
--0.665064220782,
--0.602912621107,
-0.442863818629,
--0.663602297660,
--0.582670499105,
-0.472410227639,
--0.661304518580,
--0.561398955062,
-0.501546983139,
--0.658241473138,
--0.654446960427,
-0.539074463749,
--0.530186663847,
--0.649875510950,
-0.515700796417,
--0.558313987684,
--0.644367810339,
-0.491393915953,
--0.585936979856,
--0.637885440141,
-0.466209002469,
--0.612985588145,
--0.630461315159,
-0.440114049122,
--0.639388890937,
--0.610524214804,
-0.469702162626,
--0.637683355249,
--0.589570333716,
-0.498978500105,
--0.635159254074,
--0.567566573620,
-0.527815364751,
--0.631885373499,
--0.627892878372,
-0.544497795931,
--0.556122903246,
--0.623061616905,
-0.520466681381,
--0.583873834927,
--0.617262952030,
-0.495545125983,
--0.611082217190,
--0.595600248780,
-0.524539851666,
--0.608373477124,
--0.572873638477,
-0.553063796833,
--0.604926632717,
--0.600697877351,
-0.549166629956,
--0.581014692318,
--0.509740892985,
--0.858587032424,
--0.054704019708,
--0.505083862528,
--0.862894104207,
--0.017437222806,
--0.424276393266,
--0.905532739396,
--0.000000001077,
--0.485527218439,
--0.870985685678,
--0.075148223519,
--0.480527992402,
--0.876169357698,
--0.037684282522,
--0.371155580903,
--0.928570694543,
--0.000000001209,
--0.466633721374,
--0.874815037512,
--0.130198387931,
--0.460915747478,
--0.882363843185,
--0.094819417663,
--0.456067868618,
--0.888094771199,
--0.057356574024,
--0.451116799777,
--0.892252494139,
--0.019470995389,
--0.451437166376,
--0.865236841817,
--0.218104773852,
--0.446279697618,
--0.875632616795,
--0.184667138114,
--0.440959797305,
--0.884873075674,
--0.150180215433,
--0.435812606548,
--0.892750493708,
--0.114297541343,
--0.431202572933,
--0.898973787276,
--0.076879586932,
--0.426412778319,
--0.903687851145,
--0.038992437455,
--0.260877081116,
--0.965372025982,
--0.000000000267,
--0.424358865154,
--0.873496153136,
--0.238587560490,
--0.419675662001,
--0.884288670135,
--0.204709273349,
--0.414870076333,
--0.893895524226,
--0.169804627536,
--0.410200536058,
--0.902146206069,
--0.133670277522,
--0.405851335393,
--0.908849391777,
--0.096319658571,
--0.401312727207,
--0.914072592245,
--0.058475559759,
--0.398316866803,
--0.917037175770,
--0.019659396641,
--0.404537811643,
--0.855049732395,
--0.324405786143,
--0.400889335129,
--0.868404855176,
--0.291823145905,
--0.396901517479,
--0.880705878152,
--0.258507914019,
--0.392668324953,
--0.891898094191,
--0.224342096266,
--0.388327579256,
--0.901890504602,
--0.189196217983,
--0.384079219164,
--0.910543469618,
--0.152950133514,
--0.380001187585,
--0.917723256467,
--0.115685444091,
--0.375737253482,
--0.923445686314,
--0.077907514227,
--0.372422371603,
--0.927231534385,
--0.039284332407,
--0.378866269556,
--0.845531470505,
--0.376213878238,
--0.375927559769,
--0.860357627193,
--0.344184867676,
--0.372631799612,
--0.874146159976,
--0.311470757725,
--0.369037876158,
--0.886865749507,
--0.277993144360,
--0.365227416662,
--0.898463138571,
--0.243665596151,
--0.361313281033,
--0.908856982934,
--0.208402729158,
--0.357451615644,
--0.917931518893,
--0.172133869696,
--0.353652820029,
--0.925587303437,
--0.134973429242,
--0.349673761336,
--0.931807212378,
--0.097280931289,
--0.346289117662,
--0.936280887749,
--0.058838305758,
--0.344326356404,
--0.938643247168,
--0.019703168063,
--0.351838436445,
--0.833082082696,
--0.426830127955,
--0.349554484410,
--0.849367224368,
--0.395457937836,
--0.346915901212,
--0.864624443597,
--0.363419769717,
--0.343961776975,
--0.878836952425,
--0.330659805590,
--0.340744050319,
--0.891972553962,
--0.297116904854,
--0.337331696377,
--0.903980442276,
--0.262729302900,
--0.333816262573,
--0.914787943131,
--0.227441689107,
--0.330320463490,
--0.924297329518,
--0.191214115708,
--0.326809465443,
--0.932429624434,
--0.154177069552,
--0.323123022669,
--0.939147756278,
--0.116589039358,
--0.319800327043,
--0.944242675406,
--0.078316797465,
--0.317484776367,
--0.947446110534,
--0.039360950301,
--0.323571996438,
--0.817745743233,
--0.476017922505,
--0.321871272122,
--0.835467795426,
--0.445412670440,
--0.319833413052,
--0.852168520853,
--0.414144177747,
--0.317484900037,
--0.867841819592,
--0.382170007216,
--0.314859376865,
--0.882469351288,
--0.349444440272,
--0.312000692048,
--0.896018649928,
--0.315921109048,
--0.308965978748,
--0.908441360534,
--0.281556954182,
--0.305829298505,
--0.919671785835,
--0.246317369496,
--0.302687380683,
--0.929625617612,
--0.210182208227,
--0.299474033040,
--0.938235695411,
--0.173289016939,
--0.296088347093,
--0.945453941358,
--0.135825386016,
--0.292907546226,
--0.951134052444,
--0.097719924500,
--0.290449262594,
--0.955072948874,
--0.058948182227,
--0.289083198661,
--0.957101113211,
--0.019706936380,
--0.000000001455,
--0.999805669655,
--0.019713521409,
--0.291487301526,
--0.836828920699,
--0.463413973171,
--0.289684965611,
--0.853923809695,
--0.432315565225,
--0.287615988421,
--0.869997750055,
--0.400475914512,
--0.285306744065,
--0.885031229079,
--0.367858376750,
--0.282792654174,
--0.898991500407,
--0.334428762131,
--0.280119562447,
--0.911832203878,
--0.300158396027,
--0.277347343869,
--0.923492778259,
--0.265027431319,
--0.274552898150,
--0.933898543492,
--0.229028855343,
--0.271648406695,
--0.942988462108,
--0.192301595082,
--0.268572828009,
--0.950709570841,
--0.154983702260,
--0.265588961928,
--0.956954734078,
--0.117047598125,
--0.263124479574,
--0.961566224132,
--0.078459574667,
--0.261466546902,
--0.964409293307,
--0.039369529270,
--0.058762968974,
--0.998077672616,
--0.019694489174,
--0.029428229681,
--0.998790334550,
--0.039393488134,
--0.000000000468,
--0.998253983067,
--0.059067633195,
--0.259090041412,
--0.854617400873,
--0.450001609514,
--0.257291187958,
--0.871075888171,
--0.418363528103,
--0.255288587675,
--0.886505704830,
--0.385921458728,
--0.253108167969,
--0.900873670335,
--0.352651223456,
--0.250785732525,
--0.914134415853,
--0.318535376552,
--0.248367631734,
--0.926231114354,
--0.283565587315,
--0.245917027490,
--0.937095348585,
--0.247744068043,
--0.243333598581,
--0.946668118546,
--0.211206612419,
--0.240578736906,
--0.954895730684,
--0.174057504493,
--0.237833923510,
--0.961695238604,
--0.136298543183,
--0.235458698884,
--0.966941417819,
--0.097895329955,
--0.233674349604,
--0.970525010076,
--0.058970358261,
--0.232706642837,
--0.972347475757,
--0.019697836648,
--0.117313960807,
--0.992899763434,
--0.019684876760,
--0.088201583401,
--0.995324864374,
--0.039356003921,
--0.058968815102,
--0.996514233637,
--0.059008990871,
--0.029577373257,
--0.996464031497,
--0.078642310016,
--0.000000001337,
--0.995166083739,
--0.098206241025,
--0.226492242485,
--0.871056254731,
--0.435846607406,
--0.224792106921,
--0.886871337469,
--0.403643084224,
--0.222938599952,
--0.901643035931,
--0.370591711198,
--0.220960273914,
--0.915325091472,
--0.336684621379,
--0.218891392113,
--0.927862714630,
--0.301922740544,
--0.216780186850,
--0.939192066484,
--0.266316752839,
--0.214530394989,
--0.949251847444,
--0.229994868965,
--0.212107742457,
--0.957990636184,
--0.193039494857,
--0.209636939783,
--0.965340109396,
--0.155469696949,
--0.207422449280,
--0.971198713562,
--0.117256071528,
--0.205634078535,
--0.975475109059,
--0.078504377911,
--0.204456782867,
--0.978084036467,
--0.039357865132,
--0.175377504113,
--0.984304379375,
--0.019688062214,
--0.146628827319,
--0.988408662627,
--0.039348477020,
--0.117738291131,
--0.991292013347,
--0.058973206426,
--0.088660264083,
--0.992959150186,
--0.078558790941,
--0.059359645562,
--0.993404310200,
--0.098103562401,
--0.029809996965,
--0.992612568765,
--0.117608045691,
--0.000000001447,
--0.990571620355,
--0.136995857407,
--0.193800093560,
--0.886105596412,
--0.421020659521,
--0.192277873411,
--0.901273391754,
--0.388246690537,
--0.190642071917,
--0.915377331523,
--0.354598281650,
--0.188921433136,
--0.928360290281,
--0.320087274868,
--0.187146663299,
--0.940160669090,
--0.284735039489,
--0.185240346897,
--0.950713661995,
--0.248655478078,
--0.183161627543,
--0.959969479493,
--0.211920779157,
--0.180995593950,
--0.967869324228,
--0.174555338473,
--0.178998186587,
--0.974328651581,
--0.136540572380,
--0.177299793160,
--0.979268384833,
--0.097970474188,
--0.176047042267,
--0.982613966443,
--0.058968057970,
--0.147421226090,
--0.985951820230,
--0.078523819851,
--0.118539386236,
--0.988099125316,
--0.098023122075,
--0.089372604384,
--0.989047421857,
--0.117463759958,
--0.059900256546,
--0.988780106834,
--0.136842462690,
--0.030108868862,
--0.987272338262,
--0.156162691188,
--0.000000002569,
--0.984512472364,
--0.175314550905,
--0.161114865134,
--0.899740922547,
--0.405596193926,
--0.159827039598,
--0.914262851387,
--0.372261676764,
--0.158457960691,
--0.927692975005,
--0.338048545066,
--0.157030326177,
--0.939968864238,
--0.302985166178,
--0.155469471741,
--0.951024452690,
--0.267173602254,
--0.153743472123,
--0.960804976905,
--0.230687540052,
--0.151910418116,
--0.969259234022,
--0.193545245697,
--0.150175405890,
--0.976315018382,
--0.155744445637,
--0.148641428153,
--0.981901518214,
--0.117367518361,
--0.119638526767,
--0.983362445673,
--0.136692806518,
--0.090277330963,
--0.983632210052,
--0.155941267352,
--0.060549563160,
--0.982685965989,
--0.175105804155,
--0.030458457605,
--0.980491025076,
--0.194189680741,
--0.000000001356,
--0.977040956393,
--0.213051565428,
--0.128519442053,
--0.911949783275,
--0.389654136125,
--0.127507005039,
--0.925830538389,
--0.355780519214,
--0.126439231770,
--0.938587625052,
--0.321039547048,
--0.125233955376,
--0.950152946235,
--0.285527293233,
--0.123861370596,
--0.960468406667,
--0.249316667449,
--0.122383781614,
--0.969482821903,
--0.212427088748,
--0.120947567812,
--0.977136343935,
--0.174860662249,
--0.091312154238,
--0.976766597540,
--0.193879097426,
--0.061270259801,
--0.975174293017,
--0.212793452680,
--0.030830887379,
--0.972324632198,
--0.231590729531,
--0.000000002098,
--0.968214556970,
--0.250121114006,
--0.096084791708,
--0.922736671989,
--0.373262303172,
--0.095381423987,
--0.935983569813,
--0.338876291584,
--0.094543066807,
--0.948065950468,
--0.303698143033,
--0.093532696260,
--0.958924982880,
--0.267795653324,
--0.092414860384,
--0.968509857004,
--0.231188560415,
--0.062018390139,
--0.966304729375,
--0.249817712086,
--0.031208165659,
--0.962832633898,
--0.268289711873,
--0.000000002214,
--0.958093210068,
--0.286456629914,
--0.063875683220,
--0.932118391216,
--0.356476088749,
--0.063407158365,
--0.944727713032,
--0.321666100946,
--0.062768865127,
--0.956139240091,
--0.286108061980,
--0.031583053926,
--0.952076334702,
--0.304225514390,
--0.000000000881,
--0.946738857652,
--0.322002384172,
--0.031848062377,
--0.940101520142,
--0.339403642805,
-0.824778089614,
-0.033808943928,
-0.564444911575,
-0.834680082291,
--0.000000001697,
-0.550735108946,
-0.796013181829,
--0.067686807932,
-0.601482759841,
-0.805070535623,
-0.034410420412,
-0.592180171602,
-0.815194907255,
--0.000000000297,
-0.579186725664,
-0.764556519406,
--0.101366333663,
-0.636536090912,
-0.774688614985,
-0.068316855638,
-0.628641676194,
-0.784769782823,
-0.034502971258,
-0.618826254245,
-0.795289885787,
-0.000000000517,
-0.606229327536,
-0.805070536065,
--0.034410417907,
-0.592180171147,
-0.730440678724,
-0.134796163508,
-0.669541939813,
-0.741798884035,
-0.101953342427,
-0.662827226065,
-0.752772268905,
-0.068537426908,
-0.654703392598,
-0.763635169224,
-0.034499882344,
-0.644725590032,
-0.774580004277,
-0.000000001049,
-0.632475941815,
-0.784769784026,
--0.034502969901,
-0.618826252795,
-0.693740004974,
--0.167877821148,
-0.700386923539,
-0.706333999354,
-0.135275667820,
-0.694832911607,
-0.718410433381,
-0.102190885040,
-0.688072287063,
-0.730112188692,
-0.068580959385,
-0.679877080018,
-0.741625920410,
-0.034463285101,
-0.669927814138,
-0.753000912020,
-0.000000000986,
-0.658019472734,
-0.763635170771,
--0.034499879892,
-0.644725588332,
-0.774688614614,
--0.068316852403,
-0.628641677003,
-0.654555929692,
-0.200493801539,
-0.728943598949,
-0.668350401135,
-0.168182693707,
-0.724584241369,
-0.681569673198,
-0.135434970966,
-0.719110665487,
-0.694298874835,
-0.102219062554,
-0.712390578021,
-0.706644016675,
-0.068527252260,
-0.704243032905,
-0.718734159752,
-0.034405460658,
-0.694433201887,
-0.730540278646,
-0.000000001682,
-0.682869607814,
-0.741625920758,
--0.034463280713,
-0.669927813978,
-0.752772268578,
--0.068537423514,
-0.654703393330,
-0.613018504024,
-0.232512962128,
-0.755080152148,
-0.627951624785,
-0.200550058999,
-0.751968370855,
-0.642288781130,
-0.168175017056,
-0.747784919126,
-0.656086182207,
-0.135363527859,
-0.742447059960,
-0.669409946022,
-0.102102937924,
-0.735843267438,
-0.682337091132,
-0.068405736897,
-0.727830165097,
-0.694957900126,
-0.034328594704,
-0.718230509404,
-0.707195709806,
-0.000000001520,
-0.707017841381,
-0.718734160601,
--0.034405456797,
-0.694433201200,
-0.730112188631,
--0.068580957714,
-0.679877080252,
-0.741798883751,
--0.101953339022,
-0.662827226906,
-0.569286552457,
-0.263795524187,
-0.778668570452,
-0.585275907180,
-0.232240527680,
-0.776863211754,
-0.600670196563,
-0.200287073575,
-0.774002844387,
-0.615509899917,
-0.167914736983,
-0.770033898090,
-0.629839831505,
-0.135109972812,
-0.764883704818,
-0.643709476732,
-0.101872999909,
-0.758458964912,
-0.657173653822,
-0.068227302327,
-0.750644938662,
-0.670295121994,
-0.034232118240,
-0.741304668481,
-0.682965889048,
-0.000000002123,
-0.730450268257,
-0.694957900233,
--0.034328591386,
-0.718230509459,
-0.706644015726,
--0.068527249899,
-0.704243034087,
-0.718410432245,
--0.102190883518,
-0.688072288475,
-0.523550487957,
-0.294195255416,
-0.799589918803,
-0.540493142185,
-0.263108308917,
-0.799150286886,
-0.556857337909,
-0.231631829430,
-0.797656944313,
-0.572674562413,
-0.199746609914,
-0.795075554518,
-0.587976991732,
-0.167438152639,
-0.791358024054,
-0.602798195510,
-0.134700902021,
-0.786441353493,
-0.617173524031,
-0.101543531393,
-0.780247238039,
-0.631140739601,
-0.067995376114,
-0.772682338120,
-0.644742169503,
-0.034114554464,
-0.763638482554,
-0.657848178636,
-0.000000001551,
-0.753150565202,
-0.670295122767,
--0.034232116178,
-0.741304667877,
-0.682337091540,
--0.068405733411,
-0.727830165042,
-0.694298873783,
--0.102219059564,
-0.712390579475,
-0.706333998862,
--0.135275663549,
-0.694832912939,
-0.493811022870,
--0.293008368430,
-0.818716538078,
-0.511029847788,
-0.262059072609,
-0.818641275000,
-0.527729108454,
-0.230716152908,
-0.817479079168,
-0.543931234092,
-0.198955725053,
-0.815202693842,
-0.559659129159,
-0.166767360008,
-0.811769860727,
-0.574935642409,
-0.134151227635,
-0.807126046669,
-0.589783543039,
-0.101121377597,
-0.801205241716,
-0.604227123412,
-0.067710405183,
-0.793930024853,
-0.618293423701,
-0.033974164289,
-0.785212708996,
-0.631837947640,
-0.000000001523,
-0.775100514722,
-0.644742169658,
--0.034114551121,
-0.763638482573,
-0.657173653786,
--0.068227298680,
-0.750644939025,
-0.669409945734,
--0.102102935410,
-0.735843268049,
-0.681569672953,
--0.135434969474,
-0.719110666000,
-0.540493144997,
--0.263108301620,
-0.799150287386,
-0.511029847900,
--0.262059070984,
-0.818641275450,
-0.480874089437,
--0.260690726163,
-0.837138253457,
-0.497858802177,
-0.229512669741,
-0.836337579883,
-0.514409447636,
-0.197931545206,
-0.834389611390,
-0.530529369073,
-0.165915984039,
-0.831270398120,
-0.546230423334,
-0.133469642930,
-0.826932995496,
-0.561524282822,
-0.100610329561,
-0.821320912547,
-0.576422606602,
-0.067372039971,
-0.814369686830,
-0.590941601458,
-0.033809286985,
-0.806005555676,
-0.604928643266,
-0.000000001398,
-0.796279684883,
-0.618293425097,
--0.033974161051,
-0.785212708037,
-0.631140739108,
--0.067995372639,
-0.772682338828,
-0.643709477154,
--0.101872995626,
-0.758458965129,
-0.656086182150,
--0.135363524780,
-0.742447060571,
-0.668350400361,
--0.168182688427,
-0.724584243308,
-0.585275908236,
--0.232240520377,
-0.776863213142,
-0.556857338047,
--0.231631830313,
-0.797656943961,
-0.527729109375,
--0.230716149344,
-0.817479079580,
-0.497858803090,
--0.229512668108,
-0.836337579787,
-0.467235645521,
--0.228072713490,
-0.854209394069,
-0.484080192001,
-0.196682247807,
-0.852632664815,
-0.500563730748,
-0.164891853157,
-0.849850944709,
-0.516663497294,
-0.132661271348,
-0.845848578439,
-0.532381892663,
-0.100012708755,
-0.840575385347,
-0.547718955641,
-0.066980976877,
-0.833976914770,
-0.562678485934,
-0.033618562833,
-0.825991957407,
-0.577112335949,
-0.000000002304,
-0.816664773145,
-0.590941601881,
--0.033809283880,
-0.806005555495,
-0.604227123164,
--0.067710402321,
-0.793930025286,
-0.617173524468,
--0.101543528206,
-0.780247238108,
-0.629839831779,
--0.135109971159,
-0.764883704885,
-0.642288781000,
--0.168175016008,
-0.747784919474,
-0.627951625135,
--0.200550051891,
-0.751968372458,
-0.600670196378,
--0.200287073868,
-0.774002844455,
-0.572674562088,
--0.199746606736,
-0.795075555551,
-0.543931234004,
--0.198955723158,
-0.815202694364,
-0.514409449149,
--0.197931542165,
-0.834389611179,
-0.484080193736,
--0.196682246456,
-0.852632664142,
-0.452951763250,
--0.195271487311,
-0.869887203269,
-0.469737828632,
-0.163691227213,
-0.867497293647,
-0.486217937723,
-0.131728312730,
-0.863851705249,
-0.502344446580,
-0.099329920283,
-0.858943318227,
-0.518108387531,
-0.066537655019,
-0.852722955733,
-0.533497199498,
-0.033403193298,
-0.845141979081,
-0.548380651210,
-0.000000002618,
-0.836228833142,
-0.562678486925,
--0.033618557674,
-0.825991956941,
-0.576422607479,
--0.067372037262,
-0.814369686433,
-0.589783543415,
--0.101121374674,
-0.801205241808,
-0.602798196711,
--0.134700897822,
-0.786441353292,
-0.615509900187,
--0.167914732384,
-0.770033898877,
-0.587976992556,
--0.167438150318,
-0.791358023933,
-0.559659130062,
--0.166767357131,
-0.811769860695,
-0.530529368657,
--0.165915981375,
-0.831270398918,
-0.500563732406,
--0.164891850570,
-0.849850944234,
-0.469737830257,
--0.163691225109,
-0.867497293164,
-0.438081062670,
--0.162398632807,
-0.884144595975,
-0.454879008437,
-0.130656410705,
-0.880916562465,
-0.471399032414,
-0.098556784251,
-0.876395751084,
-0.487578925246,
-0.066043103389,
-0.870577452126,
-0.503397069236,
-0.033168958337,
-0.863418329020,
-0.518728487546,
-0.000000002595,
-0.854939036545,
-0.533497199907,
--0.033403189790,
-0.845141978961,
-0.547718956789,
--0.066980973260,
-0.833976914306,
-0.561524284212,
--0.100610326299,
-0.821320911996,
-0.574935642789,
--0.134151224913,
-0.807126046851,
-0.546230423950,
--0.133469640478,
-0.826932995485,
-0.516663498245,
--0.132661268227,
-0.845848578348,
-0.486217939296,
--0.131728310669,
-0.863851704678,
-0.454879010882,
--0.130656408926,
-0.880916561466,
-0.422683924898,
--0.129559921939,
-0.896968520217,
-0.439539554374,
-0.097688558032,
-0.892895249047,
-0.456128376468,
-0.065488618557,
-0.887501067616,
-0.472378623880,
-0.032906538462,
-0.880781241528,
-0.488160085323,
-0.000000002630,
-0.872754106893,
-0.503397069870,
--0.033168953976,
-0.863418328818,
-0.518108389624,
--0.066537652053,
-0.852722954693,
-0.532381893473,
--0.100012704784,
-0.840575385307,
-0.502344447383,
--0.099329916387,
-0.858943318208,
-0.471399034768,
--0.098556779610,
-0.876395750340,
-0.439539556776,
--0.097688555779,
-0.892895248111,
-0.406815605302,
--0.096842519373,
-0.908362587145,
-0.423758170348,
-0.064876629502,
-0.903448967019,
-0.440438444769,
-0.032612561347,
-0.897190279267,
-0.456672035624,
-0.000000001795,
-0.889635122890,
-0.472378624347,
--0.032906533352,
-0.880781241468,
-0.487578927012,
--0.066043100561,
-0.870577451352,
-0.456128377743,
--0.065488613479,
-0.887501067336,
-0.423758172946,
--0.064876627463,
-0.903448965947,
-0.390526640030,
--0.064318801248,
-0.918342003413,
-0.407578539349,
-0.032292631841,
-0.912598991995,
-0.424261033492,
-0.000000002979,
-0.905539935873,
-0.440438445271,
--0.032612557244,
-0.897190279170,
-0.407578540642,
--0.032292629138,
-0.912598991513,
-0.373865220601,
--0.032052994785,
-0.926929016889,
-0.390934890192,
-0.000000000009,
-0.920418335123,
-0.858587033115,
--0.054704019281,
--0.509740891866,
-0.845456878655,
--0.028214020866,
--0.533297886141,
-0.796013182495,
--0.067686809675,
--0.601482758764,
-0.851514691953,
--0.087181959437,
--0.517031948082,
-0.838485074695,
--0.060974450259,
--0.541502443142,
-0.764556520153,
--0.101366335619,
--0.636536089703,
-0.855155644007,
--0.142348561315,
--0.498443288263,
-0.843371405732,
--0.118918069313,
--0.524006836582,
-0.830738198012,
--0.092804885731,
--0.548872753512,
-0.817104273010,
--0.065915150241,
--0.572709175758,
-0.865236842074,
--0.218104773694,
--0.451437165961,
-0.855929451995,
--0.196844363646,
--0.478160087951,
-0.845588746481,
--0.174459266100,
--0.504523177166,
-0.834274934605,
--0.150437424381,
--0.530428048689,
-0.822094202042,
--0.124393783647,
--0.555596354883,
-0.808868435677,
--0.097594059007,
--0.579833815340,
-0.693740005139,
--0.167877821581,
--0.700386923272,
-0.853789221030,
--0.250767114346,
--0.456245351117,
-0.844927722123,
--0.229035677050,
--0.483363013715,
-0.835057219956,
--0.206168699415,
--0.510072452482,
-0.824238695204,
--0.181819767216,
--0.536257536616,
-0.812529734802,
--0.155848480366,
--0.561699814163,
-0.799775054213,
--0.129115323093,
--0.586250028573,
-0.786838789936,
--0.100126424367,
--0.608982280362,
-0.855049731676,
--0.324405786587,
--0.404537812807,
-0.848707024008,
--0.303997075071,
--0.432761095464,
-0.841336350422,
--0.282839620277,
--0.460602751467,
-0.832949915435,
--0.260774074312,
--0.488048481755,
-0.823573709931,
--0.237598658979,
--0.515046814922,
-0.813262540847,
--0.213073053952,
--0.541483068373,
-0.802037815098,
--0.187182978860,
--0.567184163723,
-0.789775412530,
--0.160520286711,
--0.592020299751,
-0.777051321231,
--0.132100808574,
--0.615419060923,
-0.845531467814,
--0.376213879901,
--0.378866273910,
-0.840669571422,
--0.356352755315,
--0.407783503179,
-0.834788295906,
--0.335795255444,
--0.436314161401,
-0.827895394061,
--0.314438828355,
--0.464453915600,
-0.820003566332,
--0.292156278537,
--0.492177671287,
-0.811137061100,
--0.268796962230,
--0.519427435938,
-0.801342482213,
--0.244189857080,
--0.546096639708,
-0.790613876656,
--0.218391594571,
--0.572044412140,
-0.778857082594,
--0.191809310079,
--0.597152269911,
-0.766476261429,
--0.163783336271,
--0.621038774494,
-0.753976111300,
--0.133833734635,
--0.643124058843,
-0.833082078956,
--0.426830130267,
--0.351838442497,
-0.829682353884,
--0.407623856860,
--0.381405273918,
-0.825275966432,
--0.387738466010,
--0.410583074670,
-0.819868898485,
--0.367104067175,
--0.439374092501,
-0.813468177337,
--0.345635277874,
--0.467766799964,
-0.806085115764,
--0.323231942024,
--0.495729662012,
-0.797740348149,
--0.299781081107,
--0.523203249555,
-0.788471944630,
--0.275158820103,
--0.550090552773,
-0.778252558317,
--0.249463736698,
--0.576273198705,
-0.767013889272,
--0.222973619783,
--0.601641470101,
-0.755046458449,
--0.195246490087,
--0.625926236622,
-0.742736837361,
--0.165878238934,
--0.648711338174,
-0.817745743319,
--0.476017922451,
--0.323571996298,
-0.815773311537,
--0.457584530874,
--0.353737616446,
-0.812812516000,
--0.438467526408,
--0.383512766566,
-0.808868616354,
--0.418617451243,
--0.412905547302,
-0.803945533000,
--0.397974828901,
--0.441913583782,
-0.798048178665,
--0.376470190182,
--0.470520244446,
-0.791185291484,
--0.354025190242,
--0.498690283857,
-0.783373245969,
--0.330554499750,
--0.526364968624,
-0.774641918018,
--0.305967402278,
--0.553456274327,
-0.764946680982,
--0.280387517733,
--0.579861548264,
-0.754239827860,
--0.254002207286,
--0.605479281861,
-0.742731326260,
--0.226519892631,
--0.630110240541,
-0.730730853975,
--0.197599221982,
--0.653442397248,
-0.718513555359,
--0.167162156425,
--0.675125976559,
-0.505994649138,
--0.324905516107,
--0.799003016669,
-0.797435434069,
--0.487760486844,
--0.355227301829,
-0.794914821628,
--0.468785125491,
--0.385163513944,
-0.791438960936,
--0.449027916302,
--0.414726779331,
-0.787008109037,
--0.428439996620,
--0.443911483977,
-0.781623984221,
--0.406965876309,
--0.472697284538,
-0.775291633792,
--0.384545109183,
--0.501046845689,
-0.768023083918,
--0.361112986643,
--0.528902593534,
-0.759841040708,
--0.336602308061,
--0.556183853652,
-0.750686869491,
--0.311150515410,
--0.582798919640,
-0.740527365357,
--0.284883449080,
--0.608654780313,
-0.729513047729,
--0.257614290748,
--0.633597340900,
-0.717900629621,
--0.229053193964,
--0.657383693382,
-0.705901380163,
--0.199136205954,
--0.679741136730,
-0.552665008698,
--0.294974654495,
--0.779455798212,
-0.535376362503,
--0.325799073721,
--0.779247787315,
-0.517379894387,
--0.356264164309,
--0.778070620261,
-0.775975091849,
--0.498605229445,
--0.386335970368,
-0.772972327657,
--0.478994862918,
--0.416026083287,
-0.769041947555,
--0.458518053170,
--0.445348939393,
-0.764180865604,
--0.437132022797,
--0.474281772040,
-0.758389972150,
--0.414790736319,
--0.502785535995,
-0.751675777603,
--0.391446718345,
--0.530804099515,
-0.744055856019,
--0.367049035620,
--0.558261487633,
-0.735461508390,
--0.341739476145,
--0.585073072463,
-0.725866878871,
--0.315605119318,
--0.611155203544,
-0.715377871413,
--0.288531048127,
--0.636383795645,
-0.704212118406,
--0.260270966832,
--0.660563635174,
-0.692531867884,
--0.230779568776,
--0.683476702310,
-0.680524332915,
--0.200054457629,
--0.704886406660,
-0.597441831138,
--0.264091320040,
--0.757178336382,
-0.581180686131,
--0.295311182318,
--0.758300940040,
-0.564198671374,
--0.326194702215,
--0.758470088709,
-0.546462423634,
--0.356758598667,
--0.757695269771,
-0.527930440381,
--0.386973749375,
--0.756003153045,
-0.753448209260,
--0.508532376858,
--0.416786057409,
-0.750028876122,
--0.488216376440,
--0.446207860485,
-0.745701770764,
--0.466968713320,
--0.475256867241,
-0.740464432165,
--0.444754452126,
--0.503890763968,
-0.734317471273,
--0.421540279299,
--0.532054174226,
-0.727271290962,
--0.397290995034,
--0.559675204568,
-0.719256982207,
--0.372139512919,
--0.586669904180,
-0.710246570874,
--0.346153747729,
--0.612966060638,
-0.700312680099,
--0.319265656206,
--0.638460328337,
-0.689641762059,
--0.291267837325,
--0.662991166580,
-0.678358205594,
--0.262132722885,
--0.686379326973,
-0.666613279376,
--0.231857379516,
--0.708427054342,
-0.640119516756,
--0.232406005726,
--0.732280310243,
-0.624988892581,
--0.263954247091,
--0.734654367436,
-0.609122008085,
--0.295167259158,
--0.736102349125,
-0.592483236920,
--0.326066517015,
--0.736643903423,
-0.575040785130,
--0.356666440547,
--0.736286048777,
-0.556765963323,
--0.386976061735,
--0.735024618451,
-0.537619859446,
--0.416935440913,
--0.732891345862,
-0.729942906182,
--0.517534509858,
--0.446476634126,
-0.726167588495,
--0.496468028579,
--0.475605014712,
-0.721498236991,
--0.474422151778,
--0.504345036577,
-0.715933202766,
--0.451374435083,
--0.532635680865,
-0.709473131690,
--0.427307778383,
--0.560406939592,
-0.702058188152,
--0.402333012402,
--0.587573355064,
-0.693652731366,
--0.376513581272,
--0.614071177784,
-0.684303739574,
--0.349808507829,
--0.639814347960,
-0.674170257989,
--0.322048661629,
--0.664664669428,
-0.663347279653,
--0.293220454953,
--0.688470879104,
-0.651954164263,
--0.263327054430,
--0.711065840907,
-0.636507382151,
--0.294492359764,
--0.712834204081,
-0.620240751188,
--0.325372100332,
--0.713746738620,
-0.603125964757,
--0.355976337434,
--0.713806638960,
-0.585137025453,
--0.386307606307,
--0.713008481544,
-0.566251681186,
--0.416367767227,
--0.711334601976,
-0.546431413852,
--0.446063534893,
--0.708830045070,
-0.705551241990,
--0.525612016774,
--0.475320368540,
-0.701469401363,
--0.503775261462,
--0.504134074319,
-0.696504415944,
--0.480930932375,
--0.532528907061,
-0.690652200021,
--0.457071338626,
--0.560433162842,
-0.683850854635,
--0.432295966749,
--0.587765434291,
-0.676069940440,
--0.406663470374,
--0.614454438910,
-0.667336496990,
--0.380143759158,
--0.640431668609,
-0.657779645175,
--0.352610132898,
--0.665576466359,
-0.647472758312,
--0.324055858796,
--0.689758528490,
-0.630711224396,
--0.354643247441,
--0.690240188967,
-0.613040501717,
--0.384979539051,
--0.689907310996,
-0.594439277891,
--0.415055453419,
--0.688745900523,
-0.574894833844,
--0.444861912629,
--0.686726880725,
-0.554357033689,
--0.474284596157,
--0.683916954789,
-0.680359054357,
--0.532785078076,
--0.503241112921,
-0.676012829877,
--0.510176354066,
--0.531720548403,
-0.670791975688,
--0.486546360394,
--0.559741694480,
-0.664625657257,
--0.461992862538,
--0.587226813659,
-0.657483244315,
--0.436571795870,
--0.614101661369,
-0.649395550601,
--0.410251901778,
--0.640295865946,
-0.640451726038,
--0.382943199598,
--0.665714723058,
-0.622168319300,
--0.413032885730,
--0.665064220782,
-0.602912621107,
--0.442863818629,
--0.663602297660,
-0.582670499105,
--0.472410227639,
--0.661304518580,
-0.561398955062,
--0.501546983139,
--0.658241473138,
-0.654446960427,
--0.539074463749,
--0.530186663847,
-0.649875510950,
--0.515700796417,
--0.558313987684,
-0.644367810339,
--0.491393915953,
--0.585936979856,
-0.637885440141,
--0.466209002469,
--0.612985588145,
-0.630461315159,
--0.440114049122,
--0.639388890937,
-0.610524214804,
--0.469702162626,
--0.637683355249,
-0.589570333716,
--0.498978500105,
--0.635159254074,
-0.567566573620,
--0.527815364751,
--0.631885373499,
-0.627892878372,
--0.544497795931,
--0.556122903246,
-0.623061616905,
--0.520466681381,
--0.583873834927,
-0.617262952030,
--0.495545125983,
--0.611082217190,
-0.595600248780,
--0.524539851666,
--0.608373477124,
-0.572873638477,
--0.553063796833,
--0.604926632717,
-0.600697877351,
--0.549166629956,
--0.581014692318,
-0.509740892985,
-0.858587032424,
--0.054704019708,
-0.505083862528,
-0.862894104207,
--0.017437222806,
-0.424276393266,
-0.905532739396,
--0.000000001077,
-0.485527218439,
-0.870985685678,
--0.075148223519,
-0.480527992402,
-0.876169357698,
--0.037684282522,
-0.371155580903,
-0.928570694543,
--0.000000001209,
-0.466633721374,
-0.874815037512,
--0.130198387931,
-0.460915747478,
-0.882363843185,
--0.094819417663,
-0.456067868618,
-0.888094771199,
--0.057356574024,
-0.451116799777,
-0.892252494139,
--0.019470995389,
-0.451437166376,
-0.865236841817,
--0.218104773852,
-0.446279697618,
-0.875632616795,
--0.184667138114,
-0.440959797305,
-0.884873075674,
--0.150180215433,
-0.435812606548,
-0.892750493708,
--0.114297541343,
-0.431202572933,
-0.898973787276,
--0.076879586932,
-0.426412778319,
-0.903687851145,
--0.038992437455,
-0.260877081116,
-0.965372025982,
--0.000000000267,
-0.424358865154,
-0.873496153136,
--0.238587560490,
-0.419675662001,
-0.884288670135,
--0.204709273349,
-0.414870076333,
-0.893895524226,
--0.169804627536,
-0.410200536058,
-0.902146206069,
--0.133670277522,
-0.405851335393,
-0.908849391777,
--0.096319658571,
-0.401312727207,
-0.914072592245,
--0.058475559759,
-0.398316866803,
-0.917037175770,
--0.019659396641,
-0.404537811643,
-0.855049732395,
--0.324405786143,
-0.400889335129,
-0.868404855176,
--0.291823145905,
-0.396901517479,
-0.880705878152,
--0.258507914019,
-0.392668324953,
-0.891898094191,
--0.224342096266,
-0.388327579256,
-0.901890504602,
--0.189196217983,
-0.384079219164,
-0.910543469618,
--0.152950133514,
-0.380001187585,
-0.917723256467,
--0.115685444091,
-0.375737253482,
-0.923445686314,
--0.077907514227,
-0.372422371603,
-0.927231534385,
--0.039284332407,
-0.378866269556,
-0.845531470505,
--0.376213878238,
-0.375927559769,
-0.860357627193,
--0.344184867676,
-0.372631799612,
-0.874146159976,
--0.311470757725,
-0.369037876158,
-0.886865749507,
--0.277993144360,
-0.365227416662,
-0.898463138571,
--0.243665596151,
-0.361313281033,
-0.908856982934,
--0.208402729158,
-0.357451615644,
-0.917931518893,
--0.172133869696,
-0.353652820029,
-0.925587303437,
--0.134973429242,
-0.349673761336,
-0.931807212378,
--0.097280931289,
-0.346289117662,
-0.936280887749,
--0.058838305758,
-0.344326356404,
-0.938643247168,
--0.019703168063,
-0.351838436445,
-0.833082082696,
--0.426830127955,
-0.349554484410,
-0.849367224368,
--0.395457937836,
-0.346915901212,
-0.864624443597,
--0.363419769717,
-0.343961776975,
-0.878836952425,
--0.330659805590,
-0.340744050319,
-0.891972553962,
--0.297116904854,
-0.337331696377,
-0.903980442276,
--0.262729302900,
-0.333816262573,
-0.914787943131,
--0.227441689107,
-0.330320463490,
-0.924297329518,
--0.191214115708,
-0.326809465443,
-0.932429624434,
--0.154177069552,
-0.323123022669,
-0.939147756278,
--0.116589039358,
-0.319800327043,
-0.944242675406,
--0.078316797465,
-0.317484776367,
-0.947446110534,
--0.039360950301,
-0.323571996438,
-0.817745743233,
--0.476017922505,
-0.321871272122,
-0.835467795426,
--0.445412670440,
-0.319833413052,
-0.852168520853,
--0.414144177747,
-0.317484900037,
-0.867841819592,
--0.382170007216,
-0.314859376865,
-0.882469351288,
--0.349444440272,
-0.312000692048,
-0.896018649928,
--0.315921109048,
-0.308965978748,
-0.908441360534,
--0.281556954182,
-0.305829298505,
-0.919671785835,
--0.246317369496,
-0.302687380683,
-0.929625617612,
--0.210182208227,
-0.299474033040,
-0.938235695411,
--0.173289016939,
-0.296088347093,
-0.945453941358,
--0.135825386016,
-0.292907546226,
-0.951134052444,
--0.097719924500,
-0.290449262594,
-0.955072948874,
--0.058948182227,
-0.289083198661,
-0.957101113211,
--0.019706936380,
-0.000000001455,
-0.999805669655,
--0.019713521409,
-0.291487301526,
-0.836828920699,
--0.463413973171,
-0.289684965611,
-0.853923809695,
--0.432315565225,
-0.287615988421,
-0.869997750055,
--0.400475914512,
-0.285306744065,
-0.885031229079,
--0.367858376750,
-0.282792654174,
-0.898991500407,
--0.334428762131,
-0.280119562447,
-0.911832203878,
--0.300158396027,
-0.277347343869,
-0.923492778259,
--0.265027431319,
-0.274552898150,
-0.933898543492,
--0.229028855343,
-0.271648406695,
-0.942988462108,
--0.192301595082,
-0.268572828009,
-0.950709570841,
--0.154983702260,
-0.265588961928,
-0.956954734078,
--0.117047598125,
-0.263124479574,
-0.961566224132,
--0.078459574667,
-0.261466546902,
-0.964409293307,
--0.039369529270,
-0.058762968974,
-0.998077672616,
--0.019694489174,
-0.029428229681,
-0.998790334550,
--0.039393488134,
-0.000000000468,
-0.998253983067,
--0.059067633195,
-0.259090041412,
-0.854617400873,
--0.450001609514,
-0.257291187958,
-0.871075888171,
--0.418363528103,
-0.255288587675,
-0.886505704830,
--0.385921458728,
-0.253108167969,
-0.900873670335,
--0.352651223456,
-0.250785732525,
-0.914134415853,
--0.318535376552,
-0.248367631734,
-0.926231114354,
--0.283565587315,
-0.245917027490,
-0.937095348585,
--0.247744068043,
-0.243333598581,
-0.946668118546,
--0.211206612419,
-0.240578736906,
-0.954895730684,
--0.174057504493,
-0.237833923510,
-0.961695238604,
--0.136298543183,
-0.235458698884,
-0.966941417819,
--0.097895329955,
-0.233674349604,
-0.970525010076,
--0.058970358261,
-0.232706642837,
-0.972347475757,
--0.019697836648,
-0.117313960807,
-0.992899763434,
--0.019684876760,
-0.088201583401,
-0.995324864374,
--0.039356003921,
-0.058968815102,
-0.996514233637,
--0.059008990871,
-0.029577373257,
-0.996464031497,
--0.078642310016,
-0.000000001337,
-0.995166083739,
--0.098206241025,
-0.226492242485,
-0.871056254731,
--0.435846607406,
-0.224792106921,
-0.886871337469,
--0.403643084224,
-0.222938599952,
-0.901643035931,
--0.370591711198,
-0.220960273914,
-0.915325091472,
--0.336684621379,
-0.218891392113,
-0.927862714630,
--0.301922740544,
-0.216780186850,
-0.939192066484,
--0.266316752839,
-0.214530394989,
-0.949251847444,
--0.229994868965,
-0.212107742457,
-0.957990636184,
--0.193039494857,
-0.209636939783,
-0.965340109396,
--0.155469696949,
-0.207422449280,
-0.971198713562,
--0.117256071528,
-0.205634078535,
-0.975475109059,
--0.078504377911,
-0.204456782867,
-0.978084036467,
--0.039357865132,
-0.175377504113,
-0.984304379375,
--0.019688062214,
-0.146628827319,
-0.988408662627,
--0.039348477020,
-0.117738291131,
-0.991292013347,
--0.058973206426,
-0.088660264083,
-0.992959150186,
--0.078558790941,
-0.059359645562,
-0.993404310200,
--0.098103562401,
-0.029809996965,
-0.992612568765,
--0.117608045691,
-0.000000001447,
-0.990571620355,
--0.136995857407,
-0.193800093560,
-0.886105596412,
--0.421020659521,
-0.192277873411,
-0.901273391754,
--0.388246690537,
-0.190642071917,
-0.915377331523,
--0.354598281650,
-0.188921433136,
-0.928360290281,
--0.320087274868,
-0.187146663299,
-0.940160669090,
--0.284735039489,
-0.185240346897,
-0.950713661995,
--0.248655478078,
-0.183161627543,
-0.959969479493,
--0.211920779157,
-0.180995593950,
-0.967869324228,
--0.174555338473,
-0.178998186587,
-0.974328651581,
--0.136540572380,
-0.177299793160,
-0.979268384833,
--0.097970474188,
-0.176047042267,
-0.982613966443,
--0.058968057970,
-0.147421226090,
-0.985951820230,
--0.078523819851,
-0.118539386236,
-0.988099125316,
--0.098023122075,
-0.089372604384,
-0.989047421857,
--0.117463759958,
-0.059900256546,
-0.988780106834,
--0.136842462690,
-0.030108868862,
-0.987272338262,
--0.156162691188,
-0.000000002569,
-0.984512472364,
--0.175314550905,
-0.161114865134,
-0.899740922547,
--0.405596193926,
-0.159827039598,
-0.914262851387,
--0.372261676764,
-0.158457960691,
-0.927692975005,
--0.338048545066,
-0.157030326177,
-0.939968864238,
--0.302985166178,
-0.155469471741,
-0.951024452690,
--0.267173602254,
-0.153743472123,
-0.960804976905,
--0.230687540052,
-0.151910418116,
-0.969259234022,
--0.193545245697,
-0.150175405890,
-0.976315018382,
--0.155744445637,
-0.148641428153,
-0.981901518214,
--0.117367518361,
-0.119638526767,
-0.983362445673,
--0.136692806518,
-0.090277330963,
-0.983632210052,
--0.155941267352,
-0.060549563160,
-0.982685965989,
--0.175105804155,
-0.030458457605,
-0.980491025076,
--0.194189680741,
-0.000000001356,
-0.977040956393,
--0.213051565428,
-0.128519442053,
-0.911949783275,
--0.389654136125,
-0.127507005039,
-0.925830538389,
--0.355780519214,
-0.126439231770,
-0.938587625052,
--0.321039547048,
-0.125233955376,
-0.950152946235,
--0.285527293233,
-0.123861370596,
-0.960468406667,
--0.249316667449,
-0.122383781614,
-0.969482821903,
--0.212427088748,
-0.120947567812,
-0.977136343935,
--0.174860662249,
-0.091312154238,
-0.976766597540,
--0.193879097426,
-0.061270259801,
-0.975174293017,
--0.212793452680,
-0.030830887379,
-0.972324632198,
--0.231590729531,
-0.000000002098,
-0.968214556970,
--0.250121114006,
-0.096084791708,
-0.922736671989,
--0.373262303172,
-0.095381423987,
-0.935983569813,
--0.338876291584,
-0.094543066807,
-0.948065950468,
--0.303698143033,
-0.093532696260,
-0.958924982880,
--0.267795653324,
-0.092414860384,
-0.968509857004,
--0.231188560415,
-0.062018390139,
-0.966304729375,
--0.249817712086,
-0.031208165659,
-0.962832633898,
--0.268289711873,
-0.000000002214,
-0.958093210068,
--0.286456629914,
-0.063875683220,
-0.932118391216,
--0.356476088749,
-0.063407158365,
-0.944727713032,
--0.321666100946,
-0.062768865127,
-0.956139240091,
--0.286108061980,
-0.031583053926,
-0.952076334702,
--0.304225514390,
-0.000000000881,
-0.946738857652,
--0.322002384172,
-0.031848062377,
-0.940101520142,
--0.339403642805,
-0.858587033115,
-0.054704019281,
-0.509740891866,
-0.845456878655,
-0.028214020866,
-0.533297886141,
-0.796013182495,
-0.067686809675,
-0.601482758764,
-0.851514691953,
-0.087181959437,
-0.517031948082,
-0.838485074695,
-0.060974450259,
-0.541502443142,
-0.764556520153,
-0.101366335619,
-0.636536089703,
-0.855155644007,
-0.142348561315,
-0.498443288263,
-0.843371405732,
-0.118918069313,
-0.524006836582,
-0.830738198012,
-0.092804885731,
-0.548872753512,
-0.817104273010,
-0.065915150241,
-0.572709175758,
-0.865236842074,
-0.218104773694,
-0.451437165961,
-0.855929451995,
-0.196844363646,
-0.478160087951,
-0.845588746481,
-0.174459266100,
-0.504523177166,
-0.834274934605,
-0.150437424381,
-0.530428048689,
-0.822094202042,
-0.124393783647,
-0.555596354883,
-0.808868435677,
-0.097594059007,
-0.579833815340,
-0.693740005139,
-0.167877821581,
-0.700386923272,
-0.853789221030,
-0.250767114346,
-0.456245351117,
-0.844927722123,
-0.229035677050,
-0.483363013715,
-0.835057219956,
-0.206168699415,
-0.510072452482,
-0.824238695204,
-0.181819767216,
-0.536257536616,
-0.812529734802,
-0.155848480366,
-0.561699814163,
-0.799775054213,
-0.129115323093,
-0.586250028573,
-0.786838789936,
-0.100126424367,
-0.608982280362,
-0.855049731676,
-0.324405786587,
-0.404537812807,
-0.848707024008,
-0.303997075071,
-0.432761095464,
-0.841336350422,
-0.282839620277,
-0.460602751467,
-0.832949915435,
-0.260774074312,
-0.488048481755,
-0.823573709931,
-0.237598658979,
-0.515046814922,
-0.813262540847,
-0.213073053952,
-0.541483068373,
-0.802037815098,
-0.187182978860,
-0.567184163723,
-0.789775412530,
-0.160520286711,
-0.592020299751,
-0.777051321231,
-0.132100808574,
-0.615419060923,
-0.845531467814,
-0.376213879901,
-0.378866273910,
-0.840669571422,
-0.356352755315,
-0.407783503179,
-0.834788295906,
-0.335795255444,
-0.436314161401,
-0.827895394061,
-0.314438828355,
-0.464453915600,
-0.820003566332,
-0.292156278537,
-0.492177671287,
-0.811137061100,
-0.268796962230,
-0.519427435938,
-0.801342482213,
-0.244189857080,
-0.546096639708,
-0.790613876656,
-0.218391594571,
-0.572044412140,
-0.778857082594,
-0.191809310079,
-0.597152269911,
-0.766476261429,
-0.163783336271,
-0.621038774494,
-0.753976111300,
-0.133833734635,
-0.643124058843,
-0.833082078956,
-0.426830130267,
-0.351838442497,
-0.829682353884,
-0.407623856860,
-0.381405273918,
-0.825275966432,
-0.387738466010,
-0.410583074670,
-0.819868898485,
-0.367104067175,
-0.439374092501,
-0.813468177337,
-0.345635277874,
-0.467766799964,
-0.806085115764,
-0.323231942024,
-0.495729662012,
-0.797740348149,
-0.299781081107,
-0.523203249555,
-0.788471944630,
-0.275158820103,
-0.550090552773,
-0.778252558317,
-0.249463736698,
-0.576273198705,
-0.767013889272,
-0.222973619783,
-0.601641470101,
-0.755046458449,
-0.195246490087,
-0.625926236622,
-0.742736837361,
-0.165878238934,
-0.648711338174,
-0.817745743319,
-0.476017922451,
-0.323571996298,
-0.815773311537,
-0.457584530874,
-0.353737616446,
-0.812812516000,
-0.438467526408,
-0.383512766566,
-0.808868616354,
-0.418617451243,
-0.412905547302,
-0.803945533000,
-0.397974828901,
-0.441913583782,
-0.798048178665,
-0.376470190182,
-0.470520244446,
-0.791185291484,
-0.354025190242,
-0.498690283857,
-0.783373245969,
-0.330554499750,
-0.526364968624,
-0.774641918018,
-0.305967402278,
-0.553456274327,
-0.764946680982,
-0.280387517733,
-0.579861548264,
-0.754239827860,
-0.254002207286,
-0.605479281861,
-0.742731326260,
-0.226519892631,
-0.630110240541,
-0.730730853975,
-0.197599221982,
-0.653442397248,
-0.718513555359,
-0.167162156425,
-0.675125976559,
-0.505994649138,
-0.324905516107,
-0.799003016669,
-0.797435434069,
-0.487760486844,
-0.355227301829,
-0.794914821628,
-0.468785125491,
-0.385163513944,
-0.791438960936,
-0.449027916302,
-0.414726779331,
-0.787008109037,
-0.428439996620,
-0.443911483977,
-0.781623984221,
-0.406965876309,
-0.472697284538,
-0.775291633792,
-0.384545109183,
-0.501046845689,
-0.768023083918,
-0.361112986643,
-0.528902593534,
-0.759841040708,
-0.336602308061,
-0.556183853652,
-0.750686869491,
-0.311150515410,
-0.582798919640,
-0.740527365357,
-0.284883449080,
-0.608654780313,
-0.729513047729,
-0.257614290748,
-0.633597340900,
-0.717900629621,
-0.229053193964,
-0.657383693382,
-0.705901380163,
-0.199136205954,
-0.679741136730,
-0.552665008698,
-0.294974654495,
-0.779455798212,
-0.535376362503,
-0.325799073721,
-0.779247787315,
-0.517379894387,
-0.356264164309,
-0.778070620261,
-0.775975091849,
-0.498605229445,
-0.386335970368,
-0.772972327657,
-0.478994862918,
-0.416026083287,
-0.769041947555,
-0.458518053170,
-0.445348939393,
-0.764180865604,
-0.437132022797,
-0.474281772040,
-0.758389972150,
-0.414790736319,
-0.502785535995,
-0.751675777603,
-0.391446718345,
-0.530804099515,
-0.744055856019,
-0.367049035620,
-0.558261487633,
-0.735461508390,
-0.341739476145,
-0.585073072463,
-0.725866878871,
-0.315605119318,
-0.611155203544,
-0.715377871413,
-0.288531048127,
-0.636383795645,
-0.704212118406,
-0.260270966832,
-0.660563635174,
-0.692531867884,
-0.230779568776,
-0.683476702310,
-0.680524332915,
-0.200054457629,
-0.704886406660,
-0.597441831138,
-0.264091320040,
-0.757178336382,
-0.581180686131,
-0.295311182318,
-0.758300940040,
-0.564198671374,
-0.326194702215,
-0.758470088709,
-0.546462423634,
-0.356758598667,
-0.757695269771,
-0.527930440381,
-0.386973749375,
-0.756003153045,
-0.753448209260,
-0.508532376858,
-0.416786057409,
-0.750028876122,
-0.488216376440,
-0.446207860485,
-0.745701770764,
-0.466968713320,
-0.475256867241,
-0.740464432165,
-0.444754452126,
-0.503890763968,
-0.734317471273,
-0.421540279299,
-0.532054174226,
-0.727271290962,
-0.397290995034,
-0.559675204568,
-0.719256982207,
-0.372139512919,
-0.586669904180,
-0.710246570874,
-0.346153747729,
-0.612966060638,
-0.700312680099,
-0.319265656206,
-0.638460328337,
-0.689641762059,
-0.291267837325,
-0.662991166580,
-0.678358205594,
-0.262132722885,
-0.686379326973,
-0.666613279376,
-0.231857379516,
-0.708427054342,
-0.640119516756,
-0.232406005726,
-0.732280310243,
-0.624988892581,
-0.263954247091,
-0.734654367436,
-0.609122008085,
-0.295167259158,
-0.736102349125,
-0.592483236920,
-0.326066517015,
-0.736643903423,
-0.575040785130,
-0.356666440547,
-0.736286048777,
-0.556765963323,
-0.386976061735,
-0.735024618451,
-0.537619859446,
-0.416935440913,
-0.732891345862,
-0.729942906182,
-0.517534509858,
-0.446476634126,
-0.726167588495,
-0.496468028579,
-0.475605014712,
-0.721498236991,
-0.474422151778,
-0.504345036577,
-0.715933202766,
-0.451374435083,
-0.532635680865,
-0.709473131690,
-0.427307778383,
-0.560406939592,
-0.702058188152,
-0.402333012402,
-0.587573355064,
-0.693652731366,
-0.376513581272,
-0.614071177784,
-0.684303739574,
-0.349808507829,
-0.639814347960,
-0.674170257989,
-0.322048661629,
-0.664664669428,
-0.663347279653,
-0.293220454953,
-0.688470879104,
-0.651954164263,
-0.263327054430,
-0.711065840907,
-0.636507382151,
-0.294492359764,
-0.712834204081,
-0.620240751188,
-0.325372100332,
-0.713746738620,
-0.603125964757,
-0.355976337434,
-0.713806638960,
-0.585137025453,
-0.386307606307,
-0.713008481544,
-0.566251681186,
-0.416367767227,
-0.711334601976,
-0.546431413852,
-0.446063534893,
-0.708830045070,
-0.705551241990,
-0.525612016774,
-0.475320368540,
-0.701469401363,
-0.503775261462,
-0.504134074319,
-0.696504415944,
-0.480930932375,
-0.532528907061,
-0.690652200021,
-0.457071338626,
-0.560433162842,
-0.683850854635,
-0.432295966749,
-0.587765434291,
-0.676069940440,
-0.406663470374,
-0.614454438910,
-0.667336496990,
-0.380143759158,
-0.640431668609,
-0.657779645175,
-0.352610132898,
-0.665576466359,
-0.647472758312,
-0.324055858796,
-0.689758528490,
-0.630711224396,
-0.354643247441,
-0.690240188967,
-0.613040501717,
-0.384979539051,
-0.689907310996,
-0.594439277891,
-0.415055453419,
-0.688745900523,
-0.574894833844,
-0.444861912629,
-0.686726880725,
-0.554357033689,
-0.474284596157,
-0.683916954789,
-0.680359054357,
-0.532785078076,
-0.503241112921,
-0.676012829877,
-0.510176354066,
-0.531720548403,
-0.670791975688,
-0.486546360394,
-0.559741694480,
-0.664625657257,
-0.461992862538,
-0.587226813659,
-0.657483244315,
-0.436571795870,
-0.614101661369,
-0.649395550601,
-0.410251901778,
-0.640295865946,
-0.640451726038,
-0.382943199598,
-0.665714723058,
-0.622168319300,
-0.413032885730,
-0.665064220782,
-0.602912621107,
-0.442863818629,
-0.663602297660,
-0.582670499105,
-0.472410227639,
-0.661304518580,
-0.561398955062,
-0.501546983139,
-0.658241473138,
-0.654446960427,
-0.539074463749,
-0.530186663847,
-0.649875510950,
-0.515700796417,
-0.558313987684,
-0.644367810339,
-0.491393915953,
-0.585936979856,
-0.637885440141,
-0.466209002469,
-0.612985588145,
-0.630461315159,
-0.440114049122,
-0.639388890937,
-0.610524214804,
-0.469702162626,
-0.637683355249,
-0.589570333716,
-0.498978500105,
-0.635159254074,
-0.567566573620,
-0.527815364751,
-0.631885373499,
-0.627892878372,
-0.544497795931,
-0.556122903246,
-0.623061616905,
-0.520466681381,
-0.583873834927,
-0.617262952030,
-0.495545125983,
-0.611082217190,
-0.595600248780,
-0.524539851666,
-0.608373477124,
-0.572873638477,
-0.553063796833,
-0.604926632717,
-0.600697877351,
-0.549166629956,
-0.581014692318,
-0.879482108895,
-0.000000000692,
--0.475931949057,
-0.862894103158,
--0.017437225552,
--0.505083864225,
-0.863699991504,
--0.109519556901,
--0.491963201198,
-0.892252495060,
--0.019470993726,
--0.451116798027,
-0.876169357514,
--0.037684283003,
--0.480527992700,
-0.865922855025,
--0.164014174390,
--0.472521914566,
-0.917037176300,
--0.019659393505,
--0.398316865736,
-0.903687852136,
--0.038992437454,
--0.426412776219,
-0.888094771519,
--0.057356573187,
--0.456067868101,
-0.870985686306,
--0.075148221129,
--0.485527217684,
-0.948545452418,
-0.000000000256,
--0.316641002868,
-0.938643247681,
--0.019703164800,
--0.344326355191,
-0.927231535005,
--0.039284329194,
--0.372422370397,
-0.914072593605,
--0.058475559104,
--0.401312724204,
-0.898973787924,
--0.076879585234,
--0.431202571884,
-0.882363843033,
--0.094819415468,
--0.460915748221,
-0.861617826555,
--0.271632020843,
--0.428754902264,
-0.957101113700,
--0.019706932107,
--0.289083197335,
-0.947446110431,
--0.039360948013,
--0.317484776960,
-0.936280888107,
--0.058838304270,
--0.346289116948,
-0.923445687626,
--0.077907510865,
--0.375737250957,
-0.908849392386,
--0.096319656975,
--0.405851334406,
-0.892750493863,
--0.114297538032,
--0.435812607099,
-0.874815038980,
--0.130198385834,
--0.466633719206,
-0.978961716279,
--0.000000000719,
--0.204044010104,
-0.972347476206,
--0.019697831168,
--0.232706641423,
-0.964409293475,
--0.039369527730,
--0.261466546513,
-0.955072949147,
--0.058948178756,
--0.290449262399,
-0.944242675654,
--0.078316794670,
--0.319800326996,
-0.931807213703,
--0.097280928771,
--0.349673758507,
-0.917723257506,
--0.115685441369,
--0.380001185903,
-0.902146207470,
--0.133670273785,
--0.410200534195,
-0.884873077152,
--0.150180213154,
--0.440959795116,
-0.989232383924,
--0.000000002691,
--0.146353307429,
-0.984304380100,
--0.019688055771,
--0.175377500770,
-0.978084036575,
--0.039357864070,
--0.204456782556,
-0.970525010562,
--0.058970355447,
--0.233674348299,
-0.961566224559,
--0.078459572239,
--0.263124478738,
-0.951134053362,
--0.097719921834,
--0.292907544136,
-0.939147757206,
--0.116589036680,
--0.323123020940,
-0.925587304377,
--0.134973426781,
--0.353652818509,
-0.910543470680,
--0.152950129784,
--0.384079218133,
-0.893895524901,
--0.169804626320,
--0.414870075375,
-0.875632618386,
--0.184667135868,
--0.446279695426,
-0.996116682724,
--0.000000003740,
--0.088042912258,
-0.992899764040,
--0.019684870484,
--0.117313956730,
-0.988408662574,
--0.039348477165,
--0.146628827637,
-0.982613967092,
--0.058968053940,
--0.176047039993,
-0.975475109379,
--0.078504376625,
--0.205634077507,
-0.966941418755,
--0.097895326512,
--0.235458696468,
-0.956954734930,
--0.117047594982,
--0.265588960246,
-0.945453942097,
--0.135825384888,
--0.296088345249,
-0.932429625746,
--0.154177066117,
--0.326809463320,
-0.917931520016,
--0.172133867007,
--0.357451614055,
-0.901890505813,
--0.189196216957,
--0.388327576942,
-0.884288671180,
--0.204709273173,
--0.419675659885,
-0.999568410409,
-0.000000000087,
--0.029376741022,
-0.998077673059,
--0.019694483889,
--0.058762963205,
-0.995324864317,
--0.039356004853,
--0.088201583622,
-0.991292013656,
--0.058973203238,
--0.117738290124,
-0.985951820633,
--0.078523818288,
--0.147421224225,
-0.979268385692,
--0.097970471263,
--0.177299790028,
-0.971198714273,
--0.117256069050,
--0.207422447354,
-0.961695239351,
--0.136298539866,
--0.237833922391,
-0.950709571782,
--0.154983699593,
--0.268572826219,
-0.938235696369,
--0.173289014429,
--0.299474031489,
-0.924297330053,
--0.191214113498,
--0.330320463271,
-0.908856984171,
--0.208402726185,
--0.361313279637,
-0.891898095766,
--0.224342094899,
--0.392668322157,
-0.873496155288,
--0.238587557852,
--0.424358862210,
-0.818716538977,
--0.493811020516,
--0.293008369884,
-0.998790334632,
--0.039393486630,
--0.029428228917,
-0.996514233945,
--0.059008988066,
--0.058968812703,
-0.992959150394,
--0.078558789119,
--0.088660263368,
-0.988099125779,
--0.098023120043,
--0.118539384056,
-0.981901518718,
--0.117367516186,
--0.148641426540,
-0.974328652222,
--0.136540570086,
--0.178998184851,
-0.965340110054,
--0.155469694342,
--0.209636938687,
-0.954895731762,
--0.174057502784,
--0.240578733861,
-0.942988463049,
--0.192301592617,
--0.271648405172,
-0.929625618738,
--0.210182205485,
--0.302687379130,
-0.914787944534,
--0.227441686350,
--0.333816260608,
-0.898463139698,
--0.243665594511,
--0.365227414984,
-0.880705878907,
--0.258507913144,
--0.396901516376,
-0.835467799492,
--0.445412663918,
--0.321871270594,
-0.836828921621,
--0.463413972047,
--0.291487300666,
-0.837138253746,
--0.480874088680,
--0.260690726632,
-0.996464031622,
--0.078642309025,
--0.029577371671,
-0.993404310554,
--0.098103560514,
--0.059359642752,
-0.989047422243,
--0.117463757275,
--0.089372603636,
-0.983362446131,
--0.136692804730,
--0.119638525039,
-0.976315019141,
--0.155744443703,
--0.150175402964,
-0.967869324947,
--0.174555336751,
--0.180995591764,
-0.957990637077,
--0.193039492566,
--0.212107740505,
-0.946668119411,
--0.211206610157,
--0.243333597183,
-0.933898544415,
--0.229028851813,
--0.274552897957,
-0.919671787235,
--0.246317367191,
--0.305829296149,
-0.903980443986,
--0.262729299413,
--0.337331694510,
-0.886865750925,
--0.277993142192,
--0.369037874384,
-0.868404857990,
--0.291823142842,
--0.400889331264,
-0.849367228276,
--0.395457932296,
--0.349554481184,
-0.852168520364,
--0.414144178243,
--0.319833413713,
-0.853923811589,
--0.432315562263,
--0.289684964446,
-0.854617401757,
--0.450001607863,
--0.259090041364,
-0.854209394896,
--0.467235643358,
--0.228072714827,
-0.992612568859,
--0.117608045472,
--0.029809994679,
-0.988780107188,
--0.136842461347,
--0.059900253764,
-0.983632210614,
--0.155941265167,
--0.090277328605,
-0.977136344790,
--0.174860659307,
--0.120947565159,
-0.969259234940,
--0.193545243357,
--0.151910415236,
-0.959969480968,
--0.211920775522,
--0.183161624017,
-0.949251848868,
--0.229994865237,
--0.214530392685,
-0.937095349611,
--0.247744065310,
--0.245917026336,
-0.923492779370,
--0.265027429297,
--0.277347342105,
-0.908441361793,
--0.281556951503,
--0.308965977486,
-0.891972554664,
--0.297116903465,
--0.340744049693,
-0.874146160516,
--0.311470757091,
--0.372631798875,
-0.860357630861,
--0.344184862619,
--0.375927556003,
-0.864624443469,
--0.363419770045,
--0.346915901187,
-0.867841821247,
--0.382170005262,
--0.317484897866,
-0.869997751019,
--0.400475913266,
--0.287615987240,
-0.871075889696,
--0.418363525069,
--0.257291187727,
-0.871056255471,
--0.435846605441,
--0.226492243422,
-0.869887204164,
--0.452951760909,
--0.195271488757,
-0.987272338490,
--0.156162690230,
--0.030108866347,
-0.982685966302,
--0.175105803259,
--0.060549560681,
-0.976766598358,
--0.193879094531,
--0.091312151634,
-0.969482822614,
--0.212427087515,
--0.122383778116,
-0.960804977881,
--0.230687537400,
--0.153743470000,
-0.950713663612,
--0.248655473843,
--0.185240344280,
-0.939192068197,
--0.266316748126,
--0.216780185217,
-0.926231115309,
--0.283565584654,
--0.248367631212,
-0.911832205044,
--0.300158393592,
--0.280119561262,
-0.896018651663,
--0.315921105180,
--0.312000690982,
-0.878836954617,
--0.330659802180,
--0.343961774652,
-0.882469352320,
--0.349444438079,
--0.314859376408,
-0.885031230395,
--0.367858374127,
--0.285306743367,
-0.886505706090,
--0.385921457100,
--0.255288585759,
-0.886871338714,
--0.403643081381,
--0.224792107116,
-0.886105597484,
--0.421020657075,
--0.193800093972,
-0.884144597563,
--0.438081058513,
--0.162398635376,
-0.980491025211,
--0.194189680557,
--0.030458454429,
-0.975174293876,
--0.212793450024,
--0.061270255346,
-0.968509857621,
--0.231188559060,
--0.092414857302,
-0.960468407862,
--0.249316664217,
--0.123861367840,
-0.951024454294,
--0.267173598055,
--0.155469469146,
-0.940160670282,
--0.284735036464,
--0.187146661913,
-0.927862715947,
--0.301922737031,
--0.218891391377,
-0.914134417110,
--0.318535373208,
--0.250785732189,
-0.898991501585,
--0.334428759902,
--0.282792653065,
-0.900873671391,
--0.352651221277,
--0.253108167245,
-0.901643037296,
--0.370591708334,
--0.222938599190,
-0.901273392715,
--0.388246688098,
--0.192277873829,
-0.899740923511,
--0.405596191232,
--0.161114866532,
-0.896968521055,
--0.422683922704,
--0.129559923295,
-0.972324632450,
--0.231590728918,
--0.030830884021,
-0.966304730534,
--0.249817708512,
--0.062018386482,
-0.958924984274,
--0.267795649364,
--0.093532693308,
-0.950152947861,
--0.285527288979,
--0.125233952746,
-0.939968865739,
--0.302985162353,
--0.157030324571,
-0.928360291402,
--0.320087271301,
--0.188921433667,
-0.915325093071,
--0.336684617897,
--0.220960272596,
-0.915377333113,
--0.354598278240,
--0.190642070625,
-0.914262853396,
--0.372261671910,
--0.159827039411,
-0.911949784415,
--0.389654133093,
--0.128519443158,
-0.908362588441,
--0.406815601908,
--0.096842521471,
-0.962832634097,
--0.268289711562,
--0.031208162206,
-0.956139241186,
--0.286108058864,
--0.062768862639,
-0.948065951577,
--0.303698140129,
--0.094543065012,
-0.938587626817,
--0.321039542739,
--0.126439229612,
-0.927692976135,
--0.338048541845,
--0.158457960946,
-0.925830540369,
--0.355780514571,
--0.127507003618,
-0.922736673051,
--0.373262300183,
--0.096084793122,
-0.918342004781,
--0.390526636448,
--0.064318803462,
-0.952076335280,
--0.304225512844,
--0.031583051379,
-0.944727714873,
--0.321666096127,
--0.063407155387,
-0.935983571254,
--0.338876288061,
--0.095381422371,
-0.932118392308,
--0.356476085922,
--0.063875683064,
-0.926929017434,
--0.373865219175,
--0.032052995666,
-0.940101520148,
--0.339403642791,
--0.031848062368,
-0.000000000692,
-0.475931949057,
--0.879482108895,
--0.017437225552,
-0.505083864225,
--0.862894103158,
--0.109519556901,
-0.491963201198,
--0.863699991504,
--0.019470993726,
-0.451116798027,
--0.892252495060,
--0.037684283003,
-0.480527992700,
--0.876169357514,
--0.164014174390,
-0.472521914566,
--0.865922855025,
--0.019659393505,
-0.398316865736,
--0.917037176300,
--0.038992437454,
-0.426412776219,
--0.903687852136,
--0.057356573187,
-0.456067868101,
--0.888094771519,
--0.075148221129,
-0.485527217684,
--0.870985686306,
-0.000000000256,
-0.316641002868,
--0.948545452418,
--0.019703164800,
-0.344326355191,
--0.938643247681,
--0.039284329194,
-0.372422370397,
--0.927231535005,
--0.058475559104,
-0.401312724204,
--0.914072593605,
--0.076879585234,
-0.431202571884,
--0.898973787924,
--0.094819415468,
-0.460915748221,
--0.882363843033,
--0.271632020843,
-0.428754902264,
--0.861617826555,
--0.019706932107,
-0.289083197335,
--0.957101113700,
--0.039360948013,
-0.317484776960,
--0.947446110431,
--0.058838304270,
-0.346289116948,
--0.936280888107,
--0.077907510865,
-0.375737250957,
--0.923445687626,
--0.096319656975,
-0.405851334406,
--0.908849392386,
--0.114297538032,
-0.435812607099,
--0.892750493863,
--0.130198385834,
-0.466633719206,
--0.874815038980,
--0.000000000719,
-0.204044010104,
--0.978961716279,
--0.019697831168,
-0.232706641423,
--0.972347476206,
--0.039369527730,
-0.261466546513,
--0.964409293475,
--0.058948178756,
-0.290449262399,
--0.955072949147,
--0.078316794670,
-0.319800326996,
--0.944242675654,
--0.097280928771,
-0.349673758507,
--0.931807213703,
--0.115685441369,
-0.380001185903,
--0.917723257506,
--0.133670273785,
-0.410200534195,
--0.902146207470,
--0.150180213154,
-0.440959795116,
--0.884873077152,
--0.000000002691,
-0.146353307429,
--0.989232383924,
--0.019688055771,
-0.175377500770,
--0.984304380100,
--0.039357864070,
-0.204456782556,
--0.978084036575,
--0.058970355447,
-0.233674348299,
--0.970525010562,
--0.078459572239,
-0.263124478738,
--0.961566224559,
--0.097719921834,
-0.292907544136,
--0.951134053362,
--0.116589036680,
-0.323123020940,
--0.939147757206,
--0.134973426781,
-0.353652818509,
--0.925587304377,
--0.152950129784,
-0.384079218133,
--0.910543470680,
--0.169804626320,
-0.414870075375,
--0.893895524901,
--0.184667135868,
-0.446279695426,
--0.875632618386,
--0.000000003740,
-0.088042912258,
--0.996116682724,
--0.019684870484,
-0.117313956730,
--0.992899764040,
--0.039348477165,
-0.146628827637,
--0.988408662574,
--0.058968053940,
-0.176047039993,
--0.982613967092,
--0.078504376625,
-0.205634077507,
--0.975475109379,
--0.097895326512,
-0.235458696468,
--0.966941418755,
--0.117047594982,
-0.265588960246,
--0.956954734930,
--0.135825384888,
-0.296088345249,
--0.945453942097,
--0.154177066117,
-0.326809463320,
--0.932429625746,
--0.172133867007,
-0.357451614055,
--0.917931520016,
--0.189196216957,
-0.388327576942,
--0.901890505813,
--0.204709273173,
-0.419675659885,
--0.884288671180,
-0.000000000087,
-0.029376741022,
--0.999568410409,
--0.019694483889,
-0.058762963205,
--0.998077673059,
--0.039356004853,
-0.088201583622,
--0.995324864317,
--0.058973203238,
-0.117738290124,
--0.991292013656,
--0.078523818288,
-0.147421224225,
--0.985951820633,
--0.097970471263,
-0.177299790028,
--0.979268385692,
--0.117256069050,
-0.207422447354,
--0.971198714273,
--0.136298539866,
-0.237833922391,
--0.961695239351,
--0.154983699593,
-0.268572826219,
--0.950709571782,
--0.173289014429,
-0.299474031489,
--0.938235696369,
--0.191214113498,
-0.330320463271,
--0.924297330053,
--0.208402726185,
-0.361313279637,
--0.908856984171,
--0.224342094899,
-0.392668322157,
--0.891898095766,
--0.238587557852,
-0.424358862210,
--0.873496155288,
--0.493811020516,
-0.293008369884,
--0.818716538977,
--0.039393486630,
-0.029428228917,
--0.998790334632,
--0.059008988066,
-0.058968812703,
--0.996514233945,
--0.078558789119,
-0.088660263368,
--0.992959150394,
--0.098023120043,
-0.118539384056,
--0.988099125779,
--0.117367516186,
-0.148641426540,
--0.981901518718,
--0.136540570086,
-0.178998184851,
--0.974328652222,
--0.155469694342,
-0.209636938687,
--0.965340110054,
--0.174057502784,
-0.240578733861,
--0.954895731762,
--0.192301592617,
-0.271648405172,
--0.942988463049,
--0.210182205485,
-0.302687379130,
--0.929625618738,
--0.227441686350,
-0.333816260608,
--0.914787944534,
--0.243665594511,
-0.365227414984,
--0.898463139698,
--0.258507913144,
-0.396901516376,
--0.880705878907,
--0.445412663918,
-0.321871270594,
--0.835467799492,
--0.463413972047,
-0.291487300666,
--0.836828921621,
--0.480874088680,
-0.260690726632,
--0.837138253746,
--0.078642309025,
-0.029577371671,
--0.996464031622,
--0.098103560514,
-0.059359642752,
--0.993404310554,
--0.117463757275,
-0.089372603636,
--0.989047422243,
--0.136692804730,
-0.119638525039,
--0.983362446131,
--0.155744443703,
-0.150175402964,
--0.976315019141,
--0.174555336751,
-0.180995591764,
--0.967869324947,
--0.193039492566,
-0.212107740505,
--0.957990637077,
--0.211206610157,
-0.243333597183,
--0.946668119411,
--0.229028851813,
-0.274552897957,
--0.933898544415,
--0.246317367191,
-0.305829296149,
--0.919671787235,
--0.262729299413,
-0.337331694510,
--0.903980443986,
--0.277993142192,
-0.369037874384,
--0.886865750925,
--0.291823142842,
-0.400889331264,
--0.868404857990,
--0.395457932296,
-0.349554481184,
--0.849367228276,
--0.414144178243,
-0.319833413713,
--0.852168520364,
--0.432315562263,
-0.289684964446,
--0.853923811589,
--0.450001607863,
-0.259090041364,
--0.854617401757,
--0.467235643358,
-0.228072714827,
--0.854209394896,
--0.117608045472,
-0.029809994679,
--0.992612568859,
--0.136842461347,
-0.059900253764,
--0.988780107188,
--0.155941265167,
-0.090277328605,
--0.983632210614,
--0.174860659307,
-0.120947565159,
--0.977136344790,
--0.193545243357,
-0.151910415236,
--0.969259234940,
--0.211920775522,
-0.183161624017,
--0.959969480968,
--0.229994865237,
-0.214530392685,
--0.949251848868,
--0.247744065310,
-0.245917026336,
--0.937095349611,
--0.265027429297,
-0.277347342105,
--0.923492779370,
--0.281556951503,
-0.308965977486,
--0.908441361793,
--0.297116903465,
-0.340744049693,
--0.891972554664,
--0.311470757091,
-0.372631798875,
--0.874146160516,
--0.344184862619,
-0.375927556003,
--0.860357630861,
--0.363419770045,
-0.346915901187,
--0.864624443469,
--0.382170005262,
-0.317484897866,
--0.867841821247,
--0.400475913266,
-0.287615987240,
--0.869997751019,
--0.418363525069,
-0.257291187727,
--0.871075889696,
--0.435846605441,
-0.226492243422,
--0.871056255471,
--0.452951760909,
-0.195271488757,
--0.869887204164,
--0.156162690230,
-0.030108866347,
--0.987272338490,
--0.175105803259,
-0.060549560681,
--0.982685966302,
--0.193879094531,
-0.091312151634,
--0.976766598358,
--0.212427087515,
-0.122383778116,
--0.969482822614,
--0.230687537400,
-0.153743470000,
--0.960804977881,
--0.248655473843,
-0.185240344280,
--0.950713663612,
--0.266316748126,
-0.216780185217,
--0.939192068197,
--0.283565584654,
-0.248367631212,
--0.926231115309,
--0.300158393592,
-0.280119561262,
--0.911832205044,
--0.315921105180,
-0.312000690982,
--0.896018651663,
--0.330659802180,
-0.343961774652,
--0.878836954617,
--0.349444438079,
-0.314859376408,
--0.882469352320,
--0.367858374127,
-0.285306743367,
--0.885031230395,
--0.385921457100,
-0.255288585759,
--0.886505706090,
--0.403643081381,
-0.224792107116,
--0.886871338714,
--0.421020657075,
-0.193800093972,
--0.886105597484,
--0.438081058513,
-0.162398635376,
--0.884144597563,
--0.194189680557,
-0.030458454429,
--0.980491025211,
--0.212793450024,
-0.061270255346,
--0.975174293876,
--0.231188559060,
-0.092414857302,
--0.968509857621,
--0.249316664217,
-0.123861367840,
--0.960468407862,
--0.267173598055,
-0.155469469146,
--0.951024454294,
--0.284735036464,
-0.187146661913,
--0.940160670282,
--0.301922737031,
-0.218891391377,
--0.927862715947,
--0.318535373208,
-0.250785732189,
--0.914134417110,
--0.334428759902,
-0.282792653065,
--0.898991501585,
--0.352651221277,
-0.253108167245,
--0.900873671391,
--0.370591708334,
-0.222938599190,
--0.901643037296,
--0.388246688098,
-0.192277873829,
--0.901273392715,
--0.405596191232,
-0.161114866532,
--0.899740923511,
--0.422683922704,
-0.129559923295,
--0.896968521055,
--0.231590728918,
-0.030830884021,
--0.972324632450,
--0.249817708512,
-0.062018386482,
--0.966304730534,
--0.267795649364,
-0.093532693308,
--0.958924984274,
--0.285527288979,
-0.125233952746,
--0.950152947861,
--0.302985162353,
-0.157030324571,
--0.939968865739,
--0.320087271301,
-0.188921433667,
--0.928360291402,
--0.336684617897,
-0.220960272596,
--0.915325093071,
--0.354598278240,
-0.190642070625,
--0.915377333113,
--0.372261671910,
-0.159827039411,
--0.914262853396,
--0.389654133093,
-0.128519443158,
--0.911949784415,
--0.406815601908,
-0.096842521471,
--0.908362588441,
--0.268289711562,
-0.031208162206,
--0.962832634097,
--0.286108058864,
-0.062768862639,
--0.956139241186,
--0.303698140129,
-0.094543065012,
--0.948065951577,
--0.321039542739,
-0.126439229612,
--0.938587626817,
--0.338048541845,
-0.158457960946,
--0.927692976135,
--0.355780514571,
-0.127507003618,
--0.925830540369,
--0.373262300183,
-0.096084793122,
--0.922736673051,
--0.390526636448,
-0.064318803462,
--0.918342004781,
--0.304225512844,
-0.031583051379,
--0.952076335280,
--0.321666096127,
-0.063407155387,
--0.944727714873,
--0.338876288061,
-0.095381422371,
--0.935983571254,
--0.356476085922,
-0.063875683064,
--0.932118392308,
--0.373865219175,
-0.032052995666,
--0.926929017434,
--0.339403642791,
-0.031848062368,
--0.940101520148,
-0.509740892985,
--0.858587032424,
-0.054704019708,
-0.505083862528,
--0.862894104207,
-0.017437222806,
-0.424276393266,
--0.905532739396,
-0.000000001077,
-0.485527218439,
--0.870985685678,
-0.075148223519,
-0.480527992402,
--0.876169357698,
-0.037684282522,
-0.371155580903,
--0.928570694543,
-0.000000001209,
-0.466633721374,
--0.874815037512,
-0.130198387931,
-0.460915747478,
--0.882363843185,
-0.094819417663,
-0.456067868618,
--0.888094771199,
-0.057356574024,
-0.451116799777,
--0.892252494139,
-0.019470995389,
-0.451437166376,
--0.865236841817,
-0.218104773852,
-0.446279697618,
--0.875632616795,
-0.184667138114,
-0.440959797305,
--0.884873075674,
-0.150180215433,
-0.435812606548,
--0.892750493708,
-0.114297541343,
-0.431202572933,
--0.898973787276,
-0.076879586932,
-0.426412778319,
--0.903687851145,
-0.038992437455,
-0.260877081116,
--0.965372025982,
-0.000000000267,
-0.424358865154,
--0.873496153136,
-0.238587560490,
-0.419675662001,
--0.884288670135,
-0.204709273349,
-0.414870076333,
--0.893895524226,
-0.169804627536,
-0.410200536058,
--0.902146206069,
-0.133670277522,
-0.405851335393,
--0.908849391777,
-0.096319658571,
-0.401312727207,
--0.914072592245,
-0.058475559759,
-0.398316866803,
--0.917037175770,
-0.019659396641,
-0.404537811643,
--0.855049732395,
-0.324405786143,
-0.400889335129,
--0.868404855176,
-0.291823145905,
-0.396901517479,
--0.880705878152,
-0.258507914019,
-0.392668324953,
--0.891898094191,
-0.224342096266,
-0.388327579256,
--0.901890504602,
-0.189196217983,
-0.384079219164,
--0.910543469618,
-0.152950133514,
-0.380001187585,
--0.917723256467,
-0.115685444091,
-0.375737253482,
--0.923445686314,
-0.077907514227,
-0.372422371603,
--0.927231534385,
-0.039284332407,
-0.378866269556,
--0.845531470505,
-0.376213878238,
-0.375927559769,
--0.860357627193,
-0.344184867676,
-0.372631799612,
--0.874146159976,
-0.311470757725,
-0.369037876158,
--0.886865749507,
-0.277993144360,
-0.365227416662,
--0.898463138571,
-0.243665596151,
-0.361313281033,
--0.908856982934,
-0.208402729158,
-0.357451615644,
--0.917931518893,
-0.172133869696,
-0.353652820029,
--0.925587303437,
-0.134973429242,
-0.349673761336,
--0.931807212378,
-0.097280931289,
-0.346289117662,
--0.936280887749,
-0.058838305758,
-0.344326356404,
--0.938643247168,
-0.019703168063,
-0.351838436445,
--0.833082082696,
-0.426830127955,
-0.349554484410,
--0.849367224368,
-0.395457937836,
-0.346915901212,
--0.864624443597,
-0.363419769717,
-0.343961776975,
--0.878836952425,
-0.330659805590,
-0.340744050319,
--0.891972553962,
-0.297116904854,
-0.337331696377,
--0.903980442276,
-0.262729302900,
-0.333816262573,
--0.914787943131,
-0.227441689107,
-0.330320463490,
--0.924297329518,
-0.191214115708,
-0.326809465443,
--0.932429624434,
-0.154177069552,
-0.323123022669,
--0.939147756278,
-0.116589039358,
-0.319800327043,
--0.944242675406,
-0.078316797465,
-0.317484776367,
--0.947446110534,
-0.039360950301,
-0.323571996438,
--0.817745743233,
-0.476017922505,
-0.321871272122,
--0.835467795426,
-0.445412670440,
-0.319833413052,
--0.852168520853,
-0.414144177747,
-0.317484900037,
--0.867841819592,
-0.382170007216,
-0.314859376865,
--0.882469351288,
-0.349444440272,
-0.312000692048,
--0.896018649928,
-0.315921109048,
-0.308965978748,
--0.908441360534,
-0.281556954182,
-0.305829298505,
--0.919671785835,
-0.246317369496,
-0.302687380683,
--0.929625617612,
-0.210182208227,
-0.299474033040,
--0.938235695411,
-0.173289016939,
-0.296088347093,
--0.945453941358,
-0.135825386016,
-0.292907546226,
--0.951134052444,
-0.097719924500,
-0.290449262594,
--0.955072948874,
-0.058948182227,
-0.289083198661,
--0.957101113211,
-0.019706936380,
-0.000000001455,
--0.999805669655,
-0.019713521409,
-0.291487301526,
--0.836828920699,
-0.463413973171,
-0.289684965611,
--0.853923809695,
-0.432315565225,
-0.287615988421,
--0.869997750055,
-0.400475914512,
-0.285306744065,
--0.885031229079,
-0.367858376750,
-0.282792654174,
--0.898991500407,
-0.334428762131,
-0.280119562447,
--0.911832203878,
-0.300158396027,
-0.277347343869,
--0.923492778259,
-0.265027431319,
-0.274552898150,
--0.933898543492,
-0.229028855343,
-0.271648406695,
--0.942988462108,
-0.192301595082,
-0.268572828009,
--0.950709570841,
-0.154983702260,
-0.265588961928,
--0.956954734078,
-0.117047598125,
-0.263124479574,
--0.961566224132,
-0.078459574667,
-0.261466546902,
--0.964409293307,
-0.039369529270,
-0.058762968974,
--0.998077672616,
-0.019694489174,
-0.029428229681,
--0.998790334550,
-0.039393488134,
-0.000000000468,
--0.998253983067,
-0.059067633195,
-0.259090041412,
--0.854617400873,
-0.450001609514,
-0.257291187958,
--0.871075888171,
-0.418363528103,
-0.255288587675,
--0.886505704830,
-0.385921458728,
-0.253108167969,
--0.900873670335,
-0.352651223456,
-0.250785732525,
--0.914134415853,
-0.318535376552,
-0.248367631734,
--0.926231114354,
-0.283565587315,
-0.245917027490,
--0.937095348585,
-0.247744068043,
-0.243333598581,
--0.946668118546,
-0.211206612419,
-0.240578736906,
--0.954895730684,
-0.174057504493,
-0.237833923510,
--0.961695238604,
-0.136298543183,
-0.235458698884,
--0.966941417819,
-0.097895329955,
-0.233674349604,
--0.970525010076,
-0.058970358261,
-0.232706642837,
--0.972347475757,
-0.019697836648,
-0.117313960807,
--0.992899763434,
-0.019684876760,
-0.088201583401,
--0.995324864374,
-0.039356003921,
-0.058968815102,
--0.996514233637,
-0.059008990871,
-0.029577373257,
--0.996464031497,
-0.078642310016,
-0.000000001337,
--0.995166083739,
-0.098206241025,
-0.226492242485,
--0.871056254731,
-0.435846607406,
-0.224792106921,
--0.886871337469,
-0.403643084224,
-0.222938599952,
--0.901643035931,
-0.370591711198,
-0.220960273914,
--0.915325091472,
-0.336684621379,
-0.218891392113,
--0.927862714630,
-0.301922740544,
-0.216780186850,
--0.939192066484,
-0.266316752839,
-0.214530394989,
--0.949251847444,
-0.229994868965,
-0.212107742457,
--0.957990636184,
-0.193039494857,
-0.209636939783,
--0.965340109396,
-0.155469696949,
-0.207422449280,
--0.971198713562,
-0.117256071528,
-0.205634078535,
--0.975475109059,
-0.078504377911,
-0.204456782867,
--0.978084036467,
-0.039357865132,
-0.175377504113,
--0.984304379375,
-0.019688062214,
-0.146628827319,
--0.988408662627,
-0.039348477020,
-0.117738291131,
--0.991292013347,
-0.058973206426,
-0.088660264083,
--0.992959150186,
-0.078558790941,
-0.059359645562,
--0.993404310200,
-0.098103562401,
-0.029809996965,
--0.992612568765,
-0.117608045691,
-0.000000001447,
--0.990571620355,
-0.136995857407,
-0.193800093560,
--0.886105596412,
-0.421020659521,
-0.192277873411,
--0.901273391754,
-0.388246690537,
-0.190642071917,
--0.915377331523,
-0.354598281650,
-0.188921433136,
--0.928360290281,
-0.320087274868,
-0.187146663299,
--0.940160669090,
-0.284735039489,
-0.185240346897,
--0.950713661995,
-0.248655478078,
-0.183161627543,
--0.959969479493,
-0.211920779157,
-0.180995593950,
--0.967869324228,
-0.174555338473,
-0.178998186587,
--0.974328651581,
-0.136540572380,
-0.177299793160,
--0.979268384833,
-0.097970474188,
-0.176047042267,
--0.982613966443,
-0.058968057970,
-0.147421226090,
--0.985951820230,
-0.078523819851,
-0.118539386236,
--0.988099125316,
-0.098023122075,
-0.089372604384,
--0.989047421857,
-0.117463759958,
-0.059900256546,
--0.988780106834,
-0.136842462690,
-0.030108868862,
--0.987272338262,
-0.156162691188,
-0.000000002569,
--0.984512472364,
-0.175314550905,
-0.161114865134,
--0.899740922547,
-0.405596193926,
-0.159827039598,
--0.914262851387,
-0.372261676764,
-0.158457960691,
--0.927692975005,
-0.338048545066,
-0.157030326177,
--0.939968864238,
-0.302985166178,
-0.155469471741,
--0.951024452690,
-0.267173602254,
-0.153743472123,
--0.960804976905,
-0.230687540052,
-0.151910418116,
--0.969259234022,
-0.193545245697,
-0.150175405890,
--0.976315018382,
-0.155744445637,
-0.148641428153,
--0.981901518214,
-0.117367518361,
-0.119638526767,
--0.983362445673,
-0.136692806518,
-0.090277330963,
--0.983632210052,
-0.155941267352,
-0.060549563160,
--0.982685965989,
-0.175105804155,
-0.030458457605,
--0.980491025076,
-0.194189680741,
-0.000000001356,
--0.977040956393,
-0.213051565428,
-0.128519442053,
--0.911949783275,
-0.389654136125,
-0.127507005039,
--0.925830538389,
-0.355780519214,
-0.126439231770,
--0.938587625052,
-0.321039547048,
-0.125233955376,
--0.950152946235,
-0.285527293233,
-0.123861370596,
--0.960468406667,
-0.249316667449,
-0.122383781614,
--0.969482821903,
-0.212427088748,
-0.120947567812,
--0.977136343935,
-0.174860662249,
-0.091312154238,
--0.976766597540,
-0.193879097426,
-0.061270259801,
--0.975174293017,
-0.212793452680,
-0.030830887379,
--0.972324632198,
-0.231590729531,
-0.000000002098,
--0.968214556970,
-0.250121114006,
-0.096084791708,
--0.922736671989,
-0.373262303172,
-0.095381423987,
--0.935983569813,
-0.338876291584,
-0.094543066807,
--0.948065950468,
-0.303698143033,
-0.093532696260,
--0.958924982880,
-0.267795653324,
-0.092414860384,
--0.968509857004,
-0.231188560415,
-0.062018390139,
--0.966304729375,
-0.249817712086,
-0.031208165659,
--0.962832633898,
-0.268289711873,
-0.000000002214,
--0.958093210068,
-0.286456629914,
-0.063875683220,
--0.932118391216,
-0.356476088749,
-0.063407158365,
--0.944727713032,
-0.321666100946,
-0.062768865127,
--0.956139240091,
-0.286108061980,
-0.031583053926,
--0.952076334702,
-0.304225514390,
-0.000000000881,
--0.946738857652,
-0.322002384172,
-0.031848062377,
--0.940101520142,
-0.339403642805,
--0.858587032424,
-0.054704019708,
-0.509740892985,
--0.862894104207,
-0.017437222806,
-0.505083862528,
--0.905532739396,
-0.000000001077,
-0.424276393266,
--0.870985685678,
-0.075148223519,
-0.485527218439,
--0.876169357698,
-0.037684282522,
-0.480527992402,
--0.928570694543,
-0.000000001209,
-0.371155580903,
--0.874815037512,
-0.130198387931,
-0.466633721374,
--0.882363843185,
-0.094819417663,
-0.460915747478,
--0.888094771199,
-0.057356574024,
-0.456067868618,
--0.892252494139,
-0.019470995389,
-0.451116799777,
--0.865236841817,
-0.218104773852,
-0.451437166376,
--0.875632616795,
-0.184667138114,
-0.446279697618,
--0.884873075674,
-0.150180215433,
-0.440959797305,
--0.892750493708,
-0.114297541343,
-0.435812606548,
--0.898973787276,
-0.076879586932,
-0.431202572933,
--0.903687851145,
-0.038992437455,
-0.426412778319,
--0.965372025982,
-0.000000000267,
-0.260877081116,
--0.873496153136,
-0.238587560490,
-0.424358865154,
--0.884288670135,
-0.204709273349,
-0.419675662001,
--0.893895524226,
-0.169804627536,
-0.414870076333,
--0.902146206069,
-0.133670277522,
-0.410200536058,
--0.908849391777,
-0.096319658571,
-0.405851335393,
--0.914072592245,
-0.058475559759,
-0.401312727207,
--0.917037175770,
-0.019659396641,
-0.398316866803,
--0.855049732395,
-0.324405786143,
-0.404537811643,
--0.868404855176,
-0.291823145905,
-0.400889335129,
--0.880705878152,
-0.258507914019,
-0.396901517479,
--0.891898094191,
-0.224342096266,
-0.392668324953,
--0.901890504602,
-0.189196217983,
-0.388327579256,
--0.910543469618,
-0.152950133514,
-0.384079219164,
--0.917723256467,
-0.115685444091,
-0.380001187585,
--0.923445686314,
-0.077907514227,
-0.375737253482,
--0.927231534385,
-0.039284332407,
-0.372422371603,
--0.845531470505,
-0.376213878238,
-0.378866269556,
--0.860357627193,
-0.344184867676,
-0.375927559769,
--0.874146159976,
-0.311470757725,
-0.372631799612,
--0.886865749507,
-0.277993144360,
-0.369037876158,
--0.898463138571,
-0.243665596151,
-0.365227416662,
--0.908856982934,
-0.208402729158,
-0.361313281033,
--0.917931518893,
-0.172133869696,
-0.357451615644,
--0.925587303437,
-0.134973429242,
-0.353652820029,
--0.931807212378,
-0.097280931289,
-0.349673761336,
--0.936280887749,
-0.058838305758,
-0.346289117662,
--0.938643247168,
-0.019703168063,
-0.344326356404,
--0.833082082696,
-0.426830127955,
-0.351838436445,
--0.849367224368,
-0.395457937836,
-0.349554484410,
--0.864624443597,
-0.363419769717,
-0.346915901212,
--0.878836952425,
-0.330659805590,
-0.343961776975,
--0.891972553962,
-0.297116904854,
-0.340744050319,
--0.903980442276,
-0.262729302900,
-0.337331696377,
--0.914787943131,
-0.227441689107,
-0.333816262573,
--0.924297329518,
-0.191214115708,
-0.330320463490,
--0.932429624434,
-0.154177069552,
-0.326809465443,
--0.939147756278,
-0.116589039358,
-0.323123022669,
--0.944242675406,
-0.078316797465,
-0.319800327043,
--0.947446110534,
-0.039360950301,
-0.317484776367,
--0.817745743233,
-0.476017922505,
-0.323571996438,
--0.835467795426,
-0.445412670440,
-0.321871272122,
--0.852168520853,
-0.414144177747,
-0.319833413052,
--0.867841819592,
-0.382170007216,
-0.317484900037,
--0.882469351288,
-0.349444440272,
-0.314859376865,
--0.896018649928,
-0.315921109048,
-0.312000692048,
--0.908441360534,
-0.281556954182,
-0.308965978748,
--0.919671785835,
-0.246317369496,
-0.305829298505,
--0.929625617612,
-0.210182208227,
-0.302687380683,
--0.938235695411,
-0.173289016939,
-0.299474033040,
--0.945453941358,
-0.135825386016,
-0.296088347093,
--0.951134052444,
-0.097719924500,
-0.292907546226,
--0.955072948874,
-0.058948182227,
-0.290449262594,
--0.957101113211,
-0.019706936380,
-0.289083198661,
--0.999805669655,
-0.019713521409,
-0.000000001455,
--0.836828920699,
-0.463413973171,
-0.291487301526,
--0.853923809695,
-0.432315565225,
-0.289684965611,
--0.869997750055,
-0.400475914512,
-0.287615988421,
--0.885031229079,
-0.367858376750,
-0.285306744065,
--0.898991500407,
-0.334428762131,
-0.282792654174,
--0.911832203878,
-0.300158396027,
-0.280119562447,
--0.923492778259,
-0.265027431319,
-0.277347343869,
--0.933898543492,
-0.229028855343,
-0.274552898150,
--0.942988462108,
-0.192301595082,
-0.271648406695,
--0.950709570841,
-0.154983702260,
-0.268572828009,
--0.956954734078,
-0.117047598125,
-0.265588961928,
--0.961566224132,
-0.078459574667,
-0.263124479574,
--0.964409293307,
-0.039369529270,
-0.261466546902,
--0.998077672616,
-0.019694489174,
-0.058762968974,
--0.998790334550,
-0.039393488134,
-0.029428229681,
--0.998253983067,
-0.059067633195,
-0.000000000468,
--0.854617400873,
-0.450001609514,
-0.259090041412,
--0.871075888171,
-0.418363528103,
-0.257291187958,
--0.886505704830,
-0.385921458728,
-0.255288587675,
--0.900873670335,
-0.352651223456,
-0.253108167969,
--0.914134415853,
-0.318535376552,
-0.250785732525,
--0.926231114354,
-0.283565587315,
-0.248367631734,
--0.937095348585,
-0.247744068043,
-0.245917027490,
--0.946668118546,
-0.211206612419,
-0.243333598581,
--0.954895730684,
-0.174057504493,
-0.240578736906,
--0.961695238604,
-0.136298543183,
-0.237833923510,
--0.966941417819,
-0.097895329955,
-0.235458698884,
--0.970525010076,
-0.058970358261,
-0.233674349604,
--0.972347475757,
-0.019697836648,
-0.232706642837,
--0.992899763434,
-0.019684876760,
-0.117313960807,
--0.995324864374,
-0.039356003921,
-0.088201583401,
--0.996514233637,
-0.059008990871,
-0.058968815102,
--0.996464031497,
-0.078642310016,
-0.029577373257,
--0.995166083739,
-0.098206241025,
-0.000000001337,
--0.871056254731,
-0.435846607406,
-0.226492242485,
--0.886871337469,
-0.403643084224,
-0.224792106921,
--0.901643035931,
-0.370591711198,
-0.222938599952,
--0.915325091472,
-0.336684621379,
-0.220960273914,
--0.927862714630,
-0.301922740544,
-0.218891392113,
--0.939192066484,
-0.266316752839,
-0.216780186850,
--0.949251847444,
-0.229994868965,
-0.214530394989,
--0.957990636184,
-0.193039494857,
-0.212107742457,
--0.965340109396,
-0.155469696949,
-0.209636939783,
--0.971198713562,
-0.117256071528,
-0.207422449280,
--0.975475109059,
-0.078504377911,
-0.205634078535,
--0.978084036467,
-0.039357865132,
-0.204456782867,
--0.984304379375,
-0.019688062214,
-0.175377504113,
--0.988408662627,
-0.039348477020,
-0.146628827319,
--0.991292013347,
-0.058973206426,
-0.117738291131,
--0.992959150186,
-0.078558790941,
-0.088660264083,
--0.993404310200,
-0.098103562401,
-0.059359645562,
--0.992612568765,
-0.117608045691,
-0.029809996965,
--0.990571620355,
-0.136995857407,
-0.000000001447,
--0.886105596412,
-0.421020659521,
-0.193800093560,
--0.901273391754,
-0.388246690537,
-0.192277873411,
--0.915377331523,
-0.354598281650,
-0.190642071917,
--0.928360290281,
-0.320087274868,
-0.188921433136,
--0.940160669090,
-0.284735039489,
-0.187146663299,
--0.950713661995,
-0.248655478078,
-0.185240346897,
--0.959969479493,
-0.211920779157,
-0.183161627543,
--0.967869324228,
-0.174555338473,
-0.180995593950,
--0.974328651581,
-0.136540572380,
-0.178998186587,
--0.979268384833,
-0.097970474188,
-0.177299793160,
--0.982613966443,
-0.058968057970,
-0.176047042267,
--0.985951820230,
-0.078523819851,
-0.147421226090,
--0.988099125316,
-0.098023122075,
-0.118539386236,
--0.989047421857,
-0.117463759958,
-0.089372604384,
--0.988780106834,
-0.136842462690,
-0.059900256546,
--0.987272338262,
-0.156162691188,
-0.030108868862,
--0.984512472364,
-0.175314550905,
-0.000000002569,
--0.899740922547,
-0.405596193926,
-0.161114865134,
--0.914262851387,
-0.372261676764,
-0.159827039598,
--0.927692975005,
-0.338048545066,
-0.158457960691,
--0.939968864238,
-0.302985166178,
-0.157030326177,
--0.951024452690,
-0.267173602254,
-0.155469471741,
--0.960804976905,
-0.230687540052,
-0.153743472123,
--0.969259234022,
-0.193545245697,
-0.151910418116,
--0.976315018382,
-0.155744445637,
-0.150175405890,
--0.981901518214,
-0.117367518361,
-0.148641428153,
--0.983362445673,
-0.136692806518,
-0.119638526767,
--0.983632210052,
-0.155941267352,
-0.090277330963,
--0.982685965989,
-0.175105804155,
-0.060549563160,
--0.980491025076,
-0.194189680741,
-0.030458457605,
--0.977040956393,
-0.213051565428,
-0.000000001356,
--0.911949783275,
-0.389654136125,
-0.128519442053,
--0.925830538389,
-0.355780519214,
-0.127507005039,
--0.938587625052,
-0.321039547048,
-0.126439231770,
--0.950152946235,
-0.285527293233,
-0.125233955376,
--0.960468406667,
-0.249316667449,
-0.123861370596,
--0.969482821903,
-0.212427088748,
-0.122383781614,
--0.977136343935,
-0.174860662249,
-0.120947567812,
--0.976766597540,
-0.193879097426,
-0.091312154238,
--0.975174293017,
-0.212793452680,
-0.061270259801,
--0.972324632198,
-0.231590729531,
-0.030830887379,
--0.968214556970,
-0.250121114006,
-0.000000002098,
--0.922736671989,
-0.373262303172,
-0.096084791708,
--0.935983569813,
-0.338876291584,
-0.095381423987,
--0.948065950468,
-0.303698143033,
-0.094543066807,
--0.958924982880,
-0.267795653324,
-0.093532696260,
--0.968509857004,
-0.231188560415,
-0.092414860384,
--0.966304729375,
-0.249817712086,
-0.062018390139,
--0.962832633898,
-0.268289711873,
-0.031208165659,
--0.958093210068,
-0.286456629914,
-0.000000002214,
--0.932118391216,
-0.356476088749,
-0.063875683220,
--0.944727713032,
-0.321666100946,
-0.063407158365,
--0.956139240091,
-0.286108061980,
-0.062768865127,
--0.952076334702,
-0.304225514390,
-0.031583053926,
--0.946738857652,
-0.322002384172,
-0.000000000881,
--0.940101520142,
-0.339403642805,
-0.031848062377,
--0.033808943928,
--0.564444911575,
-0.824778089614,
-0.000000001697,
--0.550735108946,
-0.834680082291,
-0.067686807932,
--0.601482759841,
-0.796013181829,
--0.034410420412,
--0.592180171602,
-0.805070535623,
-0.000000000297,
--0.579186725664,
-0.815194907255,
-0.101366333663,
--0.636536090912,
-0.764556519406,
--0.068316855638,
--0.628641676194,
-0.774688614985,
--0.034502971258,
--0.618826254245,
-0.784769782823,
--0.000000000517,
--0.606229327536,
-0.795289885787,
-0.034410417907,
--0.592180171147,
-0.805070536065,
--0.134796163508,
--0.669541939813,
-0.730440678724,
--0.101953342427,
--0.662827226065,
-0.741798884035,
--0.068537426908,
--0.654703392598,
-0.752772268905,
--0.034499882344,
--0.644725590032,
-0.763635169224,
--0.000000001049,
--0.632475941815,
-0.774580004277,
-0.034502969901,
--0.618826252795,
-0.784769784026,
-0.167877821148,
--0.700386923539,
-0.693740004974,
--0.135275667820,
--0.694832911607,
-0.706333999354,
--0.102190885040,
--0.688072287063,
-0.718410433381,
--0.068580959385,
--0.679877080018,
-0.730112188692,
--0.034463285101,
--0.669927814138,
-0.741625920410,
--0.000000000986,
--0.658019472734,
-0.753000912020,
-0.034499879892,
--0.644725588332,
-0.763635170771,
-0.068316852403,
--0.628641677003,
-0.774688614614,
--0.200493801539,
--0.728943598949,
-0.654555929692,
--0.168182693707,
--0.724584241369,
-0.668350401135,
--0.135434970966,
--0.719110665487,
-0.681569673198,
--0.102219062554,
--0.712390578021,
-0.694298874835,
--0.068527252260,
--0.704243032905,
-0.706644016675,
--0.034405460658,
--0.694433201887,
-0.718734159752,
--0.000000001682,
--0.682869607814,
-0.730540278646,
-0.034463280713,
--0.669927813978,
-0.741625920758,
-0.068537423514,
--0.654703393330,
-0.752772268578,
--0.232512962128,
--0.755080152148,
-0.613018504024,
--0.200550058999,
--0.751968370855,
-0.627951624785,
--0.168175017056,
--0.747784919126,
-0.642288781130,
--0.135363527859,
--0.742447059960,
-0.656086182207,
--0.102102937924,
--0.735843267438,
-0.669409946022,
--0.068405736897,
--0.727830165097,
-0.682337091132,
--0.034328594704,
--0.718230509404,
-0.694957900126,
--0.000000001520,
--0.707017841381,
-0.707195709806,
-0.034405456797,
--0.694433201200,
-0.718734160601,
-0.068580957714,
--0.679877080252,
-0.730112188631,
-0.101953339022,
--0.662827226906,
-0.741798883751,
--0.263795524187,
--0.778668570452,
-0.569286552457,
--0.232240527680,
--0.776863211754,
-0.585275907180,
--0.200287073575,
--0.774002844387,
-0.600670196563,
--0.167914736983,
--0.770033898090,
-0.615509899917,
--0.135109972812,
--0.764883704818,
-0.629839831505,
--0.101872999909,
--0.758458964912,
-0.643709476732,
--0.068227302327,
--0.750644938662,
-0.657173653822,
--0.034232118240,
--0.741304668481,
-0.670295121994,
--0.000000002123,
--0.730450268257,
-0.682965889048,
-0.034328591386,
--0.718230509459,
-0.694957900233,
-0.068527249899,
--0.704243034087,
-0.706644015726,
-0.102190883518,
--0.688072288475,
-0.718410432245,
--0.294195255416,
--0.799589918803,
-0.523550487957,
--0.263108308917,
--0.799150286886,
-0.540493142185,
--0.231631829430,
--0.797656944313,
-0.556857337909,
--0.199746609914,
--0.795075554518,
-0.572674562413,
--0.167438152639,
--0.791358024054,
-0.587976991732,
--0.134700902021,
--0.786441353493,
-0.602798195510,
--0.101543531393,
--0.780247238039,
-0.617173524031,
--0.067995376114,
--0.772682338120,
-0.631140739601,
--0.034114554464,
--0.763638482554,
-0.644742169503,
--0.000000001551,
--0.753150565202,
-0.657848178636,
-0.034232116178,
--0.741304667877,
-0.670295122767,
-0.068405733411,
--0.727830165042,
-0.682337091540,
-0.102219059564,
--0.712390579475,
-0.694298873783,
-0.135275663549,
--0.694832912939,
-0.706333998862,
-0.293008368430,
--0.818716538078,
-0.493811022870,
--0.262059072609,
--0.818641275000,
-0.511029847788,
--0.230716152908,
--0.817479079168,
-0.527729108454,
--0.198955725053,
--0.815202693842,
-0.543931234092,
--0.166767360008,
--0.811769860727,
-0.559659129159,
--0.134151227635,
--0.807126046669,
-0.574935642409,
--0.101121377597,
--0.801205241716,
-0.589783543039,
--0.067710405183,
--0.793930024853,
-0.604227123412,
--0.033974164289,
--0.785212708996,
-0.618293423701,
--0.000000001523,
--0.775100514722,
-0.631837947640,
-0.034114551121,
--0.763638482573,
-0.644742169658,
-0.068227298680,
--0.750644939025,
-0.657173653786,
-0.102102935410,
--0.735843268049,
-0.669409945734,
-0.135434969474,
--0.719110666000,
-0.681569672953,
-0.263108301620,
--0.799150287386,
-0.540493144997,
-0.262059070984,
--0.818641275450,
-0.511029847900,
-0.260690726163,
--0.837138253457,
-0.480874089437,
--0.229512669741,
--0.836337579883,
-0.497858802177,
--0.197931545206,
--0.834389611390,
-0.514409447636,
--0.165915984039,
--0.831270398120,
-0.530529369073,
--0.133469642930,
--0.826932995496,
-0.546230423334,
--0.100610329561,
--0.821320912547,
-0.561524282822,
--0.067372039971,
--0.814369686830,
-0.576422606602,
--0.033809286985,
--0.806005555676,
-0.590941601458,
--0.000000001398,
--0.796279684883,
-0.604928643266,
-0.033974161051,
--0.785212708037,
-0.618293425097,
-0.067995372639,
--0.772682338828,
-0.631140739108,
-0.101872995626,
--0.758458965129,
-0.643709477154,
-0.135363524780,
--0.742447060571,
-0.656086182150,
-0.168182688427,
--0.724584243308,
-0.668350400361,
-0.232240520377,
--0.776863213142,
-0.585275908236,
-0.231631830313,
--0.797656943961,
-0.556857338047,
-0.230716149344,
--0.817479079580,
-0.527729109375,
-0.229512668108,
--0.836337579787,
-0.497858803090,
-0.228072713490,
--0.854209394069,
-0.467235645521,
--0.196682247807,
--0.852632664815,
-0.484080192001,
--0.164891853157,
--0.849850944709,
-0.500563730748,
--0.132661271348,
--0.845848578439,
-0.516663497294,
--0.100012708755,
--0.840575385347,
-0.532381892663,
--0.066980976877,
--0.833976914770,
-0.547718955641,
--0.033618562833,
--0.825991957407,
-0.562678485934,
--0.000000002304,
--0.816664773145,
-0.577112335949,
-0.033809283880,
--0.806005555495,
-0.590941601881,
-0.067710402321,
--0.793930025286,
-0.604227123164,
-0.101543528206,
--0.780247238108,
-0.617173524468,
-0.135109971159,
--0.764883704885,
-0.629839831779,
-0.168175016008,
--0.747784919474,
-0.642288781000,
-0.200550051891,
--0.751968372458,
-0.627951625135,
-0.200287073868,
--0.774002844455,
-0.600670196378,
-0.199746606736,
--0.795075555551,
-0.572674562088,
-0.198955723158,
--0.815202694364,
-0.543931234004,
-0.197931542165,
--0.834389611179,
-0.514409449149,
-0.196682246456,
--0.852632664142,
-0.484080193736,
-0.195271487311,
--0.869887203269,
-0.452951763250,
--0.163691227213,
--0.867497293647,
-0.469737828632,
--0.131728312730,
--0.863851705249,
-0.486217937723,
--0.099329920283,
--0.858943318227,
-0.502344446580,
--0.066537655019,
--0.852722955733,
-0.518108387531,
--0.033403193298,
--0.845141979081,
-0.533497199498,
--0.000000002618,
--0.836228833142,
-0.548380651210,
-0.033618557674,
--0.825991956941,
-0.562678486925,
-0.067372037262,
--0.814369686433,
-0.576422607479,
-0.101121374674,
--0.801205241808,
-0.589783543415,
-0.134700897822,
--0.786441353292,
-0.602798196711,
-0.167914732384,
--0.770033898877,
-0.615509900187,
-0.167438150318,
--0.791358023933,
-0.587976992556,
-0.166767357131,
--0.811769860695,
-0.559659130062,
-0.165915981375,
--0.831270398918,
-0.530529368657,
-0.164891850570,
--0.849850944234,
-0.500563732406,
-0.163691225109,
--0.867497293164,
-0.469737830257,
-0.162398632807,
--0.884144595975,
-0.438081062670,
--0.130656410705,
--0.880916562465,
-0.454879008437,
--0.098556784251,
--0.876395751084,
-0.471399032414,
--0.066043103389,
--0.870577452126,
-0.487578925246,
--0.033168958337,
--0.863418329020,
-0.503397069236,
--0.000000002595,
--0.854939036545,
-0.518728487546,
-0.033403189790,
--0.845141978961,
-0.533497199907,
-0.066980973260,
--0.833976914306,
-0.547718956789,
-0.100610326299,
--0.821320911996,
-0.561524284212,
-0.134151224913,
--0.807126046851,
-0.574935642789,
-0.133469640478,
--0.826932995485,
-0.546230423950,
-0.132661268227,
--0.845848578348,
-0.516663498245,
-0.131728310669,
--0.863851704678,
-0.486217939296,
-0.130656408926,
--0.880916561466,
-0.454879010882,
-0.129559921939,
--0.896968520217,
-0.422683924898,
--0.097688558032,
--0.892895249047,
-0.439539554374,
--0.065488618557,
--0.887501067616,
-0.456128376468,
--0.032906538462,
--0.880781241528,
-0.472378623880,
--0.000000002630,
--0.872754106893,
-0.488160085323,
-0.033168953976,
--0.863418328818,
-0.503397069870,
-0.066537652053,
--0.852722954693,
-0.518108389624,
-0.100012704784,
--0.840575385307,
-0.532381893473,
-0.099329916387,
--0.858943318208,
-0.502344447383,
-0.098556779610,
--0.876395750340,
-0.471399034768,
-0.097688555779,
--0.892895248111,
-0.439539556776,
-0.096842519373,
--0.908362587145,
-0.406815605302,
--0.064876629502,
--0.903448967019,
-0.423758170348,
--0.032612561347,
--0.897190279267,
-0.440438444769,
--0.000000001795,
--0.889635122890,
-0.456672035624,
-0.032906533352,
--0.880781241468,
-0.472378624347,
-0.066043100561,
--0.870577451352,
-0.487578927012,
-0.065488613479,
--0.887501067336,
-0.456128377743,
-0.064876627463,
--0.903448965947,
-0.423758172946,
-0.064318801248,
--0.918342003413,
-0.390526640030,
--0.032292631841,
--0.912598991995,
-0.407578539349,
--0.000000002979,
--0.905539935873,
-0.424261033492,
-0.032612557244,
--0.897190279170,
-0.440438445271,
-0.032292629138,
--0.912598991513,
-0.407578540642,
-0.032052994785,
--0.926929016889,
-0.373865220601,
--0.000000000009,
--0.920418335123,
-0.390934890192,
--0.824778089187,
-0.033808942809,
-0.564444912266,
--0.845456880352,
-0.028214021915,
-0.533297883394,
--0.863699990427,
-0.109519557567,
-0.491963202941,
--0.817104271541,
-0.065915150055,
-0.572709177876,
--0.838485074993,
-0.060974450443,
-0.541502442661,
--0.865922853816,
-0.164014175138,
-0.472521916522,
--0.786838788369,
-0.100126422527,
-0.608982282690,
--0.808868434473,
-0.097594060363,
-0.579833816791,
--0.830738197495,
-0.092804885412,
-0.548872754349,
--0.851514690917,
-0.087181958074,
-0.517031950018,
--0.730440678566,
-0.134796163093,
-0.669541940069,
--0.753976109567,
-0.133833732760,
-0.643124061264,
--0.777051319572,
-0.132100806769,
-0.615419063405,
--0.799775052261,
-0.129115324484,
-0.586250030929,
--0.822094200992,
-0.124393782999,
-0.555596356581,
--0.843371405579,
-0.118918067119,
-0.524006837327,
--0.861617826288,
-0.271632021008,
-0.428754902697,
--0.718513553210,
-0.167162153783,
-0.675125979501,
--0.742736837082,
-0.165878236754,
-0.648711339050,
--0.766476260571,
-0.163783335534,
-0.621038775748,
--0.789775410103,
-0.160520285659,
-0.592020303273,
--0.812529733815,
-0.155848479757,
-0.561699815759,
--0.834274934105,
-0.150437421474,
-0.530428050300,
--0.855155642339,
-0.142348561156,
-0.498443291170,
--0.654555930137,
-0.200493802702,
-0.728943598230,
--0.680524330302,
-0.200054454041,
-0.704886410201,
--0.705901379456,
-0.199136204955,
-0.679741137757,
--0.730730852881,
-0.197599219356,
-0.653442399265,
--0.755046457671,
-0.195246487927,
-0.625926238235,
--0.778857080189,
-0.191809309866,
-0.597152273116,
--0.802037813416,
-0.187182977821,
-0.567184166445,
--0.824238693243,
-0.181819765556,
-0.536257540194,
--0.845588744745,
-0.174459265807,
-0.504523180177,
--0.613018505686,
-0.232512966481,
-0.755080149457,
--0.640119512424,
-0.232406002408,
-0.732280315084,
--0.666613278850,
-0.231857378845,
-0.708427055056,
--0.692531866202,
-0.230779567301,
-0.683476704513,
--0.717900628408,
-0.229053192549,
-0.657383695200,
--0.742731324204,
-0.226519891802,
-0.630110243263,
--0.767013887509,
-0.222973618767,
-0.601641472724,
--0.790613875135,
-0.218391593631,
-0.572044414600,
--0.813262539391,
-0.213073051778,
-0.541483071415,
--0.835057219143,
-0.206168699119,
-0.510072453932,
--0.855929450322,
-0.196844363417,
-0.478160091038,
--0.569286554769,
-0.263795530239,
-0.778668566712,
--0.597441826204,
-0.264091317188,
-0.757178341270,
--0.624988892857,
-0.263954247034,
-0.734654367222,
--0.651954161502,
-0.263327052508,
-0.711065844150,
--0.678358204525,
-0.262132722457,
-0.686379328193,
--0.704212115856,
-0.260270965544,
-0.660563638400,
--0.729513045822,
-0.257614289309,
-0.633597343680,
--0.754239826390,
-0.254002207524,
-0.605479283593,
--0.778252556194,
-0.249463735385,
-0.576273202140,
--0.801342480658,
-0.244189856046,
-0.546096642452,
--0.823573708348,
-0.237598659680,
-0.515046817130,
--0.844927720879,
-0.229035678289,
-0.483363015301,
--0.523550487904,
-0.294195255276,
-0.799589918889,
--0.552665002619,
-0.294974653241,
-0.779455802997,
--0.581180686570,
-0.295311182944,
-0.758300939460,
--0.609122006440,
-0.295167257179,
-0.736102351280,
--0.636507380361,
-0.294492359556,
-0.712834205766,
--0.663347276645,
-0.293220454418,
-0.688470882230,
--0.689641760091,
-0.291267836503,
-0.662991168989,
--0.715377869855,
-0.288531046233,
-0.636383798254,
--0.740527363554,
-0.284883448108,
-0.608654782961,
--0.764946679431,
-0.280387516774,
-0.579861550773,
--0.788471944038,
-0.275158818591,
-0.550090554379,
--0.811137059671,
-0.268796960904,
-0.519427438857,
--0.832949913538,
-0.260774075091,
-0.488048484576,
--0.853789218908,
-0.250767114349,
-0.456245355086,
--0.799003017568,
-0.505994646785,
-0.324905517562,
--0.535376361461,
-0.325799072911,
-0.779247788370,
--0.564198668721,
-0.326194701241,
-0.758470091102,
--0.592483235883,
-0.326066515963,
-0.736643904723,
--0.620240749029,
-0.325372099921,
-0.713746740685,
--0.647472756587,
-0.324055857998,
-0.689758530483,
--0.674170256196,
-0.322048660839,
-0.664664671630,
--0.700312678735,
-0.319265654848,
-0.638460330512,
--0.725866876419,
-0.315605119791,
-0.611155206211,
--0.750686867968,
-0.311150514469,
-0.582798922105,
--0.774641916478,
-0.305967401183,
-0.553456277089,
--0.797740346409,
-0.299781080293,
-0.523203252676,
--0.820003565031,
-0.292156278398,
-0.492177673538,
--0.841336349636,
-0.282839620354,
-0.460602752856,
--0.815773310318,
-0.457584527618,
-0.353737623468,
--0.797435433487,
-0.487760486650,
-0.355227303402,
--0.778070620550,
-0.517379893630,
-0.356264164777,
--0.546462422108,
-0.356758598697,
-0.757695270858,
--0.575040782451,
-0.356666440534,
-0.736286050876,
--0.603125963516,
-0.355976335757,
-0.713806640845,
--0.630711222675,
-0.354643247000,
-0.690240190766,
--0.657779642589,
-0.352610133031,
-0.665576468844,
--0.684303737632,
-0.349808507752,
-0.639814350079,
--0.710246569034,
-0.346153747128,
-0.612966063110,
--0.735461506991,
-0.341739475281,
-0.585073074726,
--0.759841039922,
-0.336602305587,
-0.556183856224,
--0.783373244052,
-0.330554499496,
-0.526364971637,
--0.806085114031,
-0.323231940665,
-0.495729665716,
--0.827895392664,
-0.314438827927,
-0.464453918379,
--0.848707021341,
-0.303997075396,
-0.432761100466,
--0.829682351515,
-0.407623855198,
-0.381405280847,
--0.812812516444,
-0.438467526327,
-0.383512765718,
--0.794914820719,
-0.468785124263,
-0.385163517317,
--0.775975091741,
-0.498605228407,
-0.386335971924,
--0.756003153871,
-0.527930438218,
-0.386973750712,
--0.556765961453,
-0.386976062730,
-0.735024619344,
--0.585137022965,
-0.386307606721,
-0.713008483361,
--0.613040499416,
-0.384979538636,
-0.689907313273,
--0.640451723410,
-0.382943198809,
-0.665714726040,
--0.667336494396,
-0.380143758990,
-0.640431671412,
--0.693652728129,
-0.376513580550,
-0.614071181884,
--0.719256979903,
-0.372139511495,
-0.586669907908,
--0.744055854754,
-0.367049034302,
-0.558261490186,
--0.768023082420,
-0.361112986232,
-0.528902595989,
--0.791185290265,
-0.354025189094,
-0.498690286605,
--0.813468176753,
-0.345635277280,
-0.467766801419,
--0.834788295384,
-0.335795255467,
-0.436314162382,
--0.840669568647,
-0.356352754240,
-0.407783509839,
--0.825275966449,
-0.387738466249,
-0.410583074410,
--0.808868614821,
-0.418617451258,
-0.412905550289,
--0.791438960078,
-0.449027916183,
-0.414726781098,
--0.772972327295,
-0.478994861051,
-0.416026086109,
--0.753448209780,
-0.508532375029,
-0.416786058701,
--0.732891346756,
-0.537619857105,
-0.416935442360,
--0.566251678969,
-0.416367767780,
-0.711334603417,
--0.594439275764,
-0.415055454031,
-0.688745901990,
--0.622168316708,
-0.413032884943,
-0.665064223696,
--0.649395547747,
-0.410251902749,
-0.640295868218,
--0.676069938392,
-0.406663469592,
-0.614454441682,
--0.702058185534,
-0.402333010784,
-0.587573359299,
--0.727271289041,
-0.397290992567,
-0.559675208815,
--0.751675776835,
-0.391446716748,
-0.530804101780,
--0.775291632664,
-0.384545108166,
-0.501046848216,
--0.798048177475,
-0.376470188122,
-0.470520248113,
--0.819868896647,
-0.367104066256,
-0.439374096697,
--0.803945532468,
-0.397974827673,
-0.441913585854,
--0.787008108319,
-0.428439995253,
-0.443911486568,
--0.769041946132,
-0.458518053200,
-0.445348941818,
--0.750028876023,
-0.488216374428,
-0.446207862853,
--0.729942906296,
-0.517534508004,
-0.446476636089,
--0.708830046658,
-0.546431409694,
-0.446063537463,
--0.574894831285,
-0.444861914111,
-0.686726881908,
--0.602912617112,
-0.442863818973,
-0.663602301060,
--0.630461312556,
-0.440114049758,
-0.639388893066,
--0.657483241684,
-0.436571795002,
-0.614101664803,
--0.683850852040,
-0.432295965145,
-0.587765438490,
--0.709473130230,
-0.427307776997,
-0.560406942497,
--0.734317470250,
-0.421540277233,
-0.532054177275,
--0.758389971474,
-0.414790734170,
-0.502785538788,
--0.781623983224,
-0.406965875424,
-0.472697286949,
--0.764180864874,
-0.437132021722,
-0.474281774208,
--0.745701769945,
-0.466968711806,
-0.475256870014,
--0.726167588560,
-0.496468026693,
-0.475605016580,
--0.705551242770,
-0.525612014194,
-0.475320370235,
--0.683916955627,
-0.554357031495,
-0.474284597513,
--0.582670496325,
-0.472410228900,
-0.661304520129,
--0.610524211320,
-0.469702161921,
-0.637683359104,
--0.637885437226,
-0.466209001172,
-0.612985592165,
--0.664625654627,
-0.461992860913,
-0.587226817914,
--0.690652198290,
-0.457071336798,
-0.560433166465,
--0.715933202654,
-0.451374432279,
-0.532635683392,
--0.740464430822,
-0.444754450462,
-0.503890767410,
--0.721498235687,
-0.474422150157,
-0.504345039968,
--0.701469400717,
-0.503775258249,
-0.504134078430,
--0.680359054884,
-0.532785075422,
-0.503241115018,
--0.658241474435,
-0.561398951668,
-0.501546985237,
--0.589570330925,
-0.498978501641,
-0.635159255457,
--0.617262949603,
-0.495545125044,
-0.611082220403,
--0.644367808544,
-0.491393914844,
-0.585936982761,
--0.670791973493,
-0.486546358533,
-0.559741698729,
--0.696504415720,
-0.480930929991,
-0.532528909506,
--0.676012828283,
-0.510176351632,
-0.531720552765,
--0.654446961178,
-0.539074460952,
-0.530186665764,
--0.631885374868,
-0.567566570038,
-0.527815366965,
--0.595600246531,
-0.524539851867,
-0.608373479152,
--0.623061613926,
-0.520466679540,
-0.583873839746,
--0.649875509274,
-0.515700794820,
-0.558313991109,
--0.627892877918,
-0.544497794059,
-0.556122905592,
--0.604926633262,
-0.572873637051,
-0.553063797714,
--0.600697877342,
-0.549166629950,
-0.581014692332,
--0.564444912266,
--0.824778089187,
--0.033808942809,
--0.533297883394,
--0.845456880352,
--0.028214021915,
--0.491963202941,
--0.863699990427,
--0.109519557567,
--0.572709177876,
--0.817104271541,
--0.065915150055,
--0.541502442661,
--0.838485074993,
--0.060974450443,
--0.472521916522,
--0.865922853816,
--0.164014175138,
--0.608982282690,
--0.786838788369,
--0.100126422527,
--0.579833816791,
--0.808868434473,
--0.097594060363,
--0.548872754349,
--0.830738197495,
--0.092804885412,
--0.517031950018,
--0.851514690917,
--0.087181958074,
--0.669541940069,
--0.730440678566,
--0.134796163093,
--0.643124061264,
--0.753976109567,
--0.133833732760,
--0.615419063405,
--0.777051319572,
--0.132100806769,
--0.586250030929,
--0.799775052261,
--0.129115324484,
--0.555596356581,
--0.822094200992,
--0.124393782999,
--0.524006837327,
--0.843371405579,
--0.118918067119,
--0.428754902697,
--0.861617826288,
--0.271632021008,
--0.675125979501,
--0.718513553210,
--0.167162153783,
--0.648711339050,
--0.742736837082,
--0.165878236754,
--0.621038775748,
--0.766476260571,
--0.163783335534,
--0.592020303273,
--0.789775410103,
--0.160520285659,
--0.561699815759,
--0.812529733815,
--0.155848479757,
--0.530428050300,
--0.834274934105,
--0.150437421474,
--0.498443291170,
--0.855155642339,
--0.142348561156,
--0.728943598230,
--0.654555930137,
--0.200493802702,
--0.704886410201,
--0.680524330302,
--0.200054454041,
--0.679741137757,
--0.705901379456,
--0.199136204955,
--0.653442399265,
--0.730730852881,
--0.197599219356,
--0.625926238235,
--0.755046457671,
--0.195246487927,
--0.597152273116,
--0.778857080189,
--0.191809309866,
--0.567184166445,
--0.802037813416,
--0.187182977821,
--0.536257540194,
--0.824238693243,
--0.181819765556,
--0.504523180177,
--0.845588744745,
--0.174459265807,
--0.755080149457,
--0.613018505686,
--0.232512966481,
--0.732280315084,
--0.640119512424,
--0.232406002408,
--0.708427055056,
--0.666613278850,
--0.231857378845,
--0.683476704513,
--0.692531866202,
--0.230779567301,
--0.657383695200,
--0.717900628408,
--0.229053192549,
--0.630110243263,
--0.742731324204,
--0.226519891802,
--0.601641472724,
--0.767013887509,
--0.222973618767,
--0.572044414600,
--0.790613875135,
--0.218391593631,
--0.541483071415,
--0.813262539391,
--0.213073051778,
--0.510072453932,
--0.835057219143,
--0.206168699119,
--0.478160091038,
--0.855929450322,
--0.196844363417,
--0.778668566712,
--0.569286554769,
--0.263795530239,
--0.757178341270,
--0.597441826204,
--0.264091317188,
--0.734654367222,
--0.624988892857,
--0.263954247034,
--0.711065844150,
--0.651954161502,
--0.263327052508,
--0.686379328193,
--0.678358204525,
--0.262132722457,
--0.660563638400,
--0.704212115856,
--0.260270965544,
--0.633597343680,
--0.729513045822,
--0.257614289309,
--0.605479283593,
--0.754239826390,
--0.254002207524,
--0.576273202140,
--0.778252556194,
--0.249463735385,
--0.546096642452,
--0.801342480658,
--0.244189856046,
--0.515046817130,
--0.823573708348,
--0.237598659680,
--0.483363015301,
--0.844927720879,
--0.229035678289,
--0.799589918889,
--0.523550487904,
--0.294195255276,
--0.779455802997,
--0.552665002619,
--0.294974653241,
--0.758300939460,
--0.581180686570,
--0.295311182944,
--0.736102351280,
--0.609122006440,
--0.295167257179,
--0.712834205766,
--0.636507380361,
--0.294492359556,
--0.688470882230,
--0.663347276645,
--0.293220454418,
--0.662991168989,
--0.689641760091,
--0.291267836503,
--0.636383798254,
--0.715377869855,
--0.288531046233,
--0.608654782961,
--0.740527363554,
--0.284883448108,
--0.579861550773,
--0.764946679431,
--0.280387516774,
--0.550090554379,
--0.788471944038,
--0.275158818591,
--0.519427438857,
--0.811137059671,
--0.268796960904,
--0.488048484576,
--0.832949913538,
--0.260774075091,
--0.456245355086,
--0.853789218908,
--0.250767114349,
--0.324905517562,
--0.799003017568,
--0.505994646785,
--0.779247788370,
--0.535376361461,
--0.325799072911,
--0.758470091102,
--0.564198668721,
--0.326194701241,
--0.736643904723,
--0.592483235883,
--0.326066515963,
--0.713746740685,
--0.620240749029,
--0.325372099921,
--0.689758530483,
--0.647472756587,
--0.324055857998,
--0.664664671630,
--0.674170256196,
--0.322048660839,
--0.638460330512,
--0.700312678735,
--0.319265654848,
--0.611155206211,
--0.725866876419,
--0.315605119791,
--0.582798922105,
--0.750686867968,
--0.311150514469,
--0.553456277089,
--0.774641916478,
--0.305967401183,
--0.523203252676,
--0.797740346409,
--0.299781080293,
--0.492177673538,
--0.820003565031,
--0.292156278398,
--0.460602752856,
--0.841336349636,
--0.282839620354,
--0.353737623468,
--0.815773310318,
--0.457584527618,
--0.355227303402,
--0.797435433487,
--0.487760486650,
--0.356264164777,
--0.778070620550,
--0.517379893630,
--0.757695270858,
--0.546462422108,
--0.356758598697,
--0.736286050876,
--0.575040782451,
--0.356666440534,
--0.713806640845,
--0.603125963516,
--0.355976335757,
--0.690240190766,
--0.630711222675,
--0.354643247000,
--0.665576468844,
--0.657779642589,
--0.352610133031,
--0.639814350079,
--0.684303737632,
--0.349808507752,
--0.612966063110,
--0.710246569034,
--0.346153747128,
--0.585073074726,
--0.735461506991,
--0.341739475281,
--0.556183856224,
--0.759841039922,
--0.336602305587,
--0.526364971637,
--0.783373244052,
--0.330554499496,
--0.495729665716,
--0.806085114031,
--0.323231940665,
--0.464453918379,
--0.827895392664,
--0.314438827927,
--0.432761100466,
--0.848707021341,
--0.303997075396,
--0.381405280847,
--0.829682351515,
--0.407623855198,
--0.383512765718,
--0.812812516444,
--0.438467526327,
--0.385163517317,
--0.794914820719,
--0.468785124263,
--0.386335971924,
--0.775975091741,
--0.498605228407,
--0.386973750712,
--0.756003153871,
--0.527930438218,
--0.735024619344,
--0.556765961453,
--0.386976062730,
--0.713008483361,
--0.585137022965,
--0.386307606721,
--0.689907313273,
--0.613040499416,
--0.384979538636,
--0.665714726040,
--0.640451723410,
--0.382943198809,
--0.640431671412,
--0.667336494396,
--0.380143758990,
--0.614071181884,
--0.693652728129,
--0.376513580550,
--0.586669907908,
--0.719256979903,
--0.372139511495,
--0.558261490186,
--0.744055854754,
--0.367049034302,
--0.528902595989,
--0.768023082420,
--0.361112986232,
--0.498690286605,
--0.791185290265,
--0.354025189094,
--0.467766801419,
--0.813468176753,
--0.345635277280,
--0.436314162382,
--0.834788295384,
--0.335795255467,
--0.407783509839,
--0.840669568647,
--0.356352754240,
--0.410583074410,
--0.825275966449,
--0.387738466249,
--0.412905550289,
--0.808868614821,
--0.418617451258,
--0.414726781098,
--0.791438960078,
--0.449027916183,
--0.416026086109,
--0.772972327295,
--0.478994861051,
--0.416786058701,
--0.753448209780,
--0.508532375029,
--0.416935442360,
--0.732891346756,
--0.537619857105,
--0.711334603417,
--0.566251678969,
--0.416367767780,
--0.688745901990,
--0.594439275764,
--0.415055454031,
--0.665064223696,
--0.622168316708,
--0.413032884943,
--0.640295868218,
--0.649395547747,
--0.410251902749,
--0.614454441682,
--0.676069938392,
--0.406663469592,
--0.587573359299,
--0.702058185534,
--0.402333010784,
--0.559675208815,
--0.727271289041,
--0.397290992567,
--0.530804101780,
--0.751675776835,
--0.391446716748,
--0.501046848216,
--0.775291632664,
--0.384545108166,
--0.470520248113,
--0.798048177475,
--0.376470188122,
--0.439374096697,
--0.819868896647,
--0.367104066256,
--0.441913585854,
--0.803945532468,
--0.397974827673,
--0.443911486568,
--0.787008108319,
--0.428439995253,
--0.445348941818,
--0.769041946132,
--0.458518053200,
--0.446207862853,
--0.750028876023,
--0.488216374428,
--0.446476636089,
--0.729942906296,
--0.517534508004,
--0.446063537463,
--0.708830046658,
--0.546431409694,
--0.686726881908,
--0.574894831285,
--0.444861914111,
--0.663602301060,
--0.602912617112,
--0.442863818973,
--0.639388893066,
--0.630461312556,
--0.440114049758,
--0.614101664803,
--0.657483241684,
--0.436571795002,
--0.587765438490,
--0.683850852040,
--0.432295965145,
--0.560406942497,
--0.709473130230,
--0.427307776997,
--0.532054177275,
--0.734317470250,
--0.421540277233,
--0.502785538788,
--0.758389971474,
--0.414790734170,
--0.472697286949,
--0.781623983224,
--0.406965875424,
--0.474281774208,
--0.764180864874,
--0.437132021722,
--0.475256870014,
--0.745701769945,
--0.466968711806,
--0.475605016580,
--0.726167588560,
--0.496468026693,
--0.475320370235,
--0.705551242770,
--0.525612014194,
--0.474284597513,
--0.683916955627,
--0.554357031495,
--0.661304520129,
--0.582670496325,
--0.472410228900,
--0.637683359104,
--0.610524211320,
--0.469702161921,
--0.612985592165,
--0.637885437226,
--0.466209001172,
--0.587226817914,
--0.664625654627,
--0.461992860913,
--0.560433166465,
--0.690652198290,
--0.457071336798,
--0.532635683392,
--0.715933202654,
--0.451374432279,
--0.503890767410,
--0.740464430822,
--0.444754450462,
--0.504345039968,
--0.721498235687,
--0.474422150157,
--0.504134078430,
--0.701469400717,
--0.503775258249,
--0.503241115018,
--0.680359054884,
--0.532785075422,
--0.501546985237,
--0.658241474435,
--0.561398951668,
--0.635159255457,
--0.589570330925,
--0.498978501641,
--0.611082220403,
--0.617262949603,
--0.495545125044,
--0.585936982761,
--0.644367808544,
--0.491393914844,
--0.559741698729,
--0.670791973493,
--0.486546358533,
--0.532528909506,
--0.696504415720,
--0.480930929991,
--0.531720552765,
--0.676012828283,
--0.510176351632,
--0.530186665764,
--0.654446961178,
--0.539074460952,
--0.527815366965,
--0.631885374868,
--0.567566570038,
--0.608373479152,
--0.595600246531,
--0.524539851867,
--0.583873839746,
--0.623061613926,
--0.520466679540,
--0.558313991109,
--0.649875509274,
--0.515700794820,
--0.556122905592,
--0.627892877918,
--0.544497794059,
--0.553063797714,
--0.604926633262,
--0.572873637051,
--0.581014692332,
--0.600697877342,
--0.549166629950,
-0.033808942809,
--0.564444912266,
-0.824778089187,
-0.028214021915,
--0.533297883394,
-0.845456880352,
-0.109519557567,
--0.491963202941,
-0.863699990427,
-0.065915150055,
--0.572709177876,
-0.817104271541,
-0.060974450443,
--0.541502442661,
-0.838485074993,
-0.164014175138,
--0.472521916522,
-0.865922853816,
-0.100126422527,
--0.608982282690,
-0.786838788369,
-0.097594060363,
--0.579833816791,
-0.808868434473,
-0.092804885412,
--0.548872754349,
-0.830738197495,
-0.087181958074,
--0.517031950018,
-0.851514690917,
-0.134796163093,
--0.669541940069,
-0.730440678566,
-0.133833732760,
--0.643124061264,
-0.753976109567,
-0.132100806769,
--0.615419063405,
-0.777051319572,
-0.129115324484,
--0.586250030929,
-0.799775052261,
-0.124393782999,
--0.555596356581,
-0.822094200992,
-0.118918067119,
--0.524006837327,
-0.843371405579,
-0.271632021008,
--0.428754902697,
-0.861617826288,
-0.167162153783,
--0.675125979501,
-0.718513553210,
-0.165878236754,
--0.648711339050,
-0.742736837082,
-0.163783335534,
--0.621038775748,
-0.766476260571,
-0.160520285659,
--0.592020303273,
-0.789775410103,
-0.155848479757,
--0.561699815759,
-0.812529733815,
-0.150437421474,
--0.530428050300,
-0.834274934105,
-0.142348561156,
--0.498443291170,
-0.855155642339,
-0.200493802702,
--0.728943598230,
-0.654555930137,
-0.200054454041,
--0.704886410201,
-0.680524330302,
-0.199136204955,
--0.679741137757,
-0.705901379456,
-0.197599219356,
--0.653442399265,
-0.730730852881,
-0.195246487927,
--0.625926238235,
-0.755046457671,
-0.191809309866,
--0.597152273116,
-0.778857080189,
-0.187182977821,
--0.567184166445,
-0.802037813416,
-0.181819765556,
--0.536257540194,
-0.824238693243,
-0.174459265807,
--0.504523180177,
-0.845588744745,
-0.232512966481,
--0.755080149457,
-0.613018505686,
-0.232406002408,
--0.732280315084,
-0.640119512424,
-0.231857378845,
--0.708427055056,
-0.666613278850,
-0.230779567301,
--0.683476704513,
-0.692531866202,
-0.229053192549,
--0.657383695200,
-0.717900628408,
-0.226519891802,
--0.630110243263,
-0.742731324204,
-0.222973618767,
--0.601641472724,
-0.767013887509,
-0.218391593631,
--0.572044414600,
-0.790613875135,
-0.213073051778,
--0.541483071415,
-0.813262539391,
-0.206168699119,
--0.510072453932,
-0.835057219143,
-0.196844363417,
--0.478160091038,
-0.855929450322,
-0.263795530239,
--0.778668566712,
-0.569286554769,
-0.264091317188,
--0.757178341270,
-0.597441826204,
-0.263954247034,
--0.734654367222,
-0.624988892857,
-0.263327052508,
--0.711065844150,
-0.651954161502,
-0.262132722457,
--0.686379328193,
-0.678358204525,
-0.260270965544,
--0.660563638400,
-0.704212115856,
-0.257614289309,
--0.633597343680,
-0.729513045822,
-0.254002207524,
--0.605479283593,
-0.754239826390,
-0.249463735385,
--0.576273202140,
-0.778252556194,
-0.244189856046,
--0.546096642452,
-0.801342480658,
-0.237598659680,
--0.515046817130,
-0.823573708348,
-0.229035678289,
--0.483363015301,
-0.844927720879,
-0.294195255276,
--0.799589918889,
-0.523550487904,
-0.294974653241,
--0.779455802997,
-0.552665002619,
-0.295311182944,
--0.758300939460,
-0.581180686570,
-0.295167257179,
--0.736102351280,
-0.609122006440,
-0.294492359556,
--0.712834205766,
-0.636507380361,
-0.293220454418,
--0.688470882230,
-0.663347276645,
-0.291267836503,
--0.662991168989,
-0.689641760091,
-0.288531046233,
--0.636383798254,
-0.715377869855,
-0.284883448108,
--0.608654782961,
-0.740527363554,
-0.280387516774,
--0.579861550773,
-0.764946679431,
-0.275158818591,
--0.550090554379,
-0.788471944038,
-0.268796960904,
--0.519427438857,
-0.811137059671,
-0.260774075091,
--0.488048484576,
-0.832949913538,
-0.250767114349,
--0.456245355086,
-0.853789218908,
-0.505994646785,
--0.324905517562,
-0.799003017568,
-0.325799072911,
--0.779247788370,
-0.535376361461,
-0.326194701241,
--0.758470091102,
-0.564198668721,
-0.326066515963,
--0.736643904723,
-0.592483235883,
-0.325372099921,
--0.713746740685,
-0.620240749029,
-0.324055857998,
--0.689758530483,
-0.647472756587,
-0.322048660839,
--0.664664671630,
-0.674170256196,
-0.319265654848,
--0.638460330512,
-0.700312678735,
-0.315605119791,
--0.611155206211,
-0.725866876419,
-0.311150514469,
--0.582798922105,
-0.750686867968,
-0.305967401183,
--0.553456277089,
-0.774641916478,
-0.299781080293,
--0.523203252676,
-0.797740346409,
-0.292156278398,
--0.492177673538,
-0.820003565031,
-0.282839620354,
--0.460602752856,
-0.841336349636,
-0.457584527618,
--0.353737623468,
-0.815773310318,
-0.487760486650,
--0.355227303402,
-0.797435433487,
-0.517379893630,
--0.356264164777,
-0.778070620550,
-0.356758598697,
--0.757695270858,
-0.546462422108,
-0.356666440534,
--0.736286050876,
-0.575040782451,
-0.355976335757,
--0.713806640845,
-0.603125963516,
-0.354643247000,
--0.690240190766,
-0.630711222675,
-0.352610133031,
--0.665576468844,
-0.657779642589,
-0.349808507752,
--0.639814350079,
-0.684303737632,
-0.346153747128,
--0.612966063110,
-0.710246569034,
-0.341739475281,
--0.585073074726,
-0.735461506991,
-0.336602305587,
--0.556183856224,
-0.759841039922,
-0.330554499496,
--0.526364971637,
-0.783373244052,
-0.323231940665,
--0.495729665716,
-0.806085114031,
-0.314438827927,
--0.464453918379,
-0.827895392664,
-0.303997075396,
--0.432761100466,
-0.848707021341,
-0.407623855198,
--0.381405280847,
-0.829682351515,
-0.438467526327,
--0.383512765718,
-0.812812516444,
-0.468785124263,
--0.385163517317,
-0.794914820719,
-0.498605228407,
--0.386335971924,
-0.775975091741,
-0.527930438218,
--0.386973750712,
-0.756003153871,
-0.386976062730,
--0.735024619344,
-0.556765961453,
-0.386307606721,
--0.713008483361,
-0.585137022965,
-0.384979538636,
--0.689907313273,
-0.613040499416,
-0.382943198809,
--0.665714726040,
-0.640451723410,
-0.380143758990,
--0.640431671412,
-0.667336494396,
-0.376513580550,
--0.614071181884,
-0.693652728129,
-0.372139511495,
--0.586669907908,
-0.719256979903,
-0.367049034302,
--0.558261490186,
-0.744055854754,
-0.361112986232,
--0.528902595989,
-0.768023082420,
-0.354025189094,
--0.498690286605,
-0.791185290265,
-0.345635277280,
--0.467766801419,
-0.813468176753,
-0.335795255467,
--0.436314162382,
-0.834788295384,
-0.356352754240,
--0.407783509839,
-0.840669568647,
-0.387738466249,
--0.410583074410,
-0.825275966449,
-0.418617451258,
--0.412905550289,
-0.808868614821,
-0.449027916183,
--0.414726781098,
-0.791438960078,
-0.478994861051,
--0.416026086109,
-0.772972327295,
-0.508532375029,
--0.416786058701,
-0.753448209780,
-0.537619857105,
--0.416935442360,
-0.732891346756,
-0.416367767780,
--0.711334603417,
-0.566251678969,
-0.415055454031,
--0.688745901990,
-0.594439275764,
-0.413032884943,
--0.665064223696,
-0.622168316708,
-0.410251902749,
--0.640295868218,
-0.649395547747,
-0.406663469592,
--0.614454441682,
-0.676069938392,
-0.402333010784,
--0.587573359299,
-0.702058185534,
-0.397290992567,
--0.559675208815,
-0.727271289041,
-0.391446716748,
--0.530804101780,
-0.751675776835,
-0.384545108166,
--0.501046848216,
-0.775291632664,
-0.376470188122,
--0.470520248113,
-0.798048177475,
-0.367104066256,
--0.439374096697,
-0.819868896647,
-0.397974827673,
--0.441913585854,
-0.803945532468,
-0.428439995253,
--0.443911486568,
-0.787008108319,
-0.458518053200,
--0.445348941818,
-0.769041946132,
-0.488216374428,
--0.446207862853,
-0.750028876023,
-0.517534508004,
--0.446476636089,
-0.729942906296,
-0.546431409694,
--0.446063537463,
-0.708830046658,
-0.444861914111,
--0.686726881908,
-0.574894831285,
-0.442863818973,
--0.663602301060,
-0.602912617112,
-0.440114049758,
--0.639388893066,
-0.630461312556,
-0.436571795002,
--0.614101664803,
-0.657483241684,
-0.432295965145,
--0.587765438490,
-0.683850852040,
-0.427307776997,
--0.560406942497,
-0.709473130230,
-0.421540277233,
--0.532054177275,
-0.734317470250,
-0.414790734170,
--0.502785538788,
-0.758389971474,
-0.406965875424,
--0.472697286949,
-0.781623983224,
-0.437132021722,
--0.474281774208,
-0.764180864874,
-0.466968711806,
--0.475256870014,
-0.745701769945,
-0.496468026693,
--0.475605016580,
-0.726167588560,
-0.525612014194,
--0.475320370235,
-0.705551242770,
-0.554357031495,
--0.474284597513,
-0.683916955627,
-0.472410228900,
--0.661304520129,
-0.582670496325,
-0.469702161921,
--0.637683359104,
-0.610524211320,
-0.466209001172,
--0.612985592165,
-0.637885437226,
-0.461992860913,
--0.587226817914,
-0.664625654627,
-0.457071336798,
--0.560433166465,
-0.690652198290,
-0.451374432279,
--0.532635683392,
-0.715933202654,
-0.444754450462,
--0.503890767410,
-0.740464430822,
-0.474422150157,
--0.504345039968,
-0.721498235687,
-0.503775258249,
--0.504134078430,
-0.701469400717,
-0.532785075422,
--0.503241115018,
-0.680359054884,
-0.561398951668,
--0.501546985237,
-0.658241474435,
-0.498978501641,
--0.635159255457,
-0.589570330925,
-0.495545125044,
--0.611082220403,
-0.617262949603,
-0.491393914844,
--0.585936982761,
-0.644367808544,
-0.486546358533,
--0.559741698729,
-0.670791973493,
-0.480930929991,
--0.532528909506,
-0.696504415720,
-0.510176351632,
--0.531720552765,
-0.676012828283,
-0.539074460952,
--0.530186665764,
-0.654446961178,
-0.567566570038,
--0.527815366965,
-0.631885374868,
-0.524539851867,
--0.608373479152,
-0.595600246531,
-0.520466679540,
--0.583873839746,
-0.623061613926,
-0.515700794820,
--0.558313991109,
-0.649875509274,
-0.544497794059,
--0.556122905592,
-0.627892877918,
-0.572873637051,
--0.553063797714,
-0.604926633262,
-0.549166629950,
--0.581014692332,
-0.600697877342,
--0.824778089614,
--0.033808943928,
-0.564444911575,
--0.834680082291,
-0.000000001697,
-0.550735108946,
--0.796013181829,
-0.067686807932,
-0.601482759841,
--0.805070535623,
--0.034410420412,
-0.592180171602,
--0.815194907255,
-0.000000000297,
-0.579186725664,
--0.764556519406,
-0.101366333663,
-0.636536090912,
--0.774688614985,
--0.068316855638,
-0.628641676194,
--0.784769782823,
--0.034502971258,
-0.618826254245,
--0.795289885787,
--0.000000000517,
-0.606229327536,
--0.805070536065,
-0.034410417907,
-0.592180171147,
--0.730440678724,
--0.134796163508,
-0.669541939813,
--0.741798884035,
--0.101953342427,
-0.662827226065,
--0.752772268905,
--0.068537426908,
-0.654703392598,
--0.763635169224,
--0.034499882344,
-0.644725590032,
--0.774580004277,
--0.000000001049,
-0.632475941815,
--0.784769784026,
-0.034502969901,
-0.618826252795,
--0.693740004974,
-0.167877821148,
-0.700386923539,
--0.706333999354,
--0.135275667820,
-0.694832911607,
--0.718410433381,
--0.102190885040,
-0.688072287063,
--0.730112188692,
--0.068580959385,
-0.679877080018,
--0.741625920410,
--0.034463285101,
-0.669927814138,
--0.753000912020,
--0.000000000986,
-0.658019472734,
--0.763635170771,
-0.034499879892,
-0.644725588332,
--0.774688614614,
-0.068316852403,
-0.628641677003,
--0.654555929692,
--0.200493801539,
-0.728943598949,
--0.668350401135,
--0.168182693707,
-0.724584241369,
--0.681569673198,
--0.135434970966,
-0.719110665487,
--0.694298874835,
--0.102219062554,
-0.712390578021,
--0.706644016675,
--0.068527252260,
-0.704243032905,
--0.718734159752,
--0.034405460658,
-0.694433201887,
--0.730540278646,
--0.000000001682,
-0.682869607814,
--0.741625920758,
-0.034463280713,
-0.669927813978,
--0.752772268578,
-0.068537423514,
-0.654703393330,
--0.613018504024,
--0.232512962128,
-0.755080152148,
--0.627951624785,
--0.200550058999,
-0.751968370855,
--0.642288781130,
--0.168175017056,
-0.747784919126,
--0.656086182207,
--0.135363527859,
-0.742447059960,
--0.669409946022,
--0.102102937924,
-0.735843267438,
--0.682337091132,
--0.068405736897,
-0.727830165097,
--0.694957900126,
--0.034328594704,
-0.718230509404,
--0.707195709806,
--0.000000001520,
-0.707017841381,
--0.718734160601,
-0.034405456797,
-0.694433201200,
--0.730112188631,
-0.068580957714,
-0.679877080252,
--0.741798883751,
-0.101953339022,
-0.662827226906,
--0.569286552457,
--0.263795524187,
-0.778668570452,
--0.585275907180,
--0.232240527680,
-0.776863211754,
--0.600670196563,
--0.200287073575,
-0.774002844387,
--0.615509899917,
--0.167914736983,
-0.770033898090,
--0.629839831505,
--0.135109972812,
-0.764883704818,
--0.643709476732,
--0.101872999909,
-0.758458964912,
--0.657173653822,
--0.068227302327,
-0.750644938662,
--0.670295121994,
--0.034232118240,
-0.741304668481,
--0.682965889048,
--0.000000002123,
-0.730450268257,
--0.694957900233,
-0.034328591386,
-0.718230509459,
--0.706644015726,
-0.068527249899,
-0.704243034087,
--0.718410432245,
-0.102190883518,
-0.688072288475,
--0.523550487957,
--0.294195255416,
-0.799589918803,
--0.540493142185,
--0.263108308917,
-0.799150286886,
--0.556857337909,
--0.231631829430,
-0.797656944313,
--0.572674562413,
--0.199746609914,
-0.795075554518,
--0.587976991732,
--0.167438152639,
-0.791358024054,
--0.602798195510,
--0.134700902021,
-0.786441353493,
--0.617173524031,
--0.101543531393,
-0.780247238039,
--0.631140739601,
--0.067995376114,
-0.772682338120,
--0.644742169503,
--0.034114554464,
-0.763638482554,
--0.657848178636,
--0.000000001551,
-0.753150565202,
--0.670295122767,
-0.034232116178,
-0.741304667877,
--0.682337091540,
-0.068405733411,
-0.727830165042,
--0.694298873783,
-0.102219059564,
-0.712390579475,
--0.706333998862,
-0.135275663549,
-0.694832912939,
--0.493811022870,
-0.293008368430,
-0.818716538078,
--0.511029847788,
--0.262059072609,
-0.818641275000,
--0.527729108454,
--0.230716152908,
-0.817479079168,
--0.543931234092,
--0.198955725053,
-0.815202693842,
--0.559659129159,
--0.166767360008,
-0.811769860727,
--0.574935642409,
--0.134151227635,
-0.807126046669,
--0.589783543039,
--0.101121377597,
-0.801205241716,
--0.604227123412,
--0.067710405183,
-0.793930024853,
--0.618293423701,
--0.033974164289,
-0.785212708996,
--0.631837947640,
--0.000000001523,
-0.775100514722,
--0.644742169658,
-0.034114551121,
-0.763638482573,
--0.657173653786,
-0.068227298680,
-0.750644939025,
--0.669409945734,
-0.102102935410,
-0.735843268049,
--0.681569672953,
-0.135434969474,
-0.719110666000,
--0.540493144997,
-0.263108301620,
-0.799150287386,
--0.511029847900,
-0.262059070984,
-0.818641275450,
--0.480874089437,
-0.260690726163,
-0.837138253457,
--0.497858802177,
--0.229512669741,
-0.836337579883,
--0.514409447636,
--0.197931545206,
-0.834389611390,
--0.530529369073,
--0.165915984039,
-0.831270398120,
--0.546230423334,
--0.133469642930,
-0.826932995496,
--0.561524282822,
--0.100610329561,
-0.821320912547,
--0.576422606602,
--0.067372039971,
-0.814369686830,
--0.590941601458,
--0.033809286985,
-0.806005555676,
--0.604928643266,
--0.000000001398,
-0.796279684883,
--0.618293425097,
-0.033974161051,
-0.785212708037,
--0.631140739108,
-0.067995372639,
-0.772682338828,
--0.643709477154,
-0.101872995626,
-0.758458965129,
--0.656086182150,
-0.135363524780,
-0.742447060571,
--0.668350400361,
-0.168182688427,
-0.724584243308,
--0.585275908236,
-0.232240520377,
-0.776863213142,
--0.556857338047,
-0.231631830313,
-0.797656943961,
--0.527729109375,
-0.230716149344,
-0.817479079580,
--0.497858803090,
-0.229512668108,
-0.836337579787,
--0.467235645521,
-0.228072713490,
-0.854209394069,
--0.484080192001,
--0.196682247807,
-0.852632664815,
--0.500563730748,
--0.164891853157,
-0.849850944709,
--0.516663497294,
--0.132661271348,
-0.845848578439,
--0.532381892663,
--0.100012708755,
-0.840575385347,
--0.547718955641,
--0.066980976877,
-0.833976914770,
--0.562678485934,
--0.033618562833,
-0.825991957407,
--0.577112335949,
--0.000000002304,
-0.816664773145,
--0.590941601881,
-0.033809283880,
-0.806005555495,
--0.604227123164,
-0.067710402321,
-0.793930025286,
--0.617173524468,
-0.101543528206,
-0.780247238108,
--0.629839831779,
-0.135109971159,
-0.764883704885,
--0.642288781000,
-0.168175016008,
-0.747784919474,
--0.627951625135,
-0.200550051891,
-0.751968372458,
--0.600670196378,
-0.200287073868,
-0.774002844455,
--0.572674562088,
-0.199746606736,
-0.795075555551,
--0.543931234004,
-0.198955723158,
-0.815202694364,
--0.514409449149,
-0.197931542165,
-0.834389611179,
--0.484080193736,
-0.196682246456,
-0.852632664142,
--0.452951763250,
-0.195271487311,
-0.869887203269,
--0.469737828632,
--0.163691227213,
-0.867497293647,
--0.486217937723,
--0.131728312730,
-0.863851705249,
--0.502344446580,
--0.099329920283,
-0.858943318227,
--0.518108387531,
--0.066537655019,
-0.852722955733,
--0.533497199498,
--0.033403193298,
-0.845141979081,
--0.548380651210,
--0.000000002618,
-0.836228833142,
--0.562678486925,
-0.033618557674,
-0.825991956941,
--0.576422607479,
-0.067372037262,
-0.814369686433,
--0.589783543415,
-0.101121374674,
-0.801205241808,
--0.602798196711,
-0.134700897822,
-0.786441353292,
--0.615509900187,
-0.167914732384,
-0.770033898877,
--0.587976992556,
-0.167438150318,
-0.791358023933,
--0.559659130062,
-0.166767357131,
-0.811769860695,
--0.530529368657,
-0.165915981375,
-0.831270398918,
--0.500563732406,
-0.164891850570,
-0.849850944234,
--0.469737830257,
-0.163691225109,
-0.867497293164,
--0.438081062670,
-0.162398632807,
-0.884144595975,
--0.454879008437,
--0.130656410705,
-0.880916562465,
--0.471399032414,
--0.098556784251,
-0.876395751084,
--0.487578925246,
--0.066043103389,
-0.870577452126,
--0.503397069236,
--0.033168958337,
-0.863418329020,
--0.518728487546,
--0.000000002595,
-0.854939036545,
--0.533497199907,
-0.033403189790,
-0.845141978961,
--0.547718956789,
-0.066980973260,
-0.833976914306,
--0.561524284212,
-0.100610326299,
-0.821320911996,
--0.574935642789,
-0.134151224913,
-0.807126046851,
--0.546230423950,
-0.133469640478,
-0.826932995485,
--0.516663498245,
-0.132661268227,
-0.845848578348,
--0.486217939296,
-0.131728310669,
-0.863851704678,
--0.454879010882,
-0.130656408926,
-0.880916561466,
--0.422683924898,
-0.129559921939,
-0.896968520217,
--0.439539554374,
--0.097688558032,
-0.892895249047,
--0.456128376468,
--0.065488618557,
-0.887501067616,
--0.472378623880,
--0.032906538462,
-0.880781241528,
--0.488160085323,
--0.000000002630,
-0.872754106893,
--0.503397069870,
-0.033168953976,
-0.863418328818,
--0.518108389624,
-0.066537652053,
-0.852722954693,
--0.532381893473,
-0.100012704784,
-0.840575385307,
--0.502344447383,
-0.099329916387,
-0.858943318208,
--0.471399034768,
-0.098556779610,
-0.876395750340,
--0.439539556776,
-0.097688555779,
-0.892895248111,
--0.406815605302,
-0.096842519373,
-0.908362587145,
--0.423758170348,
--0.064876629502,
-0.903448967019,
--0.440438444769,
--0.032612561347,
-0.897190279267,
--0.456672035624,
--0.000000001795,
-0.889635122890,
--0.472378624347,
-0.032906533352,
-0.880781241468,
--0.487578927012,
-0.066043100561,
-0.870577451352,
--0.456128377743,
-0.065488613479,
-0.887501067336,
--0.423758172946,
-0.064876627463,
-0.903448965947,
--0.390526640030,
-0.064318801248,
-0.918342003413,
--0.407578539349,
--0.032292631841,
-0.912598991995,
--0.424261033492,
--0.000000002979,
-0.905539935873,
--0.440438445271,
-0.032612557244,
-0.897190279170,
--0.407578540642,
-0.032292629138,
-0.912598991513,
--0.373865220601,
-0.032052994785,
-0.926929016889,
--0.390934890192,
--0.000000000009,
-0.920418335123,
-0.475931949057,
--0.879482108895,
-0.000000000692,
-0.505083864225,
--0.862894103158,
--0.017437225552,
-0.491963201198,
--0.863699991504,
--0.109519556901,
-0.451116798027,
--0.892252495060,
--0.019470993726,
-0.480527992700,
--0.876169357514,
--0.037684283003,
-0.472521914566,
--0.865922855025,
--0.164014174390,
-0.398316865736,
--0.917037176300,
--0.019659393505,
-0.426412776219,
--0.903687852136,
--0.038992437454,
-0.456067868101,
--0.888094771519,
--0.057356573187,
-0.485527217684,
--0.870985686306,
--0.075148221129,
-0.316641002868,
--0.948545452418,
-0.000000000256,
-0.344326355191,
--0.938643247681,
--0.019703164800,
-0.372422370397,
--0.927231535005,
--0.039284329194,
-0.401312724204,
--0.914072593605,
--0.058475559104,
-0.431202571884,
--0.898973787924,
--0.076879585234,
-0.460915748221,
--0.882363843033,
--0.094819415468,
-0.428754902264,
--0.861617826555,
--0.271632020843,
-0.289083197335,
--0.957101113700,
--0.019706932107,
-0.317484776960,
--0.947446110431,
--0.039360948013,
-0.346289116948,
--0.936280888107,
--0.058838304270,
-0.375737250957,
--0.923445687626,
--0.077907510865,
-0.405851334406,
--0.908849392386,
--0.096319656975,
-0.435812607099,
--0.892750493863,
--0.114297538032,
-0.466633719206,
--0.874815038980,
--0.130198385834,
-0.204044010104,
--0.978961716279,
--0.000000000719,
-0.232706641423,
--0.972347476206,
--0.019697831168,
-0.261466546513,
--0.964409293475,
--0.039369527730,
-0.290449262399,
--0.955072949147,
--0.058948178756,
-0.319800326996,
--0.944242675654,
--0.078316794670,
-0.349673758507,
--0.931807213703,
--0.097280928771,
-0.380001185903,
--0.917723257506,
--0.115685441369,
-0.410200534195,
--0.902146207470,
--0.133670273785,
-0.440959795116,
--0.884873077152,
--0.150180213154,
-0.146353307429,
--0.989232383924,
--0.000000002691,
-0.175377500770,
--0.984304380100,
--0.019688055771,
-0.204456782556,
--0.978084036575,
--0.039357864070,
-0.233674348299,
--0.970525010562,
--0.058970355447,
-0.263124478738,
--0.961566224559,
--0.078459572239,
-0.292907544136,
--0.951134053362,
--0.097719921834,
-0.323123020940,
--0.939147757206,
--0.116589036680,
-0.353652818509,
--0.925587304377,
--0.134973426781,
-0.384079218133,
--0.910543470680,
--0.152950129784,
-0.414870075375,
--0.893895524901,
--0.169804626320,
-0.446279695426,
--0.875632618386,
--0.184667135868,
-0.088042912258,
--0.996116682724,
--0.000000003740,
-0.117313956730,
--0.992899764040,
--0.019684870484,
-0.146628827637,
--0.988408662574,
--0.039348477165,
-0.176047039993,
--0.982613967092,
--0.058968053940,
-0.205634077507,
--0.975475109379,
--0.078504376625,
-0.235458696468,
--0.966941418755,
--0.097895326512,
-0.265588960246,
--0.956954734930,
--0.117047594982,
-0.296088345249,
--0.945453942097,
--0.135825384888,
-0.326809463320,
--0.932429625746,
--0.154177066117,
-0.357451614055,
--0.917931520016,
--0.172133867007,
-0.388327576942,
--0.901890505813,
--0.189196216957,
-0.419675659885,
--0.884288671180,
--0.204709273173,
-0.029376741022,
--0.999568410409,
-0.000000000087,
-0.058762963205,
--0.998077673059,
--0.019694483889,
-0.088201583622,
--0.995324864317,
--0.039356004853,
-0.117738290124,
--0.991292013656,
--0.058973203238,
-0.147421224225,
--0.985951820633,
--0.078523818288,
-0.177299790028,
--0.979268385692,
--0.097970471263,
-0.207422447354,
--0.971198714273,
--0.117256069050,
-0.237833922391,
--0.961695239351,
--0.136298539866,
-0.268572826219,
--0.950709571782,
--0.154983699593,
-0.299474031489,
--0.938235696369,
--0.173289014429,
-0.330320463271,
--0.924297330053,
--0.191214113498,
-0.361313279637,
--0.908856984171,
--0.208402726185,
-0.392668322157,
--0.891898095766,
--0.224342094899,
-0.424358862210,
--0.873496155288,
--0.238587557852,
-0.293008369884,
--0.818716538977,
--0.493811020516,
-0.029428228917,
--0.998790334632,
--0.039393486630,
-0.058968812703,
--0.996514233945,
--0.059008988066,
-0.088660263368,
--0.992959150394,
--0.078558789119,
-0.118539384056,
--0.988099125779,
--0.098023120043,
-0.148641426540,
--0.981901518718,
--0.117367516186,
-0.178998184851,
--0.974328652222,
--0.136540570086,
-0.209636938687,
--0.965340110054,
--0.155469694342,
-0.240578733861,
--0.954895731762,
--0.174057502784,
-0.271648405172,
--0.942988463049,
--0.192301592617,
-0.302687379130,
--0.929625618738,
--0.210182205485,
-0.333816260608,
--0.914787944534,
--0.227441686350,
-0.365227414984,
--0.898463139698,
--0.243665594511,
-0.396901516376,
--0.880705878907,
--0.258507913144,
-0.321871270594,
--0.835467799492,
--0.445412663918,
-0.291487300666,
--0.836828921621,
--0.463413972047,
-0.260690726632,
--0.837138253746,
--0.480874088680,
-0.029577371671,
--0.996464031622,
--0.078642309025,
-0.059359642752,
--0.993404310554,
--0.098103560514,
-0.089372603636,
--0.989047422243,
--0.117463757275,
-0.119638525039,
--0.983362446131,
--0.136692804730,
-0.150175402964,
--0.976315019141,
--0.155744443703,
-0.180995591764,
--0.967869324947,
--0.174555336751,
-0.212107740505,
--0.957990637077,
--0.193039492566,
-0.243333597183,
--0.946668119411,
--0.211206610157,
-0.274552897957,
--0.933898544415,
--0.229028851813,
-0.305829296149,
--0.919671787235,
--0.246317367191,
-0.337331694510,
--0.903980443986,
--0.262729299413,
-0.369037874384,
--0.886865750925,
--0.277993142192,
-0.400889331264,
--0.868404857990,
--0.291823142842,
-0.349554481184,
--0.849367228276,
--0.395457932296,
-0.319833413713,
--0.852168520364,
--0.414144178243,
-0.289684964446,
--0.853923811589,
--0.432315562263,
-0.259090041364,
--0.854617401757,
--0.450001607863,
-0.228072714827,
--0.854209394896,
--0.467235643358,
-0.029809994679,
--0.992612568859,
--0.117608045472,
-0.059900253764,
--0.988780107188,
--0.136842461347,
-0.090277328605,
--0.983632210614,
--0.155941265167,
-0.120947565159,
--0.977136344790,
--0.174860659307,
-0.151910415236,
--0.969259234940,
--0.193545243357,
-0.183161624017,
--0.959969480968,
--0.211920775522,
-0.214530392685,
--0.949251848868,
--0.229994865237,
-0.245917026336,
--0.937095349611,
--0.247744065310,
-0.277347342105,
--0.923492779370,
--0.265027429297,
-0.308965977486,
--0.908441361793,
--0.281556951503,
-0.340744049693,
--0.891972554664,
--0.297116903465,
-0.372631798875,
--0.874146160516,
--0.311470757091,
-0.375927556003,
--0.860357630861,
--0.344184862619,
-0.346915901187,
--0.864624443469,
--0.363419770045,
-0.317484897866,
--0.867841821247,
--0.382170005262,
-0.287615987240,
--0.869997751019,
--0.400475913266,
-0.257291187727,
--0.871075889696,
--0.418363525069,
-0.226492243422,
--0.871056255471,
--0.435846605441,
-0.195271488757,
--0.869887204164,
--0.452951760909,
-0.030108866347,
--0.987272338490,
--0.156162690230,
-0.060549560681,
--0.982685966302,
--0.175105803259,
-0.091312151634,
--0.976766598358,
--0.193879094531,
-0.122383778116,
--0.969482822614,
--0.212427087515,
-0.153743470000,
--0.960804977881,
--0.230687537400,
-0.185240344280,
--0.950713663612,
--0.248655473843,
-0.216780185217,
--0.939192068197,
--0.266316748126,
-0.248367631212,
--0.926231115309,
--0.283565584654,
-0.280119561262,
--0.911832205044,
--0.300158393592,
-0.312000690982,
--0.896018651663,
--0.315921105180,
-0.343961774652,
--0.878836954617,
--0.330659802180,
-0.314859376408,
--0.882469352320,
--0.349444438079,
-0.285306743367,
--0.885031230395,
--0.367858374127,
-0.255288585759,
--0.886505706090,
--0.385921457100,
-0.224792107116,
--0.886871338714,
--0.403643081381,
-0.193800093972,
--0.886105597484,
--0.421020657075,
-0.162398635376,
--0.884144597563,
--0.438081058513,
-0.030458454429,
--0.980491025211,
--0.194189680557,
-0.061270255346,
--0.975174293876,
--0.212793450024,
-0.092414857302,
--0.968509857621,
--0.231188559060,
-0.123861367840,
--0.960468407862,
--0.249316664217,
-0.155469469146,
--0.951024454294,
--0.267173598055,
-0.187146661913,
--0.940160670282,
--0.284735036464,
-0.218891391377,
--0.927862715947,
--0.301922737031,
-0.250785732189,
--0.914134417110,
--0.318535373208,
-0.282792653065,
--0.898991501585,
--0.334428759902,
-0.253108167245,
--0.900873671391,
--0.352651221277,
-0.222938599190,
--0.901643037296,
--0.370591708334,
-0.192277873829,
--0.901273392715,
--0.388246688098,
-0.161114866532,
--0.899740923511,
--0.405596191232,
-0.129559923295,
--0.896968521055,
--0.422683922704,
-0.030830884021,
--0.972324632450,
--0.231590728918,
-0.062018386482,
--0.966304730534,
--0.249817708512,
-0.093532693308,
--0.958924984274,
--0.267795649364,
-0.125233952746,
--0.950152947861,
--0.285527288979,
-0.157030324571,
--0.939968865739,
--0.302985162353,
-0.188921433667,
--0.928360291402,
--0.320087271301,
-0.220960272596,
--0.915325093071,
--0.336684617897,
-0.190642070625,
--0.915377333113,
--0.354598278240,
-0.159827039411,
--0.914262853396,
--0.372261671910,
-0.128519443158,
--0.911949784415,
--0.389654133093,
-0.096842521471,
--0.908362588441,
--0.406815601908,
-0.031208162206,
--0.962832634097,
--0.268289711562,
-0.062768862639,
--0.956139241186,
--0.286108058864,
-0.094543065012,
--0.948065951577,
--0.303698140129,
-0.126439229612,
--0.938587626817,
--0.321039542739,
-0.158457960946,
--0.927692976135,
--0.338048541845,
-0.127507003618,
--0.925830540369,
--0.355780514571,
-0.096084793122,
--0.922736673051,
--0.373262300183,
-0.064318803462,
--0.918342004781,
--0.390526636448,
-0.031583051379,
--0.952076335280,
--0.304225512844,
-0.063407155387,
--0.944727714873,
--0.321666096127,
-0.095381422371,
--0.935983571254,
--0.338876288061,
-0.063875683064,
--0.932118392308,
--0.356476085922,
-0.032052995666,
--0.926929017434,
--0.373865219175,
-0.031848062368,
--0.940101520148,
--0.339403642791,
-0.879482108895,
--0.000000000692,
-0.475931949057,
-0.862894103158,
-0.017437225552,
-0.505083864225,
-0.863699991504,
-0.109519556901,
-0.491963201198,
-0.892252495060,
-0.019470993726,
-0.451116798027,
-0.876169357514,
-0.037684283003,
-0.480527992700,
-0.865922855025,
-0.164014174390,
-0.472521914566,
-0.917037176300,
-0.019659393505,
-0.398316865736,
-0.903687852136,
-0.038992437454,
-0.426412776219,
-0.888094771519,
-0.057356573187,
-0.456067868101,
-0.870985686306,
-0.075148221129,
-0.485527217684,
-0.948545452418,
--0.000000000256,
-0.316641002868,
-0.938643247681,
-0.019703164800,
-0.344326355191,
-0.927231535005,
-0.039284329194,
-0.372422370397,
-0.914072593605,
-0.058475559104,
-0.401312724204,
-0.898973787924,
-0.076879585234,
-0.431202571884,
-0.882363843033,
-0.094819415468,
-0.460915748221,
-0.861617826555,
-0.271632020843,
-0.428754902264,
-0.957101113700,
-0.019706932107,
-0.289083197335,
-0.947446110431,
-0.039360948013,
-0.317484776960,
-0.936280888107,
-0.058838304270,
-0.346289116948,
-0.923445687626,
-0.077907510865,
-0.375737250957,
-0.908849392386,
-0.096319656975,
-0.405851334406,
-0.892750493863,
-0.114297538032,
-0.435812607099,
-0.874815038980,
-0.130198385834,
-0.466633719206,
-0.978961716279,
-0.000000000719,
-0.204044010104,
-0.972347476206,
-0.019697831168,
-0.232706641423,
-0.964409293475,
-0.039369527730,
-0.261466546513,
-0.955072949147,
-0.058948178756,
-0.290449262399,
-0.944242675654,
-0.078316794670,
-0.319800326996,
-0.931807213703,
-0.097280928771,
-0.349673758507,
-0.917723257506,
-0.115685441369,
-0.380001185903,
-0.902146207470,
-0.133670273785,
-0.410200534195,
-0.884873077152,
-0.150180213154,
-0.440959795116,
-0.989232383924,
-0.000000002691,
-0.146353307429,
-0.984304380100,
-0.019688055771,
-0.175377500770,
-0.978084036575,
-0.039357864070,
-0.204456782556,
-0.970525010562,
-0.058970355447,
-0.233674348299,
-0.961566224559,
-0.078459572239,
-0.263124478738,
-0.951134053362,
-0.097719921834,
-0.292907544136,
-0.939147757206,
-0.116589036680,
-0.323123020940,
-0.925587304377,
-0.134973426781,
-0.353652818509,
-0.910543470680,
-0.152950129784,
-0.384079218133,
-0.893895524901,
-0.169804626320,
-0.414870075375,
-0.875632618386,
-0.184667135868,
-0.446279695426,
-0.996116682724,
-0.000000003740,
-0.088042912258,
-0.992899764040,
-0.019684870484,
-0.117313956730,
-0.988408662574,
-0.039348477165,
-0.146628827637,
-0.982613967092,
-0.058968053940,
-0.176047039993,
-0.975475109379,
-0.078504376625,
-0.205634077507,
-0.966941418755,
-0.097895326512,
-0.235458696468,
-0.956954734930,
-0.117047594982,
-0.265588960246,
-0.945453942097,
-0.135825384888,
-0.296088345249,
-0.932429625746,
-0.154177066117,
-0.326809463320,
-0.917931520016,
-0.172133867007,
-0.357451614055,
-0.901890505813,
-0.189196216957,
-0.388327576942,
-0.884288671180,
-0.204709273173,
-0.419675659885,
-0.999568410409,
--0.000000000087,
-0.029376741022,
-0.998077673059,
-0.019694483889,
-0.058762963205,
-0.995324864317,
-0.039356004853,
-0.088201583622,
-0.991292013656,
-0.058973203238,
-0.117738290124,
-0.985951820633,
-0.078523818288,
-0.147421224225,
-0.979268385692,
-0.097970471263,
-0.177299790028,
-0.971198714273,
-0.117256069050,
-0.207422447354,
-0.961695239351,
-0.136298539866,
-0.237833922391,
-0.950709571782,
-0.154983699593,
-0.268572826219,
-0.938235696369,
-0.173289014429,
-0.299474031489,
-0.924297330053,
-0.191214113498,
-0.330320463271,
-0.908856984171,
-0.208402726185,
-0.361313279637,
-0.891898095766,
-0.224342094899,
-0.392668322157,
-0.873496155288,
-0.238587557852,
-0.424358862210,
-0.818716538977,
-0.493811020516,
-0.293008369884,
-0.998790334632,
-0.039393486630,
-0.029428228917,
-0.996514233945,
-0.059008988066,
-0.058968812703,
-0.992959150394,
-0.078558789119,
-0.088660263368,
-0.988099125779,
-0.098023120043,
-0.118539384056,
-0.981901518718,
-0.117367516186,
-0.148641426540,
-0.974328652222,
-0.136540570086,
-0.178998184851,
-0.965340110054,
-0.155469694342,
-0.209636938687,
-0.954895731762,
-0.174057502784,
-0.240578733861,
-0.942988463049,
-0.192301592617,
-0.271648405172,
-0.929625618738,
-0.210182205485,
-0.302687379130,
-0.914787944534,
-0.227441686350,
-0.333816260608,
-0.898463139698,
-0.243665594511,
-0.365227414984,
-0.880705878907,
-0.258507913144,
-0.396901516376,
-0.835467799492,
-0.445412663918,
-0.321871270594,
-0.836828921621,
-0.463413972047,
-0.291487300666,
-0.837138253746,
-0.480874088680,
-0.260690726632,
-0.996464031622,
-0.078642309025,
-0.029577371671,
-0.993404310554,
-0.098103560514,
-0.059359642752,
-0.989047422243,
-0.117463757275,
-0.089372603636,
-0.983362446131,
-0.136692804730,
-0.119638525039,
-0.976315019141,
-0.155744443703,
-0.150175402964,
-0.967869324947,
-0.174555336751,
-0.180995591764,
-0.957990637077,
-0.193039492566,
-0.212107740505,
-0.946668119411,
-0.211206610157,
-0.243333597183,
-0.933898544415,
-0.229028851813,
-0.274552897957,
-0.919671787235,
-0.246317367191,
-0.305829296149,
-0.903980443986,
-0.262729299413,
-0.337331694510,
-0.886865750925,
-0.277993142192,
-0.369037874384,
-0.868404857990,
-0.291823142842,
-0.400889331264,
-0.849367228276,
-0.395457932296,
-0.349554481184,
-0.852168520364,
-0.414144178243,
-0.319833413713,
-0.853923811589,
-0.432315562263,
-0.289684964446,
-0.854617401757,
-0.450001607863,
-0.259090041364,
-0.854209394896,
-0.467235643358,
-0.228072714827,
-0.992612568859,
-0.117608045472,
-0.029809994679,
-0.988780107188,
-0.136842461347,
-0.059900253764,
-0.983632210614,
-0.155941265167,
-0.090277328605,
-0.977136344790,
-0.174860659307,
-0.120947565159,
-0.969259234940,
-0.193545243357,
-0.151910415236,
-0.959969480968,
-0.211920775522,
-0.183161624017,
-0.949251848868,
-0.229994865237,
-0.214530392685,
-0.937095349611,
-0.247744065310,
-0.245917026336,
-0.923492779370,
-0.265027429297,
-0.277347342105,
-0.908441361793,
-0.281556951503,
-0.308965977486,
-0.891972554664,
-0.297116903465,
-0.340744049693,
-0.874146160516,
-0.311470757091,
-0.372631798875,
-0.860357630861,
-0.344184862619,
-0.375927556003,
-0.864624443469,
-0.363419770045,
-0.346915901187,
-0.867841821247,
-0.382170005262,
-0.317484897866,
-0.869997751019,
-0.400475913266,
-0.287615987240,
-0.871075889696,
-0.418363525069,
-0.257291187727,
-0.871056255471,
-0.435846605441,
-0.226492243422,
-0.869887204164,
-0.452951760909,
-0.195271488757,
-0.987272338490,
-0.156162690230,
-0.030108866347,
-0.982685966302,
-0.175105803259,
-0.060549560681,
-0.976766598358,
-0.193879094531,
-0.091312151634,
-0.969482822614,
-0.212427087515,
-0.122383778116,
-0.960804977881,
-0.230687537400,
-0.153743470000,
-0.950713663612,
-0.248655473843,
-0.185240344280,
-0.939192068197,
-0.266316748126,
-0.216780185217,
-0.926231115309,
-0.283565584654,
-0.248367631212,
-0.911832205044,
-0.300158393592,
-0.280119561262,
-0.896018651663,
-0.315921105180,
-0.312000690982,
-0.878836954617,
-0.330659802180,
-0.343961774652,
-0.882469352320,
-0.349444438079,
-0.314859376408,
-0.885031230395,
-0.367858374127,
-0.285306743367,
-0.886505706090,
-0.385921457100,
-0.255288585759,
-0.886871338714,
-0.403643081381,
-0.224792107116,
-0.886105597484,
-0.421020657075,
-0.193800093972,
-0.884144597563,
-0.438081058513,
-0.162398635376,
-0.980491025211,
-0.194189680557,
-0.030458454429,
-0.975174293876,
-0.212793450024,
-0.061270255346,
-0.968509857621,
-0.231188559060,
-0.092414857302,
-0.960468407862,
-0.249316664217,
-0.123861367840,
-0.951024454294,
-0.267173598055,
-0.155469469146,
-0.940160670282,
-0.284735036464,
-0.187146661913,
-0.927862715947,
-0.301922737031,
-0.218891391377,
-0.914134417110,
-0.318535373208,
-0.250785732189,
-0.898991501585,
-0.334428759902,
-0.282792653065,
-0.900873671391,
-0.352651221277,
-0.253108167245,
-0.901643037296,
-0.370591708334,
-0.222938599190,
-0.901273392715,
-0.388246688098,
-0.192277873829,
-0.899740923511,
-0.405596191232,
-0.161114866532,
-0.896968521055,
-0.422683922704,
-0.129559923295,
-0.972324632450,
-0.231590728918,
-0.030830884021,
-0.966304730534,
-0.249817708512,
-0.062018386482,
-0.958924984274,
-0.267795649364,
-0.093532693308,
-0.950152947861,
-0.285527288979,
-0.125233952746,
-0.939968865739,
-0.302985162353,
-0.157030324571,
-0.928360291402,
-0.320087271301,
-0.188921433667,
-0.915325093071,
-0.336684617897,
-0.220960272596,
-0.915377333113,
-0.354598278240,
-0.190642070625,
-0.914262853396,
-0.372261671910,
-0.159827039411,
-0.911949784415,
-0.389654133093,
-0.128519443158,
-0.908362588441,
-0.406815601908,
-0.096842521471,
-0.962832634097,
-0.268289711562,
-0.031208162206,
-0.956139241186,
-0.286108058864,
-0.062768862639,
-0.948065951577,
-0.303698140129,
-0.094543065012,
-0.938587626817,
-0.321039542739,
-0.126439229612,
-0.927692976135,
-0.338048541845,
-0.158457960946,
-0.925830540369,
-0.355780514571,
-0.127507003618,
-0.922736673051,
-0.373262300183,
-0.096084793122,
-0.918342004781,
-0.390526636448,
-0.064318803462,
-0.952076335280,
-0.304225512844,
-0.031583051379,
-0.944727714873,
-0.321666096127,
-0.063407155387,
-0.935983571254,
-0.338876288061,
-0.095381422371,
-0.932118392308,
-0.356476085922,
-0.063875683064,
-0.926929017434,
-0.373865219175,
-0.032052995666,
-0.940101520148,
-0.339403642791,
-0.031848062368,
-0.054704019708,
--0.509740892985,
-0.858587032424,
-0.017437222806,
--0.505083862528,
-0.862894104207,
-0.000000001077,
--0.424276393266,
-0.905532739396,
-0.075148223519,
--0.485527218439,
-0.870985685678,
-0.037684282522,
--0.480527992402,
-0.876169357698,
-0.000000001209,
--0.371155580903,
-0.928570694543,
-0.130198387931,
--0.466633721374,
-0.874815037512,
-0.094819417663,
--0.460915747478,
-0.882363843185,
-0.057356574024,
--0.456067868618,
-0.888094771199,
-0.019470995389,
--0.451116799777,
-0.892252494139,
-0.218104773852,
--0.451437166376,
-0.865236841817,
-0.184667138114,
--0.446279697618,
-0.875632616795,
-0.150180215433,
--0.440959797305,
-0.884873075674,
-0.114297541343,
--0.435812606548,
-0.892750493708,
-0.076879586932,
--0.431202572933,
-0.898973787276,
-0.038992437455,
--0.426412778319,
-0.903687851145,
-0.000000000267,
--0.260877081116,
-0.965372025982,
-0.238587560490,
--0.424358865154,
-0.873496153136,
-0.204709273349,
--0.419675662001,
-0.884288670135,
-0.169804627536,
--0.414870076333,
-0.893895524226,
-0.133670277522,
--0.410200536058,
-0.902146206069,
-0.096319658571,
--0.405851335393,
-0.908849391777,
-0.058475559759,
--0.401312727207,
-0.914072592245,
-0.019659396641,
--0.398316866803,
-0.917037175770,
-0.324405786143,
--0.404537811643,
-0.855049732395,
-0.291823145905,
--0.400889335129,
-0.868404855176,
-0.258507914019,
--0.396901517479,
-0.880705878152,
-0.224342096266,
--0.392668324953,
-0.891898094191,
-0.189196217983,
--0.388327579256,
-0.901890504602,
-0.152950133514,
--0.384079219164,
-0.910543469618,
-0.115685444091,
--0.380001187585,
-0.917723256467,
-0.077907514227,
--0.375737253482,
-0.923445686314,
-0.039284332407,
--0.372422371603,
-0.927231534385,
-0.376213878238,
--0.378866269556,
-0.845531470505,
-0.344184867676,
--0.375927559769,
-0.860357627193,
-0.311470757725,
--0.372631799612,
-0.874146159976,
-0.277993144360,
--0.369037876158,
-0.886865749507,
-0.243665596151,
--0.365227416662,
-0.898463138571,
-0.208402729158,
--0.361313281033,
-0.908856982934,
-0.172133869696,
--0.357451615644,
-0.917931518893,
-0.134973429242,
--0.353652820029,
-0.925587303437,
-0.097280931289,
--0.349673761336,
-0.931807212378,
-0.058838305758,
--0.346289117662,
-0.936280887749,
-0.019703168063,
--0.344326356404,
-0.938643247168,
-0.426830127955,
--0.351838436445,
-0.833082082696,
-0.395457937836,
--0.349554484410,
-0.849367224368,
-0.363419769717,
--0.346915901212,
-0.864624443597,
-0.330659805590,
--0.343961776975,
-0.878836952425,
-0.297116904854,
--0.340744050319,
-0.891972553962,
-0.262729302900,
--0.337331696377,
-0.903980442276,
-0.227441689107,
--0.333816262573,
-0.914787943131,
-0.191214115708,
--0.330320463490,
-0.924297329518,
-0.154177069552,
--0.326809465443,
-0.932429624434,
-0.116589039358,
--0.323123022669,
-0.939147756278,
-0.078316797465,
--0.319800327043,
-0.944242675406,
-0.039360950301,
--0.317484776367,
-0.947446110534,
-0.476017922505,
--0.323571996438,
-0.817745743233,
-0.445412670440,
--0.321871272122,
-0.835467795426,
-0.414144177747,
--0.319833413052,
-0.852168520853,
-0.382170007216,
--0.317484900037,
-0.867841819592,
-0.349444440272,
--0.314859376865,
-0.882469351288,
-0.315921109048,
--0.312000692048,
-0.896018649928,
-0.281556954182,
--0.308965978748,
-0.908441360534,
-0.246317369496,
--0.305829298505,
-0.919671785835,
-0.210182208227,
--0.302687380683,
-0.929625617612,
-0.173289016939,
--0.299474033040,
-0.938235695411,
-0.135825386016,
--0.296088347093,
-0.945453941358,
-0.097719924500,
--0.292907546226,
-0.951134052444,
-0.058948182227,
--0.290449262594,
-0.955072948874,
-0.019706936380,
--0.289083198661,
-0.957101113211,
-0.019713521409,
--0.000000001455,
-0.999805669655,
-0.463413973171,
--0.291487301526,
-0.836828920699,
-0.432315565225,
--0.289684965611,
-0.853923809695,
-0.400475914512,
--0.287615988421,
-0.869997750055,
-0.367858376750,
--0.285306744065,
-0.885031229079,
-0.334428762131,
--0.282792654174,
-0.898991500407,
-0.300158396027,
--0.280119562447,
-0.911832203878,
-0.265027431319,
--0.277347343869,
-0.923492778259,
-0.229028855343,
--0.274552898150,
-0.933898543492,
-0.192301595082,
--0.271648406695,
-0.942988462108,
-0.154983702260,
--0.268572828009,
-0.950709570841,
-0.117047598125,
--0.265588961928,
-0.956954734078,
-0.078459574667,
--0.263124479574,
-0.961566224132,
-0.039369529270,
--0.261466546902,
-0.964409293307,
-0.019694489174,
--0.058762968974,
-0.998077672616,
-0.039393488134,
--0.029428229681,
-0.998790334550,
-0.059067633195,
--0.000000000468,
-0.998253983067,
-0.450001609514,
--0.259090041412,
-0.854617400873,
-0.418363528103,
--0.257291187958,
-0.871075888171,
-0.385921458728,
--0.255288587675,
-0.886505704830,
-0.352651223456,
--0.253108167969,
-0.900873670335,
-0.318535376552,
--0.250785732525,
-0.914134415853,
-0.283565587315,
--0.248367631734,
-0.926231114354,
-0.247744068043,
--0.245917027490,
-0.937095348585,
-0.211206612419,
--0.243333598581,
-0.946668118546,
-0.174057504493,
--0.240578736906,
-0.954895730684,
-0.136298543183,
--0.237833923510,
-0.961695238604,
-0.097895329955,
--0.235458698884,
-0.966941417819,
-0.058970358261,
--0.233674349604,
-0.970525010076,
-0.019697836648,
--0.232706642837,
-0.972347475757,
-0.019684876760,
--0.117313960807,
-0.992899763434,
-0.039356003921,
--0.088201583401,
-0.995324864374,
-0.059008990871,
--0.058968815102,
-0.996514233637,
-0.078642310016,
--0.029577373257,
-0.996464031497,
-0.098206241025,
--0.000000001337,
-0.995166083739,
-0.435846607406,
--0.226492242485,
-0.871056254731,
-0.403643084224,
--0.224792106921,
-0.886871337469,
-0.370591711198,
--0.222938599952,
-0.901643035931,
-0.336684621379,
--0.220960273914,
-0.915325091472,
-0.301922740544,
--0.218891392113,
-0.927862714630,
-0.266316752839,
--0.216780186850,
-0.939192066484,
-0.229994868965,
--0.214530394989,
-0.949251847444,
-0.193039494857,
--0.212107742457,
-0.957990636184,
-0.155469696949,
--0.209636939783,
-0.965340109396,
-0.117256071528,
--0.207422449280,
-0.971198713562,
-0.078504377911,
--0.205634078535,
-0.975475109059,
-0.039357865132,
--0.204456782867,
-0.978084036467,
-0.019688062214,
--0.175377504113,
-0.984304379375,
-0.039348477020,
--0.146628827319,
-0.988408662627,
-0.058973206426,
--0.117738291131,
-0.991292013347,
-0.078558790941,
--0.088660264083,
-0.992959150186,
-0.098103562401,
--0.059359645562,
-0.993404310200,
-0.117608045691,
--0.029809996965,
-0.992612568765,
-0.136995857407,
--0.000000001447,
-0.990571620355,
-0.421020659521,
--0.193800093560,
-0.886105596412,
-0.388246690537,
--0.192277873411,
-0.901273391754,
-0.354598281650,
--0.190642071917,
-0.915377331523,
-0.320087274868,
--0.188921433136,
-0.928360290281,
-0.284735039489,
--0.187146663299,
-0.940160669090,
-0.248655478078,
--0.185240346897,
-0.950713661995,
-0.211920779157,
--0.183161627543,
-0.959969479493,
-0.174555338473,
--0.180995593950,
-0.967869324228,
-0.136540572380,
--0.178998186587,
-0.974328651581,
-0.097970474188,
--0.177299793160,
-0.979268384833,
-0.058968057970,
--0.176047042267,
-0.982613966443,
-0.078523819851,
--0.147421226090,
-0.985951820230,
-0.098023122075,
--0.118539386236,
-0.988099125316,
-0.117463759958,
--0.089372604384,
-0.989047421857,
-0.136842462690,
--0.059900256546,
-0.988780106834,
-0.156162691188,
--0.030108868862,
-0.987272338262,
-0.175314550905,
--0.000000002569,
-0.984512472364,
-0.405596193926,
--0.161114865134,
-0.899740922547,
-0.372261676764,
--0.159827039598,
-0.914262851387,
-0.338048545066,
--0.158457960691,
-0.927692975005,
-0.302985166178,
--0.157030326177,
-0.939968864238,
-0.267173602254,
--0.155469471741,
-0.951024452690,
-0.230687540052,
--0.153743472123,
-0.960804976905,
-0.193545245697,
--0.151910418116,
-0.969259234022,
-0.155744445637,
--0.150175405890,
-0.976315018382,
-0.117367518361,
--0.148641428153,
-0.981901518214,
-0.136692806518,
--0.119638526767,
-0.983362445673,
-0.155941267352,
--0.090277330963,
-0.983632210052,
-0.175105804155,
--0.060549563160,
-0.982685965989,
-0.194189680741,
--0.030458457605,
-0.980491025076,
-0.213051565428,
--0.000000001356,
-0.977040956393,
-0.389654136125,
--0.128519442053,
-0.911949783275,
-0.355780519214,
--0.127507005039,
-0.925830538389,
-0.321039547048,
--0.126439231770,
-0.938587625052,
-0.285527293233,
--0.125233955376,
-0.950152946235,
-0.249316667449,
--0.123861370596,
-0.960468406667,
-0.212427088748,
--0.122383781614,
-0.969482821903,
-0.174860662249,
--0.120947567812,
-0.977136343935,
-0.193879097426,
--0.091312154238,
-0.976766597540,
-0.212793452680,
--0.061270259801,
-0.975174293017,
-0.231590729531,
--0.030830887379,
-0.972324632198,
-0.250121114006,
--0.000000002098,
-0.968214556970,
-0.373262303172,
--0.096084791708,
-0.922736671989,
-0.338876291584,
--0.095381423987,
-0.935983569813,
-0.303698143033,
--0.094543066807,
-0.948065950468,
-0.267795653324,
--0.093532696260,
-0.958924982880,
-0.231188560415,
--0.092414860384,
-0.968509857004,
-0.249817712086,
--0.062018390139,
-0.966304729375,
-0.268289711873,
--0.031208165659,
-0.962832633898,
-0.286456629914,
--0.000000002214,
-0.958093210068,
-0.356476088749,
--0.063875683220,
-0.932118391216,
-0.321666100946,
--0.063407158365,
-0.944727713032,
-0.286108061980,
--0.062768865127,
-0.956139240091,
-0.304225514390,
--0.031583053926,
-0.952076334702,
-0.322002384172,
--0.000000000881,
-0.946738857652,
-0.339403642805,
--0.031848062377,
-0.940101520142,
-0.824778089614,
--0.033808943928,
--0.564444911575,
-0.834680082291,
-0.000000001697,
--0.550735108946,
-0.796013181829,
-0.067686807932,
--0.601482759841,
-0.805070535623,
--0.034410420412,
--0.592180171602,
-0.815194907255,
-0.000000000297,
--0.579186725664,
-0.764556519406,
-0.101366333663,
--0.636536090912,
-0.774688614985,
--0.068316855638,
--0.628641676194,
-0.784769782823,
--0.034502971258,
--0.618826254245,
-0.795289885787,
--0.000000000517,
--0.606229327536,
-0.805070536065,
-0.034410417907,
--0.592180171147,
-0.730440678724,
--0.134796163508,
--0.669541939813,
-0.741798884035,
--0.101953342427,
--0.662827226065,
-0.752772268905,
--0.068537426908,
--0.654703392598,
-0.763635169224,
--0.034499882344,
--0.644725590032,
-0.774580004277,
--0.000000001049,
--0.632475941815,
-0.784769784026,
-0.034502969901,
--0.618826252795,
-0.693740004974,
-0.167877821148,
--0.700386923539,
-0.706333999354,
--0.135275667820,
--0.694832911607,
-0.718410433381,
--0.102190885040,
--0.688072287063,
-0.730112188692,
--0.068580959385,
--0.679877080018,
-0.741625920410,
--0.034463285101,
--0.669927814138,
-0.753000912020,
--0.000000000986,
--0.658019472734,
-0.763635170771,
-0.034499879892,
--0.644725588332,
-0.774688614614,
-0.068316852403,
--0.628641677003,
-0.654555929692,
--0.200493801539,
--0.728943598949,
-0.668350401135,
--0.168182693707,
--0.724584241369,
-0.681569673198,
--0.135434970966,
--0.719110665487,
-0.694298874835,
--0.102219062554,
--0.712390578021,
-0.706644016675,
--0.068527252260,
--0.704243032905,
-0.718734159752,
--0.034405460658,
--0.694433201887,
-0.730540278646,
--0.000000001682,
--0.682869607814,
-0.741625920758,
-0.034463280713,
--0.669927813978,
-0.752772268578,
-0.068537423514,
--0.654703393330,
-0.613018504024,
--0.232512962128,
--0.755080152148,
-0.627951624785,
--0.200550058999,
--0.751968370855,
-0.642288781130,
--0.168175017056,
--0.747784919126,
-0.656086182207,
--0.135363527859,
--0.742447059960,
-0.669409946022,
--0.102102937924,
--0.735843267438,
-0.682337091132,
--0.068405736897,
--0.727830165097,
-0.694957900126,
--0.034328594704,
--0.718230509404,
-0.707195709806,
--0.000000001520,
--0.707017841381,
-0.718734160601,
-0.034405456797,
--0.694433201200,
-0.730112188631,
-0.068580957714,
--0.679877080252,
-0.741798883751,
-0.101953339022,
--0.662827226906,
-0.569286552457,
--0.263795524187,
--0.778668570452,
-0.585275907180,
--0.232240527680,
--0.776863211754,
-0.600670196563,
--0.200287073575,
--0.774002844387,
-0.615509899917,
--0.167914736983,
--0.770033898090,
-0.629839831505,
--0.135109972812,
--0.764883704818,
-0.643709476732,
--0.101872999909,
--0.758458964912,
-0.657173653822,
--0.068227302327,
--0.750644938662,
-0.670295121994,
--0.034232118240,
--0.741304668481,
-0.682965889048,
--0.000000002123,
--0.730450268257,
-0.694957900233,
-0.034328591386,
--0.718230509459,
-0.706644015726,
-0.068527249899,
--0.704243034087,
-0.718410432245,
-0.102190883518,
--0.688072288475,
-0.523550487957,
--0.294195255416,
--0.799589918803,
-0.540493142185,
--0.263108308917,
--0.799150286886,
-0.556857337909,
--0.231631829430,
--0.797656944313,
-0.572674562413,
--0.199746609914,
--0.795075554518,
-0.587976991732,
--0.167438152639,
--0.791358024054,
-0.602798195510,
--0.134700902021,
--0.786441353493,
-0.617173524031,
--0.101543531393,
--0.780247238039,
-0.631140739601,
--0.067995376114,
--0.772682338120,
-0.644742169503,
--0.034114554464,
--0.763638482554,
-0.657848178636,
--0.000000001551,
--0.753150565202,
-0.670295122767,
-0.034232116178,
--0.741304667877,
-0.682337091540,
-0.068405733411,
--0.727830165042,
-0.694298873783,
-0.102219059564,
--0.712390579475,
-0.706333998862,
-0.135275663549,
--0.694832912939,
-0.493811022870,
-0.293008368430,
--0.818716538078,
-0.511029847788,
--0.262059072609,
--0.818641275000,
-0.527729108454,
--0.230716152908,
--0.817479079168,
-0.543931234092,
--0.198955725053,
--0.815202693842,
-0.559659129159,
--0.166767360008,
--0.811769860727,
-0.574935642409,
--0.134151227635,
--0.807126046669,
-0.589783543039,
--0.101121377597,
--0.801205241716,
-0.604227123412,
--0.067710405183,
--0.793930024853,
-0.618293423701,
--0.033974164289,
--0.785212708996,
-0.631837947640,
--0.000000001523,
--0.775100514722,
-0.644742169658,
-0.034114551121,
--0.763638482573,
-0.657173653786,
-0.068227298680,
--0.750644939025,
-0.669409945734,
-0.102102935410,
--0.735843268049,
-0.681569672953,
-0.135434969474,
--0.719110666000,
-0.540493144997,
-0.263108301620,
--0.799150287386,
-0.511029847900,
-0.262059070984,
--0.818641275450,
-0.480874089437,
-0.260690726163,
--0.837138253457,
-0.497858802177,
--0.229512669741,
--0.836337579883,
-0.514409447636,
--0.197931545206,
--0.834389611390,
-0.530529369073,
--0.165915984039,
--0.831270398120,
-0.546230423334,
--0.133469642930,
--0.826932995496,
-0.561524282822,
--0.100610329561,
--0.821320912547,
-0.576422606602,
--0.067372039971,
--0.814369686830,
-0.590941601458,
--0.033809286985,
--0.806005555676,
-0.604928643266,
--0.000000001398,
--0.796279684883,
-0.618293425097,
-0.033974161051,
--0.785212708037,
-0.631140739108,
-0.067995372639,
--0.772682338828,
-0.643709477154,
-0.101872995626,
--0.758458965129,
-0.656086182150,
-0.135363524780,
--0.742447060571,
-0.668350400361,
-0.168182688427,
--0.724584243308,
-0.585275908236,
-0.232240520377,
--0.776863213142,
-0.556857338047,
-0.231631830313,
--0.797656943961,
-0.527729109375,
-0.230716149344,
--0.817479079580,
-0.497858803090,
-0.229512668108,
--0.836337579787,
-0.467235645521,
-0.228072713490,
--0.854209394069,
-0.484080192001,
--0.196682247807,
--0.852632664815,
-0.500563730748,
--0.164891853157,
--0.849850944709,
-0.516663497294,
--0.132661271348,
--0.845848578439,
-0.532381892663,
--0.100012708755,
--0.840575385347,
-0.547718955641,
--0.066980976877,
--0.833976914770,
-0.562678485934,
--0.033618562833,
--0.825991957407,
-0.577112335949,
--0.000000002304,
--0.816664773145,
-0.590941601881,
-0.033809283880,
--0.806005555495,
-0.604227123164,
-0.067710402321,
--0.793930025286,
-0.617173524468,
-0.101543528206,
--0.780247238108,
-0.629839831779,
-0.135109971159,
--0.764883704885,
-0.642288781000,
-0.168175016008,
--0.747784919474,
-0.627951625135,
-0.200550051891,
--0.751968372458,
-0.600670196378,
-0.200287073868,
--0.774002844455,
-0.572674562088,
-0.199746606736,
--0.795075555551,
-0.543931234004,
-0.198955723158,
--0.815202694364,
-0.514409449149,
-0.197931542165,
--0.834389611179,
-0.484080193736,
-0.196682246456,
--0.852632664142,
-0.452951763250,
-0.195271487311,
--0.869887203269,
-0.469737828632,
--0.163691227213,
--0.867497293647,
-0.486217937723,
--0.131728312730,
--0.863851705249,
-0.502344446580,
--0.099329920283,
--0.858943318227,
-0.518108387531,
--0.066537655019,
--0.852722955733,
-0.533497199498,
--0.033403193298,
--0.845141979081,
-0.548380651210,
--0.000000002618,
--0.836228833142,
-0.562678486925,
-0.033618557674,
--0.825991956941,
-0.576422607479,
-0.067372037262,
--0.814369686433,
-0.589783543415,
-0.101121374674,
--0.801205241808,
-0.602798196711,
-0.134700897822,
--0.786441353292,
-0.615509900187,
-0.167914732384,
--0.770033898877,
-0.587976992556,
-0.167438150318,
--0.791358023933,
-0.559659130062,
-0.166767357131,
--0.811769860695,
-0.530529368657,
-0.165915981375,
--0.831270398918,
-0.500563732406,
-0.164891850570,
--0.849850944234,
-0.469737830257,
-0.163691225109,
--0.867497293164,
-0.438081062670,
-0.162398632807,
--0.884144595975,
-0.454879008437,
--0.130656410705,
--0.880916562465,
-0.471399032414,
--0.098556784251,
--0.876395751084,
-0.487578925246,
--0.066043103389,
--0.870577452126,
-0.503397069236,
--0.033168958337,
--0.863418329020,
-0.518728487546,
--0.000000002595,
--0.854939036545,
-0.533497199907,
-0.033403189790,
--0.845141978961,
-0.547718956789,
-0.066980973260,
--0.833976914306,
-0.561524284212,
-0.100610326299,
--0.821320911996,
-0.574935642789,
-0.134151224913,
--0.807126046851,
-0.546230423950,
-0.133469640478,
--0.826932995485,
-0.516663498245,
-0.132661268227,
--0.845848578348,
-0.486217939296,
-0.131728310669,
--0.863851704678,
-0.454879010882,
-0.130656408926,
--0.880916561466,
-0.422683924898,
-0.129559921939,
--0.896968520217,
-0.439539554374,
--0.097688558032,
--0.892895249047,
-0.456128376468,
--0.065488618557,
--0.887501067616,
-0.472378623880,
--0.032906538462,
--0.880781241528,
-0.488160085323,
--0.000000002630,
--0.872754106893,
-0.503397069870,
-0.033168953976,
--0.863418328818,
-0.518108389624,
-0.066537652053,
--0.852722954693,
-0.532381893473,
-0.100012704784,
--0.840575385307,
-0.502344447383,
-0.099329916387,
--0.858943318208,
-0.471399034768,
-0.098556779610,
--0.876395750340,
-0.439539556776,
-0.097688555779,
--0.892895248111,
-0.406815605302,
-0.096842519373,
--0.908362587145,
-0.423758170348,
--0.064876629502,
--0.903448967019,
-0.440438444769,
--0.032612561347,
--0.897190279267,
-0.456672035624,
--0.000000001795,
--0.889635122890,
-0.472378624347,
-0.032906533352,
--0.880781241468,
-0.487578927012,
-0.066043100561,
--0.870577451352,
-0.456128377743,
-0.065488613479,
--0.887501067336,
-0.423758172946,
-0.064876627463,
--0.903448965947,
-0.390526640030,
-0.064318801248,
--0.918342003413,
-0.407578539349,
--0.032292631841,
--0.912598991995,
-0.424261033492,
--0.000000002979,
--0.905539935873,
-0.440438445271,
-0.032612557244,
--0.897190279170,
-0.407578540642,
-0.032292629138,
--0.912598991513,
-0.373865220601,
-0.032052994785,
--0.926929016889,
-0.390934890192,
--0.000000000009,
--0.920418335123,
--0.564444911575,
--0.824778089614,
-0.033808943928,
--0.550735108946,
--0.834680082291,
--0.000000001697,
--0.601482759841,
--0.796013181829,
--0.067686807932,
--0.592180171602,
--0.805070535623,
-0.034410420412,
--0.579186725664,
--0.815194907255,
--0.000000000297,
--0.636536090912,
--0.764556519406,
--0.101366333663,
--0.628641676194,
--0.774688614985,
-0.068316855638,
--0.618826254245,
--0.784769782823,
-0.034502971258,
--0.606229327536,
--0.795289885787,
-0.000000000517,
--0.592180171147,
--0.805070536065,
--0.034410417907,
--0.669541939813,
--0.730440678724,
-0.134796163508,
--0.662827226065,
--0.741798884035,
-0.101953342427,
--0.654703392598,
--0.752772268905,
-0.068537426908,
--0.644725590032,
--0.763635169224,
-0.034499882344,
--0.632475941815,
--0.774580004277,
-0.000000001049,
--0.618826252795,
--0.784769784026,
--0.034502969901,
--0.700386923539,
--0.693740004974,
--0.167877821148,
--0.694832911607,
--0.706333999354,
-0.135275667820,
--0.688072287063,
--0.718410433381,
-0.102190885040,
--0.679877080018,
--0.730112188692,
-0.068580959385,
--0.669927814138,
--0.741625920410,
-0.034463285101,
--0.658019472734,
--0.753000912020,
-0.000000000986,
--0.644725588332,
--0.763635170771,
--0.034499879892,
--0.628641677003,
--0.774688614614,
--0.068316852403,
--0.728943598949,
--0.654555929692,
-0.200493801539,
--0.724584241369,
--0.668350401135,
-0.168182693707,
--0.719110665487,
--0.681569673198,
-0.135434970966,
--0.712390578021,
--0.694298874835,
-0.102219062554,
--0.704243032905,
--0.706644016675,
-0.068527252260,
--0.694433201887,
--0.718734159752,
-0.034405460658,
--0.682869607814,
--0.730540278646,
-0.000000001682,
--0.669927813978,
--0.741625920758,
--0.034463280713,
--0.654703393330,
--0.752772268578,
--0.068537423514,
--0.755080152148,
--0.613018504024,
-0.232512962128,
--0.751968370855,
--0.627951624785,
-0.200550058999,
--0.747784919126,
--0.642288781130,
-0.168175017056,
--0.742447059960,
--0.656086182207,
-0.135363527859,
--0.735843267438,
--0.669409946022,
-0.102102937924,
--0.727830165097,
--0.682337091132,
-0.068405736897,
--0.718230509404,
--0.694957900126,
-0.034328594704,
--0.707017841381,
--0.707195709806,
-0.000000001520,
--0.694433201200,
--0.718734160601,
--0.034405456797,
--0.679877080252,
--0.730112188631,
--0.068580957714,
--0.662827226906,
--0.741798883751,
--0.101953339022,
--0.778668570452,
--0.569286552457,
-0.263795524187,
--0.776863211754,
--0.585275907180,
-0.232240527680,
--0.774002844387,
--0.600670196563,
-0.200287073575,
--0.770033898090,
--0.615509899917,
-0.167914736983,
--0.764883704818,
--0.629839831505,
-0.135109972812,
--0.758458964912,
--0.643709476732,
-0.101872999909,
--0.750644938662,
--0.657173653822,
-0.068227302327,
--0.741304668481,
--0.670295121994,
-0.034232118240,
--0.730450268257,
--0.682965889048,
-0.000000002123,
--0.718230509459,
--0.694957900233,
--0.034328591386,
--0.704243034087,
--0.706644015726,
--0.068527249899,
--0.688072288475,
--0.718410432245,
--0.102190883518,
--0.799589918803,
--0.523550487957,
-0.294195255416,
--0.799150286886,
--0.540493142185,
-0.263108308917,
--0.797656944313,
--0.556857337909,
-0.231631829430,
--0.795075554518,
--0.572674562413,
-0.199746609914,
--0.791358024054,
--0.587976991732,
-0.167438152639,
--0.786441353493,
--0.602798195510,
-0.134700902021,
--0.780247238039,
--0.617173524031,
-0.101543531393,
--0.772682338120,
--0.631140739601,
-0.067995376114,
--0.763638482554,
--0.644742169503,
-0.034114554464,
--0.753150565202,
--0.657848178636,
-0.000000001551,
--0.741304667877,
--0.670295122767,
--0.034232116178,
--0.727830165042,
--0.682337091540,
--0.068405733411,
--0.712390579475,
--0.694298873783,
--0.102219059564,
--0.694832912939,
--0.706333998862,
--0.135275663549,
--0.818716538078,
--0.493811022870,
--0.293008368430,
--0.818641275000,
--0.511029847788,
-0.262059072609,
--0.817479079168,
--0.527729108454,
-0.230716152908,
--0.815202693842,
--0.543931234092,
-0.198955725053,
--0.811769860727,
--0.559659129159,
-0.166767360008,
--0.807126046669,
--0.574935642409,
-0.134151227635,
--0.801205241716,
--0.589783543039,
-0.101121377597,
--0.793930024853,
--0.604227123412,
-0.067710405183,
--0.785212708996,
--0.618293423701,
-0.033974164289,
--0.775100514722,
--0.631837947640,
-0.000000001523,
--0.763638482573,
--0.644742169658,
--0.034114551121,
--0.750644939025,
--0.657173653786,
--0.068227298680,
--0.735843268049,
--0.669409945734,
--0.102102935410,
--0.719110666000,
--0.681569672953,
--0.135434969474,
--0.799150287386,
--0.540493144997,
--0.263108301620,
--0.818641275450,
--0.511029847900,
--0.262059070984,
--0.837138253457,
--0.480874089437,
--0.260690726163,
--0.836337579883,
--0.497858802177,
-0.229512669741,
--0.834389611390,
--0.514409447636,
-0.197931545206,
--0.831270398120,
--0.530529369073,
-0.165915984039,
--0.826932995496,
--0.546230423334,
-0.133469642930,
--0.821320912547,
--0.561524282822,
-0.100610329561,
--0.814369686830,
--0.576422606602,
-0.067372039971,
--0.806005555676,
--0.590941601458,
-0.033809286985,
--0.796279684883,
--0.604928643266,
-0.000000001398,
--0.785212708037,
--0.618293425097,
--0.033974161051,
--0.772682338828,
--0.631140739108,
--0.067995372639,
--0.758458965129,
--0.643709477154,
--0.101872995626,
--0.742447060571,
--0.656086182150,
--0.135363524780,
--0.724584243308,
--0.668350400361,
--0.168182688427,
--0.776863213142,
--0.585275908236,
--0.232240520377,
--0.797656943961,
--0.556857338047,
--0.231631830313,
--0.817479079580,
--0.527729109375,
--0.230716149344,
--0.836337579787,
--0.497858803090,
--0.229512668108,
--0.854209394069,
--0.467235645521,
--0.228072713490,
--0.852632664815,
--0.484080192001,
-0.196682247807,
--0.849850944709,
--0.500563730748,
-0.164891853157,
--0.845848578439,
--0.516663497294,
-0.132661271348,
--0.840575385347,
--0.532381892663,
-0.100012708755,
--0.833976914770,
--0.547718955641,
-0.066980976877,
--0.825991957407,
--0.562678485934,
-0.033618562833,
--0.816664773145,
--0.577112335949,
-0.000000002304,
--0.806005555495,
--0.590941601881,
--0.033809283880,
--0.793930025286,
--0.604227123164,
--0.067710402321,
--0.780247238108,
--0.617173524468,
--0.101543528206,
--0.764883704885,
--0.629839831779,
--0.135109971159,
--0.747784919474,
--0.642288781000,
--0.168175016008,
--0.751968372458,
--0.627951625135,
--0.200550051891,
--0.774002844455,
--0.600670196378,
--0.200287073868,
--0.795075555551,
--0.572674562088,
--0.199746606736,
--0.815202694364,
--0.543931234004,
--0.198955723158,
--0.834389611179,
--0.514409449149,
--0.197931542165,
--0.852632664142,
--0.484080193736,
--0.196682246456,
--0.869887203269,
--0.452951763250,
--0.195271487311,
--0.867497293647,
--0.469737828632,
-0.163691227213,
--0.863851705249,
--0.486217937723,
-0.131728312730,
--0.858943318227,
--0.502344446580,
-0.099329920283,
--0.852722955733,
--0.518108387531,
-0.066537655019,
--0.845141979081,
--0.533497199498,
-0.033403193298,
--0.836228833142,
--0.548380651210,
-0.000000002618,
--0.825991956941,
--0.562678486925,
--0.033618557674,
--0.814369686433,
--0.576422607479,
--0.067372037262,
--0.801205241808,
--0.589783543415,
--0.101121374674,
--0.786441353292,
--0.602798196711,
--0.134700897822,
--0.770033898877,
--0.615509900187,
--0.167914732384,
--0.791358023933,
--0.587976992556,
--0.167438150318,
--0.811769860695,
--0.559659130062,
--0.166767357131,
--0.831270398918,
--0.530529368657,
--0.165915981375,
--0.849850944234,
--0.500563732406,
--0.164891850570,
--0.867497293164,
--0.469737830257,
--0.163691225109,
--0.884144595975,
--0.438081062670,
--0.162398632807,
--0.880916562465,
--0.454879008437,
-0.130656410705,
--0.876395751084,
--0.471399032414,
-0.098556784251,
--0.870577452126,
--0.487578925246,
-0.066043103389,
--0.863418329020,
--0.503397069236,
-0.033168958337,
--0.854939036545,
--0.518728487546,
-0.000000002595,
--0.845141978961,
--0.533497199907,
--0.033403189790,
--0.833976914306,
--0.547718956789,
--0.066980973260,
--0.821320911996,
--0.561524284212,
--0.100610326299,
--0.807126046851,
--0.574935642789,
--0.134151224913,
--0.826932995485,
--0.546230423950,
--0.133469640478,
--0.845848578348,
--0.516663498245,
--0.132661268227,
--0.863851704678,
--0.486217939296,
--0.131728310669,
--0.880916561466,
--0.454879010882,
--0.130656408926,
--0.896968520217,
--0.422683924898,
--0.129559921939,
--0.892895249047,
--0.439539554374,
-0.097688558032,
--0.887501067616,
--0.456128376468,
-0.065488618557,
--0.880781241528,
--0.472378623880,
-0.032906538462,
--0.872754106893,
--0.488160085323,
-0.000000002630,
--0.863418328818,
--0.503397069870,
--0.033168953976,
--0.852722954693,
--0.518108389624,
--0.066537652053,
--0.840575385307,
--0.532381893473,
--0.100012704784,
--0.858943318208,
--0.502344447383,
--0.099329916387,
--0.876395750340,
--0.471399034768,
--0.098556779610,
--0.892895248111,
--0.439539556776,
--0.097688555779,
--0.908362587145,
--0.406815605302,
--0.096842519373,
--0.903448967019,
--0.423758170348,
-0.064876629502,
--0.897190279267,
--0.440438444769,
-0.032612561347,
--0.889635122890,
--0.456672035624,
-0.000000001795,
--0.880781241468,
--0.472378624347,
--0.032906533352,
--0.870577451352,
--0.487578927012,
--0.066043100561,
--0.887501067336,
--0.456128377743,
--0.065488613479,
--0.903448965947,
--0.423758172946,
--0.064876627463,
--0.918342003413,
--0.390526640030,
--0.064318801248,
--0.912598991995,
--0.407578539349,
-0.032292631841,
--0.905539935873,
--0.424261033492,
-0.000000002979,
--0.897190279170,
--0.440438445271,
--0.032612557244,
--0.912598991513,
--0.407578540642,
--0.032292629138,
--0.926929016889,
--0.373865220601,
--0.032052994785,
--0.920418335123,
--0.390934890192,
-0.000000000009,
-0.564444912266,
--0.824778089187,
-0.033808942809,
-0.533297883394,
--0.845456880352,
-0.028214021915,
-0.491963202941,
--0.863699990427,
-0.109519557567,
-0.572709177876,
--0.817104271541,
-0.065915150055,
-0.541502442661,
--0.838485074993,
-0.060974450443,
-0.472521916522,
--0.865922853816,
-0.164014175138,
-0.608982282690,
--0.786838788369,
-0.100126422527,
-0.579833816791,
--0.808868434473,
-0.097594060363,
-0.548872754349,
--0.830738197495,
-0.092804885412,
-0.517031950018,
--0.851514690917,
-0.087181958074,
-0.669541940069,
--0.730440678566,
-0.134796163093,
-0.643124061264,
--0.753976109567,
-0.133833732760,
-0.615419063405,
--0.777051319572,
-0.132100806769,
-0.586250030929,
--0.799775052261,
-0.129115324484,
-0.555596356581,
--0.822094200992,
-0.124393782999,
-0.524006837327,
--0.843371405579,
-0.118918067119,
-0.428754902697,
--0.861617826288,
-0.271632021008,
-0.675125979501,
--0.718513553210,
-0.167162153783,
-0.648711339050,
--0.742736837082,
-0.165878236754,
-0.621038775748,
--0.766476260571,
-0.163783335534,
-0.592020303273,
--0.789775410103,
-0.160520285659,
-0.561699815759,
--0.812529733815,
-0.155848479757,
-0.530428050300,
--0.834274934105,
-0.150437421474,
-0.498443291170,
--0.855155642339,
-0.142348561156,
-0.728943598230,
--0.654555930137,
-0.200493802702,
-0.704886410201,
--0.680524330302,
-0.200054454041,
-0.679741137757,
--0.705901379456,
-0.199136204955,
-0.653442399265,
--0.730730852881,
-0.197599219356,
-0.625926238235,
--0.755046457671,
-0.195246487927,
-0.597152273116,
--0.778857080189,
-0.191809309866,
-0.567184166445,
--0.802037813416,
-0.187182977821,
-0.536257540194,
--0.824238693243,
-0.181819765556,
-0.504523180177,
--0.845588744745,
-0.174459265807,
-0.755080149457,
--0.613018505686,
-0.232512966481,
-0.732280315084,
--0.640119512424,
-0.232406002408,
-0.708427055056,
--0.666613278850,
-0.231857378845,
-0.683476704513,
--0.692531866202,
-0.230779567301,
-0.657383695200,
--0.717900628408,
-0.229053192549,
-0.630110243263,
--0.742731324204,
-0.226519891802,
-0.601641472724,
--0.767013887509,
-0.222973618767,
-0.572044414600,
--0.790613875135,
-0.218391593631,
-0.541483071415,
--0.813262539391,
-0.213073051778,
-0.510072453932,
--0.835057219143,
-0.206168699119,
-0.478160091038,
--0.855929450322,
-0.196844363417,
-0.778668566712,
--0.569286554769,
-0.263795530239,
-0.757178341270,
--0.597441826204,
-0.264091317188,
-0.734654367222,
--0.624988892857,
-0.263954247034,
-0.711065844150,
--0.651954161502,
-0.263327052508,
-0.686379328193,
--0.678358204525,
-0.262132722457,
-0.660563638400,
--0.704212115856,
-0.260270965544,
-0.633597343680,
--0.729513045822,
-0.257614289309,
-0.605479283593,
--0.754239826390,
-0.254002207524,
-0.576273202140,
--0.778252556194,
-0.249463735385,
-0.546096642452,
--0.801342480658,
-0.244189856046,
-0.515046817130,
--0.823573708348,
-0.237598659680,
-0.483363015301,
--0.844927720879,
-0.229035678289,
-0.799589918889,
--0.523550487904,
-0.294195255276,
-0.779455802997,
--0.552665002619,
-0.294974653241,
-0.758300939460,
--0.581180686570,
-0.295311182944,
-0.736102351280,
--0.609122006440,
-0.295167257179,
-0.712834205766,
--0.636507380361,
-0.294492359556,
-0.688470882230,
--0.663347276645,
-0.293220454418,
-0.662991168989,
--0.689641760091,
-0.291267836503,
-0.636383798254,
--0.715377869855,
-0.288531046233,
-0.608654782961,
--0.740527363554,
-0.284883448108,
-0.579861550773,
--0.764946679431,
-0.280387516774,
-0.550090554379,
--0.788471944038,
-0.275158818591,
-0.519427438857,
--0.811137059671,
-0.268796960904,
-0.488048484576,
--0.832949913538,
-0.260774075091,
-0.456245355086,
--0.853789218908,
-0.250767114349,
-0.324905517562,
--0.799003017568,
-0.505994646785,
-0.779247788370,
--0.535376361461,
-0.325799072911,
-0.758470091102,
--0.564198668721,
-0.326194701241,
-0.736643904723,
--0.592483235883,
-0.326066515963,
-0.713746740685,
--0.620240749029,
-0.325372099921,
-0.689758530483,
--0.647472756587,
-0.324055857998,
-0.664664671630,
--0.674170256196,
-0.322048660839,
-0.638460330512,
--0.700312678735,
-0.319265654848,
-0.611155206211,
--0.725866876419,
-0.315605119791,
-0.582798922105,
--0.750686867968,
-0.311150514469,
-0.553456277089,
--0.774641916478,
-0.305967401183,
-0.523203252676,
--0.797740346409,
-0.299781080293,
-0.492177673538,
--0.820003565031,
-0.292156278398,
-0.460602752856,
--0.841336349636,
-0.282839620354,
-0.353737623468,
--0.815773310318,
-0.457584527618,
-0.355227303402,
--0.797435433487,
-0.487760486650,
-0.356264164777,
--0.778070620550,
-0.517379893630,
-0.757695270858,
--0.546462422108,
-0.356758598697,
-0.736286050876,
--0.575040782451,
-0.356666440534,
-0.713806640845,
--0.603125963516,
-0.355976335757,
-0.690240190766,
--0.630711222675,
-0.354643247000,
-0.665576468844,
--0.657779642589,
-0.352610133031,
-0.639814350079,
--0.684303737632,
-0.349808507752,
-0.612966063110,
--0.710246569034,
-0.346153747128,
-0.585073074726,
--0.735461506991,
-0.341739475281,
-0.556183856224,
--0.759841039922,
-0.336602305587,
-0.526364971637,
--0.783373244052,
-0.330554499496,
-0.495729665716,
--0.806085114031,
-0.323231940665,
-0.464453918379,
--0.827895392664,
-0.314438827927,
-0.432761100466,
--0.848707021341,
-0.303997075396,
-0.381405280847,
--0.829682351515,
-0.407623855198,
-0.383512765718,
--0.812812516444,
-0.438467526327,
-0.385163517317,
--0.794914820719,
-0.468785124263,
-0.386335971924,
--0.775975091741,
-0.498605228407,
-0.386973750712,
--0.756003153871,
-0.527930438218,
-0.735024619344,
--0.556765961453,
-0.386976062730,
-0.713008483361,
--0.585137022965,
-0.386307606721,
-0.689907313273,
--0.613040499416,
-0.384979538636,
-0.665714726040,
--0.640451723410,
-0.382943198809,
-0.640431671412,
--0.667336494396,
-0.380143758990,
-0.614071181884,
--0.693652728129,
-0.376513580550,
-0.586669907908,
--0.719256979903,
-0.372139511495,
-0.558261490186,
--0.744055854754,
-0.367049034302,
-0.528902595989,
--0.768023082420,
-0.361112986232,
-0.498690286605,
--0.791185290265,
-0.354025189094,
-0.467766801419,
--0.813468176753,
-0.345635277280,
-0.436314162382,
--0.834788295384,
-0.335795255467,
-0.407783509839,
--0.840669568647,
-0.356352754240,
-0.410583074410,
--0.825275966449,
-0.387738466249,
-0.412905550289,
--0.808868614821,
-0.418617451258,
-0.414726781098,
--0.791438960078,
-0.449027916183,
-0.416026086109,
--0.772972327295,
-0.478994861051,
-0.416786058701,
--0.753448209780,
-0.508532375029,
-0.416935442360,
--0.732891346756,
-0.537619857105,
-0.711334603417,
--0.566251678969,
-0.416367767780,
-0.688745901990,
--0.594439275764,
-0.415055454031,
-0.665064223696,
--0.622168316708,
-0.413032884943,
-0.640295868218,
--0.649395547747,
-0.410251902749,
-0.614454441682,
--0.676069938392,
-0.406663469592,
-0.587573359299,
--0.702058185534,
-0.402333010784,
-0.559675208815,
--0.727271289041,
-0.397290992567,
-0.530804101780,
--0.751675776835,
-0.391446716748,
-0.501046848216,
--0.775291632664,
-0.384545108166,
-0.470520248113,
--0.798048177475,
-0.376470188122,
-0.439374096697,
--0.819868896647,
-0.367104066256,
-0.441913585854,
--0.803945532468,
-0.397974827673,
-0.443911486568,
--0.787008108319,
-0.428439995253,
-0.445348941818,
--0.769041946132,
-0.458518053200,
-0.446207862853,
--0.750028876023,
-0.488216374428,
-0.446476636089,
--0.729942906296,
-0.517534508004,
-0.446063537463,
--0.708830046658,
-0.546431409694,
-0.686726881908,
--0.574894831285,
-0.444861914111,
-0.663602301060,
--0.602912617112,
-0.442863818973,
-0.639388893066,
--0.630461312556,
-0.440114049758,
-0.614101664803,
--0.657483241684,
-0.436571795002,
-0.587765438490,
--0.683850852040,
-0.432295965145,
-0.560406942497,
--0.709473130230,
-0.427307776997,
-0.532054177275,
--0.734317470250,
-0.421540277233,
-0.502785538788,
--0.758389971474,
-0.414790734170,
-0.472697286949,
--0.781623983224,
-0.406965875424,
-0.474281774208,
--0.764180864874,
-0.437132021722,
-0.475256870014,
--0.745701769945,
-0.466968711806,
-0.475605016580,
--0.726167588560,
-0.496468026693,
-0.475320370235,
--0.705551242770,
-0.525612014194,
-0.474284597513,
--0.683916955627,
-0.554357031495,
-0.661304520129,
--0.582670496325,
-0.472410228900,
-0.637683359104,
--0.610524211320,
-0.469702161921,
-0.612985592165,
--0.637885437226,
-0.466209001172,
-0.587226817914,
--0.664625654627,
-0.461992860913,
-0.560433166465,
--0.690652198290,
-0.457071336798,
-0.532635683392,
--0.715933202654,
-0.451374432279,
-0.503890767410,
--0.740464430822,
-0.444754450462,
-0.504345039968,
--0.721498235687,
-0.474422150157,
-0.504134078430,
--0.701469400717,
-0.503775258249,
-0.503241115018,
--0.680359054884,
-0.532785075422,
-0.501546985237,
--0.658241474435,
-0.561398951668,
-0.635159255457,
--0.589570330925,
-0.498978501641,
-0.611082220403,
--0.617262949603,
-0.495545125044,
-0.585936982761,
--0.644367808544,
-0.491393914844,
-0.559741698729,
--0.670791973493,
-0.486546358533,
-0.532528909506,
--0.696504415720,
-0.480930929991,
-0.531720552765,
--0.676012828283,
-0.510176351632,
-0.530186665764,
--0.654446961178,
-0.539074460952,
-0.527815366965,
--0.631885374868,
-0.567566570038,
-0.608373479152,
--0.595600246531,
-0.524539851867,
-0.583873839746,
--0.623061613926,
-0.520466679540,
-0.558313991109,
--0.649875509274,
-0.515700794820,
-0.556122905592,
--0.627892877918,
-0.544497794059,
-0.553063797714,
--0.604926633262,
-0.572873637051,
-0.581014692332,
--0.600697877342,
-0.549166629950,
--0.033808942809,
--0.564444912266,
--0.824778089187,
--0.028214021915,
--0.533297883394,
--0.845456880352,
--0.109519557567,
--0.491963202941,
--0.863699990427,
--0.065915150055,
--0.572709177876,
--0.817104271541,
--0.060974450443,
--0.541502442661,
--0.838485074993,
--0.164014175138,
--0.472521916522,
--0.865922853816,
--0.100126422527,
--0.608982282690,
--0.786838788369,
--0.097594060363,
--0.579833816791,
--0.808868434473,
--0.092804885412,
--0.548872754349,
--0.830738197495,
--0.087181958074,
--0.517031950018,
--0.851514690917,
--0.134796163093,
--0.669541940069,
--0.730440678566,
--0.133833732760,
--0.643124061264,
--0.753976109567,
--0.132100806769,
--0.615419063405,
--0.777051319572,
--0.129115324484,
--0.586250030929,
--0.799775052261,
--0.124393782999,
--0.555596356581,
--0.822094200992,
--0.118918067119,
--0.524006837327,
--0.843371405579,
--0.271632021008,
--0.428754902697,
--0.861617826288,
--0.167162153783,
--0.675125979501,
--0.718513553210,
--0.165878236754,
--0.648711339050,
--0.742736837082,
--0.163783335534,
--0.621038775748,
--0.766476260571,
--0.160520285659,
--0.592020303273,
--0.789775410103,
--0.155848479757,
--0.561699815759,
--0.812529733815,
--0.150437421474,
--0.530428050300,
--0.834274934105,
--0.142348561156,
--0.498443291170,
--0.855155642339,
--0.200493802702,
--0.728943598230,
--0.654555930137,
--0.200054454041,
--0.704886410201,
--0.680524330302,
--0.199136204955,
--0.679741137757,
--0.705901379456,
--0.197599219356,
--0.653442399265,
--0.730730852881,
--0.195246487927,
--0.625926238235,
--0.755046457671,
--0.191809309866,
--0.597152273116,
--0.778857080189,
--0.187182977821,
--0.567184166445,
--0.802037813416,
--0.181819765556,
--0.536257540194,
--0.824238693243,
--0.174459265807,
--0.504523180177,
--0.845588744745,
--0.232512966481,
--0.755080149457,
--0.613018505686,
--0.232406002408,
--0.732280315084,
--0.640119512424,
--0.231857378845,
--0.708427055056,
--0.666613278850,
--0.230779567301,
--0.683476704513,
--0.692531866202,
--0.229053192549,
--0.657383695200,
--0.717900628408,
--0.226519891802,
--0.630110243263,
--0.742731324204,
--0.222973618767,
--0.601641472724,
--0.767013887509,
--0.218391593631,
--0.572044414600,
--0.790613875135,
--0.213073051778,
--0.541483071415,
--0.813262539391,
--0.206168699119,
--0.510072453932,
--0.835057219143,
--0.196844363417,
--0.478160091038,
--0.855929450322,
--0.263795530239,
--0.778668566712,
--0.569286554769,
--0.264091317188,
--0.757178341270,
--0.597441826204,
--0.263954247034,
--0.734654367222,
--0.624988892857,
--0.263327052508,
--0.711065844150,
--0.651954161502,
--0.262132722457,
--0.686379328193,
--0.678358204525,
--0.260270965544,
--0.660563638400,
--0.704212115856,
--0.257614289309,
--0.633597343680,
--0.729513045822,
--0.254002207524,
--0.605479283593,
--0.754239826390,
--0.249463735385,
--0.576273202140,
--0.778252556194,
--0.244189856046,
--0.546096642452,
--0.801342480658,
--0.237598659680,
--0.515046817130,
--0.823573708348,
--0.229035678289,
--0.483363015301,
--0.844927720879,
--0.294195255276,
--0.799589918889,
--0.523550487904,
--0.294974653241,
--0.779455802997,
--0.552665002619,
--0.295311182944,
--0.758300939460,
--0.581180686570,
--0.295167257179,
--0.736102351280,
--0.609122006440,
--0.294492359556,
--0.712834205766,
--0.636507380361,
--0.293220454418,
--0.688470882230,
--0.663347276645,
--0.291267836503,
--0.662991168989,
--0.689641760091,
--0.288531046233,
--0.636383798254,
--0.715377869855,
--0.284883448108,
--0.608654782961,
--0.740527363554,
--0.280387516774,
--0.579861550773,
--0.764946679431,
--0.275158818591,
--0.550090554379,
--0.788471944038,
--0.268796960904,
--0.519427438857,
--0.811137059671,
--0.260774075091,
--0.488048484576,
--0.832949913538,
--0.250767114349,
--0.456245355086,
--0.853789218908,
--0.505994646785,
--0.324905517562,
--0.799003017568,
--0.325799072911,
--0.779247788370,
--0.535376361461,
--0.326194701241,
--0.758470091102,
--0.564198668721,
--0.326066515963,
--0.736643904723,
--0.592483235883,
--0.325372099921,
--0.713746740685,
--0.620240749029,
--0.324055857998,
--0.689758530483,
--0.647472756587,
--0.322048660839,
--0.664664671630,
--0.674170256196,
--0.319265654848,
--0.638460330512,
--0.700312678735,
--0.315605119791,
--0.611155206211,
--0.725866876419,
--0.311150514469,
--0.582798922105,
--0.750686867968,
--0.305967401183,
--0.553456277089,
--0.774641916478,
--0.299781080293,
--0.523203252676,
--0.797740346409,
--0.292156278398,
--0.492177673538,
--0.820003565031,
--0.282839620354,
--0.460602752856,
--0.841336349636,
--0.457584527618,
--0.353737623468,
--0.815773310318,
--0.487760486650,
--0.355227303402,
--0.797435433487,
--0.517379893630,
--0.356264164777,
--0.778070620550,
--0.356758598697,
--0.757695270858,
--0.546462422108,
--0.356666440534,
--0.736286050876,
--0.575040782451,
--0.355976335757,
--0.713806640845,
--0.603125963516,
--0.354643247000,
--0.690240190766,
--0.630711222675,
--0.352610133031,
--0.665576468844,
--0.657779642589,
--0.349808507752,
--0.639814350079,
--0.684303737632,
--0.346153747128,
--0.612966063110,
--0.710246569034,
--0.341739475281,
--0.585073074726,
--0.735461506991,
--0.336602305587,
--0.556183856224,
--0.759841039922,
--0.330554499496,
--0.526364971637,
--0.783373244052,
--0.323231940665,
--0.495729665716,
--0.806085114031,
--0.314438827927,
--0.464453918379,
--0.827895392664,
--0.303997075396,
--0.432761100466,
--0.848707021341,
--0.407623855198,
--0.381405280847,
--0.829682351515,
--0.438467526327,
--0.383512765718,
--0.812812516444,
--0.468785124263,
--0.385163517317,
--0.794914820719,
--0.498605228407,
--0.386335971924,
--0.775975091741,
--0.527930438218,
--0.386973750712,
--0.756003153871,
--0.386976062730,
--0.735024619344,
--0.556765961453,
--0.386307606721,
--0.713008483361,
--0.585137022965,
--0.384979538636,
--0.689907313273,
--0.613040499416,
--0.382943198809,
--0.665714726040,
--0.640451723410,
--0.380143758990,
--0.640431671412,
--0.667336494396,
--0.376513580550,
--0.614071181884,
--0.693652728129,
--0.372139511495,
--0.586669907908,
--0.719256979903,
--0.367049034302,
--0.558261490186,
--0.744055854754,
--0.361112986232,
--0.528902595989,
--0.768023082420,
--0.354025189094,
--0.498690286605,
--0.791185290265,
--0.345635277280,
--0.467766801419,
--0.813468176753,
--0.335795255467,
--0.436314162382,
--0.834788295384,
--0.356352754240,
--0.407783509839,
--0.840669568647,
--0.387738466249,
--0.410583074410,
--0.825275966449,
--0.418617451258,
--0.412905550289,
--0.808868614821,
--0.449027916183,
--0.414726781098,
--0.791438960078,
--0.478994861051,
--0.416026086109,
--0.772972327295,
--0.508532375029,
--0.416786058701,
--0.753448209780,
--0.537619857105,
--0.416935442360,
--0.732891346756,
--0.416367767780,
--0.711334603417,
--0.566251678969,
--0.415055454031,
--0.688745901990,
--0.594439275764,
--0.413032884943,
--0.665064223696,
--0.622168316708,
--0.410251902749,
--0.640295868218,
--0.649395547747,
--0.406663469592,
--0.614454441682,
--0.676069938392,
--0.402333010784,
--0.587573359299,
--0.702058185534,
--0.397290992567,
--0.559675208815,
--0.727271289041,
--0.391446716748,
--0.530804101780,
--0.751675776835,
--0.384545108166,
--0.501046848216,
--0.775291632664,
--0.376470188122,
--0.470520248113,
--0.798048177475,
--0.367104066256,
--0.439374096697,
--0.819868896647,
--0.397974827673,
--0.441913585854,
--0.803945532468,
--0.428439995253,
--0.443911486568,
--0.787008108319,
--0.458518053200,
--0.445348941818,
--0.769041946132,
--0.488216374428,
--0.446207862853,
--0.750028876023,
--0.517534508004,
--0.446476636089,
--0.729942906296,
--0.546431409694,
--0.446063537463,
--0.708830046658,
--0.444861914111,
--0.686726881908,
--0.574894831285,
--0.442863818973,
--0.663602301060,
--0.602912617112,
--0.440114049758,
--0.639388893066,
--0.630461312556,
--0.436571795002,
--0.614101664803,
--0.657483241684,
--0.432295965145,
--0.587765438490,
--0.683850852040,
--0.427307776997,
--0.560406942497,
--0.709473130230,
--0.421540277233,
--0.532054177275,
--0.734317470250,
--0.414790734170,
--0.502785538788,
--0.758389971474,
--0.406965875424,
--0.472697286949,
--0.781623983224,
--0.437132021722,
--0.474281774208,
--0.764180864874,
--0.466968711806,
--0.475256870014,
--0.745701769945,
--0.496468026693,
--0.475605016580,
--0.726167588560,
--0.525612014194,
--0.475320370235,
--0.705551242770,
--0.554357031495,
--0.474284597513,
--0.683916955627,
--0.472410228900,
--0.661304520129,
--0.582670496325,
--0.469702161921,
--0.637683359104,
--0.610524211320,
--0.466209001172,
--0.612985592165,
--0.637885437226,
--0.461992860913,
--0.587226817914,
--0.664625654627,
--0.457071336798,
--0.560433166465,
--0.690652198290,
--0.451374432279,
--0.532635683392,
--0.715933202654,
--0.444754450462,
--0.503890767410,
--0.740464430822,
--0.474422150157,
--0.504345039968,
--0.721498235687,
--0.503775258249,
--0.504134078430,
--0.701469400717,
--0.532785075422,
--0.503241115018,
--0.680359054884,
--0.561398951668,
--0.501546985237,
--0.658241474435,
--0.498978501641,
--0.635159255457,
--0.589570330925,
--0.495545125044,
--0.611082220403,
--0.617262949603,
--0.491393914844,
--0.585936982761,
--0.644367808544,
--0.486546358533,
--0.559741698729,
--0.670791973493,
--0.480930929991,
--0.532528909506,
--0.696504415720,
--0.510176351632,
--0.531720552765,
--0.676012828283,
--0.539074460952,
--0.530186665764,
--0.654446961178,
--0.567566570038,
--0.527815366965,
--0.631885374868,
--0.524539851867,
--0.608373479152,
--0.595600246531,
--0.520466679540,
--0.583873839746,
--0.623061613926,
--0.515700794820,
--0.558313991109,
--0.649875509274,
--0.544497794059,
--0.556122905592,
--0.627892877918,
--0.572873637051,
--0.553063797714,
--0.604926633262,
--0.549166629950,
--0.581014692332,
--0.600697877342,
-0.033808942809,
-0.564444912266,
--0.824778089187,
-0.028214021915,
-0.533297883394,
--0.845456880352,
-0.109519557567,
-0.491963202941,
--0.863699990427,
-0.065915150055,
-0.572709177876,
--0.817104271541,
-0.060974450443,
-0.541502442661,
--0.838485074993,
-0.164014175138,
-0.472521916522,
--0.865922853816,
-0.100126422527,
-0.608982282690,
--0.786838788369,
-0.097594060363,
-0.579833816791,
--0.808868434473,
-0.092804885412,
-0.548872754349,
--0.830738197495,
-0.087181958074,
-0.517031950018,
--0.851514690917,
-0.134796163093,
-0.669541940069,
--0.730440678566,
-0.133833732760,
-0.643124061264,
--0.753976109567,
-0.132100806769,
-0.615419063405,
--0.777051319572,
-0.129115324484,
-0.586250030929,
--0.799775052261,
-0.124393782999,
-0.555596356581,
--0.822094200992,
-0.118918067119,
-0.524006837327,
--0.843371405579,
-0.271632021008,
-0.428754902697,
--0.861617826288,
-0.167162153783,
-0.675125979501,
--0.718513553210,
-0.165878236754,
-0.648711339050,
--0.742736837082,
-0.163783335534,
-0.621038775748,
--0.766476260571,
-0.160520285659,
-0.592020303273,
--0.789775410103,
-0.155848479757,
-0.561699815759,
--0.812529733815,
-0.150437421474,
-0.530428050300,
--0.834274934105,
-0.142348561156,
-0.498443291170,
--0.855155642339,
-0.200493802702,
-0.728943598230,
--0.654555930137,
-0.200054454041,
-0.704886410201,
--0.680524330302,
-0.199136204955,
-0.679741137757,
--0.705901379456,
-0.197599219356,
-0.653442399265,
--0.730730852881,
-0.195246487927,
-0.625926238235,
--0.755046457671,
-0.191809309866,
-0.597152273116,
--0.778857080189,
-0.187182977821,
-0.567184166445,
--0.802037813416,
-0.181819765556,
-0.536257540194,
--0.824238693243,
-0.174459265807,
-0.504523180177,
--0.845588744745,
-0.232512966481,
-0.755080149457,
--0.613018505686,
-0.232406002408,
-0.732280315084,
--0.640119512424,
-0.231857378845,
-0.708427055056,
--0.666613278850,
-0.230779567301,
-0.683476704513,
--0.692531866202,
-0.229053192549,
-0.657383695200,
--0.717900628408,
-0.226519891802,
-0.630110243263,
--0.742731324204,
-0.222973618767,
-0.601641472724,
--0.767013887509,
-0.218391593631,
-0.572044414600,
--0.790613875135,
-0.213073051778,
-0.541483071415,
--0.813262539391,
-0.206168699119,
-0.510072453932,
--0.835057219143,
-0.196844363417,
-0.478160091038,
--0.855929450322,
-0.263795530239,
-0.778668566712,
--0.569286554769,
-0.264091317188,
-0.757178341270,
--0.597441826204,
-0.263954247034,
-0.734654367222,
--0.624988892857,
-0.263327052508,
-0.711065844150,
--0.651954161502,
-0.262132722457,
-0.686379328193,
--0.678358204525,
-0.260270965544,
-0.660563638400,
--0.704212115856,
-0.257614289309,
-0.633597343680,
--0.729513045822,
-0.254002207524,
-0.605479283593,
--0.754239826390,
-0.249463735385,
-0.576273202140,
--0.778252556194,
-0.244189856046,
-0.546096642452,
--0.801342480658,
-0.237598659680,
-0.515046817130,
--0.823573708348,
-0.229035678289,
-0.483363015301,
--0.844927720879,
-0.294195255276,
-0.799589918889,
--0.523550487904,
-0.294974653241,
-0.779455802997,
--0.552665002619,
-0.295311182944,
-0.758300939460,
--0.581180686570,
-0.295167257179,
-0.736102351280,
--0.609122006440,
-0.294492359556,
-0.712834205766,
--0.636507380361,
-0.293220454418,
-0.688470882230,
--0.663347276645,
-0.291267836503,
-0.662991168989,
--0.689641760091,
-0.288531046233,
-0.636383798254,
--0.715377869855,
-0.284883448108,
-0.608654782961,
--0.740527363554,
-0.280387516774,
-0.579861550773,
--0.764946679431,
-0.275158818591,
-0.550090554379,
--0.788471944038,
-0.268796960904,
-0.519427438857,
--0.811137059671,
-0.260774075091,
-0.488048484576,
--0.832949913538,
-0.250767114349,
-0.456245355086,
--0.853789218908,
-0.505994646785,
-0.324905517562,
--0.799003017568,
-0.325799072911,
-0.779247788370,
--0.535376361461,
-0.326194701241,
-0.758470091102,
--0.564198668721,
-0.326066515963,
-0.736643904723,
--0.592483235883,
-0.325372099921,
-0.713746740685,
--0.620240749029,
-0.324055857998,
-0.689758530483,
--0.647472756587,
-0.322048660839,
-0.664664671630,
--0.674170256196,
-0.319265654848,
-0.638460330512,
--0.700312678735,
-0.315605119791,
-0.611155206211,
--0.725866876419,
-0.311150514469,
-0.582798922105,
--0.750686867968,
-0.305967401183,
-0.553456277089,
--0.774641916478,
-0.299781080293,
-0.523203252676,
--0.797740346409,
-0.292156278398,
-0.492177673538,
--0.820003565031,
-0.282839620354,
-0.460602752856,
--0.841336349636,
-0.457584527618,
-0.353737623468,
--0.815773310318,
-0.487760486650,
-0.355227303402,
--0.797435433487,
-0.517379893630,
-0.356264164777,
--0.778070620550,
-0.356758598697,
-0.757695270858,
--0.546462422108,
-0.356666440534,
-0.736286050876,
--0.575040782451,
-0.355976335757,
-0.713806640845,
--0.603125963516,
-0.354643247000,
-0.690240190766,
--0.630711222675,
-0.352610133031,
-0.665576468844,
--0.657779642589,
-0.349808507752,
-0.639814350079,
--0.684303737632,
-0.346153747128,
-0.612966063110,
--0.710246569034,
-0.341739475281,
-0.585073074726,
--0.735461506991,
-0.336602305587,
-0.556183856224,
--0.759841039922,
-0.330554499496,
-0.526364971637,
--0.783373244052,
-0.323231940665,
-0.495729665716,
--0.806085114031,
-0.314438827927,
-0.464453918379,
--0.827895392664,
-0.303997075396,
-0.432761100466,
--0.848707021341,
-0.407623855198,
-0.381405280847,
--0.829682351515,
-0.438467526327,
-0.383512765718,
--0.812812516444,
-0.468785124263,
-0.385163517317,
--0.794914820719,
-0.498605228407,
-0.386335971924,
--0.775975091741,
-0.527930438218,
-0.386973750712,
--0.756003153871,
-0.386976062730,
-0.735024619344,
--0.556765961453,
-0.386307606721,
-0.713008483361,
--0.585137022965,
-0.384979538636,
-0.689907313273,
--0.613040499416,
-0.382943198809,
-0.665714726040,
--0.640451723410,
-0.380143758990,
-0.640431671412,
--0.667336494396,
-0.376513580550,
-0.614071181884,
--0.693652728129,
-0.372139511495,
-0.586669907908,
--0.719256979903,
-0.367049034302,
-0.558261490186,
--0.744055854754,
-0.361112986232,
-0.528902595989,
--0.768023082420,
-0.354025189094,
-0.498690286605,
--0.791185290265,
-0.345635277280,
-0.467766801419,
--0.813468176753,
-0.335795255467,
-0.436314162382,
--0.834788295384,
-0.356352754240,
-0.407783509839,
--0.840669568647,
-0.387738466249,
-0.410583074410,
--0.825275966449,
-0.418617451258,
-0.412905550289,
--0.808868614821,
-0.449027916183,
-0.414726781098,
--0.791438960078,
-0.478994861051,
-0.416026086109,
--0.772972327295,
-0.508532375029,
-0.416786058701,
--0.753448209780,
-0.537619857105,
-0.416935442360,
--0.732891346756,
-0.416367767780,
-0.711334603417,
--0.566251678969,
-0.415055454031,
-0.688745901990,
--0.594439275764,
-0.413032884943,
-0.665064223696,
--0.622168316708,
-0.410251902749,
-0.640295868218,
--0.649395547747,
-0.406663469592,
-0.614454441682,
--0.676069938392,
-0.402333010784,
-0.587573359299,
--0.702058185534,
-0.397290992567,
-0.559675208815,
--0.727271289041,
-0.391446716748,
-0.530804101780,
--0.751675776835,
-0.384545108166,
-0.501046848216,
--0.775291632664,
-0.376470188122,
-0.470520248113,
--0.798048177475,
-0.367104066256,
-0.439374096697,
--0.819868896647,
-0.397974827673,
-0.441913585854,
--0.803945532468,
-0.428439995253,
-0.443911486568,
--0.787008108319,
-0.458518053200,
-0.445348941818,
--0.769041946132,
-0.488216374428,
-0.446207862853,
--0.750028876023,
-0.517534508004,
-0.446476636089,
--0.729942906296,
-0.546431409694,
-0.446063537463,
--0.708830046658,
-0.444861914111,
-0.686726881908,
--0.574894831285,
-0.442863818973,
-0.663602301060,
--0.602912617112,
-0.440114049758,
-0.639388893066,
--0.630461312556,
-0.436571795002,
-0.614101664803,
--0.657483241684,
-0.432295965145,
-0.587765438490,
--0.683850852040,
-0.427307776997,
-0.560406942497,
--0.709473130230,
-0.421540277233,
-0.532054177275,
--0.734317470250,
-0.414790734170,
-0.502785538788,
--0.758389971474,
-0.406965875424,
-0.472697286949,
--0.781623983224,
-0.437132021722,
-0.474281774208,
--0.764180864874,
-0.466968711806,
-0.475256870014,
--0.745701769945,
-0.496468026693,
-0.475605016580,
--0.726167588560,
-0.525612014194,
-0.475320370235,
--0.705551242770,
-0.554357031495,
-0.474284597513,
--0.683916955627,
-0.472410228900,
-0.661304520129,
--0.582670496325,
-0.469702161921,
-0.637683359104,
--0.610524211320,
-0.466209001172,
-0.612985592165,
--0.637885437226,
-0.461992860913,
-0.587226817914,
--0.664625654627,
-0.457071336798,
-0.560433166465,
--0.690652198290,
-0.451374432279,
-0.532635683392,
--0.715933202654,
-0.444754450462,
-0.503890767410,
--0.740464430822,
-0.474422150157,
-0.504345039968,
--0.721498235687,
-0.503775258249,
-0.504134078430,
--0.701469400717,
-0.532785075422,
-0.503241115018,
--0.680359054884,
-0.561398951668,
-0.501546985237,
--0.658241474435,
-0.498978501641,
-0.635159255457,
--0.589570330925,
-0.495545125044,
-0.611082220403,
--0.617262949603,
-0.491393914844,
-0.585936982761,
--0.644367808544,
-0.486546358533,
-0.559741698729,
--0.670791973493,
-0.480930929991,
-0.532528909506,
--0.696504415720,
-0.510176351632,
-0.531720552765,
--0.676012828283,
-0.539074460952,
-0.530186665764,
--0.654446961178,
-0.567566570038,
-0.527815366965,
--0.631885374868,
-0.524539851867,
-0.608373479152,
--0.595600246531,
-0.520466679540,
-0.583873839746,
--0.623061613926,
-0.515700794820,
-0.558313991109,
--0.649875509274,
-0.544497794059,
-0.556122905592,
--0.627892877918,
-0.572873637051,
-0.553063797714,
--0.604926633262,
-0.549166629950,
-0.581014692332,
--0.600697877342,
--0.824778089187,
--0.033808942809,
--0.564444912266,
--0.845456880352,
--0.028214021915,
--0.533297883394,
--0.863699990427,
--0.109519557567,
--0.491963202941,
--0.817104271541,
--0.065915150055,
--0.572709177876,
--0.838485074993,
--0.060974450443,
--0.541502442661,
--0.865922853816,
--0.164014175138,
--0.472521916522,
--0.786838788369,
--0.100126422527,
--0.608982282690,
--0.808868434473,
--0.097594060363,
--0.579833816791,
--0.830738197495,
--0.092804885412,
--0.548872754349,
--0.851514690917,
--0.087181958074,
--0.517031950018,
--0.730440678566,
--0.134796163093,
--0.669541940069,
--0.753976109567,
--0.133833732760,
--0.643124061264,
--0.777051319572,
--0.132100806769,
--0.615419063405,
--0.799775052261,
--0.129115324484,
--0.586250030929,
--0.822094200992,
--0.124393782999,
--0.555596356581,
--0.843371405579,
--0.118918067119,
--0.524006837327,
--0.861617826288,
--0.271632021008,
--0.428754902697,
--0.718513553210,
--0.167162153783,
--0.675125979501,
--0.742736837082,
--0.165878236754,
--0.648711339050,
--0.766476260571,
--0.163783335534,
--0.621038775748,
--0.789775410103,
--0.160520285659,
--0.592020303273,
--0.812529733815,
--0.155848479757,
--0.561699815759,
--0.834274934105,
--0.150437421474,
--0.530428050300,
--0.855155642339,
--0.142348561156,
--0.498443291170,
--0.654555930137,
--0.200493802702,
--0.728943598230,
--0.680524330302,
--0.200054454041,
--0.704886410201,
--0.705901379456,
--0.199136204955,
--0.679741137757,
--0.730730852881,
--0.197599219356,
--0.653442399265,
--0.755046457671,
--0.195246487927,
--0.625926238235,
--0.778857080189,
--0.191809309866,
--0.597152273116,
--0.802037813416,
--0.187182977821,
--0.567184166445,
--0.824238693243,
--0.181819765556,
--0.536257540194,
--0.845588744745,
--0.174459265807,
--0.504523180177,
--0.613018505686,
--0.232512966481,
--0.755080149457,
--0.640119512424,
--0.232406002408,
--0.732280315084,
--0.666613278850,
--0.231857378845,
--0.708427055056,
--0.692531866202,
--0.230779567301,
--0.683476704513,
--0.717900628408,
--0.229053192549,
--0.657383695200,
--0.742731324204,
--0.226519891802,
--0.630110243263,
--0.767013887509,
--0.222973618767,
--0.601641472724,
--0.790613875135,
--0.218391593631,
--0.572044414600,
--0.813262539391,
--0.213073051778,
--0.541483071415,
--0.835057219143,
--0.206168699119,
--0.510072453932,
--0.855929450322,
--0.196844363417,
--0.478160091038,
--0.569286554769,
--0.263795530239,
--0.778668566712,
--0.597441826204,
--0.264091317188,
--0.757178341270,
--0.624988892857,
--0.263954247034,
--0.734654367222,
--0.651954161502,
--0.263327052508,
--0.711065844150,
--0.678358204525,
--0.262132722457,
--0.686379328193,
--0.704212115856,
--0.260270965544,
--0.660563638400,
--0.729513045822,
--0.257614289309,
--0.633597343680,
--0.754239826390,
--0.254002207524,
--0.605479283593,
--0.778252556194,
--0.249463735385,
--0.576273202140,
--0.801342480658,
--0.244189856046,
--0.546096642452,
--0.823573708348,
--0.237598659680,
--0.515046817130,
--0.844927720879,
--0.229035678289,
--0.483363015301,
--0.523550487904,
--0.294195255276,
--0.799589918889,
--0.552665002619,
--0.294974653241,
--0.779455802997,
--0.581180686570,
--0.295311182944,
--0.758300939460,
--0.609122006440,
--0.295167257179,
--0.736102351280,
--0.636507380361,
--0.294492359556,
--0.712834205766,
--0.663347276645,
--0.293220454418,
--0.688470882230,
--0.689641760091,
--0.291267836503,
--0.662991168989,
--0.715377869855,
--0.288531046233,
--0.636383798254,
--0.740527363554,
--0.284883448108,
--0.608654782961,
--0.764946679431,
--0.280387516774,
--0.579861550773,
--0.788471944038,
--0.275158818591,
--0.550090554379,
--0.811137059671,
--0.268796960904,
--0.519427438857,
--0.832949913538,
--0.260774075091,
--0.488048484576,
--0.853789218908,
--0.250767114349,
--0.456245355086,
--0.799003017568,
--0.505994646785,
--0.324905517562,
--0.535376361461,
--0.325799072911,
--0.779247788370,
--0.564198668721,
--0.326194701241,
--0.758470091102,
--0.592483235883,
--0.326066515963,
--0.736643904723,
--0.620240749029,
--0.325372099921,
--0.713746740685,
--0.647472756587,
--0.324055857998,
--0.689758530483,
--0.674170256196,
--0.322048660839,
--0.664664671630,
--0.700312678735,
--0.319265654848,
--0.638460330512,
--0.725866876419,
--0.315605119791,
--0.611155206211,
--0.750686867968,
--0.311150514469,
--0.582798922105,
--0.774641916478,
--0.305967401183,
--0.553456277089,
--0.797740346409,
--0.299781080293,
--0.523203252676,
--0.820003565031,
--0.292156278398,
--0.492177673538,
--0.841336349636,
--0.282839620354,
--0.460602752856,
--0.815773310318,
--0.457584527618,
--0.353737623468,
--0.797435433487,
--0.487760486650,
--0.355227303402,
--0.778070620550,
--0.517379893630,
--0.356264164777,
--0.546462422108,
--0.356758598697,
--0.757695270858,
--0.575040782451,
--0.356666440534,
--0.736286050876,
--0.603125963516,
--0.355976335757,
--0.713806640845,
--0.630711222675,
--0.354643247000,
--0.690240190766,
--0.657779642589,
--0.352610133031,
--0.665576468844,
--0.684303737632,
--0.349808507752,
--0.639814350079,
--0.710246569034,
--0.346153747128,
--0.612966063110,
--0.735461506991,
--0.341739475281,
--0.585073074726,
--0.759841039922,
--0.336602305587,
--0.556183856224,
--0.783373244052,
--0.330554499496,
--0.526364971637,
--0.806085114031,
--0.323231940665,
--0.495729665716,
--0.827895392664,
--0.314438827927,
--0.464453918379,
--0.848707021341,
--0.303997075396,
--0.432761100466,
--0.829682351515,
--0.407623855198,
--0.381405280847,
--0.812812516444,
--0.438467526327,
--0.383512765718,
--0.794914820719,
--0.468785124263,
--0.385163517317,
--0.775975091741,
--0.498605228407,
--0.386335971924,
--0.756003153871,
--0.527930438218,
--0.386973750712,
--0.556765961453,
--0.386976062730,
--0.735024619344,
--0.585137022965,
--0.386307606721,
--0.713008483361,
--0.613040499416,
--0.384979538636,
--0.689907313273,
--0.640451723410,
--0.382943198809,
--0.665714726040,
--0.667336494396,
--0.380143758990,
--0.640431671412,
--0.693652728129,
--0.376513580550,
--0.614071181884,
--0.719256979903,
--0.372139511495,
--0.586669907908,
--0.744055854754,
--0.367049034302,
--0.558261490186,
--0.768023082420,
--0.361112986232,
--0.528902595989,
--0.791185290265,
--0.354025189094,
--0.498690286605,
--0.813468176753,
--0.345635277280,
--0.467766801419,
--0.834788295384,
--0.335795255467,
--0.436314162382,
--0.840669568647,
--0.356352754240,
--0.407783509839,
--0.825275966449,
--0.387738466249,
--0.410583074410,
--0.808868614821,
--0.418617451258,
--0.412905550289,
--0.791438960078,
--0.449027916183,
--0.414726781098,
--0.772972327295,
--0.478994861051,
--0.416026086109,
--0.753448209780,
--0.508532375029,
--0.416786058701,
--0.732891346756,
--0.537619857105,
--0.416935442360,
--0.566251678969,
--0.416367767780,
--0.711334603417,
--0.594439275764,
--0.415055454031,
--0.688745901990,
--0.622168316708,
--0.413032884943,
--0.665064223696,
--0.649395547747,
--0.410251902749,
--0.640295868218,
--0.676069938392,
--0.406663469592,
--0.614454441682,
--0.702058185534,
--0.402333010784,
--0.587573359299,
--0.727271289041,
--0.397290992567,
--0.559675208815,
--0.751675776835,
--0.391446716748,
--0.530804101780,
--0.775291632664,
--0.384545108166,
--0.501046848216,
--0.798048177475,
--0.376470188122,
--0.470520248113,
--0.819868896647,
--0.367104066256,
--0.439374096697,
--0.803945532468,
--0.397974827673,
--0.441913585854,
--0.787008108319,
--0.428439995253,
--0.443911486568,
--0.769041946132,
--0.458518053200,
--0.445348941818,
--0.750028876023,
--0.488216374428,
--0.446207862853,
--0.729942906296,
--0.517534508004,
--0.446476636089,
--0.708830046658,
--0.546431409694,
--0.446063537463,
--0.574894831285,
--0.444861914111,
--0.686726881908,
--0.602912617112,
--0.442863818973,
--0.663602301060,
--0.630461312556,
--0.440114049758,
--0.639388893066,
--0.657483241684,
--0.436571795002,
--0.614101664803,
--0.683850852040,
--0.432295965145,
--0.587765438490,
--0.709473130230,
--0.427307776997,
--0.560406942497,
--0.734317470250,
--0.421540277233,
--0.532054177275,
--0.758389971474,
--0.414790734170,
--0.502785538788,
--0.781623983224,
--0.406965875424,
--0.472697286949,
--0.764180864874,
--0.437132021722,
--0.474281774208,
--0.745701769945,
--0.466968711806,
--0.475256870014,
--0.726167588560,
--0.496468026693,
--0.475605016580,
--0.705551242770,
--0.525612014194,
--0.475320370235,
--0.683916955627,
--0.554357031495,
--0.474284597513,
--0.582670496325,
--0.472410228900,
--0.661304520129,
--0.610524211320,
--0.469702161921,
--0.637683359104,
--0.637885437226,
--0.466209001172,
--0.612985592165,
--0.664625654627,
--0.461992860913,
--0.587226817914,
--0.690652198290,
--0.457071336798,
--0.560433166465,
--0.715933202654,
--0.451374432279,
--0.532635683392,
--0.740464430822,
--0.444754450462,
--0.503890767410,
--0.721498235687,
--0.474422150157,
--0.504345039968,
--0.701469400717,
--0.503775258249,
--0.504134078430,
--0.680359054884,
--0.532785075422,
--0.503241115018,
--0.658241474435,
--0.561398951668,
--0.501546985237,
--0.589570330925,
--0.498978501641,
--0.635159255457,
--0.617262949603,
--0.495545125044,
--0.611082220403,
--0.644367808544,
--0.491393914844,
--0.585936982761,
--0.670791973493,
--0.486546358533,
--0.559741698729,
--0.696504415720,
--0.480930929991,
--0.532528909506,
--0.676012828283,
--0.510176351632,
--0.531720552765,
--0.654446961178,
--0.539074460952,
--0.530186665764,
--0.631885374868,
--0.567566570038,
--0.527815366965,
--0.595600246531,
--0.524539851867,
--0.608373479152,
--0.623061613926,
--0.520466679540,
--0.583873839746,
--0.649875509274,
--0.515700794820,
--0.558313991109,
--0.627892877918,
--0.544497794059,
--0.556122905592,
--0.604926633262,
--0.572873637051,
--0.553063797714,
--0.600697877342,
--0.549166629950,
--0.581014692332,
--0.564444911575,
-0.824778089614,
--0.033808943928,
--0.550735108946,
-0.834680082291,
-0.000000001697,
--0.601482759841,
-0.796013181829,
-0.067686807932,
--0.592180171602,
-0.805070535623,
--0.034410420412,
--0.579186725664,
-0.815194907255,
-0.000000000297,
--0.636536090912,
-0.764556519406,
-0.101366333663,
--0.628641676194,
-0.774688614985,
--0.068316855638,
--0.618826254245,
-0.784769782823,
--0.034502971258,
--0.606229327536,
-0.795289885787,
--0.000000000517,
--0.592180171147,
-0.805070536065,
-0.034410417907,
--0.669541939813,
-0.730440678724,
--0.134796163508,
--0.662827226065,
-0.741798884035,
--0.101953342427,
--0.654703392598,
-0.752772268905,
--0.068537426908,
--0.644725590032,
-0.763635169224,
--0.034499882344,
--0.632475941815,
-0.774580004277,
--0.000000001049,
--0.618826252795,
-0.784769784026,
-0.034502969901,
--0.700386923539,
-0.693740004974,
-0.167877821148,
--0.694832911607,
-0.706333999354,
--0.135275667820,
--0.688072287063,
-0.718410433381,
--0.102190885040,
--0.679877080018,
-0.730112188692,
--0.068580959385,
--0.669927814138,
-0.741625920410,
--0.034463285101,
--0.658019472734,
-0.753000912020,
--0.000000000986,
--0.644725588332,
-0.763635170771,
-0.034499879892,
--0.628641677003,
-0.774688614614,
-0.068316852403,
--0.728943598949,
-0.654555929692,
--0.200493801539,
--0.724584241369,
-0.668350401135,
--0.168182693707,
--0.719110665487,
-0.681569673198,
--0.135434970966,
--0.712390578021,
-0.694298874835,
--0.102219062554,
--0.704243032905,
-0.706644016675,
--0.068527252260,
--0.694433201887,
-0.718734159752,
--0.034405460658,
--0.682869607814,
-0.730540278646,
--0.000000001682,
--0.669927813978,
-0.741625920758,
-0.034463280713,
--0.654703393330,
-0.752772268578,
-0.068537423514,
--0.755080152148,
-0.613018504024,
--0.232512962128,
--0.751968370855,
-0.627951624785,
--0.200550058999,
--0.747784919126,
-0.642288781130,
--0.168175017056,
--0.742447059960,
-0.656086182207,
--0.135363527859,
--0.735843267438,
-0.669409946022,
--0.102102937924,
--0.727830165097,
-0.682337091132,
--0.068405736897,
--0.718230509404,
-0.694957900126,
--0.034328594704,
--0.707017841381,
-0.707195709806,
--0.000000001520,
--0.694433201200,
-0.718734160601,
-0.034405456797,
--0.679877080252,
-0.730112188631,
-0.068580957714,
--0.662827226906,
-0.741798883751,
-0.101953339022,
--0.778668570452,
-0.569286552457,
--0.263795524187,
--0.776863211754,
-0.585275907180,
--0.232240527680,
--0.774002844387,
-0.600670196563,
--0.200287073575,
--0.770033898090,
-0.615509899917,
--0.167914736983,
--0.764883704818,
-0.629839831505,
--0.135109972812,
--0.758458964912,
-0.643709476732,
--0.101872999909,
--0.750644938662,
-0.657173653822,
--0.068227302327,
--0.741304668481,
-0.670295121994,
--0.034232118240,
--0.730450268257,
-0.682965889048,
--0.000000002123,
--0.718230509459,
-0.694957900233,
-0.034328591386,
--0.704243034087,
-0.706644015726,
-0.068527249899,
--0.688072288475,
-0.718410432245,
-0.102190883518,
--0.799589918803,
-0.523550487957,
--0.294195255416,
--0.799150286886,
-0.540493142185,
--0.263108308917,
--0.797656944313,
-0.556857337909,
--0.231631829430,
--0.795075554518,
-0.572674562413,
--0.199746609914,
--0.791358024054,
-0.587976991732,
--0.167438152639,
--0.786441353493,
-0.602798195510,
--0.134700902021,
--0.780247238039,
-0.617173524031,
--0.101543531393,
--0.772682338120,
-0.631140739601,
--0.067995376114,
--0.763638482554,
-0.644742169503,
--0.034114554464,
--0.753150565202,
-0.657848178636,
--0.000000001551,
--0.741304667877,
-0.670295122767,
-0.034232116178,
--0.727830165042,
-0.682337091540,
-0.068405733411,
--0.712390579475,
-0.694298873783,
-0.102219059564,
--0.694832912939,
-0.706333998862,
-0.135275663549,
--0.818716538078,
-0.493811022870,
-0.293008368430,
--0.818641275000,
-0.511029847788,
--0.262059072609,
--0.817479079168,
-0.527729108454,
--0.230716152908,
--0.815202693842,
-0.543931234092,
--0.198955725053,
--0.811769860727,
-0.559659129159,
--0.166767360008,
--0.807126046669,
-0.574935642409,
--0.134151227635,
--0.801205241716,
-0.589783543039,
--0.101121377597,
--0.793930024853,
-0.604227123412,
--0.067710405183,
--0.785212708996,
-0.618293423701,
--0.033974164289,
--0.775100514722,
-0.631837947640,
--0.000000001523,
--0.763638482573,
-0.644742169658,
-0.034114551121,
--0.750644939025,
-0.657173653786,
-0.068227298680,
--0.735843268049,
-0.669409945734,
-0.102102935410,
--0.719110666000,
-0.681569672953,
-0.135434969474,
--0.799150287386,
-0.540493144997,
-0.263108301620,
--0.818641275450,
-0.511029847900,
-0.262059070984,
--0.837138253457,
-0.480874089437,
-0.260690726163,
--0.836337579883,
-0.497858802177,
--0.229512669741,
--0.834389611390,
-0.514409447636,
--0.197931545206,
--0.831270398120,
-0.530529369073,
--0.165915984039,
--0.826932995496,
-0.546230423334,
--0.133469642930,
--0.821320912547,
-0.561524282822,
--0.100610329561,
--0.814369686830,
-0.576422606602,
--0.067372039971,
--0.806005555676,
-0.590941601458,
--0.033809286985,
--0.796279684883,
-0.604928643266,
--0.000000001398,
--0.785212708037,
-0.618293425097,
-0.033974161051,
--0.772682338828,
-0.631140739108,
-0.067995372639,
--0.758458965129,
-0.643709477154,
-0.101872995626,
--0.742447060571,
-0.656086182150,
-0.135363524780,
--0.724584243308,
-0.668350400361,
-0.168182688427,
--0.776863213142,
-0.585275908236,
-0.232240520377,
--0.797656943961,
-0.556857338047,
-0.231631830313,
--0.817479079580,
-0.527729109375,
-0.230716149344,
--0.836337579787,
-0.497858803090,
-0.229512668108,
--0.854209394069,
-0.467235645521,
-0.228072713490,
--0.852632664815,
-0.484080192001,
--0.196682247807,
--0.849850944709,
-0.500563730748,
--0.164891853157,
--0.845848578439,
-0.516663497294,
--0.132661271348,
--0.840575385347,
-0.532381892663,
--0.100012708755,
--0.833976914770,
-0.547718955641,
--0.066980976877,
--0.825991957407,
-0.562678485934,
--0.033618562833,
--0.816664773145,
-0.577112335949,
--0.000000002304,
--0.806005555495,
-0.590941601881,
-0.033809283880,
--0.793930025286,
-0.604227123164,
-0.067710402321,
--0.780247238108,
-0.617173524468,
-0.101543528206,
--0.764883704885,
-0.629839831779,
-0.135109971159,
--0.747784919474,
-0.642288781000,
-0.168175016008,
--0.751968372458,
-0.627951625135,
-0.200550051891,
--0.774002844455,
-0.600670196378,
-0.200287073868,
--0.795075555551,
-0.572674562088,
-0.199746606736,
--0.815202694364,
-0.543931234004,
-0.198955723158,
--0.834389611179,
-0.514409449149,
-0.197931542165,
--0.852632664142,
-0.484080193736,
-0.196682246456,
--0.869887203269,
-0.452951763250,
-0.195271487311,
--0.867497293647,
-0.469737828632,
--0.163691227213,
--0.863851705249,
-0.486217937723,
--0.131728312730,
--0.858943318227,
-0.502344446580,
--0.099329920283,
--0.852722955733,
-0.518108387531,
--0.066537655019,
--0.845141979081,
-0.533497199498,
--0.033403193298,
--0.836228833142,
-0.548380651210,
--0.000000002618,
--0.825991956941,
-0.562678486925,
-0.033618557674,
--0.814369686433,
-0.576422607479,
-0.067372037262,
--0.801205241808,
-0.589783543415,
-0.101121374674,
--0.786441353292,
-0.602798196711,
-0.134700897822,
--0.770033898877,
-0.615509900187,
-0.167914732384,
--0.791358023933,
-0.587976992556,
-0.167438150318,
--0.811769860695,
-0.559659130062,
-0.166767357131,
--0.831270398918,
-0.530529368657,
-0.165915981375,
--0.849850944234,
-0.500563732406,
-0.164891850570,
--0.867497293164,
-0.469737830257,
-0.163691225109,
--0.884144595975,
-0.438081062670,
-0.162398632807,
--0.880916562465,
-0.454879008437,
--0.130656410705,
--0.876395751084,
-0.471399032414,
--0.098556784251,
--0.870577452126,
-0.487578925246,
--0.066043103389,
--0.863418329020,
-0.503397069236,
--0.033168958337,
--0.854939036545,
-0.518728487546,
--0.000000002595,
--0.845141978961,
-0.533497199907,
-0.033403189790,
--0.833976914306,
-0.547718956789,
-0.066980973260,
--0.821320911996,
-0.561524284212,
-0.100610326299,
--0.807126046851,
-0.574935642789,
-0.134151224913,
--0.826932995485,
-0.546230423950,
-0.133469640478,
--0.845848578348,
-0.516663498245,
-0.132661268227,
--0.863851704678,
-0.486217939296,
-0.131728310669,
--0.880916561466,
-0.454879010882,
-0.130656408926,
--0.896968520217,
-0.422683924898,
-0.129559921939,
--0.892895249047,
-0.439539554374,
--0.097688558032,
--0.887501067616,
-0.456128376468,
--0.065488618557,
--0.880781241528,
-0.472378623880,
--0.032906538462,
--0.872754106893,
-0.488160085323,
--0.000000002630,
--0.863418328818,
-0.503397069870,
-0.033168953976,
--0.852722954693,
-0.518108389624,
-0.066537652053,
--0.840575385307,
-0.532381893473,
-0.100012704784,
--0.858943318208,
-0.502344447383,
-0.099329916387,
--0.876395750340,
-0.471399034768,
-0.098556779610,
--0.892895248111,
-0.439539556776,
-0.097688555779,
--0.908362587145,
-0.406815605302,
-0.096842519373,
--0.903448967019,
-0.423758170348,
--0.064876629502,
--0.897190279267,
-0.440438444769,
--0.032612561347,
--0.889635122890,
-0.456672035624,
--0.000000001795,
--0.880781241468,
-0.472378624347,
-0.032906533352,
--0.870577451352,
-0.487578927012,
-0.066043100561,
--0.887501067336,
-0.456128377743,
-0.065488613479,
--0.903448965947,
-0.423758172946,
-0.064876627463,
--0.918342003413,
-0.390526640030,
-0.064318801248,
--0.912598991995,
-0.407578539349,
--0.032292631841,
--0.905539935873,
-0.424261033492,
--0.000000002979,
--0.897190279170,
-0.440438445271,
-0.032612557244,
--0.912598991513,
-0.407578540642,
-0.032292629138,
--0.926929016889,
-0.373865220601,
-0.032052994785,
--0.920418335123,
-0.390934890192,
--0.000000000009,
--0.033808943928,
-0.564444911575,
--0.824778089614,
-0.000000001697,
-0.550735108946,
--0.834680082291,
-0.067686807932,
-0.601482759841,
--0.796013181829,
--0.034410420412,
-0.592180171602,
--0.805070535623,
-0.000000000297,
-0.579186725664,
--0.815194907255,
-0.101366333663,
-0.636536090912,
--0.764556519406,
--0.068316855638,
-0.628641676194,
--0.774688614985,
--0.034502971258,
-0.618826254245,
--0.784769782823,
--0.000000000517,
-0.606229327536,
--0.795289885787,
-0.034410417907,
-0.592180171147,
--0.805070536065,
--0.134796163508,
-0.669541939813,
--0.730440678724,
--0.101953342427,
-0.662827226065,
--0.741798884035,
--0.068537426908,
-0.654703392598,
--0.752772268905,
--0.034499882344,
-0.644725590032,
--0.763635169224,
--0.000000001049,
-0.632475941815,
--0.774580004277,
-0.034502969901,
-0.618826252795,
--0.784769784026,
-0.167877821148,
-0.700386923539,
--0.693740004974,
--0.135275667820,
-0.694832911607,
--0.706333999354,
--0.102190885040,
-0.688072287063,
--0.718410433381,
--0.068580959385,
-0.679877080018,
--0.730112188692,
--0.034463285101,
-0.669927814138,
--0.741625920410,
--0.000000000986,
-0.658019472734,
--0.753000912020,
-0.034499879892,
-0.644725588332,
--0.763635170771,
-0.068316852403,
-0.628641677003,
--0.774688614614,
--0.200493801539,
-0.728943598949,
--0.654555929692,
--0.168182693707,
-0.724584241369,
--0.668350401135,
--0.135434970966,
-0.719110665487,
--0.681569673198,
--0.102219062554,
-0.712390578021,
--0.694298874835,
--0.068527252260,
-0.704243032905,
--0.706644016675,
--0.034405460658,
-0.694433201887,
--0.718734159752,
--0.000000001682,
-0.682869607814,
--0.730540278646,
-0.034463280713,
-0.669927813978,
--0.741625920758,
-0.068537423514,
-0.654703393330,
--0.752772268578,
--0.232512962128,
-0.755080152148,
--0.613018504024,
--0.200550058999,
-0.751968370855,
--0.627951624785,
--0.168175017056,
-0.747784919126,
--0.642288781130,
--0.135363527859,
-0.742447059960,
--0.656086182207,
--0.102102937924,
-0.735843267438,
--0.669409946022,
--0.068405736897,
-0.727830165097,
--0.682337091132,
--0.034328594704,
-0.718230509404,
--0.694957900126,
--0.000000001520,
-0.707017841381,
--0.707195709806,
-0.034405456797,
-0.694433201200,
--0.718734160601,
-0.068580957714,
-0.679877080252,
--0.730112188631,
-0.101953339022,
-0.662827226906,
--0.741798883751,
--0.263795524187,
-0.778668570452,
--0.569286552457,
--0.232240527680,
-0.776863211754,
--0.585275907180,
--0.200287073575,
-0.774002844387,
--0.600670196563,
--0.167914736983,
-0.770033898090,
--0.615509899917,
--0.135109972812,
-0.764883704818,
--0.629839831505,
--0.101872999909,
-0.758458964912,
--0.643709476732,
--0.068227302327,
-0.750644938662,
--0.657173653822,
--0.034232118240,
-0.741304668481,
--0.670295121994,
--0.000000002123,
-0.730450268257,
--0.682965889048,
-0.034328591386,
-0.718230509459,
--0.694957900233,
-0.068527249899,
-0.704243034087,
--0.706644015726,
-0.102190883518,
-0.688072288475,
--0.718410432245,
--0.294195255416,
-0.799589918803,
--0.523550487957,
--0.263108308917,
-0.799150286886,
--0.540493142185,
--0.231631829430,
-0.797656944313,
--0.556857337909,
--0.199746609914,
-0.795075554518,
--0.572674562413,
--0.167438152639,
-0.791358024054,
--0.587976991732,
--0.134700902021,
-0.786441353493,
--0.602798195510,
--0.101543531393,
-0.780247238039,
--0.617173524031,
--0.067995376114,
-0.772682338120,
--0.631140739601,
--0.034114554464,
-0.763638482554,
--0.644742169503,
--0.000000001551,
-0.753150565202,
--0.657848178636,
-0.034232116178,
-0.741304667877,
--0.670295122767,
-0.068405733411,
-0.727830165042,
--0.682337091540,
-0.102219059564,
-0.712390579475,
--0.694298873783,
-0.135275663549,
-0.694832912939,
--0.706333998862,
-0.293008368430,
-0.818716538078,
--0.493811022870,
--0.262059072609,
-0.818641275000,
--0.511029847788,
--0.230716152908,
-0.817479079168,
--0.527729108454,
--0.198955725053,
-0.815202693842,
--0.543931234092,
--0.166767360008,
-0.811769860727,
--0.559659129159,
--0.134151227635,
-0.807126046669,
--0.574935642409,
--0.101121377597,
-0.801205241716,
--0.589783543039,
--0.067710405183,
-0.793930024853,
--0.604227123412,
--0.033974164289,
-0.785212708996,
--0.618293423701,
--0.000000001523,
-0.775100514722,
--0.631837947640,
-0.034114551121,
-0.763638482573,
--0.644742169658,
-0.068227298680,
-0.750644939025,
--0.657173653786,
-0.102102935410,
-0.735843268049,
--0.669409945734,
-0.135434969474,
-0.719110666000,
--0.681569672953,
-0.263108301620,
-0.799150287386,
--0.540493144997,
-0.262059070984,
-0.818641275450,
--0.511029847900,
-0.260690726163,
-0.837138253457,
--0.480874089437,
--0.229512669741,
-0.836337579883,
--0.497858802177,
--0.197931545206,
-0.834389611390,
--0.514409447636,
--0.165915984039,
-0.831270398120,
--0.530529369073,
--0.133469642930,
-0.826932995496,
--0.546230423334,
--0.100610329561,
-0.821320912547,
--0.561524282822,
--0.067372039971,
-0.814369686830,
--0.576422606602,
--0.033809286985,
-0.806005555676,
--0.590941601458,
--0.000000001398,
-0.796279684883,
--0.604928643266,
-0.033974161051,
-0.785212708037,
--0.618293425097,
-0.067995372639,
-0.772682338828,
--0.631140739108,
-0.101872995626,
-0.758458965129,
--0.643709477154,
-0.135363524780,
-0.742447060571,
--0.656086182150,
-0.168182688427,
-0.724584243308,
--0.668350400361,
-0.232240520377,
-0.776863213142,
--0.585275908236,
-0.231631830313,
-0.797656943961,
--0.556857338047,
-0.230716149344,
-0.817479079580,
--0.527729109375,
-0.229512668108,
-0.836337579787,
--0.497858803090,
-0.228072713490,
-0.854209394069,
--0.467235645521,
--0.196682247807,
-0.852632664815,
--0.484080192001,
--0.164891853157,
-0.849850944709,
--0.500563730748,
--0.132661271348,
-0.845848578439,
--0.516663497294,
--0.100012708755,
-0.840575385347,
--0.532381892663,
--0.066980976877,
-0.833976914770,
--0.547718955641,
--0.033618562833,
-0.825991957407,
--0.562678485934,
--0.000000002304,
-0.816664773145,
--0.577112335949,
-0.033809283880,
-0.806005555495,
--0.590941601881,
-0.067710402321,
-0.793930025286,
--0.604227123164,
-0.101543528206,
-0.780247238108,
--0.617173524468,
-0.135109971159,
-0.764883704885,
--0.629839831779,
-0.168175016008,
-0.747784919474,
--0.642288781000,
-0.200550051891,
-0.751968372458,
--0.627951625135,
-0.200287073868,
-0.774002844455,
--0.600670196378,
-0.199746606736,
-0.795075555551,
--0.572674562088,
-0.198955723158,
-0.815202694364,
--0.543931234004,
-0.197931542165,
-0.834389611179,
--0.514409449149,
-0.196682246456,
-0.852632664142,
--0.484080193736,
-0.195271487311,
-0.869887203269,
--0.452951763250,
--0.163691227213,
-0.867497293647,
--0.469737828632,
--0.131728312730,
-0.863851705249,
--0.486217937723,
--0.099329920283,
-0.858943318227,
--0.502344446580,
--0.066537655019,
-0.852722955733,
--0.518108387531,
--0.033403193298,
-0.845141979081,
--0.533497199498,
--0.000000002618,
-0.836228833142,
--0.548380651210,
-0.033618557674,
-0.825991956941,
--0.562678486925,
-0.067372037262,
-0.814369686433,
--0.576422607479,
-0.101121374674,
-0.801205241808,
--0.589783543415,
-0.134700897822,
-0.786441353292,
--0.602798196711,
-0.167914732384,
-0.770033898877,
--0.615509900187,
-0.167438150318,
-0.791358023933,
--0.587976992556,
-0.166767357131,
-0.811769860695,
--0.559659130062,
-0.165915981375,
-0.831270398918,
--0.530529368657,
-0.164891850570,
-0.849850944234,
--0.500563732406,
-0.163691225109,
-0.867497293164,
--0.469737830257,
-0.162398632807,
-0.884144595975,
--0.438081062670,
--0.130656410705,
-0.880916562465,
--0.454879008437,
--0.098556784251,
-0.876395751084,
--0.471399032414,
--0.066043103389,
-0.870577452126,
--0.487578925246,
--0.033168958337,
-0.863418329020,
--0.503397069236,
--0.000000002595,
-0.854939036545,
--0.518728487546,
-0.033403189790,
-0.845141978961,
--0.533497199907,
-0.066980973260,
-0.833976914306,
--0.547718956789,
-0.100610326299,
-0.821320911996,
--0.561524284212,
-0.134151224913,
-0.807126046851,
--0.574935642789,
-0.133469640478,
-0.826932995485,
--0.546230423950,
-0.132661268227,
-0.845848578348,
--0.516663498245,
-0.131728310669,
-0.863851704678,
--0.486217939296,
-0.130656408926,
-0.880916561466,
--0.454879010882,
-0.129559921939,
-0.896968520217,
--0.422683924898,
--0.097688558032,
-0.892895249047,
--0.439539554374,
--0.065488618557,
-0.887501067616,
--0.456128376468,
--0.032906538462,
-0.880781241528,
--0.472378623880,
--0.000000002630,
-0.872754106893,
--0.488160085323,
-0.033168953976,
-0.863418328818,
--0.503397069870,
-0.066537652053,
-0.852722954693,
--0.518108389624,
-0.100012704784,
-0.840575385307,
--0.532381893473,
-0.099329916387,
-0.858943318208,
--0.502344447383,
-0.098556779610,
-0.876395750340,
--0.471399034768,
-0.097688555779,
-0.892895248111,
--0.439539556776,
-0.096842519373,
-0.908362587145,
--0.406815605302,
--0.064876629502,
-0.903448967019,
--0.423758170348,
--0.032612561347,
-0.897190279267,
--0.440438444769,
--0.000000001795,
-0.889635122890,
--0.456672035624,
-0.032906533352,
-0.880781241468,
--0.472378624347,
-0.066043100561,
-0.870577451352,
--0.487578927012,
-0.065488613479,
-0.887501067336,
--0.456128377743,
-0.064876627463,
-0.903448965947,
--0.423758172946,
-0.064318801248,
-0.918342003413,
--0.390526640030,
--0.032292631841,
-0.912598991995,
--0.407578539349,
--0.000000002979,
-0.905539935873,
--0.424261033492,
-0.032612557244,
-0.897190279170,
--0.440438445271,
-0.032292629138,
-0.912598991513,
--0.407578540642,
-0.032052994785,
-0.926929016889,
--0.373865220601,
--0.000000000009,
-0.920418335123,
--0.390934890192,
-0.054704019281,
--0.509740891866,
--0.858587033115,
-0.028214020866,
--0.533297886141,
--0.845456878655,
-0.067686809675,
--0.601482758764,
--0.796013182495,
-0.087181959437,
--0.517031948082,
--0.851514691953,
-0.060974450259,
--0.541502443142,
--0.838485074695,
-0.101366335619,
--0.636536089703,
--0.764556520153,
-0.142348561315,
--0.498443288263,
--0.855155644007,
-0.118918069313,
--0.524006836582,
--0.843371405732,
-0.092804885731,
--0.548872753512,
--0.830738198012,
-0.065915150241,
--0.572709175758,
--0.817104273010,
-0.218104773694,
--0.451437165961,
--0.865236842074,
-0.196844363646,
--0.478160087951,
--0.855929451995,
-0.174459266100,
--0.504523177166,
--0.845588746481,
-0.150437424381,
--0.530428048689,
--0.834274934605,
-0.124393783647,
--0.555596354883,
--0.822094202042,
-0.097594059007,
--0.579833815340,
--0.808868435677,
-0.167877821581,
--0.700386923272,
--0.693740005139,
-0.250767114346,
--0.456245351117,
--0.853789221030,
-0.229035677050,
--0.483363013715,
--0.844927722123,
-0.206168699415,
--0.510072452482,
--0.835057219956,
-0.181819767216,
--0.536257536616,
--0.824238695204,
-0.155848480366,
--0.561699814163,
--0.812529734802,
-0.129115323093,
--0.586250028573,
--0.799775054213,
-0.100126424367,
--0.608982280362,
--0.786838789936,
-0.324405786587,
--0.404537812807,
--0.855049731676,
-0.303997075071,
--0.432761095464,
--0.848707024008,
-0.282839620277,
--0.460602751467,
--0.841336350422,
-0.260774074312,
--0.488048481755,
--0.832949915435,
-0.237598658979,
--0.515046814922,
--0.823573709931,
-0.213073053952,
--0.541483068373,
--0.813262540847,
-0.187182978860,
--0.567184163723,
--0.802037815098,
-0.160520286711,
--0.592020299751,
--0.789775412530,
-0.132100808574,
--0.615419060923,
--0.777051321231,
-0.376213879901,
--0.378866273910,
--0.845531467814,
-0.356352755315,
--0.407783503179,
--0.840669571422,
-0.335795255444,
--0.436314161401,
--0.834788295906,
-0.314438828355,
--0.464453915600,
--0.827895394061,
-0.292156278537,
--0.492177671287,
--0.820003566332,
-0.268796962230,
--0.519427435938,
--0.811137061100,
-0.244189857080,
--0.546096639708,
--0.801342482213,
-0.218391594571,
--0.572044412140,
--0.790613876656,
-0.191809310079,
--0.597152269911,
--0.778857082594,
-0.163783336271,
--0.621038774494,
--0.766476261429,
-0.133833734635,
--0.643124058843,
--0.753976111300,
-0.426830130267,
--0.351838442497,
--0.833082078956,
-0.407623856860,
--0.381405273918,
--0.829682353884,
-0.387738466010,
--0.410583074670,
--0.825275966432,
-0.367104067175,
--0.439374092501,
--0.819868898485,
-0.345635277874,
--0.467766799964,
--0.813468177337,
-0.323231942024,
--0.495729662012,
--0.806085115764,
-0.299781081107,
--0.523203249555,
--0.797740348149,
-0.275158820103,
--0.550090552773,
--0.788471944630,
-0.249463736698,
--0.576273198705,
--0.778252558317,
-0.222973619783,
--0.601641470101,
--0.767013889272,
-0.195246490087,
--0.625926236622,
--0.755046458449,
-0.165878238934,
--0.648711338174,
--0.742736837361,
-0.476017922451,
--0.323571996298,
--0.817745743319,
-0.457584530874,
--0.353737616446,
--0.815773311537,
-0.438467526408,
--0.383512766566,
--0.812812516000,
-0.418617451243,
--0.412905547302,
--0.808868616354,
-0.397974828901,
--0.441913583782,
--0.803945533000,
-0.376470190182,
--0.470520244446,
--0.798048178665,
-0.354025190242,
--0.498690283857,
--0.791185291484,
-0.330554499750,
--0.526364968624,
--0.783373245969,
-0.305967402278,
--0.553456274327,
--0.774641918018,
-0.280387517733,
--0.579861548264,
--0.764946680982,
-0.254002207286,
--0.605479281861,
--0.754239827860,
-0.226519892631,
--0.630110240541,
--0.742731326260,
-0.197599221982,
--0.653442397248,
--0.730730853975,
-0.167162156425,
--0.675125976559,
--0.718513555359,
-0.324905516107,
--0.799003016669,
--0.505994649138,
-0.487760486844,
--0.355227301829,
--0.797435434069,
-0.468785125491,
--0.385163513944,
--0.794914821628,
-0.449027916302,
--0.414726779331,
--0.791438960936,
-0.428439996620,
--0.443911483977,
--0.787008109037,
-0.406965876309,
--0.472697284538,
--0.781623984221,
-0.384545109183,
--0.501046845689,
--0.775291633792,
-0.361112986643,
--0.528902593534,
--0.768023083918,
-0.336602308061,
--0.556183853652,
--0.759841040708,
-0.311150515410,
--0.582798919640,
--0.750686869491,
-0.284883449080,
--0.608654780313,
--0.740527365357,
-0.257614290748,
--0.633597340900,
--0.729513047729,
-0.229053193964,
--0.657383693382,
--0.717900629621,
-0.199136205954,
--0.679741136730,
--0.705901380163,
-0.294974654495,
--0.779455798212,
--0.552665008698,
-0.325799073721,
--0.779247787315,
--0.535376362503,
-0.356264164309,
--0.778070620261,
--0.517379894387,
-0.498605229445,
--0.386335970368,
--0.775975091849,
-0.478994862918,
--0.416026083287,
--0.772972327657,
-0.458518053170,
--0.445348939393,
--0.769041947555,
-0.437132022797,
--0.474281772040,
--0.764180865604,
-0.414790736319,
--0.502785535995,
--0.758389972150,
-0.391446718345,
--0.530804099515,
--0.751675777603,
-0.367049035620,
--0.558261487633,
--0.744055856019,
-0.341739476145,
--0.585073072463,
--0.735461508390,
-0.315605119318,
--0.611155203544,
--0.725866878871,
-0.288531048127,
--0.636383795645,
--0.715377871413,
-0.260270966832,
--0.660563635174,
--0.704212118406,
-0.230779568776,
--0.683476702310,
--0.692531867884,
-0.200054457629,
--0.704886406660,
--0.680524332915,
-0.264091320040,
--0.757178336382,
--0.597441831138,
-0.295311182318,
--0.758300940040,
--0.581180686131,
-0.326194702215,
--0.758470088709,
--0.564198671374,
-0.356758598667,
--0.757695269771,
--0.546462423634,
-0.386973749375,
--0.756003153045,
--0.527930440381,
-0.508532376858,
--0.416786057409,
--0.753448209260,
-0.488216376440,
--0.446207860485,
--0.750028876122,
-0.466968713320,
--0.475256867241,
--0.745701770764,
-0.444754452126,
--0.503890763968,
--0.740464432165,
-0.421540279299,
--0.532054174226,
--0.734317471273,
-0.397290995034,
--0.559675204568,
--0.727271290962,
-0.372139512919,
--0.586669904180,
--0.719256982207,
-0.346153747729,
--0.612966060638,
--0.710246570874,
-0.319265656206,
--0.638460328337,
--0.700312680099,
-0.291267837325,
--0.662991166580,
--0.689641762059,
-0.262132722885,
--0.686379326973,
--0.678358205594,
-0.231857379516,
--0.708427054342,
--0.666613279376,
-0.232406005726,
--0.732280310243,
--0.640119516756,
-0.263954247091,
--0.734654367436,
--0.624988892581,
-0.295167259158,
--0.736102349125,
--0.609122008085,
-0.326066517015,
--0.736643903423,
--0.592483236920,
-0.356666440547,
--0.736286048777,
--0.575040785130,
-0.386976061735,
--0.735024618451,
--0.556765963323,
-0.416935440913,
--0.732891345862,
--0.537619859446,
-0.517534509858,
--0.446476634126,
--0.729942906182,
-0.496468028579,
--0.475605014712,
--0.726167588495,
-0.474422151778,
--0.504345036577,
--0.721498236991,
-0.451374435083,
--0.532635680865,
--0.715933202766,
-0.427307778383,
--0.560406939592,
--0.709473131690,
-0.402333012402,
--0.587573355064,
--0.702058188152,
-0.376513581272,
--0.614071177784,
--0.693652731366,
-0.349808507829,
--0.639814347960,
--0.684303739574,
-0.322048661629,
--0.664664669428,
--0.674170257989,
-0.293220454953,
--0.688470879104,
--0.663347279653,
-0.263327054430,
--0.711065840907,
--0.651954164263,
-0.294492359764,
--0.712834204081,
--0.636507382151,
-0.325372100332,
--0.713746738620,
--0.620240751188,
-0.355976337434,
--0.713806638960,
--0.603125964757,
-0.386307606307,
--0.713008481544,
--0.585137025453,
-0.416367767227,
--0.711334601976,
--0.566251681186,
-0.446063534893,
--0.708830045070,
--0.546431413852,
-0.525612016774,
--0.475320368540,
--0.705551241990,
-0.503775261462,
--0.504134074319,
--0.701469401363,
-0.480930932375,
--0.532528907061,
--0.696504415944,
-0.457071338626,
--0.560433162842,
--0.690652200021,
-0.432295966749,
--0.587765434291,
--0.683850854635,
-0.406663470374,
--0.614454438910,
--0.676069940440,
-0.380143759158,
--0.640431668609,
--0.667336496990,
-0.352610132898,
--0.665576466359,
--0.657779645175,
-0.324055858796,
--0.689758528490,
--0.647472758312,
-0.354643247441,
--0.690240188967,
--0.630711224396,
-0.384979539051,
--0.689907310996,
--0.613040501717,
-0.415055453419,
--0.688745900523,
--0.594439277891,
-0.444861912629,
--0.686726880725,
--0.574894833844,
-0.474284596157,
--0.683916954789,
--0.554357033689,
-0.532785078076,
--0.503241112921,
--0.680359054357,
-0.510176354066,
--0.531720548403,
--0.676012829877,
-0.486546360394,
--0.559741694480,
--0.670791975688,
-0.461992862538,
--0.587226813659,
--0.664625657257,
-0.436571795870,
--0.614101661369,
--0.657483244315,
-0.410251901778,
--0.640295865946,
--0.649395550601,
-0.382943199598,
--0.665714723058,
--0.640451726038,
-0.413032885730,
--0.665064220782,
--0.622168319300,
-0.442863818629,
--0.663602297660,
--0.602912621107,
-0.472410227639,
--0.661304518580,
--0.582670499105,
-0.501546983139,
--0.658241473138,
--0.561398955062,
-0.539074463749,
--0.530186663847,
--0.654446960427,
-0.515700796417,
--0.558313987684,
--0.649875510950,
-0.491393915953,
--0.585936979856,
--0.644367810339,
-0.466209002469,
--0.612985588145,
--0.637885440141,
-0.440114049122,
--0.639388890937,
--0.630461315159,
-0.469702162626,
--0.637683355249,
--0.610524214804,
-0.498978500105,
--0.635159254074,
--0.589570333716,
-0.527815364751,
--0.631885373499,
--0.567566573620,
-0.544497795931,
--0.556122903246,
--0.627892878372,
-0.520466681381,
--0.583873834927,
--0.623061616905,
-0.495545125983,
--0.611082217190,
--0.617262952030,
-0.524539851666,
--0.608373477124,
--0.595600248780,
-0.553063796833,
--0.604926632717,
--0.572873638477,
-0.549166629956,
--0.581014692318,
--0.600697877351,
--0.858587032424,
--0.054704019708,
--0.509740892985,
--0.862894104207,
--0.017437222806,
--0.505083862528,
--0.905532739396,
--0.000000001077,
--0.424276393266,
--0.870985685678,
--0.075148223519,
--0.485527218439,
--0.876169357698,
--0.037684282522,
--0.480527992402,
--0.928570694543,
--0.000000001209,
--0.371155580903,
--0.874815037512,
--0.130198387931,
--0.466633721374,
--0.882363843185,
--0.094819417663,
--0.460915747478,
--0.888094771199,
--0.057356574024,
--0.456067868618,
--0.892252494139,
--0.019470995389,
--0.451116799777,
--0.865236841817,
--0.218104773852,
--0.451437166376,
--0.875632616795,
--0.184667138114,
--0.446279697618,
--0.884873075674,
--0.150180215433,
--0.440959797305,
--0.892750493708,
--0.114297541343,
--0.435812606548,
--0.898973787276,
--0.076879586932,
--0.431202572933,
--0.903687851145,
--0.038992437455,
--0.426412778319,
--0.965372025982,
--0.000000000267,
--0.260877081116,
--0.873496153136,
--0.238587560490,
--0.424358865154,
--0.884288670135,
--0.204709273349,
--0.419675662001,
--0.893895524226,
--0.169804627536,
--0.414870076333,
--0.902146206069,
--0.133670277522,
--0.410200536058,
--0.908849391777,
--0.096319658571,
--0.405851335393,
--0.914072592245,
--0.058475559759,
--0.401312727207,
--0.917037175770,
--0.019659396641,
--0.398316866803,
--0.855049732395,
--0.324405786143,
--0.404537811643,
--0.868404855176,
--0.291823145905,
--0.400889335129,
--0.880705878152,
--0.258507914019,
--0.396901517479,
--0.891898094191,
--0.224342096266,
--0.392668324953,
--0.901890504602,
--0.189196217983,
--0.388327579256,
--0.910543469618,
--0.152950133514,
--0.384079219164,
--0.917723256467,
--0.115685444091,
--0.380001187585,
--0.923445686314,
--0.077907514227,
--0.375737253482,
--0.927231534385,
--0.039284332407,
--0.372422371603,
--0.845531470505,
--0.376213878238,
--0.378866269556,
--0.860357627193,
--0.344184867676,
--0.375927559769,
--0.874146159976,
--0.311470757725,
--0.372631799612,
--0.886865749507,
--0.277993144360,
--0.369037876158,
--0.898463138571,
--0.243665596151,
--0.365227416662,
--0.908856982934,
--0.208402729158,
--0.361313281033,
--0.917931518893,
--0.172133869696,
--0.357451615644,
--0.925587303437,
--0.134973429242,
--0.353652820029,
--0.931807212378,
--0.097280931289,
--0.349673761336,
--0.936280887749,
--0.058838305758,
--0.346289117662,
--0.938643247168,
--0.019703168063,
--0.344326356404,
--0.833082082696,
--0.426830127955,
--0.351838436445,
--0.849367224368,
--0.395457937836,
--0.349554484410,
--0.864624443597,
--0.363419769717,
--0.346915901212,
--0.878836952425,
--0.330659805590,
--0.343961776975,
--0.891972553962,
--0.297116904854,
--0.340744050319,
--0.903980442276,
--0.262729302900,
--0.337331696377,
--0.914787943131,
--0.227441689107,
--0.333816262573,
--0.924297329518,
--0.191214115708,
--0.330320463490,
--0.932429624434,
--0.154177069552,
--0.326809465443,
--0.939147756278,
--0.116589039358,
--0.323123022669,
--0.944242675406,
--0.078316797465,
--0.319800327043,
--0.947446110534,
--0.039360950301,
--0.317484776367,
--0.817745743233,
--0.476017922505,
--0.323571996438,
--0.835467795426,
--0.445412670440,
--0.321871272122,
--0.852168520853,
--0.414144177747,
--0.319833413052,
--0.867841819592,
--0.382170007216,
--0.317484900037,
--0.882469351288,
--0.349444440272,
--0.314859376865,
--0.896018649928,
--0.315921109048,
--0.312000692048,
--0.908441360534,
--0.281556954182,
--0.308965978748,
--0.919671785835,
--0.246317369496,
--0.305829298505,
--0.929625617612,
--0.210182208227,
--0.302687380683,
--0.938235695411,
--0.173289016939,
--0.299474033040,
--0.945453941358,
--0.135825386016,
--0.296088347093,
--0.951134052444,
--0.097719924500,
--0.292907546226,
--0.955072948874,
--0.058948182227,
--0.290449262594,
--0.957101113211,
--0.019706936380,
--0.289083198661,
--0.999805669655,
--0.019713521409,
--0.000000001455,
--0.836828920699,
--0.463413973171,
--0.291487301526,
--0.853923809695,
--0.432315565225,
--0.289684965611,
--0.869997750055,
--0.400475914512,
--0.287615988421,
--0.885031229079,
--0.367858376750,
--0.285306744065,
--0.898991500407,
--0.334428762131,
--0.282792654174,
--0.911832203878,
--0.300158396027,
--0.280119562447,
--0.923492778259,
--0.265027431319,
--0.277347343869,
--0.933898543492,
--0.229028855343,
--0.274552898150,
--0.942988462108,
--0.192301595082,
--0.271648406695,
--0.950709570841,
--0.154983702260,
--0.268572828009,
--0.956954734078,
--0.117047598125,
--0.265588961928,
--0.961566224132,
--0.078459574667,
--0.263124479574,
--0.964409293307,
--0.039369529270,
--0.261466546902,
--0.998077672616,
--0.019694489174,
--0.058762968974,
--0.998790334550,
--0.039393488134,
--0.029428229681,
--0.998253983067,
--0.059067633195,
--0.000000000468,
--0.854617400873,
--0.450001609514,
--0.259090041412,
--0.871075888171,
--0.418363528103,
--0.257291187958,
--0.886505704830,
--0.385921458728,
--0.255288587675,
--0.900873670335,
--0.352651223456,
--0.253108167969,
--0.914134415853,
--0.318535376552,
--0.250785732525,
--0.926231114354,
--0.283565587315,
--0.248367631734,
--0.937095348585,
--0.247744068043,
--0.245917027490,
--0.946668118546,
--0.211206612419,
--0.243333598581,
--0.954895730684,
--0.174057504493,
--0.240578736906,
--0.961695238604,
--0.136298543183,
--0.237833923510,
--0.966941417819,
--0.097895329955,
--0.235458698884,
--0.970525010076,
--0.058970358261,
--0.233674349604,
--0.972347475757,
--0.019697836648,
--0.232706642837,
--0.992899763434,
--0.019684876760,
--0.117313960807,
--0.995324864374,
--0.039356003921,
--0.088201583401,
--0.996514233637,
--0.059008990871,
--0.058968815102,
--0.996464031497,
--0.078642310016,
--0.029577373257,
--0.995166083739,
--0.098206241025,
--0.000000001337,
--0.871056254731,
--0.435846607406,
--0.226492242485,
--0.886871337469,
--0.403643084224,
--0.224792106921,
--0.901643035931,
--0.370591711198,
--0.222938599952,
--0.915325091472,
--0.336684621379,
--0.220960273914,
--0.927862714630,
--0.301922740544,
--0.218891392113,
--0.939192066484,
--0.266316752839,
--0.216780186850,
--0.949251847444,
--0.229994868965,
--0.214530394989,
--0.957990636184,
--0.193039494857,
--0.212107742457,
--0.965340109396,
--0.155469696949,
--0.209636939783,
--0.971198713562,
--0.117256071528,
--0.207422449280,
--0.975475109059,
--0.078504377911,
--0.205634078535,
--0.978084036467,
--0.039357865132,
--0.204456782867,
--0.984304379375,
--0.019688062214,
--0.175377504113,
--0.988408662627,
--0.039348477020,
--0.146628827319,
--0.991292013347,
--0.058973206426,
--0.117738291131,
--0.992959150186,
--0.078558790941,
--0.088660264083,
--0.993404310200,
--0.098103562401,
--0.059359645562,
--0.992612568765,
--0.117608045691,
--0.029809996965,
--0.990571620355,
--0.136995857407,
--0.000000001447,
--0.886105596412,
--0.421020659521,
--0.193800093560,
--0.901273391754,
--0.388246690537,
--0.192277873411,
--0.915377331523,
--0.354598281650,
--0.190642071917,
--0.928360290281,
--0.320087274868,
--0.188921433136,
--0.940160669090,
--0.284735039489,
--0.187146663299,
--0.950713661995,
--0.248655478078,
--0.185240346897,
--0.959969479493,
--0.211920779157,
--0.183161627543,
--0.967869324228,
--0.174555338473,
--0.180995593950,
--0.974328651581,
--0.136540572380,
--0.178998186587,
--0.979268384833,
--0.097970474188,
--0.177299793160,
--0.982613966443,
--0.058968057970,
--0.176047042267,
--0.985951820230,
--0.078523819851,
--0.147421226090,
--0.988099125316,
--0.098023122075,
--0.118539386236,
--0.989047421857,
--0.117463759958,
--0.089372604384,
--0.988780106834,
--0.136842462690,
--0.059900256546,
--0.987272338262,
--0.156162691188,
--0.030108868862,
--0.984512472364,
--0.175314550905,
--0.000000002569,
--0.899740922547,
--0.405596193926,
--0.161114865134,
--0.914262851387,
--0.372261676764,
--0.159827039598,
--0.927692975005,
--0.338048545066,
--0.158457960691,
--0.939968864238,
--0.302985166178,
--0.157030326177,
--0.951024452690,
--0.267173602254,
--0.155469471741,
--0.960804976905,
--0.230687540052,
--0.153743472123,
--0.969259234022,
--0.193545245697,
--0.151910418116,
--0.976315018382,
--0.155744445637,
--0.150175405890,
--0.981901518214,
--0.117367518361,
--0.148641428153,
--0.983362445673,
--0.136692806518,
--0.119638526767,
--0.983632210052,
--0.155941267352,
--0.090277330963,
--0.982685965989,
--0.175105804155,
--0.060549563160,
--0.980491025076,
--0.194189680741,
--0.030458457605,
--0.977040956393,
--0.213051565428,
--0.000000001356,
--0.911949783275,
--0.389654136125,
--0.128519442053,
--0.925830538389,
--0.355780519214,
--0.127507005039,
--0.938587625052,
--0.321039547048,
--0.126439231770,
--0.950152946235,
--0.285527293233,
--0.125233955376,
--0.960468406667,
--0.249316667449,
--0.123861370596,
--0.969482821903,
--0.212427088748,
--0.122383781614,
--0.977136343935,
--0.174860662249,
--0.120947567812,
--0.976766597540,
--0.193879097426,
--0.091312154238,
--0.975174293017,
--0.212793452680,
--0.061270259801,
--0.972324632198,
--0.231590729531,
--0.030830887379,
--0.968214556970,
--0.250121114006,
--0.000000002098,
--0.922736671989,
--0.373262303172,
--0.096084791708,
--0.935983569813,
--0.338876291584,
--0.095381423987,
--0.948065950468,
--0.303698143033,
--0.094543066807,
--0.958924982880,
--0.267795653324,
--0.093532696260,
--0.968509857004,
--0.231188560415,
--0.092414860384,
--0.966304729375,
--0.249817712086,
--0.062018390139,
--0.962832633898,
--0.268289711873,
--0.031208165659,
--0.958093210068,
--0.286456629914,
--0.000000002214,
--0.932118391216,
--0.356476088749,
--0.063875683220,
--0.944727713032,
--0.321666100946,
--0.063407158365,
--0.956139240091,
--0.286108061980,
--0.062768865127,
--0.952076334702,
--0.304225514390,
--0.031583053926,
--0.946738857652,
--0.322002384172,
--0.000000000881,
--0.940101520142,
--0.339403642805,
--0.031848062377,
--0.054704019281,
-0.509740891866,
--0.858587033115,
--0.028214020866,
-0.533297886141,
--0.845456878655,
--0.067686809675,
-0.601482758764,
--0.796013182495,
--0.087181959437,
-0.517031948082,
--0.851514691953,
--0.060974450259,
-0.541502443142,
--0.838485074695,
--0.101366335619,
-0.636536089703,
--0.764556520153,
--0.142348561315,
-0.498443288263,
--0.855155644007,
--0.118918069313,
-0.524006836582,
--0.843371405732,
--0.092804885731,
-0.548872753512,
--0.830738198012,
--0.065915150241,
-0.572709175758,
--0.817104273010,
--0.218104773694,
-0.451437165961,
--0.865236842074,
--0.196844363646,
-0.478160087951,
--0.855929451995,
--0.174459266100,
-0.504523177166,
--0.845588746481,
--0.150437424381,
-0.530428048689,
--0.834274934605,
--0.124393783647,
-0.555596354883,
--0.822094202042,
--0.097594059007,
-0.579833815340,
--0.808868435677,
--0.167877821581,
-0.700386923272,
--0.693740005139,
--0.250767114346,
-0.456245351117,
--0.853789221030,
--0.229035677050,
-0.483363013715,
--0.844927722123,
--0.206168699415,
-0.510072452482,
--0.835057219956,
--0.181819767216,
-0.536257536616,
--0.824238695204,
--0.155848480366,
-0.561699814163,
--0.812529734802,
--0.129115323093,
-0.586250028573,
--0.799775054213,
--0.100126424367,
-0.608982280362,
--0.786838789936,
--0.324405786587,
-0.404537812807,
--0.855049731676,
--0.303997075071,
-0.432761095464,
--0.848707024008,
--0.282839620277,
-0.460602751467,
--0.841336350422,
--0.260774074312,
-0.488048481755,
--0.832949915435,
--0.237598658979,
-0.515046814922,
--0.823573709931,
--0.213073053952,
-0.541483068373,
--0.813262540847,
--0.187182978860,
-0.567184163723,
--0.802037815098,
--0.160520286711,
-0.592020299751,
--0.789775412530,
--0.132100808574,
-0.615419060923,
--0.777051321231,
--0.376213879901,
-0.378866273910,
--0.845531467814,
--0.356352755315,
-0.407783503179,
--0.840669571422,
--0.335795255444,
-0.436314161401,
--0.834788295906,
--0.314438828355,
-0.464453915600,
--0.827895394061,
--0.292156278537,
-0.492177671287,
--0.820003566332,
--0.268796962230,
-0.519427435938,
--0.811137061100,
--0.244189857080,
-0.546096639708,
--0.801342482213,
--0.218391594571,
-0.572044412140,
--0.790613876656,
--0.191809310079,
-0.597152269911,
--0.778857082594,
--0.163783336271,
-0.621038774494,
--0.766476261429,
--0.133833734635,
-0.643124058843,
--0.753976111300,
--0.426830130267,
-0.351838442497,
--0.833082078956,
--0.407623856860,
-0.381405273918,
--0.829682353884,
--0.387738466010,
-0.410583074670,
--0.825275966432,
--0.367104067175,
-0.439374092501,
--0.819868898485,
--0.345635277874,
-0.467766799964,
--0.813468177337,
--0.323231942024,
-0.495729662012,
--0.806085115764,
--0.299781081107,
-0.523203249555,
--0.797740348149,
--0.275158820103,
-0.550090552773,
--0.788471944630,
--0.249463736698,
-0.576273198705,
--0.778252558317,
--0.222973619783,
-0.601641470101,
--0.767013889272,
--0.195246490087,
-0.625926236622,
--0.755046458449,
--0.165878238934,
-0.648711338174,
--0.742736837361,
--0.476017922451,
-0.323571996298,
--0.817745743319,
--0.457584530874,
-0.353737616446,
--0.815773311537,
--0.438467526408,
-0.383512766566,
--0.812812516000,
--0.418617451243,
-0.412905547302,
--0.808868616354,
--0.397974828901,
-0.441913583782,
--0.803945533000,
--0.376470190182,
-0.470520244446,
--0.798048178665,
--0.354025190242,
-0.498690283857,
--0.791185291484,
--0.330554499750,
-0.526364968624,
--0.783373245969,
--0.305967402278,
-0.553456274327,
--0.774641918018,
--0.280387517733,
-0.579861548264,
--0.764946680982,
--0.254002207286,
-0.605479281861,
--0.754239827860,
--0.226519892631,
-0.630110240541,
--0.742731326260,
--0.197599221982,
-0.653442397248,
--0.730730853975,
--0.167162156425,
-0.675125976559,
--0.718513555359,
--0.324905516107,
-0.799003016669,
--0.505994649138,
--0.487760486844,
-0.355227301829,
--0.797435434069,
--0.468785125491,
-0.385163513944,
--0.794914821628,
--0.449027916302,
-0.414726779331,
--0.791438960936,
--0.428439996620,
-0.443911483977,
--0.787008109037,
--0.406965876309,
-0.472697284538,
--0.781623984221,
--0.384545109183,
-0.501046845689,
--0.775291633792,
--0.361112986643,
-0.528902593534,
--0.768023083918,
--0.336602308061,
-0.556183853652,
--0.759841040708,
--0.311150515410,
-0.582798919640,
--0.750686869491,
--0.284883449080,
-0.608654780313,
--0.740527365357,
--0.257614290748,
-0.633597340900,
--0.729513047729,
--0.229053193964,
-0.657383693382,
--0.717900629621,
--0.199136205954,
-0.679741136730,
--0.705901380163,
--0.294974654495,
-0.779455798212,
--0.552665008698,
--0.325799073721,
-0.779247787315,
--0.535376362503,
--0.356264164309,
-0.778070620261,
--0.517379894387,
--0.498605229445,
-0.386335970368,
--0.775975091849,
--0.478994862918,
-0.416026083287,
--0.772972327657,
--0.458518053170,
-0.445348939393,
--0.769041947555,
--0.437132022797,
-0.474281772040,
--0.764180865604,
--0.414790736319,
-0.502785535995,
--0.758389972150,
--0.391446718345,
-0.530804099515,
--0.751675777603,
--0.367049035620,
-0.558261487633,
--0.744055856019,
--0.341739476145,
-0.585073072463,
--0.735461508390,
--0.315605119318,
-0.611155203544,
--0.725866878871,
--0.288531048127,
-0.636383795645,
--0.715377871413,
--0.260270966832,
-0.660563635174,
--0.704212118406,
--0.230779568776,
-0.683476702310,
--0.692531867884,
--0.200054457629,
-0.704886406660,
--0.680524332915,
--0.264091320040,
-0.757178336382,
--0.597441831138,
--0.295311182318,
-0.758300940040,
--0.581180686131,
--0.326194702215,
-0.758470088709,
--0.564198671374,
--0.356758598667,
-0.757695269771,
--0.546462423634,
--0.386973749375,
-0.756003153045,
--0.527930440381,
--0.508532376858,
-0.416786057409,
--0.753448209260,
--0.488216376440,
-0.446207860485,
--0.750028876122,
--0.466968713320,
-0.475256867241,
--0.745701770764,
--0.444754452126,
-0.503890763968,
--0.740464432165,
--0.421540279299,
-0.532054174226,
--0.734317471273,
--0.397290995034,
-0.559675204568,
--0.727271290962,
--0.372139512919,
-0.586669904180,
--0.719256982207,
--0.346153747729,
-0.612966060638,
--0.710246570874,
--0.319265656206,
-0.638460328337,
--0.700312680099,
--0.291267837325,
-0.662991166580,
--0.689641762059,
--0.262132722885,
-0.686379326973,
--0.678358205594,
--0.231857379516,
-0.708427054342,
--0.666613279376,
--0.232406005726,
-0.732280310243,
--0.640119516756,
--0.263954247091,
-0.734654367436,
--0.624988892581,
--0.295167259158,
-0.736102349125,
--0.609122008085,
--0.326066517015,
-0.736643903423,
--0.592483236920,
--0.356666440547,
-0.736286048777,
--0.575040785130,
--0.386976061735,
-0.735024618451,
--0.556765963323,
--0.416935440913,
-0.732891345862,
--0.537619859446,
--0.517534509858,
-0.446476634126,
--0.729942906182,
--0.496468028579,
-0.475605014712,
--0.726167588495,
--0.474422151778,
-0.504345036577,
--0.721498236991,
--0.451374435083,
-0.532635680865,
--0.715933202766,
--0.427307778383,
-0.560406939592,
--0.709473131690,
--0.402333012402,
-0.587573355064,
--0.702058188152,
--0.376513581272,
-0.614071177784,
--0.693652731366,
--0.349808507829,
-0.639814347960,
--0.684303739574,
--0.322048661629,
-0.664664669428,
--0.674170257989,
--0.293220454953,
-0.688470879104,
--0.663347279653,
--0.263327054430,
-0.711065840907,
--0.651954164263,
--0.294492359764,
-0.712834204081,
--0.636507382151,
--0.325372100332,
-0.713746738620,
--0.620240751188,
--0.355976337434,
-0.713806638960,
--0.603125964757,
--0.386307606307,
-0.713008481544,
--0.585137025453,
--0.416367767227,
-0.711334601976,
--0.566251681186,
--0.446063534893,
-0.708830045070,
--0.546431413852,
--0.525612016774,
-0.475320368540,
--0.705551241990,
--0.503775261462,
-0.504134074319,
--0.701469401363,
--0.480930932375,
-0.532528907061,
--0.696504415944,
--0.457071338626,
-0.560433162842,
--0.690652200021,
--0.432295966749,
-0.587765434291,
--0.683850854635,
--0.406663470374,
-0.614454438910,
--0.676069940440,
--0.380143759158,
-0.640431668609,
--0.667336496990,
--0.352610132898,
-0.665576466359,
--0.657779645175,
--0.324055858796,
-0.689758528490,
--0.647472758312,
--0.354643247441,
-0.690240188967,
--0.630711224396,
--0.384979539051,
-0.689907310996,
--0.613040501717,
--0.415055453419,
-0.688745900523,
--0.594439277891,
--0.444861912629,
-0.686726880725,
--0.574894833844,
--0.474284596157,
-0.683916954789,
--0.554357033689,
--0.532785078076,
-0.503241112921,
--0.680359054357,
--0.510176354066,
-0.531720548403,
--0.676012829877,
--0.486546360394,
-0.559741694480,
--0.670791975688,
--0.461992862538,
-0.587226813659,
--0.664625657257,
--0.436571795870,
-0.614101661369,
--0.657483244315,
--0.410251901778,
-0.640295865946,
--0.649395550601,
--0.382943199598,
-0.665714723058,
--0.640451726038,
--0.413032885730,
-0.665064220782,
--0.622168319300,
--0.442863818629,
-0.663602297660,
--0.602912621107,
--0.472410227639,
-0.661304518580,
--0.582670499105,
--0.501546983139,
-0.658241473138,
--0.561398955062,
--0.539074463749,
-0.530186663847,
--0.654446960427,
--0.515700796417,
-0.558313987684,
--0.649875510950,
--0.491393915953,
-0.585936979856,
--0.644367810339,
--0.466209002469,
-0.612985588145,
--0.637885440141,
--0.440114049122,
-0.639388890937,
--0.630461315159,
--0.469702162626,
-0.637683355249,
--0.610524214804,
--0.498978500105,
-0.635159254074,
--0.589570333716,
--0.527815364751,
-0.631885373499,
--0.567566573620,
--0.544497795931,
-0.556122903246,
--0.627892878372,
--0.520466681381,
-0.583873834927,
--0.623061616905,
--0.495545125983,
-0.611082217190,
--0.617262952030,
--0.524539851666,
-0.608373477124,
--0.595600248780,
--0.553063796833,
-0.604926632717,
--0.572873638477,
--0.549166629956,
-0.581014692318,
--0.600697877351,
-0.858587032424,
-0.054704019708,
--0.509740892985,
-0.862894104207,
-0.017437222806,
--0.505083862528,
-0.905532739396,
-0.000000001077,
--0.424276393266,
-0.870985685678,
-0.075148223519,
--0.485527218439,
-0.876169357698,
-0.037684282522,
--0.480527992402,
-0.928570694543,
-0.000000001209,
--0.371155580903,
-0.874815037512,
-0.130198387931,
--0.466633721374,
-0.882363843185,
-0.094819417663,
--0.460915747478,
-0.888094771199,
-0.057356574024,
--0.456067868618,
-0.892252494139,
-0.019470995389,
--0.451116799777,
-0.865236841817,
-0.218104773852,
--0.451437166376,
-0.875632616795,
-0.184667138114,
--0.446279697618,
-0.884873075674,
-0.150180215433,
--0.440959797305,
-0.892750493708,
-0.114297541343,
--0.435812606548,
-0.898973787276,
-0.076879586932,
--0.431202572933,
-0.903687851145,
-0.038992437455,
--0.426412778319,
-0.965372025982,
-0.000000000267,
--0.260877081116,
-0.873496153136,
-0.238587560490,
--0.424358865154,
-0.884288670135,
-0.204709273349,
--0.419675662001,
-0.893895524226,
-0.169804627536,
--0.414870076333,
-0.902146206069,
-0.133670277522,
--0.410200536058,
-0.908849391777,
-0.096319658571,
--0.405851335393,
-0.914072592245,
-0.058475559759,
--0.401312727207,
-0.917037175770,
-0.019659396641,
--0.398316866803,
-0.855049732395,
-0.324405786143,
--0.404537811643,
-0.868404855176,
-0.291823145905,
--0.400889335129,
-0.880705878152,
-0.258507914019,
--0.396901517479,
-0.891898094191,
-0.224342096266,
--0.392668324953,
-0.901890504602,
-0.189196217983,
--0.388327579256,
-0.910543469618,
-0.152950133514,
--0.384079219164,
-0.917723256467,
-0.115685444091,
--0.380001187585,
-0.923445686314,
-0.077907514227,
--0.375737253482,
-0.927231534385,
-0.039284332407,
--0.372422371603,
-0.845531470505,
-0.376213878238,
--0.378866269556,
-0.860357627193,
-0.344184867676,
--0.375927559769,
-0.874146159976,
-0.311470757725,
--0.372631799612,
-0.886865749507,
-0.277993144360,
--0.369037876158,
-0.898463138571,
-0.243665596151,
--0.365227416662,
-0.908856982934,
-0.208402729158,
--0.361313281033,
-0.917931518893,
-0.172133869696,
--0.357451615644,
-0.925587303437,
-0.134973429242,
--0.353652820029,
-0.931807212378,
-0.097280931289,
--0.349673761336,
-0.936280887749,
-0.058838305758,
--0.346289117662,
-0.938643247168,
-0.019703168063,
--0.344326356404,
-0.833082082696,
-0.426830127955,
--0.351838436445,
-0.849367224368,
-0.395457937836,
--0.349554484410,
-0.864624443597,
-0.363419769717,
--0.346915901212,
-0.878836952425,
-0.330659805590,
--0.343961776975,
-0.891972553962,
-0.297116904854,
--0.340744050319,
-0.903980442276,
-0.262729302900,
--0.337331696377,
-0.914787943131,
-0.227441689107,
--0.333816262573,
-0.924297329518,
-0.191214115708,
--0.330320463490,
-0.932429624434,
-0.154177069552,
--0.326809465443,
-0.939147756278,
-0.116589039358,
--0.323123022669,
-0.944242675406,
-0.078316797465,
--0.319800327043,
-0.947446110534,
-0.039360950301,
--0.317484776367,
-0.817745743233,
-0.476017922505,
--0.323571996438,
-0.835467795426,
-0.445412670440,
--0.321871272122,
-0.852168520853,
-0.414144177747,
--0.319833413052,
-0.867841819592,
-0.382170007216,
--0.317484900037,
-0.882469351288,
-0.349444440272,
--0.314859376865,
-0.896018649928,
-0.315921109048,
--0.312000692048,
-0.908441360534,
-0.281556954182,
--0.308965978748,
-0.919671785835,
-0.246317369496,
--0.305829298505,
-0.929625617612,
-0.210182208227,
--0.302687380683,
-0.938235695411,
-0.173289016939,
--0.299474033040,
-0.945453941358,
-0.135825386016,
--0.296088347093,
-0.951134052444,
-0.097719924500,
--0.292907546226,
-0.955072948874,
-0.058948182227,
--0.290449262594,
-0.957101113211,
-0.019706936380,
--0.289083198661,
-0.999805669655,
-0.019713521409,
--0.000000001455,
-0.836828920699,
-0.463413973171,
--0.291487301526,
-0.853923809695,
-0.432315565225,
--0.289684965611,
-0.869997750055,
-0.400475914512,
--0.287615988421,
-0.885031229079,
-0.367858376750,
--0.285306744065,
-0.898991500407,
-0.334428762131,
--0.282792654174,
-0.911832203878,
-0.300158396027,
--0.280119562447,
-0.923492778259,
-0.265027431319,
--0.277347343869,
-0.933898543492,
-0.229028855343,
--0.274552898150,
-0.942988462108,
-0.192301595082,
--0.271648406695,
-0.950709570841,
-0.154983702260,
--0.268572828009,
-0.956954734078,
-0.117047598125,
--0.265588961928,
-0.961566224132,
-0.078459574667,
--0.263124479574,
-0.964409293307,
-0.039369529270,
--0.261466546902,
-0.998077672616,
-0.019694489174,
--0.058762968974,
-0.998790334550,
-0.039393488134,
--0.029428229681,
-0.998253983067,
-0.059067633195,
--0.000000000468,
-0.854617400873,
-0.450001609514,
--0.259090041412,
-0.871075888171,
-0.418363528103,
--0.257291187958,
-0.886505704830,
-0.385921458728,
--0.255288587675,
-0.900873670335,
-0.352651223456,
--0.253108167969,
-0.914134415853,
-0.318535376552,
--0.250785732525,
-0.926231114354,
-0.283565587315,
--0.248367631734,
-0.937095348585,
-0.247744068043,
--0.245917027490,
-0.946668118546,
-0.211206612419,
--0.243333598581,
-0.954895730684,
-0.174057504493,
--0.240578736906,
-0.961695238604,
-0.136298543183,
--0.237833923510,
-0.966941417819,
-0.097895329955,
--0.235458698884,
-0.970525010076,
-0.058970358261,
--0.233674349604,
-0.972347475757,
-0.019697836648,
--0.232706642837,
-0.992899763434,
-0.019684876760,
--0.117313960807,
-0.995324864374,
-0.039356003921,
--0.088201583401,
-0.996514233637,
-0.059008990871,
--0.058968815102,
-0.996464031497,
-0.078642310016,
--0.029577373257,
-0.995166083739,
-0.098206241025,
--0.000000001337,
-0.871056254731,
-0.435846607406,
--0.226492242485,
-0.886871337469,
-0.403643084224,
--0.224792106921,
-0.901643035931,
-0.370591711198,
--0.222938599952,
-0.915325091472,
-0.336684621379,
--0.220960273914,
-0.927862714630,
-0.301922740544,
--0.218891392113,
-0.939192066484,
-0.266316752839,
--0.216780186850,
-0.949251847444,
-0.229994868965,
--0.214530394989,
-0.957990636184,
-0.193039494857,
--0.212107742457,
-0.965340109396,
-0.155469696949,
--0.209636939783,
-0.971198713562,
-0.117256071528,
--0.207422449280,
-0.975475109059,
-0.078504377911,
--0.205634078535,
-0.978084036467,
-0.039357865132,
--0.204456782867,
-0.984304379375,
-0.019688062214,
--0.175377504113,
-0.988408662627,
-0.039348477020,
--0.146628827319,
-0.991292013347,
-0.058973206426,
--0.117738291131,
-0.992959150186,
-0.078558790941,
--0.088660264083,
-0.993404310200,
-0.098103562401,
--0.059359645562,
-0.992612568765,
-0.117608045691,
--0.029809996965,
-0.990571620355,
-0.136995857407,
--0.000000001447,
-0.886105596412,
-0.421020659521,
--0.193800093560,
-0.901273391754,
-0.388246690537,
--0.192277873411,
-0.915377331523,
-0.354598281650,
--0.190642071917,
-0.928360290281,
-0.320087274868,
--0.188921433136,
-0.940160669090,
-0.284735039489,
--0.187146663299,
-0.950713661995,
-0.248655478078,
--0.185240346897,
-0.959969479493,
-0.211920779157,
--0.183161627543,
-0.967869324228,
-0.174555338473,
--0.180995593950,
-0.974328651581,
-0.136540572380,
--0.178998186587,
-0.979268384833,
-0.097970474188,
--0.177299793160,
-0.982613966443,
-0.058968057970,
--0.176047042267,
-0.985951820230,
-0.078523819851,
--0.147421226090,
-0.988099125316,
-0.098023122075,
--0.118539386236,
-0.989047421857,
-0.117463759958,
--0.089372604384,
-0.988780106834,
-0.136842462690,
--0.059900256546,
-0.987272338262,
-0.156162691188,
--0.030108868862,
-0.984512472364,
-0.175314550905,
--0.000000002569,
-0.899740922547,
-0.405596193926,
--0.161114865134,
-0.914262851387,
-0.372261676764,
--0.159827039598,
-0.927692975005,
-0.338048545066,
--0.158457960691,
-0.939968864238,
-0.302985166178,
--0.157030326177,
-0.951024452690,
-0.267173602254,
--0.155469471741,
-0.960804976905,
-0.230687540052,
--0.153743472123,
-0.969259234022,
-0.193545245697,
--0.151910418116,
-0.976315018382,
-0.155744445637,
--0.150175405890,
-0.981901518214,
-0.117367518361,
--0.148641428153,
-0.983362445673,
-0.136692806518,
--0.119638526767,
-0.983632210052,
-0.155941267352,
--0.090277330963,
-0.982685965989,
-0.175105804155,
--0.060549563160,
-0.980491025076,
-0.194189680741,
--0.030458457605,
-0.977040956393,
-0.213051565428,
--0.000000001356,
-0.911949783275,
-0.389654136125,
--0.128519442053,
-0.925830538389,
-0.355780519214,
--0.127507005039,
-0.938587625052,
-0.321039547048,
--0.126439231770,
-0.950152946235,
-0.285527293233,
--0.125233955376,
-0.960468406667,
-0.249316667449,
--0.123861370596,
-0.969482821903,
-0.212427088748,
--0.122383781614,
-0.977136343935,
-0.174860662249,
--0.120947567812,
-0.976766597540,
-0.193879097426,
--0.091312154238,
-0.975174293017,
-0.212793452680,
--0.061270259801,
-0.972324632198,
-0.231590729531,
--0.030830887379,
-0.968214556970,
-0.250121114006,
--0.000000002098,
-0.922736671989,
-0.373262303172,
--0.096084791708,
-0.935983569813,
-0.338876291584,
--0.095381423987,
-0.948065950468,
-0.303698143033,
--0.094543066807,
-0.958924982880,
-0.267795653324,
--0.093532696260,
-0.968509857004,
-0.231188560415,
--0.092414860384,
-0.966304729375,
-0.249817712086,
--0.062018390139,
-0.962832633898,
-0.268289711873,
--0.031208165659,
-0.958093210068,
-0.286456629914,
--0.000000002214,
-0.932118391216,
-0.356476088749,
--0.063875683220,
-0.944727713032,
-0.321666100946,
--0.063407158365,
-0.956139240091,
-0.286108061980,
--0.062768865127,
-0.952076334702,
-0.304225514390,
--0.031583053926,
-0.946738857652,
-0.322002384172,
--0.000000000881,
-0.940101520142,
-0.339403642805,
--0.031848062377,
-0.033808943928,
--0.564444911575,
--0.824778089614,
--0.000000001697,
--0.550735108946,
--0.834680082291,
--0.067686807932,
--0.601482759841,
--0.796013181829,
-0.034410420412,
--0.592180171602,
--0.805070535623,
--0.000000000297,
--0.579186725664,
--0.815194907255,
--0.101366333663,
--0.636536090912,
--0.764556519406,
-0.068316855638,
--0.628641676194,
--0.774688614985,
-0.034502971258,
--0.618826254245,
--0.784769782823,
-0.000000000517,
--0.606229327536,
--0.795289885787,
--0.034410417907,
--0.592180171147,
--0.805070536065,
-0.134796163508,
--0.669541939813,
--0.730440678724,
-0.101953342427,
--0.662827226065,
--0.741798884035,
-0.068537426908,
--0.654703392598,
--0.752772268905,
-0.034499882344,
--0.644725590032,
--0.763635169224,
-0.000000001049,
--0.632475941815,
--0.774580004277,
--0.034502969901,
--0.618826252795,
--0.784769784026,
--0.167877821148,
--0.700386923539,
--0.693740004974,
-0.135275667820,
--0.694832911607,
--0.706333999354,
-0.102190885040,
--0.688072287063,
--0.718410433381,
-0.068580959385,
--0.679877080018,
--0.730112188692,
-0.034463285101,
--0.669927814138,
--0.741625920410,
-0.000000000986,
--0.658019472734,
--0.753000912020,
--0.034499879892,
--0.644725588332,
--0.763635170771,
--0.068316852403,
--0.628641677003,
--0.774688614614,
-0.200493801539,
--0.728943598949,
--0.654555929692,
-0.168182693707,
--0.724584241369,
--0.668350401135,
-0.135434970966,
--0.719110665487,
--0.681569673198,
-0.102219062554,
--0.712390578021,
--0.694298874835,
-0.068527252260,
--0.704243032905,
--0.706644016675,
-0.034405460658,
--0.694433201887,
--0.718734159752,
-0.000000001682,
--0.682869607814,
--0.730540278646,
--0.034463280713,
--0.669927813978,
--0.741625920758,
--0.068537423514,
--0.654703393330,
--0.752772268578,
-0.232512962128,
--0.755080152148,
--0.613018504024,
-0.200550058999,
--0.751968370855,
--0.627951624785,
-0.168175017056,
--0.747784919126,
--0.642288781130,
-0.135363527859,
--0.742447059960,
--0.656086182207,
-0.102102937924,
--0.735843267438,
--0.669409946022,
-0.068405736897,
--0.727830165097,
--0.682337091132,
-0.034328594704,
--0.718230509404,
--0.694957900126,
-0.000000001520,
--0.707017841381,
--0.707195709806,
--0.034405456797,
--0.694433201200,
--0.718734160601,
--0.068580957714,
--0.679877080252,
--0.730112188631,
--0.101953339022,
--0.662827226906,
--0.741798883751,
-0.263795524187,
--0.778668570452,
--0.569286552457,
-0.232240527680,
--0.776863211754,
--0.585275907180,
-0.200287073575,
--0.774002844387,
--0.600670196563,
-0.167914736983,
--0.770033898090,
--0.615509899917,
-0.135109972812,
--0.764883704818,
--0.629839831505,
-0.101872999909,
--0.758458964912,
--0.643709476732,
-0.068227302327,
--0.750644938662,
--0.657173653822,
-0.034232118240,
--0.741304668481,
--0.670295121994,
-0.000000002123,
--0.730450268257,
--0.682965889048,
--0.034328591386,
--0.718230509459,
--0.694957900233,
--0.068527249899,
--0.704243034087,
--0.706644015726,
--0.102190883518,
--0.688072288475,
--0.718410432245,
-0.294195255416,
--0.799589918803,
--0.523550487957,
-0.263108308917,
--0.799150286886,
--0.540493142185,
-0.231631829430,
--0.797656944313,
--0.556857337909,
-0.199746609914,
--0.795075554518,
--0.572674562413,
-0.167438152639,
--0.791358024054,
--0.587976991732,
-0.134700902021,
--0.786441353493,
--0.602798195510,
-0.101543531393,
--0.780247238039,
--0.617173524031,
-0.067995376114,
--0.772682338120,
--0.631140739601,
-0.034114554464,
--0.763638482554,
--0.644742169503,
-0.000000001551,
--0.753150565202,
--0.657848178636,
--0.034232116178,
--0.741304667877,
--0.670295122767,
--0.068405733411,
--0.727830165042,
--0.682337091540,
--0.102219059564,
--0.712390579475,
--0.694298873783,
--0.135275663549,
--0.694832912939,
--0.706333998862,
--0.293008368430,
--0.818716538078,
--0.493811022870,
-0.262059072609,
--0.818641275000,
--0.511029847788,
-0.230716152908,
--0.817479079168,
--0.527729108454,
-0.198955725053,
--0.815202693842,
--0.543931234092,
-0.166767360008,
--0.811769860727,
--0.559659129159,
-0.134151227635,
--0.807126046669,
--0.574935642409,
-0.101121377597,
--0.801205241716,
--0.589783543039,
-0.067710405183,
--0.793930024853,
--0.604227123412,
-0.033974164289,
--0.785212708996,
--0.618293423701,
-0.000000001523,
--0.775100514722,
--0.631837947640,
--0.034114551121,
--0.763638482573,
--0.644742169658,
--0.068227298680,
--0.750644939025,
--0.657173653786,
--0.102102935410,
--0.735843268049,
--0.669409945734,
--0.135434969474,
--0.719110666000,
--0.681569672953,
--0.263108301620,
--0.799150287386,
--0.540493144997,
--0.262059070984,
--0.818641275450,
--0.511029847900,
--0.260690726163,
--0.837138253457,
--0.480874089437,
-0.229512669741,
--0.836337579883,
--0.497858802177,
-0.197931545206,
--0.834389611390,
--0.514409447636,
-0.165915984039,
--0.831270398120,
--0.530529369073,
-0.133469642930,
--0.826932995496,
--0.546230423334,
-0.100610329561,
--0.821320912547,
--0.561524282822,
-0.067372039971,
--0.814369686830,
--0.576422606602,
-0.033809286985,
--0.806005555676,
--0.590941601458,
-0.000000001398,
--0.796279684883,
--0.604928643266,
--0.033974161051,
--0.785212708037,
--0.618293425097,
--0.067995372639,
--0.772682338828,
--0.631140739108,
--0.101872995626,
--0.758458965129,
--0.643709477154,
--0.135363524780,
--0.742447060571,
--0.656086182150,
--0.168182688427,
--0.724584243308,
--0.668350400361,
--0.232240520377,
--0.776863213142,
--0.585275908236,
--0.231631830313,
--0.797656943961,
--0.556857338047,
--0.230716149344,
--0.817479079580,
--0.527729109375,
--0.229512668108,
--0.836337579787,
--0.497858803090,
--0.228072713490,
--0.854209394069,
--0.467235645521,
-0.196682247807,
--0.852632664815,
--0.484080192001,
-0.164891853157,
--0.849850944709,
--0.500563730748,
-0.132661271348,
--0.845848578439,
--0.516663497294,
-0.100012708755,
--0.840575385347,
--0.532381892663,
-0.066980976877,
--0.833976914770,
--0.547718955641,
-0.033618562833,
--0.825991957407,
--0.562678485934,
-0.000000002304,
--0.816664773145,
--0.577112335949,
--0.033809283880,
--0.806005555495,
--0.590941601881,
--0.067710402321,
--0.793930025286,
--0.604227123164,
--0.101543528206,
--0.780247238108,
--0.617173524468,
--0.135109971159,
--0.764883704885,
--0.629839831779,
--0.168175016008,
--0.747784919474,
--0.642288781000,
--0.200550051891,
--0.751968372458,
--0.627951625135,
--0.200287073868,
--0.774002844455,
--0.600670196378,
--0.199746606736,
--0.795075555551,
--0.572674562088,
--0.198955723158,
--0.815202694364,
--0.543931234004,
--0.197931542165,
--0.834389611179,
--0.514409449149,
--0.196682246456,
--0.852632664142,
--0.484080193736,
--0.195271487311,
--0.869887203269,
--0.452951763250,
-0.163691227213,
--0.867497293647,
--0.469737828632,
-0.131728312730,
--0.863851705249,
--0.486217937723,
-0.099329920283,
--0.858943318227,
--0.502344446580,
-0.066537655019,
--0.852722955733,
--0.518108387531,
-0.033403193298,
--0.845141979081,
--0.533497199498,
-0.000000002618,
--0.836228833142,
--0.548380651210,
--0.033618557674,
--0.825991956941,
--0.562678486925,
--0.067372037262,
--0.814369686433,
--0.576422607479,
--0.101121374674,
--0.801205241808,
--0.589783543415,
--0.134700897822,
--0.786441353292,
--0.602798196711,
--0.167914732384,
--0.770033898877,
--0.615509900187,
--0.167438150318,
--0.791358023933,
--0.587976992556,
--0.166767357131,
--0.811769860695,
--0.559659130062,
--0.165915981375,
--0.831270398918,
--0.530529368657,
--0.164891850570,
--0.849850944234,
--0.500563732406,
--0.163691225109,
--0.867497293164,
--0.469737830257,
--0.162398632807,
--0.884144595975,
--0.438081062670,
-0.130656410705,
--0.880916562465,
--0.454879008437,
-0.098556784251,
--0.876395751084,
--0.471399032414,
-0.066043103389,
--0.870577452126,
--0.487578925246,
-0.033168958337,
--0.863418329020,
--0.503397069236,
-0.000000002595,
--0.854939036545,
--0.518728487546,
--0.033403189790,
--0.845141978961,
--0.533497199907,
--0.066980973260,
--0.833976914306,
--0.547718956789,
--0.100610326299,
--0.821320911996,
--0.561524284212,
--0.134151224913,
--0.807126046851,
--0.574935642789,
--0.133469640478,
--0.826932995485,
--0.546230423950,
--0.132661268227,
--0.845848578348,
--0.516663498245,
--0.131728310669,
--0.863851704678,
--0.486217939296,
--0.130656408926,
--0.880916561466,
--0.454879010882,
--0.129559921939,
--0.896968520217,
--0.422683924898,
-0.097688558032,
--0.892895249047,
--0.439539554374,
-0.065488618557,
--0.887501067616,
--0.456128376468,
-0.032906538462,
--0.880781241528,
--0.472378623880,
-0.000000002630,
--0.872754106893,
--0.488160085323,
--0.033168953976,
--0.863418328818,
--0.503397069870,
--0.066537652053,
--0.852722954693,
--0.518108389624,
--0.100012704784,
--0.840575385307,
--0.532381893473,
--0.099329916387,
--0.858943318208,
--0.502344447383,
--0.098556779610,
--0.876395750340,
--0.471399034768,
--0.097688555779,
--0.892895248111,
--0.439539556776,
--0.096842519373,
--0.908362587145,
--0.406815605302,
-0.064876629502,
--0.903448967019,
--0.423758170348,
-0.032612561347,
--0.897190279267,
--0.440438444769,
-0.000000001795,
--0.889635122890,
--0.456672035624,
--0.032906533352,
--0.880781241468,
--0.472378624347,
--0.066043100561,
--0.870577451352,
--0.487578927012,
--0.065488613479,
--0.887501067336,
--0.456128377743,
--0.064876627463,
--0.903448965947,
--0.423758172946,
--0.064318801248,
--0.918342003413,
--0.390526640030,
-0.032292631841,
--0.912598991995,
--0.407578539349,
-0.000000002979,
--0.905539935873,
--0.424261033492,
--0.032612557244,
--0.897190279170,
--0.440438445271,
--0.032292629138,
--0.912598991513,
--0.407578540642,
--0.032052994785,
--0.926929016889,
--0.373865220601,
-0.000000000009,
--0.920418335123,
--0.390934890192,
-0.824778089187,
-0.033808942809,
--0.564444912266,
-0.845456880352,
-0.028214021915,
--0.533297883394,
-0.863699990427,
-0.109519557567,
--0.491963202941,
-0.817104271541,
-0.065915150055,
--0.572709177876,
-0.838485074993,
-0.060974450443,
--0.541502442661,
-0.865922853816,
-0.164014175138,
--0.472521916522,
-0.786838788369,
-0.100126422527,
--0.608982282690,
-0.808868434473,
-0.097594060363,
--0.579833816791,
-0.830738197495,
-0.092804885412,
--0.548872754349,
-0.851514690917,
-0.087181958074,
--0.517031950018,
-0.730440678566,
-0.134796163093,
--0.669541940069,
-0.753976109567,
-0.133833732760,
--0.643124061264,
-0.777051319572,
-0.132100806769,
--0.615419063405,
-0.799775052261,
-0.129115324484,
--0.586250030929,
-0.822094200992,
-0.124393782999,
--0.555596356581,
-0.843371405579,
-0.118918067119,
--0.524006837327,
-0.861617826288,
-0.271632021008,
--0.428754902697,
-0.718513553210,
-0.167162153783,
--0.675125979501,
-0.742736837082,
-0.165878236754,
--0.648711339050,
-0.766476260571,
-0.163783335534,
--0.621038775748,
-0.789775410103,
-0.160520285659,
--0.592020303273,
-0.812529733815,
-0.155848479757,
--0.561699815759,
-0.834274934105,
-0.150437421474,
--0.530428050300,
-0.855155642339,
-0.142348561156,
--0.498443291170,
-0.654555930137,
-0.200493802702,
--0.728943598230,
-0.680524330302,
-0.200054454041,
--0.704886410201,
-0.705901379456,
-0.199136204955,
--0.679741137757,
-0.730730852881,
-0.197599219356,
--0.653442399265,
-0.755046457671,
-0.195246487927,
--0.625926238235,
-0.778857080189,
-0.191809309866,
--0.597152273116,
-0.802037813416,
-0.187182977821,
--0.567184166445,
-0.824238693243,
-0.181819765556,
--0.536257540194,
-0.845588744745,
-0.174459265807,
--0.504523180177,
-0.613018505686,
-0.232512966481,
--0.755080149457,
-0.640119512424,
-0.232406002408,
--0.732280315084,
-0.666613278850,
-0.231857378845,
--0.708427055056,
-0.692531866202,
-0.230779567301,
--0.683476704513,
-0.717900628408,
-0.229053192549,
--0.657383695200,
-0.742731324204,
-0.226519891802,
--0.630110243263,
-0.767013887509,
-0.222973618767,
--0.601641472724,
-0.790613875135,
-0.218391593631,
--0.572044414600,
-0.813262539391,
-0.213073051778,
--0.541483071415,
-0.835057219143,
-0.206168699119,
--0.510072453932,
-0.855929450322,
-0.196844363417,
--0.478160091038,
-0.569286554769,
-0.263795530239,
--0.778668566712,
-0.597441826204,
-0.264091317188,
--0.757178341270,
-0.624988892857,
-0.263954247034,
--0.734654367222,
-0.651954161502,
-0.263327052508,
--0.711065844150,
-0.678358204525,
-0.262132722457,
--0.686379328193,
-0.704212115856,
-0.260270965544,
--0.660563638400,
-0.729513045822,
-0.257614289309,
--0.633597343680,
-0.754239826390,
-0.254002207524,
--0.605479283593,
-0.778252556194,
-0.249463735385,
--0.576273202140,
-0.801342480658,
-0.244189856046,
--0.546096642452,
-0.823573708348,
-0.237598659680,
--0.515046817130,
-0.844927720879,
-0.229035678289,
--0.483363015301,
-0.523550487904,
-0.294195255276,
--0.799589918889,
-0.552665002619,
-0.294974653241,
--0.779455802997,
-0.581180686570,
-0.295311182944,
--0.758300939460,
-0.609122006440,
-0.295167257179,
--0.736102351280,
-0.636507380361,
-0.294492359556,
--0.712834205766,
-0.663347276645,
-0.293220454418,
--0.688470882230,
-0.689641760091,
-0.291267836503,
--0.662991168989,
-0.715377869855,
-0.288531046233,
--0.636383798254,
-0.740527363554,
-0.284883448108,
--0.608654782961,
-0.764946679431,
-0.280387516774,
--0.579861550773,
-0.788471944038,
-0.275158818591,
--0.550090554379,
-0.811137059671,
-0.268796960904,
--0.519427438857,
-0.832949913538,
-0.260774075091,
--0.488048484576,
-0.853789218908,
-0.250767114349,
--0.456245355086,
-0.799003017568,
-0.505994646785,
--0.324905517562,
-0.535376361461,
-0.325799072911,
--0.779247788370,
-0.564198668721,
-0.326194701241,
--0.758470091102,
-0.592483235883,
-0.326066515963,
--0.736643904723,
-0.620240749029,
-0.325372099921,
--0.713746740685,
-0.647472756587,
-0.324055857998,
--0.689758530483,
-0.674170256196,
-0.322048660839,
--0.664664671630,
-0.700312678735,
-0.319265654848,
--0.638460330512,
-0.725866876419,
-0.315605119791,
--0.611155206211,
-0.750686867968,
-0.311150514469,
--0.582798922105,
-0.774641916478,
-0.305967401183,
--0.553456277089,
-0.797740346409,
-0.299781080293,
--0.523203252676,
-0.820003565031,
-0.292156278398,
--0.492177673538,
-0.841336349636,
-0.282839620354,
--0.460602752856,
-0.815773310318,
-0.457584527618,
--0.353737623468,
-0.797435433487,
-0.487760486650,
--0.355227303402,
-0.778070620550,
-0.517379893630,
--0.356264164777,
-0.546462422108,
-0.356758598697,
--0.757695270858,
-0.575040782451,
-0.356666440534,
--0.736286050876,
-0.603125963516,
-0.355976335757,
--0.713806640845,
-0.630711222675,
-0.354643247000,
--0.690240190766,
-0.657779642589,
-0.352610133031,
--0.665576468844,
-0.684303737632,
-0.349808507752,
--0.639814350079,
-0.710246569034,
-0.346153747128,
--0.612966063110,
-0.735461506991,
-0.341739475281,
--0.585073074726,
-0.759841039922,
-0.336602305587,
--0.556183856224,
-0.783373244052,
-0.330554499496,
--0.526364971637,
-0.806085114031,
-0.323231940665,
--0.495729665716,
-0.827895392664,
-0.314438827927,
--0.464453918379,
-0.848707021341,
-0.303997075396,
--0.432761100466,
-0.829682351515,
-0.407623855198,
--0.381405280847,
-0.812812516444,
-0.438467526327,
--0.383512765718,
-0.794914820719,
-0.468785124263,
--0.385163517317,
-0.775975091741,
-0.498605228407,
--0.386335971924,
-0.756003153871,
-0.527930438218,
--0.386973750712,
-0.556765961453,
-0.386976062730,
--0.735024619344,
-0.585137022965,
-0.386307606721,
--0.713008483361,
-0.613040499416,
-0.384979538636,
--0.689907313273,
-0.640451723410,
-0.382943198809,
--0.665714726040,
-0.667336494396,
-0.380143758990,
--0.640431671412,
-0.693652728129,
-0.376513580550,
--0.614071181884,
-0.719256979903,
-0.372139511495,
--0.586669907908,
-0.744055854754,
-0.367049034302,
--0.558261490186,
-0.768023082420,
-0.361112986232,
--0.528902595989,
-0.791185290265,
-0.354025189094,
--0.498690286605,
-0.813468176753,
-0.345635277280,
--0.467766801419,
-0.834788295384,
-0.335795255467,
--0.436314162382,
-0.840669568647,
-0.356352754240,
--0.407783509839,
-0.825275966449,
-0.387738466249,
--0.410583074410,
-0.808868614821,
-0.418617451258,
--0.412905550289,
-0.791438960078,
-0.449027916183,
--0.414726781098,
-0.772972327295,
-0.478994861051,
--0.416026086109,
-0.753448209780,
-0.508532375029,
--0.416786058701,
-0.732891346756,
-0.537619857105,
--0.416935442360,
-0.566251678969,
-0.416367767780,
--0.711334603417,
-0.594439275764,
-0.415055454031,
--0.688745901990,
-0.622168316708,
-0.413032884943,
--0.665064223696,
-0.649395547747,
-0.410251902749,
--0.640295868218,
-0.676069938392,
-0.406663469592,
--0.614454441682,
-0.702058185534,
-0.402333010784,
--0.587573359299,
-0.727271289041,
-0.397290992567,
--0.559675208815,
-0.751675776835,
-0.391446716748,
--0.530804101780,
-0.775291632664,
-0.384545108166,
--0.501046848216,
-0.798048177475,
-0.376470188122,
--0.470520248113,
-0.819868896647,
-0.367104066256,
--0.439374096697,
-0.803945532468,
-0.397974827673,
--0.441913585854,
-0.787008108319,
-0.428439995253,
--0.443911486568,
-0.769041946132,
-0.458518053200,
--0.445348941818,
-0.750028876023,
-0.488216374428,
--0.446207862853,
-0.729942906296,
-0.517534508004,
--0.446476636089,
-0.708830046658,
-0.546431409694,
--0.446063537463,
-0.574894831285,
-0.444861914111,
--0.686726881908,
-0.602912617112,
-0.442863818973,
--0.663602301060,
-0.630461312556,
-0.440114049758,
--0.639388893066,
-0.657483241684,
-0.436571795002,
--0.614101664803,
-0.683850852040,
-0.432295965145,
--0.587765438490,
-0.709473130230,
-0.427307776997,
--0.560406942497,
-0.734317470250,
-0.421540277233,
--0.532054177275,
-0.758389971474,
-0.414790734170,
--0.502785538788,
-0.781623983224,
-0.406965875424,
--0.472697286949,
-0.764180864874,
-0.437132021722,
--0.474281774208,
-0.745701769945,
-0.466968711806,
--0.475256870014,
-0.726167588560,
-0.496468026693,
--0.475605016580,
-0.705551242770,
-0.525612014194,
--0.475320370235,
-0.683916955627,
-0.554357031495,
--0.474284597513,
-0.582670496325,
-0.472410228900,
--0.661304520129,
-0.610524211320,
-0.469702161921,
--0.637683359104,
-0.637885437226,
-0.466209001172,
--0.612985592165,
-0.664625654627,
-0.461992860913,
--0.587226817914,
-0.690652198290,
-0.457071336798,
--0.560433166465,
-0.715933202654,
-0.451374432279,
--0.532635683392,
-0.740464430822,
-0.444754450462,
--0.503890767410,
-0.721498235687,
-0.474422150157,
--0.504345039968,
-0.701469400717,
-0.503775258249,
--0.504134078430,
-0.680359054884,
-0.532785075422,
--0.503241115018,
-0.658241474435,
-0.561398951668,
--0.501546985237,
-0.589570330925,
-0.498978501641,
--0.635159255457,
-0.617262949603,
-0.495545125044,
--0.611082220403,
-0.644367808544,
-0.491393914844,
--0.585936982761,
-0.670791973493,
-0.486546358533,
--0.559741698729,
-0.696504415720,
-0.480930929991,
--0.532528909506,
-0.676012828283,
-0.510176351632,
--0.531720552765,
-0.654446961178,
-0.539074460952,
--0.530186665764,
-0.631885374868,
-0.567566570038,
--0.527815366965,
-0.595600246531,
-0.524539851867,
--0.608373479152,
-0.623061613926,
-0.520466679540,
--0.583873839746,
-0.649875509274,
-0.515700794820,
--0.558313991109,
-0.627892877918,
-0.544497794059,
--0.556122905592,
-0.604926633262,
-0.572873637051,
--0.553063797714,
-0.600697877342,
-0.549166629950,
--0.581014692332,
--0.879482108895,
--0.000000000692,
--0.475931949057,
--0.862894103158,
-0.017437225552,
--0.505083864225,
--0.863699991504,
-0.109519556901,
--0.491963201198,
--0.892252495060,
-0.019470993726,
--0.451116798027,
--0.876169357514,
-0.037684283003,
--0.480527992700,
--0.865922855025,
-0.164014174390,
--0.472521914566,
--0.917037176300,
-0.019659393505,
--0.398316865736,
--0.903687852136,
-0.038992437454,
--0.426412776219,
--0.888094771519,
-0.057356573187,
--0.456067868101,
--0.870985686306,
-0.075148221129,
--0.485527217684,
--0.948545452418,
--0.000000000256,
--0.316641002868,
--0.938643247681,
-0.019703164800,
--0.344326355191,
--0.927231535005,
-0.039284329194,
--0.372422370397,
--0.914072593605,
-0.058475559104,
--0.401312724204,
--0.898973787924,
-0.076879585234,
--0.431202571884,
--0.882363843033,
-0.094819415468,
--0.460915748221,
--0.861617826555,
-0.271632020843,
--0.428754902264,
--0.957101113700,
-0.019706932107,
--0.289083197335,
--0.947446110431,
-0.039360948013,
--0.317484776960,
--0.936280888107,
-0.058838304270,
--0.346289116948,
--0.923445687626,
-0.077907510865,
--0.375737250957,
--0.908849392386,
-0.096319656975,
--0.405851334406,
--0.892750493863,
-0.114297538032,
--0.435812607099,
--0.874815038980,
-0.130198385834,
--0.466633719206,
--0.978961716279,
-0.000000000719,
--0.204044010104,
--0.972347476206,
-0.019697831168,
--0.232706641423,
--0.964409293475,
-0.039369527730,
--0.261466546513,
--0.955072949147,
-0.058948178756,
--0.290449262399,
--0.944242675654,
-0.078316794670,
--0.319800326996,
--0.931807213703,
-0.097280928771,
--0.349673758507,
--0.917723257506,
-0.115685441369,
--0.380001185903,
--0.902146207470,
-0.133670273785,
--0.410200534195,
--0.884873077152,
-0.150180213154,
--0.440959795116,
--0.989232383924,
-0.000000002691,
--0.146353307429,
--0.984304380100,
-0.019688055771,
--0.175377500770,
--0.978084036575,
-0.039357864070,
--0.204456782556,
--0.970525010562,
-0.058970355447,
--0.233674348299,
--0.961566224559,
-0.078459572239,
--0.263124478738,
--0.951134053362,
-0.097719921834,
--0.292907544136,
--0.939147757206,
-0.116589036680,
--0.323123020940,
--0.925587304377,
-0.134973426781,
--0.353652818509,
--0.910543470680,
-0.152950129784,
--0.384079218133,
--0.893895524901,
-0.169804626320,
--0.414870075375,
--0.875632618386,
-0.184667135868,
--0.446279695426,
--0.996116682724,
-0.000000003740,
--0.088042912258,
--0.992899764040,
-0.019684870484,
--0.117313956730,
--0.988408662574,
-0.039348477165,
--0.146628827637,
--0.982613967092,
-0.058968053940,
--0.176047039993,
--0.975475109379,
-0.078504376625,
--0.205634077507,
--0.966941418755,
-0.097895326512,
--0.235458696468,
--0.956954734930,
-0.117047594982,
--0.265588960246,
--0.945453942097,
-0.135825384888,
--0.296088345249,
--0.932429625746,
-0.154177066117,
--0.326809463320,
--0.917931520016,
-0.172133867007,
--0.357451614055,
--0.901890505813,
-0.189196216957,
--0.388327576942,
--0.884288671180,
-0.204709273173,
--0.419675659885,
--0.999568410409,
--0.000000000087,
--0.029376741022,
--0.998077673059,
-0.019694483889,
--0.058762963205,
--0.995324864317,
-0.039356004853,
--0.088201583622,
--0.991292013656,
-0.058973203238,
--0.117738290124,
--0.985951820633,
-0.078523818288,
--0.147421224225,
--0.979268385692,
-0.097970471263,
--0.177299790028,
--0.971198714273,
-0.117256069050,
--0.207422447354,
--0.961695239351,
-0.136298539866,
--0.237833922391,
--0.950709571782,
-0.154983699593,
--0.268572826219,
--0.938235696369,
-0.173289014429,
--0.299474031489,
--0.924297330053,
-0.191214113498,
--0.330320463271,
--0.908856984171,
-0.208402726185,
--0.361313279637,
--0.891898095766,
-0.224342094899,
--0.392668322157,
--0.873496155288,
-0.238587557852,
--0.424358862210,
--0.818716538977,
-0.493811020516,
--0.293008369884,
--0.998790334632,
-0.039393486630,
--0.029428228917,
--0.996514233945,
-0.059008988066,
--0.058968812703,
--0.992959150394,
-0.078558789119,
--0.088660263368,
--0.988099125779,
-0.098023120043,
--0.118539384056,
--0.981901518718,
-0.117367516186,
--0.148641426540,
--0.974328652222,
-0.136540570086,
--0.178998184851,
--0.965340110054,
-0.155469694342,
--0.209636938687,
--0.954895731762,
-0.174057502784,
--0.240578733861,
--0.942988463049,
-0.192301592617,
--0.271648405172,
--0.929625618738,
-0.210182205485,
--0.302687379130,
--0.914787944534,
-0.227441686350,
--0.333816260608,
--0.898463139698,
-0.243665594511,
--0.365227414984,
--0.880705878907,
-0.258507913144,
--0.396901516376,
--0.835467799492,
-0.445412663918,
--0.321871270594,
--0.836828921621,
-0.463413972047,
--0.291487300666,
--0.837138253746,
-0.480874088680,
--0.260690726632,
--0.996464031622,
-0.078642309025,
--0.029577371671,
--0.993404310554,
-0.098103560514,
--0.059359642752,
--0.989047422243,
-0.117463757275,
--0.089372603636,
--0.983362446131,
-0.136692804730,
--0.119638525039,
--0.976315019141,
-0.155744443703,
--0.150175402964,
--0.967869324947,
-0.174555336751,
--0.180995591764,
--0.957990637077,
-0.193039492566,
--0.212107740505,
--0.946668119411,
-0.211206610157,
--0.243333597183,
--0.933898544415,
-0.229028851813,
--0.274552897957,
--0.919671787235,
-0.246317367191,
--0.305829296149,
--0.903980443986,
-0.262729299413,
--0.337331694510,
--0.886865750925,
-0.277993142192,
--0.369037874384,
--0.868404857990,
-0.291823142842,
--0.400889331264,
--0.849367228276,
-0.395457932296,
--0.349554481184,
--0.852168520364,
-0.414144178243,
--0.319833413713,
--0.853923811589,
-0.432315562263,
--0.289684964446,
--0.854617401757,
-0.450001607863,
--0.259090041364,
--0.854209394896,
-0.467235643358,
--0.228072714827,
--0.992612568859,
-0.117608045472,
--0.029809994679,
--0.988780107188,
-0.136842461347,
--0.059900253764,
--0.983632210614,
-0.155941265167,
--0.090277328605,
--0.977136344790,
-0.174860659307,
--0.120947565159,
--0.969259234940,
-0.193545243357,
--0.151910415236,
--0.959969480968,
-0.211920775522,
--0.183161624017,
--0.949251848868,
-0.229994865237,
--0.214530392685,
--0.937095349611,
-0.247744065310,
--0.245917026336,
--0.923492779370,
-0.265027429297,
--0.277347342105,
--0.908441361793,
-0.281556951503,
--0.308965977486,
--0.891972554664,
-0.297116903465,
--0.340744049693,
--0.874146160516,
-0.311470757091,
--0.372631798875,
--0.860357630861,
-0.344184862619,
--0.375927556003,
--0.864624443469,
-0.363419770045,
--0.346915901187,
--0.867841821247,
-0.382170005262,
--0.317484897866,
--0.869997751019,
-0.400475913266,
--0.287615987240,
--0.871075889696,
-0.418363525069,
--0.257291187727,
--0.871056255471,
-0.435846605441,
--0.226492243422,
--0.869887204164,
-0.452951760909,
--0.195271488757,
--0.987272338490,
-0.156162690230,
--0.030108866347,
--0.982685966302,
-0.175105803259,
--0.060549560681,
--0.976766598358,
-0.193879094531,
--0.091312151634,
--0.969482822614,
-0.212427087515,
--0.122383778116,
--0.960804977881,
-0.230687537400,
--0.153743470000,
--0.950713663612,
-0.248655473843,
--0.185240344280,
--0.939192068197,
-0.266316748126,
--0.216780185217,
--0.926231115309,
-0.283565584654,
--0.248367631212,
--0.911832205044,
-0.300158393592,
--0.280119561262,
--0.896018651663,
-0.315921105180,
--0.312000690982,
--0.878836954617,
-0.330659802180,
--0.343961774652,
--0.882469352320,
-0.349444438079,
--0.314859376408,
--0.885031230395,
-0.367858374127,
--0.285306743367,
--0.886505706090,
-0.385921457100,
--0.255288585759,
--0.886871338714,
-0.403643081381,
--0.224792107116,
--0.886105597484,
-0.421020657075,
--0.193800093972,
--0.884144597563,
-0.438081058513,
--0.162398635376,
--0.980491025211,
-0.194189680557,
--0.030458454429,
--0.975174293876,
-0.212793450024,
--0.061270255346,
--0.968509857621,
-0.231188559060,
--0.092414857302,
--0.960468407862,
-0.249316664217,
--0.123861367840,
--0.951024454294,
-0.267173598055,
--0.155469469146,
--0.940160670282,
-0.284735036464,
--0.187146661913,
--0.927862715947,
-0.301922737031,
--0.218891391377,
--0.914134417110,
-0.318535373208,
--0.250785732189,
--0.898991501585,
-0.334428759902,
--0.282792653065,
--0.900873671391,
-0.352651221277,
--0.253108167245,
--0.901643037296,
-0.370591708334,
--0.222938599190,
--0.901273392715,
-0.388246688098,
--0.192277873829,
--0.899740923511,
-0.405596191232,
--0.161114866532,
--0.896968521055,
-0.422683922704,
--0.129559923295,
--0.972324632450,
-0.231590728918,
--0.030830884021,
--0.966304730534,
-0.249817708512,
--0.062018386482,
--0.958924984274,
-0.267795649364,
--0.093532693308,
--0.950152947861,
-0.285527288979,
--0.125233952746,
--0.939968865739,
-0.302985162353,
--0.157030324571,
--0.928360291402,
-0.320087271301,
--0.188921433667,
--0.915325093071,
-0.336684617897,
--0.220960272596,
--0.915377333113,
-0.354598278240,
--0.190642070625,
--0.914262853396,
-0.372261671910,
--0.159827039411,
--0.911949784415,
-0.389654133093,
--0.128519443158,
--0.908362588441,
-0.406815601908,
--0.096842521471,
--0.962832634097,
-0.268289711562,
--0.031208162206,
--0.956139241186,
-0.286108058864,
--0.062768862639,
--0.948065951577,
-0.303698140129,
--0.094543065012,
--0.938587626817,
-0.321039542739,
--0.126439229612,
--0.927692976135,
-0.338048541845,
--0.158457960946,
--0.925830540369,
-0.355780514571,
--0.127507003618,
--0.922736673051,
-0.373262300183,
--0.096084793122,
--0.918342004781,
-0.390526636448,
--0.064318803462,
--0.952076335280,
-0.304225512844,
--0.031583051379,
--0.944727714873,
-0.321666096127,
--0.063407155387,
--0.935983571254,
-0.338876288061,
--0.095381422371,
--0.932118392308,
-0.356476085922,
--0.063875683064,
--0.926929017434,
-0.373865219175,
--0.032052995666,
--0.940101520148,
-0.339403642791,
--0.031848062368,
--0.000000000692,
--0.475931949057,
--0.879482108895,
-0.017437225552,
--0.505083864225,
--0.862894103158,
-0.109519556901,
--0.491963201198,
--0.863699991504,
-0.019470993726,
--0.451116798027,
--0.892252495060,
-0.037684283003,
--0.480527992700,
--0.876169357514,
-0.164014174390,
--0.472521914566,
--0.865922855025,
-0.019659393505,
--0.398316865736,
--0.917037176300,
-0.038992437454,
--0.426412776219,
--0.903687852136,
-0.057356573187,
--0.456067868101,
--0.888094771519,
-0.075148221129,
--0.485527217684,
--0.870985686306,
--0.000000000256,
--0.316641002868,
--0.948545452418,
-0.019703164800,
--0.344326355191,
--0.938643247681,
-0.039284329194,
--0.372422370397,
--0.927231535005,
-0.058475559104,
--0.401312724204,
--0.914072593605,
-0.076879585234,
--0.431202571884,
--0.898973787924,
-0.094819415468,
--0.460915748221,
--0.882363843033,
-0.271632020843,
--0.428754902264,
--0.861617826555,
-0.019706932107,
--0.289083197335,
--0.957101113700,
-0.039360948013,
--0.317484776960,
--0.947446110431,
-0.058838304270,
--0.346289116948,
--0.936280888107,
-0.077907510865,
--0.375737250957,
--0.923445687626,
-0.096319656975,
--0.405851334406,
--0.908849392386,
-0.114297538032,
--0.435812607099,
--0.892750493863,
-0.130198385834,
--0.466633719206,
--0.874815038980,
-0.000000000719,
--0.204044010104,
--0.978961716279,
-0.019697831168,
--0.232706641423,
--0.972347476206,
-0.039369527730,
--0.261466546513,
--0.964409293475,
-0.058948178756,
--0.290449262399,
--0.955072949147,
-0.078316794670,
--0.319800326996,
--0.944242675654,
-0.097280928771,
--0.349673758507,
--0.931807213703,
-0.115685441369,
--0.380001185903,
--0.917723257506,
-0.133670273785,
--0.410200534195,
--0.902146207470,
-0.150180213154,
--0.440959795116,
--0.884873077152,
-0.000000002691,
--0.146353307429,
--0.989232383924,
-0.019688055771,
--0.175377500770,
--0.984304380100,
-0.039357864070,
--0.204456782556,
--0.978084036575,
-0.058970355447,
--0.233674348299,
--0.970525010562,
-0.078459572239,
--0.263124478738,
--0.961566224559,
-0.097719921834,
--0.292907544136,
--0.951134053362,
-0.116589036680,
--0.323123020940,
--0.939147757206,
-0.134973426781,
--0.353652818509,
--0.925587304377,
-0.152950129784,
--0.384079218133,
--0.910543470680,
-0.169804626320,
--0.414870075375,
--0.893895524901,
-0.184667135868,
--0.446279695426,
--0.875632618386,
-0.000000003740,
--0.088042912258,
--0.996116682724,
-0.019684870484,
--0.117313956730,
--0.992899764040,
-0.039348477165,
--0.146628827637,
--0.988408662574,
-0.058968053940,
--0.176047039993,
--0.982613967092,
-0.078504376625,
--0.205634077507,
--0.975475109379,
-0.097895326512,
--0.235458696468,
--0.966941418755,
-0.117047594982,
--0.265588960246,
--0.956954734930,
-0.135825384888,
--0.296088345249,
--0.945453942097,
-0.154177066117,
--0.326809463320,
--0.932429625746,
-0.172133867007,
--0.357451614055,
--0.917931520016,
-0.189196216957,
--0.388327576942,
--0.901890505813,
-0.204709273173,
--0.419675659885,
--0.884288671180,
--0.000000000087,
--0.029376741022,
--0.999568410409,
-0.019694483889,
--0.058762963205,
--0.998077673059,
-0.039356004853,
--0.088201583622,
--0.995324864317,
-0.058973203238,
--0.117738290124,
--0.991292013656,
-0.078523818288,
--0.147421224225,
--0.985951820633,
-0.097970471263,
--0.177299790028,
--0.979268385692,
-0.117256069050,
--0.207422447354,
--0.971198714273,
-0.136298539866,
--0.237833922391,
--0.961695239351,
-0.154983699593,
--0.268572826219,
--0.950709571782,
-0.173289014429,
--0.299474031489,
--0.938235696369,
-0.191214113498,
--0.330320463271,
--0.924297330053,
-0.208402726185,
--0.361313279637,
--0.908856984171,
-0.224342094899,
--0.392668322157,
--0.891898095766,
-0.238587557852,
--0.424358862210,
--0.873496155288,
-0.493811020516,
--0.293008369884,
--0.818716538977,
-0.039393486630,
--0.029428228917,
--0.998790334632,
-0.059008988066,
--0.058968812703,
--0.996514233945,
-0.078558789119,
--0.088660263368,
--0.992959150394,
-0.098023120043,
--0.118539384056,
--0.988099125779,
-0.117367516186,
--0.148641426540,
--0.981901518718,
-0.136540570086,
--0.178998184851,
--0.974328652222,
-0.155469694342,
--0.209636938687,
--0.965340110054,
-0.174057502784,
--0.240578733861,
--0.954895731762,
-0.192301592617,
--0.271648405172,
--0.942988463049,
-0.210182205485,
--0.302687379130,
--0.929625618738,
-0.227441686350,
--0.333816260608,
--0.914787944534,
-0.243665594511,
--0.365227414984,
--0.898463139698,
-0.258507913144,
--0.396901516376,
--0.880705878907,
-0.445412663918,
--0.321871270594,
--0.835467799492,
-0.463413972047,
--0.291487300666,
--0.836828921621,
-0.480874088680,
--0.260690726632,
--0.837138253746,
-0.078642309025,
--0.029577371671,
--0.996464031622,
-0.098103560514,
--0.059359642752,
--0.993404310554,
-0.117463757275,
--0.089372603636,
--0.989047422243,
-0.136692804730,
--0.119638525039,
--0.983362446131,
-0.155744443703,
--0.150175402964,
--0.976315019141,
-0.174555336751,
--0.180995591764,
--0.967869324947,
-0.193039492566,
--0.212107740505,
--0.957990637077,
-0.211206610157,
--0.243333597183,
--0.946668119411,
-0.229028851813,
--0.274552897957,
--0.933898544415,
-0.246317367191,
--0.305829296149,
--0.919671787235,
-0.262729299413,
--0.337331694510,
--0.903980443986,
-0.277993142192,
--0.369037874384,
--0.886865750925,
-0.291823142842,
--0.400889331264,
--0.868404857990,
-0.395457932296,
--0.349554481184,
--0.849367228276,
-0.414144178243,
--0.319833413713,
--0.852168520364,
-0.432315562263,
--0.289684964446,
--0.853923811589,
-0.450001607863,
--0.259090041364,
--0.854617401757,
-0.467235643358,
--0.228072714827,
--0.854209394896,
-0.117608045472,
--0.029809994679,
--0.992612568859,
-0.136842461347,
--0.059900253764,
--0.988780107188,
-0.155941265167,
--0.090277328605,
--0.983632210614,
-0.174860659307,
--0.120947565159,
--0.977136344790,
-0.193545243357,
--0.151910415236,
--0.969259234940,
-0.211920775522,
--0.183161624017,
--0.959969480968,
-0.229994865237,
--0.214530392685,
--0.949251848868,
-0.247744065310,
--0.245917026336,
--0.937095349611,
-0.265027429297,
--0.277347342105,
--0.923492779370,
-0.281556951503,
--0.308965977486,
--0.908441361793,
-0.297116903465,
--0.340744049693,
--0.891972554664,
-0.311470757091,
--0.372631798875,
--0.874146160516,
-0.344184862619,
--0.375927556003,
--0.860357630861,
-0.363419770045,
--0.346915901187,
--0.864624443469,
-0.382170005262,
--0.317484897866,
--0.867841821247,
-0.400475913266,
--0.287615987240,
--0.869997751019,
-0.418363525069,
--0.257291187727,
--0.871075889696,
-0.435846605441,
--0.226492243422,
--0.871056255471,
-0.452951760909,
--0.195271488757,
--0.869887204164,
-0.156162690230,
--0.030108866347,
--0.987272338490,
-0.175105803259,
--0.060549560681,
--0.982685966302,
-0.193879094531,
--0.091312151634,
--0.976766598358,
-0.212427087515,
--0.122383778116,
--0.969482822614,
-0.230687537400,
--0.153743470000,
--0.960804977881,
-0.248655473843,
--0.185240344280,
--0.950713663612,
-0.266316748126,
--0.216780185217,
--0.939192068197,
-0.283565584654,
--0.248367631212,
--0.926231115309,
-0.300158393592,
--0.280119561262,
--0.911832205044,
-0.315921105180,
--0.312000690982,
--0.896018651663,
-0.330659802180,
--0.343961774652,
--0.878836954617,
-0.349444438079,
--0.314859376408,
--0.882469352320,
-0.367858374127,
--0.285306743367,
--0.885031230395,
-0.385921457100,
--0.255288585759,
--0.886505706090,
-0.403643081381,
--0.224792107116,
--0.886871338714,
-0.421020657075,
--0.193800093972,
--0.886105597484,
-0.438081058513,
--0.162398635376,
--0.884144597563,
-0.194189680557,
--0.030458454429,
--0.980491025211,
-0.212793450024,
--0.061270255346,
--0.975174293876,
-0.231188559060,
--0.092414857302,
--0.968509857621,
-0.249316664217,
--0.123861367840,
--0.960468407862,
-0.267173598055,
--0.155469469146,
--0.951024454294,
-0.284735036464,
--0.187146661913,
--0.940160670282,
-0.301922737031,
--0.218891391377,
--0.927862715947,
-0.318535373208,
--0.250785732189,
--0.914134417110,
-0.334428759902,
--0.282792653065,
--0.898991501585,
-0.352651221277,
--0.253108167245,
--0.900873671391,
-0.370591708334,
--0.222938599190,
--0.901643037296,
-0.388246688098,
--0.192277873829,
--0.901273392715,
-0.405596191232,
--0.161114866532,
--0.899740923511,
-0.422683922704,
--0.129559923295,
--0.896968521055,
-0.231590728918,
--0.030830884021,
--0.972324632450,
-0.249817708512,
--0.062018386482,
--0.966304730534,
-0.267795649364,
--0.093532693308,
--0.958924984274,
-0.285527288979,
--0.125233952746,
--0.950152947861,
-0.302985162353,
--0.157030324571,
--0.939968865739,
-0.320087271301,
--0.188921433667,
--0.928360291402,
-0.336684617897,
--0.220960272596,
--0.915325093071,
-0.354598278240,
--0.190642070625,
--0.915377333113,
-0.372261671910,
--0.159827039411,
--0.914262853396,
-0.389654133093,
--0.128519443158,
--0.911949784415,
-0.406815601908,
--0.096842521471,
--0.908362588441,
-0.268289711562,
--0.031208162206,
--0.962832634097,
-0.286108058864,
--0.062768862639,
--0.956139241186,
-0.303698140129,
--0.094543065012,
--0.948065951577,
-0.321039542739,
--0.126439229612,
--0.938587626817,
-0.338048541845,
--0.158457960946,
--0.927692976135,
-0.355780514571,
--0.127507003618,
--0.925830540369,
-0.373262300183,
--0.096084793122,
--0.922736673051,
-0.390526636448,
--0.064318803462,
--0.918342004781,
-0.304225512844,
--0.031583051379,
--0.952076335280,
-0.321666096127,
--0.063407155387,
--0.944727714873,
-0.338876288061,
--0.095381422371,
--0.935983571254,
-0.356476085922,
--0.063875683064,
--0.932118392308,
-0.373865219175,
--0.032052995666,
--0.926929017434,
-0.339403642791,
--0.031848062368,
--0.940101520148,
-0.509740891866,
--0.858587033115,
--0.054704019281,
-0.533297886141,
--0.845456878655,
--0.028214020866,
-0.601482758764,
--0.796013182495,
--0.067686809675,
-0.517031948082,
--0.851514691953,
--0.087181959437,
-0.541502443142,
--0.838485074695,
--0.060974450259,
-0.636536089703,
--0.764556520153,
--0.101366335619,
-0.498443288263,
--0.855155644007,
--0.142348561315,
-0.524006836582,
--0.843371405732,
--0.118918069313,
-0.548872753512,
--0.830738198012,
--0.092804885731,
-0.572709175758,
--0.817104273010,
--0.065915150241,
-0.451437165961,
--0.865236842074,
--0.218104773694,
-0.478160087951,
--0.855929451995,
--0.196844363646,
-0.504523177166,
--0.845588746481,
--0.174459266100,
-0.530428048689,
--0.834274934605,
--0.150437424381,
-0.555596354883,
--0.822094202042,
--0.124393783647,
-0.579833815340,
--0.808868435677,
--0.097594059007,
-0.700386923272,
--0.693740005139,
--0.167877821581,
-0.456245351117,
--0.853789221030,
--0.250767114346,
-0.483363013715,
--0.844927722123,
--0.229035677050,
-0.510072452482,
--0.835057219956,
--0.206168699415,
-0.536257536616,
--0.824238695204,
--0.181819767216,
-0.561699814163,
--0.812529734802,
--0.155848480366,
-0.586250028573,
--0.799775054213,
--0.129115323093,
-0.608982280362,
--0.786838789936,
--0.100126424367,
-0.404537812807,
--0.855049731676,
--0.324405786587,
-0.432761095464,
--0.848707024008,
--0.303997075071,
-0.460602751467,
--0.841336350422,
--0.282839620277,
-0.488048481755,
--0.832949915435,
--0.260774074312,
-0.515046814922,
--0.823573709931,
--0.237598658979,
-0.541483068373,
--0.813262540847,
--0.213073053952,
-0.567184163723,
--0.802037815098,
--0.187182978860,
-0.592020299751,
--0.789775412530,
--0.160520286711,
-0.615419060923,
--0.777051321231,
--0.132100808574,
-0.378866273910,
--0.845531467814,
--0.376213879901,
-0.407783503179,
--0.840669571422,
--0.356352755315,
-0.436314161401,
--0.834788295906,
--0.335795255444,
-0.464453915600,
--0.827895394061,
--0.314438828355,
-0.492177671287,
--0.820003566332,
--0.292156278537,
-0.519427435938,
--0.811137061100,
--0.268796962230,
-0.546096639708,
--0.801342482213,
--0.244189857080,
-0.572044412140,
--0.790613876656,
--0.218391594571,
-0.597152269911,
--0.778857082594,
--0.191809310079,
-0.621038774494,
--0.766476261429,
--0.163783336271,
-0.643124058843,
--0.753976111300,
--0.133833734635,
-0.351838442497,
--0.833082078956,
--0.426830130267,
-0.381405273918,
--0.829682353884,
--0.407623856860,
-0.410583074670,
--0.825275966432,
--0.387738466010,
-0.439374092501,
--0.819868898485,
--0.367104067175,
-0.467766799964,
--0.813468177337,
--0.345635277874,
-0.495729662012,
--0.806085115764,
--0.323231942024,
-0.523203249555,
--0.797740348149,
--0.299781081107,
-0.550090552773,
--0.788471944630,
--0.275158820103,
-0.576273198705,
--0.778252558317,
--0.249463736698,
-0.601641470101,
--0.767013889272,
--0.222973619783,
-0.625926236622,
--0.755046458449,
--0.195246490087,
-0.648711338174,
--0.742736837361,
--0.165878238934,
-0.323571996298,
--0.817745743319,
--0.476017922451,
-0.353737616446,
--0.815773311537,
--0.457584530874,
-0.383512766566,
--0.812812516000,
--0.438467526408,
-0.412905547302,
--0.808868616354,
--0.418617451243,
-0.441913583782,
--0.803945533000,
--0.397974828901,
-0.470520244446,
--0.798048178665,
--0.376470190182,
-0.498690283857,
--0.791185291484,
--0.354025190242,
-0.526364968624,
--0.783373245969,
--0.330554499750,
-0.553456274327,
--0.774641918018,
--0.305967402278,
-0.579861548264,
--0.764946680982,
--0.280387517733,
-0.605479281861,
--0.754239827860,
--0.254002207286,
-0.630110240541,
--0.742731326260,
--0.226519892631,
-0.653442397248,
--0.730730853975,
--0.197599221982,
-0.675125976559,
--0.718513555359,
--0.167162156425,
-0.799003016669,
--0.505994649138,
--0.324905516107,
-0.355227301829,
--0.797435434069,
--0.487760486844,
-0.385163513944,
--0.794914821628,
--0.468785125491,
-0.414726779331,
--0.791438960936,
--0.449027916302,
-0.443911483977,
--0.787008109037,
--0.428439996620,
-0.472697284538,
--0.781623984221,
--0.406965876309,
-0.501046845689,
--0.775291633792,
--0.384545109183,
-0.528902593534,
--0.768023083918,
--0.361112986643,
-0.556183853652,
--0.759841040708,
--0.336602308061,
-0.582798919640,
--0.750686869491,
--0.311150515410,
-0.608654780313,
--0.740527365357,
--0.284883449080,
-0.633597340900,
--0.729513047729,
--0.257614290748,
-0.657383693382,
--0.717900629621,
--0.229053193964,
-0.679741136730,
--0.705901380163,
--0.199136205954,
-0.779455798212,
--0.552665008698,
--0.294974654495,
-0.779247787315,
--0.535376362503,
--0.325799073721,
-0.778070620261,
--0.517379894387,
--0.356264164309,
-0.386335970368,
--0.775975091849,
--0.498605229445,
-0.416026083287,
--0.772972327657,
--0.478994862918,
-0.445348939393,
--0.769041947555,
--0.458518053170,
-0.474281772040,
--0.764180865604,
--0.437132022797,
-0.502785535995,
--0.758389972150,
--0.414790736319,
-0.530804099515,
--0.751675777603,
--0.391446718345,
-0.558261487633,
--0.744055856019,
--0.367049035620,
-0.585073072463,
--0.735461508390,
--0.341739476145,
-0.611155203544,
--0.725866878871,
--0.315605119318,
-0.636383795645,
--0.715377871413,
--0.288531048127,
-0.660563635174,
--0.704212118406,
--0.260270966832,
-0.683476702310,
--0.692531867884,
--0.230779568776,
-0.704886406660,
--0.680524332915,
--0.200054457629,
-0.757178336382,
--0.597441831138,
--0.264091320040,
-0.758300940040,
--0.581180686131,
--0.295311182318,
-0.758470088709,
--0.564198671374,
--0.326194702215,
-0.757695269771,
--0.546462423634,
--0.356758598667,
-0.756003153045,
--0.527930440381,
--0.386973749375,
-0.416786057409,
--0.753448209260,
--0.508532376858,
-0.446207860485,
--0.750028876122,
--0.488216376440,
-0.475256867241,
--0.745701770764,
--0.466968713320,
-0.503890763968,
--0.740464432165,
--0.444754452126,
-0.532054174226,
--0.734317471273,
--0.421540279299,
-0.559675204568,
--0.727271290962,
--0.397290995034,
-0.586669904180,
--0.719256982207,
--0.372139512919,
-0.612966060638,
--0.710246570874,
--0.346153747729,
-0.638460328337,
--0.700312680099,
--0.319265656206,
-0.662991166580,
--0.689641762059,
--0.291267837325,
-0.686379326973,
--0.678358205594,
--0.262132722885,
-0.708427054342,
--0.666613279376,
--0.231857379516,
-0.732280310243,
--0.640119516756,
--0.232406005726,
-0.734654367436,
--0.624988892581,
--0.263954247091,
-0.736102349125,
--0.609122008085,
--0.295167259158,
-0.736643903423,
--0.592483236920,
--0.326066517015,
-0.736286048777,
--0.575040785130,
--0.356666440547,
-0.735024618451,
--0.556765963323,
--0.386976061735,
-0.732891345862,
--0.537619859446,
--0.416935440913,
-0.446476634126,
--0.729942906182,
--0.517534509858,
-0.475605014712,
--0.726167588495,
--0.496468028579,
-0.504345036577,
--0.721498236991,
--0.474422151778,
-0.532635680865,
--0.715933202766,
--0.451374435083,
-0.560406939592,
--0.709473131690,
--0.427307778383,
-0.587573355064,
--0.702058188152,
--0.402333012402,
-0.614071177784,
--0.693652731366,
--0.376513581272,
-0.639814347960,
--0.684303739574,
--0.349808507829,
-0.664664669428,
--0.674170257989,
--0.322048661629,
-0.688470879104,
--0.663347279653,
--0.293220454953,
-0.711065840907,
--0.651954164263,
--0.263327054430,
-0.712834204081,
--0.636507382151,
--0.294492359764,
-0.713746738620,
--0.620240751188,
--0.325372100332,
-0.713806638960,
--0.603125964757,
--0.355976337434,
-0.713008481544,
--0.585137025453,
--0.386307606307,
-0.711334601976,
--0.566251681186,
--0.416367767227,
-0.708830045070,
--0.546431413852,
--0.446063534893,
-0.475320368540,
--0.705551241990,
--0.525612016774,
-0.504134074319,
--0.701469401363,
--0.503775261462,
-0.532528907061,
--0.696504415944,
--0.480930932375,
-0.560433162842,
--0.690652200021,
--0.457071338626,
-0.587765434291,
--0.683850854635,
--0.432295966749,
-0.614454438910,
--0.676069940440,
--0.406663470374,
-0.640431668609,
--0.667336496990,
--0.380143759158,
-0.665576466359,
--0.657779645175,
--0.352610132898,
-0.689758528490,
--0.647472758312,
--0.324055858796,
-0.690240188967,
--0.630711224396,
--0.354643247441,
-0.689907310996,
--0.613040501717,
--0.384979539051,
-0.688745900523,
--0.594439277891,
--0.415055453419,
-0.686726880725,
--0.574894833844,
--0.444861912629,
-0.683916954789,
--0.554357033689,
--0.474284596157,
-0.503241112921,
--0.680359054357,
--0.532785078076,
-0.531720548403,
--0.676012829877,
--0.510176354066,
-0.559741694480,
--0.670791975688,
--0.486546360394,
-0.587226813659,
--0.664625657257,
--0.461992862538,
-0.614101661369,
--0.657483244315,
--0.436571795870,
-0.640295865946,
--0.649395550601,
--0.410251901778,
-0.665714723058,
--0.640451726038,
--0.382943199598,
-0.665064220782,
--0.622168319300,
--0.413032885730,
-0.663602297660,
--0.602912621107,
--0.442863818629,
-0.661304518580,
--0.582670499105,
--0.472410227639,
-0.658241473138,
--0.561398955062,
--0.501546983139,
-0.530186663847,
--0.654446960427,
--0.539074463749,
-0.558313987684,
--0.649875510950,
--0.515700796417,
-0.585936979856,
--0.644367810339,
--0.491393915953,
-0.612985588145,
--0.637885440141,
--0.466209002469,
-0.639388890937,
--0.630461315159,
--0.440114049122,
-0.637683355249,
--0.610524214804,
--0.469702162626,
-0.635159254074,
--0.589570333716,
--0.498978500105,
-0.631885373499,
--0.567566573620,
--0.527815364751,
-0.556122903246,
--0.627892878372,
--0.544497795931,
-0.583873834927,
--0.623061616905,
--0.520466681381,
-0.611082217190,
--0.617262952030,
--0.495545125983,
-0.608373477124,
--0.595600248780,
--0.524539851666,
-0.604926632717,
--0.572873638477,
--0.553063796833,
-0.581014692318,
--0.600697877351,
--0.549166629956,
--0.509740891866,
--0.858587033115,
-0.054704019281,
--0.533297886141,
--0.845456878655,
-0.028214020866,
--0.601482758764,
--0.796013182495,
-0.067686809675,
--0.517031948082,
--0.851514691953,
-0.087181959437,
--0.541502443142,
--0.838485074695,
-0.060974450259,
--0.636536089703,
--0.764556520153,
-0.101366335619,
--0.498443288263,
--0.855155644007,
-0.142348561315,
--0.524006836582,
--0.843371405732,
-0.118918069313,
--0.548872753512,
--0.830738198012,
-0.092804885731,
--0.572709175758,
--0.817104273010,
-0.065915150241,
--0.451437165961,
--0.865236842074,
-0.218104773694,
--0.478160087951,
--0.855929451995,
-0.196844363646,
--0.504523177166,
--0.845588746481,
-0.174459266100,
--0.530428048689,
--0.834274934605,
-0.150437424381,
--0.555596354883,
--0.822094202042,
-0.124393783647,
--0.579833815340,
--0.808868435677,
-0.097594059007,
--0.700386923272,
--0.693740005139,
-0.167877821581,
--0.456245351117,
--0.853789221030,
-0.250767114346,
--0.483363013715,
--0.844927722123,
-0.229035677050,
--0.510072452482,
--0.835057219956,
-0.206168699415,
--0.536257536616,
--0.824238695204,
-0.181819767216,
--0.561699814163,
--0.812529734802,
-0.155848480366,
--0.586250028573,
--0.799775054213,
-0.129115323093,
--0.608982280362,
--0.786838789936,
-0.100126424367,
--0.404537812807,
--0.855049731676,
-0.324405786587,
--0.432761095464,
--0.848707024008,
-0.303997075071,
--0.460602751467,
--0.841336350422,
-0.282839620277,
--0.488048481755,
--0.832949915435,
-0.260774074312,
--0.515046814922,
--0.823573709931,
-0.237598658979,
--0.541483068373,
--0.813262540847,
-0.213073053952,
--0.567184163723,
--0.802037815098,
-0.187182978860,
--0.592020299751,
--0.789775412530,
-0.160520286711,
--0.615419060923,
--0.777051321231,
-0.132100808574,
--0.378866273910,
--0.845531467814,
-0.376213879901,
--0.407783503179,
--0.840669571422,
-0.356352755315,
--0.436314161401,
--0.834788295906,
-0.335795255444,
--0.464453915600,
--0.827895394061,
-0.314438828355,
--0.492177671287,
--0.820003566332,
-0.292156278537,
--0.519427435938,
--0.811137061100,
-0.268796962230,
--0.546096639708,
--0.801342482213,
-0.244189857080,
--0.572044412140,
--0.790613876656,
-0.218391594571,
--0.597152269911,
--0.778857082594,
-0.191809310079,
--0.621038774494,
--0.766476261429,
-0.163783336271,
--0.643124058843,
--0.753976111300,
-0.133833734635,
--0.351838442497,
--0.833082078956,
-0.426830130267,
--0.381405273918,
--0.829682353884,
-0.407623856860,
--0.410583074670,
--0.825275966432,
-0.387738466010,
--0.439374092501,
--0.819868898485,
-0.367104067175,
--0.467766799964,
--0.813468177337,
-0.345635277874,
--0.495729662012,
--0.806085115764,
-0.323231942024,
--0.523203249555,
--0.797740348149,
-0.299781081107,
--0.550090552773,
--0.788471944630,
-0.275158820103,
--0.576273198705,
--0.778252558317,
-0.249463736698,
--0.601641470101,
--0.767013889272,
-0.222973619783,
--0.625926236622,
--0.755046458449,
-0.195246490087,
--0.648711338174,
--0.742736837361,
-0.165878238934,
--0.323571996298,
--0.817745743319,
-0.476017922451,
--0.353737616446,
--0.815773311537,
-0.457584530874,
--0.383512766566,
--0.812812516000,
-0.438467526408,
--0.412905547302,
--0.808868616354,
-0.418617451243,
--0.441913583782,
--0.803945533000,
-0.397974828901,
--0.470520244446,
--0.798048178665,
-0.376470190182,
--0.498690283857,
--0.791185291484,
-0.354025190242,
--0.526364968624,
--0.783373245969,
-0.330554499750,
--0.553456274327,
--0.774641918018,
-0.305967402278,
--0.579861548264,
--0.764946680982,
-0.280387517733,
--0.605479281861,
--0.754239827860,
-0.254002207286,
--0.630110240541,
--0.742731326260,
-0.226519892631,
--0.653442397248,
--0.730730853975,
-0.197599221982,
--0.675125976559,
--0.718513555359,
-0.167162156425,
--0.799003016669,
--0.505994649138,
-0.324905516107,
--0.355227301829,
--0.797435434069,
-0.487760486844,
--0.385163513944,
--0.794914821628,
-0.468785125491,
--0.414726779331,
--0.791438960936,
-0.449027916302,
--0.443911483977,
--0.787008109037,
-0.428439996620,
--0.472697284538,
--0.781623984221,
-0.406965876309,
--0.501046845689,
--0.775291633792,
-0.384545109183,
--0.528902593534,
--0.768023083918,
-0.361112986643,
--0.556183853652,
--0.759841040708,
-0.336602308061,
--0.582798919640,
--0.750686869491,
-0.311150515410,
--0.608654780313,
--0.740527365357,
-0.284883449080,
--0.633597340900,
--0.729513047729,
-0.257614290748,
--0.657383693382,
--0.717900629621,
-0.229053193964,
--0.679741136730,
--0.705901380163,
-0.199136205954,
--0.779455798212,
--0.552665008698,
-0.294974654495,
--0.779247787315,
--0.535376362503,
-0.325799073721,
--0.778070620261,
--0.517379894387,
-0.356264164309,
--0.386335970368,
--0.775975091849,
-0.498605229445,
--0.416026083287,
--0.772972327657,
-0.478994862918,
--0.445348939393,
--0.769041947555,
-0.458518053170,
--0.474281772040,
--0.764180865604,
-0.437132022797,
--0.502785535995,
--0.758389972150,
-0.414790736319,
--0.530804099515,
--0.751675777603,
-0.391446718345,
--0.558261487633,
--0.744055856019,
-0.367049035620,
--0.585073072463,
--0.735461508390,
-0.341739476145,
--0.611155203544,
--0.725866878871,
-0.315605119318,
--0.636383795645,
--0.715377871413,
-0.288531048127,
--0.660563635174,
--0.704212118406,
-0.260270966832,
--0.683476702310,
--0.692531867884,
-0.230779568776,
--0.704886406660,
--0.680524332915,
-0.200054457629,
--0.757178336382,
--0.597441831138,
-0.264091320040,
--0.758300940040,
--0.581180686131,
-0.295311182318,
--0.758470088709,
--0.564198671374,
-0.326194702215,
--0.757695269771,
--0.546462423634,
-0.356758598667,
--0.756003153045,
--0.527930440381,
-0.386973749375,
--0.416786057409,
--0.753448209260,
-0.508532376858,
--0.446207860485,
--0.750028876122,
-0.488216376440,
--0.475256867241,
--0.745701770764,
-0.466968713320,
--0.503890763968,
--0.740464432165,
-0.444754452126,
--0.532054174226,
--0.734317471273,
-0.421540279299,
--0.559675204568,
--0.727271290962,
-0.397290995034,
--0.586669904180,
--0.719256982207,
-0.372139512919,
--0.612966060638,
--0.710246570874,
-0.346153747729,
--0.638460328337,
--0.700312680099,
-0.319265656206,
--0.662991166580,
--0.689641762059,
-0.291267837325,
--0.686379326973,
--0.678358205594,
-0.262132722885,
--0.708427054342,
--0.666613279376,
-0.231857379516,
--0.732280310243,
--0.640119516756,
-0.232406005726,
--0.734654367436,
--0.624988892581,
-0.263954247091,
--0.736102349125,
--0.609122008085,
-0.295167259158,
--0.736643903423,
--0.592483236920,
-0.326066517015,
--0.736286048777,
--0.575040785130,
-0.356666440547,
--0.735024618451,
--0.556765963323,
-0.386976061735,
--0.732891345862,
--0.537619859446,
-0.416935440913,
--0.446476634126,
--0.729942906182,
-0.517534509858,
--0.475605014712,
--0.726167588495,
-0.496468028579,
--0.504345036577,
--0.721498236991,
-0.474422151778,
--0.532635680865,
--0.715933202766,
-0.451374435083,
--0.560406939592,
--0.709473131690,
-0.427307778383,
--0.587573355064,
--0.702058188152,
-0.402333012402,
--0.614071177784,
--0.693652731366,
-0.376513581272,
--0.639814347960,
--0.684303739574,
-0.349808507829,
--0.664664669428,
--0.674170257989,
-0.322048661629,
--0.688470879104,
--0.663347279653,
-0.293220454953,
--0.711065840907,
--0.651954164263,
-0.263327054430,
--0.712834204081,
--0.636507382151,
-0.294492359764,
--0.713746738620,
--0.620240751188,
-0.325372100332,
--0.713806638960,
--0.603125964757,
-0.355976337434,
--0.713008481544,
--0.585137025453,
-0.386307606307,
--0.711334601976,
--0.566251681186,
-0.416367767227,
--0.708830045070,
--0.546431413852,
-0.446063534893,
--0.475320368540,
--0.705551241990,
-0.525612016774,
--0.504134074319,
--0.701469401363,
-0.503775261462,
--0.532528907061,
--0.696504415944,
-0.480930932375,
--0.560433162842,
--0.690652200021,
-0.457071338626,
--0.587765434291,
--0.683850854635,
-0.432295966749,
--0.614454438910,
--0.676069940440,
-0.406663470374,
--0.640431668609,
--0.667336496990,
-0.380143759158,
--0.665576466359,
--0.657779645175,
-0.352610132898,
--0.689758528490,
--0.647472758312,
-0.324055858796,
--0.690240188967,
--0.630711224396,
-0.354643247441,
--0.689907310996,
--0.613040501717,
-0.384979539051,
--0.688745900523,
--0.594439277891,
-0.415055453419,
--0.686726880725,
--0.574894833844,
-0.444861912629,
--0.683916954789,
--0.554357033689,
-0.474284596157,
--0.503241112921,
--0.680359054357,
-0.532785078076,
--0.531720548403,
--0.676012829877,
-0.510176354066,
--0.559741694480,
--0.670791975688,
-0.486546360394,
--0.587226813659,
--0.664625657257,
-0.461992862538,
--0.614101661369,
--0.657483244315,
-0.436571795870,
--0.640295865946,
--0.649395550601,
-0.410251901778,
--0.665714723058,
--0.640451726038,
-0.382943199598,
--0.665064220782,
--0.622168319300,
-0.413032885730,
--0.663602297660,
--0.602912621107,
-0.442863818629,
--0.661304518580,
--0.582670499105,
-0.472410227639,
--0.658241473138,
--0.561398955062,
-0.501546983139,
--0.530186663847,
--0.654446960427,
-0.539074463749,
--0.558313987684,
--0.649875510950,
-0.515700796417,
--0.585936979856,
--0.644367810339,
-0.491393915953,
--0.612985588145,
--0.637885440141,
-0.466209002469,
--0.639388890937,
--0.630461315159,
-0.440114049122,
--0.637683355249,
--0.610524214804,
-0.469702162626,
--0.635159254074,
--0.589570333716,
-0.498978500105,
--0.631885373499,
--0.567566573620,
-0.527815364751,
--0.556122903246,
--0.627892878372,
-0.544497795931,
--0.583873834927,
--0.623061616905,
-0.520466681381,
--0.611082217190,
--0.617262952030,
-0.495545125983,
--0.608373477124,
--0.595600248780,
-0.524539851666,
--0.604926632717,
--0.572873638477,
-0.553063796833,
--0.581014692318,
--0.600697877351,
-0.549166629956,
--0.475931949057,
--0.879482108895,
--0.000000000692,
--0.505083864225,
--0.862894103158,
-0.017437225552,
--0.491963201198,
--0.863699991504,
-0.109519556901,
--0.451116798027,
--0.892252495060,
-0.019470993726,
--0.480527992700,
--0.876169357514,
-0.037684283003,
--0.472521914566,
--0.865922855025,
-0.164014174390,
--0.398316865736,
--0.917037176300,
-0.019659393505,
--0.426412776219,
--0.903687852136,
-0.038992437454,
--0.456067868101,
--0.888094771519,
-0.057356573187,
--0.485527217684,
--0.870985686306,
-0.075148221129,
--0.316641002868,
--0.948545452418,
--0.000000000256,
--0.344326355191,
--0.938643247681,
-0.019703164800,
--0.372422370397,
--0.927231535005,
-0.039284329194,
--0.401312724204,
--0.914072593605,
-0.058475559104,
--0.431202571884,
--0.898973787924,
-0.076879585234,
--0.460915748221,
--0.882363843033,
-0.094819415468,
--0.428754902264,
--0.861617826555,
-0.271632020843,
--0.289083197335,
--0.957101113700,
-0.019706932107,
--0.317484776960,
--0.947446110431,
-0.039360948013,
--0.346289116948,
--0.936280888107,
-0.058838304270,
--0.375737250957,
--0.923445687626,
-0.077907510865,
--0.405851334406,
--0.908849392386,
-0.096319656975,
--0.435812607099,
--0.892750493863,
-0.114297538032,
--0.466633719206,
--0.874815038980,
-0.130198385834,
--0.204044010104,
--0.978961716279,
-0.000000000719,
--0.232706641423,
--0.972347476206,
-0.019697831168,
--0.261466546513,
--0.964409293475,
-0.039369527730,
--0.290449262399,
--0.955072949147,
-0.058948178756,
--0.319800326996,
--0.944242675654,
-0.078316794670,
--0.349673758507,
--0.931807213703,
-0.097280928771,
--0.380001185903,
--0.917723257506,
-0.115685441369,
--0.410200534195,
--0.902146207470,
-0.133670273785,
--0.440959795116,
--0.884873077152,
-0.150180213154,
--0.146353307429,
--0.989232383924,
-0.000000002691,
--0.175377500770,
--0.984304380100,
-0.019688055771,
--0.204456782556,
--0.978084036575,
-0.039357864070,
--0.233674348299,
--0.970525010562,
-0.058970355447,
--0.263124478738,
--0.961566224559,
-0.078459572239,
--0.292907544136,
--0.951134053362,
-0.097719921834,
--0.323123020940,
--0.939147757206,
-0.116589036680,
--0.353652818509,
--0.925587304377,
-0.134973426781,
--0.384079218133,
--0.910543470680,
-0.152950129784,
--0.414870075375,
--0.893895524901,
-0.169804626320,
--0.446279695426,
--0.875632618386,
-0.184667135868,
--0.088042912258,
--0.996116682724,
-0.000000003740,
--0.117313956730,
--0.992899764040,
-0.019684870484,
--0.146628827637,
--0.988408662574,
-0.039348477165,
--0.176047039993,
--0.982613967092,
-0.058968053940,
--0.205634077507,
--0.975475109379,
-0.078504376625,
--0.235458696468,
--0.966941418755,
-0.097895326512,
--0.265588960246,
--0.956954734930,
-0.117047594982,
--0.296088345249,
--0.945453942097,
-0.135825384888,
--0.326809463320,
--0.932429625746,
-0.154177066117,
--0.357451614055,
--0.917931520016,
-0.172133867007,
--0.388327576942,
--0.901890505813,
-0.189196216957,
--0.419675659885,
--0.884288671180,
-0.204709273173,
--0.029376741022,
--0.999568410409,
--0.000000000087,
--0.058762963205,
--0.998077673059,
-0.019694483889,
--0.088201583622,
--0.995324864317,
-0.039356004853,
--0.117738290124,
--0.991292013656,
-0.058973203238,
--0.147421224225,
--0.985951820633,
-0.078523818288,
--0.177299790028,
--0.979268385692,
-0.097970471263,
--0.207422447354,
--0.971198714273,
-0.117256069050,
--0.237833922391,
--0.961695239351,
-0.136298539866,
--0.268572826219,
--0.950709571782,
-0.154983699593,
--0.299474031489,
--0.938235696369,
-0.173289014429,
--0.330320463271,
--0.924297330053,
-0.191214113498,
--0.361313279637,
--0.908856984171,
-0.208402726185,
--0.392668322157,
--0.891898095766,
-0.224342094899,
--0.424358862210,
--0.873496155288,
-0.238587557852,
--0.293008369884,
--0.818716538977,
-0.493811020516,
--0.029428228917,
--0.998790334632,
-0.039393486630,
--0.058968812703,
--0.996514233945,
-0.059008988066,
--0.088660263368,
--0.992959150394,
-0.078558789119,
--0.118539384056,
--0.988099125779,
-0.098023120043,
--0.148641426540,
--0.981901518718,
-0.117367516186,
--0.178998184851,
--0.974328652222,
-0.136540570086,
--0.209636938687,
--0.965340110054,
-0.155469694342,
--0.240578733861,
--0.954895731762,
-0.174057502784,
--0.271648405172,
--0.942988463049,
-0.192301592617,
--0.302687379130,
--0.929625618738,
-0.210182205485,
--0.333816260608,
--0.914787944534,
-0.227441686350,
--0.365227414984,
--0.898463139698,
-0.243665594511,
--0.396901516376,
--0.880705878907,
-0.258507913144,
--0.321871270594,
--0.835467799492,
-0.445412663918,
--0.291487300666,
--0.836828921621,
-0.463413972047,
--0.260690726632,
--0.837138253746,
-0.480874088680,
--0.029577371671,
--0.996464031622,
-0.078642309025,
--0.059359642752,
--0.993404310554,
-0.098103560514,
--0.089372603636,
--0.989047422243,
-0.117463757275,
--0.119638525039,
--0.983362446131,
-0.136692804730,
--0.150175402964,
--0.976315019141,
-0.155744443703,
--0.180995591764,
--0.967869324947,
-0.174555336751,
--0.212107740505,
--0.957990637077,
-0.193039492566,
--0.243333597183,
--0.946668119411,
-0.211206610157,
--0.274552897957,
--0.933898544415,
-0.229028851813,
--0.305829296149,
--0.919671787235,
-0.246317367191,
--0.337331694510,
--0.903980443986,
-0.262729299413,
--0.369037874384,
--0.886865750925,
-0.277993142192,
--0.400889331264,
--0.868404857990,
-0.291823142842,
--0.349554481184,
--0.849367228276,
-0.395457932296,
--0.319833413713,
--0.852168520364,
-0.414144178243,
--0.289684964446,
--0.853923811589,
-0.432315562263,
--0.259090041364,
--0.854617401757,
-0.450001607863,
--0.228072714827,
--0.854209394896,
-0.467235643358,
--0.029809994679,
--0.992612568859,
-0.117608045472,
--0.059900253764,
--0.988780107188,
-0.136842461347,
--0.090277328605,
--0.983632210614,
-0.155941265167,
--0.120947565159,
--0.977136344790,
-0.174860659307,
--0.151910415236,
--0.969259234940,
-0.193545243357,
--0.183161624017,
--0.959969480968,
-0.211920775522,
--0.214530392685,
--0.949251848868,
-0.229994865237,
--0.245917026336,
--0.937095349611,
-0.247744065310,
--0.277347342105,
--0.923492779370,
-0.265027429297,
--0.308965977486,
--0.908441361793,
-0.281556951503,
--0.340744049693,
--0.891972554664,
-0.297116903465,
--0.372631798875,
--0.874146160516,
-0.311470757091,
--0.375927556003,
--0.860357630861,
-0.344184862619,
--0.346915901187,
--0.864624443469,
-0.363419770045,
--0.317484897866,
--0.867841821247,
-0.382170005262,
--0.287615987240,
--0.869997751019,
-0.400475913266,
--0.257291187727,
--0.871075889696,
-0.418363525069,
--0.226492243422,
--0.871056255471,
-0.435846605441,
--0.195271488757,
--0.869887204164,
-0.452951760909,
--0.030108866347,
--0.987272338490,
-0.156162690230,
--0.060549560681,
--0.982685966302,
-0.175105803259,
--0.091312151634,
--0.976766598358,
-0.193879094531,
--0.122383778116,
--0.969482822614,
-0.212427087515,
--0.153743470000,
--0.960804977881,
-0.230687537400,
--0.185240344280,
--0.950713663612,
-0.248655473843,
--0.216780185217,
--0.939192068197,
-0.266316748126,
--0.248367631212,
--0.926231115309,
-0.283565584654,
--0.280119561262,
--0.911832205044,
-0.300158393592,
--0.312000690982,
--0.896018651663,
-0.315921105180,
--0.343961774652,
--0.878836954617,
-0.330659802180,
--0.314859376408,
--0.882469352320,
-0.349444438079,
--0.285306743367,
--0.885031230395,
-0.367858374127,
--0.255288585759,
--0.886505706090,
-0.385921457100,
--0.224792107116,
--0.886871338714,
-0.403643081381,
--0.193800093972,
--0.886105597484,
-0.421020657075,
--0.162398635376,
--0.884144597563,
-0.438081058513,
--0.030458454429,
--0.980491025211,
-0.194189680557,
--0.061270255346,
--0.975174293876,
-0.212793450024,
--0.092414857302,
--0.968509857621,
-0.231188559060,
--0.123861367840,
--0.960468407862,
-0.249316664217,
--0.155469469146,
--0.951024454294,
-0.267173598055,
--0.187146661913,
--0.940160670282,
-0.284735036464,
--0.218891391377,
--0.927862715947,
-0.301922737031,
--0.250785732189,
--0.914134417110,
-0.318535373208,
--0.282792653065,
--0.898991501585,
-0.334428759902,
--0.253108167245,
--0.900873671391,
-0.352651221277,
--0.222938599190,
--0.901643037296,
-0.370591708334,
--0.192277873829,
--0.901273392715,
-0.388246688098,
--0.161114866532,
--0.899740923511,
-0.405596191232,
--0.129559923295,
--0.896968521055,
-0.422683922704,
--0.030830884021,
--0.972324632450,
-0.231590728918,
--0.062018386482,
--0.966304730534,
-0.249817708512,
--0.093532693308,
--0.958924984274,
-0.267795649364,
--0.125233952746,
--0.950152947861,
-0.285527288979,
--0.157030324571,
--0.939968865739,
-0.302985162353,
--0.188921433667,
--0.928360291402,
-0.320087271301,
--0.220960272596,
--0.915325093071,
-0.336684617897,
--0.190642070625,
--0.915377333113,
-0.354598278240,
--0.159827039411,
--0.914262853396,
-0.372261671910,
--0.128519443158,
--0.911949784415,
-0.389654133093,
--0.096842521471,
--0.908362588441,
-0.406815601908,
--0.031208162206,
--0.962832634097,
-0.268289711562,
--0.062768862639,
--0.956139241186,
-0.286108058864,
--0.094543065012,
--0.948065951577,
-0.303698140129,
--0.126439229612,
--0.938587626817,
-0.321039542739,
--0.158457960946,
--0.927692976135,
-0.338048541845,
--0.127507003618,
--0.925830540369,
-0.355780514571,
--0.096084793122,
--0.922736673051,
-0.373262300183,
--0.064318803462,
--0.918342004781,
-0.390526636448,
--0.031583051379,
--0.952076335280,
-0.304225512844,
--0.063407155387,
--0.944727714873,
-0.321666096127,
--0.095381422371,
--0.935983571254,
-0.338876288061,
--0.063875683064,
--0.932118392308,
-0.356476085922,
--0.032052995666,
--0.926929017434,
-0.373865219175,
--0.031848062368,
--0.940101520148,
-0.339403642791,
-0.475931949057,
-0.879482108895,
--0.000000000692,
-0.505083864225,
-0.862894103158,
-0.017437225552,
-0.491963201198,
-0.863699991504,
-0.109519556901,
-0.451116798027,
-0.892252495060,
-0.019470993726,
-0.480527992700,
-0.876169357514,
-0.037684283003,
-0.472521914566,
-0.865922855025,
-0.164014174390,
-0.398316865736,
-0.917037176300,
-0.019659393505,
-0.426412776219,
-0.903687852136,
-0.038992437454,
-0.456067868101,
-0.888094771519,
-0.057356573187,
-0.485527217684,
-0.870985686306,
-0.075148221129,
-0.316641002868,
-0.948545452418,
--0.000000000256,
-0.344326355191,
-0.938643247681,
-0.019703164800,
-0.372422370397,
-0.927231535005,
-0.039284329194,
-0.401312724204,
-0.914072593605,
-0.058475559104,
-0.431202571884,
-0.898973787924,
-0.076879585234,
-0.460915748221,
-0.882363843033,
-0.094819415468,
-0.428754902264,
-0.861617826555,
-0.271632020843,
-0.289083197335,
-0.957101113700,
-0.019706932107,
-0.317484776960,
-0.947446110431,
-0.039360948013,
-0.346289116948,
-0.936280888107,
-0.058838304270,
-0.375737250957,
-0.923445687626,
-0.077907510865,
-0.405851334406,
-0.908849392386,
-0.096319656975,
-0.435812607099,
-0.892750493863,
-0.114297538032,
-0.466633719206,
-0.874815038980,
-0.130198385834,
-0.204044010104,
-0.978961716279,
-0.000000000719,
-0.232706641423,
-0.972347476206,
-0.019697831168,
-0.261466546513,
-0.964409293475,
-0.039369527730,
-0.290449262399,
-0.955072949147,
-0.058948178756,
-0.319800326996,
-0.944242675654,
-0.078316794670,
-0.349673758507,
-0.931807213703,
-0.097280928771,
-0.380001185903,
-0.917723257506,
-0.115685441369,
-0.410200534195,
-0.902146207470,
-0.133670273785,
-0.440959795116,
-0.884873077152,
-0.150180213154,
-0.146353307429,
-0.989232383924,
-0.000000002691,
-0.175377500770,
-0.984304380100,
-0.019688055771,
-0.204456782556,
-0.978084036575,
-0.039357864070,
-0.233674348299,
-0.970525010562,
-0.058970355447,
-0.263124478738,
-0.961566224559,
-0.078459572239,
-0.292907544136,
-0.951134053362,
-0.097719921834,
-0.323123020940,
-0.939147757206,
-0.116589036680,
-0.353652818509,
-0.925587304377,
-0.134973426781,
-0.384079218133,
-0.910543470680,
-0.152950129784,
-0.414870075375,
-0.893895524901,
-0.169804626320,
-0.446279695426,
-0.875632618386,
-0.184667135868,
-0.088042912258,
-0.996116682724,
-0.000000003740,
-0.117313956730,
-0.992899764040,
-0.019684870484,
-0.146628827637,
-0.988408662574,
-0.039348477165,
-0.176047039993,
-0.982613967092,
-0.058968053940,
-0.205634077507,
-0.975475109379,
-0.078504376625,
-0.235458696468,
-0.966941418755,
-0.097895326512,
-0.265588960246,
-0.956954734930,
-0.117047594982,
-0.296088345249,
-0.945453942097,
-0.135825384888,
-0.326809463320,
-0.932429625746,
-0.154177066117,
-0.357451614055,
-0.917931520016,
-0.172133867007,
-0.388327576942,
-0.901890505813,
-0.189196216957,
-0.419675659885,
-0.884288671180,
-0.204709273173,
-0.029376741022,
-0.999568410409,
--0.000000000087,
-0.058762963205,
-0.998077673059,
-0.019694483889,
-0.088201583622,
-0.995324864317,
-0.039356004853,
-0.117738290124,
-0.991292013656,
-0.058973203238,
-0.147421224225,
-0.985951820633,
-0.078523818288,
-0.177299790028,
-0.979268385692,
-0.097970471263,
-0.207422447354,
-0.971198714273,
-0.117256069050,
-0.237833922391,
-0.961695239351,
-0.136298539866,
-0.268572826219,
-0.950709571782,
-0.154983699593,
-0.299474031489,
-0.938235696369,
-0.173289014429,
-0.330320463271,
-0.924297330053,
-0.191214113498,
-0.361313279637,
-0.908856984171,
-0.208402726185,
-0.392668322157,
-0.891898095766,
-0.224342094899,
-0.424358862210,
-0.873496155288,
-0.238587557852,
-0.293008369884,
-0.818716538977,
-0.493811020516,
-0.029428228917,
-0.998790334632,
-0.039393486630,
-0.058968812703,
-0.996514233945,
-0.059008988066,
-0.088660263368,
-0.992959150394,
-0.078558789119,
-0.118539384056,
-0.988099125779,
-0.098023120043,
-0.148641426540,
-0.981901518718,
-0.117367516186,
-0.178998184851,
-0.974328652222,
-0.136540570086,
-0.209636938687,
-0.965340110054,
-0.155469694342,
-0.240578733861,
-0.954895731762,
-0.174057502784,
-0.271648405172,
-0.942988463049,
-0.192301592617,
-0.302687379130,
-0.929625618738,
-0.210182205485,
-0.333816260608,
-0.914787944534,
-0.227441686350,
-0.365227414984,
-0.898463139698,
-0.243665594511,
-0.396901516376,
-0.880705878907,
-0.258507913144,
-0.321871270594,
-0.835467799492,
-0.445412663918,
-0.291487300666,
-0.836828921621,
-0.463413972047,
-0.260690726632,
-0.837138253746,
-0.480874088680,
-0.029577371671,
-0.996464031622,
-0.078642309025,
-0.059359642752,
-0.993404310554,
-0.098103560514,
-0.089372603636,
-0.989047422243,
-0.117463757275,
-0.119638525039,
-0.983362446131,
-0.136692804730,
-0.150175402964,
-0.976315019141,
-0.155744443703,
-0.180995591764,
-0.967869324947,
-0.174555336751,
-0.212107740505,
-0.957990637077,
-0.193039492566,
-0.243333597183,
-0.946668119411,
-0.211206610157,
-0.274552897957,
-0.933898544415,
-0.229028851813,
-0.305829296149,
-0.919671787235,
-0.246317367191,
-0.337331694510,
-0.903980443986,
-0.262729299413,
-0.369037874384,
-0.886865750925,
-0.277993142192,
-0.400889331264,
-0.868404857990,
-0.291823142842,
-0.349554481184,
-0.849367228276,
-0.395457932296,
-0.319833413713,
-0.852168520364,
-0.414144178243,
-0.289684964446,
-0.853923811589,
-0.432315562263,
-0.259090041364,
-0.854617401757,
-0.450001607863,
-0.228072714827,
-0.854209394896,
-0.467235643358,
-0.029809994679,
-0.992612568859,
-0.117608045472,
-0.059900253764,
-0.988780107188,
-0.136842461347,
-0.090277328605,
-0.983632210614,
-0.155941265167,
-0.120947565159,
-0.977136344790,
-0.174860659307,
-0.151910415236,
-0.969259234940,
-0.193545243357,
-0.183161624017,
-0.959969480968,
-0.211920775522,
-0.214530392685,
-0.949251848868,
-0.229994865237,
-0.245917026336,
-0.937095349611,
-0.247744065310,
-0.277347342105,
-0.923492779370,
-0.265027429297,
-0.308965977486,
-0.908441361793,
-0.281556951503,
-0.340744049693,
-0.891972554664,
-0.297116903465,
-0.372631798875,
-0.874146160516,
-0.311470757091,
-0.375927556003,
-0.860357630861,
-0.344184862619,
-0.346915901187,
-0.864624443469,
-0.363419770045,
-0.317484897866,
-0.867841821247,
-0.382170005262,
-0.287615987240,
-0.869997751019,
-0.400475913266,
-0.257291187727,
-0.871075889696,
-0.418363525069,
-0.226492243422,
-0.871056255471,
-0.435846605441,
-0.195271488757,
-0.869887204164,
-0.452951760909,
-0.030108866347,
-0.987272338490,
-0.156162690230,
-0.060549560681,
-0.982685966302,
-0.175105803259,
-0.091312151634,
-0.976766598358,
-0.193879094531,
-0.122383778116,
-0.969482822614,
-0.212427087515,
-0.153743470000,
-0.960804977881,
-0.230687537400,
-0.185240344280,
-0.950713663612,
-0.248655473843,
-0.216780185217,
-0.939192068197,
-0.266316748126,
-0.248367631212,
-0.926231115309,
-0.283565584654,
-0.280119561262,
-0.911832205044,
-0.300158393592,
-0.312000690982,
-0.896018651663,
-0.315921105180,
-0.343961774652,
-0.878836954617,
-0.330659802180,
-0.314859376408,
-0.882469352320,
-0.349444438079,
-0.285306743367,
-0.885031230395,
-0.367858374127,
-0.255288585759,
-0.886505706090,
-0.385921457100,
-0.224792107116,
-0.886871338714,
-0.403643081381,
-0.193800093972,
-0.886105597484,
-0.421020657075,
-0.162398635376,
-0.884144597563,
-0.438081058513,
-0.030458454429,
-0.980491025211,
-0.194189680557,
-0.061270255346,
-0.975174293876,
-0.212793450024,
-0.092414857302,
-0.968509857621,
-0.231188559060,
-0.123861367840,
-0.960468407862,
-0.249316664217,
-0.155469469146,
-0.951024454294,
-0.267173598055,
-0.187146661913,
-0.940160670282,
-0.284735036464,
-0.218891391377,
-0.927862715947,
-0.301922737031,
-0.250785732189,
-0.914134417110,
-0.318535373208,
-0.282792653065,
-0.898991501585,
-0.334428759902,
-0.253108167245,
-0.900873671391,
-0.352651221277,
-0.222938599190,
-0.901643037296,
-0.370591708334,
-0.192277873829,
-0.901273392715,
-0.388246688098,
-0.161114866532,
-0.899740923511,
-0.405596191232,
-0.129559923295,
-0.896968521055,
-0.422683922704,
-0.030830884021,
-0.972324632450,
-0.231590728918,
-0.062018386482,
-0.966304730534,
-0.249817708512,
-0.093532693308,
-0.958924984274,
-0.267795649364,
-0.125233952746,
-0.950152947861,
-0.285527288979,
-0.157030324571,
-0.939968865739,
-0.302985162353,
-0.188921433667,
-0.928360291402,
-0.320087271301,
-0.220960272596,
-0.915325093071,
-0.336684617897,
-0.190642070625,
-0.915377333113,
-0.354598278240,
-0.159827039411,
-0.914262853396,
-0.372261671910,
-0.128519443158,
-0.911949784415,
-0.389654133093,
-0.096842521471,
-0.908362588441,
-0.406815601908,
-0.031208162206,
-0.962832634097,
-0.268289711562,
-0.062768862639,
-0.956139241186,
-0.286108058864,
-0.094543065012,
-0.948065951577,
-0.303698140129,
-0.126439229612,
-0.938587626817,
-0.321039542739,
-0.158457960946,
-0.927692976135,
-0.338048541845,
-0.127507003618,
-0.925830540369,
-0.355780514571,
-0.096084793122,
-0.922736673051,
-0.373262300183,
-0.064318803462,
-0.918342004781,
-0.390526636448,
-0.031583051379,
-0.952076335280,
-0.304225512844,
-0.063407155387,
-0.944727714873,
-0.321666096127,
-0.095381422371,
-0.935983571254,
-0.338876288061,
-0.063875683064,
-0.932118392308,
-0.356476085922,
-0.032052995666,
-0.926929017434,
-0.373865219175,
-0.031848062368,
-0.940101520148,
-0.339403642791,
--0.054704019708,
--0.509740892985,
--0.858587032424,
--0.017437222806,
--0.505083862528,
--0.862894104207,
--0.000000001077,
--0.424276393266,
--0.905532739396,
--0.075148223519,
--0.485527218439,
--0.870985685678,
--0.037684282522,
--0.480527992402,
--0.876169357698,
--0.000000001209,
--0.371155580903,
--0.928570694543,
--0.130198387931,
--0.466633721374,
--0.874815037512,
--0.094819417663,
--0.460915747478,
--0.882363843185,
--0.057356574024,
--0.456067868618,
--0.888094771199,
--0.019470995389,
--0.451116799777,
--0.892252494139,
--0.218104773852,
--0.451437166376,
--0.865236841817,
--0.184667138114,
--0.446279697618,
--0.875632616795,
--0.150180215433,
--0.440959797305,
--0.884873075674,
--0.114297541343,
--0.435812606548,
--0.892750493708,
--0.076879586932,
--0.431202572933,
--0.898973787276,
--0.038992437455,
--0.426412778319,
--0.903687851145,
--0.000000000267,
--0.260877081116,
--0.965372025982,
--0.238587560490,
--0.424358865154,
--0.873496153136,
--0.204709273349,
--0.419675662001,
--0.884288670135,
--0.169804627536,
--0.414870076333,
--0.893895524226,
--0.133670277522,
--0.410200536058,
--0.902146206069,
--0.096319658571,
--0.405851335393,
--0.908849391777,
--0.058475559759,
--0.401312727207,
--0.914072592245,
--0.019659396641,
--0.398316866803,
--0.917037175770,
--0.324405786143,
--0.404537811643,
--0.855049732395,
--0.291823145905,
--0.400889335129,
--0.868404855176,
--0.258507914019,
--0.396901517479,
--0.880705878152,
--0.224342096266,
--0.392668324953,
--0.891898094191,
--0.189196217983,
--0.388327579256,
--0.901890504602,
--0.152950133514,
--0.384079219164,
--0.910543469618,
--0.115685444091,
--0.380001187585,
--0.917723256467,
--0.077907514227,
--0.375737253482,
--0.923445686314,
--0.039284332407,
--0.372422371603,
--0.927231534385,
--0.376213878238,
--0.378866269556,
--0.845531470505,
--0.344184867676,
--0.375927559769,
--0.860357627193,
--0.311470757725,
--0.372631799612,
--0.874146159976,
--0.277993144360,
--0.369037876158,
--0.886865749507,
--0.243665596151,
--0.365227416662,
--0.898463138571,
--0.208402729158,
--0.361313281033,
--0.908856982934,
--0.172133869696,
--0.357451615644,
--0.917931518893,
--0.134973429242,
--0.353652820029,
--0.925587303437,
--0.097280931289,
--0.349673761336,
--0.931807212378,
--0.058838305758,
--0.346289117662,
--0.936280887749,
--0.019703168063,
--0.344326356404,
--0.938643247168,
--0.426830127955,
--0.351838436445,
--0.833082082696,
--0.395457937836,
--0.349554484410,
--0.849367224368,
--0.363419769717,
--0.346915901212,
--0.864624443597,
--0.330659805590,
--0.343961776975,
--0.878836952425,
--0.297116904854,
--0.340744050319,
--0.891972553962,
--0.262729302900,
--0.337331696377,
--0.903980442276,
--0.227441689107,
--0.333816262573,
--0.914787943131,
--0.191214115708,
--0.330320463490,
--0.924297329518,
--0.154177069552,
--0.326809465443,
--0.932429624434,
--0.116589039358,
--0.323123022669,
--0.939147756278,
--0.078316797465,
--0.319800327043,
--0.944242675406,
--0.039360950301,
--0.317484776367,
--0.947446110534,
--0.476017922505,
--0.323571996438,
--0.817745743233,
--0.445412670440,
--0.321871272122,
--0.835467795426,
--0.414144177747,
--0.319833413052,
--0.852168520853,
--0.382170007216,
--0.317484900037,
--0.867841819592,
--0.349444440272,
--0.314859376865,
--0.882469351288,
--0.315921109048,
--0.312000692048,
--0.896018649928,
--0.281556954182,
--0.308965978748,
--0.908441360534,
--0.246317369496,
--0.305829298505,
--0.919671785835,
--0.210182208227,
--0.302687380683,
--0.929625617612,
--0.173289016939,
--0.299474033040,
--0.938235695411,
--0.135825386016,
--0.296088347093,
--0.945453941358,
--0.097719924500,
--0.292907546226,
--0.951134052444,
--0.058948182227,
--0.290449262594,
--0.955072948874,
--0.019706936380,
--0.289083198661,
--0.957101113211,
--0.019713521409,
--0.000000001455,
--0.999805669655,
--0.463413973171,
--0.291487301526,
--0.836828920699,
--0.432315565225,
--0.289684965611,
--0.853923809695,
--0.400475914512,
--0.287615988421,
--0.869997750055,
--0.367858376750,
--0.285306744065,
--0.885031229079,
--0.334428762131,
--0.282792654174,
--0.898991500407,
--0.300158396027,
--0.280119562447,
--0.911832203878,
--0.265027431319,
--0.277347343869,
--0.923492778259,
--0.229028855343,
--0.274552898150,
--0.933898543492,
--0.192301595082,
--0.271648406695,
--0.942988462108,
--0.154983702260,
--0.268572828009,
--0.950709570841,
--0.117047598125,
--0.265588961928,
--0.956954734078,
--0.078459574667,
--0.263124479574,
--0.961566224132,
--0.039369529270,
--0.261466546902,
--0.964409293307,
--0.019694489174,
--0.058762968974,
--0.998077672616,
--0.039393488134,
--0.029428229681,
--0.998790334550,
--0.059067633195,
--0.000000000468,
--0.998253983067,
--0.450001609514,
--0.259090041412,
--0.854617400873,
--0.418363528103,
--0.257291187958,
--0.871075888171,
--0.385921458728,
--0.255288587675,
--0.886505704830,
--0.352651223456,
--0.253108167969,
--0.900873670335,
--0.318535376552,
--0.250785732525,
--0.914134415853,
--0.283565587315,
--0.248367631734,
--0.926231114354,
--0.247744068043,
--0.245917027490,
--0.937095348585,
--0.211206612419,
--0.243333598581,
--0.946668118546,
--0.174057504493,
--0.240578736906,
--0.954895730684,
--0.136298543183,
--0.237833923510,
--0.961695238604,
--0.097895329955,
--0.235458698884,
--0.966941417819,
--0.058970358261,
--0.233674349604,
--0.970525010076,
--0.019697836648,
--0.232706642837,
--0.972347475757,
--0.019684876760,
--0.117313960807,
--0.992899763434,
--0.039356003921,
--0.088201583401,
--0.995324864374,
--0.059008990871,
--0.058968815102,
--0.996514233637,
--0.078642310016,
--0.029577373257,
--0.996464031497,
--0.098206241025,
--0.000000001337,
--0.995166083739,
--0.435846607406,
--0.226492242485,
--0.871056254731,
--0.403643084224,
--0.224792106921,
--0.886871337469,
--0.370591711198,
--0.222938599952,
--0.901643035931,
--0.336684621379,
--0.220960273914,
--0.915325091472,
--0.301922740544,
--0.218891392113,
--0.927862714630,
--0.266316752839,
--0.216780186850,
--0.939192066484,
--0.229994868965,
--0.214530394989,
--0.949251847444,
--0.193039494857,
--0.212107742457,
--0.957990636184,
--0.155469696949,
--0.209636939783,
--0.965340109396,
--0.117256071528,
--0.207422449280,
--0.971198713562,
--0.078504377911,
--0.205634078535,
--0.975475109059,
--0.039357865132,
--0.204456782867,
--0.978084036467,
--0.019688062214,
--0.175377504113,
--0.984304379375,
--0.039348477020,
--0.146628827319,
--0.988408662627,
--0.058973206426,
--0.117738291131,
--0.991292013347,
--0.078558790941,
--0.088660264083,
--0.992959150186,
--0.098103562401,
--0.059359645562,
--0.993404310200,
--0.117608045691,
--0.029809996965,
--0.992612568765,
--0.136995857407,
--0.000000001447,
--0.990571620355,
--0.421020659521,
--0.193800093560,
--0.886105596412,
--0.388246690537,
--0.192277873411,
--0.901273391754,
--0.354598281650,
--0.190642071917,
--0.915377331523,
--0.320087274868,
--0.188921433136,
--0.928360290281,
--0.284735039489,
--0.187146663299,
--0.940160669090,
--0.248655478078,
--0.185240346897,
--0.950713661995,
--0.211920779157,
--0.183161627543,
--0.959969479493,
--0.174555338473,
--0.180995593950,
--0.967869324228,
--0.136540572380,
--0.178998186587,
--0.974328651581,
--0.097970474188,
--0.177299793160,
--0.979268384833,
--0.058968057970,
--0.176047042267,
--0.982613966443,
--0.078523819851,
--0.147421226090,
--0.985951820230,
--0.098023122075,
--0.118539386236,
--0.988099125316,
--0.117463759958,
--0.089372604384,
--0.989047421857,
--0.136842462690,
--0.059900256546,
--0.988780106834,
--0.156162691188,
--0.030108868862,
--0.987272338262,
--0.175314550905,
--0.000000002569,
--0.984512472364,
--0.405596193926,
--0.161114865134,
--0.899740922547,
--0.372261676764,
--0.159827039598,
--0.914262851387,
--0.338048545066,
--0.158457960691,
--0.927692975005,
--0.302985166178,
--0.157030326177,
--0.939968864238,
--0.267173602254,
--0.155469471741,
--0.951024452690,
--0.230687540052,
--0.153743472123,
--0.960804976905,
--0.193545245697,
--0.151910418116,
--0.969259234022,
--0.155744445637,
--0.150175405890,
--0.976315018382,
--0.117367518361,
--0.148641428153,
--0.981901518214,
--0.136692806518,
--0.119638526767,
--0.983362445673,
--0.155941267352,
--0.090277330963,
--0.983632210052,
--0.175105804155,
--0.060549563160,
--0.982685965989,
--0.194189680741,
--0.030458457605,
--0.980491025076,
--0.213051565428,
--0.000000001356,
--0.977040956393,
--0.389654136125,
--0.128519442053,
--0.911949783275,
--0.355780519214,
--0.127507005039,
--0.925830538389,
--0.321039547048,
--0.126439231770,
--0.938587625052,
--0.285527293233,
--0.125233955376,
--0.950152946235,
--0.249316667449,
--0.123861370596,
--0.960468406667,
--0.212427088748,
--0.122383781614,
--0.969482821903,
--0.174860662249,
--0.120947567812,
--0.977136343935,
--0.193879097426,
--0.091312154238,
--0.976766597540,
--0.212793452680,
--0.061270259801,
--0.975174293017,
--0.231590729531,
--0.030830887379,
--0.972324632198,
--0.250121114006,
--0.000000002098,
--0.968214556970,
--0.373262303172,
--0.096084791708,
--0.922736671989,
--0.338876291584,
--0.095381423987,
--0.935983569813,
--0.303698143033,
--0.094543066807,
--0.948065950468,
--0.267795653324,
--0.093532696260,
--0.958924982880,
--0.231188560415,
--0.092414860384,
--0.968509857004,
--0.249817712086,
--0.062018390139,
--0.966304729375,
--0.268289711873,
--0.031208165659,
--0.962832633898,
--0.286456629914,
--0.000000002214,
--0.958093210068,
--0.356476088749,
--0.063875683220,
--0.932118391216,
--0.321666100946,
--0.063407158365,
--0.944727713032,
--0.286108061980,
--0.062768865127,
--0.956139240091,
--0.304225514390,
--0.031583053926,
--0.952076334702,
--0.322002384172,
--0.000000000881,
--0.946738857652,
--0.339403642805,
--0.031848062377,
--0.940101520142,
-0.564444911575,
--0.824778089614,
--0.033808943928,
-0.550735108946,
--0.834680082291,
-0.000000001697,
-0.601482759841,
--0.796013181829,
-0.067686807932,
-0.592180171602,
--0.805070535623,
--0.034410420412,
-0.579186725664,
--0.815194907255,
-0.000000000297,
-0.636536090912,
--0.764556519406,
-0.101366333663,
-0.628641676194,
--0.774688614985,
--0.068316855638,
-0.618826254245,
--0.784769782823,
--0.034502971258,
-0.606229327536,
--0.795289885787,
--0.000000000517,
-0.592180171147,
--0.805070536065,
-0.034410417907,
-0.669541939813,
--0.730440678724,
--0.134796163508,
-0.662827226065,
--0.741798884035,
--0.101953342427,
-0.654703392598,
--0.752772268905,
--0.068537426908,
-0.644725590032,
--0.763635169224,
--0.034499882344,
-0.632475941815,
--0.774580004277,
--0.000000001049,
-0.618826252795,
--0.784769784026,
-0.034502969901,
-0.700386923539,
--0.693740004974,
-0.167877821148,
-0.694832911607,
--0.706333999354,
--0.135275667820,
-0.688072287063,
--0.718410433381,
--0.102190885040,
-0.679877080018,
--0.730112188692,
--0.068580959385,
-0.669927814138,
--0.741625920410,
--0.034463285101,
-0.658019472734,
--0.753000912020,
--0.000000000986,
-0.644725588332,
--0.763635170771,
-0.034499879892,
-0.628641677003,
--0.774688614614,
-0.068316852403,
-0.728943598949,
--0.654555929692,
--0.200493801539,
-0.724584241369,
--0.668350401135,
--0.168182693707,
-0.719110665487,
--0.681569673198,
--0.135434970966,
-0.712390578021,
--0.694298874835,
--0.102219062554,
-0.704243032905,
--0.706644016675,
--0.068527252260,
-0.694433201887,
--0.718734159752,
--0.034405460658,
-0.682869607814,
--0.730540278646,
--0.000000001682,
-0.669927813978,
--0.741625920758,
-0.034463280713,
-0.654703393330,
--0.752772268578,
-0.068537423514,
-0.755080152148,
--0.613018504024,
--0.232512962128,
-0.751968370855,
--0.627951624785,
--0.200550058999,
-0.747784919126,
--0.642288781130,
--0.168175017056,
-0.742447059960,
--0.656086182207,
--0.135363527859,
-0.735843267438,
--0.669409946022,
--0.102102937924,
-0.727830165097,
--0.682337091132,
--0.068405736897,
-0.718230509404,
--0.694957900126,
--0.034328594704,
-0.707017841381,
--0.707195709806,
--0.000000001520,
-0.694433201200,
--0.718734160601,
-0.034405456797,
-0.679877080252,
--0.730112188631,
-0.068580957714,
-0.662827226906,
--0.741798883751,
-0.101953339022,
-0.778668570452,
--0.569286552457,
--0.263795524187,
-0.776863211754,
--0.585275907180,
--0.232240527680,
-0.774002844387,
--0.600670196563,
--0.200287073575,
-0.770033898090,
--0.615509899917,
--0.167914736983,
-0.764883704818,
--0.629839831505,
--0.135109972812,
-0.758458964912,
--0.643709476732,
--0.101872999909,
-0.750644938662,
--0.657173653822,
--0.068227302327,
-0.741304668481,
--0.670295121994,
--0.034232118240,
-0.730450268257,
--0.682965889048,
--0.000000002123,
-0.718230509459,
--0.694957900233,
-0.034328591386,
-0.704243034087,
--0.706644015726,
-0.068527249899,
-0.688072288475,
--0.718410432245,
-0.102190883518,
-0.799589918803,
--0.523550487957,
--0.294195255416,
-0.799150286886,
--0.540493142185,
--0.263108308917,
-0.797656944313,
--0.556857337909,
--0.231631829430,
-0.795075554518,
--0.572674562413,
--0.199746609914,
-0.791358024054,
--0.587976991732,
--0.167438152639,
-0.786441353493,
--0.602798195510,
--0.134700902021,
-0.780247238039,
--0.617173524031,
--0.101543531393,
-0.772682338120,
--0.631140739601,
--0.067995376114,
-0.763638482554,
--0.644742169503,
--0.034114554464,
-0.753150565202,
--0.657848178636,
--0.000000001551,
-0.741304667877,
--0.670295122767,
-0.034232116178,
-0.727830165042,
--0.682337091540,
-0.068405733411,
-0.712390579475,
--0.694298873783,
-0.102219059564,
-0.694832912939,
--0.706333998862,
-0.135275663549,
-0.818716538078,
--0.493811022870,
-0.293008368430,
-0.818641275000,
--0.511029847788,
--0.262059072609,
-0.817479079168,
--0.527729108454,
--0.230716152908,
-0.815202693842,
--0.543931234092,
--0.198955725053,
-0.811769860727,
--0.559659129159,
--0.166767360008,
-0.807126046669,
--0.574935642409,
--0.134151227635,
-0.801205241716,
--0.589783543039,
--0.101121377597,
-0.793930024853,
--0.604227123412,
--0.067710405183,
-0.785212708996,
--0.618293423701,
--0.033974164289,
-0.775100514722,
--0.631837947640,
--0.000000001523,
-0.763638482573,
--0.644742169658,
-0.034114551121,
-0.750644939025,
--0.657173653786,
-0.068227298680,
-0.735843268049,
--0.669409945734,
-0.102102935410,
-0.719110666000,
--0.681569672953,
-0.135434969474,
-0.799150287386,
--0.540493144997,
-0.263108301620,
-0.818641275450,
--0.511029847900,
-0.262059070984,
-0.837138253457,
--0.480874089437,
-0.260690726163,
-0.836337579883,
--0.497858802177,
--0.229512669741,
-0.834389611390,
--0.514409447636,
--0.197931545206,
-0.831270398120,
--0.530529369073,
--0.165915984039,
-0.826932995496,
--0.546230423334,
--0.133469642930,
-0.821320912547,
--0.561524282822,
--0.100610329561,
-0.814369686830,
--0.576422606602,
--0.067372039971,
-0.806005555676,
--0.590941601458,
--0.033809286985,
-0.796279684883,
--0.604928643266,
--0.000000001398,
-0.785212708037,
--0.618293425097,
-0.033974161051,
-0.772682338828,
--0.631140739108,
-0.067995372639,
-0.758458965129,
--0.643709477154,
-0.101872995626,
-0.742447060571,
--0.656086182150,
-0.135363524780,
-0.724584243308,
--0.668350400361,
-0.168182688427,
-0.776863213142,
--0.585275908236,
-0.232240520377,
-0.797656943961,
--0.556857338047,
-0.231631830313,
-0.817479079580,
--0.527729109375,
-0.230716149344,
-0.836337579787,
--0.497858803090,
-0.229512668108,
-0.854209394069,
--0.467235645521,
-0.228072713490,
-0.852632664815,
--0.484080192001,
--0.196682247807,
-0.849850944709,
--0.500563730748,
--0.164891853157,
-0.845848578439,
--0.516663497294,
--0.132661271348,
-0.840575385347,
--0.532381892663,
--0.100012708755,
-0.833976914770,
--0.547718955641,
--0.066980976877,
-0.825991957407,
--0.562678485934,
--0.033618562833,
-0.816664773145,
--0.577112335949,
--0.000000002304,
-0.806005555495,
--0.590941601881,
-0.033809283880,
-0.793930025286,
--0.604227123164,
-0.067710402321,
-0.780247238108,
--0.617173524468,
-0.101543528206,
-0.764883704885,
--0.629839831779,
-0.135109971159,
-0.747784919474,
--0.642288781000,
-0.168175016008,
-0.751968372458,
--0.627951625135,
-0.200550051891,
-0.774002844455,
--0.600670196378,
-0.200287073868,
-0.795075555551,
--0.572674562088,
-0.199746606736,
-0.815202694364,
--0.543931234004,
-0.198955723158,
-0.834389611179,
--0.514409449149,
-0.197931542165,
-0.852632664142,
--0.484080193736,
-0.196682246456,
-0.869887203269,
--0.452951763250,
-0.195271487311,
-0.867497293647,
--0.469737828632,
--0.163691227213,
-0.863851705249,
--0.486217937723,
--0.131728312730,
-0.858943318227,
--0.502344446580,
--0.099329920283,
-0.852722955733,
--0.518108387531,
--0.066537655019,
-0.845141979081,
--0.533497199498,
--0.033403193298,
-0.836228833142,
--0.548380651210,
--0.000000002618,
-0.825991956941,
--0.562678486925,
-0.033618557674,
-0.814369686433,
--0.576422607479,
-0.067372037262,
-0.801205241808,
--0.589783543415,
-0.101121374674,
-0.786441353292,
--0.602798196711,
-0.134700897822,
-0.770033898877,
--0.615509900187,
-0.167914732384,
-0.791358023933,
--0.587976992556,
-0.167438150318,
-0.811769860695,
--0.559659130062,
-0.166767357131,
-0.831270398918,
--0.530529368657,
-0.165915981375,
-0.849850944234,
--0.500563732406,
-0.164891850570,
-0.867497293164,
--0.469737830257,
-0.163691225109,
-0.884144595975,
--0.438081062670,
-0.162398632807,
-0.880916562465,
--0.454879008437,
--0.130656410705,
-0.876395751084,
--0.471399032414,
--0.098556784251,
-0.870577452126,
--0.487578925246,
--0.066043103389,
-0.863418329020,
--0.503397069236,
--0.033168958337,
-0.854939036545,
--0.518728487546,
--0.000000002595,
-0.845141978961,
--0.533497199907,
-0.033403189790,
-0.833976914306,
--0.547718956789,
-0.066980973260,
-0.821320911996,
--0.561524284212,
-0.100610326299,
-0.807126046851,
--0.574935642789,
-0.134151224913,
-0.826932995485,
--0.546230423950,
-0.133469640478,
-0.845848578348,
--0.516663498245,
-0.132661268227,
-0.863851704678,
--0.486217939296,
-0.131728310669,
-0.880916561466,
--0.454879010882,
-0.130656408926,
-0.896968520217,
--0.422683924898,
-0.129559921939,
-0.892895249047,
--0.439539554374,
--0.097688558032,
-0.887501067616,
--0.456128376468,
--0.065488618557,
-0.880781241528,
--0.472378623880,
--0.032906538462,
-0.872754106893,
--0.488160085323,
--0.000000002630,
-0.863418328818,
--0.503397069870,
-0.033168953976,
-0.852722954693,
--0.518108389624,
-0.066537652053,
-0.840575385307,
--0.532381893473,
-0.100012704784,
-0.858943318208,
--0.502344447383,
-0.099329916387,
-0.876395750340,
--0.471399034768,
-0.098556779610,
-0.892895248111,
--0.439539556776,
-0.097688555779,
-0.908362587145,
--0.406815605302,
-0.096842519373,
-0.903448967019,
--0.423758170348,
--0.064876629502,
-0.897190279267,
--0.440438444769,
--0.032612561347,
-0.889635122890,
--0.456672035624,
--0.000000001795,
-0.880781241468,
--0.472378624347,
-0.032906533352,
-0.870577451352,
--0.487578927012,
-0.066043100561,
-0.887501067336,
--0.456128377743,
-0.065488613479,
-0.903448965947,
--0.423758172946,
-0.064876627463,
-0.918342003413,
--0.390526640030,
-0.064318801248,
-0.912598991995,
--0.407578539349,
--0.032292631841,
-0.905539935873,
--0.424261033492,
--0.000000002979,
-0.897190279170,
--0.440438445271,
-0.032612557244,
-0.912598991513,
--0.407578540642,
-0.032292629138,
-0.926929016889,
--0.373865220601,
-0.032052994785,
-0.920418335123,
--0.390934890192,
--0.000000000009])
+
+_UNIDIST_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'uniform_dist.npy')
+
+
+@functools.lru_cache(maxsize=None)
+def load_unidist():
+    '''
+    Load the uniform distribution of points on the sphere
+
+    :return: flat array of cartesian coordinates (x0,y0,z0,x1,y1,z1,...)
+    :rtype: np.memmap (read-only)
+    :Exemple:
+        >>> vs=load_unidist().reshape([-1,3])
+    '''
+    return np.load(_UNIDIST_FILE, mmap_mode='r')
+
+
+@functools.lru_cache(maxsize=8)
+def equal_area_hemisphere(npts=5000):
+    '''
+    Equal-area set of points on the upper hemisphere (Fibonacci lattice) and its triangulation
+
+    The npts points of the lattice are completed by a ring of points on the equator (z=0) with the same spacing,
+    so that the triangulation covers the whole projected disc.
+
+    :param npts: number of points inside the hemisphere
+    :type npts: int
+    :return: xyz (cartesian coordinates of size [n,3], z>=0), triangles (indices of size [ntri,3])
+    :rtype: np.array (read-only), np.array (read-only)
+    :Exemple:
+        >>> xyz,triangles=equal_area_hemisphere(2000)
+
+    .. note:: the result is cached for each npts. The triangulation is computed in the Lambert equal-area projection, it stays valid for any projection that only changes the radius (e.g. stereographic).
+    '''
+    import matplotlib.tri as tri
+
+    npts=int(npts)
+    # uniform in z is uniform in area on the sphere
+    i=np.arange(npts)
+    z=1.-(i+0.5)/npts
+    azi=np.mod(i*np.pi*(3.-5**0.5),2*np.pi)
+    # equator with the same spacing than the lattice
+    nring=int(np.ceil((2*np.pi*npts)**0.5))
+    z=np.concatenate([z,np.zeros(nring)])
+    azi=np.concatenate([azi,np.linspace(0,2*np.pi,nring,endpoint=False)])
+
+    r=(1.-z**2)**0.5
+    xyz=np.stack([r*np.cos(azi),r*np.sin(azi),z],axis=-1)
+
+    # Lambert equal-area projection
+    rl=(2.*(1.-z))**0.5
+    triangles=tri.Triangulation(rl*np.cos(azi),rl*np.sin(azi)).triangles
+
+    xyz.flags.writeable=False
+    triangles.flags.writeable=False
+    return xyz,triangles
+
+
+def __getattr__(name):
+    # keep 'from xarrayuvecs.uniform_dist import unidist' working without loading the file at import
+    if name == 'unidist':
+        return load_unidist()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
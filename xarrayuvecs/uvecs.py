@@ -1,16 +1,25 @@
 '''
 This is an object to take care of unit vector
 '''
-from xarrayuvecs.uniform_dist import unidist
+import xarrayuvecs.uniform_dist as uniform_dist
 import xarrayuvecs.lut2d as lut2d
+import xarrayuvecs.tensor3 as tensor3
 
+import collections
 import datetime
+import weakref
+import zlib
 import xarray as xr
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.tri as tri
-from sklearn.neighbors import KernelDensity
-import scipy
+# matplotlib, scikit-learn and scipy are imported inside the methods that need them
+# so that registering the accessor stays cheap
+
+# cache of the cartesian and bunge representations, shared by all the accessors (see set_cache_limit)
+_cache=collections.OrderedDict()
+_cache_limit=2**30
+# engine of the per-pixel kernels (see set_engine), the numba module is only imported when needed
+_engine='auto'
+_jit_module=None
 
 @xr.register_dataarray_accessor("uvecs")
 
@@ -27,97 +36,654 @@ class uvecs(object):
         Colatitude : angle between u-vector and z vector [0 pi/2]
         Azimuth : angle between the projection of u-vector in xOy plan and x-vector [0 2pi]
         
-        :param xarray_obj: dimention should be (n,m,2), xarray_obj[n,m,0]=azimuth , xarray_obj[n,m,1]=colatitude
+        The vector can also be given in cartesian coordinate, xarray_obj[...,0]=x, xarray_obj[...,1]=y, xarray_obj[...,2]=z,
+        then every method work directly in this representation.
+        
+        :param xarray_obj: dimention should be (...,2), xarray_obj[...,0]=azimuth , xarray_obj[...,1]=colatitude, or (...,3) for cartesian coordinate
         :type xarray_obj: xr.DataArray
+        
+        .. note:: the component dimension is the last one, unless xarray_obj.attrs['uvecs_dim'] gives its name. All the other dimensions (time, z, y, x ...) are broadcasted.
+        .. note:: the representation is xarray_obj.attrs['uvecs_repr'] ('azicol', 'xyz', or 'oct16'/'oct8' for encoded data, see encode) if given, otherwise it is deduced from the size of the component dimension (2:'azicol', 3:'xyz')
         '''
         self._obj = xarray_obj 
+        self._vdim = _component_dim(xarray_obj)
+        self._repr = _representation(xarray_obj,self._vdim)
     pass
     
+    def _dims(self):
+        '''
+        :return: the dimensions of the data without the component dimension
+        :rtype: tuple
+        '''
+        return tuple(d for d in self._obj.dims if d!=self._vdim)
+    
+    def _wrap(self,values,vdim=None):
+        '''
+        Build a DataArray from values of dim (...,k) with the dimensions and coordinates of the data, the component dimension being replaced by vdim
+        (values of dim (...) if vdim is None)
+        '''
+        coords=self._obj.isel({self._vdim:0},drop=True).coords
+        dims=self._dims() if vdim is None else self._dims()+(vdim,)
+        return xr.DataArray(values,dims=dims,coords=coords)
+    
+    def _buffer_key(self):
+        '''
+        :return: key identifying the data buffer, its content and how it is read (representation, component dimension), None if the data is not a numpy array (e.g. dask) or is not contiguous
+        :rtype: tuple
+        '''
+        if self._is_lazy():
+            return None
+        data=self._obj.data
+        if data.flags.f_contiguous and not data.flags.c_contiguous:
+            buf=data.T # same buffer, C ordered
+        elif data.flags.c_contiguous:
+            buf=data
+        else:
+            # a strided view (e.g. a slice of a bigger map) is not cached, hashing it would need a copy
+            return None
+        # the crc of the content detect in-place modification of the data, it is much cheaper than the trigonometry
+        crc=zlib.crc32(memoryview(buf).cast('B'))
+        return (data.__array_interface__['data'][0],data.shape,data.strides,data.dtype.str,self._obj.get_axis_num(self._vdim),crc,self._repr,self._vdim)
+    
+    def _cached(self,name,func):
+        '''
+        Return func() from the cache of the data buffer, compute and store it if needed
+        :param name: name of the representation
+        :type name: str
+        :param func: function computing the representation
+        :type func: function
+        :rtype: np.array (read-only)
+        '''
+        bkey=self._buffer_key()
+        if bkey is None or _cache_limit<=0:
+            return func()
+        key=(bkey,name)
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+        
+        res=func()
+        res.flags.writeable=False
+        if not any(k[0]==bkey for k in _cache):
+            # the entries of the buffer are removed when it is freed
+            base=self._obj.data
+            while isinstance(base.base,np.ndarray):
+                base=base.base
+            weakref.finalize(base,_forget,bkey)
+        _cache[key]=res
+        _evict()
+        return res
+    
+    def clear_cache(self):
+        '''
+        Remove the cached representations (xyz, bunge_euler) of this DataArray
+        
+        .. note:: use xarrayuvecs.uvecs.clear_cache() to empty the whole cache
+        '''
+        data=self._obj.data
+        if not isinstance(data,np.ndarray):
+            return
+        ptr=data.__array_interface__['data'][0]
+        for key in [k for k in _cache if k[0][0]==ptr]:
+            del _cache[key]
 
 #-----------------------------vector representation-------------------------------------        
+    def _values(self):
+        '''
+        :return: the data with the component dimension at the end
+        :rtype: np.array
+        '''
+        return np.moveaxis(np.asarray(self._obj),self._obj.get_axis_num(self._vdim),-1)
+    
+    def _is_lazy(self):
+        '''
+        :return: True if the data is not a numpy array in memory (e.g. dask)
+        :rtype: bool
+        '''
+        return not isinstance(self._obj.data,np.ndarray)
+    
+    def _apply(self,func,vdim,size,output_dtype,**kwargs):
+        '''
+        Apply func(u,**kwargs) on the vectors with xr.apply_ufunc, dask chunks stay lazy and are computed in parallel
+        :param func: function of the data of dim (...,k) returning an array of dim (...,size)
+        :type func: function
+        :param vdim: name of the component dimension of the output
+        :type vdim: str
+        :param size: size of the component dimension of the output
+        :type size: int
+        :param output_dtype: dtype of the output
+        :type output_dtype: np.dtype
+        :rtype: xr.DataArray
+        
+        .. note:: the attrs of the data (uvecs_dim, uvecs_repr...) describe its components, they are not copied to the output (as for the eager methods, see _wrap)
+        '''
+        return xr.apply_ufunc(func,self._obj,
+                              input_core_dims=[[self._vdim]],
+                              output_core_dims=[[vdim]],
+                              kwargs=kwargs,
+                              dask='parallelized',
+                              output_dtypes=[np.dtype(output_dtype)],
+                              keep_attrs=False,
+                              dask_gufunc_kwargs={'output_sizes':{vdim:size},'allow_rechunk':True})
+    
     def azi_col(self):
         '''
-        :return out: the azimuth out[n,m,0] and colatitude out[n,m,0], dim (n,m,2)
+        :return out: the azimuth out[...,0] and colatitude out[...,1], dim (...,2)
         :rtype out: np.array
+        
+        .. note:: for cartesian or encoded data the vectors are converted, the one pointing down are flipped to the upper hemisphere
         '''
-        return np.moveaxis(np.array([self._obj[:,:,0],self._obj[:,:,1]]),0,-1)
+        if self._repr!='azicol':
+            return self._cached('azi_col',lambda: _azi_col_kernel(_decode(self._values(),self._repr)[0]))
+        return self._values()
         
-    def bunge_euler(self):
+    def bunge_euler(self,dtype=np.float64,out=None):
         '''
         This is from the Euler angle, Bunge convention
         1. rotate around z-axis of phi1
         2. rotate around x'-axis of phi
-        :return out: phi1 and phi, out[n,m,0]=phi1, out[n,m,1]=phi
-        :rtype out: np.array
+        :param dtype: dtype of the output (default:np.float64)
+        :type dtype: np.dtype
+        :param out: array of dim (...,2) where the result is written, it is not cached
+        :type out: np.array
+        :return out: phi1 and phi, out[...,0]=phi1, out[...,1]=phi
+        :rtype out: xr.DataArray
+        
+        .. note:: the result is cached (read-only), see clear_cache. Dask data stays lazy.
         '''
-        BE=np.moveaxis(np.array([np.mod(self._obj[:,:,0]+np.pi/2.,2*np.pi),self._obj[:,:,1]]),0,-1)
+        if out is not None:
+            BE=_bunge_euler_kernel(self.azi_col(),out=out)
+        elif self._is_lazy():
+            return self._apply(_bunge_euler_kernel,'vbe',2,dtype,representation=self._repr,dtype=dtype)
+        else:
+            dtype=np.dtype(dtype)
+            BE=self._cached(('bunge_euler',dtype.str),lambda: _bunge_euler_kernel(self.azi_col(),dtype=dtype))
         
-        return xr.DataArray(BE,dims=[self._obj.coords.dims[0],self._obj.coords.dims[1],'vbe'])
+        return self._wrap(BE,'vbe')
 
 
-    def xyz(self):
+    def xyz(self,dtype=np.float64,out=None):
         '''
         Return axis in cartesian coordinate
-        :return out: out[n,m,0]=x, out[n,m,1]=u , out[n,m,2]=z
-        :rtype out: np.array
+        :param dtype: dtype of the output (default:np.float64)
+        :type dtype: np.dtype
+        :param out: array of dim (...,3) where the result is written, it is not cached
+        :type out: np.array
+        :return out: out[...,0]=x, out[...,1]=y , out[...,2]=z
+        :rtype out: xr.DataArray
+        
+        .. note:: the result is cached (read-only), see clear_cache. Dask data stays lazy.
         '''
-        XYZ=np.moveaxis(np.array([np.cos(self._obj[:,:,0])*np.sin(self._obj[:,:,1]),np.sin(self._obj[:,:,0])*np.sin(self._obj[:,:,1]),np.cos(self._obj[:,:,1])]),0,-1)
+        if out is not None:
+            XYZ=_xyz_kernel(self._values(),self._repr,out=out)
+        elif self._is_lazy():
+            return self._apply(_xyz_kernel,'vc',3,dtype,representation=self._repr,dtype=dtype)
+        else:
+            dtype=np.dtype(dtype)
+            XYZ=self._cached(('xyz',dtype.str),lambda: _xyz_kernel(self._values(),self._repr,dtype=dtype))
 
-        return xr.DataArray(XYZ,dims=[self._obj.coords.dims[0],self._obj.coords.dims[1],'vc'])
+        return self._wrap(XYZ,'vc')
+    
+    def canonical(self,dtype=np.float64,out=None):
+        '''
+        Return the vectors in cartesian coordinate, taken in the upper hemisphere (u=-u)
+        :param dtype: dtype of the output (default:np.float64)
+        :type dtype: np.dtype
+        :param out: array of dim (...,3) where the result is written
+        :type out: np.array
+        :return out: out[...,0]=x, out[...,1]=y , out[...,2]=z>=0
+        :rtype out: xr.DataArray
+        
+        .. note:: on the equator (z=0) the vector with y>0 is kept, and the one with x>0 if y=0 too (see _canonical_kernel). Dask data stays lazy.
+        '''
+        if self._is_lazy() and out is None:
+            return self._apply(_canonical_xyz,'vc',3,dtype,representation=self._repr,dtype=dtype)
+        return self._wrap(_canonical_xyz(self._values(),self._repr,dtype=dtype,out=out),'vc')
+    
+    def compress(self):
+        '''
+        Sparse form of the data: the valid (non NaN) vectors packed along a 'pixel' dimension
+        
+        The validity mask is kept in the 'pixel' MultiIndex (one level per dimension of the grid).
+        xyz, calc_colormap, calc_schmid, inner_angle, OT2nd, plotODF... work directly on the packed vectors,
+        use expand to put a result back on the grid.
+        :return: packed vectors, dim (pixel,k)
+        :rtype: xr.DataArray
+        :Exemple:
+            >>> packed=data.uvecs.compress()
+            >>> img=xarrayuvecs.uvecs.expand(packed.uvecs.calc_colormap(dtype=np.uint8),fill_value=255)
+        
+        .. note:: the data is loaded in memory
+        '''
+        import pandas as pd
+        
+        dims=self._dims()
+        u=self._values()
+        valid=~_invalid(u,self._repr)
+        levels=[self._obj.indexes[d] if d in self._obj.indexes else pd.RangeIndex(self._obj.sizes[d]) for d in dims]
+        midx=pd.MultiIndex(levels=levels,codes=np.nonzero(valid),names=dims)
+        coords=xr.Coordinates.from_pandas_multiindex(midx,'pixel')
+        packed=xr.DataArray(u[valid],dims=('pixel',self._vdim),coords=coords,attrs=self._obj.attrs)
+        if self._vdim in self._obj.coords:
+            packed=packed.assign_coords({self._vdim:self._obj[self._vdim]})
+        return packed
+    
+    def expand(self,fill_value=np.nan):
+        '''
+        Put packed vectors (see compress) back on the grid
+        :param fill_value: value of the invalid pixels (default:NaN)
+        :rtype: xr.DataArray
+        '''
+        return expand(self._obj,fill_value=fill_value)
+    
+    def encode(self,encoding='oct16'):
+        '''
+        Pack the vectors in 2 integers with the hemi-octahedral encoding, to store orientation maps
+        :param encoding: 'oct16' 2*int16 (4 bytes, max error about 0.002 degree) or 'oct8' 2*int8 (2 bytes, max error about 0.6 degree, for preview)
+        :type encoding: str
+        :return: encoded vectors, they can be used directly with uvecs or decoded with decode
+        :rtype: xr.DataArray
+        :Exemple:
+            >>> data.uvecs.encode().to_netcdf('map.nc')
+            >>> ori=xr.open_dataarray('map.nc').uvecs.decode()
+        
+        .. note:: u=-u so only the upper hemisphere is encoded, NaN vectors are stored with a fill value (-32768 or -128)
+        .. note:: the components are along the last dimension 'oct', the only attr of the output is uvecs_repr
+        '''
+        if encoding not in _OCT:
+            raise ValueError("encoding should be 'oct16' or 'oct8', got "+str(encoding))
+        enc=self._apply(_oct_encode,'oct',2,_OCT[encoding][3],representation=self._repr,encoding=encoding)
+        enc.attrs['uvecs_repr']=encoding
+        return enc
+    
+    def decode(self,representation='xyz'):
+        '''
+        Decode vectors encoded with encode
+        :param representation: 'xyz' cartesian coordinate (vc dimension) or 'azicol' azimuth and colatitude (vac dimension)
+        :type representation: str
+        :rtype: xr.DataArray
+        '''
+        if representation=='xyz':
+            return self.xyz()
+        elif representation=='azicol':
+            if self._is_lazy():
+                func=lambda u,representation: _azi_col_kernel(_xyz_kernel(u,representation))
+                return self._apply(func,'vac',2,np.float64,representation=self._repr)
+            return self._wrap(self.azi_col(),'vac')
+        raise ValueError("representation should be 'xyz' or 'azicol', got "+str(representation))
     
 #-----------------------------------colormap function-------------------------------------
-    def calc_colormap(self,**kwargs):
+    def calc_colormap(self,dtype=np.float64,engine='lut',semi=False,**kwargs):
         '''
         Compute the colormap value
-        :param nlut: size of the lut (default:512)
-        :type nlut: int
+        :param nx: size of the lut (default:512)
+        :type nx: int
         :param semi: colorbar option
+        :param dtype: np.float64 for colors in [0 1], np.uint8 for colors in [0 255] (8 times lighter, can be written directly to png/tiff)
+        :type dtype: np.dtype
+        :param engine: 'lut' look up the color in a nx*nx colorwheel, 'analytic' compute it directly from the orientation (no quantization, same as 'lut' when nx->inf)
+        :type engine: str
         '''
-        rlut=lut2d.lut(circle=False,**kwargs)
-        nlut=np.shape(rlut)[0]
+        if engine=='lut':
+            rlut=lut2d.lut(circle=False,semi=semi,dtype=dtype,**kwargs)
+            func=_colormap
+            fkwargs={'rlut':rlut}
+        elif engine=='analytic':
+            func=_colormap_analytic
+            fkwargs={'semi':semi,'dtype':dtype}
+        else:
+            raise ValueError("engine should be 'lut' or 'analytic', got "+str(engine))
+        
+        fkwargs['representation']=self._repr
+        jit=_jit()
+        if jit is not None and engine=='lut' and self._repr in ('azicol','xyz'):
+            func=jit.colormap
+        # dask chunks are colored in parallel, the lut is given once to every task
+        return self._apply(func,'img',3,dtype,**fkwargs)
+#--------------------------------------------------------------------------------------------
+    def products(self,names=('xyz','colormap','schmid','OT2nd'),axis=np.array([0.,0.,1.]),dtype=np.float64,semi=False,**kwargs):
+        '''
+        Compute several products of the map in a single pass over the vectors
+        
+        The map is read by blocks of pixels, the cartesian coordinates of each block are computed once
+        and shared by all the requested products.
+        :param names: products to compute among 'xyz', 'colormap', 'schmid' and 'OT2nd'
+        :type names: list of str
+        :param axis: axis of the schmid factor in cartesien coordinate (X,Y,Z) (default:[0,0,1])
+        :type axis: np.array
+        :param dtype: dtype of the colormap, np.float64 or np.uint8 (see calc_colormap)
+        :type dtype: np.dtype
+        :param semi: colorbar option of the colormap
+        :type semi: bool
+        :param **kwargs: lut2d.lut option of the colormap (e.g. nx)
+        :return: 'xyz', 'colormap', 'schmid' like xyz(), calc_colormap() and calc_schmid(axis), and 'OT2nd_eigvalue', 'OT2nd_eigvector' like OT2nd()
+        (one tensor per frame of the non-spatial dimensions, e.g. time)
+        :rtype: xr.Dataset
+        :Exemple:
+            >>> ds=data.uvecs.products(['colormap','schmid','OT2nd'],axis=[0,1,0])
+        
+        .. note:: the vectors are read frame by frame in the same blocks as OT2nd, so the OT2nd products are identical to OT2nd()
+        .. note:: for dask data all the products stay lazy: each chunk is converted once, gives its pixel products and the sums of u_i u_j of its frames, which are reduced lazily (not compensated across chunks)
+        '''
+        names=list(names)
+        for name in names:
+            if name not in _PRODUCTS:
+                raise ValueError('unknown product '+str(name)+', should be in '+str(_PRODUCTS))
+        pixel=[name for name in names if name!='OT2nd']
+        fkwargs={'representation':self._repr,'names':pixel,'axis':np.asarray(axis,dtype=np.float64)}
+        if 'colormap' in names:
+            fkwargs['rlut']=lut2d.lut(circle=False,semi=semi,dtype=dtype,**kwargs)
         
-        XX=np.int32((nlut-1)/2*np.multiply(np.sin(self._obj[:,:,1]),-np.sin(self._obj[:,:,0]))+(nlut-1)/2)
-        YY=np.int32((nlut-1)/2*np.multiply(np.sin(self._obj[:,:,1]),np.cos(self._obj[:,:,0]))+(nlut-1)/2)
+        data={}
+        if self._is_lazy():
+            data=self._products_lazy(names,pixel,fkwargs,dtype)
+        else:
+            # vectors of size [frame,pixel,k], read by the blocks of OT2nd
+            keep,red=self._frame_dims()
+            u=np.asarray(self._obj.transpose(*keep,*red,self._vdim))
+            fshape=u.shape[:len(keep)]
+            pshape=u.shape[len(keep):-1]
+            u=u.reshape((int(np.prod(fshape)),-1,u.shape[-1]))
+            out={name:np.empty(u.shape[:2]+_PRODUCT_SHAPE[name],dtype=dtype if name=='colormap' else np.float64) for name in pixel}
+            acc=np.zeros((2,u.shape[0],3,3))
+            count=np.zeros(u.shape[0])
+            step=_frame_step(u.shape[0])
+            for i in range(0,u.shape[1],step):
+                sl=slice(i,i+step)
+                res=_products_kernel(u[:,sl],moment='OT2nd' in names,out={name:out[name][:,sl] for name in pixel},**fkwargs)
+                if 'OT2nd' in names:
+                    _kahan_add(acc,res[-2])
+                    count+=res[-1]
+            coords=self._obj.isel({self._vdim:0},drop=True).coords
+            for name in pixel:
+                tail=list(_PRODUCT_DIMS[name])
+                data[name]=xr.DataArray(out[name].reshape(fshape+pshape+out[name].shape[2:]),dims=keep+red+tail,coords=coords).transpose(*self._dims(),*tail)
+            if 'OT2nd' in names:
+                mean,empty=_moment_mean(acc,count)
+                frames={d:self._obj.coords[d] for d in keep if d in self._obj.coords}
+                eigvalue,eigvector=_ot2nd_result(mean,empty,keep,fshape,frames)
+        
+        if 'OT2nd' in names and not self._is_lazy():
+            if not isinstance(eigvalue,xr.DataArray):
+                eigvalue=xr.DataArray(eigvalue,dims=('eig',))
+                eigvector=xr.DataArray(eigvector,dims=('vc','eig'))
+            data['OT2nd_eigvalue']=eigvalue
+            data['OT2nd_eigvector']=eigvector
+        return xr.Dataset(data)
+    
+    def _products_lazy(self,names,pixel,fkwargs,dtype):
+        '''
+        products of dask data: one task per chunk computes the pixel products and the moments of the chunk, see products
+        :rtype: dict of xr.DataArray
+        '''
+        import operator
+        import dask.array as dsa
         
-        id=XX<0
-        XX[id]=0
-        YY[id]=0
+        keep,red=self._frame_dims()
+        obj=self._obj.transpose(*keep,*red,self._vdim)
+        arr=obj.data.rechunk({obj.ndim-1:-1})
+        moment='OT2nd' in names
+        nkeep=len(keep)
+        nd=arr.ndim-1
+        # one task per chunk returning the tuple of its products, the kwargs (lut, axis...) are given once to the graph
+        blocks=dsa.blockwise(_products_block,tuple(range(nd)),arr,tuple(range(arr.ndim)),
+                             dtype=object,meta=np.empty((0,)*nd,dtype=object),concatenate=True,
+                             nkeep=nkeep,moment=moment,**fkwargs)
         
-        idx,idy=np.where(id==True)
-        img=rlut[XX,YY]
-        img[idx,idy,:]=np.array([255,255,255])
-        return xr.DataArray(img,dims=[self._obj.coords.dims[0],self._obj.coords.dims[1],'img'])
+        data={}
+        coords=self._obj.isel({self._vdim:0},drop=True).coords
+        for k,name in enumerate(pixel):
+            tail=_PRODUCT_SHAPE[name]
+            res=blocks.map_blocks(operator.getitem,k,dtype=dtype if name=='colormap' else np.float64,
+                                  chunks=arr.chunks[:-1]+tuple((t,) for t in tail),new_axis=list(range(nd,nd+len(tail))))
+            data[name]=xr.DataArray(res,dims=keep+red+list(_PRODUCT_DIMS[name]),coords=coords).transpose(*self._dims(),*_PRODUCT_DIMS[name])
+        if moment:
+            # sums of each chunk, of size [frame...,1...,7], reduced over the pixel chunks
+            sums=blocks.map_blocks(operator.getitem,len(pixel),dtype=np.float64,
+                                   chunks=arr.chunks[:nkeep]+tuple((1,)*n for n in arr.numblocks[nkeep:nd])+((7,),),new_axis=[nd])
+            total=sums.sum(axis=tuple(range(nkeep,nd)))
+            # all the frames in one chunk: same eigen solver as the eager path
+            total=total.rechunk(-1)
+            eigvalue,eigvector=dsa.apply_gufunc(_moment_eig,'(k)->(i),(i,j)',total,output_sizes={'i':3,'j':3},output_dtypes=(np.float64,np.float64))
+            frames={d:self._obj.coords[d] for d in keep if d in self._obj.coords}
+            data['OT2nd_eigvalue']=xr.DataArray(eigvalue,dims=keep+['eig'],coords=frames)
+            data['OT2nd_eigvector']=xr.DataArray(eigvector,dims=keep+['vc','eig'],coords=frames)
+        return data
 #--------------------------------------------------------------------------------------------
-    def OT2nd(self):
+    def OT2nd(self,labels=None,dims=None):
         '''
         Compute the second order orientation tensor
         
+        :param labels: integer label of each pixel (e.g. grain id), same dimensions as the map, to compute one tensor per label (default:None, one tensor for the map)
+        :type labels: xr.DataArray
+        :param dims: dimensions over which the tensor is computed, the other ones are kept (default: the spatial dimensions 'z', 'y', 'x' and 'pixel', or all if there is none)
+        :type dims: list of str
         :return eigvalue: eigen value w[i]
         :rtype eigvalue: np.array
         :return eigvector: eigen vector v[:,i]
         :rtype eigvector: np.array
+        :return: if some dimensions are kept (e.g. time), eigvalue (...,eig) and eigvector (...,vc,eig) are xr.DataArray
+        :rtype: xr.DataArray, xr.DataArray
+        :return: with labels, xr.Dataset indexed by 'label' with 'eigvalue' (label,eig), 'eigvector' (label,vc,eig), 'tensor' (label,vc,vc2) and 'count' (number of valid vectors) 
+        :rtype: xr.Dataset
+        :Exemple:
+            >>> ds=data.uvecs.OT2nd(labels=grains)
+            >>> ds.eigvalue.sel(label=12)
+            >>> eigvalue,eigvector=serie.uvecs.OT2nd() # serie of dim (time,y,x,v)
+            >>> eigvalue.plot.line(x='time')
         
         .. note:: eigen value w[i] is associate to eigen vector v[:,i] 
+        .. note:: the tensor a_ij=<u_i u_j> is the same for u and -u, it is computed in one pass over the vectors by blocks with a compensated float64 sum (NaN are skipped)
+        .. note:: the tensors of all the kept coordinates (e.g. all the time steps) are computed in the same pass and diagonalized at once
+        .. note:: with labels, the six components of all the tensors are summed in the same pass (np.bincount) and the 3x3 eigen problems are solved at once. Negative or NaN labels are ignored, a label without valid vector gets NaN.
+        '''
+        if labels is not None:
+            return self._ot2nd_labels(labels)
+        
+        keep,shape,coords,vxyz=self._frames(dims)
+        mean,empty=_frame_mean(vxyz,_second_moment)
+        return _ot2nd_result(mean,empty,keep,shape,coords)
+    
+    def OT4th(self,labels=None,dims=None):
         '''
+        Compute the fourth order orientation tensor a_ijkl=<u_i u_j u_k u_l> in compact form
+        
+        a_ijkl is symmetric for any permutation of ijkl, only its 15 independent components are computed and stored.
+        :param labels: integer label of each pixel (e.g. grain id), same dimensions as the map, to compute one tensor per label (default:None)
+        :type labels: xr.DataArray
+        :param dims: dimensions over which the tensor is computed, the other ones are kept (default: the spatial dimensions 'z', 'y', 'x' and 'pixel', or all if there is none)
+        :type dims: list of str
+        :return: the 15 components along 'comp4' (coordinate '1111', '1112', ... '3333'), with a 'label' dimension (and a 'count' coordinate) if labels is given and the kept dimensions (e.g. time)
+        :rtype: xr.DataArray
+        :Exemple:
+            >>> a4=data.uvecs.OT4th()
+            >>> a4.sel(comp4='1122')
+            >>> full=xarrayuvecs.uvecs.expand_OT4th(a4) # dims (...,i,j,k,l)
+        
+        .. note:: the components are summed in one pass over the vectors by blocks (compensated float64 sum, NaN are skipped), like OT2nd
+        .. note:: the second order tensor is the contraction a_ij=a_ijkk
+        '''
+        if labels is not None:
+            names,sums,count=self._label_sums(labels,_OT4_COMPONENTS)
+            empty=count==0
+            a4=sums/np.where(empty,1,count)[:,np.newaxis]
+            a4[empty]=np.nan
+            return xr.DataArray(a4,dims=('label','comp4'),
+                                coords={'label':names,'count':('label',count.astype(np.int64)),'comp4':_OT4_NAMES},name='OT4th')
+        
+        keep,shape,coords,vxyz=self._frames(dims)
+        a4,empty=_frame_mean(vxyz,_fourth_moment)
+        a4[empty]=np.nan
+        coords['comp4']=_OT4_NAMES
+        return xr.DataArray(a4.reshape(shape+(15,)),dims=keep+['comp4'],coords=coords,name='OT4th')
+    
+    def _frame_dims(self,dims=None):
+        '''
+        :param dims: reduced dimensions (default: the spatial dimensions, or all if there is none)
+        :type dims: list of str
+        :return: kept dimensions, reduced dimensions
+        :rtype: list, list
+        '''
+        if dims is None:
+            dims=[d for d in self._dims() if d in _SPATIAL_DIMS] or self._dims()
+        for d in dims:
+            if d not in self._dims():
+                raise ValueError(str(d)+' is not a dimension of the map '+str(self._dims()))
+        return [d for d in self._dims() if d not in dims],list(dims)
+    
+    def _frames(self,dims=None):
+        '''
+        Cartesian vectors grouped by frame, the frames being all the coordinates of the dimensions not in dims
+        :param dims: reduced dimensions (default: the spatial dimensions, or all if there is none)
+        :type dims: list of str
+        :return: kept dimensions, their shape, their coordinates, vectors of size [frame,pixel,3]
+        :rtype: list, tuple, dict, np.array
+        '''
+        keep,dims=self._frame_dims(dims)
         u_xyz=self.xyz()
-        ux=np.concatenate([np.array(u_xyz[:,:,0]).flatten(),-np.array(u_xyz[:,:,0]).flatten()])
-        uy=np.concatenate([np.array(u_xyz[:,:,1]).flatten(),-np.array(u_xyz[:,:,1]).flatten()])
-        uz=np.concatenate([np.array(u_xyz[:,:,2]).flatten(),-np.array(u_xyz[:,:,2]).flatten()])
+        vxyz=np.asarray(u_xyz.transpose(*keep,*dims,'vc'))
+        shape=vxyz.shape[:len(keep)]
+        coords={d:u_xyz.coords[d] for d in keep if d in u_xyz.coords}
+        return keep,shape,coords,vxyz.reshape((int(np.prod(shape)),-1,3))
+    
+    def _label_sums(self,labels,components):
+        '''
+        Sum of the products of the components of the vectors for each label, in one pass (np.bincount)
+        :param labels: integer label of each pixel, negative or NaN labels are ignored
+        :type labels: xr.DataArray
+        :param components: indices of the products, e.g. ((0,0),(0,1)...) for u_x*u_x, u_x*u_y...
+        :type components: tuple
+        :return: labels, sums of size [label,len(components)], number of valid vectors of each label
+        :rtype: np.array, np.array, np.array
+        '''
+        dims=self._dims()
+        lab=labels.broadcast_like(self._obj.isel({self._vdim:0},drop=True)).transpose(*dims) if isinstance(labels,xr.DataArray) else labels
+        lab=np.asarray(lab).reshape(-1)
+        if lab.size!=self._obj.size//self._obj.sizes[self._vdim]:
+            raise ValueError('labels should have the dimensions of the map '+str(dims)+', got '+str(np.shape(labels)))
+        if lab.dtype.kind=='f':
+            lab=np.where(np.isnan(lab),-1,lab).astype(np.int64)
+        elif lab.dtype.kind not in 'iub':
+            raise ValueError('labels should be integer, got '+str(lab.dtype))
+        vxyz=np.asarray(self.xyz()).reshape(-1,3)
         
+        # labels as consecutive indices, a lookup table avoids sorting the labels when they are not too sparse
+        keep=lab>=0
+        lab=lab[keep]
+        if lab.size and lab.max()<=2*lab.size:
+            names=np.flatnonzero(np.bincount(lab))
+            table=np.zeros(lab.max()+1,dtype=np.intp)
+            table[names]=np.arange(len(names))
+            index=table[lab]
+        else:
+            names,index=np.unique(lab,return_inverse=True)
+        nlab=len(names)
+        sums=np.zeros((nlab,len(components)))
+        count=np.zeros(nlab)
+        pos=np.flatnonzero(keep)
+        for i in range(0,len(pos),_BLOCK_SIZE):
+            sl=pos[i:i+_BLOCK_SIZE]
+            v=vxyz[sl]
+            idx=index[i:i+_BLOCK_SIZE]
+            valid=~np.any(np.isnan(v),axis=-1)
+            v=v[valid]
+            idx=idx[valid]
+            count+=np.bincount(idx,minlength=nlab)
+            for k,comp in enumerate(components):
+                sums[:,k]+=np.bincount(idx,weights=np.prod(v[:,list(comp)],axis=-1),minlength=nlab)
+        return names,sums,count
+    
+    def _ot2nd_labels(self,labels):
+        '''
+        Second order orientation tensor of each label, see OT2nd
+        :rtype: xr.Dataset
+        '''
+        names,sums,count=self._label_sums(labels,_OT2_COMPONENTS)
+        empty=count==0
+        mean=sums/np.where(empty,1,count)[:,np.newaxis]
+        tensor=mean[:,_OT2_MATRIX]
+        eigvalue,eigvector=_ot2nd_eig(tensor)
+        tensor[empty]=np.nan
+        eigvalue[empty]=np.nan
+        eigvector[empty]=np.nan
+        
+        return xr.Dataset({'eigvalue':(('label','eig'),eigvalue),
+                           'eigvector':(('label','vc','eig'),eigvector),
+                           'tensor':(('label','vc','vc2'),tensor),
+                           'count':(('label',),count.astype(np.int64))},
+                          coords={'label':names})
+#--------------------------------------------------------------------------------------------
+    def local_OT2nd(self,size=5,kernel='uniform',sigma=None,min_fraction=0.):
+        '''
+        Compute the second order orientation tensor in a sliding window around every pixel
         
-        a11 = np.float32(np.nanmean(np.float128(np.multiply(ux,ux))))
-        a22 = np.float32(np.nanmean(np.float128(np.multiply(uy,uy))))
-        a33 = np.float32(np.nanmean(np.float128(np.multiply(uz,uz))))
-        a12 = np.float32(np.nanmean(np.float128(np.multiply(ux,uy))))
-        a13 = np.float32(np.nanmean(np.float128(np.multiply(ux,uz))))
-        a23 = np.float32(np.nanmean(np.float128(np.multiply(uy,uz))))
+        The six components u_i u_j are averaged with a box (or gaussian) filter over 'y' and 'x', the cost does not depend on the size of the window.
+        :param size: size of the window in pixel (default:5)
+        :type size: int
+        :param kernel: 'uniform' box window of size*size, 'gaussian' gaussian window of standard deviation sigma cut at size/2 (default:'uniform')
+        :type kernel: str
+        :param sigma: standard deviation of the gaussian window in pixel (default:size/4)
+        :type sigma: float
+        :param min_fraction: minimum (weighted) fraction of valid vectors in the window, NaN below (a window exactly at min_fraction is kept) (default:0., any valid vector)
+        :type min_fraction: float
+        :return: 'eigvalue' (...,eig) and 'eigvector' (...,vc,eig) as in OT2nd, 'fraction' (...) fraction of valid vectors in the window
+        :rtype: xr.Dataset
+        :Exemple:
+            >>> ds=data.uvecs.local_OT2nd(11)
+            >>> (ds.eigvalue.isel(eig=0)-ds.eigvalue.isel(eig=1)).plot()
         
-        Tensor=np.array([[a11, a12, a13],[a12, a22, a23],[a13, a23, a33]])
-        eigvalue,eigvector=np.linalg.eig(Tensor)
+        .. note:: NaN vectors are skipped, the mean is normalised by the number of valid vectors in the window (the window is cut at the border of the map). Other dimensions (e.g. time) are filtered independently.
+        '''
+        import scipy.ndimage
+        _check_grid(self._obj)
+        dims=self._dims()
+        for d in ('y','x'):
+            if d not in dims:
+                raise ValueError('local_OT2nd needs the dimensions y and x, got '+str(dims))
+        if kernel=='uniform':
+            fsize=[size if d in ('y','x') else 1 for d in dims]
+            def smooth(a):
+                return scipy.ndimage.uniform_filter(a,size=fsize,mode='constant')
+        elif kernel=='gaussian':
+            sigma=size/4. if sigma is None else sigma
+            if not sigma>0:
+                raise ValueError('sigma should be positive, got '+str(sigma))
+            fsigma=[sigma if d in ('y','x') else 0. for d in dims]
+            def smooth(a):
+                return scipy.ndimage.gaussian_filter(a,sigma=fsigma,mode='constant',truncate=(size//2)/sigma)
+        else:
+            raise ValueError("kernel should be 'uniform' or 'gaussian', got "+str(kernel))
         
-        idx = eigvalue.argsort()[::-1]
-           
-        return eigvalue[idx],eigvector[:,idx]
+        vxyz=np.asarray(self.xyz())
+        valid=~np.any(np.isnan(vxyz),axis=-1)
+        w=np.where(valid[...,np.newaxis],vxyz,0.)
+        fraction=smooth(valid.astype(np.float64))
+        
+        # the window normalisation cancels in the ratio sum(u_i u_j)/sum(valid)
+        # windows without valid vector, or below min_fraction
+        empty=(fraction<=1e-12)|(fraction<min_fraction)
+        norm=np.where(empty,1.,fraction)
+        moment=np.empty(vxyz.shape[:-1]+(6,))
+        for k,(a,b) in enumerate(_OT2_COMPONENTS):
+            moment[...,k]=smooth(w[...,a]*w[...,b])/norm
+        del w
+        
+        eigvalue=np.empty(vxyz.shape[:-1]+(3,))
+        eigvector=np.empty(vxyz.shape[:-1]+(3,3))
+        mflat=moment.reshape(-1,6)
+        wflat=eigvalue.reshape(-1,3)
+        vflat=eigvector.reshape(-1,3,3)
+        for i in range(0,mflat.shape[0],_BLOCK_SIZE):
+            sl=slice(i,i+_BLOCK_SIZE)
+            # closed form for every block, the last one may be smaller than _EIGH_BATCH
+            wflat[sl],vflat[sl]=tensor3.eigh_sym3(mflat[sl][:,_OT2_MATRIX])
+        eigvalue[empty]=np.nan
+        eigvector[empty]=np.nan
+        fraction[fraction<1e-12]=0.
+        
+        return xr.Dataset({'eigvalue':self._wrap(eigvalue,'eig'),
+                           'eigvector':xr.DataArray(eigvector,dims=dims+('vc','eig'),coords=self._obj.isel({self._vdim:0},drop=True).coords),
+                           'fraction':self._wrap(fraction)})
 #--------------------------------------------------------------------------------------------
     def misorientation_profile(self,xx,yy,degre=True,method="nearest",**kwargs):
         '''
@@ -129,20 +695,22 @@ class uvecs(object):
         :param degre: Do you want the angle in degree (default:True)
         :type degre: bool
         :param **kwargs: xr.sel
+        
+        .. note:: only for a single 2D map, select one map of a stack with kwargs (e.g. time=1)
         '''
+        _check_grid(self._obj)
         ori=self._obj.sel(x=xx,y=yy, method=method,**kwargs)
+        # the other dimensions (e.g. time) should be selected by kwargs
+        _check_map(ori.uvecs._dims())
         # trasform it in numpy array in cartesien coordinate
         vxyz=np.array(ori.uvecs.xyz())[0]
         # compute the misorientation to origin
-        mis2o=np.arccos(np.round(np.dot(vxyz,vxyz[0]),10))
-    
-        mis2o[np.where(mis2o>np.pi/2)]=np.pi-mis2o[np.where(mis2o>np.pi/2)]
+        mis2o=_fold_angle(np.arccos(np.round(np.dot(vxyz,vxyz[0]),10)))
         # compute misorientation from previous
         vxyzm=np.zeros(np.shape(vxyz))
         vxyzm[:,:]=np.nan
         vxyzm[1::,:]=vxyz[0:-1,:]
-        mis2p=np.arccos(np.round(np.diag(np.dot(vxyz,np.transpose(vxyzm))),10))
-        mis2p[np.where(mis2p>np.pi/2)]=np.pi-mis2p[np.where(mis2p>np.pi/2)]
+        mis2p=_fold_angle(np.arccos(np.round(np.diag(np.dot(vxyz,np.transpose(vxyzm))),10)))
         #compute distance
         d=((xx-xx[0])**2+(yy-yy[0])**2)**0.5
         
@@ -167,57 +735,57 @@ class uvecs(object):
         :param random: suffle the image and compute the angle
         :type random: bool
 
+        .. note:: only for a single 2D map
         '''
-        phi1=np.array(self.bunge_euler())[:,:,0]
-        phi=np.array(self.bunge_euler())[:,:,1]
+        import scipy.signal
+        _check_grid(self._obj)
+        _check_map(self._dims())
 
-        if random:
-            np.random.shuffle(phi1)
-            np.random.shuffle(phi)
-            phi1=phi1.flatten()
-            phi=phi.flatten()
-            phi1 = phi1[~np.isnan(phi1)]
-            phi = phi[~np.isnan(phi)]
-            dd=np.int(np.sqrt(len(phi1)))
-            phi1=phi1[0:dd**2].reshape([dd,dd])
-            phi=phi[0:dd**2].reshape([dd,dd])
-
-        mat=np.zeros([3,3])
-        mat[0,1]=1
-        phi_a=scipy.signal.convolve2d(phi,mat,mode='same',boundary='symm')
-        phi1_a=scipy.signal.convolve2d(phi1,mat,mode='same',boundary='symm')
-
-        mat=np.zeros([3,3])
-        mat[1,0]=1
-        phi_b=scipy.signal.convolve2d(phi,mat,mode='same',boundary='symm')
-        phi1_b=scipy.signal.convolve2d(phi1,mat,mode='same',boundary='symm')
-
-
-        mat=np.zeros([3,3])
-        mat[1,2]=1
-        phi_c=scipy.signal.convolve2d(phi,mat,mode='same',boundary='symm')
-        phi1_c=scipy.signal.convolve2d(phi1,mat,mode='same',boundary='symm')
-
-
-        mat=np.zeros([3,3])
-        mat[2,1]=1
-        phi_d=scipy.signal.convolve2d(phi,mat,mode='same',boundary='symm')
-        phi1_d=scipy.signal.convolve2d(phi1,mat,mode='same',boundary='symm')
-
-        phi1_s=[phi1_a,phi1_b,phi1_c,phi1_d]
-        phi_s=[phi_a,phi_b,phi_c,phi_d]
-        if random:
-            tot=np.zeros([dd,dd,4])
+        if self._repr!='azicol':
+            # work directly on the cartesian vectors, u.v=x*nx+y*ny+z*nz
+            comp=np.array(self.xyz())
+            def dot(c,n):
+                return c[0]*n[0]+c[1]*n[1]+c[2]*n[2]
         else:
-            tot=np.zeros([len(self._obj.y),len(self._obj.x),4])
+            comp=np.array(self.bunge_euler())
+            def dot(c,n):
+                phi1,phi=c
+                nphi1,nphi=n
+                return np.sin(phi1)*np.sin(nphi1)*np.sin(phi)*np.sin(nphi)+np.cos(phi1)*np.cos(nphi1)*np.sin(phi)*np.sin(nphi)+np.cos(phi)*np.cos(nphi)
+
+        if random:
+            if self._repr!='azicol':
+                # suffle the rows of vectors
+                np.random.shuffle(comp)
+            else:
+                np.random.shuffle(comp[...,0])
+                np.random.shuffle(comp[...,1])
+            comp=comp.reshape([-1,np.shape(comp)[-1]])
+            comp=comp[~np.any(np.isnan(comp),axis=-1)]
+            dd=int(np.sqrt(len(comp)))
+            comp=comp[0:dd**2].reshape([dd,dd,-1])
+        
+        jit=_jit()
+        if jit is not None and not random:
+            tot=np.empty(np.shape(comp)[:-1]+(4,))
+            jit.neighbour_dot(np.ascontiguousarray(comp,dtype=np.float64),self._repr!='azicol',tot)
+            np.arccos(tot,out=tot)
+            jit.fold(tot.reshape(-1))
+            return xr.DataArray(tot,dims=self._dims()+('misAngle',))
+        
+        comp=[comp[...,k] for k in range(np.shape(comp)[-1])]
+        
+        # neighbour (i+1,j), (i,j+1), (i,j-1), (i-1,j)
+        neighbours=[]
+        for k in [(0,1),(1,0),(1,2),(2,1)]:
+            mat=np.zeros([3,3])
+            mat[k]=1
+            neighbours.append([scipy.signal.convolve2d(c,mat,mode='same',boundary='symm') for c in comp])
+
+        tot=np.zeros(np.shape(comp[0])+(4,))
         
         for i in range(4):
-            nphi1=phi1_s[i]
-            nphi=phi_s[i]
-            res=np.arccos(np.round(np.sin(phi1)*np.sin(nphi1)*np.sin(phi)*np.sin(nphi)+np.cos(phi1)*np.cos(nphi1)*np.sin(phi)*np.sin(nphi)+np.cos(phi)*np.cos(nphi),5))
-            #put everything between 0  and pi/2 because c=-c
-            id=np.where(res>np.pi/2)
-            res[id]=np.pi-res[id] 
+            res=_fold_angle(np.arccos(np.round(dot(comp,neighbours[i]),5)))
 
             res[0,:] = np.nan  # delete first row 
             res[-1,:] = np.nan
@@ -230,18 +798,32 @@ class uvecs(object):
             tot=tot.flatten()
             tot=tot[~np.isnan(tot)]
         else:
-            tot=xr.DataArray(tot,dims=[self._obj.coords.dims[0],self._obj.coords.dims[1],'misAngle'])
+            tot=xr.DataArray(tot,dims=self._dims()+('misAngle',))
 
         return tot
 #--------------------------------------------------------------------------------------------
-    def plotODF(self,nbr=10000,bw=0.2,projz=1,plotOT=True,angle=np.array([30.,60.]),cline=10,**kwargs):
+    def plotODF(self,nbr=10000,bw=0.2,projz=1,plotOT=True,angle=np.array([30.,60.]),cline=10,npts=5000,**kwargs):
+        '''
+        Plot the orientation distribution function (kde) in a pole figure
+        :param nbr: number of vectors used for the kde, 0 for all (default:10000)
+        :param bw: bandwidth of the kde (default:0.2)
+        :param projz: 0 stereographic projection, 1 Lambert equal-area projection (default:1)
+        :param plotOT: plot the eigen vectors of the second order orientation tensor (default:True)
+        :param angle: colatitude of the circles drawn (default:[30,60])
+        :param cline: number of contour levels (default:10)
+        :param npts: number of points of the hemisphere grid where the kde is evaluated, e.g. 2000 for a preview, 200000 for a publication (default:5000)
+        :param **kwargs: plt.tricontourf
+        '''
+        import matplotlib.pyplot as plt
+        import matplotlib.tri as tri
+        from sklearn.neighbors import KernelDensity
         
         #compute phi theta under the nice form for kde fit
         u_xyz=self.xyz()
         
-        ux=np.concatenate([np.array(u_xyz[:,:,0]).flatten(),-np.array(u_xyz[:,:,0]).flatten()])
-        uy=np.concatenate([np.array(u_xyz[:,:,1]).flatten(),-np.array(u_xyz[:,:,1]).flatten()])
-        uz=np.concatenate([np.array(u_xyz[:,:,2]).flatten(),-np.array(u_xyz[:,:,2]).flatten()])
+        ux=np.concatenate([np.array(u_xyz[...,0]).flatten(),-np.array(u_xyz[...,0]).flatten()])
+        uy=np.concatenate([np.array(u_xyz[...,1]).flatten(),-np.array(u_xyz[...,1]).flatten()])
+        uz=np.concatenate([np.array(u_xyz[...,2]).flatten(),-np.array(u_xyz[...,2]).flatten()])
         
         ux=ux[~np.isnan(ux)]
         uy=uy[~np.isnan(uy)]
@@ -268,28 +850,11 @@ class uvecs(object):
         kde = KernelDensity(bandwidth=bw, metric='haversine',kernel='gaussian', algorithm='ball_tree')
         kde.fit(np.transpose(np.array([phi,theta])))
         
-        # Prepare the plot
-        val=unidist
-        dim=int(np.size(val)/3)
-        vs=val.reshape([dim,3])
-        id=np.where(vs[:,2]>0)
-        vs_u=vs[id[0],:]
-        
-        # add point on the disc for contourf
-        tot=10000
-        omega = np.linspace(0, 2*np.pi, tot)
-        zcir = np.zeros(tot)
-        xcir = np.cos(omega)
-        ycir = np.sin(omega)
-        
-        vs_x=np.concatenate([vs[:,0],xcir])
-        vs_y=np.concatenate([vs[:,1],ycir])
-        vs_z=np.concatenate([vs[:,2],zcir])
-        
-        id=np.where(vs_z<0)
-        vs_x[id]=-vs_x[id]
-        vs_y[id]=-vs_y[id]
-        vs_z[id]=-vs_z[id]
+        # Prepare the plot, on the upper hemisphere only because u=-u
+        vs,triangles=uniform_dist.equal_area_hemisphere(npts)
+        vs_x=vs[:,0]
+        vs_y=vs[:,1]
+        vs_z=vs[:,2]
         
         phi_e=np.arccos(vs_z)
         theta_e=np.arctan2(vs_y,vs_x)
@@ -310,9 +875,9 @@ class uvecs(object):
             rco=2.**0.5
             
         # plot contourf
-        triang = tri.Triangulation(xx, yy)
-        plt.tricontour(xx, yy, np.exp(weights), cline, linewidths=0.5, colors='k')
-        plt.tricontourf(xx, yy, np.exp(weights), cline, **kwargs)
+        triang = tri.Triangulation(xx, yy, triangles)
+        plt.tricontour(triang, np.exp(weights), cline, linewidths=0.5, colors='k')
+        plt.tricontourf(triang, np.exp(weights), cline, **kwargs)
         
         
         plt.colorbar(orientation='vertical',aspect=4,shrink=0.5)
@@ -350,14 +915,12 @@ class uvecs(object):
                    
         
         if plotOT:
-            eigvalue,eigvector=self.OT2nd()
+            # one tensor for the whole stack
+            eigvalue,eigvector=self.OT2nd(dims=self._dims())
+            eigvector=_canonical_kernel(np.array(eigvector.T,dtype=np.float64))
             for i in list(range(3)): # Loop on the 3 eigenvalue
-                if (eigvector[2,i]<0):
-                    v=-eigvector[:,i]
-                else:
-                    v=eigvector[:,i]
-                    
-                    
+                v=eigvector[i]
+                
                 if projz==0:    
                     LpLv=1./(1.+v[2])
                     xxv=LpLv*v[0]
@@ -380,6 +943,15 @@ class uvecs(object):
         '''
 
         ori=self.xyz()
+        jit=_jit()
+        if jit is not None and not self._is_lazy() and np.shape(axis)==(3,):
+            vxyz=np.ascontiguousarray(ori).reshape(-1,3)
+            angle=np.empty(vxyz.shape[0],dtype=vxyz.dtype)
+            jit.dot_axis_nansum(vxyz,np.asarray(axis,dtype=vxyz.dtype),angle)
+            np.arccos(angle,out=angle)
+            jit.abs_cos_sin(angle)
+            return self._wrap(angle.reshape(ori.shape[:-1]))
+        
         angle=np.arccos(np.sum(ori*axis,axis=-1))
         schmid=np.abs(np.cos(angle)*np.sin(angle))
 
@@ -396,12 +968,662 @@ class uvecs(object):
         '''
         o1=self.xyz()
         o2=other.uvecs.xyz()
-        angle=np.array(np.arccos(np.sum(o1*o2,axis=-1)))
-        id=np.where(angle>np.pi/2)
-        angle[id]=np.pi-angle[id]
+        jit=_jit()
+        if jit is not None and isinstance(o1.data,np.ndarray) and isinstance(o2.data,np.ndarray):
+            o1,o2=xr.align(o1,o2,join='inner')
+            if o1.dims==o2.dims and o1.dtype==o2.dtype:
+                angle=np.empty(o1.shape[:-1],dtype=o1.dtype)
+                jit.dot_nansum(np.ascontiguousarray(o1).reshape(-1,3),np.ascontiguousarray(o2).reshape(-1,3),angle.reshape(-1))
+                np.arccos(angle,out=angle)
+                jit.fold(angle.reshape(-1))
+                return xr.DataArray(angle,dims=o1.dims[:-1],coords=o1.isel(vc=0,drop=True).coords)
+        
+        angle=np.arccos((o1*o2).sum('vc'))
+        angle=xr.apply_ufunc(_fold_angle,angle,dask='parallelized',output_dtypes=[angle.dtype])
         
-        return xr.DataArray(angle,dims=self._obj.coords.dims[0:2])
+        return angle
 
 #-------------------------------------------------------------------------------------------
-        
-        
\ No newline at end of file
+
+def set_cache_limit(nbytes):
+    '''
+    Set the maximum memory used by the cache of the xyz and bunge_euler representations
+    
+    The least recently used representations are removed first.
+    :param nbytes: limit in byte (default: 1GiB), 0 to disable the cache
+    :type nbytes: int
+    
+    .. note:: only contiguous numpy data is cached, strided views (e.g. map[::2,::2]) are recomputed at each call
+    .. note:: the representations of a buffer are removed from the cache when the buffer is freed
+    '''
+    global _cache_limit
+    _cache_limit=int(nbytes)
+    _evict()
+
+def set_engine(engine):
+    '''
+    Choose the engine of the per-pixel kernels of mis_angle, inner_angle, calc_schmid and calc_colormap
+    
+    :param engine: 'numpy', 'numba' (fused multithreaded kernels, needs numba) or 'auto' (numba if installed, default)
+    :type engine: str
+    
+    .. note:: both engines give bit-identical results
+    '''
+    global _engine
+    if engine not in ('auto','numpy','numba'):
+        raise ValueError("engine should be 'auto', 'numpy' or 'numba', got "+str(engine))
+    if engine=='numba':
+        import xarrayuvecs.jit
+    _engine=engine
+
+def _jit():
+    '''
+    :return: the xarrayuvecs.jit module if the numba engine is used, None otherwise
+    '''
+    global _jit_module
+    if _engine=='numpy':
+        return None
+    if _jit_module is None:
+        try:
+            import xarrayuvecs.jit as jit
+            _jit_module=jit
+        except ImportError:
+            if _engine=='numba':
+                raise
+            _jit_module=False
+    return _jit_module or None
+
+def clear_cache():
+    '''
+    Remove all the cached representations
+    '''
+    _cache.clear()
+
+def _forget(bkey):
+    '''
+    Remove the cached representations of a freed buffer
+    '''
+    for key in [k for k in _cache if k[0]==bkey]:
+        del _cache[key]
+
+def _evict():
+    nbytes=sum(v.nbytes for v in _cache.values())
+    while _cache and nbytes>_cache_limit:
+        key,v=_cache.popitem(last=False)
+        nbytes-=v.nbytes
+
+def expand(obj,fill_value=np.nan):
+    '''
+    Put a DataArray computed on packed vectors (see uvecs.compress) back on the grid
+    :param obj: DataArray with a 'pixel' dimension
+    :type obj: xr.DataArray
+    :param fill_value: value of the invalid pixels, e.g. 255 for a uint8 colormap (default:NaN)
+    :return: DataArray where 'pixel' is replaced by the dimensions of the grid
+    :rtype: xr.DataArray
+    '''
+    if 'pixel' not in obj.dims:
+        return obj
+    midx=obj.indexes['pixel']
+    grid=list(midx.names)
+    order=[]
+    for d in obj.dims:
+        order+=grid if d=='pixel' else [d]
+    res=obj.unstack('pixel',fill_value=fill_value)
+    # unstack drops the rows/columns without any valid pixel, the levels of the index still hold the whole grid
+    res=res.reindex({d:np.asarray(lev) for d,lev in zip(grid,midx.levels)},fill_value=fill_value)
+    return res.transpose(*order)
+
+def _check_grid(obj):
+    if 'pixel' in obj.dims:
+        raise ValueError('this method needs the vectors on a grid, use uvecs.expand() on packed vectors')
+
+def _check_map(dims):
+    if len(dims)!=2:
+        raise ValueError('this method works on a single 2D map, got the dimensions '+str(tuple(dims))+', select one map first (e.g. data.isel(time=0))')
+
+def _output(out,shape,dtype):
+    '''
+    Check the out array given by the user or allocate it
+    :param out: None or array of size shape
+    :type out: np.array
+    :param shape: shape of the result
+    :type shape: tuple
+    :param dtype: dtype of the result if out is None
+    :type dtype: np.dtype
+    :rtype: np.array
+    '''
+    if out is None:
+        return np.empty(shape,dtype=dtype)
+    if np.shape(out)!=tuple(shape):
+        raise ValueError('out should be of size '+str(tuple(shape))+', got '+str(np.shape(out)))
+    return out
+
+def _component_dim(obj):
+    '''
+    Find the component dimension of a uvecs DataArray
+    :param obj: uvecs DataArray
+    :type obj: xr.DataArray
+    :return: obj.attrs['uvecs_dim'] if given, the last dimension otherwise
+    :rtype: str
+    '''
+    vdim=obj.attrs.get('uvecs_dim',obj.dims[-1])
+    if vdim not in obj.dims:
+        raise ValueError("uvecs_dim '"+str(vdim)+"' is not a dimension of the DataArray "+str(obj.dims))
+    return vdim
+
+def _azi_col_kernel(vxyz):
+    '''
+    Convert cartesian vectors to azimuth and colatitude, the vectors pointing down are flipped to the upper hemisphere
+    :param vxyz: vxyz[...,0]=x, vxyz[...,1]=y, vxyz[...,2]=z
+    :type vxyz: np.array
+    :rtype: np.array of size [...,2]
+    '''
+    vxyz=_canonical_kernel(np.array(vxyz,dtype=np.float64))
+    out=np.empty(vxyz.shape[:-1]+(2,))
+    np.arctan2(vxyz[...,1],vxyz[...,0],out=out[...,0])
+    np.mod(out[...,0],2*np.pi,out=out[...,0])
+    np.clip(vxyz[...,2],-1.,1.,out=vxyz[...,2])
+    np.arccos(vxyz[...,2],out=out[...,1])
+    return out
+
+def _bunge_euler_kernel(u,representation='azicol',dtype=np.float64,out=None):
+    '''
+    Compute the Bunge Euler angle phi1, phi of the vectors
+    :param u: vectors, azimuth/colatitude u[...,0:2] or cartesian u[...,0:3]
+    :type u: np.array
+    :param representation: 'azicol' or 'xyz'
+    :type representation: str
+    :param dtype: dtype of the output if out is None
+    :type dtype: np.dtype
+    :param out: array of size [...,2] where the result is written
+    :type out: np.array
+    :rtype: np.array of size [...,2]
+    '''
+    u,representation=_decode(u,representation)
+    if representation=='xyz':
+        u=_azi_col_kernel(u)
+    out=_output(out,u.shape[:-1]+(2,),dtype)
+    np.add(u[...,0],np.pi/2.,out=out[...,0])
+    np.mod(out[...,0],2*np.pi,out=out[...,0])
+    out[...,1]=u[...,1]
+    return out
+
+def _xyz_kernel(u,representation='azicol',dtype=np.float64,out=None):
+    '''
+    Compute the cartesian coordinate of the vectors
+    :param u: vectors, azimuth/colatitude u[...,0:2] or cartesian u[...,0:3]
+    :type u: np.array
+    :param representation: 'azicol' or 'xyz'
+    :type representation: str
+    :param dtype: dtype of the output if out is None
+    :type dtype: np.dtype
+    :param out: array of size [...,3] where the result is written
+    :type out: np.array
+    :rtype: np.array of size [...,3]
+    '''
+    u,representation=_decode(u,representation)
+    out=_output(out,u.shape[:-1]+(3,),dtype)
+    if representation=='xyz':
+        out[...]=u
+        return out
+    # the result is written in place, sin(colatitude) is the only temporary
+    sincol=np.sin(u[...,1])
+    np.cos(u[...,0],out=out[...,0])
+    np.multiply(out[...,0],sincol,out=out[...,0])
+    np.sin(u[...,0],out=out[...,1])
+    np.multiply(out[...,1],sincol,out=out[...,1])
+    np.cos(u[...,1],out=out[...,2])
+    return out
+
+def _second_moment(vxyz):
+    '''
+    Sum of the products u_i u_j over the valid vectors
+    :param vxyz: vectors of size [n,3], or [...,n,3] for several sets of vectors
+    :type vxyz: np.array
+    :return: sum of u u^T of size [...,3,3], number of valid vectors of size [...]
+    :rtype: np.array, np.array
+    '''
+    v=np.asarray(vxyz,dtype=np.float64)
+    valid=~np.any(np.isnan(v),axis=-1)
+    # the NaN vectors are replaced by 0 so that a single matrix product gives the 6 sums (pairwise summation in BLAS)
+    w=np.where(valid[...,np.newaxis],v,0.)
+    return np.swapaxes(w,-1,-2)@w,np.count_nonzero(valid,axis=-1)
+
+def _fourth_moment(vxyz):
+    '''
+    Sum of the 15 independent products u_i u_j u_k u_l over the valid vectors (see _OT4_COMPONENTS)
+    :param vxyz: vectors of size [n,3], or [...,n,3] for several sets of vectors
+    :type vxyz: np.array
+    :return: sums of size [...,15], number of valid vectors of size [...]
+    :rtype: np.array, np.array
+    '''
+    v=np.asarray(vxyz,dtype=np.float64)
+    valid=~np.any(np.isnan(v),axis=-1)
+    w=np.where(valid[...,np.newaxis],v,0.)
+    # u_i u_j u_k u_l=(u_i u_j)(u_k u_l): one matrix product of the 6 second order products gives all the sums
+    idx=np.array(_OT2_COMPONENTS).T
+    w2=w[...,idx[0]]*w[...,idx[1]]
+    gram=np.swapaxes(w2,-1,-2)@w2
+    return gram[...,_OT4_GRAM[0],_OT4_GRAM[1]],np.count_nonzero(valid,axis=-1)
+
+def _frame_mean(vxyz,moment):
+    '''
+    Mean of the moments of the vectors of each frame, in one compensated pass by blocks
+    :param vxyz: vectors of size [frame,pixel,3]
+    :type vxyz: np.array
+    :param moment: function returning the sum of the moments and the number of valid vectors (_second_moment, _fourth_moment)
+    :type moment: function
+    :return: mean of size [frame,...], True for the frames without valid vector
+    :rtype: np.array, np.array
+    '''
+    step=_frame_step(vxyz.shape[0])
+    acc=None
+    count=np.zeros(vxyz.shape[0])
+    for i in range(0,vxyz.shape[1],step):
+        m,n=moment(vxyz[:,i:i+step])
+        if acc is None:
+            acc=np.zeros((2,)+m.shape)
+        _kahan_add(acc,m)
+        count+=n
+    return _moment_mean(acc,count)
+
+def _frame_step(nframe):
+    '''
+    :return: number of pixels of each frame in a block of _BLOCK_SIZE vectors
+    :rtype: int
+    '''
+    return max(1,_BLOCK_SIZE//nframe)
+
+def _moment_mean(acc,count):
+    '''
+    :param acc: compensated sum of the moments of each frame (see _kahan_add), of size [2,frame,...]
+    :param count: number of valid vectors of each frame
+    :return: mean of size [frame,...], True for the frames without valid vector
+    :rtype: np.array, np.array
+    '''
+    empty=count==0
+    mean=acc[0]/np.where(empty,1,count).reshape((-1,)+(1,)*(acc.ndim-2))
+    return mean,empty
+
+def _ot2nd_result(mean,empty,keep,shape,coords):
+    '''
+    Eigen decomposition of the second order tensor of each frame, see uvecs.OT2nd
+    :param mean: tensors of size [frame,3,3]
+    :param empty: True for the frames without valid vector (NaN)
+    :param keep: kept dimensions
+    :param shape: shape of the kept dimensions
+    :param coords: coordinates of the kept dimensions
+    :return: eigvalue, eigvector as np.array for a single frame, as xr.DataArray otherwise
+    '''
+    eigvalue,eigvector=_ot2nd_eig(mean)
+    eigvalue[empty]=np.nan
+    eigvector[empty]=np.nan
+    if not keep:
+        return eigvalue[0],eigvector[0]
+    return (xr.DataArray(eigvalue.reshape(tuple(shape)+(3,)),dims=list(keep)+['eig'],coords=coords),
+            xr.DataArray(eigvector.reshape(tuple(shape)+(3,3)),dims=list(keep)+['vc','eig'],coords=coords))
+
+def expand_OT4th(a4):
+    '''
+    Full fourth order orientation tensor from its compact form (see uvecs.OT4th)
+    :param a4: 15 components along 'comp4' (or along the last axis for a np.array)
+    :type a4: xr.DataArray
+    :return: a_ijkl with the dimensions i, j, k, l of size 3 instead of 'comp4' (or [...,3,3,3,3] for a np.array)
+    :rtype: xr.DataArray
+    '''
+    if isinstance(a4,xr.DataArray):
+        return xr.apply_ufunc(expand_OT4th,a4,input_core_dims=[['comp4']],output_core_dims=[['i','j','k','l']],
+                              dask='parallelized',output_dtypes=[a4.dtype],
+                              dask_gufunc_kwargs={'output_sizes':{'i':3,'j':3,'k':3,'l':3}})
+    return np.asarray(a4)[...,_OT4_MATRIX]
+
+def _kahan_add(acc,x):
+    '''
+    Compensated (Kahan) summation, in place
+    :param acc: acc[0] sum, acc[1] compensation
+    :type acc: np.array
+    :param x: value to add, of size acc[0]
+    :type x: np.array
+    '''
+    y=x-acc[1]
+    t=acc[0]+y
+    acc[1]=(t-acc[0])-y
+    acc[0]=t
+
+def _ot2nd_eig(tensor):
+    '''
+    Eigen decomposition of the second order orientation tensor
+    :param tensor: symmetric tensor of size [3,3], or [...,3,3] for several tensors
+    :type tensor: np.array
+    :return: eigen value sorted in decreasing order, eigen vector v[:,i]
+    :rtype: np.array, np.array
+    
+    .. note:: the solver depends only on the number of tensors: np.linalg.eigh below _EIGH_BATCH tensors (a single map, a few frames or labels), the vectorized closed form tensor3.eigh_sym3 above
+    '''
+    if np.size(tensor)//9>=_EIGH_BATCH:
+        return tensor3.eigh_sym3(tensor)
+    eigvalue,eigvector=np.linalg.eigh(tensor)
+    # eigh sorts the eigen values in increasing order
+    return eigvalue[...,::-1],eigvector[...,::-1]
+
+def _products_kernel(u,representation='azicol',names=(),axis=None,rlut=None,moment=False,out=None):
+    '''
+    Compute several products of the vectors from their cartesian coordinate, computed once
+    :param u: vectors, azimuth/colatitude u[...,0:2] or cartesian u[...,0:3]
+    :type u: np.array
+    :param representation: 'azicol' or 'xyz'
+    :type representation: str
+    :param names: products among 'xyz', 'colormap' (needs rlut) and 'schmid' (needs axis)
+    :type names: list of str
+    :param moment: also return the sum of u_i u_j over the axis -2 (see _second_moment) and the number of valid vectors
+    :type moment: bool
+    :param out: arrays where the products are written (default: new arrays)
+    :type out: dict
+    :return: the products in the order of names, followed by the moment and the count if moment
+    :rtype: tuple
+    '''
+    out={} if out is None else out
+    vxyz=_xyz_kernel(u,representation,out=out.get('xyz'))
+    res=[]
+    for name in names:
+        if name=='xyz':
+            res.append(vxyz)
+        elif name=='colormap':
+            if representation=='azicol':
+                # x and y of the upper hemisphere are the horizontal projection
+                hx,hy=vxyz[...,0].copy(),vxyz[...,1].copy()
+                invalid=np.isnan(u[...,0])|np.isnan(u[...,1])
+            else:
+                hx,hy,rho,invalid=_horizontal(vxyz,'xyz')
+            img=_lut_lookup(hx,hy,invalid,rlut)
+            if 'colormap' in out:
+                out['colormap'][...]=img
+                img=out['colormap']
+            res.append(img)
+        elif name=='schmid':
+            angle=np.arccos(np.nansum(vxyz*axis,axis=-1))
+            schmid=np.abs(np.cos(angle)*np.sin(angle))
+            if 'schmid' in out:
+                out['schmid'][...]=schmid
+                schmid=out['schmid']
+            res.append(schmid)
+    if moment:
+        res+=list(_second_moment(vxyz))
+    if len(res)==1:
+        return res[0]
+    return tuple(res)
+
+def _canonical_kernel(vxyz):
+    '''
+    Take the vectors in the upper hemisphere, in place (u=-u)
+    
+    The vectors with z<0 are flipped. On the equator (z=0) the vector with y>0 is kept, and the one with x>0 if y=0 too,
+    so that u and -u always give the same vector. NaN vectors are left as is.
+    :param vxyz: vxyz[...,0]=x, vxyz[...,1]=y, vxyz[...,2]=z
+    :type vxyz: np.array (float)
+    :return: vxyz
+    :rtype: np.array
+    '''
+    x,y,z=vxyz[...,0],vxyz[...,1],vxyz[...,2]
+    flip=(z<0)|((z==0)&((y<0)|((y==0)&(x<0))))
+    # multiply by -1 instead of scattering, it keeps a single vectorized pass
+    np.multiply(vxyz,np.where(flip,-1.,1.)[...,np.newaxis].astype(vxyz.dtype),out=vxyz)
+    return vxyz
+
+def _canonical_xyz(u,representation='azicol',dtype=np.float64,out=None):
+    '''
+    Cartesian coordinate of the vectors taken in the upper hemisphere, see _xyz_kernel and _canonical_kernel
+    :rtype: np.array of size [...,3]
+    '''
+    return _canonical_kernel(_xyz_kernel(u,representation,dtype=dtype,out=out))
+
+def _fold_angle(angle):
+    '''
+    Put the angles between two axes in [0 pi/2], in place (u=-u)
+    :param angle: angle in [0 pi]
+    :type angle: np.array
+    :return: angle
+    :rtype: np.array
+    '''
+    np.subtract(np.pi,angle,out=angle,where=angle>np.pi/2)
+    return angle
+
+def _products_block(u,nkeep=0,moment=False,**kwargs):
+    '''
+    _products_kernel on a chunk of vectors of dim (frame...,pixel...,k)
+    :param nkeep: number of frame dimensions
+    :type nkeep: int
+    :param moment: also return the sums a11, a22, a33, a12, a13, a23 and the number of valid vectors of each frame, of size [frame...,1...,7]
+    :type moment: bool
+    :rtype: tuple
+    '''
+    shape=u.shape[:-1]
+    fshape=shape[:nkeep]
+    ub=u.reshape((int(np.prod(fshape)),-1,u.shape[-1]))
+    res=_products_kernel(ub,moment=moment,**kwargs)
+    res=list(res) if isinstance(res,tuple) else [res]
+    out=[r.reshape(shape+r.shape[2:]) for r in res[:len(res)-2*moment]]
+    if moment:
+        m,n=res[-2],res[-1]
+        packed=np.concatenate([m[:,[a for a,b in _OT2_COMPONENTS],[b for a,b in _OT2_COMPONENTS]],n[:,np.newaxis]],axis=-1)
+        out.append(packed.reshape(fshape+(1,)*(len(shape)-nkeep)+(7,)))
+    return tuple(out)
+
+def _moment_eig(total):
+    '''
+    Eigen decomposition of the second order tensors from the packed sums of _products_block reduced over the pixels
+    :param total: a11, a22, a33, a12, a13, a23 sums and number of valid vectors, of size [frame...,7]
+    :rtype: np.array, np.array
+    '''
+    fshape=total.shape[:-1]
+    total=total.reshape(-1,7)
+    empty=total[:,6]==0
+    mean=total[:,:6]/np.where(empty,1,total[:,6])[:,np.newaxis]
+    eigvalue,eigvector=_ot2nd_eig(mean[:,_OT2_MATRIX])
+    eigvalue[empty]=np.nan
+    eigvector[empty]=np.nan
+    return eigvalue.reshape(fshape+(3,)),eigvector.reshape(fshape+(3,3))
+
+def _representation(obj,vdim):
+    '''
+    Find the representation of a uvecs DataArray
+    :param obj: uvecs DataArray
+    :type obj: xr.DataArray
+    :param vdim: component dimension
+    :type vdim: str
+    :return: 'azicol', 'xyz', 'oct16' or 'oct8'
+    :rtype: str
+    '''
+    rep=obj.attrs.get('uvecs_repr')
+    if rep is None:
+        rep={2:'azicol',3:'xyz'}.get(obj.sizes[vdim])
+    if rep not in _NCOMP or obj.sizes[vdim]!=_NCOMP[rep]:
+        raise ValueError('uvecs DataArray should have 2 (azimuth, colatitude) or 3 (x, y, z) components along '+str(vdim)+', got '+str(obj.sizes[vdim])+' and uvecs_repr='+str(obj.attrs.get('uvecs_repr')))
+    return rep
+
+def _invalid(u,representation):
+    '''
+    :return: True for the invalid vectors (NaN or fill value of the octahedral encoding)
+    :rtype: np.array of bool
+    '''
+    invalid=np.any(np.isnan(u),axis=-1)
+    if representation in _OCT:
+        invalid|=np.any(u==_OCT[representation][2],axis=-1)
+    return invalid
+
+def _decode(u,representation):
+    '''
+    Decode octahedral encoded vectors to cartesian coordinate, other representations are returned as is
+    :return: u, representation
+    :rtype: np.array, str
+    '''
+    if representation in _OCT:
+        return _oct_decode(u,representation),'xyz'
+    return u,representation
+
+def _oct_encode(u,representation='azicol',encoding='oct16'):
+    '''
+    Encode the vectors on the upper hemisphere with the hemi-octahedral map
+    
+    The vector is folded to z>=0 and projected on the octahedron |x|+|y|+|z|=1, (px,py) is then rotated by 45 degree
+    to fill the square [-1 1]^2 and quantized. Invalid vectors get a sentinel value (-32768 for oct16, -128 for oct8).
+    :param u: vectors, azimuth/colatitude u[...,0:2] or cartesian u[...,0:3]
+    :type u: np.array
+    :param representation: 'azicol' or 'xyz'
+    :type representation: str
+    :param encoding: 'oct16' (2*int16) or 'oct8' (2*int8)
+    :type encoding: str
+    :rtype: np.array of size [...,2]
+    '''
+    vxyz=_xyz_kernel(u,representation)
+    invalid=np.any(np.isnan(vxyz),axis=-1)
+    vxyz[invalid]=0
+    _canonical_kernel(vxyz)
+    n1=np.sum(np.abs(vxyz),axis=-1)
+    n1[invalid]=1
+    px=vxyz[...,0]/n1
+    py=vxyz[...,1]/n1
+    
+    scale,offset,fill,dtype=_OCT[encoding]
+    out=np.empty(vxyz.shape[:-1]+(2,),dtype=dtype)
+    out[...,0]=np.rint((px+py)*scale+offset)
+    out[...,1]=np.rint((px-py)*scale+offset)
+    out[invalid]=fill
+    return out
+
+def _oct_decode(q,encoding='oct16'):
+    '''
+    Decode hemi-octahedral encoded vectors, see _oct_encode
+    :param q: encoded vectors of size [...,2]
+    :type q: np.array
+    :param encoding: 'oct16' or 'oct8'
+    :type encoding: str
+    :return: unit vectors in cartesian coordinate, z>=0, NaN for invalid vectors
+    :rtype: np.array of size [...,3]
+    '''
+    scale,offset,fill,dtype=_OCT[encoding]
+    # float data come from a reader that already masked the fill value
+    invalid=_invalid(q,encoding)
+    a=(q[...,0]-offset)/scale
+    b=(q[...,1]-offset)/scale
+    
+    out=np.empty(q.shape[:-1]+(3,))
+    out[...,0]=(a+b)/2
+    out[...,1]=(a-b)/2
+    out[...,2]=np.maximum(1.-np.abs(out[...,0])-np.abs(out[...,1]),0.)
+    out/=np.linalg.norm(out,axis=-1)[...,np.newaxis]
+    out[invalid]=np.nan
+    return out
+
+# octahedral encodings: scale, offset, fill value, dtype
+_OCT={'oct16':(32767.,0.,-32768,np.int16),
+      'oct8':(127.,0.,-128,np.int8)}
+# number of components of each representation
+_NCOMP={'azicol':2,'xyz':3,'oct16':2,'oct8':2}
+# components a11, a22, a33, a12, a13, a23 of the second order tensor, and their position in the 3x3 matrix
+_OT2_COMPONENTS=((0,0),(1,1),(2,2),(0,1),(0,2),(1,2))
+_OT2_MATRIX=np.array([[0,3,4],[3,1,5],[4,5,2]])
+# independent components i<=j<=k<=l of the fourth order tensor, their names and their position in the 3x3x3x3 tensor
+_OT4_COMPONENTS=tuple((i,j,k,l) for i in range(3) for j in range(i,3) for k in range(j,3) for l in range(k,3))
+_OT4_NAMES=[''.join(str(n+1) for n in c) for c in _OT4_COMPONENTS]
+_OT4_MATRIX=np.array([_OT4_COMPONENTS.index(tuple(sorted(c))) for c in np.ndindex(3,3,3,3)]).reshape(3,3,3,3)
+# position of each component in the products of the second order components (u_i u_j)(u_k u_l)
+_OT4_GRAM=np.array([(_OT2_COMPONENTS.index(c[:2]),_OT2_COMPONENTS.index(c[2:])) for c in _OT4_COMPONENTS]).T
+# dimensions reduced by OT2nd by default
+_SPATIAL_DIMS=('z','y','x','pixel')
+# products of uvecs.products and size of the blocks of pixels
+_PRODUCTS=('xyz','colormap','schmid','OT2nd')
+_PRODUCT_SHAPE={'xyz':(3,),'colormap':(3,),'schmid':()}
+_PRODUCT_DIMS={'xyz':('vc',),'colormap':('img',),'schmid':()}
+_BLOCK_SIZE=2**18
+# number of tensors from which _ot2nd_eig uses the closed form eigen solver
+_EIGH_BATCH=256
+
+def _horizontal(u,representation):
+    '''
+    Projection of the vectors, taken in the upper hemisphere, on the xOy plane
+    :param u: vectors, azimuth/colatitude u[...,0:2] or cartesian u[...,0:3]
+    :type u: np.array
+    :param representation: 'azicol' or 'xyz'
+    :type representation: str
+    :return: hx=sin(col)cos(azi), hy=sin(col)sin(azi), rho=sin(col), invalid (NaN vectors)
+    :rtype: np.array
+    '''
+    u,representation=_decode(u,representation)
+    if representation=='xyz':
+        invalid=np.isnan(u[...,0])|np.isnan(u[...,1])|np.isnan(u[...,2])
+        u=_canonical_kernel(np.array(u,dtype=np.float64))
+        hx=u[...,0]
+        hy=u[...,1]
+        rho=np.hypot(hx,hy)
+    else:
+        azi=u[...,0]
+        col=u[...,1]
+        rho=np.sin(col)
+        hx=rho*np.cos(azi)
+        hy=rho*np.sin(azi)
+        invalid=np.isnan(azi)|np.isnan(col)
+    return hx,hy,rho,invalid
+
+def _colormap(u,rlut,representation='azicol'):
+    '''
+    Color each vector with rlut, invalid vectors are white
+    :param u: vectors, azimuth/colatitude u[...,0:2] or cartesian u[...,0:3]
+    :type u: np.array
+    :param rlut: colorwheel of size [nlut,nlut,3]
+    :type rlut: np.array
+    :param representation: 'azicol' or 'xyz'
+    :type representation: str
+    :rtype: np.array of size [...,3]
+    '''
+    hx,hy,rho,invalid=_horizontal(u,representation)
+    return _lut_lookup(hx,hy,invalid,rlut)
+
+def _lut_lookup(hx,hy,invalid,rlut):
+    '''
+    Color of the horizontal projection (hx,hy) of the vectors in rlut, invalid vectors are white
+    :rtype: np.array of size [...,3]
+    '''
+    nlut=np.shape(rlut)[0]
+    XX=(nlut-1)/2*(-hy)+(nlut-1)/2
+    YY=(nlut-1)/2*hx+(nlut-1)/2
+    XX[invalid]=0
+    YY[invalid]=0
+    
+    img=rlut[XX.astype(np.intp),YY.astype(np.intp)]
+    img[invalid]=255
+    return img
+
+def _colormap_analytic(u,semi=False,dtype=np.float64,representation='azicol'):
+    '''
+    Compute the color of each vector without lut, invalid vectors are white
+    
+    It is the limit of _colormap when the size of the lut goes to infinity:
+    hue=(pi-azimuth)/2pi (or mod(-azimuth,pi)/pi for semi), saturation=1, value=sin(colatitude)/sqrt(2)
+    :param u: vectors, azimuth/colatitude u[...,0:2] or cartesian u[...,0:3]
+    :type u: np.array
+    :param semi: colorbar option
+    :type semi: bool
+    :param dtype: np.float64 or np.uint8
+    :type dtype: np.dtype
+    :param representation: 'azicol' or 'xyz'
+    :type representation: str
+    :rtype: np.array of size [...,3]
+    '''
+    hx,hy,rho,invalid=_horizontal(u,representation)
+    
+    # polar angle of the vector in the lut frame, wrapped in [-pi pi]
+    phi=np.arctan2(-hy,hx)
+    if semi:
+        h=np.mod(phi,np.pi)/np.pi
+    else:
+        h=(phi+np.pi)/(2*np.pi)
+    v=rho/2**0.5
+    h[invalid]=0
+    v[invalid]=0
+    
+    img=lut2d.hsv_to_rgb(h,1.,v)
+    if np.dtype(dtype)==np.uint8:
+        img=np.rint(img*255).astype(np.uint8)
+    img[invalid]=255
+    return img